@@ -0,0 +1,167 @@
+# address_parser.py
+# Single-pass Japanese address parser: normalizes an address and splits it into
+# prefecture / county / city / ward / town / chome / block / number
+
+import re
+import unicodedata
+from functools import lru_cache
+from typing import NamedTuple
+
+PREFECTURES = (
+    "北海道", "青森県", "岩手県", "宮城県", "秋田県", "山形県", "福島県", "茨城県", "栃木県", "群馬県",
+    "埼玉県", "千葉県", "東京都", "神奈川県", "新潟県", "富山県", "石川県", "福井県", "山梨県", "長野県",
+    "岐阜県", "静岡県", "愛知県", "三重県", "滋賀県", "京都府", "大阪府", "兵庫県", "奈良県", "和歌山県",
+    "鳥取県", "島根県", "岡山県", "広島県", "山口県", "徳島県", "香川県", "愛媛県", "高知県", "福岡県",
+    "佐賀県", "長崎県", "熊本県", "大分県", "宮崎県", "鹿児島県", "沖縄県",
+)
+
+# Cities whose addresses name a ward (区) after the city
+DESIGNATED_CITIES = frozenset((
+    "札幌市", "仙台市", "さいたま市", "千葉市", "横浜市", "川崎市", "相模原市", "新潟市", "静岡市", "浜松市",
+    "名古屋市", "京都市", "大阪市", "堺市", "神戸市", "岡山市", "広島市", "北九州市", "福岡市", "熊本市",
+))
+
+KANJI_DIGITS = {"〇": 0, "一": 1, "二": 2, "三": 3, "四": 4, "五": 5, "六": 6, "七": 7, "八": 8, "九": 9}
+
+# Normalization: full-width ASCII to ASCII (NFKC only for half-width kana), dashes between
+# digits become "-", ケ/ヵ between kanji become ヶ
+FULL_WIDTH = re.compile(r'[\u3000\uff01-\uff5e]')
+FULL_WIDTH_TABLE = str.maketrans({**{chr(code): chr(code - 0xFEE0) for code in range(0xFF01, 0xFF5F)}, "\u3000": " "})
+HALF_WIDTH_KANA = re.compile(r'[\uff61-\uff9f]')
+ODD_DASH = re.compile(r'[‐‑‒–—―−ー]')
+DASH = re.compile(r'(?<=\d)[‐‑‒–—―−ー](?=\d)')
+SMALL_KE = re.compile(r'(?<=[一-鿿])[ケヵ](?=[一-鿿])')
+
+POSTAL_CODE = re.compile(r'〒?(\d{3})-?(\d{4})(?!\d)')
+PREFECTURE_NAMES = frozenset(PREFECTURES)
+# A county counts only when a town or village follows it: 大和郡山市 is a city, 中新川郡上市町 a town.
+# 市 only ends a one-character county stem (余市郡, 高市郡), so 鹿児島市郡山町 stays a city's town
+COUNTY = re.compile(r'(?:[^\d市区郡]{1,5}?|[^\d市区郡]市)郡(?=(?:[^\d市]|市(?=[町村])){1,6}?[町村])')
+COUNTY_MUNICIPALITY = re.compile(r'[^\d]{1,6}?[町村]')
+MUNICIPALITY = re.compile(r'[^\d]{1,7}?[市区町村]')
+# 東村山市, 大町市, 十日町市: a 町/村 outside a county is usually part of a city name
+CITY_CONTINUATION = re.compile(r'[^\d市区町村]{0,2}市')
+WARD = re.compile(r'[^\d]{1,4}?区')
+# Hokkaido grid towns carry their 条 number in the name: 北1条西 (2丁目), 6条通 (9丁目)
+TOWN = re.compile(r'(?:[^\d]*?\d+条)?[^\d]*?(?=\d|[〇一二三四五六七八九十]+丁目|$)')
+NUMBERS = re.compile(
+    r'(?:(?P<chome>\d+|[〇一二三四五六七八九十]+)丁目-?)?'
+    r'(?:(?P<n1>\d+)(?:番地|番|-)?(?:(?P<n2>\d+)(?:号|-)?(?:(?P<n3>\d+)号?)?)?)?'
+)
+
+class ParsedAddress(NamedTuple):
+    """A normalized address split into its parts; missing parts are empty strings
+
+    chome, block and number are ASCII digit strings ("2丁目8番1号" and "2-8-1" both give
+    2, 8, 1); a bare pair such as "961-1" is block and number. rest is whatever follows
+    the numbers, typically a building name; postal_code is a leading 〒 code (7 digits).
+    """
+    prefecture: str
+    county: str
+    city: str
+    ward: str
+    town: str
+    chome: str
+    block: str
+    number: str
+    rest: str = ""
+    postal_code: str = ""
+
+    @property
+    def key(self) -> str:
+        """Canonical form shared by every spelling of the address: no county, numbers as 2-8-1"""
+        numbers = "-".join(part for part in (self.chome, self.block, self.number) if part)
+        return f"{self.prefecture}{self.city}{self.ward}{self.town}{numbers}{self.rest}"
+
+    @property
+    def canonical(self) -> str:
+        """The key with its 〒 code in front, as an address to search for"""
+        if not self.postal_code:
+            return self.key
+        return f"〒{self.postal_code[:3]}-{self.postal_code[3:]} {self.key}"
+
+def kanji_number(text: str) -> int:
+    """Value of a kanji numeral up to 99 (二, 十, 十二, 二十三)"""
+    if "十" not in text:
+        value = 0
+        for char in text:
+            value = value * 10 + KANJI_DIGITS[char]
+        return value
+    tens, _, ones = text.partition("十")
+    return (KANJI_DIGITS[tens] if tens else 1) * 10 + (KANJI_DIGITS[ones] if ones else 0)
+
+def normalize(address: str) -> str:
+    """Full-width digits and letters to ASCII, one "-" for every dash between digits,
+    ヶ for ケ/ヵ inside place names, no whitespace"""
+    # The checks are cheaper than the rewrites they skip on already-clean addresses
+    if HALF_WIDTH_KANA.search(address):
+        address = unicodedata.normalize("NFKC", address)
+    elif FULL_WIDTH.search(address):
+        address = address.translate(FULL_WIDTH_TABLE)
+    text = "".join(address.split())
+    if ODD_DASH.search(text):
+        text = DASH.sub("-", text)
+    if "ケ" in text or "ヵ" in text:
+        text = SMALL_KE.sub("ヶ", text)
+    return text
+
+@lru_cache(maxsize=65536)
+def parse_address(address: str) -> ParsedAddress:
+    """Split an address into its parts in one left-to-right pass over the normalized text"""
+    text = normalize(address)
+    pos = 0
+    postal_code = ""
+
+    match = POSTAL_CODE.match(text)
+    if match:
+        postal_code, pos = match.group(1) + match.group(2), match.end()
+
+    prefecture = county = city = ward = ""
+    for length in (3, 4):
+        if text[pos:pos + length] in PREFECTURE_NAMES:
+            prefecture, pos = text[pos:pos + length], pos + length
+            break
+
+    match = COUNTY.match(text, pos) if "郡" in text else None
+    if match:
+        county, pos = match.group(), match.end()
+        match = COUNTY_MUNICIPALITY.match(text, pos)
+    else:
+        match = MUNICIPALITY.match(text, pos)
+    if match:
+        city, pos = match.group(), match.end()
+        if not county:
+            if city[-1] in "町村":
+                continuation = CITY_CONTINUATION.match(text, pos)
+                if continuation:
+                    city, pos = city + continuation.group(), continuation.end()
+            elif city[-1] == "市" and text.startswith("市", pos):
+                # 廿日市市, 四日市市
+                city, pos = city + "市", pos + 1
+
+    if city in DESIGNATED_CITIES:
+        match = WARD.match(text, pos)
+        if match:
+            ward, pos = match.group(), match.end()
+
+    match = TOWN.match(text, pos)
+    town, pos = match.group(), match.end()
+
+    match = NUMBERS.match(text, pos)
+    chome, n1, n2, n3 = match.group("chome", "n1", "n2", "n3")
+    pos = match.end()
+    if chome:
+        chome = chome if chome.isdigit() else str(kanji_number(chome))
+        block, number = n1 or "", n2 or ""
+    elif n3:
+        chome, block, number = n1, n2, n3
+    else:
+        chome, block, number = "", n1 or "", n2 or ""
+
+    return ParsedAddress(prefecture, county, city, ward, town,
+                         chome and str(int(chome)), block and str(int(block)), number and str(int(number)),
+                         text[pos:], postal_code)
+
+def address_key(address: str) -> str:
+    """Canonical cache key for an address (ParsedAddress.key)"""
+    return parse_address(address).key
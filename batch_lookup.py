@@ -0,0 +1,312 @@
+#!/usr/bin/env python3
+"""
+Batch address lookup: read addresses from a CSV/Excel file, find the nearest contacts for
+each one and write the results as a multi-sheet XLSX workbook (or a pair of CSV files).
+
+Rows are read, resolved and written in chunks, so memory stays bounded however large the
+input is. Each address goes through the steps of the Streamlit search (locate_address: the
+geocoder chain and boundary jurisdiction; then the nearest contacts and assemble_results),
+with the geocoding of a chunk running concurrently (geocode_batch.geocode_addresses) and its
+contacts searched together (get_comprehensive_contacts_batch).
+
+Usage:
+    python batch_lookup.py sites.xlsx contacts.xlsx
+    python batch_lookup.py sites.csv contacts.csv --column 所在地 --chunk-size 200
+"""
+
+import argparse
+import csv
+import io
+import os
+import sys
+import time
+from typing import IO, Any, Callable, Dict, Iterator, List, Optional, Sequence, Tuple, Union
+
+import pandas as pd
+from openpyxl import Workbook, load_workbook
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from address_parser import parse_address
+from contact_search import assemble_results, get_comprehensive_contacts_batch, locate_address, parse_address_components
+from geocode_batch import DEFAULT_MAX_IN_FLIGHT, geocode_addresses
+from geocoder import ADDRESS, GeocodeResult
+
+ADDRESS_COLUMN_CANDIDATES = ("住所", "所在地", "address", "Address")
+SUMMARY_COLUMNS = ["行", "入力住所", "都道府県", "市区町村", "区", "緯度", "経度", "位置情報", "件数"]
+CONTACT_COLUMNS = ["行", "入力住所", "種別", "施設名", "電話番号", "住所", "営業時間", "サービス", "距離"]
+DEFAULT_CHUNK_SIZE = 100
+
+# 位置情報 values: located at the address, estimated from a coarser place (postal code, town,
+# city), or no coordinates (city-level contacts only)
+GEOCODED, ESTIMATED, NOT_FOUND = "住所", "推定", "取得失敗"
+
+Source = Union[str, IO[bytes]]
+
+def _is_excel(name: str) -> bool:
+    return os.path.splitext(name)[1].lower() in (".xlsx", ".xlsm")
+
+def pick_address_column(columns: Sequence[Any], column: Optional[str] = None) -> int:
+    """Index of the address column: the requested one, a well-known header, or the first"""
+    headers = ["" if c is None else str(c).strip() for c in columns]
+    if column is not None:
+        if column not in headers:
+            raise ValueError(f"column '{column}' not found (columns: {', '.join(headers)})")
+        return headers.index(column)
+    for candidate in ADDRESS_COLUMN_CANDIDATES:
+        if candidate in headers:
+            return headers.index(candidate)
+    return 0
+
+def iter_address_chunks(source: Source, name: Optional[str] = None, column: Optional[str] = None,
+                        chunk_size: int = DEFAULT_CHUNK_SIZE, encoding: str = "utf-8-sig") -> Iterator[List[Tuple[int, str]]]:
+    """Yield lists of (row number, address) read chunk by chunk from a CSV or XLSX file
+
+    Row numbers count data rows from 1 (the header is not counted); blank addresses are skipped.
+    """
+    name = name or (source if isinstance(source, str) else getattr(source, "name", ""))
+    chunk: List[Tuple[int, str]] = []
+
+    if _is_excel(name):
+        workbook = load_workbook(source, read_only=True, data_only=True)
+        try:
+            rows = workbook.worksheets[0].iter_rows(values_only=True)
+            header = next(rows, None)
+            if header is None:
+                return
+            index = pick_address_column(header, column)
+            for row_number, row in enumerate(rows, start=1):
+                value = row[index] if index < len(row) else None
+                if value is not None and str(value).strip():
+                    chunk.append((row_number, str(value).strip()))
+                if len(chunk) >= chunk_size:
+                    yield chunk
+                    chunk = []
+        finally:
+            workbook.close()
+    else:
+        row_number = 0
+        index = None
+        with pd.read_csv(source, dtype=str, keep_default_na=False, encoding=encoding, chunksize=chunk_size) as reader:
+            for frame in reader:
+                if index is None:
+                    index = pick_address_column(list(frame.columns), column)
+                for value in frame.iloc[:, index]:
+                    row_number += 1
+                    if value.strip():
+                        chunk.append((row_number, value.strip()))
+                    if len(chunk) >= chunk_size:
+                        yield chunk
+                        chunk = []
+
+    if chunk:
+        yield chunk
+
+def count_rows(source: Source, name: Optional[str] = None) -> Optional[int]:
+    """Number of data rows, for progress reporting (None when it cannot be read cheaply)"""
+    name = name or (source if isinstance(source, str) else getattr(source, "name", ""))
+    try:
+        if _is_excel(name):
+            workbook = load_workbook(source, read_only=True)
+            try:
+                max_row = workbook.worksheets[0].max_row
+            finally:
+                workbook.close()
+            return max_row - 1 if max_row else None
+        if isinstance(source, str):
+            with open(source, "rb") as f:
+                return max(sum(1 for _ in f) - 1, 0)
+        return max(sum(1 for _ in source) - 1, 0)
+    except Exception:
+        return None
+    finally:
+        # Uploaded files are read again from the start by iter_address_chunks
+        if not isinstance(source, str):
+            source.seek(0)
+
+def resolve_addresses(addresses: Sequence[str], located: Sequence[Optional[Tuple[GeocodeResult, Tuple[str, str, str]]]],
+                      cross_prefecture: bool = False, prefer_same_prefecture: bool = False) -> List[Dict[str, Any]]:
+    """Search located addresses as the Streamlit app does and tabulate their contacts
+
+    located holds locate_address's answers (None when it failed: city-level contacts only).
+    Less precise answers after a resolver failure are kept, as the app does. The contacts
+    come from one get_comprehensive_contacts_batch call, with search_address's results.
+    """
+    rows = []
+    for address, answer in zip(addresses, located):
+        geocoded, components = answer or (None, parse_address_components(address))
+        coords = geocoded.coords if geocoded else None
+        if coords is None:
+            status = NOT_FOUND
+        else:
+            status = GEOCODED if geocoded.precision >= ADDRESS else ESTIMATED
+        rows.append({"coords": coords, "status": status, "components": components})
+    # Without coordinates there is only the city's listing, as in search_address
+    queries = []
+    for row in rows:
+        pref, city_name, district_name = row["components"]
+        queries.append((city_name, district_name, pref, row["coords"]))
+    contacts = get_comprehensive_contacts_batch(queries, cross_prefecture=cross_prefecture,
+                                                prefer_same_prefecture=prefer_same_prefecture)
+    for row, row_contacts in zip(rows, contacts):
+        row["results"] = assemble_results(row_contacts)
+    return rows
+
+class XlsxBatchWriter:
+    """Stream results into an XLSX workbook with 概要 (one row per input) and 連絡先 sheets"""
+
+    def __init__(self, target: Union[str, IO[bytes]]):
+        self.target = target
+        self.workbook = Workbook(write_only=True)
+        self.summary = self.workbook.create_sheet("概要")
+        self.contacts = self.workbook.create_sheet("連絡先")
+        self.summary.append(SUMMARY_COLUMNS)
+        self.contacts.append(CONTACT_COLUMNS)
+
+    def write(self, summary_rows: List[List[Any]], contact_rows: List[List[Any]]) -> None:
+        for row in summary_rows:
+            self.summary.append(row)
+        for row in contact_rows:
+            self.contacts.append(row)
+
+    def close(self) -> None:
+        self.workbook.save(self.target)
+
+class CsvBatchWriter:
+    """Stream results into <name>.csv (contacts) and <name>_summary.csv (one row per input)"""
+
+    def __init__(self, path: str):
+        stem, _ = os.path.splitext(path)
+        self.paths = (path, f"{stem}_summary.csv")
+        # utf-8-sig so Excel opens the Japanese text correctly
+        self.files = [open(p, "w", encoding="utf-8-sig", newline="") for p in self.paths]
+        self.contacts, self.summary = (csv.writer(f) for f in self.files)
+        self.contacts.writerow(CONTACT_COLUMNS)
+        self.summary.writerow(SUMMARY_COLUMNS)
+
+    def write(self, summary_rows: List[List[Any]], contact_rows: List[List[Any]]) -> None:
+        self.summary.writerows(summary_rows)
+        self.contacts.writerows(contact_rows)
+
+    def close(self) -> None:
+        for f in self.files:
+            f.close()
+
+def run_batch(chunks: Iterator[List[Tuple[int, str]]], writer: Any, total: Optional[int] = None,
+              progress: Optional[Callable[[Dict[str, Any]], None]] = None,
+              max_in_flight: int = DEFAULT_MAX_IN_FLIGHT, cross_prefecture: bool = False,
+              prefer_same_prefecture: bool = False) -> Dict[str, Any]:
+    """Resolve every chunk of addresses and hand the rows to writer; returns run statistics
+
+    progress, if given, is called after each chunk with the running statistics. The search
+    options default to the app's.
+    """
+    stats: Dict[str, Any] = {"rows": 0, "total": total, "contacts": 0, GEOCODED: 0, ESTIMATED: 0, NOT_FOUND: 0,
+                             "elapsed": 0.0, "rows_per_second": 0.0}
+    start = time.perf_counter()
+
+    try:
+        for chunk in chunks:
+            summary_rows, contact_rows = [], []
+            # Canonical forms, as the app searches them
+            located = geocode_addresses([parse_address(address).canonical for _, address in chunk],
+                                        max_in_flight=max_in_flight, geocode=locate_address)
+            results = resolve_addresses([address for _, address in chunk], located, cross_prefecture, prefer_same_prefecture)
+            for (row_number, address), result in zip(chunk, results):
+                lat, lon = result["coords"] or ("", "")
+                summary_rows.append([row_number, address, *result["components"], lat, lon,
+                                     result["status"], len(result["results"])])
+                for record in result["results"].to_dict("records"):
+                    contact_rows.append([row_number, address, *(record[c] for c in CONTACT_COLUMNS[2:])])
+                stats[result["status"]] += 1
+            writer.write(summary_rows, contact_rows)
+
+            stats["rows"] += len(chunk)
+            stats["contacts"] += len(contact_rows)
+            stats["elapsed"] = time.perf_counter() - start
+            stats["rows_per_second"] = stats["rows"] / stats["elapsed"] if stats["elapsed"] else 0.0
+            if progress:
+                progress(dict(stats))
+    finally:
+        writer.close()
+
+    return stats
+
+def batch_lookup(input_path: str, output_path: str, column: Optional[str] = None,
+                 chunk_size: int = DEFAULT_CHUNK_SIZE, encoding: str = "utf-8-sig",
+                 progress: Optional[Callable[[Dict[str, Any]], None]] = None,
+                 max_in_flight: int = DEFAULT_MAX_IN_FLIGHT, cross_prefecture: bool = False,
+                 prefer_same_prefecture: bool = False) -> Dict[str, Any]:
+    """Resolve every address in input_path and write the workbook (or CSV pair) to output_path"""
+    chunks = iter_address_chunks(input_path, column=column, chunk_size=chunk_size, encoding=encoding)
+    writer = XlsxBatchWriter(output_path) if _is_excel(output_path) else CsvBatchWriter(output_path)
+    return run_batch(chunks, writer, total=count_rows(input_path), progress=progress, max_in_flight=max_in_flight,
+                     cross_prefecture=cross_prefecture, prefer_same_prefecture=prefer_same_prefecture)
+
+def format_progress(stats: Dict[str, Any]) -> str:
+    done = f"{stats['rows']}/{stats['total']}" if stats["total"] else str(stats["rows"])
+    return f"処理済み {done} 件 ({stats['rows_per_second']:.1f} 件/秒, 連絡先 {stats['contacts']} 件)"
+
+def render_batch_section(cross_prefecture: bool = False, prefer_same_prefecture: bool = False) -> None:
+    """Streamlit UI: upload a CSV/Excel file of addresses and download the contacts workbook
+
+    Takes the search options of the app's checkboxes.
+    """
+    import streamlit as st
+
+    st.subheader("📂 一括検索（CSV / Excel）")
+    uploaded = st.file_uploader("住所の列（住所・所在地・address）を含むファイル", type=["csv", "xlsx"])
+    if uploaded is None or not st.button("📥 一括検索を実行"):
+        return
+
+    total = count_rows(uploaded, uploaded.name)
+    bar = st.progress(0.0)
+    status = st.empty()
+
+    def show_progress(stats: Dict[str, Any]) -> None:
+        if stats["total"]:
+            bar.progress(min(stats["rows"] / stats["total"], 1.0))
+        status.write(format_progress(stats))
+
+    output = io.BytesIO()
+    try:
+        stats = run_batch(iter_address_chunks(uploaded, uploaded.name), XlsxBatchWriter(output),
+                          total=total, progress=show_progress, cross_prefecture=cross_prefecture,
+                          prefer_same_prefecture=prefer_same_prefecture)
+    except ValueError as e:
+        st.error(f"ファイルを読み込めませんでした: {e}")
+        return
+
+    bar.progress(1.0)
+    st.success(f"✅ {stats['rows']} 件の住所を処理しました（{stats['elapsed']:.1f} 秒）")
+    st.download_button(
+        "📥 結果をダウンロード (XLSX)",
+        data=output.getvalue(),
+        file_name=f"{os.path.splitext(uploaded.name)[0]}_contacts.xlsx",
+        mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+    )
+
+def main():
+    parser = argparse.ArgumentParser(description="Find nearest contacts for every address in a CSV/Excel file")
+    parser.add_argument("input", help="CSV or XLSX file with an address column")
+    parser.add_argument("output", help="output .xlsx workbook, or .csv (a _summary.csv is written alongside)")
+    parser.add_argument("--column", help="address column header (default: 住所/所在地/address, else the first column)")
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE, help="rows processed per chunk")
+    parser.add_argument("--encoding", default="utf-8-sig", help="CSV input encoding (e.g. cp932 for Shift_JIS)")
+    parser.add_argument("--workers", type=int, default=DEFAULT_MAX_IN_FLIGHT, help="concurrent geocoding lookups per chunk")
+    parser.add_argument("--cross-prefecture", action="store_true", help="search facilities across prefecture borders")
+    parser.add_argument("--prefer-same-prefecture", action="store_true",
+                        help="with --cross-prefecture, list the address's prefecture first")
+    args = parser.parse_args()
+
+    stats = batch_lookup(args.input, args.output, column=args.column, chunk_size=args.chunk_size,
+                         encoding=args.encoding, progress=lambda s: print(f"  {format_progress(s)}"),
+                         max_in_flight=args.workers, cross_prefecture=args.cross_prefecture,
+                         prefer_same_prefecture=args.prefer_same_prefecture)
+
+    print(f"✅ Wrote {args.output}")
+    print(f"  {GEOCODED}: {stats[GEOCODED]}, {ESTIMATED}: {stats[ESTIMATED]}, {NOT_FOUND}: {stats[NOT_FOUND]}")
+    print(f"  {stats['rows']} rows in {stats['elapsed']:.1f}s ({stats['rows_per_second']:.1f} rows/s)")
+
+if __name__ == "__main__":
+    main()
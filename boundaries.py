@@ -0,0 +1,297 @@
+#!/usr/bin/env python3
+"""
+Local reverse geocoder: (lat, lon) → prefecture / city / ward from municipal boundary polygons.
+
+Boundaries come from an administrative-area extract such as 国土数値情報 N03 (GeoJSON, or a
+shapefile when pyshp is installed) and are imported offline into boundaries.npz. A lookup
+probes one grid cell and runs a vectorized point-in-polygon test on the few polygons whose
+bounding box covers the point: no network call, well under a millisecond.
+
+Usage:
+    python boundaries.py N03-20240101_13.geojson N03-20240101_14.geojson   # build boundaries.npz
+    python boundaries.py --lookup 35.6895,139.6917                          # reverse-geocode a point
+"""
+
+import argparse
+import hashlib
+import json
+import math
+import os
+from typing import Any, Callable, Dict, Iterable, Iterator, List, NamedTuple, Optional, Sequence, Tuple
+
+import numpy as np
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+BOUNDARIES_PATH = os.path.join(BASE_DIR, "boundaries.npz")
+BOUNDARIES_VERSION = 1
+
+# GeoJSON order: (lon, lat)
+Ring = Sequence[Sequence[float]]
+Polygon = Sequence[Ring]  # outer ring first, then holes
+
+# 国土数値情報 N03 attributes: prefecture, 振興局 (Hokkaido), county or 政令市, municipality or ward, code
+N03_PREFECTURE, N03_CITY_OR_COUNTY, N03_MUNICIPALITY, N03_CODE = "N03_001", "N03_003", "N03_004", "N03_007"
+UNASSIGNED = "所属未定地"  # disputed reclaimed land; no municipality to report
+
+class Jurisdiction(NamedTuple):
+    """Municipality containing a point; county (郡) and ward (政令市 区) are empty when not applicable"""
+    prefecture: str
+    county: str
+    city: str
+    ward: str
+    code: str = ""
+
+    @property
+    def components(self) -> Tuple[str, str, str]:
+        """(prefecture, city, ward), as parse_address_components returns them"""
+        return self.prefecture, self.city, self.ward
+
+class PolygonIndex:
+    """Polygons (with holes) bucketed by bounding box into a lat/lon grid, each with a payload
+
+    Every polygon edge lives in one (E, 4) array of x1, y1, x2, y2 rows, the edges of one
+    polygon (all its rings) contiguous, so the even-odd test is a single vectorized pass.
+    """
+
+    def __init__(self, edges: np.ndarray, edge_offsets: np.ndarray, boxes: np.ndarray,
+                 owners: np.ndarray, payloads: List[Any], cell_deg: float = 0.05):
+        self.edges = edges
+        self.edge_offsets = edge_offsets
+        self.boxes = boxes
+        self.owners = owners
+        self.payloads = payloads
+        self.cell_deg = cell_deg
+        self._x1, self._y1, self._x2, self._y2 = (np.ascontiguousarray(edges[:, i]) for i in range(4))
+        self._offsets = edge_offsets.tolist()
+        self._boxes = boxes.tolist()
+        self._owners = owners.tolist()
+        self._cells: Dict[Tuple[int, int], List[int]] = {}
+        for polygon, (min_lon, min_lat, max_lon, max_lat) in enumerate(self._boxes):
+            row0, col0 = self._cell(min_lat, min_lon)
+            row1, col1 = self._cell(max_lat, max_lon)
+            for row in range(row0, row1 + 1):
+                for col in range(col0, col1 + 1):
+                    self._cells.setdefault((row, col), []).append(polygon)
+
+    @classmethod
+    def from_polygons(cls, items: Iterable[Tuple[Polygon, Any]], cell_deg: float = 0.05) -> "PolygonIndex":
+        """Index (polygon, payload) pairs; equal payloads are stored once"""
+        edges: List[np.ndarray] = []
+        offsets = [0]
+        boxes: List[Tuple[float, float, float, float]] = []
+        owners: List[int] = []
+        payloads: List[Any] = []
+        payload_ids: Dict[Any, int] = {}
+        for rings, payload in items:
+            polygon_edges = [ring_edges(ring) for ring in rings if len(ring) >= 3]
+            if not polygon_edges:
+                continue
+            polygon_edges = np.concatenate(polygon_edges)
+            edges.append(polygon_edges)
+            offsets.append(offsets[-1] + len(polygon_edges))
+            xs, ys = polygon_edges[:, 0], polygon_edges[:, 1]
+            boxes.append((float(xs.min()), float(ys.min()), float(xs.max()), float(ys.max())))
+            if payload not in payload_ids:
+                payload_ids[payload] = len(payloads)
+                payloads.append(payload)
+            owners.append(payload_ids[payload])
+        return cls(
+            np.concatenate(edges) if edges else np.empty((0, 4)),
+            np.array(offsets, dtype=np.int64),
+            np.array(boxes, dtype=np.float64).reshape(-1, 4),
+            np.array(owners, dtype=np.int64),
+            payloads,
+            cell_deg,
+        )
+
+    def __len__(self) -> int:
+        return len(self._owners)
+
+    def _cell(self, lat: float, lon: float) -> Tuple[int, int]:
+        return math.floor(lat / self.cell_deg), math.floor(lon / self.cell_deg)
+
+    def contains(self, polygon: int, lat: float, lon: float) -> bool:
+        """Even-odd rule over every ring of one polygon, so points in holes are outside"""
+        start, end = self._offsets[polygon], self._offsets[polygon + 1]
+        y1, y2 = self._y1[start:end], self._y2[start:end]
+        crossing = (y1 > lat) != (y2 > lat)
+        if not crossing.any():
+            return False
+        x1, x2 = self._x1[start:end][crossing], self._x2[start:end][crossing]
+        y1, y2 = y1[crossing], y2[crossing]
+        x_at_lat = x1 + (lat - y1) * (x2 - x1) / (y2 - y1)
+        return bool(np.count_nonzero(lon < x_at_lat) % 2)
+
+    def locate(self, lat: float, lon: float) -> Optional[Any]:
+        """Payload of the polygon containing the point, or None outside every polygon"""
+        for polygon in self._cells.get(self._cell(lat, lon), ()):
+            min_lon, min_lat, max_lon, max_lat = self._boxes[polygon]
+            if min_lon <= lon <= max_lon and min_lat <= lat <= max_lat and self.contains(polygon, lat, lon):
+                return self.payloads[self._owners[polygon]]
+        return None
+
+    def locate_all(self, lat: float, lon: float) -> List[Any]:
+        """Payloads of every polygon containing the point, for layers whose polygons overlap"""
+        return [
+            self.payloads[self._owners[polygon]]
+            for polygon in self._cells.get(self._cell(lat, lon), ())
+            if self._boxes[polygon][0] <= lon <= self._boxes[polygon][2]
+            and self._boxes[polygon][1] <= lat <= self._boxes[polygon][3]
+            and self.contains(polygon, lat, lon)
+        ]
+
+    def save(self, path: str, source_sha1: str, version: int) -> None:
+        """Write the index atomically; payloads must be JSON-serializable"""
+        tmp_path = path + ".tmp"
+        with open(tmp_path, "wb") as f:
+            np.savez_compressed(
+                f, edges=self.edges, edge_offsets=self.edge_offsets, boxes=self.boxes, owners=self.owners,
+                payloads=np.array(json.dumps(self.payloads, ensure_ascii=False)),
+                source_sha1=np.array(source_sha1), version=np.array(version),
+            )
+        os.replace(tmp_path, path)
+
+def ring_edges(ring: Ring) -> np.ndarray:
+    """(n, 4) array of x1, y1, x2, y2 per edge; the ring is closed if it is not already"""
+    points = np.asarray(ring, dtype=np.float64)[:, :2]
+    if not np.array_equal(points[0], points[-1]):
+        points = np.vstack([points, points[:1]])
+    return np.hstack([points[:-1], points[1:]])
+
+def load_polygon_index(path: str, version: int, payload: Callable[[Any], Any] = tuple) -> Optional[PolygonIndex]:
+    """Index saved by PolygonIndex.save, or None when missing or from another version"""
+    try:
+        with np.load(path, allow_pickle=False) as data:
+            if int(data["version"]) != version:
+                return None
+            return PolygonIndex(
+                data["edges"], data["edge_offsets"], data["boxes"], data["owners"],
+                [payload(item) for item in json.loads(str(data["payloads"]))],
+            )
+    except (OSError, ValueError, KeyError):
+        return None
+
+# -----------------------------
+# Reading boundary files
+# -----------------------------
+
+def geometry_polygons(geometry: Optional[Dict[str, Any]]) -> List[Polygon]:
+    """Polygons of a GeoJSON Polygon or MultiPolygon geometry (anything else has none)"""
+    if not geometry:
+        return []
+    if geometry.get("type") == "Polygon":
+        return [geometry["coordinates"]]
+    if geometry.get("type") == "MultiPolygon":
+        return list(geometry["coordinates"])
+    return []
+
+def read_features(path: str, encoding: str = "utf-8") -> Iterator[Tuple[Dict[str, Any], List[Polygon]]]:
+    """(properties, polygons) per feature of a GeoJSON file, or of a shapefile (needs pyshp)"""
+    if path.lower().endswith(".shp"):
+        try:
+            import shapefile
+        except ImportError as e:
+            raise ImportError("Reading shapefiles needs pyshp: pip install pyshp "
+                              "(or convert the extract to GeoJSON)") from e
+        with shapefile.Reader(path, encoding=encoding) as reader:
+            for shape_record in reader.iterShapeRecords():
+                yield shape_record.record.as_dict(), geometry_polygons(shape_record.shape.__geo_interface__)
+        return
+    with open(path, encoding=encoding) as f:
+        collection = json.load(f)
+    for feature in collection.get("features", []):
+        yield feature.get("properties") or {}, geometry_polygons(feature.get("geometry"))
+
+def feature_jurisdiction(properties: Dict[str, Any]) -> Optional[Jurisdiction]:
+    """Jurisdiction from N03 attributes (or plain prefecture/county/city/ward/code keys)"""
+    if N03_PREFECTURE not in properties:
+        if not properties.get("prefecture"):
+            return None
+        return Jurisdiction(*(str(properties.get(key) or "") for key in ("prefecture", "county", "city", "ward", "code")))
+
+    prefecture = properties.get(N03_PREFECTURE) or ""
+    upper = properties.get(N03_CITY_OR_COUNTY) or ""
+    municipality = properties.get(N03_MUNICIPALITY) or ""
+    code = str(properties.get(N03_CODE) or "")
+    if not prefecture or municipality == UNASSIGNED:
+        return None
+    if upper.endswith("郡"):
+        return Jurisdiction(prefecture, upper, municipality, "", code)
+    if upper.endswith("市"):
+        # 政令市: N03_003 is the city, N03_004 its ward
+        return Jurisdiction(prefecture, "", upper, municipality, code)
+    return Jurisdiction(prefecture, "", municipality, "", code)
+
+def build_boundary_index(paths: Sequence[str], encoding: str = "utf-8") -> PolygonIndex:
+    """Boundary index from one or more extracts (typically one per prefecture)"""
+    def items() -> Iterator[Tuple[Polygon, Jurisdiction]]:
+        for path in paths:
+            for properties, polygons in read_features(path, encoding):
+                jurisdiction = feature_jurisdiction(properties)
+                if jurisdiction is not None:
+                    for polygon in polygons:
+                        yield polygon, jurisdiction
+    return PolygonIndex.from_polygons(items())
+
+# -----------------------------
+# Lookups
+# -----------------------------
+
+class BoundaryIndex:
+    """Reverse geocoder over a PolygonIndex of Jurisdiction payloads (empty when not imported)"""
+
+    def __init__(self, polygons: Optional[PolygonIndex] = None):
+        self.polygons = polygons
+
+    def __len__(self) -> int:
+        return len(self.polygons) if self.polygons is not None else 0
+
+    def reverse_geocode(self, lat: float, lon: float) -> Optional[Jurisdiction]:
+        """Municipality containing the point, or None outside the imported boundaries"""
+        if self.polygons is None:
+            return None
+        return self.polygons.locate(lat, lon)
+
+def load_boundary_index(path: str = BOUNDARIES_PATH) -> BoundaryIndex:
+    """Index from the imported file; empty when it has not been built (or is from another version)"""
+    return BoundaryIndex(load_polygon_index(path, BOUNDARIES_VERSION, lambda item: Jurisdiction(*item)))
+
+_default_index: Optional[BoundaryIndex] = None
+
+def get_boundary_index() -> BoundaryIndex:
+    """Process-wide boundary index, loaded on first use"""
+    global _default_index
+    if _default_index is None:
+        _default_index = load_boundary_index()
+    return _default_index
+
+def reverse_geocode(lat: float, lon: float) -> Optional[Jurisdiction]:
+    """Municipality containing a point according to the imported boundaries"""
+    return get_boundary_index().reverse_geocode(lat, lon)
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Import municipal boundaries or reverse-geocode a point")
+    parser.add_argument("inputs", nargs="*", help="N03 GeoJSON (.geojson/.json) or shapefile (.shp) extracts")
+    parser.add_argument("--output", default=BOUNDARIES_PATH)
+    parser.add_argument("--encoding", default="utf-8", help="text encoding of the inputs (N03 shapefiles: cp932)")
+    parser.add_argument("--lookup", metavar="LAT,LON", help="print the municipality containing a point")
+    args = parser.parse_args()
+
+    if args.lookup:
+        lat, lon = (float(value) for value in args.lookup.split(","))
+        jurisdiction = load_boundary_index(args.output).reverse_geocode(lat, lon)
+        print(jurisdiction if jurisdiction else f"❌ {args.lookup} is outside the boundaries in {args.output}")
+        return
+    if not args.inputs:
+        parser.error("no input files")
+
+    sha1 = hashlib.sha1()
+    for path in args.inputs:
+        with open(path, "rb") as f:
+            sha1.update(f.read())
+    index = build_boundary_index(args.inputs, args.encoding)
+    index.save(args.output, sha1.hexdigest(), BOUNDARIES_VERSION)
+    print(f"✅ {len(index.payloads)} municipalities ({len(index)} polygons) → {args.output}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+"""
+Offline build step: resolve every CONTACT_DATABASE facility address once and store
+lat/lon in the versioned coordinate sidecar (facility_coordinates.json).
+
+The query path (get_comprehensive_contacts) reads the sidecar instead of geocoding
+each candidate facility on every search.
+
+Usage:
+    python build_facility_coordinates.py             # resolve addresses missing from the sidecar
+    python build_facility_coordinates.py --refresh   # re-resolve every address
+    python build_facility_coordinates.py --offline   # local coordinate map only, no GSI calls
+
+An offline build lists the addresses it could not place under "unresolved", so the sidecar
+covers every facility (the app leaves those unmapped); the next online build retries them.
+Only a sidecar without unresolved addresses is shipped, so the build exits with status 1
+while any remain.
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from contact_search import (
+    CONTACT_DATABASE,
+    FACILITY_COORDINATES_PATH,
+    FACILITY_COORDINATES_VERSION,
+    estimate_coordinates_from_address,
+    gsi_address_search,
+    read_facility_sidecar,
+)
+
+def iter_facility_addresses() -> Iterator[Tuple[str, List[str]]]:
+    """Yield each distinct facility address in database order, with the prefectures listing it"""
+    listings: Dict[str, List[str]] = {}
+    for prefecture, pref_data in CONTACT_DATABASE.items():
+        for city_data in pref_data.values():
+            for district_data in city_data.values():
+                for contacts in district_data.values():
+                    for contact in contacts:
+                        address = contact.get("address", "")
+                        if address:
+                            prefectures = listings.setdefault(address, [])
+                            if prefecture not in prefectures:
+                                prefectures.append(prefecture)
+    yield from listings.items()
+
+def write_facility_coordinates(coordinates: Dict[str, Optional[Tuple[float, float]]], path: str,
+                               unresolved: Sequence[str] = ()) -> None:
+    """Write the sidecar with one address per line so rebuilds produce readable diffs"""
+    lines = []
+    for address, coords in coordinates.items():
+        value = [round(coords[0], 6), round(coords[1], 6)] if coords else None
+        lines.append(f"    {json.dumps(address, ensure_ascii=False)}: {json.dumps(value)}")
+    unresolved_lines = [f"    {json.dumps(address, ensure_ascii=False)}" for address in unresolved]
+
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        f.write("{\n")
+        f.write(f'  "version": {FACILITY_COORDINATES_VERSION},\n')
+        f.write('  "coordinates": {\n')
+        f.write(",\n".join(lines))
+        f.write("\n  },\n")
+        f.write('  "unresolved": [\n')
+        f.write(",\n".join(unresolved_lines))
+        f.write("\n  ]\n}\n")
+    os.replace(tmp_path, path)
+
+def build_facility_coordinates(path: str = FACILITY_COORDINATES_PATH, refresh: bool = False,
+                               offline: bool = False, delay: float = 0.2) -> Dict[str, int]:
+    """Resolve facility addresses into the sidecar and return per-source counts"""
+    # Unresolved addresses are not in the coordinates, so every build retries them
+    existing = {} if refresh else read_facility_sidecar(path)[0]
+    coordinates: Dict[str, Optional[Tuple[float, float]]] = {}
+    unresolved: List[str] = []
+    stats = {"cached": 0, "local": 0, "gsi": 0, "no_match": 0, "unreachable": 0}
+
+    for address, prefectures in iter_facility_addresses():
+        if address in existing:
+            coordinates[address] = existing[address]
+            stats["cached"] += 1
+            continue
+
+        # Misfiled entries (e.g. a Hiroshima town listed under 茨城県) resolve under another listing
+        coords = next(filter(None, (
+            estimate_coordinates_from_address(address, allow_remote=False, prefecture=prefecture)
+            for prefecture in prefectures
+        )), None)
+        if coords:
+            coordinates[address] = coords
+            stats["local"] += 1
+            continue
+
+        if offline:
+            # Listed as unresolved: unmapped in the app, retried by the next online build
+            unresolved.append(address)
+            stats["unreachable"] += 1
+            continue
+
+        try:
+            coords = gsi_address_search(address, timeout=10, use_cache=not refresh)
+        except Exception as e:
+            # Transport errors are not recorded: a missing entry is retried next build
+            print(f"  ⚠️ GSI unreachable for {address}: {e}")
+            unresolved.append(address)
+            stats["unreachable"] += 1
+            continue
+        finally:
+            time.sleep(delay)
+
+        coordinates[address] = coords
+        stats["gsi" if coords else "no_match"] += 1
+
+    write_facility_coordinates(coordinates, path, unresolved)
+    return stats
+
+def main():
+    parser = argparse.ArgumentParser(description="Precompute facility coordinates for CONTACT_DATABASE")
+    parser.add_argument("--output", default=FACILITY_COORDINATES_PATH, help="sidecar path")
+    parser.add_argument("--refresh", action="store_true", help="re-resolve addresses already in the sidecar")
+    parser.add_argument("--offline", action="store_true", help="use the local coordinate map only")
+    parser.add_argument("--delay", type=float, default=0.2, help="seconds to wait between GSI requests")
+    args = parser.parse_args()
+
+    stats = build_facility_coordinates(args.output, refresh=args.refresh, offline=args.offline, delay=args.delay)
+
+    print(f"✅ Wrote {args.output}")
+    for source, count in stats.items():
+        print(f"  {source}: {count}")
+    if stats["unreachable"]:
+        print(f"⚠️ {stats['unreachable']} addresses unresolved; re-run with network access to fill them in")
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,5324 @@
+# contact_data.py
+# Contact Database source - ONLY 11 Required Categories - Kanto Region, Yamaguchi, Hiroshima, Yamanashi
+#
+# This is the editable source of truth. The app reads the compiled store built from it
+# (see contact_store.py), so importing this module is only needed when compiling.
+
+CONTACT_DATABASE = {
+    "神奈川県": {
+        "横浜市": {
+            "鶴見区": {
+                "労基署": [{"name": "横浜東労働基準監督署", "phone": "045-211-7370", "address": "横浜市中区北仲通5-57", "hours": "平日 8:30-17:15", "services": ["労働相談", "労災申請"]}],
+                "警察署": [{"name": "鶴見警察署", "phone": "045-504-0110", "address": "横浜市鶴見区鶴見中央4-38-37", "hours": "24時間", "services": ["事件事故", "遺失物"]}],
+                "市区町村役所": [
+                    {"name": "鶴見区役所", "phone": "045-510-1800", "address": "横浜市鶴見区鶴見中央3-20-1", "hours": "平日 8:45-17:00", "services": ["住民票", "戸籍"]},
+                    {"name": "鶴見区環境対策課", "phone": "045-510-1840", "address": "横浜市鶴見区鶴見中央3-20-1", "hours": "平日 8:45-17:00", "services": ["ごみ収集", "リサイクル", "環境対策"]}
+                ],
+                "消防署": [{"name": "鶴見消防署", "phone": "045-503-0119", "address": "横浜市鶴見区豊岡町2-2", "hours": "24時間", "services": ["火災通報", "救急車"]}],
+                "ガス": [{"name": "東京ガス鶴見支店", "phone": "0570-002211", "address": "横浜市鶴見区鶴見中央4-32-1", "hours": "平日 8:30-19:00", "services": ["ガス開栓", "緊急通報"]}],
+                "電力": [{"name": "東京電力パワーグリッド鶴見支社", "phone": "0120-995-007", "address": "横浜市鶴見区鶴見中央1-31-2", "hours": "平日 9:00-17:00", "services": ["停電情報", "電気工事"]}],
+                "病院": [{"name": "済生会横浜市東部病院", "phone": "045-576-3000", "address": "横浜市鶴見区下末吉3-6-1", "hours": "24時間救急", "services": ["総合診療", "救急医療"]}],
+                "保健所": [{"name": "横浜市鶴見福祉保健センター", "phone": "045-510-1832", "address": "横浜市鶴見区鶴見中央3-20-1", "hours": "平日 8:45-17:00", "services": ["健康相談", "予防接種"]}],
+                "水道": [{"name": "横浜市水道局鶴見営業所", "phone": "045-671-3000", "address": "横浜市鶴見区鶴見中央3-20-1", "hours": "平日 8:45-17:00", "services": ["水道開栓", "料金"]}],
+                "NTT": [{"name": "NTT東日本神奈川支店", "phone": "116", "address": "横浜市西区みなとみらい2-3-3", "hours": "平日 9:00-17:00", "services": ["電話工事", "故障修理"]}],
+                "下水道": [{"name": "横浜市環境創造局鶴見水再生センター", "phone": "045-503-0201", "address": "横浜市鶴見区末広町1-15-1", "hours": "平日 8:45-17:15", "services": ["下水道修理", "排水設備"]}]
+            },
+            "神奈川区": {
+                "労基署": [{"name": "横浜東労働基準監督署", "phone": "045-211-7370", "address": "横浜市中区北仲通5-57", "hours": "平日 8:30-17:15", "services": ["労働相談", "労災申請"]}],
+                "警察署": [{"name": "神奈川警察署", "phone": "045-441-0110", "address": "横浜市神奈川区反町1-7-4", "hours": "24時間", "services": ["事件事故", "遺失物"]}],
+                "市区町村役所": [{"name": "神奈川区役所", "phone": "045-411-7171", "address": "横浜市神奈川区広台太田町3-8", "hours": "平日 8:45-17:00", "services": ["住民票", "戸籍"]}],
+                "消防署": [{"name": "神奈川消防署", "phone": "045-316-0119", "address": "横浜市神奈川区広台太田町2-3", "hours": "24時間", "services": ["火災通報", "救急車"]}],
+                "ガス": [{"name": "東京ガス神奈川支店", "phone": "0570-002211", "address": "横浜市神奈川区金港町6-18", "hours": "平日 8:30-19:00", "services": ["ガス開栓", "緊急通報"]}],
+                "電力": [{"name": "東京電力パワーグリッド神奈川支社", "phone": "0120-995-007", "address": "横浜市神奈川区金港町6-18", "hours": "平日 9:00-17:00", "services": ["停電情報", "電気工事"]}],
+                "病院": [{"name": "横浜市立市民病院", "phone": "045-316-4580", "address": "横浜市神奈川区三ツ沢西町1-1", "hours": "24時間救急", "services": ["総合診療", "救急医療"]}],
+                "保健所": [{"name": "横浜市神奈川福祉保健センター", "phone": "045-411-7138", "address": "横浜市神奈川区広台太田町3-8", "hours": "平日 8:45-17:00", "services": ["健康相談", "予防接種"]}],
+                "水道": [{"name": "横浜市水道局神奈川営業所", "phone": "045-671-3000", "address": "横浜市神奈川区広台太田町3-8", "hours": "平日 8:45-17:00", "services": ["水道開栓", "料金"]}],
+                "NTT": [{"name": "NTT東日本神奈川支店", "phone": "116", "address": "横浜市西区みなとみらい2-3-3", "hours": "平日 9:00-17:00", "services": ["電話工事", "故障修理"]}],
+                "下水道": [{"name": "横浜市環境創造局神奈川水再生センター", "phone": "045-453-2641", "address": "横浜市神奈川区千若町3-1-1", "hours": "平日 8:45-17:15", "services": ["下水道修理", "排水設備"]}]
+            }
+        },
+        "川崎市": {
+            "川崎区": {
+                "労基署": [{"name": "川崎北労働基準監督署", "phone": "044-556-3374", "address": "川崎市高津区久本2-4-3", "hours": "平日 8:30-17:15", "services": ["労働相談", "労災申請"]}],
+                "警察署": [{"name": "川崎警察署", "phone": "044-222-0110", "address": "川崎市川崎区南町16-1", "hours": "24時間", "services": ["事件事故", "遺失物"]}],
+                "市区町村役所": [
+                    {"name": "川崎区役所", "phone": "044-201-3113", "address": "川崎市川崎区東田町8", "hours": "平日 8:30-17:00", "services": ["住民票", "戸籍"]},
+                    {"name": "川崎市環境局", "phone": "044-200-2527", "address": "川崎市川崎区東田町8", "hours": "平日 8:30-17:00", "services": ["ごみ収集", "リサイクル", "環境対策"]}
+                ],
+                "消防署": [{"name": "川崎消防署", "phone": "044-223-0119", "address": "川崎市川崎区南町20-7", "hours": "24時間", "services": ["火災通報", "救急車"]}],
+                "ガス": [{"name": "東京ガス川崎支店", "phone": "0570-002211", "address": "川崎市川崎区駅前本町26-1", "hours": "平日 8:30-19:00", "services": ["ガス開栓", "緊急通報"]}],
+                "電力": [{"name": "東京電力パワーグリッド川崎支社", "phone": "0120-995-007", "address": "川崎市川崎区駅前本町11-1", "hours": "平日 9:00-17:00", "services": ["停電情報", "電気工事"]}],
+                "病院": [{"name": "川崎市立川崎病院", "phone": "044-233-5521", "address": "川崎市川崎区新川通12-1", "hours": "24時間救急", "services": ["総合診療", "救急医療"]}],
+                "保健所": [{"name": "川崎市川崎区保健福祉センター", "phone": "044-201-3306", "address": "川崎市川崎区東田町8", "hours": "平日 8:30-17:00", "services": ["健康相談", "予防接種"]}],
+                "水道": [{"name": "川崎市上下水道局川崎営業所", "phone": "044-200-3548", "address": "川崎市川崎区宮本町3-3", "hours": "平日 8:30-17:00", "services": ["水道開栓", "料金"]}],
+                "NTT": [{"name": "NTT東日本川崎支店", "phone": "116", "address": "川崎市川崎区駅前本町26-1", "hours": "平日 9:00-17:00", "services": ["電話工事", "故障修理"]}],
+                "下水道": [{"name": "川崎市上下水道局下水道管理センター", "phone": "044-200-2525", "address": "川崎市川崎区塩浜3-24-12", "hours": "平日 8:30-17:15", "services": ["下水道修理", "排水設備"]}]
+            }
+        },
+        "厚木市": {
+            "": {
+                "労基署": [{"name": "厚木労働基準監督署", "phone": "046-228-1331", "address": "厚木市田村町2-18", "hours": "平日 8:30-17:15", "services": ["労働相談", "労災申請"]}],
+                "警察署": [{"name": "厚木警察署", "phone": "046-223-0110", "address": "厚木市水引2-7-26", "hours": "24時間", "services": ["事件事故", "遺失物"]}],
+                "市区町村役所": [{"name": "厚木市役所", "phone": "046-223-1511", "address": "厚木市中町3-17-17", "hours": "平日 8:30-17:15", "services": ["住民票", "戸籍"]}],
+                "消防署": [{"name": "厚木市消防本部", "phone": "046-223-9365", "address": "厚木市水引2-7-26", "hours": "24時間", "services": ["火災通報", "救急車"]}],
+                "ガス": [{"name": "東京ガス厚木営業所", "phone": "0570-002211", "address": "厚木市中町2-6-14", "hours": "平日 8:30-19:00", "services": ["ガス開栓", "緊急通報"]}],
+                "電力": [{"name": "東京電力パワーグリッド厚木支社", "phone": "0120-995-007", "address": "厚木市中町3-12-1", "hours": "平日 9:00-17:00", "services": ["停電情報", "電気工事"]}],
+                "病院": [{"name": "厚木市立病院", "phone": "046-221-1570", "address": "厚木市水引1-16-36", "hours": "24時間救急", "services": ["総合診療", "救急医療"]}],
+                "保健所": [{"name": "厚木保健福祉事務所", "phone": "046-224-1111", "address": "厚木市水引2-3-1", "hours": "平日 8:30-17:15", "services": ["健康相談", "予防接種"]}],
+                "水道": [{"name": "厚木市上下水道局", "phone": "046-225-2368", "address": "厚木市中町3-17-17", "hours": "平日 8:30-17:15", "services": ["水道開栓", "料金"]}],
+                "NTT": [{"name": "NTT東日本神奈川支店", "phone": "116", "address": "横浜市西区みなとみらい2-3-3", "hours": "平日 9:00-17:00", "services": ["電話工事", "故障修理"]}],
+                "下水道": [{"name": "厚木市上下水道局", "phone": "046-225-2750", "address": "厚木市中町3-17-17", "hours": "平日 8:30-17:15", "services": ["下水道修理", "排水設備"]}]
+            }
+        },
+        "綾瀬市": {
+            "": {
+                "労基署": [{"name": "厚木労働基準監督署", "phone": "046-228-1331", "address": "厚木市田村町2-18", "hours": "平日 8:30-17:15", "services": ["労働相談", "労災申請"]}],
+                "警察署": [{"name": "大和警察署", "phone": "046-261-0110", "address": "大和市深見西3-1-29", "hours": "24時間", "services": ["事件事故", "遺失物"]}],
+                "市区町村役所": [{"name": "綾瀬市役所", "phone": "0467-77-1111", "address": "綾瀬市早川550", "hours": "平日 8:30-17:15", "services": ["住民票", "戸籍"]}],
+                "消防署": [{"name": "綾瀬市消防本部", "phone": "0467-76-0119", "address": "綾瀬市深谷中1-8-15", "hours": "24時間", "services": ["火災通報", "救急車"]}],
+                "ガス": [{"name": "東京ガス座間営業所", "phone": "0570-002211", "address": "座間市相模が丘1-22-30", "hours": "平日 8:30-19:00", "services": ["ガス開栓", "緊急通報"]}],
+                "電力": [{"name": "東京電力パワーグリッド厚木支社", "phone": "0120-995-007", "address": "厚木市中町3-12-1", "hours": "平日 9:00-17:00", "services": ["停電情報", "電気工事"]}],
+                "病院": [{"name": "綾瀬厚生病院", "phone": "0467-78-1311", "address": "綾瀬市深谷中2-8-23", "hours": "24時間救急", "services": ["総合診療", "救急医療"]}],
+                "保健所": [{"name": "厚木保健福祉事務所", "phone": "046-224-1111", "address": "厚木市水引2-3-1", "hours": "平日 8:30-17:15", "services": ["健康相談", "予防接種"]}],
+                "水道": [{"name": "綾瀬市上下水道部", "phone": "0467-70-5616", "address": "綾瀬市早川550", "hours": "平日 8:30-17:15", "services": ["水道開栓", "料金"]}],
+                "NTT": [{"name": "NTT東日本神奈川支店", "phone": "116", "address": "横浜市西区みなとみらい2-3-3", "hours": "平日 9:00-17:00", "services": ["電話工事", "故障修理"]}],
+                "下水道": [{"name": "綾瀬市上下水道部", "phone": "0467-70-5656", "address": "綾瀬市早川550", "hours": "平日 8:30-17:15", "services": ["下水道修理", "排水設備"]}]
+            }
+        },
+        "茅ヶ崎市": {
+            "": {
+                "労基署": [{"name": "藤沢労働基準監督署", "phone": "0466-23-6753", "address": "藤沢市朝日町5-12", "hours": "平日 8:30-17:15", "services": ["労働相談", "労災申請"]}],
+                "警察署": [{"name": "茅ヶ崎警察署", "phone": "0467-82-0110", "address": "茅ヶ崎市茅ヶ崎1-7-20", "hours": "24時間", "services": ["事件事故", "遺失物"]}],
+                "市区町村役所": [{"name": "茅ヶ崎市役所", "phone": "0467-82-1111", "address": "茅ヶ崎市茅ヶ崎1-1-1", "hours": "平日 8:30-17:00", "services": ["住民票", "戸籍"]}],
+                "消防署": [{"name": "茅ヶ崎市消防本部", "phone": "0467-85-4619", "address": "茅ヶ崎市茅ヶ崎1-8-7", "hours": "24時間", "services": ["火災通報", "救急車"]}],
+                "ガス": [{"name": "東京ガス茅ヶ崎営業所", "phone": "0570-002211", "address": "茅ヶ崎市新栄町7-5", "hours": "平日 8:30-19:00", "services": ["ガス開栓", "緊急通報"]}],
+                "電力": [{"name": "東京電力パワーグリッド藤沢支社", "phone": "0120-995-007", "address": "藤沢市藤沢93", "hours": "平日 9:00-17:00", "services": ["停電情報", "電気工事"]}],
+                "病院": [{"name": "茅ヶ崎市立病院", "phone": "0467-52-1111", "address": "茅ヶ崎市本村5-15-1", "hours": "24時間救急", "services": ["総合診療", "救急医療"]}],
+                "保健所": [{"name": "茅ヶ崎市保健所", "phone": "0467-38-3313", "address": "茅ヶ崎市茅ヶ崎1-8-7", "hours": "平日 8:30-17:00", "services": ["健康相談", "予防接種"]}],
+                "水道": [{"name": "茅ヶ崎市上下水道局", "phone": "0467-82-1111", "address": "茅ヶ崎市茅ヶ崎1-1-1", "hours": "平日 8:30-17:00", "services": ["水道開栓", "料金"]}],
+                "NTT": [{"name": "NTT東日本神奈川支店", "phone": "116", "address": "横浜市西区みなとみらい2-3-3", "hours": "平日 9:00-17:00", "services": ["電話工事", "故障修理"]}],
+                "下水道": [{"name": "茅ヶ崎市上下水道局", "phone": "0467-82-1111", "address": "茅ヶ崎市茅ヶ崎1-1-1", "hours": "平日 8:30-17:00", "services": ["下水道修理", "排水設備"]}]
+            }
+        },
+        "海老名市": {
+            "": {
+                "労基署": [{"name": "厚木労働基準監督署", "phone": "046-228-1331", "address": "厚木市田村町2-18", "hours": "平日 8:30-17:15", "services": ["労働相談", "労災申請"]}],
+                "警察署": [{"name": "海老名警察署", "phone": "046-233-0110", "address": "海老名市中央1-7-41", "hours": "24時間", "services": ["事件事故", "遺失物"]}],
+                "市区町村役所": [{"name": "海老名市役所", "phone": "046-231-2111", "address": "海老名市勝瀬175-1", "hours": "平日 8:30-17:15", "services": ["住民票", "戸籍"]}],
+                "消防署": [{"name": "海老名市消防本部", "phone": "046-231-2702", "address": "海老名市勝瀬175-1", "hours": "24時間", "services": ["火災通報", "救急車"]}],
+                "ガス": [{"name": "東京ガス海老名営業所", "phone": "0570-002211", "address": "海老名市中央1-4-1", "hours": "平日 8:30-19:00", "services": ["ガス開栓", "緊急通報"]}],
+                "電力": [{"name": "東京電力パワーグリッド厚木支社", "phone": "0120-995-007", "address": "厚木市中町3-12-1", "hours": "平日 9:00-17:00", "services": ["停電情報", "電気工事"]}],
+                "病院": [{"name": "海老名総合病院", "phone": "046-233-1311", "address": "海老名市河原口1320", "hours": "24時間救急", "services": ["総合診療", "救急医療"]}],
+                "保健所": [{"name": "厚木保健福祉事務所", "phone": "046-224-1111", "address": "厚木市水引2-3-1", "hours": "平日 8:30-17:15", "services": ["健康相談", "予防接種"]}],
+                "水道": [{"name": "海老名市上下水道部", "phone": "046-235-4658", "address": "海老名市勝瀬175-1", "hours": "平日 8:30-17:15", "services": ["水道開栓", "料金"]}],
+                "NTT": [{"name": "NTT東日本神奈川支店", "phone": "116", "address": "横浜市西区みなとみらい2-3-3", "hours": "平日 9:00-17:00", "services": ["電話工事", "故障修理"]}],
+                "下水道": [{"name": "海老名市上下水道部", "phone": "046-235-4659", "address": "海老名市勝瀬175-1", "hours": "平日 8:30-17:15", "services": ["下水道修理", "排水設備"]}]
+            }
+        },
+        "藤沢市": {
+            "": {
+                "労基署": [{"name": "藤沢労働基準監督署", "phone": "0466-23-6753", "address": "藤沢市朝日町5-12", "hours": "平日 8:30-17:15", "services": ["労働相談", "労災申請"]}],
+                "警察署": [{"name": "藤沢警察署", "phone": "0466-24-0110", "address": "藤沢市藤沢109-4", "hours": "24時間", "services": ["事件事故", "遺失物"]}],
+                "市区町村役所": [{"name": "藤沢市役所", "phone": "0466-25-1111", "address": "藤沢市朝日町1-1", "hours": "平日 8:30-17:00", "services": ["住民票", "戸籍"]}],
+                "消防署": [{"name": "藤沢市消防局", "phone": "0466-25-8181", "address": "藤沢市朝日町1-1", "hours": "24時間", "services": ["火災通報", "救急車"]}],
+                "ガス": [{"name": "東京ガス藤沢営業所", "phone": "0570-002211", "address": "藤沢市藤沢93", "hours": "平日 8:30-19:00", "services": ["ガス開栓", "緊急通報"]}],
+                "電力": [{"name": "東京電力パワーグリッド藤沢支社", "phone": "0120-995-007", "address": "藤沢市藤沢93", "hours": "平日 9:00-17:00", "services": ["停電情報", "電気工事"]}],
+                "病院": [{"name": "藤沢市民病院", "phone": "0466-25-3111", "address": "藤沢市藤沢2-6-1", "hours": "24時間救急", "services": ["総合診療", "救急医療"]}],
+                "保健所": [{"name": "藤沢市保健所", "phone": "0466-50-3593", "address": "藤沢市鵠沼2131-1", "hours": "平日 8:30-17:00", "services": ["健康相談", "予防接種"]}],
+                "水道": [{"name": "藤沢市上下水道局", "phone": "0466-27-0011", "address": "藤沢市朝日町1-1", "hours": "平日 8:30-17:00", "services": ["水道開栓", "料金"]}],
+                "NTT": [{"name": "NTT東日本神奈川支店", "phone": "116", "address": "横浜市西区みなとみらい2-3-3", "hours": "平日 9:00-17:00", "services": ["電話工事", "故障修理"]}],
+                "下水道": [{"name": "藤沢市上下水道局", "phone": "0466-27-0011", "address": "藤沢市朝日町1-1", "hours": "平日 8:30-17:00", "services": ["下水道修理", "排水設備"]}]
+            }
+        },
+        "秦野市": {
+            "": {
+                "労基署": [{"name": "厚木労働基準監督署", "phone": "046-228-1331", "address": "厚木市田村町2-18", "hours": "平日 8:30-17:15", "services": ["労働相談", "労災申請"]}],
+                "警察署": [{"name": "秦野警察署", "phone": "0463-83-0110", "address": "秦野市桜町2-1-6", "hours": "24時間", "services": ["事件事故", "遺失物"]}],
+                "市区町村役所": [{"name": "秦野市役所", "phone": "0463-82-5111", "address": "秦野市桜町1-3-2", "hours": "平日 8:30-17:15", "services": ["住民票", "戸籍"]}],
+                "消防署": [{"name": "秦野市消防本部", "phone": "0463-81-0119", "address": "秦野市桜町1-3-2", "hours": "24時間", "services": ["火災通報", "救急車"]}],
+                "ガス": [{"name": "東京ガス秦野営業所", "phone": "0570-002211", "address": "秦野市桜町2-4-23", "hours": "平日 8:30-19:00", "services": ["ガス開栓", "緊急通報"]}],
+                "電力": [{"name": "東京電力パワーグリッド厚木支社", "phone": "0120-995-007", "address": "厚木市中町3-12-1", "hours": "平日 9:00-17:00", "services": ["停電情報", "電気工事"]}],
+                "病院": [{"name": "秦野赤十字病院", "phone": "0463-81-3721", "address": "秦野市立野台1-1", "hours": "24時間救急", "services": ["総合診療", "救急医療"]}],
+                "保健所": [{"name": "厚木保健福祉事務所", "phone": "046-224-1111", "address": "厚木市水引2-3-1", "hours": "平日 8:30-17:15", "services": ["健康相談", "予防接種"]}],
+                "水道": [{"name": "秦野市上下水道局", "phone": "0463-83-2111", "address": "秦野市桜町1-3-2", "hours": "平日 8:30-17:15", "services": ["水道開栓", "料金"]}],
+                "NTT": [{"name": "NTT東日本神奈川支店", "phone": "116", "address": "横浜市西区みなとみらい2-3-3", "hours": "平日 9:00-17:00", "services": ["電話工事", "故障修理"]}],
+                "下水道": [{"name": "秦野市上下水道局", "phone": "0463-83-2111", "address": "秦野市桜町1-3-2", "hours": "平日 8:30-17:15", "services": ["下水道修理", "排水設備"]}]
+            }
+        },
+        "平塚市": {
+            "": {
+                "労基署": [{"name": "平塚労働基準監督署", "phone": "0463-32-4612", "address": "平塚市八重咲町8-2", "hours": "平日 8:30-17:15", "services": ["労働相談", "労災申請"]}],
+                "警察署": [{"name": "平塚警察署", "phone": "0463-31-0110", "address": "平塚市浅間町2-75", "hours": "24時間", "services": ["事件事故", "遺失物"]}],
+                "市区町村役所": [{"name": "平塚市役所", "phone": "0463-23-1111", "address": "平塚市浅間町9-1", "hours": "平日 8:30-17:00", "services": ["住民票", "戸籍"]}],
+                "消防署": [{"name": "平塚市消防本部", "phone": "0463-21-0119", "address": "平塚市浅間町1-1", "hours": "24時間", "services": ["火災通報", "救急車"]}],
+                "ガス": [{"name": "東京ガス平塚営業所", "phone": "0570-002211", "address": "平塚市宝町1-1", "hours": "平日 8:30-19:00", "services": ["ガス開栓", "緊急通報"]}],
+                "電力": [{"name": "東京電力パワーグリッド平塚支社", "phone": "0120-995-007", "address": "平塚市宝町1-1", "hours": "平日 9:00-17:00", "services": ["停電情報", "電気工事"]}],
+                "病院": [{"name": "平塚市民病院", "phone": "0463-32-0015", "address": "平塚市南原1-19-1", "hours": "24時間救急", "services": ["総合診療", "救急医療"]}],
+                "保健所": [{"name": "平塚保健福祉事務所", "phone": "0463-32-0130", "address": "平塚市豊原町6-21", "hours": "平日 8:30-17:15", "services": ["健康相談", "予防接種"]}],
+                "水道": [{"name": "平塚市上下水道局", "phone": "0463-21-8796", "address": "平塚市浅間町9-1", "hours": "平日 8:30-17:00", "services": ["水道開栓", "料金"]}],
+                "NTT": [{"name": "NTT東日本神奈川支店", "phone": "116", "address": "横浜市西区みなとみらい2-3-3", "hours": "平日 9:00-17:00", "services": ["電話工事", "故障修理"]}],
+                "下水道": [{"name": "平塚市上下水道局", "phone": "0463-21-8797", "address": "平塚市浅間町9-1", "hours": "平日 8:30-17:00", "services": ["下水道修理", "排水設備"]}]
+            }
+        },
+        "伊勢原市": {
+            "": {
+                "労基署": [{"name": "厚木労働基準監督署", "phone": "046-228-1331", "address": "厚木市田村町2-18", "hours": "平日 8:30-17:15", "services": ["労働相談", "労災申請"]}],
+                "警察署": [{"name": "伊勢原警察署", "phone": "0463-94-0110", "address": "伊勢原市田中348", "hours": "24時間", "services": ["事件事故", "遺失物"]}],
+                "市区町村役所": [{"name": "伊勢原市役所", "phone": "0463-94-4711", "address": "伊勢原市田中348", "hours": "平日 8:30-17:15", "services": ["住民票", "戸籍"]}],
+                "消防署": [{"name": "伊勢原市消防本部", "phone": "0463-95-2119", "address": "伊勢原市田中348", "hours": "24時間", "services": ["火災通報", "救急車"]}],
+                "ガス": [{"name": "東京ガス秦野営業所", "phone": "0570-002211", "address": "秦野市桜町2-4-23", "hours": "平日 8:30-19:00", "services": ["ガス開栓", "緊急通報"]}],
+                "電力": [{"name": "東京電力パワーグリッド厚木支社", "phone": "0120-995-007", "address": "厚木市中町3-12-1", "hours": "平日 9:00-17:00", "services": ["停電情報", "電気工事"]}],
+                "病院": [{"name": "伊勢原協同病院", "phone": "0463-94-2111", "address": "伊勢原市田中345", "hours": "24時間救急", "services": ["総合診療", "救急医療"]}],
+                "保健所": [{"name": "厚木保健福祉事務所", "phone": "046-224-1111", "address": "厚木市水引2-3-1", "hours": "平日 8:30-17:15", "services": ["健康相談", "予防接種"]}],
+                "水道": [{"name": "伊勢原市上下水道部", "phone": "0463-94-4715", "address": "伊勢原市田中348", "hours": "平日 8:30-17:15", "services": ["水道開栓", "料金"]}],
+                "NTT": [{"name": "NTT東日本神奈川支店", "phone": "116", "address": "横浜市西区みなとみらい2-3-3", "hours": "平日 9:00-17:00", "services": ["電話工事", "故障修理"]}],
+                "下水道": [{"name": "伊勢原市上下水道部", "phone": "0463-94-4716", "address": "伊勢原市田中348", "hours": "平日 8:30-17:15", "services": ["下水道修理", "排水設備"]}]
+            }
+        },
+        "鎌倉市": {
+            "": {
+                "労基署": [{"name": "藤沢労働基準監督署", "phone": "0466-23-6753", "address": "藤沢市朝日町5-12", "hours": "平日 8:30-17:15", "services": ["労働相談", "労災申請"]}],
+                "警察署": [{"name": "鎌倉警察署", "phone": "0467-23-0110", "address": "鎌倉市小町1-11-34", "hours": "24時間", "services": ["事件事故", "遺失物"]}],
+                "市区町村役所": [{"name": "鎌倉市役所", "phone": "0467-23-3000", "address": "鎌倉市御成町18-10", "hours": "平日 8:30-17:00", "services": ["住民票", "戸籍"]}],
+                "消防署": [{"name": "鎌倉市消防本部", "phone": "0467-25-0119", "address": "鎌倉市大船1-10-5", "hours": "24時間", "services": ["火災通報", "救急車"]}],
+                "ガス": [{"name": "東京ガス鎌倉営業所", "phone": "0570-002211", "address": "鎌倉市大船1-24-10", "hours": "平日 8:30-19:00", "services": ["ガス開栓", "緊急通報"]}],
+                "電力": [{"name": "東京電力パワーグリッド藤沢支社", "phone": "0120-995-007", "address": "藤沢市藤沢93", "hours": "平日 9:00-17:00", "services": ["停電情報", "電気工事"]}],
+                "病院": [{"name": "湘南鎌倉総合病院", "phone": "0467-46-1717", "address": "鎌倉市岡本1370-1", "hours": "24時間救急", "services": ["総合診療", "救急医療"]}],
+                "保健所": [{"name": "鎌倉保健福祉事務所", "phone": "0467-24-3900", "address": "鎌倉市由比ガ浜2-16-13", "hours": "平日 8:30-17:15", "services": ["健康相談", "予防接種"]}],
+                "水道": [{"name": "鎌倉市上下水道部", "phone": "0467-23-3000", "address": "鎌倉市御成町18-10", "hours": "平日 8:30-17:00", "services": ["水道開栓", "料金"]}],
+                "NTT": [{"name": "NTT東日本神奈川支店", "phone": "116", "address": "横浜市西区みなとみらい2-3-3", "hours": "平日 9:00-17:00", "services": ["電話工事", "故障修理"]}],
+                "下水道": [{"name": "鎌倉市上下水道部", "phone": "0467-23-3000", "address": "鎌倉市御成町18-10", "hours": "平日 8:30-17:00", "services": ["下水道修理", "排水設備"]}]
+            }
+        },
+        "南足柄市": {
+            "": {
+                "労基署": [{"name": "小田原労働基準監督署", "phone": "0465-22-7151", "address": "小田原市本町1-2-17", "hours": "平日 8:30-17:15", "services": ["労働相談", "労災申請"]}],
+                "警察署": [{"name": "松田警察署", "phone": "0465-82-0110", "address": "足柄上郡松田町松田惣領1192-7", "hours": "24時間", "services": ["事件事故", "遺失物"]}],
+                "市区町村役所": [{"name": "南足柄市役所", "phone": "0465-74-2111", "address": "南足柄市関本440", "hours": "平日 8:30-17:15", "services": ["住民票", "戸籍"]}],
+                "消防署": [{"name": "南足柄市消防本部", "phone": "0465-74-0119", "address": "南足柄市関本403-1", "hours": "24時間", "services": ["火災通報", "救急車"]}],
+                "ガス": [{"name": "東京ガス小田原営業所", "phone": "0570-002211", "address": "小田原市本町1-2-25", "hours": "平日 8:30-19:00", "services": ["ガス開栓", "緊急通報"]}],
+                "電力": [{"name": "東京電力パワーグリッド小田原支社", "phone": "0120-995-007", "address": "小田原市本町1-5-12", "hours": "平日 9:00-17:00", "services": ["停電情報", "電気工事"]}],
+                "病院": [{"name": "南足柄市立病院", "phone": "0465-74-0261", "address": "南足柄市中沼210", "hours": "24時間救急", "services": ["総合診療", "救急医療"]}],
+                "保健所": [{"name": "小田原保健福祉事務所", "phone": "0465-32-8000", "address": "小田原市荻窪350-1", "hours": "平日 8:30-17:15", "services": ["健康相談", "予防接種"]}],
+                "水道": [{"name": "南足柄市上下水道課", "phone": "0465-73-8028", "address": "南足柄市関本440", "hours": "平日 8:30-17:15", "services": ["水道開栓", "料金"]}],
+                "NTT": [{"name": "NTT東日本神奈川支店", "phone": "116", "address": "横浜市西区みなとみらい2-3-3", "hours": "平日 9:00-17:00", "services": ["電話工事", "故障修理"]}],
+                "下水道": [{"name": "南足柄市上下水道課", "phone": "0465-73-8029", "address": "南足柄市関本440", "hours": "平日 8:30-17:15", "services": ["下水道修理", "排水設備"]}]
+            }
+        },
+        "三浦市": {
+            "": {
+                "労基署": [{"name": "横須賀労働基準監督署", "phone": "046-823-0858", "address": "横須賀市西逸見町1-38-11", "hours": "平日 8:30-17:15", "services": ["労働相談", "労災申請"]}],
+                "警察署": [{"name": "三崎警察署", "phone": "046-881-0110", "address": "三浦市三崎町六合32", "hours": "24時間", "services": ["事件事故", "遺失物"]}],
+                "市区町村役所": [{"name": "三浦市役所", "phone": "046-882-1111", "address": "三浦市城山町1-1", "hours": "平日 8:30-17:15", "services": ["住民票", "戸籍"]}],
+                "消防署": [{"name": "三浦市消防本部", "phone": "046-884-0119", "address": "三浦市南下浦町上宮田3274", "hours": "24時間", "services": ["火災通報", "救急車"]}],
+                "ガス": [{"name": "東京ガス横須賀営業所", "phone": "0570-002211", "address": "横須賀市若松町1-21", "hours": "平日 8:30-19:00", "services": ["ガス開栓", "緊急通報"]}],
+                "電力": [{"name": "東京電力パワーグリッド横須賀支社", "phone": "0120-995-007", "address": "横須賀市若松町1-21", "hours": "平日 9:00-17:00", "services": ["停電情報", "電気工事"]}],
+                "病院": [{"name": "三浦市立病院", "phone": "046-882-2111", "address": "三浦市岬陽町4-33", "hours": "24時間救急", "services": ["総合診療", "救急医療"]}],
+                "保健所": [{"name": "鎌倉保健福祉事務所", "phone": "0467-24-3900", "address": "鎌倉市由比ガ浜2-16-13", "hours": "平日 8:30-17:15", "services": ["健康相談", "予防接種"]}],
+                "水道": [{"name": "三浦市上下水道部", "phone": "046-882-1111", "address": "三浦市城山町1-1", "hours": "平日 8:30-17:15", "services": ["水道開栓", "料金"]}],
+                "NTT": [{"name": "NTT東日本神奈川支店", "phone": "116", "address": "横浜市西区みなとみらい2-3-3", "hours": "平日 9:00-17:00", "services": ["電話工事", "故障修理"]}],
+                "下水道": [{"name": "三浦市上下水道部", "phone": "046-882-1111", "address": "三浦市城山町1-1", "hours": "平日 8:30-17:15", "services": ["下水道修理", "排水設備"]}]
+            }
+        },
+        "小田原市": {
+            "": {
+                "労基署": [{"name": "小田原労働基準監督署", "phone": "0465-22-7151", "address": "小田原市本町1-2-17", "hours": "平日 8:30-17:15", "services": ["労働相談", "労災申請"]}],
+                "警察署": [{"name": "小田原警察署", "phone": "0465-32-0110", "address": "小田原市荻窪350-1", "hours": "24時間", "services": ["事件事故", "遺失物"]}],
+                "市区町村役所": [{"name": "小田原市役所", "phone": "0465-33-1300", "address": "小田原市荻窪300", "hours": "平日 8:30-17:00", "services": ["住民票", "戸籍"]}],
+                "消防署": [{"name": "小田原市消防本部", "phone": "0465-49-0119", "address": "小田原市荻窪350-1", "hours": "24時間", "services": ["火災通報", "救急車"]}],
+                "ガス": [{"name": "東京ガス小田原営業所", "phone": "0570-002211", "address": "小田原市本町1-2-25", "hours": "平日 8:30-19:00", "services": ["ガス開栓", "緊急通報"]}],
+                "電力": [{"name": "東京電力パワーグリッド小田原支社", "phone": "0120-995-007", "address": "小田原市本町1-5-12", "hours": "平日 9:00-17:00", "services": ["停電情報", "電気工事"]}],
+                "病院": [{"name": "小田原市立病院", "phone": "0465-34-3175", "address": "小田原市久野46", "hours": "24時間救急", "services": ["総合診療", "救急医療"]}],
+                "保健所": [{"name": "小田原保健福祉事務所", "phone": "0465-32-8000", "address": "小田原市荻窪350-1", "hours": "平日 8:30-17:15", "services": ["健康相談", "予防接種"]}],
+                "水道": [{"name": "小田原市上下水道局", "phone": "0465-41-1211", "address": "小田原市荻窪300", "hours": "平日 8:30-17:00", "services": ["水道開栓", "料金"]}],
+                "NTT": [{"name": "NTT東日本神奈川支店", "phone": "116", "address": "横浜市西区みなとみらい2-3-3", "hours": "平日 9:00-17:00", "services": ["電話工事", "故障修理"]}],
+                "下水道": [{"name": "小田原市上下水道局", "phone": "0465-41-1211", "address": "小田原市荻窪300", "hours": "平日 8:30-17:00", "services": ["下水道修理", "排水設備"]}]
+            }
+        },
+        "相模原市": {
+            "": {
+                "労基署": [{"name": "相模原労働基準監督署", "phone": "042-752-2051", "address": "相模原市中央区富士見6-10-10", "hours": "平日 8:30-17:15", "services": ["労働相談", "労災申請"]}],
+                "警察署": [{"name": "相模原警察署", "phone": "042-749-0110", "address": "相模原市中央区富士見1-2-1", "hours": "24時間", "services": ["事件事故", "遺失物"]}],
+                "市区町村役所": [{"name": "相模原市役所", "phone": "042-754-1111", "address": "相模原市中央区中央2-11-15", "hours": "平日 8:30-17:00", "services": ["住民票", "戸籍"]}],
+                "消防署": [{"name": "相模原市消防局", "phone": "042-751-9111", "address": "相模原市中央区中央2-2-15", "hours": "24時間", "services": ["火災通報", "救急車"]}],
+                "ガス": [{"name": "東京ガス相模原営業所", "phone": "0570-002211", "address": "相模原市中央区富士見1-3-41", "hours": "平日 8:30-19:00", "services": ["ガス開栓", "緊急通報"]}],
+                "電力": [{"name": "東京電力パワーグリッド相模原支社", "phone": "0120-995-007", "address": "相模原市中央区富士見1-1-3", "hours": "平日 9:00-17:00", "services": ["停電情報", "電気工事"]}],
+                "病院": [{"name": "相模原協同病院", "phone": "042-772-4291", "address": "相模原市緑区橋本台4-3-1", "hours": "24時間救急", "services": ["総合診療", "救急医療"]}],
+                "保健所": [{"name": "相模原市保健所", "phone": "042-769-8200", "address": "相模原市中央区富士見6-1-1", "hours": "平日 8:30-17:00", "services": ["健康相談", "予防接種"]}],
+                "水道": [{"name": "相模原市上下水道局", "phone": "042-772-8001", "address": "相模原市中央区中央2-11-15", "hours": "平日 8:30-17:00", "services": ["水道開栓", "料金"]}],
+                "NTT": [{"name": "NTT東日本神奈川支店", "phone": "116", "address": "横浜市西区みなとみらい2-3-3", "hours": "平日 9:00-17:00", "services": ["電話工事", "故障修理"]}],
+                "下水道": [{"name": "相模原市上下水道局", "phone": "042-772-8001", "address": "相模原市中央区中央2-11-15", "hours": "平日 8:30-17:00", "services": ["下水道修理", "排水設備"]}]
+            }
+        },
+        "大和市": {
+            "": {
+                "労基署": [{"name": "厚木労働基準監督署", "phone": "046-228-1331", "address": "厚木市田村町2-18", "hours": "平日 8:30-17:15", "services": ["労働相談", "労災申請"]}],
+                "警察署": [{"name": "大和警察署", "phone": "046-261-0110", "address": "大和市深見西3-1-29", "hours": "24時間", "services": ["事件事故", "遺失物"]}],
+                "市区町村役所": [{"name": "大和市役所", "phone": "046-263-1111", "address": "大和市下鶴間1-1-1", "hours": "平日 8:30-17:00", "services": ["住民票", "戸籍"]}],
+                "消防署": [{"name": "大和市消防本部", "phone": "046-260-5777", "address": "大和市深見西3-1-6", "hours": "24時間", "services": ["火災通報", "救急車"]}],
+                "ガス": [{"name": "東京ガス大和営業所", "phone": "0570-002211", "address": "大和市中央1-5-14", "hours": "平日 8:30-19:00", "services": ["ガス開栓", "緊急通報"]}],
+                "電力": [{"name": "東京電力パワーグリッド厚木支社", "phone": "0120-995-007", "address": "厚木市中町3-12-1", "hours": "平日 9:00-17:00", "services": ["停電情報", "電気工事"]}],
+                "病院": [{"name": "大和市立病院", "phone": "046-260-0111", "address": "大和市深見西8-3-6", "hours": "24時間救急", "services": ["総合診療", "救急医療"]}],
+                "保健所": [{"name": "厚木保健福祉事務所", "phone": "046-224-1111", "address": "厚木市水引2-3-1", "hours": "平日 8:30-17:15", "services": ["健康相談", "予防接種"]}],
+                "水道": [{"name": "大和市上下水道部", "phone": "046-269-1131", "address": "大和市下鶴間1-1-1", "hours": "平日 8:30-17:00", "services": ["水道開栓", "料金"]}],
+                "NTT": [{"name": "NTT東日本神奈川支店", "phone": "116", "address": "横浜市西区みなとみらい2-3-3", "hours": "平日 9:00-17:00", "services": ["電話工事", "故障修理"]}],
+                "下水道": [{"name": "大和市上下水道部", "phone": "046-269-1132", "address": "大和市下鶴間1-1-1", "hours": "平日 8:30-17:00", "services": ["下水道修理", "排水設備"]}]
+            }
+        },
+        "横須賀市": {
+            "": {
+                "労基署": [{"name": "横須賀労働基準監督署", "phone": "046-823-0858", "address": "横須賀市西逸見町1-38-11", "hours": "平日 8:30-17:15", "services": ["労働相談", "労災申請"]}],
+                "警察署": [{"name": "横須賀警察署", "phone": "046-820-0110", "address": "横須賀市小川町26", "hours": "24時間", "services": ["事件事故", "遺失物"]}],
+                "市区町村役所": [{"name": "横須賀市役所", "phone": "046-822-1000", "address": "横須賀市小川町11", "hours": "平日 8:30-17:00", "services": ["住民票", "戸籍"]}],
+                "消防署": [{"name": "横須賀市消防局", "phone": "046-821-6474", "address": "横須賀市小川町11", "hours": "24時間", "services": ["火災通報", "救急車"]}],
+                "ガス": [{"name": "東京ガス横須賀営業所", "phone": "0570-002211", "address": "横須賀市若松町1-21", "hours": "平日 8:30-19:00", "services": ["ガス開栓", "緊急通報"]}],
+                "電力": [{"name": "東京電力パワーグリッド横須賀支社", "phone": "0120-995-007", "address": "横須賀市若松町1-21", "hours": "平日 9:00-17:00", "services": ["停電情報", "電気工事"]}],
+                "病院": [{"name": "横須賀市立市民病院", "phone": "046-856-3136", "address": "横須賀市長坂1-3-2", "hours": "24時間救急", "services": ["総合診療", "救急医療"]}],
+                "保健所": [{"name": "横須賀市保健所", "phone": "046-824-7141", "address": "横須賀市西逸見町1-38-11", "hours": "平日 8:30-17:00", "services": ["健康相談", "予防接種"]}],
+                "水道": [{"name": "横須賀市上下水道局", "phone": "046-822-8607", "address": "横須賀市小川町11", "hours": "平日 8:30-17:00", "services": ["水道開栓", "料金"]}],
+                "NTT": [{"name": "NTT東日本神奈川支店", "phone": "116", "address": "横浜市西区みなとみらい2-3-3", "hours": "平日 9:00-17:00", "services": ["電話工事", "故障修理"]}],
+                "下水道": [{"name": "横須賀市上下水道局", "phone": "046-822-8608", "address": "横須賀市小川町11", "hours": "平日 8:30-17:00", "services": ["下水道修理", "排水設備"]}]
+            }
+        },
+        "座間市": {
+            "": {
+                "労基署": [{"name": "厚木労働基準監督署", "phone": "046-228-1331", "address": "厚木市田村町2-18", "hours": "平日 8:30-17:15", "services": ["労働相談", "労災申請"]}],
+                "警察署": [{"name": "座間警察署", "phone": "046-256-0110", "address": "座間市相模が丘6-35-17", "hours": "24時間", "services": ["事件事故", "遺失物"]}],
+                "市区町村役所": [{"name": "座間市役所", "phone": "046-255-1111", "address": "座間市緑ケ丘1-1-1", "hours": "平日 8:30-17:15", "services": ["住民票", "戸籍"]}],
+                "消防署": [{"name": "座間市消防本部", "phone": "046-256-2211", "address": "座間市緑ケ丘1-1-1", "hours": "24時間", "services": ["火災通報", "救急車"]}],
+                "ガス": [{"name": "東京ガス座間営業所", "phone": "0570-002211", "address": "座間市相模が丘1-22-30", "hours": "平日 8:30-19:00", "services": ["ガス開栓", "緊急通報"]}],
+                "電力": [{"name": "東京電力パワーグリッド厚木支社", "phone": "0120-995-007", "address": "厚木市中町3-12-1", "hours": "平日 9:00-17:00", "services": ["停電情報", "電気工事"]}],
+                "病院": [{"name": "座間総合病院", "phone": "046-251-1311", "address": "座間市相模が丘5-1-6", "hours": "24時間救急", "services": ["総合診療", "救急医療"]}],
+                "保健所": [{"name": "厚木保健福祉事務所", "phone": "046-224-1111", "address": "厚木市水引2-3-1", "hours": "平日 8:30-17:15", "services": ["健康相談", "予防接種"]}],
+                "水道": [{"name": "座間市上下水道部", "phone": "046-252-8885", "address": "座間市緑ケ丘1-1-1", "hours": "平日 8:30-17:15", "services": ["水道開栓", "料金"]}],
+                "NTT": [{"name": "NTT東日本神奈川支店", "phone": "116", "address": "横浜市西区みなとみらい2-3-3", "hours": "平日 9:00-17:00", "services": ["電話工事", "故障修理"]}],
+                "下水道": [{"name": "座間市上下水道部", "phone": "046-252-8886", "address": "座間市緑ケ丘1-1-1", "hours": "平日 8:30-17:15", "services": ["下水道修理", "排水設備"]}]
+            }
+        },
+        "逗子市": {
+            "": {
+                "労基署": [{"name": "藤沢労働基準監督署", "phone": "0466-23-6753", "address": "藤沢市朝日町5-12", "hours": "平日 8:30-17:15", "services": ["労働相談", "労災申請"]}],
+                "警察署": [{"name": "逗子警察署", "phone": "046-871-0110", "address": "逗子市逗子1-5-1", "hours": "24時間", "services": ["事件事故", "遺失物"]}],
+                "市区町村役所": [{"name": "逗子市役所", "phone": "046-873-1111", "address": "逗子市逗子5-2-16", "hours": "平日 8:30-17:00", "services": ["住民票", "戸籍"]}],
+                "消防署": [{"name": "逗子市消防本部", "phone": "046-871-0119", "address": "逗子市逗子4-2-3", "hours": "24時間", "services": ["火災通報", "救急車"]}],
+                "ガス": [{"name": "東京ガス鎌倉営業所", "phone": "0570-002211", "address": "鎌倉市大船1-24-10", "hours": "平日 8:30-19:00", "services": ["ガス開栓", "緊急通報"]}],
+                "電力": [{"name": "東京電力パワーグリッド藤沢支社", "phone": "0120-995-007", "address": "藤沢市藤沢93", "hours": "平日 9:00-17:00", "services": ["停電情報", "電気工事"]}],
+                "病院": [{"name": "逗子市立逗子病院", "phone": "046-871-7611", "address": "逗子市桜山8-2-35", "hours": "24時間救急", "services": ["総合診療", "救急医療"]}],
+                "保健所": [{"name": "鎌倉保健福祉事務所", "phone": "0467-24-3900", "address": "鎌倉市由比ガ浜2-16-13", "hours": "平日 8:30-17:15", "services": ["健康相談", "予防接種"]}],
+                "水道": [{"name": "逗子市環境都市部", "phone": "046-872-8135", "address": "逗子市逗子5-2-16", "hours": "平日 8:30-17:00", "services": ["水道開栓", "料金"]}],
+                "NTT": [{"name": "NTT東日本神奈川支店", "phone": "116", "address": "横浜市西区みなとみらい2-3-3", "hours": "平日 9:00-17:00", "services": ["電話工事", "故障修理"]}],
+                "下水道": [{"name": "逗子市環境都市部", "phone": "046-872-8136", "address": "逗子市逗子5-2-16", "hours": "平日 8:30-17:00", "services": ["下水道修理", "排水設備"]}]
+            }
+        },
+        "愛川町": {
+            "": {
+                "労基署": [{"name": "厚木労働基準監督署", "phone": "046-228-1331", "address": "厚木市田村町2-18", "hours": "平日 8:30-17:15", "services": ["労働相談", "労災申請"]}],
+                "警察署": [{"name": "津久井警察署", "phone": "042-780-0110", "address": "相模原市緑区中野256", "hours": "24時間", "services": ["事件事故", "遺失物"]}],
+                "市区町村役所": [
+                    {"name": "愛川町役場", "phone": "046-285-2111", "address": "愛甲郡愛川町角田251-1", "hours": "平日 8:30-17:15", "services": ["住民票", "戸籍"]},
+                    {"name": "愛川町環境経済部", "phone": "046-285-6947", "address": "愛甲郡愛川町角田251-1", "hours": "平日 8:30-17:15", "services": ["ごみ収集", "リサイクル", "環境対策"]}
+                ],
+                "消防署": [{"name": "愛川町消防本部", "phone": "046-285-3119", "address": "愛甲郡愛川町角田257-1", "hours": "24時間", "services": ["火災通報", "救急車"]}],
+                "ガス": [{"name": "東京ガス厚木営業所", "phone": "0570-002211", "address": "厚木市中町2-6-14", "hours": "平日 8:30-19:00", "services": ["ガス開栓", "緊急通報"]}],
+                "電力": [{"name": "東京電力パワーグリッド厚木支社", "phone": "0120-995-007", "address": "厚木市中町3-12-1", "hours": "平日 9:00-17:00", "services": ["停電情報", "電気工事"]}],
+                "病院": [{"name": "愛川北部病院", "phone": "046-285-1120", "address": "愛甲郡愛川町半原2725", "hours": "平日 9:00-17:00", "services": ["内科", "外科"]}],
+                "保健所": [{"name": "厚木保健福祉事務所", "phone": "046-224-1111", "address": "厚木市水引2-3-1", "hours": "平日 8:30-17:15", "services": ["健康相談", "予防接種"]}],
+                "水道": [{"name": "愛川町上下水道課", "phone": "046-285-6932", "address": "愛甲郡愛川町角田251-1", "hours": "平日 8:30-17:15", "services": ["水道開栓", "料金"]}],
+                "NTT": [{"name": "NTT東日本神奈川支店", "phone": "116", "address": "横浜市西区みなとみらい2-3-3", "hours": "平日 9:00-17:00", "services": ["電話工事", "故障修理"]}],
+                "下水道": [{"name": "愛川町上下水道課", "phone": "046-285-6933", "address": "愛甲郡愛川町角田251-1", "hours": "平日 8:30-17:15", "services": ["下水道修理", "排水設備"]}]
+            }
+        },
+        "寒川町": {
+            "": {
+                "労基署": [{"name": "藤沢労働基準監督署", "phone": "0466-23-6753", "address": "藤沢市朝日町5-12", "hours": "平日 8:30-17:15", "services": ["労働相談", "労災申請"]}],
+                "警察署": [{"name": "茅ヶ崎警察署", "phone": "0467-82-0110", "address": "茅ヶ崎市茅ヶ崎1-7-20", "hours": "24時間", "services": ["事件事故", "遺失物"]}],
+                "市区町村役所": [
+                    {"name": "寒川町役場", "phone": "0467-74-1111", "address": "高座郡寒川町宮山165", "hours": "平日 8:30-17:15", "services": ["住民票", "戸籍"]},
+                    {"name": "寒川町環境課", "phone": "0467-74-1111", "address": "高座郡寒川町宮山165", "hours": "平日 8:30-17:15", "services": ["ごみ収集", "リサイクル", "環境対策"]}
+                ],
+                "消防署": [{"name": "寒川町消防本部", "phone": "0467-75-8002", "address": "高座郡寒川町宮山275-1", "hours": "24時間", "services": ["火災通報", "救急車"]}],
+                "ガス": [{"name": "東京ガス茅ヶ崎営業所", "phone": "0570-002211", "address": "茅ヶ崎市新栄町7-5", "hours": "平日 8:30-19:00", "services": ["ガス開栓", "緊急通報"]}],
+                "電力": [{"name": "東京電力パワーグリッド藤沢支社", "phone": "0120-995-007", "address": "藤沢市藤沢93", "hours": "平日 9:00-17:00", "services": ["停電情報", "電気工事"]}],
+                "病院": [{"name": "寒川病院", "phone": "0467-75-6680", "address": "高座郡寒川町大蔵887", "hours": "平日 9:00-17:00", "services": ["内科", "外科"]}],
+                "保健所": [{"name": "平塚保健福祉事務所", "phone": "0463-32-0130", "address": "平塚市豊原町6-21", "hours": "平日 8:30-17:15", "services": ["健康相談", "予防接種"]}],
+                "水道": [{"name": "寒川町上下水道課", "phone": "0467-74-1111", "address": "高座郡寒川町宮山165", "hours": "平日 8:30-17:15", "services": ["水道開栓", "料金"]}],
+                "NTT": [{"name": "NTT東日本神奈川支店", "phone": "116", "address": "横浜市西区みなとみらい2-3-3", "hours": "平日 9:00-17:00", "services": ["電話工事", "故障修理"]}],
+                "下水道": [{"name": "寒川町上下水道課", "phone": "0467-74-1111", "address": "高座郡寒川町宮山165", "hours": "平日 8:30-17:15", "services": ["下水道修理", "排水設備"]}]
+            }
+        },
+        "大磯町": {
+            "": {
+                "労基署": [{"name": "平塚労働基準監督署", "phone": "0463-32-4612", "address": "平塚市八重咲町8-2", "hours": "平日 8:30-17:15", "services": ["労働相談", "労災申請"]}],
+                "警察署": [{"name": "平塚警察署", "phone": "0463-31-0110", "address": "平塚市浅間町2-75", "hours": "24時間", "services": ["事件事故", "遺失物"]}],
+                "市区町村役所": [
+                    {"name": "大磯町役場", "phone": "0463-61-4100", "address": "中郡大磯町東小磯183", "hours": "平日 8:30-17:15", "services": ["住民票", "戸籍"]},
+                    {"name": "大磯町環境課", "phone": "0463-61-4100", "address": "中郡大磯町東小磯183", "hours": "平日 8:30-17:15", "services": ["ごみ収集", "リサイクル", "環境対策"]}
+                ],
+                "消防署": [{"name": "大磯町消防本部", "phone": "0463-61-0911", "address": "中郡大磯町東小磯199", "hours": "24時間", "services": ["火災通報", "救急車"]}],
+                "ガス": [{"name": "東京ガス平塚営業所", "phone": "0570-002211", "address": "平塚市宝町1-1", "hours": "平日 8:30-19:00", "services": ["ガス開栓", "緊急通報"]}],
+                "電力": [{"name": "東京電力パワーグリッド平塚支社", "phone": "0120-995-007", "address": "平塚市宝町1-1", "hours": "平日 9:00-17:00", "services": ["停電情報", "電気工事"]}],
+                "病院": [{"name": "大磯町国府診療所", "phone": "0463-71-1615", "address": "中郡大磯町国府本郷546", "hours": "平日 9:00-17:00", "services": ["内科", "小児科"]}],
+                "保健所": [{"name": "平塚保健福祉事務所", "phone": "0463-32-0130", "address": "平塚市豊原町6-21", "hours": "平日 8:30-17:15", "services": ["健康相談", "予防接種"]}],
+                "水道": [{"name": "大磯町上下水道課", "phone": "0463-61-4100", "address": "中郡大磯町東小磯183", "hours": "平日 8:30-17:15", "services": ["水道開栓", "料金"]}],
+                "NTT": [{"name": "NTT東日本神奈川支店", "phone": "116", "address": "横浜市西区みなとみらい2-3-3", "hours": "平日 9:00-17:00", "services": ["電話工事", "故障修理"]}],
+                "下水道": [{"name": "大磯町上下水道課", "phone": "0463-61-4100", "address": "中郡大磯町東小磯183", "hours": "平日 8:30-17:15", "services": ["下水道修理", "排水設備"]}]
+            }
+        },
+        "二宮町": {
+            "": {
+                "労基署": [{"name": "平塚労働基準監督署", "phone": "0463-32-4612", "address": "平塚市八重咲町8-2", "hours": "平日 8:30-17:15", "services": ["労働相談", "労災申請"]}],
+                "警察署": [{"name": "平塚警察署", "phone": "0463-31-0110", "address": "平塚市浅間町2-75", "hours": "24時間", "services": ["事件事故", "遺失物"]}],
+                "市区町村役所": [
+                    {"name": "二宮町役場", "phone": "0463-71-3311", "address": "中郡二宮町二宮961", "hours": "平日 8:30-17:15", "services": ["住民票", "戸籍"]},
+                    {"name": "二宮町生活環境課", "phone": "0463-71-3311", "address": "中郡二宮町二宮961", "hours": "平日 8:30-17:15", "services": ["ごみ収集", "リサイクル", "環境対策"]}
+                ],
+                "消防署": [{"name": "二宮町消防本部", "phone": "0463-71-0119", "address": "中郡二宮町二宮1410", "hours": "24時間", "services": ["火災通報", "救急車"]}],
+                "ガス": [{"name": "東京ガス平塚営業所", "phone": "0570-002211", "address": "平塚市宝町1-1", "hours": "平日 8:30-19:00", "services": ["ガス開栓", "緊急通報"]}],
+                "電力": [{"name": "東京電力パワーグリッド平塚支社", "phone": "0120-995-007", "address": "平塚市宝町1-1", "hours": "平日 9:00-17:00", "services": ["停電情報", "電気工事"]}],
+                "病院": [{"name": "二宮町国民健康保険診療所", "phone": "0463-70-1850", "address": "中郡二宮町二宮1410", "hours": "平日 9:00-17:00", "services": ["内科", "小児科"]}],
+                "保健所": [{"name": "平塚保健福祉事務所", "phone": "0463-32-0130", "address": "平塚市豊原町6-21", "hours": "平日 8:30-17:15", "services": ["健康相談", "予防接種"]}],
+                "水道": [{"name": "二宮町上下水道課", "phone": "0463-71-3311", "address": "中郡二宮町二宮961", "hours": "平日 8:30-17:15", "services": ["水道開栓", "料金"]}],
+                "NTT": [{"name": "NTT東日本神奈川支店", "phone": "116", "address": "横浜市西区みなとみらい2-3-3", "hours": "平日 9:00-17:00", "services": ["電話工事", "故障修理"]}],
+                "下水道": [{"name": "二宮町上下水道課", "phone": "0463-71-3311", "address": "中郡二宮町二宮961", "hours": "平日 8:30-17:15", "services": ["下水道修理", "排水設備"]}]
+            }
+        },
+        "箱根町": {
+            "": {
+                "労基署": [{"name": "小田原労働基準監督署", "phone": "0465-22-7151", "address": "小田原市本町1-2-17", "hours": "平日 8:30-17:15", "services": ["労働相談", "労災申請"]}],
+                "警察署": [{"name": "小田原警察署", "phone": "0465-32-0110", "address": "小田原市荻窪350-1", "hours": "24時間", "services": ["事件事故", "遺失物"]}],
+                "市区町村役所": [
+                    {"name": "箱根町役場", "phone": "0460-85-7111", "address": "足柄下郡箱根町湯本256", "hours": "平日 8:30-17:15", "services": ["住民票", "戸籍"]},
+                    {"name": "箱根町環境課", "phone": "0460-85-9565", "address": "足柄下郡箱根町湯本256", "hours": "平日 8:30-17:15", "services": ["ごみ収集", "リサイクル", "環境対策"]}
+                ],
+                "消防署": [{"name": "箱根町消防本部", "phone": "0460-85-7444", "address": "足柄下郡箱根町湯本682", "hours": "24時間", "services": ["火災通報", "救急車"]}],
+                "ガス": [{"name": "東京ガス小田原営業所", "phone": "0570-002211", "address": "小田原市本町1-2-25", "hours": "平日 8:30-19:00", "services": ["ガス開栓", "緊急通報"]}],
+                "電力": [{"name": "東京電力パワーグリッド小田原支社", "phone": "0120-995-007", "address": "小田原市本町1-5-12", "hours": "平日 9:00-17:00", "services": ["停電情報", "電気工事"]}],
+                "病院": [{"name": "箱根リハビリテーション病院", "phone": "0460-88-0871", "address": "足柄下郡箱根町仙石原1285", "hours": "平日 9:00-17:00", "services": ["リハビリテーション", "内科"]}],
+                "保健所": [{"name": "小田原保健福祉事務所", "phone": "0465-32-8000", "address": "小田原市荻窪350-1", "hours": "平日 8:30-17:15", "services": ["健康相談", "予防接種"]}],
+                "水道": [{"name": "箱根町上下水道温泉課", "phone": "0460-85-9564", "address": "足柄下郡箱根町湯本256", "hours": "平日 8:30-17:15", "services": ["水道開栓", "料金"]}],
+                "NTT": [{"name": "NTT東日本神奈川支店", "phone": "116", "address": "横浜市西区みなとみらい2-3-3", "hours": "平日 9:00-17:00", "services": ["電話工事", "故障修理"]}],
+                "下水道": [{"name": "箱根町上下水道温泉課", "phone": "0460-85-9564", "address": "足柄下郡箱根町湯本256", "hours": "平日 8:30-17:15", "services": ["下水道修理", "排水設備"]}]
+            }
+        },
+        "真鶴町": {
+            "": {
+                "労基署": [{"name": "小田原労働基準監督署", "phone": "0465-22-7151", "address": "小田原市本町1-2-17", "hours": "平日 8:30-17:15", "services": ["労働相談", "労災申請"]}],
+                "警察署": [{"name": "小田原警察署", "phone": "0465-32-0110", "address": "小田原市荻窪350-1", "hours": "24時間", "services": ["事件事故", "遺失物"]}],
+                "市区町村役所": [
+                    {"name": "真鶴町役場", "phone": "0465-68-1131", "address": "足柄下郡真鶴町岩244-1", "hours": "平日 8:30-17:15", "services": ["住民票", "戸籍"]},
+                    {"name": "真鶴町環境防災課", "phone": "0465-68-1131", "address": "足柄下郡真鶴町岩244-1", "hours": "平日 8:30-17:15", "services": ["ごみ収集", "リサイクル", "環境対策"]}
+                ],
+                "消防署": [{"name": "真鶴町消防署", "phone": "0465-68-0119", "address": "足柄下郡真鶴町岩350-1", "hours": "24時間", "services": ["火災通報", "救急車"]}],
+                "ガス": [{"name": "東京ガス小田原営業所", "phone": "0570-002211", "address": "小田原市本町1-2-25", "hours": "平日 8:30-19:00", "services": ["ガス開栓", "緊急通報"]}],
+                "電力": [{"name": "東京電力パワーグリッド小田原支社", "phone": "0120-995-007", "address": "小田原市本町1-5-12", "hours": "平日 9:00-17:00", "services": ["停電情報", "電気工事"]}],
+                "病院": [{"name": "真鶴町国民健康保険診療所", "phone": "0465-68-0028", "address": "足柄下郡真鶴町岩244-1", "hours": "平日 9:00-17:00", "services": ["内科", "外科"]}],
+                "保健所": [{"name": "小田原保健福祉事務所", "phone": "0465-32-8000", "address": "小田原市荻窪350-1", "hours": "平日 8:30-17:15", "services": ["健康相談", "予防接種"]}],
+                "水道": [{"name": "真鶴町上下水道課", "phone": "0465-68-1131", "address": "足柄下郡真鶴町岩244-1", "hours": "平日 8:30-17:15", "services": ["水道開栓", "料金"]}],
+                "NTT": [{"name": "NTT東日本神奈川支店", "phone": "116", "address": "横浜市西区みなとみらい2-3-3", "hours": "平日 9:00-17:00", "services": ["電話工事", "故障修理"]}],
+                "下水道": [{"name": "真鶴町上下水道課", "phone": "0465-68-1131", "address": "足柄下郡真鶴町岩244-1", "hours": "平日 8:30-17:15", "services": ["下水道修理", "排水設備"]}]
+            }
+        },
+        "湯河原町": {
+            "": {
+                "労基署": [{"name": "小田原労働基準監督署", "phone": "0465-22-7151", "address": "小田原市本町1-2-17", "hours": "平日 8:30-17:15", "services": ["労働相談", "労災申請"]}],
+                "警察署": [{"name": "小田原警察署", "phone": "0465-32-0110", "address": "小田原市荻窪350-1", "hours": "24時間", "services": ["事件事故", "遺失物"]}],
+                "市区町村役所": [
+                    {"name": "湯河原町役場", "phone": "0465-63-2111", "address": "足柄下郡湯河原町中央2-2-1", "hours": "平日 8:30-17:15", "services": ["住民票", "戸籍"]},
+                    {"name": "湯河原町環境課", "phone": "0465-63-2111", "address": "足柄下郡湯河原町中央2-2-1", "hours": "平日 8:30-17:15", "services": ["ごみ収集", "リサイクル", "環境対策"]}
+                ],
+                "消防署": [{"name": "湯河原町消防本部", "phone": "0465-62-4411", "address": "足柄下郡湯河原町土肥1-15-4", "hours": "24時間", "services": ["火災通報", "救急車"]}],
+                "ガス": [{"name": "東京ガス小田原営業所", "phone": "0570-002211", "address": "小田原市本町1-2-25", "hours": "平日 8:30-19:00", "services": ["ガス開栓", "緊急通報"]}],
+                "電力": [{"name": "東京電力パワーグリッド小田原支社", "phone": "0120-995-007", "address": "小田原市本町1-5-12", "hours": "平日 9:00-17:00", "services": ["停電情報", "電気工事"]}],
+                "病院": [{"name": "湯河原胃腸病院", "phone": "0465-62-7181", "address": "足柄下郡湯河原町中央5-6-15", "hours": "平日 9:00-17:00", "services": ["消化器内科", "外科"]}],
+                "保健所": [{"name": "小田原保健福祉事務所", "phone": "0465-32-8000", "address": "小田原市荻窪350-1", "hours": "平日 8:30-17:15", "services": ["健康相談", "予防接種"]}],
+                "水道": [{"name": "湯河原町上下水道課", "phone": "0465-63-2111", "address": "足柄下郡湯河原町中央2-2-1", "hours": "平日 8:30-17:15", "services": ["水道開栓", "料金"]}],
+                "NTT": [{"name": "NTT東日本神奈川支店", "phone": "116", "address": "横浜市西区みなとみらい2-3-3", "hours": "平日 9:00-17:00", "services": ["電話工事", "故障修理"]}],
+                "下水道": [{"name": "湯河原町上下水道課", "phone": "0465-63-2111", "address": "足柄下郡湯河原町中央2-2-1", "hours": "平日 8:30-17:15", "services": ["下水道修理", "排水設備"]}]
+            }
+        },
+        "開成町": {
+            "": {
+                "労基署": [{"name": "小田原労働基準監督署", "phone": "0465-22-7151", "address": "小田原市本町1-2-17", "hours": "平日 8:30-17:15", "services": ["労働相談", "労災申請"]}],
+                "警察署": [{"name": "松田警察署", "phone": "0465-82-0110", "address": "足柄上郡松田町松田惣領1192-7", "hours": "24時間", "services": ["事件事故", "遺失物"]}],
+                "市区町村役所": [
+                    {"name": "開成町役場", "phone": "0465-83-2331", "address": "足柄上郡開成町延沢773", "hours": "平日 8:30-17:15", "services": ["住民票", "戸籍"]},
+                    {"name": "開成町環境防災課", "phone": "0465-84-0314", "address": "足柄上郡開成町延沢773", "hours": "平日 8:30-17:15", "services": ["ごみ収集", "リサイクル", "環境対策"]}
+                ],
+                "消防署": [{"name": "開成町消防署", "phone": "0465-82-4612", "address": "足柄上郡開成町延沢771", "hours": "24時間", "services": ["火災通報", "救急車"]}],
+                "ガス": [{"name": "東京ガス小田原営業所", "phone": "0570-002211", "address": "小田原市本町1-2-25", "hours": "平日 8:30-19:00", "services": ["ガス開栓", "緊急通報"]}],
+                "電力": [{"name": "東京電力パワーグリッド小田原支社", "phone": "0120-995-007", "address": "小田原市本町1-5-12", "hours": "平日 9:00-17:00", "services": ["停電情報", "電気工事"]}],
+                "病院": [{"name": "開成町国民健康保険診療所", "phone": "0465-82-0724", "address": "足柄上郡開成町延沢773", "hours": "平日 9:00-17:00", "services": ["内科", "小児科"]}],
+                "保健所": [{"name": "小田原保健福祉事務所", "phone": "0465-32-8000", "address": "小田原市荻窪350-1", "hours": "平日 8:30-17:15", "services": ["健康相談", "予防接種"]}],
+                "水道": [{"name": "開成町上下水道課", "phone": "0465-84-0314", "address": "足柄上郡開成町延沢773", "hours": "平日 8:30-17:15", "services": ["水道開栓", "料金"]}],
+                "NTT": [{"name": "NTT東日本神奈川支店", "phone": "116", "address": "横浜市西区みなとみらい2-3-3", "hours": "平日 9:00-17:00", "services": ["電話工事", "故障修理"]}],
+                "下水道": [{"name": "開成町上下水道課", "phone": "0465-84-0314", "address": "足柄上郡開成町延沢773", "hours": "平日 8:30-17:15", "services": ["下水道修理", "排水設備"]}]
+            }
+        },
+        "中井町": {
+            "": {
+                "労基署": [{"name": "小田原労働基準監督署", "phone": "0465-22-7151", "address": "小田原市本町1-2-17", "hours": "平日 8:30-17:15", "services": ["労働相談", "労災申請"]}],
+                "警察署": [{"name": "松田警察署", "phone": "0465-82-0110", "address": "足柄上郡松田町松田惣領1192-7", "hours": "24時間", "services": ["事件事故", "遺失物"]}],
+                "市区町村役所": [
+                    {"name": "中井町役場", "phone": "0465-81-1111", "address": "足柄上郡中井町比奈窪56", "hours": "平日 8:30-17:15", "services": ["住民票", "戸籍"]},
+                    {"name": "中井町生活環境課", "phone": "0465-81-1111", "address": "足柄上郡中井町比奈窪56", "hours": "平日 8:30-17:15", "services": ["ごみ収集", "リサイクル", "環境対策"]}
+                ],
+                "消防署": [{"name": "中井町消防署", "phone": "0465-81-0119", "address": "足柄上郡中井町比奈窪70", "hours": "24時間", "services": ["火災通報", "救急車"]}],
+                "ガス": [{"name": "東京ガス小田原営業所", "phone": "0570-002211", "address": "小田原市本町1-2-25", "hours": "平日 8:30-19:00", "services": ["ガス開栓", "緊急通報"]}],
+                "電力": [{"name": "東京電力パワーグリッド小田原支社", "phone": "0120-995-007", "address": "小田原市本町1-5-12", "hours": "平日 9:00-17:00", "services": ["停電情報", "電気工事"]}],
+                "病院": [{"name": "中井町国民健康保険診療所", "phone": "0465-81-8824", "address": "足柄上郡中井町比奈窪56", "hours": "平日 9:00-17:00", "services": ["内科", "小児科"]}],
+                "保健所": [{"name": "小田原保健福祉事務所", "phone": "0465-32-8000", "address": "小田原市荻窪350-1", "hours": "平日 8:30-17:15", "services": ["健康相談", "予防接種"]}],
+                "水道": [{"name": "中井町上下水道課", "phone": "0465-81-1111", "address": "足柄上郡中井町比奈窪56", "hours": "平日 8:30-17:15", "services": ["水道開栓", "料金"]}],
+                "NTT": [{"name": "NTT東日本神奈川支店", "phone": "116", "address": "横浜市西区みなとみらい2-3-3", "hours": "平日 9:00-17:00", "services": ["電話工事", "故障修理"]}],
+                "下水道": [{"name": "中井町上下水道課", "phone": "0465-81-1111", "address": "足柄上郡中井町比奈窪56", "hours": "平日 8:30-17:15", "services": ["下水道修理", "排水設備"]}]
+            }
+        },
+        "大井町": {
+            "": {
+                "労基署": [{"name": "小田原労働基準監督署", "phone": "0465-22-7151", "address": "小田原市本町1-2-17", "hours": "平日 8:30-17:15", "services": ["労働相談", "労災申請"]}],
+                "警察署": [{"name": "松田警察署", "phone": "0465-82-0110", "address": "足柄上郡松田町松田惣領1192-7", "hours": "24時間", "services": ["事件事故", "遺失物"]}],
+                "市区町村役所": [
+                    {"name": "大井町役場", "phone": "0465-83-1311", "address": "足柄上郡大井町金子1995", "hours": "平日 8:30-17:15", "services": ["住民票", "戸籍"]},
+                    {"name": "大井町生活環境課", "phone": "0465-85-5010", "address": "足柄上郡大井町金子1995", "hours": "平日 8:30-17:15", "services": ["ごみ収集", "リサイクル", "環境対策"]}
+                ],
+                "消防署": [{"name": "大井町消防署", "phone": "0465-82-3050", "address": "足柄上郡大井町金子1921-1", "hours": "24時間", "services": ["火災通報", "救急車"]}],
+                "ガス": [{"name": "東京ガス小田原営業所", "phone": "0570-002211", "address": "小田原市本町1-2-25", "hours": "平日 8:30-19:00", "services": ["ガス開栓", "緊急通報"]}],
+                "電力": [{"name": "東京電力パワーグリッド小田原支社", "phone": "0120-995-007", "address": "小田原市本町1-5-12", "hours": "平日 9:00-17:00", "services": ["停電情報", "電気工事"]}],
+                "病院": [{"name": "大井町国民健康保険診療所", "phone": "0465-83-3543", "address": "足柄上郡大井町金子1970", "hours": "平日 9:00-17:00", "services": ["内科", "外科"]}],
+                "保健所": [{"name": "小田原保健福祉事務所", "phone": "0465-32-8000", "address": "小田原市荻窪350-1", "hours": "平日 8:30-17:15", "services": ["健康相談", "予防接種"]}],
+                "水道": [{"name": "大井町上下水道課", "phone": "0465-85-5016", "address": "足柄上郡大井町金子1995", "hours": "平日 8:30-17:15", "services": ["水道開栓", "料金"]}],
+                "NTT": [{"name": "NTT東日本神奈川支店", "phone": "116", "address": "横浜市西区みなとみらい2-3-3", "hours": "平日 9:00-17:00", "services": ["電話工事", "故障修理"]}],
+                "下水道": [{"name": "大井町上下水道課", "phone": "0465-85-5016", "address": "足柄上郡大井町金子1995", "hours": "平日 8:30-17:15", "services": ["下水道修理", "排水設備"]}]
+            }
+        },
+        "松田町": {
+            "": {
+                "労基署": [{"name": "小田原労働基準監督署", "phone": "0465-22-7151", "address": "小田原市本町1-2-17", "hours": "平日 8:30-17:15", "services": ["労働相談", "労災申請"]}],
+                "警察署": [{"name": "松田警察署", "phone": "0465-82-0110", "address": "足柄上郡松田町松田惣領1192-7", "hours": "24時間", "services": ["事件事故", "遺失物"]}],
+                "市区町村役所": [
+                    {"name": "松田町役場", "phone": "0465-83-1221", "address": "足柄上郡松田町松田惣領2037", "hours": "平日 8:30-17:15", "services": ["住民票", "戸籍"]},
+                    {"name": "松田町環境経済課", "phone": "0465-84-5545", "address": "足柄上郡松田町松田惣領2037", "hours": "平日 8:30-17:15", "services": ["ごみ収集", "リサイクル", "環境対策"]}
+                ],
+                "消防署": [{"name": "松田町消防署", "phone": "0465-82-2621", "address": "足柄上郡松田町松田惣領1192-5", "hours": "24時間", "services": ["火災通報", "救急車"]}],
+                "ガス": [{"name": "東京ガス小田原営業所", "phone": "0570-002211", "address": "小田原市本町1-2-25", "hours": "平日 8:30-19:00", "services": ["ガス開栓", "緊急通報"]}],
+                "電力": [{"name": "東京電力パワーグリッド小田原支社", "phone": "0120-995-007", "address": "小田原市本町1-5-12", "hours": "平日 9:00-17:00", "services": ["停電情報", "電気工事"]}],
+                "病院": [{"name": "松田町国民健康保険診療所", "phone": "0465-82-1192", "address": "足柄上郡松田町松田惣領1192-4", "hours": "平日 9:00-17:00", "services": ["内科", "小児科"]}],
+                "保健所": [{"name": "小田原保健福祉事務所", "phone": "0465-32-8000", "address": "小田原市荻窪350-1", "hours": "平日 8:30-17:15", "services": ["健康相談", "予防接種"]}],
+                "水道": [{"name": "松田町上下水道課", "phone": "0465-84-5544", "address": "足柄上郡松田町松田惣領2037", "hours": "平日 8:30-17:15", "services": ["水道開栓", "料金"]}],
+                "NTT": [{"name": "NTT東日本神奈川支店", "phone": "116", "address": "横浜市西区みなとみらい2-3-3", "hours": "平日 9:00-17:00", "services": ["電話工事", "故障修理"]}],
+                "下水道": [{"name": "松田町上下水道課", "phone": "0465-84-5544", "address": "足柄上郡松田町松田惣領2037", "hours": "平日 8:30-17:15", "services": ["下水道修理", "排水設備"]}]
+            }
+        },
+        "山北町": {
+            "": {
+                "労基署": [{"name": "小田原労働基準監督署", "phone": "0465-22-7151", "address": "小田原市本町1-2-17", "hours": "平日 8:30-17:15", "services": ["労働相談", "労災申請"]}],
+                "警察署": [{"name": "松田警察署", "phone": "0465-82-0110", "address": "足柄上郡松田町松田惣領1192-7", "hours": "24時間", "services": ["事件事故", "遺失物"]}],
+                "市区町村役所": [
+                    {"name": "山北町役場", "phone": "0465-75-1122", "address": "足柄上郡山北町山北1301-4", "hours": "平日 8:30-17:15", "services": ["住民票", "戸籍"]},
+                    {"name": "山北町環境課", "phone": "0465-75-3646", "address": "足柄上郡山北町山北1301-4", "hours": "平日 8:30-17:15", "services": ["ごみ収集", "リサイクル", "環境対策"]}
+                ],
+                "消防署": [{"name": "山北町消防署", "phone": "0465-75-0119", "address": "足柄上郡山北町山北1889", "hours": "24時間", "services": ["火災通報", "救急車"]}],
+                "ガス": [{"name": "東京ガス小田原営業所", "phone": "0570-002211", "address": "小田原市本町1-2-25", "hours": "平日 8:30-19:00", "services": ["ガス開栓", "緊急通報"]}],
+                "電力": [{"name": "東京電力パワーグリッド小田原支社", "phone": "0120-995-007", "address": "小田原市本町1-5-12", "hours": "平日 9:00-17:00", "services": ["停電情報", "電気工事"]}],
+                "病院": [{"name": "山北町国民健康保険診療所", "phone": "0465-75-0299", "address": "足柄上郡山北町山北1301-4", "hours": "平日 9:00-17:00", "services": ["内科", "外科"]}],
+                "保健所": [{"name": "小田原保健福祉事務所", "phone": "0465-32-8000", "address": "小田原市荻窪350-1", "hours": "平日 8:30-17:15", "services": ["健康相談", "予防接種"]}],
+                "水道": [{"name": "山北町上下水道課", "phone": "0465-75-3645", "address": "足柄上郡山北町山北1301-4", "hours": "平日 8:30-17:15", "services": ["水道開栓", "料金"]}],
+                "NTT": [{"name": "NTT東日本神奈川支店", "phone": "116", "address": "横浜市西区みなとみらい2-3-3", "hours": "平日 9:00-17:00", "services": ["電話工事", "故障修理"]}],
+                "下水道": [{"name": "山北町上下水道課", "phone": "0465-75-3645", "address": "足柄上郡山北町山北1301-4", "hours": "平日 8:30-17:15", "services": ["下水道修理", "排水設備"]}]
+            }
+        },
+        "城山町": {
+            "": {
+                "労基署": [{"name": "厚木労働基準監督署", "phone": "046-228-1331", "address": "厚木市田村町2-18", "hours": "平日 8:30-17:15", "services": ["労働相談", "労災申請"]}],
+                "警察署": [{"name": "津久井警察署", "phone": "042-780-0110", "address": "相模原市緑区中野256", "hours": "24時間", "services": ["事件事故", "遺失物"]}],
+                "市区町村役所": [
+                    {"name": "相模原市緑区役所城山総合事務所", "phone": "042-783-8120", "address": "相模原市緑区久保沢2-26-1", "hours": "平日 8:30-17:00", "services": ["住民票", "戸籍"]},
+                    {"name": "相模原市緑区役所環境課", "phone": "042-775-8818", "address": "相模原市緑区橋本6-2-1", "hours": "平日 8:30-17:00", "services": ["ごみ収集", "リサイクル", "環境対策"]}
+                ],
+                "消防署": [{"name": "相模原市消防局津久井消防署", "phone": "042-784-2119", "address": "相模原市緑区中野256-3", "hours": "24時間", "services": ["火災通報", "救急車"]}],
+                "ガス": [{"name": "東京ガス相模原営業所", "phone": "0570-002211", "address": "相模原市中央区相模原1-1-3", "hours": "平日 8:30-19:00", "services": ["ガス開栓", "緊急通報"]}],
+                "電力": [{"name": "東京電力パワーグリッド相模原支社", "phone": "0120-995-007", "address": "相模原市中央区富士見2-7-19", "hours": "平日 9:00-17:00", "services": ["停電情報", "電気工事"]}],
+                "病院": [{"name": "城山病院", "phone": "042-782-3108", "address": "相模原市緑区川尻4436-1", "hours": "平日 9:00-17:00", "services": ["内科", "外科"]}],
+                "保健所": [{"name": "相模原市緑区合同庁舎", "phone": "042-775-8800", "address": "相模原市緑区橋本6-2-1", "hours": "平日 8:30-17:00", "services": ["健康相談", "予防接種"]}],
+                "水道": [{"name": "相模原市水道局津久井営業所", "phone": "042-784-2113", "address": "相模原市緑区中野258-3", "hours": "平日 8:30-17:00", "services": ["水道開栓", "料金"]}],
+                "NTT": [{"name": "NTT東日本神奈川支店", "phone": "116", "address": "横浜市西区みなとみらい2-3-3", "hours": "平日 9:00-17:00", "services": ["電話工事", "故障修理"]}],
+                "下水道": [{"name": "相模原市下水道部津久井下水道事務所", "phone": "042-784-1053", "address": "相模原市緑区中野258-3", "hours": "平日 8:30-17:00", "services": ["下水道修理", "排水設備"]}]
+            }
+        },
+        "津久井町": {
+            "": {
+                "労基署": [{"name": "厚木労働基準監督署", "phone": "046-228-1331", "address": "厚木市田村町2-18", "hours": "平日 8:30-17:15", "services": ["労働相談", "労災申請"]}],
+                "警察署": [{"name": "津久井警察署", "phone": "042-780-0110", "address": "相模原市緑区中野256", "hours": "24時間", "services": ["事件事故", "遺失物"]}],
+                "市区町村役所": [
+                    {"name": "相模原市緑区役所津久井総合事務所", "phone": "042-780-1400", "address": "相模原市緑区中野633", "hours": "平日 8:30-17:00", "services": ["住民票", "戸籍"]},
+                    {"name": "相模原市緑区役所環境課", "phone": "042-775-8818", "address": "相模原市緑区橋本6-2-1", "hours": "平日 8:30-17:00", "services": ["ごみ収集", "リサイクル", "環境対策"]}
+                ],
+                "消防署": [{"name": "相模原市消防局津久井消防署", "phone": "042-784-2119", "address": "相模原市緑区中野256-3", "hours": "24時間", "services": ["火災通報", "救急車"]}],
+                "ガス": [{"name": "東京ガス相模原営業所", "phone": "0570-002211", "address": "相模原市中央区相模原1-1-3", "hours": "平日 8:30-19:00", "services": ["ガス開栓", "緊急通報"]}],
+                "電力": [{"name": "東京電力パワーグリッド相模原支社", "phone": "0120-995-007", "address": "相模原市中央区富士見2-7-19", "hours": "平日 9:00-17:00", "services": ["停電情報", "電気工事"]}],
+                "病院": [{"name": "津久井赤十字病院", "phone": "042-784-2425", "address": "相模原市緑区中野256", "hours": "平日 9:00-17:00", "services": ["内科", "外科"]}],
+                "保健所": [{"name": "相模原市緑区合同庁舎", "phone": "042-775-8800", "address": "相模原市緑区橋本6-2-1", "hours": "平日 8:30-17:00", "services": ["健康相談", "予防接種"]}],
+                "水道": [{"name": "相模原市水道局津久井営業所", "phone": "042-784-2113", "address": "相模原市緑区中野258-3", "hours": "平日 8:30-17:00", "services": ["水道開栓", "料金"]}],
+                "NTT": [{"name": "NTT東日本神奈川支店", "phone": "116", "address": "横浜市西区みなとみらい2-3-3", "hours": "平日 9:00-17:00", "services": ["電話工事", "故障修理"]}],
+                "下水道": [{"name": "相模原市下水道部津久井下水道事務所", "phone": "042-784-1053", "address": "相模原市緑区中野258-3", "hours": "平日 8:30-17:00", "services": ["下水道修理", "排水設備"]}]
+            }
+        },
+        "相模湖町": {
+            "": {
+                "労基署": [{"name": "厚木労働基準監督署", "phone": "046-228-1331", "address": "厚木市田村町2-18", "hours": "平日 8:30-17:15", "services": ["労働相談", "労災申請"]}],
+                "警察署": [{"name": "津久井警察署", "phone": "042-780-0110", "address": "相模原市緑区中野256", "hours": "24時間", "services": ["事件事故", "遺失物"]}],
+                "市区町村役所": [
+                    {"name": "相模原市緑区役所相模湖総合事務所", "phone": "042-684-3240", "address": "相模原市緑区与瀬896", "hours": "平日 8:30-17:00", "services": ["住民票", "戸籍"]},
+                    {"name": "相模原市緑区役所環境課", "phone": "042-775-8818", "address": "相模原市緑区橋本6-2-1", "hours": "平日 8:30-17:00", "services": ["ごみ収集", "リサイクル", "環境対策"]}
+                ],
+                "消防署": [{"name": "相模原市消防局相模湖分署", "phone": "042-684-3119", "address": "相模原市緑区与瀬259-1", "hours": "24時間", "services": ["火災通報", "救急車"]}],
+                "ガス": [{"name": "東京ガス相模原営業所", "phone": "0570-002211", "address": "相模原市中央区相模原1-1-3", "hours": "平日 8:30-19:00", "services": ["ガス開栓", "緊急通報"]}],
+                "電力": [{"name": "東京電力パワーグリッド相模原支社", "phone": "0120-995-007", "address": "相模原市中央区富士見2-7-19", "hours": "平日 9:00-17:00", "services": ["停電情報", "電気工事"]}],
+                "病院": [{"name": "相模湖病院", "phone": "042-684-3111", "address": "相模原市緑区与瀬1304", "hours": "平日 9:00-17:00", "services": ["内科", "外科"]}],
+                "保健所": [{"name": "相模原市緑区合同庁舎", "phone": "042-775-8800", "address": "相模原市緑区橋本6-2-1", "hours": "平日 8:30-17:00", "services": ["健康相談", "予防接種"]}],
+                "水道": [{"name": "相模原市水道局津久井営業所", "phone": "042-784-2113", "address": "相模原市緑区中野258-3", "hours": "平日 8:30-17:00", "services": ["水道開栓", "料金"]}],
+                "NTT": [{"name": "NTT東日本神奈川支店", "phone": "116", "address": "横浜市西区みなとみらい2-3-3", "hours": "平日 9:00-17:00", "services": ["電話工事", "故障修理"]}],
+                "下水道": [{"name": "相模原市下水道部津久井下水道事務所", "phone": "042-784-1053", "address": "相模原市緑区中野258-3", "hours": "平日 8:30-17:00", "services": ["下水道修理", "排水設備"]}]
+            }
+        },
+        "藤野町": {
+            "": {
+                "労基署": [{"name": "厚木労働基準監督署", "phone": "046-228-1331", "address": "厚木市田村町2-18", "hours": "平日 8:30-17:15", "services": ["労働相談", "労災申請"]}],
+                "警察署": [{"name": "津久井警察署", "phone": "042-780-0110", "address": "相模原市緑区中野256", "hours": "24時間", "services": ["事件事故", "遺失物"]}],
+                "市区町村役所": [
+                    {"name": "相模原市緑区役所藤野総合事務所", "phone": "042-687-2119", "address": "相模原市緑区小渕2000", "hours": "平日 8:30-17:00", "services": ["住民票", "戸籍"]},
+                    {"name": "相模原市緑区役所環境課", "phone": "042-775-8818", "address": "相模原市緑区橋本6-2-1", "hours": "平日 8:30-17:00", "services": ["ごみ収集", "リサイクル", "環境対策"]}
+                ],
+                "消防署": [{"name": "相模原市消防局藤野分署", "phone": "042-687-3119", "address": "相模原市緑区小渕1987", "hours": "24時間", "services": ["火災通報", "救急車"]}],
+                "ガス": [{"name": "東京ガス相模原営業所", "phone": "0570-002211", "address": "相模原市中央区相模原1-1-3", "hours": "平日 8:30-19:00", "services": ["ガス開栓", "緊急通報"]}],
+                "電力": [{"name": "東京電力パワーグリッド相模原支社", "phone": "0120-995-007", "address": "相模原市中央区富士見2-7-19", "hours": "平日 9:00-17:00", "services": ["停電情報", "電気工事"]}],
+                "病院": [{"name": "藤野診療所", "phone": "042-687-2068", "address": "相模原市緑区小渕2009-1", "hours": "平日 9:00-17:00", "services": ["内科", "小児科"]}],
+                "保健所": [{"name": "相模原市緑区合同庁舎", "phone": "042-775-8800", "address": "相模原市緑区橋本6-2-1", "hours": "平日 8:30-17:00", "services": ["健康相談", "予防接種"]}],
+                "水道": [{"name": "相模原市水道局津久井営業所", "phone": "042-784-2113", "address": "相模原市緑区中野258-3", "hours": "平日 8:30-17:00", "services": ["水道開栓", "料金"]}],
+                "NTT": [{"name": "NTT東日本神奈川支店", "phone": "116", "address": "横浜市西区みなとみらい2-3-3", "hours": "平日 9:00-17:00", "services": ["電話工事", "故障修理"]}],
+                "下水道": [{"name": "相模原市下水道部津久井下水道事務所", "phone": "042-784-1053", "address": "相模原市緑区中野258-3", "hours": "平日 8:30-17:00", "services": ["下水道修理", "排水設備"]}]
+            }
+        }
+    },
+    "千葉県": {
+        "千葉市": {
+            "中央区": {
+                "労基署": [{"name": "千葉労働基準監督署", "phone": "043-221-2304", "address": "千葉市中央区中央4-11-1", "hours": "平日 8:30-17:15", "services": ["労働相談", "労災申請"]}],
+                "警察署": [{"name": "千葉中央警察署", "phone": "043-244-0110", "address": "千葉市中央区長洲2-21-1", "hours": "24時間", "services": ["事件事故", "遺失物"]}],
+                "市区町村役所": [{"name": "千葉市中央区役所", "phone": "043-221-2111", "address": "千葉市中央区中央3-10-8", "hours": "平日 8:30-17:30", "services": ["住民票", "戸籍"]}],
+                "消防署": [{"name": "千葉市消防局中央消防署", "phone": "043-202-1611", "address": "千葉市中央区長洲2-15-1", "hours": "24時間", "services": ["火災通報", "救急車"]}],
+                "ガス": [{"name": "京葉ガス千葉営業所", "phone": "047-361-1111", "address": "千葉市中央区中央2-5-1", "hours": "平日 8:30-19:00", "services": ["ガス開栓", "緊急通報"]}],
+                "電力": [{"name": "東京電力パワーグリッド千葉支社", "phone": "0120-995-007", "address": "千葉市中央区中央2-6-1", "hours": "平日 9:00-17:00", "services": ["停電情報", "電気工事"]}],
+                "病院": [{"name": "千葉市立青葉病院", "phone": "043-227-1131", "address": "千葉市中央区青葉町1273-2", "hours": "24時間救急", "services": ["総合診療", "救急医療"]}],
+                "保健所": [{"name": "千葉市保健所", "phone": "043-238-9925", "address": "千葉市美浜区幸町1-3-9", "hours": "平日 8:30-17:30", "services": ["健康相談", "予防接種"]}],
+                "水道": [{"name": "千葉市上下水道局", "phone": "043-211-8111", "address": "千葉市中央区千葉港1-1", "hours": "平日 8:30-17:30", "services": ["水道開栓", "料金"]}],
+                "NTT": [{"name": "NTT東日本千葉支店", "phone": "116", "address": "千葉市中央区新町1000", "hours": "平日 9:00-17:00", "services": ["電話工事", "故障修理"]}],
+                "下水道": [{"name": "千葉市上下水道局", "phone": "043-211-8632", "address": "千葉市中央区千葉港1-1", "hours": "平日 8:30-17:30", "services": ["下水道修理", "排水設備"]}]
+            },
+            "花見川区": {
+                "労基署": [{"name": "千葉労働基準監督署", "phone": "043-221-2304", "address": "千葉市中央区中央4-11-1", "hours": "平日 8:30-17:15", "services": ["労働相談", "労災申請"]}],
+                "警察署": [{"name": "千葉北警察署", "phone": "043-286-0110", "address": "千葉市花見川区犢橋町162-1", "hours": "24時間", "services": ["事件事故", "遺失物"]}],
+                "市区町村役所": [{"name": "千葉市花見川区役所", "phone": "043-275-6111", "address": "千葉市花見川区瑞穂1-1", "hours": "平日 8:30-17:30", "services": ["住民票", "戸籍"]}],
+                "消防署": [{"name": "千葉市消防局花見川消防署", "phone": "043-259-2580", "address": "千葉市花見川区瑞穂1-1", "hours": "24時間", "services": ["火災通報", "救急車"]}],
+                "ガス": [{"name": "京葉ガス幕張営業所", "phone": "047-361-1111", "address": "千葉市花見川区幕張町5-417-7", "hours": "平日 8:30-19:00", "services": ["ガス開栓", "緊急通報"]}],
+                "電力": [{"name": "東京電力パワーグリッド千葉支社", "phone": "0120-995-007", "address": "千葉市中央区中央2-6-1", "hours": "平日 9:00-17:00", "services": ["停電情報", "電気工事"]}],
+                "病院": [{"name": "千葉市立海浜病院", "phone": "043-277-7711", "address": "千葉市美浜区磯辺3-31-1", "hours": "24時間救急", "services": ["総合診療", "救急医療"]}],
+                "保健所": [{"name": "千葉市保健所", "phone": "043-238-9925", "address": "千葉市美浜区幸町1-3-9", "hours": "平日 8:30-17:30", "services": ["健康相談", "予防接種"]}],
+                "水道": [{"name": "千葉市上下水道局", "phone": "043-211-8111", "address": "千葉市中央区千葉港1-1", "hours": "平日 8:30-17:30", "services": ["水道開栓", "料金"]}],
+                "NTT": [{"name": "NTT東日本千葉支店", "phone": "116", "address": "千葉市中央区新町1000", "hours": "平日 9:00-17:00", "services": ["電話工事", "故障修理"]}],
+                "下水道": [{"name": "千葉市上下水道局", "phone": "043-211-8632", "address": "千葉市中央区千葉港1-1", "hours": "平日 8:30-17:30", "services": ["下水道修理", "排水設備"]}]
+            },
+            "稲毛区": {
+                "労基署": [{"name": "千葉労働基準監督署", "phone": "043-221-2304", "address": "千葉市中央区中央4-11-1", "hours": "平日 8:30-17:15", "services": ["労働相談", "労災申請"]}],
+                "警察署": [{"name": "千葉西警察署", "phone": "043-277-0110", "address": "千葉市美浜区真砂5-15-1", "hours": "24時間", "services": ["事件事故", "遺失物"]}],
+                "市区町村役所": [{"name": "千葉市稲毛区役所", "phone": "043-284-6111", "address": "千葉市稲毛区穴川4-12-1", "hours": "平日 8:30-17:30", "services": ["住民票", "戸籍"]}],
+                "消防署": [{"name": "千葉市消防局稲毛消防署", "phone": "043-284-5111", "address": "千葉市稲毛区稲毛1-5-15", "hours": "24時間", "services": ["火災通報", "救急車"]}],
+                "ガス": [{"name": "京葉ガス稲毛営業所", "phone": "047-361-1111", "address": "千葉市稲毛区小仲台7-2-1", "hours": "平日 8:30-19:00", "services": ["ガス開栓", "緊急通報"]}],
+                "電力": [{"name": "東京電力パワーグリッド千葉支社", "phone": "0120-995-007", "address": "千葉市中央区中央2-6-1", "hours": "平日 9:00-17:00", "services": ["停電情報", "電気工事"]}],
+                "病院": [{"name": "千葉市立稲毛病院", "phone": "043-251-1221", "address": "千葉市稲毛区小仲台6-1-1", "hours": "24時間救急", "services": ["総合診療", "救急医療"]}],
+                "保健所": [{"name": "千葉市保健所", "phone": "043-238-9925", "address": "千葉市美浜区幸町1-3-9", "hours": "平日 8:30-17:30", "services": ["健康相談", "予防接種"]}],
+                "水道": [{"name": "千葉市上下水道局", "phone": "043-211-8111", "address": "千葉市中央区千葉港1-1", "hours": "平日 8:30-17:30", "services": ["水道開栓", "料金"]}],
+                "NTT": [{"name": "NTT東日本千葉支店", "phone": "116", "address": "千葉市中央区新町1000", "hours": "平日 9:00-17:00", "services": ["電話工事", "故障修理"]}],
+                "下水道": [{"name": "千葉市上下水道局", "phone": "043-211-8632", "address": "千葉市中央区千葉港1-1", "hours": "平日 8:30-17:30", "services": ["下水道修理", "排水設備"]}]
+            },
+            "緑区": {
+                "労基署": [{"name": "千葉労働基準監督署", "phone": "043-221-2304", "address": "千葉市中央区中央4-11-1", "hours": "平日 8:30-17:15", "services": ["労働相談", "労災申請"]}],
+                "警察署": [{"name": "千葉南警察署", "phone": "043-291-0110", "address": "千葉市中央区蘇我2-1-1", "hours": "24時間", "services": ["事件事故", "遺失物"]}],
+                "市区町村役所": [{"name": "千葉市緑区役所", "phone": "043-292-8111", "address": "千葉市緑区おゆみ野3-15-2", "hours": "平日 8:30-17:30", "services": ["住民票", "戸籍"]}],
+                "消防署": [{"name": "千葉市消防局緑消防署", "phone": "043-292-6111", "address": "千葉市緑区おゆみ野3-15-2", "hours": "24時間", "services": ["火災通報", "救急車"]}],
+                "ガス": [{"name": "京葉ガス千葉営業所", "phone": "047-361-1111", "address": "千葉市中央区中央2-5-1", "hours": "平日 8:30-19:00", "services": ["ガス開栓", "緊急通報"]}],
+                "電力": [{"name": "東京電力パワーグリッド千葉支社", "phone": "0120-995-007", "address": "千葉市中央区中央2-6-1", "hours": "平日 9:00-17:00", "services": ["停電情報", "電気工事"]}],
+                "病院": [{"name": "千葉市立青葉病院", "phone": "043-227-1131", "address": "千葉市中央区青葉町1273-2", "hours": "24時間救急", "services": ["総合診療", "救急医療"]}],
+                "保健所": [{"name": "千葉市保健所", "phone": "043-238-9925", "address": "千葉市美浜区幸町1-3-9", "hours": "平日 8:30-17:30", "services": ["健康相談", "予防接種"]}],
+                "水道": [{"name": "千葉市上下水道局", "phone": "043-211-8111", "address": "千葉市中央区千葉港1-1", "hours": "平日 8:30-17:30", "services": ["水道開栓", "料金"]}],
+                "NTT": [{"name": "NTT東日本千葉支店", "phone": "116", "address": "千葉市中央区新町1000", "hours": "平日 9:00-17:00", "services": ["電話工事", "故障修理"]}],
+                "下水道": [{"name": "千葉市上下水道局", "phone": "043-211-8632", "address": "千葉市中央区千葉港1-1", "hours": "平日 8:30-17:30", "services": ["下水道修理", "排水設備"]}]
+            },
+            "美浜区": {
+                "労基署": [{"name": "千葉労働基準監督署", "phone": "043-221-2304", "address": "千葉市中央区中央4-11-1", "hours": "平日 8:30-17:15", "services": ["労働相談", "労災申請"]}],
+                "警察署": [{"name": "千葉西警察署", "phone": "043-277-0110", "address": "千葉市美浜区真砂5-15-1", "hours": "24時間", "services": ["事件事故", "遺失物"]}],
+                "市区町村役所": [{"name": "千葉市美浜区役所", "phone": "043-270-3111", "address": "千葉市美浜区真砂5-15-1", "hours": "平日 8:30-17:30", "services": ["住民票", "戸籍"]}],
+                "消防署": [{"name": "千葉市消防局美浜消防署", "phone": "043-279-0119", "address": "千葉市美浜区真砂5-15-1", "hours": "24時間", "services": ["火災通報", "救急車"]}],
+                "ガス": [{"name": "京葉ガス検見川営業所", "phone": "047-361-1111", "address": "千葉市美浜区真砂1-2-21", "hours": "平日 8:30-19:00", "services": ["ガス開栓", "緊急通報"]}],
+                "電力": [{"name": "東京電力パワーグリッド千葉支社", "phone": "0120-995-007", "address": "千葉市中央区中央2-6-1", "hours": "平日 9:00-17:00", "services": ["停電情報", "電気工事"]}],
+                "病院": [{"name": "千葉市立海浜病院", "phone": "043-277-7711", "address": "千葉市美浜区磯辺3-31-1", "hours": "24時間救急", "services": ["総合診療", "救急医療"]}],
+                "保健所": [{"name": "千葉市保健所", "phone": "043-238-9925", "address": "千葉市美浜区幸町1-3-9", "hours": "平日 8:30-17:30", "services": ["健康相談", "予防接種"]}],
+                "水道": [{"name": "千葉市上下水道局", "phone": "043-211-8111", "address": "千葉市中央区千葉港1-1", "hours": "平日 8:30-17:30", "services": ["水道開栓", "料金"]}],
+                "NTT": [{"name": "NTT東日本千葉支店", "phone": "116", "address": "千葉市中央区新町1000", "hours": "平日 9:00-17:00", "services": ["電話工事", "故障修理"]}],
+                "下水道": [{"name": "千葉市上下水道局", "phone": "043-211-8632", "address": "千葉市中央区千葉港1-1", "hours": "平日 8:30-17:30", "services": ["下水道修理", "排水設備"]}]
+            },
+            "若葉区": {
+                "労基署": [{"name": "千葉労働基準監督署", "phone": "043-221-2304", "address": "千葉市中央区中央4-11-1", "hours": "平日 8:30-17:15", "services": ["労働相談", "労災申請"]}],
+                "警察署": [{"name": "千葉東警察署", "phone": "043-233-0110", "address": "千葉市中央区千葉港7-1", "hours": "24時間", "services": ["事件事故", "遺失物"]}],
+                "市区町村役所": [{"name": "千葉市若葉区役所", "phone": "043-233-8111", "address": "千葉市若葉区桜木北2-1-1", "hours": "平日 8:30-17:30", "services": ["住民票", "戸籍"]}],
+                "消防署": [{"name": "千葉市消防局若葉消防署", "phone": "043-233-8111", "address": "千葉市若葉区桜木北2-1-1", "hours": "24時間", "services": ["火災通報", "救急車"]}],
+                "ガス": [{"name": "京葉ガス千葉営業所", "phone": "047-361-1111", "address": "千葉市中央区中央2-5-1", "hours": "平日 8:30-19:00", "services": ["ガス開栓", "緊急通報"]}],
+                "電力": [{"name": "東京電力パワーグリッド千葉支社", "phone": "0120-995-007", "address": "千葉市中央区中央2-6-1", "hours": "平日 9:00-17:00", "services": ["停電情報", "電気工事"]}],
+                "病院": [{"name": "千葉市立青葉病院", "phone": "043-227-1131", "address": "千葉市中央区青葉町1273-2", "hours": "24時間救急", "services": ["総合診療", "救急医療"]}],
+                "保健所": [{"name": "千葉市保健所", "phone": "043-238-9925", "address": "千葉市美浜区幸町1-3-9", "hours": "平日 8:30-17:30", "services": ["健康相談", "予防接種"]}],
+                "水道": [{"name": "千葉市上下水道局", "phone": "043-211-8111", "address": "千葉市中央区千葉港1-1", "hours": "平日 8:30-17:30", "services": ["水道開栓", "料金"]}],
+                "NTT": [{"name": "NTT東日本千葉支店", "phone": "116", "address": "千葉市中央区新町1000", "hours": "平日 9:00-17:00", "services": ["電話工事", "故障修理"]}],
+                "下水道": [{"name": "千葉市上下水道局", "phone": "043-211-8632", "address": "千葉市中央区千葉港1-1", "hours": "平日 8:30-17:30", "services": ["下水道修理", "排水設備"]}]
+            }
+        },
+        "市川市": {
+            "": {
+                "労基署": [{"name": "船橋労働基準監督署", "phone": "047-431-0182", "address": "船橋市湊町2-10-17", "hours": "平日 8:30-17:15", "services": ["労働相談", "労災申請"]}],
+                "警察署": [{"name": "市川警察署", "phone": "047-370-0110", "address": "市川市市川1-1-1", "hours": "24時間", "services": ["事件事故", "遺失物"]}],
+                "市区町村役所": [{"name": "市川市役所", "phone": "047-334-1111", "address": "市川市八幡1-1-1", "hours": "平日 8:45-17:00", "services": ["住民票", "戸籍"]}],
+                "消防署": [{"name": "市川市消防局", "phone": "047-333-2111", "address": "市川市八幡1-8-1", "hours": "24時間", "services": ["火災通報", "救急車"]}],
+                "ガス": [{"name": "京葉ガス市川営業所", "phone": "047-361-1111", "address": "市川市市川1-4-10", "hours": "平日 8:30-19:00", "services": ["ガス開栓", "緊急通報"]}],
+                "電力": [{"name": "東京電力パワーグリッド市川支社", "phone": "0120-995-007", "address": "市川市市川1-3-18", "hours": "平日 9:00-17:00", "services": ["停電情報", "電気工事"]}],
+                "病院": [{"name": "市川市立リハビリテーション病院", "phone": "047-336-8111", "address": "市川市柏井町4-229-4", "hours": "24時間救急", "services": ["総合診療", "救急医療"]}],
+                "保健所": [{"name": "市川保健所", "phone": "047-377-1103", "address": "市川市南八幡5-11-22", "hours": "平日 9:00-17:00", "services": ["健康相談", "予防接種"]}],
+                "水道": [{"name": "市川市水道部", "phone": "047-712-6361", "address": "市川市八幡2-16-1", "hours": "平日 8:45-17:00", "services": ["水道開栓", "料金"]}],
+                "NTT": [{"name": "NTT東日本千葉支店", "phone": "116", "address": "千葉市中央区新町1000", "hours": "平日 9:00-17:00", "services": ["電話工事", "故障修理"]}],
+                "下水道": [{"name": "市川市下水道部", "phone": "047-712-6362", "address": "市川市八幡2-16-1", "hours": "平日 8:45-17:00", "services": ["下水道修理", "排水設備"]}]
+            }
+        },
+        "船橋市": {
+            "": {
+                "労基署": [{"name": "船橋労働基準監督署", "phone": "047-431-0182", "address": "船橋市湊町2-10-17", "hours": "平日 8:30-17:15", "services": ["労働相談", "労災申請"]}],
+                "警察署": [{"name": "船橋警察署", "phone": "047-435-0110", "address": "船橋市湊町2-4-1", "hours": "24時間", "services": ["事件事故", "遺失物"]}],
+                "市区町村役所": [{"name": "船橋市役所", "phone": "047-436-2111", "address": "船橋市湊町2-10-25", "hours": "平日 9:00-17:00", "services": ["住民票", "戸籍"]}],
+                "消防署": [{"name": "船橋市消防局", "phone": "047-435-8651", "address": "船橋市湊町2-1-1", "hours": "24時間", "services": ["火災通報", "救急車"]}],
+                "ガス": [{"name": "京葉ガス船橋営業所", "phone": "047-361-1111", "address": "船橋市本町2-1-1", "hours": "平日 8:30-19:00", "services": ["ガス開栓", "緊急通報"]}],
+                "電力": [{"name": "東京電力パワーグリッド船橋支社", "phone": "0120-995-007", "address": "船橋市本町1-3-1", "hours": "平日 9:00-17:00", "services": ["停電情報", "電気工事"]}],
+                "病院": [{"name": "船橋市立医療センター", "phone": "047-438-3321", "address": "船橋市金杉1-21-1", "hours": "24時間救急", "services": ["総合診療", "救急医療"]}],
+                "保健所": [{"name": "船橋市保健所", "phone": "047-431-4161", "address": "船橋市湊町2-10-25", "hours": "平日 9:00-17:00", "services": ["健康相談", "予防接種"]}],
+                "水道": [{"name": "船橋市上下水道局", "phone": "047-436-2871", "address": "船橋市湊町2-10-15", "hours": "平日 9:00-17:00", "services": ["水道開栓", "料金"]}],
+                "NTT": [{"name": "NTT東日本千葉支店", "phone": "116", "address": "千葉市中央区新町1000", "hours": "平日 9:00-17:00", "services": ["電話工事", "故障修理"]}],
+                "下水道": [{"name": "船橋市上下水道局", "phone": "047-436-2872", "address": "船橋市湊町2-10-15", "hours": "平日 9:00-17:00", "services": ["下水道修理", "排水設備"]}]
+            }
+        },
+        "柏市": {
+            "": {
+                "労基署": [{"name": "柏労働基準監督署", "phone": "04-7163-0246", "address": "柏市柏255", "hours": "平日 8:30-17:15", "services": ["労働相談", "労災申請"]}],
+                "警察署": [{"name": "柏警察署", "phone": "04-7148-0110", "address": "柏市松ヶ崎722-1", "hours": "24時間", "services": ["事件事故", "遺失物"]}],
+                "市区町村役所": [{"name": "柏市役所", "phone": "04-7167-1111", "address": "柏市柏5-10-1", "hours": "平日 8:30-17:15", "services": ["住民票", "戸籍"]}],
+                "消防署": [{"name": "柏市消防局", "phone": "04-7133-0119", "address": "柏市松葉町7-16-7", "hours": "24時間", "services": ["火災通報", "救急車"]}],
+                "ガス": [{"name": "東京ガス柏営業所", "phone": "0570-002211", "address": "柏市柏1-2-35", "hours": "平日 8:30-19:00", "services": ["ガス開栓", "緊急通報"]}],
+                "電力": [{"name": "東京電力パワーグリッド柏支社", "phone": "0120-995-007", "address": "柏市柏1-7-1", "hours": "平日 9:00-17:00", "services": ["停電情報", "電気工事"]}],
+                "病院": [{"name": "柏市立柏病院", "phone": "04-7134-2000", "address": "柏市布施1-3", "hours": "24時間救急", "services": ["総合診療", "救急医療"]}],
+                "保健所": [{"name": "柏市保健所", "phone": "04-7167-1255", "address": "柏市柏下65-1", "hours": "平日 8:30-17:15", "services": ["健康相談", "予防接種"]}],
+                "水道": [{"name": "柏市上下水道部", "phone": "04-7166-2411", "address": "柏市柏5-10-1", "hours": "平日 8:30-17:15", "services": ["水道開栓", "料金"]}],
+                "NTT": [{"name": "NTT東日本千葉支店", "phone": "116", "address": "千葉市中央区新町1000", "hours": "平日 9:00-17:00", "services": ["電話工事", "故障修理"]}],
+                "下水道": [{"name": "柏市上下水道部", "phone": "04-7166-2412", "address": "柏市柏5-10-1", "hours": "平日 8:30-17:15", "services": ["下水道修理", "排水設備"]}]
+            }
+        },
+        "松戸市": {
+            "": {
+                "労基署": [{"name": "松戸労働基準監督署", "phone": "047-368-8131", "address": "松戸市岩瀬550", "hours": "平日 8:30-17:15", "services": ["労働相談", "労災申請"]}],
+                "警察署": [{"name": "松戸警察署", "phone": "047-369-0110", "address": "松戸市松戸1613", "hours": "24時間", "services": ["事件事故", "遺失物"]}],
+                "市区町村役所": [{"name": "松戸市役所", "phone": "047-366-1111", "address": "松戸市根本387-5", "hours": "平日 8:30-17:00", "services": ["住民票", "戸籍"]}],
+                "消防署": [{"name": "松戸市消防局", "phone": "047-363-1141", "address": "松戸市根本387-5", "hours": "24時間", "services": ["火災通報", "救急車"]}],
+                "ガス": [{"name": "京葉ガス松戸営業所", "phone": "047-361-1111", "address": "松戸市本町20-10", "hours": "平日 8:30-19:00", "services": ["ガス開栓", "緊急通報"]}],
+                "電力": [{"name": "東京電力パワーグリッド松戸支社", "phone": "0120-995-007", "address": "松戸市本町7-3", "hours": "平日 9:00-17:00", "services": ["停電情報", "電気工事"]}],
+                "病院": [{"name": "松戸市立総合医療センター", "phone": "047-712-2511", "address": "松戸市千駄堀993-1", "hours": "24時間救急", "services": ["総合診療", "救急医療"]}],
+                "保健所": [{"name": "松戸保健所", "phone": "047-361-2121", "address": "松戸市小根本7", "hours": "平日 9:00-17:00", "services": ["健康相談", "予防接種"]}],
+                "水道": [{"name": "松戸市水道部", "phone": "047-341-0430", "address": "松戸市根本387-5", "hours": "平日 8:30-17:00", "services": ["水道開栓", "料金"]}],
+                "NTT": [{"name": "NTT東日本千葉支店", "phone": "116", "address": "千葉市中央区新町1000", "hours": "平日 9:00-17:00", "services": ["電話工事", "故障修理"]}],
+                "下水道": [{"name": "松戸市建設部下水道課", "phone": "047-366-7395", "address": "松戸市根本387-5", "hours": "平日 8:30-17:00", "services": ["下水道修理", "排水設備"]}]
+            }
+        },
+        "銚子市": {
+            "": {
+                "労基署": [{"name": "銚子労働基準監督署", "phone": "0479-22-7111", "address": "銚子市西芝町2-12", "hours": "平日 8:30-17:15", "services": ["労働相談", "労災申請"]}],
+                "警察署": [{"name": "銚子警察署", "phone": "0479-25-0110", "address": "銚子市西芝町11-8", "hours": "24時間", "services": ["事件事故", "遺失物"]}],
+                "市区町村役所": [{"name": "銚子市役所", "phone": "0479-24-8181", "address": "銚子市若宮町1-1", "hours": "平日 8:30-17:15", "services": ["住民票", "戸籍"]}],
+                "消防署": [{"name": "銚子市消防本部", "phone": "0479-24-0119", "address": "銚子市若宮町4-6", "hours": "24時間", "services": ["火災通報", "救急車"]}],
+                "ガス": [{"name": "銚子ガス", "phone": "0479-22-3326", "address": "銚子市新生町1-36-15", "hours": "平日 8:30-17:30", "services": ["ガス開栓", "緊急通報"]}],
+                "電力": [{"name": "東京電力パワーグリッド銚子支社", "phone": "0120-995-007", "address": "銚子市新生町1-1-17", "hours": "平日 9:00-17:00", "services": ["停電情報", "電気工事"]}],
+                "病院": [{"name": "銚子市立病院", "phone": "0479-23-0011", "address": "銚子市前宿町597", "hours": "24時間救急", "services": ["総合診療", "救急医療"]}],
+                "保健所": [{"name": "海匝保健所", "phone": "0479-22-0206", "address": "銚子市栄町1-2-26", "hours": "平日 9:00-17:00", "services": ["健康相談", "予防接種"]}],
+                "水道": [{"name": "銚子市上下水道部", "phone": "0479-24-8974", "address": "銚子市若宮町1-1", "hours": "平日 8:30-17:15", "services": ["水道開栓", "料金"]}],
+                "NTT": [{"name": "NTT東日本千葉支店", "phone": "116", "address": "千葉市中央区新町1000", "hours": "平日 9:00-17:00", "services": ["電話工事", "故障修理"]}],
+                "下水道": [{"name": "銚子市上下水道部", "phone": "0479-24-8975", "address": "銚子市若宮町1-1", "hours": "平日 8:30-17:15", "services": ["下水道修理", "排水設備"]}]
+            }
+        },
+        "館山市": {
+            "": {
+                "労基署": [{"name": "館山労働基準監督署", "phone": "0470-22-2533", "address": "館山市北条1073", "hours": "平日 8:30-17:15", "services": ["労働相談", "労災申請"]}],
+                "警察署": [{"name": "館山警察署", "phone": "0470-23-0110", "address": "館山市北条402-1", "hours": "24時間", "services": ["事件事故", "遺失物"]}],
+                "市区町村役所": [{"name": "館山市役所", "phone": "0470-22-3111", "address": "館山市北条1145-1", "hours": "平日 8:30-17:15", "services": ["住民票", "戸籍"]}],
+                "消防署": [{"name": "館山市消防本部", "phone": "0470-25-4012", "address": "館山市北条740-1", "hours": "24時間", "services": ["火災通報", "救急車"]}],
+                "ガス": [{"name": "房州ガス", "phone": "0470-22-1688", "address": "館山市北条1879-2", "hours": "平日 8:30-17:30", "services": ["ガス開栓", "緊急通報"]}],
+                "電力": [{"name": "東京電力パワーグリッド館山支社", "phone": "0120-995-007", "address": "館山市北条1584-1", "hours": "平日 9:00-17:00", "services": ["停電情報", "電気工事"]}],
+                "病院": [{"name": "亀田総合病院", "phone": "04-7092-2211", "address": "鴨川市東町929", "hours": "24時間救急", "services": ["総合診療", "救急医療"]}],
+                "保健所": [{"name": "安房保健所", "phone": "0470-22-4511", "address": "館山市北条402-1", "hours": "平日 9:00-17:00", "services": ["健康相談", "予防接種"]}],
+                "水道": [{"name": "館山市上下水道部", "phone": "0470-22-3614", "address": "館山市北条1145-1", "hours": "平日 8:30-17:15", "services": ["水道開栓", "料金"]}],
+                "NTT": [{"name": "NTT東日本千葉支店", "phone": "116", "address": "千葉市中央区新町1000", "hours": "平日 9:00-17:00", "services": ["電話工事", "故障修理"]}],
+                "下水道": [{"name": "館山市上下水道部", "phone": "0470-22-3615", "address": "館山市北条1145-1", "hours": "平日 8:30-17:15", "services": ["下水道修理", "排水設備"]}]
+            }
+        },
+        "木更津市": {
+            "": {
+                "労基署": [{"name": "木更津労働基準監督署", "phone": "0438-22-4175", "address": "木更津市新田2-5-1", "hours": "平日 8:30-17:15", "services": ["労働相談", "労災申請"]}],
+                "警察署": [{"name": "木更津警察署", "phone": "0438-22-0110", "address": "木更津市新田2-7-1", "hours": "24時間", "services": ["事件事故", "遺失物"]}],
+                "市区町村役所": [{"name": "木更津市役所", "phone": "0438-23-7111", "address": "木更津市朝日3-10-19", "hours": "平日 8:30-17:15", "services": ["住民票", "戸籍"]}],
+                "消防署": [{"name": "木更津市消防本部", "phone": "0438-25-1122", "address": "木更津市潮見5-1", "hours": "24時間", "services": ["火災通報", "救急車"]}],
+                "ガス": [{"name": "京葉ガス木更津営業所", "phone": "047-361-1111", "address": "木更津市大和1-2-8", "hours": "平日 8:30-19:00", "services": ["ガス開栓", "緊急通報"]}],
+                "電力": [{"name": "東京電力パワーグリッド木更津支社", "phone": "0120-995-007", "address": "木更津市新田2-4-1", "hours": "平日 9:00-17:00", "services": ["停電情報", "電気工事"]}],
+                "病院": [{"name": "君津中央病院", "phone": "0438-36-1071", "address": "木更津市桜井1010", "hours": "24時間救急", "services": ["総合診療", "救急医療"]}],
+                "保健所": [{"name": "君津保健所", "phone": "0438-22-3745", "address": "木更津市新田3-4-34", "hours": "平日 9:00-17:00", "services": ["健康相談", "予防接種"]}],
+                "水道": [{"name": "木更津市上下水道部", "phone": "0438-23-4634", "address": "木更津市朝日3-10-19", "hours": "平日 8:30-17:15", "services": ["水道開栓", "料金"]}],
+                "NTT": [{"name": "NTT東日本千葉支店", "phone": "116", "address": "千葉市中央区新町1000", "hours": "平日 9:00-17:00", "services": ["電話工事", "故障修理"]}],
+                "下水道": [{"name": "木更津市上下水道部", "phone": "0438-23-4635", "address": "木更津市朝日3-10-19", "hours": "平日 8:30-17:15", "services": ["下水道修理", "排水設備"]}]
+            }
+        }
+    },
+    "東京都": {
+        "足立区": {
+            "": {
+                "労基署": [{"name": "足立労働基準監督署", "phone": "03-3882-1192", "address": "東京都足立区千住旭町4-21", "hours": "平日 8:30-17:15", "services": ["労働相談", "労災申請"]}],
+                "警察署": [
+                    {"name": "竹の塚警察署", "phone": "03-3850-0110", "address": "東京都足立区竹の塚2-8-1", "hours": "24時間", "services": ["事件事故", "遺失物"]},
+                    {"name": "千住警察署", "phone": "03-3879-0110", "address": "東京都足立区千住2-63", "hours": "24時間", "services": ["事件事故", "遺失物"]},
+                    {"name": "西新井警察署", "phone": "03-3898-0110", "address": "東京都足立区栗原3-10-15", "hours": "24時間", "services": ["事件事故", "遺失物"]}
+                ],
+                "市区町村役所": [
+                    {"name": "足立区役所", "phone": "03-3880-5111", "address": "東京都足立区中央本町1-17-1", "hours": "平日 8:30-17:00", "services": ["住民票", "戸籍"]},
+                    {"name": "足立区環境部", "phone": "03-3880-5860", "address": "東京都足立区中央本町1-17-1", "hours": "平日 8:30-17:00", "services": ["ごみ収集", "リサイクル", "環境対策"]}
+                ],
+                "消防署": [
+                    {"name": "足立消防署", "phone": "03-3881-0119", "address": "東京都足立区千住曙町41-1", "hours": "24時間", "services": ["火災通報", "救急車"]},
+                    {"name": "西新井消防署", "phone": "03-3848-0119", "address": "東京都足立区西新井本町3-15-7", "hours": "24時間", "services": ["火災通報", "救急車"]},
+                    {"name": "本所消防署竹の塚出張所", "phone": "03-3850-0119", "address": "東京都足立区竹の塚6-8-1", "hours": "24時間", "services": ["火災通報", "救急車"]}
+                ],
+                "ガス": [{"name": "東京ガス足立支店", "phone": "0570-002211", "address": "東京都足立区千住1-4-1", "hours": "平日 8:30-19:00", "services": ["ガス開栓", "緊急通報"]}],
+                "電力": [{"name": "東京電力パワーグリッド足立支社", "phone": "0120-995-007", "address": "東京都足立区千住2-26", "hours": "平日 9:00-17:00", "services": ["停電情報", "電気工事"]}],
+                "病院": [
+                    {"name": "足立区立病院", "phone": "03-5682-8102", "address": "東京都足立区西新井本町4-9-10", "hours": "24時間救急", "services": ["総合診療", "救急医療"]},
+                    {"name": "千住病院", "phone": "03-3881-2181", "address": "東京都足立区千住2-26", "hours": "24時間救急", "services": ["内科", "外科"]},
+                    {"name": "竹の塚脳神経外科病院", "phone": "03-3850-3451", "address": "東京都足立区竹の塚4-2-12", "hours": "平日 9:00-17:00", "services": ["脳神経外科", "神経内科"]}
+                ],
+                "保健所": [{"name": "足立保健所", "phone": "03-3880-5892", "address": "東京都足立区中央本町1-5-3", "hours": "平日 8:30-17:00", "services": ["健康相談", "予防接種"]}],
+                "水道": [{"name": "東京都水道局足立営業所", "phone": "03-5326-1103", "address": "東京都足立区千住1-4-1", "hours": "平日 8:30-17:00", "services": ["水道開栓", "料金"]}],
+                "NTT": [{"name": "NTT東日本東京支店", "phone": "116", "address": "東京都新宿区西新宿3-19-2", "hours": "平日 9:00-17:00", "services": ["電話工事", "故障修理"]}],
+                "下水道": [{"name": "東京都下水道局足立出張所", "phone": "03-5320-6514", "address": "東京都足立区千住1-4-1", "hours": "平日 8:30-17:15", "services": ["下水道修理", "排水設備"]}]
+            }
+        },
+        "荒川区": {
+            "": {
+                "労基署": [{"name": "足立労働基準監督署", "phone": "03-3882-1192", "address": "東京都足立区千住旭町4-21", "hours": "平日 8:30-17:15", "services": ["労働相談", "労災申請"]}],
+                "警察署": [{"name": "荒川警察署", "phone": "03-3891-0110", "address": "東京都荒川区荒川3-3-10", "hours": "24時間", "services": ["事件事故", "遺失物"]}],
+                "市区町村役所": [{"name": "荒川区役所", "phone": "03-3802-3111", "address": "東京都荒川区荒川2-2-3", "hours": "平日 8:30-17:00", "services": ["住民票", "戸籍"]}],
+                "消防署": [{"name": "荒川消防署", "phone": "03-3891-0119", "address": "東京都荒川区荒川3-4-1", "hours": "24時間", "services": ["火災通報", "救急車"]}],
+                "ガス": [{"name": "東京ガス荒川支店", "phone": "0570-002211", "address": "東京都荒川区西日暮里2-25-1", "hours": "平日 8:30-19:00", "services": ["ガス開栓", "緊急通報"]}],
+                "電力": [{"name": "東京電力パワーグリッド荒川支社", "phone": "0120-995-007", "address": "東京都荒川区西日暮里2-23-1", "hours": "平日 9:00-17:00", "services": ["停電情報", "電気工事"]}],
+                "病院": [{"name": "東京女子医科大学東医療センター", "phone": "03-3810-1111", "address": "東京都荒川区西尾久2-1-10", "hours": "24時間救急", "services": ["総合診療", "救急医療"]}],
+                "保健所": [{"name": "荒川区保健所", "phone": "03-3802-3111", "address": "東京都荒川区荒川2-11-1", "hours": "平日 8:30-17:00", "services": ["健康相談", "予防接種"]}],
+                "水道": [{"name": "東京都水道局荒川営業所", "phone": "03-5326-1104", "address": "東京都荒川区西日暮里2-25-1", "hours": "平日 8:30-17:00", "services": ["水道開栓", "料金"]}],
+                "NTT": [{"name": "NTT東日本東京支店", "phone": "116", "address": "東京都新宿区西新宿3-19-2", "hours": "平日 9:00-17:00", "services": ["電話工事", "故障修理"]}],
+                "下水道": [{"name": "東京都下水道局荒川出張所", "phone": "03-5320-6515", "address": "東京都荒川区西日暮里2-25-1", "hours": "平日 8:30-17:15", "services": ["下水道修理", "排水設備"]}]
+            }
+        },
+        "文京区": {
+            "": {
+                "労基署": [{"name": "文京労働基準監督署", "phone": "03-5842-2194", "address": "東京都文京区後楽1-9-3", "hours": "平日 8:30-17:15", "services": ["労働相談", "労災申請"]}],
+                "警察署": [{"name": "本富士警察署", "phone": "03-3817-0110", "address": "東京都文京区本郷1-25-3", "hours": "24時間", "services": ["事件事故", "遺失物"]}],
+                "市区町村役所": [{"name": "文京区役所", "phone": "03-3812-7111", "address": "東京都文京区春日1-16-21", "hours": "平日 8:30-17:00", "services": ["住民票", "戸籍"]}],
+                "消防署": [{"name": "本郷消防署", "phone": "03-3815-0119", "address": "東京都文京区本郷1-26-15", "hours": "24時間", "services": ["火災通報", "救急車"]}],
+                "ガス": [{"name": "東京ガス文京支店", "phone": "0570-002211", "address": "東京都文京区後楽2-5-1", "hours": "平日 8:30-19:00", "services": ["ガス開栓", "緊急通報"]}],
+                "電力": [{"name": "東京電力パワーグリッド文京支社", "phone": "0120-995-007", "address": "東京都文京区後楽2-3-10", "hours": "平日 9:00-17:00", "services": ["停電情報", "電気工事"]}],
+                "病院": [{"name": "東京大学医学部附属病院", "phone": "03-3815-5411", "address": "東京都文京区本郷7-3-1", "hours": "24時間救急", "services": ["総合診療", "救急医療"]}],
+                "保健所": [{"name": "文京保健所", "phone": "03-5803-1223", "address": "東京都文京区春日1-16-21", "hours": "平日 8:30-17:00", "services": ["健康相談", "予防接種"]}],
+                "水道": [{"name": "東京都水道局文京営業所", "phone": "03-5326-1105", "address": "東京都文京区後楽2-5-1", "hours": "平日 8:30-17:00", "services": ["水道開栓", "料金"]}],
+                "NTT": [{"name": "NTT東日本東京支店", "phone": "116", "address": "東京都新宿区西新宿3-19-2", "hours": "平日 9:00-17:00", "services": ["電話工事", "故障修理"]}],
+                "下水道": [{"name": "東京都下水道局文京出張所", "phone": "03-5320-6516", "address": "東京都文京区後楽2-5-1", "hours": "平日 8:30-17:15", "services": ["下水道修理", "排水設備"]}]
+            }
+        },
+        "千代田区": {
+            "": {
+                "労基署": [{"name": "中央労働基準監督署", "phone": "03-5547-1879", "address": "東京都中央区築地4-4-12", "hours": "平日 8:30-17:15", "services": ["労働相談", "労災申請"]}],
+                "警察署": [{"name": "丸の内警察署", "phone": "03-3212-0110", "address": "東京都千代田区丸の内2-1-1", "hours": "24時間", "services": ["事件事故", "遺失物"]}],
+                "市区町村役所": [{"name": "千代田区役所", "phone": "03-3264-2111", "address": "東京都千代田区九段南1-2-1", "hours": "平日 8:30-17:00", "services": ["住民票", "戸籍"]}],
+                "消防署": [{"name": "丸の内消防署", "phone": "03-3212-0119", "address": "東京都千代田区大手町1-3-1", "hours": "24時間", "services": ["火災通報", "救急車"]}],
+                "ガス": [{"name": "東京ガス千代田支店", "phone": "0570-002211", "address": "東京都千代田区内幸町2-2-3", "hours": "平日 8:30-19:00", "services": ["ガス開栓", "緊急通報"]}],
+                "電力": [{"name": "東京電力パワーグリッド千代田支社", "phone": "0120-995-007", "address": "東京都千代田区内幸町1-1-3", "hours": "平日 9:00-17:00", "services": ["停電情報", "電気工事"]}],
+                "病院": [{"name": "東京逓信病院", "phone": "03-5214-7111", "address": "東京都千代田区富士見2-14-23", "hours": "24時間救急", "services": ["総合診療", "救急医療"]}],
+                "保健所": [{"name": "千代田保健所", "phone": "03-5211-8161", "address": "東京都千代田区九段南1-6-17", "hours": "平日 8:30-17:00", "services": ["健康相談", "予防接種"]}],
+                "水道": [{"name": "東京都水道局千代田営業所", "phone": "03-5326-1106", "address": "東京都千代田区内幸町2-2-3", "hours": "平日 8:30-17:00", "services": ["水道開栓", "料金"]}],
+                "NTT": [{"name": "NTT東日本東京支店", "phone": "116", "address": "東京都新宿区西新宿3-19-2", "hours": "平日 9:00-17:00", "services": ["電話工事", "故障修理"]}],
+                "下水道": [{"name": "東京都下水道局千代田出張所", "phone": "03-5320-6517", "address": "東京都千代田区内幸町2-2-3", "hours": "平日 8:30-17:15", "services": ["下水道修理", "排水設備"]}]
+            }
+        },
+        "新宿区": {
+            "": {
+                "労基署": [{"name": "新宿労働基準監督署", "phone": "03-3361-3949", "address": "東京都新宿区百人町4-4-1", "hours": "平日 8:30-17:15", "services": ["労働相談", "労災申請"]}],
+                "警察署": [{"name": "新宿警察署", "phone": "03-3346-0110", "address": "東京都新宿区西新宿8-2-13", "hours": "24時間", "services": ["事件事故", "遺失物"]}],
+                "市区町村役所": [
+                    {"name": "新宿区役所", "phone": "03-3209-1111", "address": "東京都新宿区歌舞伎町1-4-1", "hours": "平日 8:30-17:00", "services": ["住民票", "戸籍"]},
+                    {"name": "新宿区環境清掃部", "phone": "03-5273-3318", "address": "東京都新宿区歌舞伎町1-4-1", "hours": "平日 8:30-17:00", "services": ["ごみ収集", "リサイクル", "環境対策"]}
+                ],
+                "消防署": [{"name": "新宿消防署", "phone": "03-3357-0119", "address": "東京都新宿区大久保3-17-3", "hours": "24時間", "services": ["火災通報", "救急車"]}],
+                "ガス": [{"name": "東京ガス新宿支店", "phone": "0570-002211", "address": "東京都新宿区西新宿3-7-1", "hours": "平日 8:30-19:00", "services": ["ガス開栓", "緊急通報"]}],
+                "電力": [{"name": "東京電力パワーグリッド新宿支社", "phone": "0120-995-007", "address": "東京都新宿区西新宿2-4-1", "hours": "平日 9:00-17:00", "services": ["停電情報", "電気工事"]}],
+                "病院": [{"name": "東京医科大学病院", "phone": "03-3342-6111", "address": "東京都新宿区西新宿6-7-1", "hours": "24時間救急", "services": ["総合診療", "救急医療"]}],
+                "保健所": [{"name": "新宿区保健所", "phone": "03-5273-3859", "address": "東京都新宿区歌舞伎町1-4-1", "hours": "平日 8:30-17:00", "services": ["健康相談", "予防接種"]}],
+                "水道": [{"name": "東京都水道局新宿営業所", "phone": "03-5326-1100", "address": "東京都新宿区西新宿2-8-1", "hours": "平日 8:30-17:00", "services": ["水道開栓", "料金"]}],
+                "NTT": [{"name": "NTT東日本東京支店", "phone": "116", "address": "東京都新宿区西新宿3-19-2", "hours": "平日 9:00-17:00", "services": ["電話工事", "故障修理"]}],
+                "下水道": [{"name": "東京都下水道局新宿出張所", "phone": "03-5320-6511", "address": "東京都新宿区西新宿2-8-1", "hours": "平日 8:30-17:15", "services": ["下水道修理", "排水設備"]}]
+            }
+        },
+        "渋谷区": {
+            "": {
+                "労基署": [{"name": "渋谷労働基準監督署", "phone": "03-3780-6501", "address": "東京都渋谷区神南1-3-5", "hours": "平日 8:30-17:15", "services": ["労働相談", "労災申請"]}],
+                "警察署": [
+                    {"name": "渋谷警察署", "phone": "03-3498-0110", "address": "東京都渋谷区渋谷3-8-15", "hours": "24時間", "services": ["事件事故", "遺失物"]},
+                    {"name": "原宿警察署", "phone": "03-3408-0110", "address": "東京都渋谷区神宮前1-4-1", "hours": "24時間", "services": ["事件事故", "遺失物"]},
+                    {"name": "代々木警察署", "phone": "03-3375-0110", "address": "東京都渋谷区代々木2-7-1", "hours": "24時間", "services": ["事件事故", "遺失物"]}
+                ],
+                "市区町村役所": [
+                    {"name": "渋谷区役所", "phone": "03-3463-1211", "address": "東京都渋谷区宇田川町1-1", "hours": "平日 8:30-17:00", "services": ["住民票", "戸籍"]},
+                    {"name": "渋谷区環境対策課", "phone": "03-3463-2749", "address": "東京都渋谷区宇田川町1-1", "hours": "平日 8:30-17:00", "services": ["ごみ収集", "リサイクル", "環境対策"]}
+                ],
+                "消防署": [
+                    {"name": "渋谷消防署", "phone": "03-3464-0119", "address": "東京都渋谷区渋谷1-9-5", "hours": "24時間", "services": ["火災通報", "救急車"]},
+                    {"name": "神宮前出張所", "phone": "03-3401-0119", "address": "東京都渋谷区神宮前2-18-21", "hours": "24時間", "services": ["火災通報", "救急車"]},
+                    {"name": "恵比寿出張所", "phone": "03-3444-0119", "address": "東京都渋谷区恵比寿3-28-6", "hours": "24時間", "services": ["火災通報", "救急車"]}
+                ],
+                "ガス": [{"name": "東京ガス渋谷支店", "phone": "0570-002211", "address": "東京都渋谷区渋谷3-12-18", "hours": "平日 8:30-19:00", "services": ["ガス開栓", "緊急通報"]}],
+                "電力": [{"name": "東京電力パワーグリッド渋谷支社", "phone": "0120-995-007", "address": "東京都渋谷区道玄坂2-10-7", "hours": "平日 9:00-17:00", "services": ["停電情報", "電気工事"]}],
+                "病院": [
+                    {"name": "東京都立広尾病院", "phone": "03-3444-1181", "address": "東京都渋谷区恵比寿2-34-10", "hours": "24時間救急", "services": ["総合診療", "救急医療"]},
+                    {"name": "日本赤十字社医療センター", "phone": "03-3400-1311", "address": "東京都渋谷区広尾4-1-22", "hours": "24時間救急", "services": ["総合診療", "救急医療"]},
+                    {"name": "国立病院機構東京医療センター", "phone": "03-3411-0111", "address": "東京都目黒区東が丘2-5-1", "hours": "24時間救急", "services": ["総合診療", "救急医療"]}
+                ],
+                "保健所": [{"name": "渋谷区保健所", "phone": "03-3463-2416", "address": "東京都渋谷区宇田川町1-1", "hours": "平日 8:30-17:00", "services": ["健康相談", "予防接種"]}],
+                "水道": [{"name": "東京都水道局渋谷営業所", "phone": "03-5326-1101", "address": "東京都渋谷区渋谷1-12-5", "hours": "平日 8:30-17:00", "services": ["水道開栓", "料金"]}],
+                "NTT": [{"name": "NTT東日本東京支店", "phone": "116", "address": "東京都新宿区西新宿3-19-2", "hours": "平日 9:00-17:00", "services": ["電話工事", "故障修理"]}],
+                "下水道": [{"name": "東京都下水道局渋谷出張所", "phone": "03-5320-6512", "address": "東京都渋谷区渋谷1-12-5", "hours": "平日 8:30-17:15", "services": ["下水道修理", "排水設備"]}]
+            }
+        },
+        "中央区": {
+            "": {
+                "労基署": [{"name": "中央労働基準監督署", "phone": "03-5547-1879", "address": "東京都中央区築地4-4-12", "hours": "平日 8:30-17:15", "services": ["労働相談", "労災申請"]}],
+                "警察署": [{"name": "中央警察署", "phone": "03-5651-0110", "address": "東京都中央区日本橋兜町15-1", "hours": "24時間", "services": ["事件事故", "遺失物"]}],
+                "市区町村役所": [{"name": "中央区役所", "phone": "03-3543-0211", "address": "東京都中央区築地1-1-1", "hours": "平日 8:30-17:00", "services": ["住民票", "戸籍"]}],
+                "消防署": [{"name": "中央消防署", "phone": "03-3553-0119", "address": "東京都中央区日本橋兜町10-7", "hours": "24時間", "services": ["火災通報", "救急車"]}],
+                "ガス": [{"name": "東京ガス中央支店", "phone": "0570-002211", "address": "東京都中央区築地2-11-24", "hours": "平日 8:30-19:00", "services": ["ガス開栓", "緊急通報"]}],
+                "電力": [{"name": "東京電力パワーグリッド中央支社", "phone": "0120-995-007", "address": "東京都中央区日本橋2-7-1", "hours": "平日 9:00-17:00", "services": ["停電情報", "電気工事"]}],
+                "病院": [{"name": "聖路加国際病院", "phone": "03-3541-5151", "address": "東京都中央区明石町9-1", "hours": "24時間救急", "services": ["総合診療", "救急医療"]}],
+                "保健所": [{"name": "中央区保健所", "phone": "03-3541-5930", "address": "東京都中央区築地1-1-1", "hours": "平日 8:30-17:00", "services": ["健康相談", "予防接種"]}],
+                "水道": [{"name": "東京都水道局中央営業所", "phone": "03-5326-1102", "address": "東京都中央区日本橋2-1-3", "hours": "平日 8:30-17:00", "services": ["水道開栓", "料金"]}],
+                "NTT": [{"name": "NTT東日本東京支店", "phone": "116", "address": "東京都新宿区西新宿3-19-2", "hours": "平日 9:00-17:00", "services": ["電話工事", "故障修理"]}],
+                "下水道": [{"name": "東京都下水道局中央出張所", "phone": "03-5320-6513", "address": "東京都中央区日本橋2-1-3", "hours": "平日 8:30-17:15", "services": ["下水道修理", "排水設備"]}]
+            }
+        },
+        "江戸川区": {
+            "": {
+                "労基署": [{"name": "亀戸労働基準監督署", "phone": "03-3637-8130", "address": "東京都江東区亀戸2-19-1", "hours": "平日 8:30-17:15", "services": ["労働相談", "労災申請"]}],
+                "警察署": [{"name": "小岩警察署", "phone": "03-3672-0110", "address": "東京都江戸川区南小岩7-25-1", "hours": "24時間", "services": ["事件事故", "遺失物"]}],
+                "市区町村役所": [{"name": "江戸川区役所", "phone": "03-3652-1151", "address": "東京都江戸川区中央1-4-1", "hours": "平日 8:30-17:00", "services": ["住民票", "戸籍"]}],
+                "消防署": [{"name": "小岩消防署", "phone": "03-3657-0119", "address": "東京都江戸川区西小岩1-23-1", "hours": "24時間", "services": ["火災通報", "救急車"]}],
+                "ガス": [{"name": "東京ガス江戸川支店", "phone": "0570-002211", "address": "東京都江戸川区船堀4-1-1", "hours": "平日 8:30-19:00", "services": ["ガス開栓", "緊急通報"]}],
+                "電力": [{"name": "東京電力パワーグリッド江戸川支社", "phone": "0120-995-007", "address": "東京都江戸川区船堀2-1-1", "hours": "平日 9:00-17:00", "services": ["停電情報", "電気工事"]}],
+                "病院": [{"name": "東京臨海病院", "phone": "03-5605-8811", "address": "東京都江戸川区臨海町1-4-2", "hours": "24時間救急", "services": ["総合診療", "救急医療"]}],
+                "保健所": [{"name": "江戸川保健所", "phone": "03-5661-2467", "address": "東京都江戸川区中央1-4-1", "hours": "平日 8:30-17:00", "services": ["健康相談", "予防接種"]}],
+                "水道": [{"name": "東京都水道局江戸川営業所", "phone": "03-5326-1107", "address": "東京都江戸川区船堀4-1-1", "hours": "平日 8:30-17:00", "services": ["水道開栓", "料金"]}],
+                "NTT": [{"name": "NTT東日本東京支店", "phone": "116", "address": "東京都新宿区西新宿3-19-2", "hours": "平日 9:00-17:00", "services": ["電話工事", "故障修理"]}],
+                "下水道": [{"name": "東京都下水道局江戸川出張所", "phone": "03-5320-6518", "address": "東京都江戸川区船堀4-1-1", "hours": "平日 8:30-17:15", "services": ["下水道修理", "排水設備"]}]
+            }
+        },
+        "板橋区": {
+            "": {
+                "労基署": [{"name": "池袋労働基準監督署", "phone": "03-3971-1257", "address": "東京都豊島区東池袋3-5-13", "hours": "平日 8:30-17:15", "services": ["労働相談", "労災申請"]}],
+                "警察署": [{"name": "板橋警察署", "phone": "03-3964-0110", "address": "東京都板橋区仲町14-17", "hours": "24時間", "services": ["事件事故", "遺失物"]}],
+                "市区町村役所": [{"name": "板橋区役所", "phone": "03-3964-1111", "address": "東京都板橋区板橋2-66-1", "hours": "平日 8:30-17:00", "services": ["住民票", "戸籍"]}],
+                "消防署": [{"name": "板橋消防署", "phone": "03-3964-0119", "address": "東京都板橋区板橋1-33-6", "hours": "24時間", "services": ["火災通報", "救急車"]}],
+                "ガス": [{"name": "東京ガス板橋支店", "phone": "0570-002211", "address": "東京都板橋区板橋2-65-6", "hours": "平日 8:30-19:00", "services": ["ガス開栓", "緊急通報"]}],
+                "電力": [{"name": "東京電力パワーグリッド板橋支社", "phone": "0120-995-007", "address": "東京都板橋区板橋3-14-1", "hours": "平日 9:00-17:00", "services": ["停電情報", "電気工事"]}],
+                "病院": [{"name": "日本大学医学部附属板橋病院", "phone": "03-3972-8111", "address": "東京都板橋区大谷口上町30-1", "hours": "24時間救急", "services": ["総合診療", "救急医療"]}],
+                "保健所": [{"name": "板橋区保健所", "phone": "03-3579-2333", "address": "東京都板橋区板橋2-66-1", "hours": "平日 8:30-17:00", "services": ["健康相談", "予防接種"]}],
+                "水道": [{"name": "東京都水道局板橋営業所", "phone": "03-5326-1108", "address": "東京都板橋区板橋2-65-6", "hours": "平日 8:30-17:00", "services": ["水道開栓", "料金"]}],
+                "NTT": [{"name": "NTT東日本東京支店", "phone": "116", "address": "東京都新宿区西新宿3-19-2", "hours": "平日 9:00-17:00", "services": ["電話工事", "故障修理"]}],
+                "下水道": [{"name": "東京都下水道局板橋出張所", "phone": "03-5320-6519", "address": "東京都板橋区板橋2-65-6", "hours": "平日 8:30-17:15", "services": ["下水道修理", "排水設備"]}]
+            }
+        },
+        "葛飾区": {
+            "": {
+                "労基署": [{"name": "亀戸労働基準監督署", "phone": "03-3637-8130", "address": "東京都江東区亀戸2-19-1", "hours": "平日 8:30-17:15", "services": ["労働相談", "労災申請"]}],
+                "警察署": [{"name": "葛飾警察署", "phone": "03-3695-0110", "address": "東京都葛飾区新宿6-1-1", "hours": "24時間", "services": ["事件事故", "遺失物"]}],
+                "市区町村役所": [{"name": "葛飾区役所", "phone": "03-3695-1111", "address": "東京都葛飾区立石5-13-1", "hours": "平日 8:30-17:00", "services": ["住民票", "戸籍"]}],
+                "消防署": [{"name": "本田消防署", "phone": "03-3694-0119", "address": "東京都葛飾区立石8-35-1", "hours": "24時間", "services": ["火災通報", "救急車"]}],
+                "ガス": [{"name": "東京ガス葛飾支店", "phone": "0570-002211", "address": "東京都葛飾区青戸6-1-1", "hours": "平日 8:30-19:00", "services": ["ガス開栓", "緊急通報"]}],
+                "電力": [{"name": "東京電力パワーグリッド葛飾支社", "phone": "0120-995-007", "address": "東京都葛飾区青戸7-2-1", "hours": "平日 9:00-17:00", "services": ["停電情報", "電気工事"]}],
+                "病院": [{"name": "東京慈恵会医科大学葛飾医療センター", "phone": "03-3603-2111", "address": "東京都葛飾区青戸6-41-2", "hours": "24時間救急", "services": ["総合診療", "救急医療"]}],
+                "保健所": [{"name": "葛飾区保健所", "phone": "03-3602-1222", "address": "東京都葛飾区青戸4-15-14", "hours": "平日 8:30-17:00", "services": ["健康相談", "予防接種"]}],
+                "水道": [{"name": "東京都水道局葛飾営業所", "phone": "03-5326-1109", "address": "東京都葛飾区青戸6-1-1", "hours": "平日 8:30-17:00", "services": ["水道開栓", "料金"]}],
+                "NTT": [{"name": "NTT東日本東京支店", "phone": "116", "address": "東京都新宿区西新宿3-19-2", "hours": "平日 9:00-17:00", "services": ["電話工事", "故障修理"]}],
+                "下水道": [{"name": "東京都下水道局葛飾出張所", "phone": "03-5320-6520", "address": "東京都葛飾区青戸6-1-1", "hours": "平日 8:30-17:15", "services": ["下水道修理", "排水設備"]}]
+            }
+        },
+        "北区": {
+            "": {
+                "労基署": [{"name": "池袋労働基準監督署", "phone": "03-3971-1257", "address": "東京都豊島区東池袋3-5-13", "hours": "平日 8:30-17:15", "services": ["労働相談", "労災申請"]}],
+                "警察署": [{"name": "赤羽警察署", "phone": "03-3903-0110", "address": "東京都北区赤羽2-3-22", "hours": "24時間", "services": ["事件事故", "遺失物"]}],
+                "市区町村役所": [{"name": "北区役所", "phone": "03-3908-1111", "address": "東京都北区王子本町1-15-22", "hours": "平日 8:30-17:00", "services": ["住民票", "戸籍"]}],
+                "消防署": [{"name": "赤羽消防署", "phone": "03-3902-0119", "address": "東京都北区赤羽2-5-13", "hours": "24時間", "services": ["火災通報", "救急車"]}],
+                "ガス": [{"name": "東京ガス北区支店", "phone": "0570-002211", "address": "東京都北区王子1-11-1", "hours": "平日 8:30-19:00", "services": ["ガス開栓", "緊急通報"]}],
+                "電力": [{"name": "東京電力パワーグリッド北区支社", "phone": "0120-995-007", "address": "東京都北区王子2-3-5", "hours": "平日 9:00-17:00", "services": ["停電情報", "電気工事"]}],
+                "病院": [{"name": "東京北医療センター", "phone": "03-5390-7000", "address": "東京都北区赤羽台4-17-56", "hours": "24時間救急", "services": ["総合診療", "救急医療"]}],
+                "保健所": [{"name": "北区保健所", "phone": "03-3919-3101", "address": "東京都北区王子本町1-15-22", "hours": "平日 8:30-17:00", "services": ["健康相談", "予防接種"]}],
+                "水道": [{"name": "東京都水道局北区営業所", "phone": "03-5326-1110", "address": "東京都北区王子1-11-1", "hours": "平日 8:30-17:00", "services": ["水道開栓", "料金"]}],
+                "NTT": [{"name": "NTT東日本東京支店", "phone": "116", "address": "東京都新宿区西新宿3-19-2", "hours": "平日 9:00-17:00", "services": ["電話工事", "故障修理"]}],
+                "下水道": [{"name": "東京都下水道局北区出張所", "phone": "03-5320-6521", "address": "東京都北区王子1-11-1", "hours": "平日 8:30-17:15", "services": ["下水道修理", "排水設備"]}]
+            }
+        },
+        "江東区": {
+            "": {
+                "労基署": [{"name": "亀戸労働基準監督署", "phone": "03-3637-8130", "address": "東京都江東区亀戸2-19-1", "hours": "平日 8:30-17:15", "services": ["労働相談", "労災申請"]}],
+                "警察署": [{"name": "深川警察署", "phone": "03-3641-0110", "address": "東京都江東区東陽3-15-15", "hours": "24時間", "services": ["事件事故", "遺失物"]}],
+                "市区町村役所": [{"name": "江東区役所", "phone": "03-3647-9111", "address": "東京都江東区東陽4-11-28", "hours": "平日 8:30-17:00", "services": ["住民票", "戸籍"]}],
+                "消防署": [{"name": "深川消防署", "phone": "03-3643-0119", "address": "東京都江東区永代1-12-1", "hours": "24時間", "services": ["火災通報", "救急車"]}],
+                "ガス": [{"name": "東京ガス江東支店", "phone": "0570-002211", "address": "東京都江東区東陽4-2-8", "hours": "平日 8:30-19:00", "services": ["ガス開栓", "緊急通報"]}],
+                "電力": [{"name": "東京電力パワーグリッド江東支社", "phone": "0120-995-007", "address": "東京都江東区東陽3-1-1", "hours": "平日 9:00-17:00", "services": ["停電情報", "電気工事"]}],
+                "病院": [{"name": "東京都立墨東病院", "phone": "03-3633-6151", "address": "東京都墨田区江東橋4-23-15", "hours": "24時間救急", "services": ["総合診療", "救急医療"]}],
+                "保健所": [{"name": "江東区保健所", "phone": "03-3647-5906", "address": "東京都江東区新砂3-3-3", "hours": "平日 8:30-17:00", "services": ["健康相談", "予防接種"]}],
+                "水道": [{"name": "東京都水道局江東営業所", "phone": "03-5326-1111", "address": "東京都江東区東陽4-2-8", "hours": "平日 8:30-17:00", "services": ["水道開栓", "料金"]}],
+                "NTT": [{"name": "NTT東日本東京支店", "phone": "116", "address": "東京都新宿区西新宿3-19-2", "hours": "平日 9:00-17:00", "services": ["電話工事", "故障修理"]}],
+                "下水道": [{"name": "東京都下水道局江東出張所", "phone": "03-5320-6522", "address": "東京都江東区東陽4-2-8", "hours": "平日 8:30-17:15", "services": ["下水道修理", "排水設備"]}]
+            }
+        },
+        "港区": {
+            "": {
+                "労基署": [{"name": "麻布労働基準監督署", "phone": "03-3408-5773", "address": "東京都港区麻布台1-8-10", "hours": "平日 8:30-17:15", "services": ["労働相談", "労災申請"]}],
+                "警察署": [{"name": "赤坂警察署", "phone": "03-3475-0110", "address": "東京都港区赤坂4-18-19", "hours": "24時間", "services": ["事件事故", "遺失物"]}],
+                "市区町村役所": [{"name": "港区役所", "phone": "03-3578-2111", "address": "東京都港区芝公園1-5-25", "hours": "平日 8:30-17:00", "services": ["住民票", "戸籍"]}],
+                "消防署": [{"name": "赤坂消防署", "phone": "03-3478-0119", "address": "東京都港区赤坂5-4-8", "hours": "24時間", "services": ["火災通報", "救急車"]}],
+                "ガス": [{"name": "東京ガス港支店", "phone": "0570-002211", "address": "東京都港区海岸1-5-20", "hours": "平日 8:30-19:00", "services": ["ガス開栓", "緊急通報"]}],
+                "電力": [{"name": "東京電力パワーグリッド港支社", "phone": "0120-995-007", "address": "東京都港区海岸1-11-1", "hours": "平日 9:00-17:00", "services": ["停電情報", "電気工事"]}],
+                "病院": [{"name": "東京慈恵会医科大学附属病院", "phone": "03-3433-1111", "address": "東京都港区西新橋3-25-8", "hours": "24時間救急", "services": ["総合診療", "救急医療"]}],
+                "保健所": [{"name": "港区保健所", "phone": "03-3455-4461", "address": "東京都港区三田1-4-10", "hours": "平日 8:30-17:00", "services": ["健康相談", "予防接種"]}],
+                "水道": [{"name": "東京都水道局港営業所", "phone": "03-5326-1112", "address": "東京都港区海岸1-5-20", "hours": "平日 8:30-17:00", "services": ["水道開栓", "料金"]}],
+                "NTT": [{"name": "NTT東日本東京支店", "phone": "116", "address": "東京都新宿区西新宿3-19-2", "hours": "平日 9:00-17:00", "services": ["電話工事", "故障修理"]}],
+                "下水道": [{"name": "東京都下水道局港出張所", "phone": "03-5320-6523", "address": "東京都港区海岸1-5-20", "hours": "平日 8:30-17:15", "services": ["下水道修理", "排水設備"]}]
+            }
+        },
+        "目黒区": {
+            "": {
+                "労基署": [{"name": "渋谷労働基準監督署", "phone": "03-3780-6501", "address": "東京都渋谷区神南1-3-5", "hours": "平日 8:30-17:15", "services": ["労働相談", "労災申請"]}],
+                "警察署": [{"name": "目黒警察署", "phone": "03-3710-0110", "address": "東京都目黒区中目黒5-27-8", "hours": "24時間", "services": ["事件事故", "遺失物"]}],
+                "市区町村役所": [{"name": "目黒区役所", "phone": "03-3715-1111", "address": "東京都目黒区上目黒2-19-15", "hours": "平日 8:30-17:00", "services": ["住民票", "戸籍"]}],
+                "消防署": [{"name": "目黒消防署", "phone": "03-3710-0119", "address": "東京都目黒区中央町1-9-7", "hours": "24時間", "services": ["火災通報", "救急車"]}],
+                "ガス": [{"name": "東京ガス目黒支店", "phone": "0570-002211", "address": "東京都目黒区上目黒2-1-1", "hours": "平日 8:30-19:00", "services": ["ガス開栓", "緊急通報"]}],
+                "電力": [{"name": "東京電力パワーグリッド目黒支社", "phone": "0120-995-007", "address": "東京都目黒区上目黒1-5-1", "hours": "平日 9:00-17:00", "services": ["停電情報", "電気工事"]}],
+                "病院": [{"name": "東京共済病院", "phone": "03-3712-3151", "address": "東京都目黒区中目黒2-3-8", "hours": "24時間救急", "services": ["総合診療", "救急医療"]}],
+                "保健所": [{"name": "目黒区保健所", "phone": "03-5722-9503", "address": "東京都目黒区上目黒2-19-15", "hours": "平日 8:30-17:00", "services": ["健康相談", "予防接種"]}],
+                "水道": [{"name": "東京都水道局目黒営業所", "phone": "03-5326-1113", "address": "東京都目黒区上目黒2-1-1", "hours": "平日 8:30-17:00", "services": ["水道開栓", "料金"]}],
+                "NTT": [{"name": "NTT東日本東京支店", "phone": "116", "address": "東京都新宿区西新宿3-19-2", "hours": "平日 9:00-17:00", "services": ["電話工事", "故障修理"]}],
+                "下水道": [{"name": "東京都下水道局目黒出張所", "phone": "03-5320-6524", "address": "東京都目黒区上目黒2-1-1", "hours": "平日 8:30-17:15", "services": ["下水道修理", "排水設備"]}]
+            }
+        },
+        "中野区": {
+            "": {
+                "労基署": [{"name": "新宿労働基準監督署", "phone": "03-3361-3949", "address": "東京都新宿区百人町4-4-1", "hours": "平日 8:30-17:15", "services": ["労働相談", "労災申請"]}],
+                "警察署": [{"name": "中野警察署", "phone": "03-3366-0110", "address": "東京都中野区中野4-11-32", "hours": "24時間", "services": ["事件事故", "遺失物"]}],
+                "市区町村役所": [{"name": "中野区役所", "phone": "03-3389-1111", "address": "東京都中野区中野4-8-1", "hours": "平日 8:30-17:00", "services": ["住民票", "戸籍"]}],
+                "消防署": [{"name": "中野消防署", "phone": "03-3366-0119", "address": "東京都中野区中野4-17-12", "hours": "24時間", "services": ["火災通報", "救急車"]}],
+                "ガス": [{"name": "東京ガス中野支店", "phone": "0570-002211", "address": "東京都中野区中野3-34-28", "hours": "平日 8:30-19:00", "services": ["ガス開栓", "緊急通報"]}],
+                "電力": [{"name": "東京電力パワーグリッド中野支社", "phone": "0120-995-007", "address": "東京都中野区中野4-9-1", "hours": "平日 9:00-17:00", "services": ["停電情報", "電気工事"]}],
+                "病院": [{"name": "東京警察病院", "phone": "03-5343-5611", "address": "東京都中野区中野4-22-1", "hours": "24時間救急", "services": ["総合診療", "救急医療"]}],
+                "保健所": [{"name": "中野区保健所", "phone": "03-3382-6500", "address": "東京都中野区中野2-17-4", "hours": "平日 8:30-17:00", "services": ["健康相談", "予防接種"]}],
+                "水道": [{"name": "東京都水道局中野営業所", "phone": "03-5326-1114", "address": "東京都中野区中野3-34-28", "hours": "平日 8:30-17:00", "services": ["水道開栓", "料金"]}],
+                "NTT": [{"name": "NTT東日本東京支店", "phone": "116", "address": "東京都新宿区西新宿3-19-2", "hours": "平日 9:00-17:00", "services": ["電話工事", "故障修理"]}],
+                "下水道": [{"name": "東京都下水道局中野出張所", "phone": "03-5320-6525", "address": "東京都中野区中野3-34-28", "hours": "平日 8:30-17:15", "services": ["下水道修理", "排水設備"]}]
+            }
+        },
+        "練馬区": {
+            "": {
+                "労基署": [{"name": "池袋労働基準監督署", "phone": "03-3971-1257", "address": "東京都豊島区東池袋3-5-13", "hours": "平日 8:30-17:15", "services": ["労働相談", "労災申請"]}],
+                "警察署": [
+                    {"name": "石神井警察署", "phone": "03-3904-0110", "address": "東京都練馬区石神井町2-15-13", "hours": "24時間", "services": ["事件事故", "遺失物"]},
+                    {"name": "練馬警察署", "phone": "03-3994-0110", "address": "東京都練馬区豊玉北5-3-15", "hours": "24時間", "services": ["事件事故", "遺失物"]},
+                    {"name": "光が丘警察署", "phone": "03-5998-0110", "address": "東京都練馬区光が丘2-9-7", "hours": "24時間", "services": ["事件事故", "遺失物"]}
+                ],
+                "市区町村役所": [
+                    {"name": "練馬区役所", "phone": "03-3993-1111", "address": "東京都練馬区豊玉北6-12-1", "hours": "平日 8:30-17:00", "services": ["住民票", "戸籍"]},
+                    {"name": "練馬区環境清掃課", "phone": "03-5984-1059", "address": "東京都練馬区豊玉北6-12-1", "hours": "平日 8:30-17:00", "services": ["ごみ収集", "リサイクル", "環境対策"]}
+                ],
+                "消防署": [{"name": "練馬消防署", "phone": "03-3994-0119", "address": "東京都練馬区豊玉北5-4-1", "hours": "24時間", "services": ["火災通報", "救急車"]}],
+                "ガス": [{"name": "東京ガス練馬支店", "phone": "0570-002211", "address": "東京都練馬区豊玉北6-8-1", "hours": "平日 8:30-19:00", "services": ["ガス開栓", "緊急通報"]}],
+                "電力": [{"name": "東京電力パワーグリッド練馬支社", "phone": "0120-995-007", "address": "東京都練馬区豊玉北5-17-12", "hours": "平日 9:00-17:00", "services": ["停電情報", "電気工事"]}],
+                "病院": [{"name": "順天堂大学医学部附属練馬病院", "phone": "03-5923-3111", "address": "東京都練馬区高野台3-1-10", "hours": "24時間救急", "services": ["総合診療", "救急医療"]}],
+                "保健所": [{"name": "練馬区保健所", "phone": "03-5984-2484", "address": "東京都練馬区豊玉北6-12-1", "hours": "平日 8:30-17:00", "services": ["健康相談", "予防接種"]}],
+                "水道": [{"name": "東京都水道局練馬営業所", "phone": "03-5326-1115", "address": "東京都練馬区豊玉北6-8-1", "hours": "平日 8:30-17:00", "services": ["水道開栓", "料金"]}],
+                "NTT": [{"name": "NTT東日本東京支店", "phone": "116", "address": "東京都新宿区西新宿3-19-2", "hours": "平日 9:00-17:00", "services": ["電話工事", "故障修理"]}],
+                "下水道": [{"name": "東京都下水道局練馬出張所", "phone": "03-5320-6526", "address": "東京都練馬区豊玉北6-8-1", "hours": "平日 8:30-17:15", "services": ["下水道修理", "排水設備"]}]
+            }
+        },
+        "大田区": {
+            "": {
+                "労基署": [{"name": "蒲田労働基準監督署", "phone": "03-3732-0174", "address": "東京都大田区蒲田5-40-3", "hours": "平日 8:30-17:15", "services": ["労働相談", "労災申請"]}],
+                "警察署": [{"name": "蒲田警察署", "phone": "03-3731-0110", "address": "東京都大田区蒲田本町2-1-1", "hours": "24時間", "services": ["事件事故", "遺失物"]}],
+                "市区町村役所": [{"name": "大田区役所", "phone": "03-5744-1111", "address": "東京都大田区蒲田5-13-14", "hours": "平日 8:30-17:00", "services": ["住民票", "戸籍"]}],
+                "消防署": [{"name": "蒲田消防署", "phone": "03-3731-0119", "address": "東京都大田区蒲田本町2-3-3", "hours": "24時間", "services": ["火災通報", "救急車"]}],
+                "ガス": [{"name": "東京ガス大田支店", "phone": "0570-002211", "address": "東京都大田区蒲田5-37-1", "hours": "平日 8:30-19:00", "services": ["ガス開栓", "緊急通報"]}],
+                "電力": [{"name": "東京電力パワーグリッド大田支社", "phone": "0120-995-007", "address": "東京都大田区蒲田4-10-14", "hours": "平日 9:00-17:00", "services": ["停電情報", "電気工事"]}],
+                "病院": [{"name": "東邦大学医療センター大森病院", "phone": "03-3762-4151", "address": "東京都大田区大森西6-11-1", "hours": "24時間救急", "services": ["総合診療", "救急医療"]}],
+                "保健所": [{"name": "大田区保健所", "phone": "03-5744-1263", "address": "東京都大田区蒲田5-13-14", "hours": "平日 8:30-17:00", "services": ["健康相談", "予防接種"]}],
+                "水道": [{"name": "東京都水道局大田営業所", "phone": "03-5326-1116", "address": "東京都大田区蒲田5-37-1", "hours": "平日 8:30-17:00", "services": ["水道開栓", "料金"]}],
+                "NTT": [{"name": "NTT東日本東京支店", "phone": "116", "address": "東京都新宿区西新宿3-19-2", "hours": "平日 9:00-17:00", "services": ["電話工事", "故障修理"]}],
+                "下水道": [{"name": "東京都下水道局大田出張所", "phone": "03-5320-6527", "address": "東京都大田区蒲田5-37-1", "hours": "平日 8:30-17:15", "services": ["下水道修理", "排水設備"]}]
+            }
+        },
+        "世田谷区": {
+            "": {
+                "労基署": [{"name": "三田労働基準監督署", "phone": "03-3452-5473", "address": "東京都港区芝5-35-2", "hours": "平日 8:30-17:15", "services": ["労働相談", "労災申請"]}],
+                "警察署": [{"name": "世田谷警察署", "phone": "03-3418-0110", "address": "東京都世田谷区三軒茶屋2-4-4", "hours": "24時間", "services": ["事件事故", "遺失物"]}],
+                "市区町村役所": [{"name": "世田谷区役所", "phone": "03-5432-1111", "address": "東京都世田谷区世田谷4-21-27", "hours": "平日 8:30-17:00", "services": ["住民票", "戸籍"]}],
+                "消防署": [{"name": "世田谷消防署", "phone": "03-3418-0119", "address": "東京都世田谷区三軒茶屋2-33-21", "hours": "24時間", "services": ["火災通報", "救急車"]}],
+                "ガス": [{"name": "東京ガス世田谷支店", "phone": "0570-002211", "address": "東京都世田谷区用賀4-10-1", "hours": "平日 8:30-19:00", "services": ["ガス開栓", "緊急通報"]}],
+                "電力": [{"name": "東京電力パワーグリッド世田谷支社", "phone": "0120-995-007", "address": "東京都世田谷区用賀2-27-5", "hours": "平日 9:00-17:00", "services": ["停電情報", "電気工事"]}],
+                "病院": [{"name": "国立成育医療研究センター", "phone": "03-3416-0181", "address": "東京都世田谷区大蔵2-10-1", "hours": "24時間救急", "services": ["総合診療", "救急医療"]}],
+                "保健所": [{"name": "世田谷保健所", "phone": "03-5432-2893", "address": "東京都世田谷区世田谷4-22-35", "hours": "平日 8:30-17:00", "services": ["健康相談", "予防接種"]}],
+                "水道": [{"name": "東京都水道局世田谷営業所", "phone": "03-5326-1117", "address": "東京都世田谷区用賀4-10-1", "hours": "平日 8:30-17:00", "services": ["水道開栓", "料金"]}],
+                "NTT": [{"name": "NTT東日本東京支店", "phone": "116", "address": "東京都新宿区西新宿3-19-2", "hours": "平日 9:00-17:00", "services": ["電話工事", "故障修理"]}],
+                "下水道": [{"name": "東京都下水道局世田谷出張所", "phone": "03-5320-6528", "address": "東京都世田谷区用賀4-10-1", "hours": "平日 8:30-17:15", "services": ["下水道修理", "排水設備"]}]
+            }
+        },
+        "品川区": {
+            "": {
+                "労基署": [{"name": "三田労働基準監督署", "phone": "03-3452-5473", "address": "東京都港区芝5-35-2", "hours": "平日 8:30-17:15", "services": ["労働相談", "労災申請"]}],
+                "警察署": [{"name": "大井警察署", "phone": "03-3778-0110", "address": "東京都品川区大井1-2-1", "hours": "24時間", "services": ["事件事故", "遺失物"]}],
+                "市区町村役所": [{"name": "品川区役所", "phone": "03-3777-1111", "address": "東京都品川区広町2-1-36", "hours": "平日 8:30-17:00", "services": ["住民票", "戸籍"]}],
+                "消防署": [{"name": "大井消防署", "phone": "03-3778-0119", "address": "東京都品川区大井1-3-1", "hours": "24時間", "services": ["火災通報", "救急車"]}],
+                "ガス": [{"name": "東京ガス品川支店", "phone": "0570-002211", "address": "東京都品川区大井1-49-12", "hours": "平日 8:30-19:00", "services": ["ガス開栓", "緊急通報"]}],
+                "電力": [{"name": "東京電力パワーグリッド品川支社", "phone": "0120-995-007", "address": "東京都品川区大井1-47-1", "hours": "平日 9:00-17:00", "services": ["停電情報", "電気工事"]}],
+                "病院": [{"name": "昭和大学病院", "phone": "03-3784-8000", "address": "東京都品川区旗の台1-5-8", "hours": "24時間救急", "services": ["総合診療", "救急医療"]}],
+                "保健所": [{"name": "品川区保健所", "phone": "03-5742-6101", "address": "東京都品川区広町2-1-36", "hours": "平日 8:30-17:00", "services": ["健康相談", "予防接種"]}],
+                "水道": [{"name": "東京都水道局品川営業所", "phone": "03-5326-1118", "address": "東京都品川区大井1-49-12", "hours": "平日 8:30-17:00", "services": ["水道開栓", "料金"]}],
+                "NTT": [{"name": "NTT東日本東京支店", "phone": "116", "address": "東京都新宿区西新宿3-19-2", "hours": "平日 9:00-17:00", "services": ["電話工事", "故障修理"]}],
+                "下水道": [{"name": "東京都下水道局品川出張所", "phone": "03-5320-6529", "address": "東京都品川区大井1-49-12", "hours": "平日 8:30-17:15", "services": ["下水道修理", "排水設備"]}]
+            }
+        },
+        "杉並区": {
+            "": {
+                "労基署": [{"name": "新宿労働基準監督署", "phone": "03-3361-3949", "address": "東京都新宿区百人町4-4-1", "hours": "平日 8:30-17:15", "services": ["労働相談", "労災申請"]}],
+                "警察署": [{"name": "杉並警察署", "phone": "03-3314-0110", "address": "東京都杉並区成田東5-38-16", "hours": "24時間", "services": ["事件事故", "遺失物"]}],
+                "市区町村役所": [{"name": "杉並区役所", "phone": "03-3312-2111", "address": "東京都杉並区阿佐谷南1-15-1", "hours": "平日 8:30-17:00", "services": ["住民票", "戸籍"]}],
+                "消防署": [{"name": "杉並消防署", "phone": "03-3393-0119", "address": "東京都杉並区阿佐谷南3-4-62", "hours": "24時間", "services": ["火災通報", "救急車"]}],
+                "ガス": [{"name": "東京ガス杉並支店", "phone": "0570-002211", "address": "東京都杉並区高円寺北2-3-4", "hours": "平日 8:30-19:00", "services": ["ガス開栓", "緊急通報"]}],
+                "電力": [{"name": "東京電力パワーグリッド杉並支社", "phone": "0120-995-007", "address": "東京都杉並区高円寺北3-22-18", "hours": "平日 9:00-17:00", "services": ["停電情報", "電気工事"]}],
+                "病院": [{"name": "杏林大学医学部付属病院", "phone": "0422-47-5511", "address": "東京都三鷹市新川6-20-2", "hours": "24時間救急", "services": ["総合診療", "救急医療"]}],
+                "保健所": [{"name": "杉並保健所", "phone": "03-3391-1025", "address": "東京都杉並区荻窪5-20-1", "hours": "平日 8:30-17:00", "services": ["健康相談", "予防接種"]}],
+                "水道": [{"name": "東京都水道局杉並営業所", "phone": "03-5326-1119", "address": "東京都杉並区高円寺北2-3-4", "hours": "平日 8:30-17:00", "services": ["水道開栓", "料金"]}],
+                "NTT": [{"name": "NTT東日本東京支店", "phone": "116", "address": "東京都新宿区西新宿3-19-2", "hours": "平日 9:00-17:00", "services": ["電話工事", "故障修理"]}],
+                "下水道": [{"name": "東京都下水道局杉並出張所", "phone": "03-5320-6530", "address": "東京都杉並区高円寺北2-3-4", "hours": "平日 8:30-17:15", "services": ["下水道修理", "排水設備"]}]
+            }
+        },
+        "墨田区": {
+            "": {
+                "労基署": [{"name": "亀戸労働基準監督署", "phone": "03-3637-8130", "address": "東京都江東区亀戸2-19-1", "hours": "平日 8:30-17:15", "services": ["労働相談", "労災申請"]}],
+                "警察署": [{"name": "本所警察署", "phone": "03-3622-0110", "address": "東京都墨田区業平1-5-1", "hours": "24時間", "services": ["事件事故", "遺失物"]}],
+                "市区町村役所": [{"name": "墨田区役所", "phone": "03-5608-1111", "address": "東京都墨田区吾妻橋1-23-20", "hours": "平日 8:30-17:00", "services": ["住民票", "戸籍"]}],
+                "消防署": [{"name": "本所消防署", "phone": "03-3622-0119", "address": "東京都墨田区横川4-6-6", "hours": "24時間", "services": ["火災通報", "救急車"]}],
+                "ガス": [{"name": "東京ガス墨田支店", "phone": "0570-002211", "address": "東京都墨田区錦糸1-2-1", "hours": "平日 8:30-19:00", "services": ["ガス開栓", "緊急通報"]}],
+                "電力": [{"name": "東京電力パワーグリッド墨田支社", "phone": "0120-995-007", "address": "東京都墨田区業平1-1-14", "hours": "平日 9:00-17:00", "services": ["停電情報", "電気工事"]}],
+                "病院": [{"name": "東京都立墨東病院", "phone": "03-3633-6151", "address": "東京都墨田区江東橋4-23-15", "hours": "24時間救急", "services": ["総合診療", "救急医療"]}],
+                "保健所": [{"name": "墨田区保健所", "phone": "03-5608-1333", "address": "東京都墨田区吾妻橋1-23-20", "hours": "平日 8:30-17:00", "services": ["健康相談", "予防接種"]}],
+                "水道": [{"name": "東京都水道局墨田営業所", "phone": "03-5326-1120", "address": "東京都墨田区錦糸1-2-1", "hours": "平日 8:30-17:00", "services": ["水道開栓", "料金"]}],
+                "NTT": [{"name": "NTT東日本東京支店", "phone": "116", "address": "東京都新宿区西新宿3-19-2", "hours": "平日 9:00-17:00", "services": ["電話工事", "故障修理"]}],
+                "下水道": [{"name": "東京都下水道局墨田出張所", "phone": "03-5320-6531", "address": "東京都墨田区錦糸1-2-1", "hours": "平日 8:30-17:15", "services": ["下水道修理", "排水設備"]}]
+            }
+        },
+        "台東区": {
+            "": {
+                "労基署": [{"name": "上野労働基準監督署", "phone": "03-6872-1230", "address": "東京都台東区東上野4-8-1", "hours": "平日 8:30-17:15", "services": ["労働相談", "労災申請"]}],
+                "警察署": [{"name": "上野警察署", "phone": "03-3847-0110", "address": "東京都台東区東上野4-2-1", "hours": "24時間", "services": ["事件事故", "遺失物"]}],
+                "市区町村役所": [{"name": "台東区役所", "phone": "03-5246-1111", "address": "東京都台東区東上野4-5-6", "hours": "平日 8:30-17:00", "services": ["住民票", "戸籍"]}],
+                "消防署": [{"name": "上野消防署", "phone": "03-3841-0119", "address": "東京都台東区東上野5-2-9", "hours": "24時間", "services": ["火災通報", "救急車"]}],
+                "ガス": [{"name": "東京ガス台東支店", "phone": "0570-002211", "address": "東京都台東区上野3-24-6", "hours": "平日 8:30-19:00", "services": ["ガス開栓", "緊急通報"]}],
+                "電力": [{"name": "東京電力パワーグリッド台東支社", "phone": "0120-995-007", "address": "東京都台東区上野1-9-3", "hours": "平日 9:00-17:00", "services": ["停電情報", "電気工事"]}],
+                "病院": [{"name": "東京大学医学部附属病院", "phone": "03-3815-5411", "address": "東京都文京区本郷7-3-1", "hours": "24時間救急", "services": ["総合診療", "救急医療"]}],
+                "保健所": [{"name": "台東保健所", "phone": "03-3847-9405", "address": "東京都台東区東上野4-22-8", "hours": "平日 8:30-17:00", "services": ["健康相談", "予防接種"]}],
+                "水道": [{"name": "東京都水道局台東営業所", "phone": "03-5326-1121", "address": "東京都台東区上野3-24-6", "hours": "平日 8:30-17:00", "services": ["水道開栓", "料金"]}],
+                "NTT": [{"name": "NTT東日本東京支店", "phone": "116", "address": "東京都新宿区西新宿3-19-2", "hours": "平日 9:00-17:00", "services": ["電話工事", "故障修理"]}],
+                "下水道": [{"name": "東京都下水道局台東出張所", "phone": "03-5320-6532", "address": "東京都台東区上野3-24-6", "hours": "平日 8:30-17:15", "services": ["下水道修理", "排水設備"]}]
+            }
+        },
+        "豊島区": {
+            "": {
+                "労基署": [{"name": "池袋労働基準監督署", "phone": "03-3971-1257", "address": "東京都豊島区東池袋3-5-13", "hours": "平日 8:30-17:15", "services": ["労働相談", "労災申請"]}],
+                "警察署": [{"name": "池袋警察署", "phone": "03-3986-0110", "address": "東京都豊島区東池袋3-19-1", "hours": "24時間", "services": ["事件事故", "遺失物"]}],
+                "市区町村役所": [{"name": "豊島区役所", "phone": "03-3981-1111", "address": "東京都豊島区南池袋2-45-1", "hours": "平日 8:30-17:00", "services": ["住民票", "戸籍"]}],
+                "消防署": [{"name": "池袋消防署", "phone": "03-3985-0119", "address": "東京都豊島区上池袋1-7-19", "hours": "24時間", "services": ["火災通報", "救急車"]}],
+                "ガス": [{"name": "東京ガス豊島支店", "phone": "0570-002211", "address": "東京都豊島区南池袋3-13-10", "hours": "平日 8:30-19:00", "services": ["ガス開栓", "緊急通報"]}],
+                "電力": [{"name": "東京電力パワーグリッド豊島支社", "phone": "0120-995-007", "address": "東京都豊島区東池袋1-53-1", "hours": "平日 9:00-17:00", "services": ["停電情報", "電気工事"]}],
+                "病院": [{"name": "東京都立大塚病院", "phone": "03-3941-3211", "address": "東京都豊島区南大塚2-8-1", "hours": "24時間救急", "services": ["総合診療", "救急医療"]}],
+                "保健所": [{"name": "池袋保健所", "phone": "03-3987-4174", "address": "東京都豊島区東池袋4-42-16", "hours": "平日 8:30-17:00", "services": ["健康相談", "予防接種"]}],
+                "水道": [{"name": "東京都水道局豊島営業所", "phone": "03-5326-1122", "address": "東京都豊島区南池袋3-13-10", "hours": "平日 8:30-17:00", "services": ["水道開栓", "料金"]}],
+                "NTT": [{"name": "NTT東日本東京支店", "phone": "116", "address": "東京都新宿区西新宿3-19-2", "hours": "平日 9:00-17:00", "services": ["電話工事", "故障修理"]}],
+                "下水道": [{"name": "東京都下水道局豊島出張所", "phone": "03-5320-6533", "address": "東京都豊島区南池袋3-13-10", "hours": "平日 8:30-17:15", "services": ["下水道修理", "排水設備"]}]
+            }
+        },
+        "八王子市": {
+            "": {
+                "労基署": [{"name": "八王子労働基準監督署", "phone": "042-680-8752", "address": "東京都八王子市明神町3-8-10", "hours": "平日 8:30-17:15", "services": ["労働相談", "労災申請"]}],
+                "警察署": [{"name": "八王子警察署", "phone": "042-621-0110", "address": "東京都八王子市明神町4-7-1", "hours": "24時間", "services": ["事件事故", "遺失物"]}],
+                "市区町村役所": [
+                    {"name": "八王子市役所", "phone": "042-626-3111", "address": "東京都八王子市元本郷町3-24-1", "hours": "平日 8:30-17:00", "services": ["住民票", "戸籍"]},
+                    {"name": "八王子市環境部", "phone": "042-620-7256", "address": "東京都八王子市元本郷町3-24-1", "hours": "平日 8:30-17:00", "services": ["ごみ収集", "リサイクル", "環境対策"]}
+                ],
+                "消防署": [{"name": "八王子消防署", "phone": "042-625-0119", "address": "東京都八王子市旭町12-1", "hours": "24時間", "services": ["火災通報", "救急車"]}],
+                "ガス": [{"name": "東京ガス八王子支店", "phone": "0570-002211", "address": "東京都八王子市旭町9-1", "hours": "平日 8:30-19:00", "services": ["ガス開栓", "緊急通報"]}],
+                "電力": [{"name": "東京電力パワーグリッド八王子支社", "phone": "0120-995-007", "address": "東京都八王子市旭町9-1", "hours": "平日 9:00-17:00", "services": ["停電情報", "電気工事"]}],
+                "病院": [{"name": "東京医科大学八王子医療センター", "phone": "042-665-5611", "address": "東京都八王子市館町1163", "hours": "24時間救急", "services": ["総合診療", "救急医療"]}],
+                "保健所": [{"name": "南多摩保健所", "phone": "042-371-7661", "address": "東京都多摩市関戸4-19-5", "hours": "平日 9:00-17:00", "services": ["健康相談", "予防接種"]}],
+                "水道": [{"name": "東京都水道局多摩お客さまセンター", "phone": "0570-091-100", "address": "東京都立川市錦町6-3-1", "hours": "平日 8:30-20:00", "services": ["水道開栓", "料金"]}],
+                "NTT": [{"name": "NTT東日本東京支店", "phone": "116", "address": "東京都新宿区西新宿3-19-2", "hours": "平日 9:00-17:00", "services": ["電話工事", "故障修理"]}],
+                "下水道": [{"name": "東京都下水道局八王子管理事務所", "phone": "042-645-4031", "address": "東京都八王子市北野町596-2", "hours": "平日 8:30-17:15", "services": ["下水道修理", "排水設備"]}]
+            }
+        },
+        "立川市": {
+            "": {
+                "労基署": [{"name": "立川労働基準監督署", "phone": "042-523-4472", "address": "東京都立川市緑町4-2", "hours": "平日 8:30-17:15", "services": ["労働相談", "労災申請"]}],
+                "警察署": [{"name": "立川警察署", "phone": "042-527-0110", "address": "東京都立川市緑町3213-2", "hours": "24時間", "services": ["事件事故", "遺失物"]}],
+                "市区町村役所": [
+                    {"name": "立川市役所", "phone": "042-523-2111", "address": "東京都立川市泉町1156-9", "hours": "平日 8:30-17:00", "services": ["住民票", "戸籍"]},
+                    {"name": "立川市環境下水道部", "phone": "042-523-2111", "address": "東京都立川市泉町1156-9", "hours": "平日 8:30-17:00", "services": ["ごみ収集", "リサイクル", "環境対策"]}
+                ],
+                "消防署": [{"name": "立川消防署", "phone": "042-526-0119", "address": "東京都立川市緑町3212", "hours": "24時間", "services": ["火災通報", "救急車"]}],
+                "ガス": [{"name": "東京ガス立川支店", "phone": "0570-002211", "address": "東京都立川市曙町2-22-20", "hours": "平日 8:30-19:00", "services": ["ガス開栓", "緊急通報"]}],
+                "電力": [{"name": "東京電力パワーグリッド立川支社", "phone": "0120-995-007", "address": "東京都立川市曙町2-22-20", "hours": "平日 9:00-17:00", "services": ["停電情報", "電気工事"]}],
+                "病院": [{"name": "立川病院", "phone": "042-523-3131", "address": "東京都立川市錦町4-2-22", "hours": "24時間救急", "services": ["総合診療", "救急医療"]}],
+                "保健所": [{"name": "南多摩保健所", "phone": "042-371-7661", "address": "東京都多摩市関戸4-19-5", "hours": "平日 9:00-17:00", "services": ["健康相談", "予防接種"]}],
+                "水道": [{"name": "東京都水道局多摩お客さまセンター", "phone": "0570-091-100", "address": "東京都立川市錦町6-3-1", "hours": "平日 8:30-20:00", "services": ["水道開栓", "料金"]}],
+                "NTT": [{"name": "NTT東日本東京支店", "phone": "116", "address": "東京都新宿区西新宿3-19-2", "hours": "平日 9:00-17:00", "services": ["電話工事", "故障修理"]}],
+                "下水道": [{"name": "東京都下水道局北多摩一号水再生センター", "phone": "042-524-3393", "address": "東京都府中市小柳町6-600", "hours": "平日 8:30-17:15", "services": ["下水道修理", "排水設備"]}]
+            }
+        },
+        "武蔵野市": {
+            "": {
+                "労基署": [{"name": "三鷹労働基準監督署", "phone": "0422-49-1311", "address": "東京都三鷹市下連雀1-12-18", "hours": "平日 8:30-17:15", "services": ["労働相談", "労災申請"]}],
+                "警察署": [{"name": "武蔵野警察署", "phone": "0422-55-0110", "address": "東京都武蔵野市境2-10-5", "hours": "24時間", "services": ["事件事故", "遺失物"]}],
+                "市区町村役所": [
+                    {"name": "武蔵野市役所", "phone": "0422-51-5131", "address": "東京都武蔵野市緑町2-2-28", "hours": "平日 8:30-17:00", "services": ["住民票", "戸籍"]},
+                    {"name": "武蔵野市環境部", "phone": "0422-60-1841", "address": "東京都武蔵野市緑町2-2-28", "hours": "平日 8:30-17:00", "services": ["ごみ収集", "リサイクル", "環境対策"]}
+                ],
+                "消防署": [{"name": "武蔵野消防署", "phone": "0422-51-0119", "address": "東京都武蔵野市吉祥寺本町2-10-5", "hours": "24時間", "services": ["火災通報", "救急車"]}],
+                "ガス": [{"name": "東京ガス武蔵野支店", "phone": "0570-002211", "address": "東京都武蔵野市吉祥寺本町1-10-7", "hours": "平日 8:30-19:00", "services": ["ガス開栓", "緊急通報"]}],
+                "電力": [{"name": "東京電力パワーグリッド武蔵野支社", "phone": "0120-995-007", "address": "東京都武蔵野市吉祥寺本町1-10-7", "hours": "平日 9:00-17:00", "services": ["停電情報", "電気工事"]}],
+                "病院": [{"name": "武蔵野赤十字病院", "phone": "0422-32-3111", "address": "東京都武蔵野市境南町1-26-1", "hours": "24時間救急", "services": ["総合診療", "救急医療"]}],
+                "保健所": [{"name": "多摩府中保健所", "phone": "042-362-2334", "address": "東京都府中市宮西町1-26-1", "hours": "平日 9:00-17:00", "services": ["健康相談", "予防接種"]}],
+                "水道": [{"name": "東京都水道局多摩お客さまセンター", "phone": "0570-091-100", "address": "東京都立川市錦町6-3-1", "hours": "平日 8:30-20:00", "services": ["水道開栓", "料金"]}],
+                "NTT": [{"name": "NTT東日本東京支店", "phone": "116", "address": "東京都新宿区西新宿3-19-2", "hours": "平日 9:00-17:00", "services": ["電話工事", "故障修理"]}],
+                "下水道": [{"name": "東京都下水道局北多摩一号水再生センター", "phone": "042-524-3393", "address": "東京都府中市小柳町6-600", "hours": "平日 8:30-17:15", "services": ["下水道修理", "排水設備"]}]
+            }
+        },
+        "三鷹市": {
+            "": {
+                "労基署": [{"name": "三鷹労働基準監督署", "phone": "0422-49-1311", "address": "東京都三鷹市下連雀1-12-18", "hours": "平日 8:30-17:15", "services": ["労働相談", "労災申請"]}],
+                "警察署": [{"name": "三鷹警察署", "phone": "0422-49-0110", "address": "東京都三鷹市下連雀1-12-14", "hours": "24時間", "services": ["事件事故", "遺失物"]}],
+                "市区町村役所": [
+                    {"name": "三鷹市役所", "phone": "0422-45-1151", "address": "東京都三鷹市野崎1-1-1", "hours": "平日 8:30-17:00", "services": ["住民票", "戸籍"]},
+                    {"name": "三鷹市環境政策課", "phone": "0422-45-1151", "address": "東京都三鷹市野崎1-1-1", "hours": "平日 8:30-17:00", "services": ["ごみ収集", "リサイクル", "環境対策"]}
+                ],
+                "消防署": [{"name": "三鷹消防署", "phone": "0422-47-0119", "address": "東京都三鷹市下連雀2-9-5", "hours": "24時間", "services": ["火災通報", "救急車"]}],
+                "ガス": [{"name": "東京ガス三鷹支店", "phone": "0570-002211", "address": "東京都三鷹市下連雀3-44-4", "hours": "平日 8:30-19:00", "services": ["ガス開栓", "緊急通報"]}],
+                "電力": [{"name": "東京電力パワーグリッド三鷹支社", "phone": "0120-995-007", "address": "東京都三鷹市下連雀3-44-4", "hours": "平日 9:00-17:00", "services": ["停電情報", "電気工事"]}],
+                "病院": [{"name": "杏林大学医学部付属病院", "phone": "0422-47-5511", "address": "東京都三鷹市新川6-20-2", "hours": "24時間救急", "services": ["総合診療", "救急医療"]}],
+                "保健所": [{"name": "多摩府中保健所", "phone": "042-362-2334", "address": "東京都府中市宮西町1-26-1", "hours": "平日 9:00-17:00", "services": ["健康相談", "予防接種"]}],
+                "水道": [{"name": "東京都水道局多摩お客さまセンター", "phone": "0570-091-100", "address": "東京都立川市錦町6-3-1", "hours": "平日 8:30-20:00", "services": ["水道開栓", "料金"]}],
+                "NTT": [{"name": "NTT東日本東京支店", "phone": "116", "address": "東京都新宿区西新宿3-19-2", "hours": "平日 9:00-17:00", "services": ["電話工事", "故障修理"]}],
+                "下水道": [{"name": "東京都下水道局北多摩一号水再生センター", "phone": "042-524-3393", "address": "東京都府中市小柳町6-600", "hours": "平日 8:30-17:15", "services": ["下水道修理", "排水設備"]}]
+            }
+        },
+        "青梅市": {
+            "": {
+                "労基署": [{"name": "青梅労働基準監督署", "phone": "0428-22-0285", "address": "東京都青梅市東青梅2-6-2", "hours": "平日 8:30-17:15", "services": ["労働相談", "労災申請"]}],
+                "警察署": [{"name": "青梅警察署", "phone": "0428-22-0110", "address": "東京都青梅市東青梅1-13-2", "hours": "24時間", "services": ["事件事故", "遺失物"]}],
+                "市区町村役所": [
+                    {"name": "青梅市役所", "phone": "0428-22-1111", "address": "東京都青梅市東青梅1-11-1", "hours": "平日 8:30-17:00", "services": ["住民票", "戸籍"]},
+                    {"name": "青梅市環境部", "phone": "0428-22-1111", "address": "東京都青梅市東青梅1-11-1", "hours": "平日 8:30-17:00", "services": ["ごみ収集", "リサイクル", "環境対策"]}
+                ],
+                "消防署": [{"name": "青梅消防署", "phone": "0428-22-0119", "address": "東京都青梅市東青梅1-174", "hours": "24時間", "services": ["火災通報", "救急車"]}],
+                "ガス": [{"name": "東京ガス青梅支店", "phone": "0570-002211", "address": "東京都青梅市本町134", "hours": "平日 8:30-19:00", "services": ["ガス開栓", "緊急通報"]}],
+                "電力": [{"name": "東京電力パワーグリッド青梅支社", "phone": "0120-995-007", "address": "東京都青梅市本町134", "hours": "平日 9:00-17:00", "services": ["停電情報", "電気工事"]}],
+                "病院": [{"name": "青梅市立総合病院", "phone": "0428-22-3191", "address": "東京都青梅市東青梅4-16-5", "hours": "24時間救急", "services": ["総合診療", "救急医療"]}],
+                "保健所": [{"name": "西多摩保健所", "phone": "0428-22-6141", "address": "東京都青梅市東青梅2-235", "hours": "平日 9:00-17:00", "services": ["健康相談", "予防接種"]}],
+                "水道": [{"name": "東京都水道局多摩お客さまセンター", "phone": "0570-091-100", "address": "東京都立川市錦町6-3-1", "hours": "平日 8:30-20:00", "services": ["水道開栓", "料金"]}],
+                "NTT": [{"name": "NTT東日本東京支店", "phone": "116", "address": "東京都新宿区西新宿3-19-2", "hours": "平日 9:00-17:00", "services": ["電話工事", "故障修理"]}],
+                "下水道": [{"name": "東京都下水道局八王子管理事務所", "phone": "042-645-4031", "address": "東京都八王子市北野町596-2", "hours": "平日 8:30-17:15", "services": ["下水道修理", "排水設備"]}]
+            }
+        },
+        "府中市": {
+            "": {
+                "労基署": [{"name": "立川労働基準監督署", "phone": "042-523-4472", "address": "東京都立川市緑町4-2", "hours": "平日 8:30-17:15", "services": ["労働相談", "労災申請"]}],
+                "警察署": [{"name": "府中警察署", "phone": "042-360-0110", "address": "東京都府中市寿町1-3", "hours": "24時間", "services": ["事件事故", "遺失物"]}],
+                "市区町村役所": [
+                    {"name": "府中市役所", "phone": "042-364-4111", "address": "東京都府中市宮西町2-24", "hours": "平日 8:30-17:00", "services": ["住民票", "戸籍"]},
+                    {"name": "府中市生活環境部", "phone": "042-335-4315", "address": "東京都府中市宮西町2-24", "hours": "平日 8:30-17:00", "services": ["ごみ収集", "リサイクル", "環境対策"]}
+                ],
+                "消防署": [{"name": "府中消防署", "phone": "042-361-0119", "address": "東京都府中市寿町1-1", "hours": "24時間", "services": ["火災通報", "救急車"]}],
+                "ガス": [{"name": "東京ガス府中支店", "phone": "0570-002211", "address": "東京都府中市宮町1-100", "hours": "平日 8:30-19:00", "services": ["ガス開栓", "緊急通報"]}],
+                "電力": [{"name": "東京電力パワーグリッド府中支社", "phone": "0120-995-007", "address": "東京都府中市宮町1-100", "hours": "平日 9:00-17:00", "services": ["停電情報", "電気工事"]}],
+                "病院": [{"name": "東京都立多摩総合医療センター", "phone": "042-323-5111", "address": "東京都府中市武蔵台2-8-29", "hours": "24時間救急", "services": ["総合診療", "救急医療"]}],
+                "保健所": [{"name": "多摩府中保健所", "phone": "042-362-2334", "address": "東京都府中市宮西町1-26-1", "hours": "平日 9:00-17:00", "services": ["健康相談", "予防接種"]}],
+                "水道": [{"name": "東京都水道局多摩お客さまセンター", "phone": "0570-091-100", "address": "東京都立川市錦町6-3-1", "hours": "平日 8:30-20:00", "services": ["水道開栓", "料金"]}],
+                "NTT": [{"name": "NTT東日本東京支店", "phone": "116", "address": "東京都新宿区西新宿3-19-2", "hours": "平日 9:00-17:00", "services": ["電話工事", "故障修理"]}],
+                "下水道": [{"name": "東京都下水道局北多摩一号水再生センター", "phone": "042-524-3393", "address": "東京都府中市小柳町6-600", "hours": "平日 8:30-17:15", "services": ["下水道修理", "排水設備"]}]
+            }
+        },
+        "昭島市": {
+            "": {
+                "労基署": [{"name": "立川労働基準監督署", "phone": "042-523-4472", "address": "東京都立川市緑町4-2", "hours": "平日 8:30-17:15", "services": ["労働相談", "労災申請"]}],
+                "警察署": [{"name": "昭島警察署", "phone": "042-546-0110", "address": "東京都昭島市朝日町1-7", "hours": "24時間", "services": ["事件事故", "遺失物"]}],
+                "市区町村役所": [
+                    {"name": "昭島市役所", "phone": "042-544-5111", "address": "東京都昭島市田中町1-17-1", "hours": "平日 8:30-17:15", "services": ["住民票", "戸籍"]},
+                    {"name": "昭島市環境部", "phone": "042-544-4331", "address": "東京都昭島市田中町1-17-1", "hours": "平日 8:30-17:15", "services": ["ごみ収集", "リサイクル", "環境対策"]}
+                ],
+                "消防署": [{"name": "昭島消防署", "phone": "042-544-0119", "address": "東京都昭島市朝日町1-7", "hours": "24時間", "services": ["火災通報", "救急車"]}],
+                "ガス": [{"name": "東京ガス昭島支店", "phone": "0570-002211", "address": "東京都昭島市昭和町2-2-15", "hours": "平日 8:30-19:00", "services": ["ガス開栓", "緊急通報"]}],
+                "電力": [{"name": "東京電力パワーグリッド立川支社", "phone": "0120-995-007", "address": "東京都立川市曙町2-22-20", "hours": "平日 9:00-17:00", "services": ["停電情報", "電気工事"]}],
+                "病院": [{"name": "昭島病院", "phone": "042-545-2111", "address": "東京都昭島市中神町1260", "hours": "24時間救急", "services": ["総合診療", "救急医療"]}],
+                "保健所": [{"name": "南多摩保健所", "phone": "042-371-7661", "address": "東京都多摩市関戸4-19-5", "hours": "平日 9:00-17:00", "services": ["健康相談", "予防接種"]}],
+                "水道": [{"name": "東京都水道局多摩お客さまセンター", "phone": "0570-091-100", "address": "東京都立川市錦町6-3-1", "hours": "平日 8:30-20:00", "services": ["水道開栓", "料金"]}],
+                "NTT": [{"name": "NTT東日本東京支店", "phone": "116", "address": "東京都新宿区西新宿3-19-2", "hours": "平日 9:00-17:00", "services": ["電話工事", "故障修理"]}],
+                "下水道": [{"name": "東京都下水道局北多摩一号水再生センター", "phone": "042-524-3393", "address": "東京都府中市小柳町6-600", "hours": "平日 8:30-17:15", "services": ["下水道修理", "排水設備"]}]
+            }
+        },
+        "調布市": {
+            "": {
+                "労基署": [{"name": "三鷹労働基準監督署", "phone": "0422-49-1311", "address": "東京都三鷹市下連雀1-12-18", "hours": "平日 8:30-17:15", "services": ["労働相談", "労災申請"]}],
+                "警察署": [{"name": "調布警察署", "phone": "042-488-0110", "address": "東京都調布市小島町2-21-1", "hours": "24時間", "services": ["事件事故", "遺失物"]}],
+                "市区町村役所": [
+                    {"name": "調布市役所", "phone": "042-481-7111", "address": "東京都調布市小島町2-35-1", "hours": "平日 8:30-17:00", "services": ["住民票", "戸籍"]},
+                    {"name": "調布市環境部", "phone": "042-481-7086", "address": "東京都調布市小島町2-35-1", "hours": "平日 8:30-17:00", "services": ["ごみ収集", "リサイクル", "環境対策"]}
+                ],
+                "消防署": [{"name": "調布消防署", "phone": "042-486-0119", "address": "東京都調布市小島町2-21-1", "hours": "24時間", "services": ["火災通報", "救急車"]}],
+                "ガス": [{"name": "東京ガス調布支店", "phone": "0570-002211", "address": "東京都調布市布田1-41-1", "hours": "平日 8:30-19:00", "services": ["ガス開栓", "緊急通報"]}],
+                "電力": [{"name": "東京電力パワーグリッド調布支社", "phone": "0120-995-007", "address": "東京都調布市布田1-41-1", "hours": "平日 9:00-17:00", "services": ["停電情報", "電気工事"]}],
+                "病院": [{"name": "調布病院", "phone": "042-484-2626", "address": "東京都調布市下石原3-42-6", "hours": "24時間救急", "services": ["総合診療", "救急医療"]}],
+                "保健所": [{"name": "多摩府中保健所", "phone": "042-362-2334", "address": "東京都府中市宮西町1-26-1", "hours": "平日 9:00-17:00", "services": ["健康相談", "予防接種"]}],
+                "水道": [{"name": "東京都水道局多摩お客さまセンター", "phone": "0570-091-100", "address": "東京都立川市錦町6-3-1", "hours": "平日 8:30-20:00", "services": ["水道開栓", "料金"]}],
+                "NTT": [{"name": "NTT東日本東京支店", "phone": "116", "address": "東京都新宿区西新宿3-19-2", "hours": "平日 9:00-17:00", "services": ["電話工事", "故障修理"]}],
+                "下水道": [{"name": "東京都下水道局北多摩一号水再生センター", "phone": "042-524-3393", "address": "東京都府中市小柳町6-600", "hours": "平日 8:30-17:15", "services": ["下水道修理", "排水設備"]}]
+            }
+        },
+        "町田市": {
+            "": {
+                "労基署": [{"name": "八王子労働基準監督署", "phone": "042-680-8752", "address": "東京都八王子市明神町3-8-10", "hours": "平日 8:30-17:15", "services": ["労働相談", "労災申請"]}],
+                "警察署": [{"name": "町田警察署", "phone": "042-722-0110", "address": "東京都町田市中町2-4-4", "hours": "24時間", "services": ["事件事故", "遺失物"]}],
+                "市区町村役所": [
+                    {"name": "町田市役所", "phone": "042-722-3111", "address": "東京都町田市森野2-2-22", "hours": "平日 8:30-17:00", "services": ["住民票", "戸籍"]},
+                    {"name": "町田市環境資源部", "phone": "042-724-4379", "address": "東京都町田市森野2-2-22", "hours": "平日 8:30-17:00", "services": ["ごみ収集", "リサイクル", "環境対策"]}
+                ],
+                "消防署": [{"name": "町田消防署", "phone": "042-722-0119", "address": "東京都町田市中町2-15-46", "hours": "24時間", "services": ["火災通報", "救急車"]}],
+                "ガス": [{"name": "東京ガス町田支店", "phone": "0570-002211", "address": "東京都町田市中町1-4-2", "hours": "平日 8:30-19:00", "services": ["ガス開栓", "緊急通報"]}],
+                "電力": [{"name": "東京電力パワーグリッド町田支社", "phone": "0120-995-007", "address": "東京都町田市中町1-4-2", "hours": "平日 9:00-17:00", "services": ["停電情報", "電気工事"]}],
+                "病院": [{"name": "町田市民病院", "phone": "042-722-2230", "address": "東京都町田市旭町2-15-41", "hours": "24時間救急", "services": ["総合診療", "救急医療"]}],
+                "保健所": [{"name": "南多摩保健所", "phone": "042-371-7661", "address": "東京都多摩市関戸4-19-5", "hours": "平日 9:00-17:00", "services": ["健康相談", "予防接種"]}],
+                "水道": [{"name": "東京都水道局多摩お客さまセンター", "phone": "0570-091-100", "address": "東京都立川市錦町6-3-1", "hours": "平日 8:30-20:00", "services": ["水道開栓", "料金"]}],
+                "NTT": [{"name": "NTT東日本東京支店", "phone": "116", "address": "東京都新宿区西新宿3-19-2", "hours": "平日 9:00-17:00", "services": ["電話工事", "故障修理"]}],
+                "下水道": [{"name": "東京都下水道局八王子管理事務所", "phone": "042-645-4031", "address": "東京都八王子市北野町596-2", "hours": "平日 8:30-17:15", "services": ["下水道修理", "排水設備"]}]
+            }
+        },
+        "小金井市": {
+            "": {
+                "労基署": [{"name": "三鷹労働基準監督署", "phone": "0422-49-1311", "address": "東京都三鷹市下連雀1-12-18", "hours": "平日 8:30-17:15", "services": ["労働相談", "労災申請"]}],
+                "警察署": [{"name": "小金井警察署", "phone": "042-381-0110", "address": "東京都小金井市本町1-7-5", "hours": "24時間", "services": ["事件事故", "遺失物"]}],
+                "市区町村役所": [
+                    {"name": "小金井市役所", "phone": "042-383-1111", "address": "東京都小金井市本町6-6-3", "hours": "平日 8:30-17:00", "services": ["住民票", "戸籍"]},
+                    {"name": "小金井市環境部", "phone": "042-387-9817", "address": "東京都小金井市本町6-6-3", "hours": "平日 8:30-17:00", "services": ["ごみ収集", "リサイクル", "環境対策"]}
+                ],
+                "消防署": [{"name": "小金井消防署", "phone": "042-383-0119", "address": "東京都小金井市本町1-7-3", "hours": "24時間", "services": ["火災通報", "救急車"]}],
+                "ガス": [{"name": "東京ガス小金井支店", "phone": "0570-002211", "address": "東京都小金井市本町5-36-15", "hours": "平日 8:30-19:00", "services": ["ガス開栓", "緊急通報"]}],
+                "電力": [{"name": "東京電力パワーグリッド武蔵野支社", "phone": "0120-995-007", "address": "東京都武蔵野市吉祥寺本町1-10-7", "hours": "平日 9:00-17:00", "services": ["停電情報", "電気工事"]}],
+                "病院": [{"name": "JA東京むさし小金井診療所", "phone": "042-388-0121", "address": "東京都小金井市本町6-14-45", "hours": "平日 9:00-17:00", "services": ["内科", "外科"]}],
+                "保健所": [{"name": "多摩府中保健所", "phone": "042-362-2334", "address": "東京都府中市宮西町1-26-1", "hours": "平日 9:00-17:00", "services": ["健康相談", "予防接種"]}],
+                "水道": [{"name": "東京都水道局多摩お客さまセンター", "phone": "0570-091-100", "address": "東京都立川市錦町6-3-1", "hours": "平日 8:30-20:00", "services": ["水道開栓", "料金"]}],
+                "NTT": [{"name": "NTT東日本東京支店", "phone": "116", "address": "東京都新宿区西新宿3-19-2", "hours": "平日 9:00-17:00", "services": ["電話工事", "故障修理"]}],
+                "下水道": [{"name": "東京都下水道局北多摩一号水再生センター", "phone": "042-524-3393", "address": "東京都府中市小柳町6-600", "hours": "平日 8:30-17:15", "services": ["下水道修理", "排水設備"]}]
+            }
+        },
+        "小平市": {
+            "": {
+                "労基署": [{"name": "立川労働基準監督署", "phone": "042-523-4472", "address": "東京都立川市緑町4-2", "hours": "平日 8:30-17:15", "services": ["労働相談", "労災申請"]}],
+                "警察署": [{"name": "小平警察署", "phone": "042-343-0110", "address": "東京都小平市美園町3-2-2", "hours": "24時間", "services": ["事件事故", "遺失物"]}],
+                "市区町村役所": [
+                    {"name": "小平市役所", "phone": "042-341-1211", "address": "東京都小平市小川町2-1333", "hours": "平日 8:30-17:00", "services": ["住民票", "戸籍"]},
+                    {"name": "小平市環境部", "phone": "042-346-9535", "address": "東京都小平市小川町2-1333", "hours": "平日 8:30-17:00", "services": ["ごみ収集", "リサイクル", "環境対策"]}
+                ],
+                "消防署": [{"name": "小平消防署", "phone": "042-341-0119", "address": "東京都小平市美園町3-2-1", "hours": "24時間", "services": ["火災通報", "救急車"]}],
+                "ガス": [{"name": "東京ガス小平支店", "phone": "0570-002211", "address": "東京都小平市学園東町1-4-21", "hours": "平日 8:30-19:00", "services": ["ガス開栓", "緊急通報"]}],
+                "電力": [{"name": "東京電力パワーグリッド立川支社", "phone": "0120-995-007", "address": "東京都立川市曙町2-22-20", "hours": "平日 9:00-17:00", "services": ["停電情報", "電気工事"]}],
+                "病院": [{"name": "公立昭和病院", "phone": "042-461-0052", "address": "東京都小平市花小金井8-1-1", "hours": "24時間救急", "services": ["総合診療", "救急医療"]}],
+                "保健所": [{"name": "多摩府中保健所", "phone": "042-362-2334", "address": "東京都府中市宮西町1-26-1", "hours": "平日 9:00-17:00", "services": ["健康相談", "予防接種"]}],
+                "水道": [{"name": "東京都水道局多摩お客さまセンター", "phone": "0570-091-100", "address": "東京都立川市錦町6-3-1", "hours": "平日 8:30-20:00", "services": ["水道開栓", "料金"]}],
+                "NTT": [{"name": "NTT東日本東京支店", "phone": "116", "address": "東京都新宿区西新宿3-19-2", "hours": "平日 9:00-17:00", "services": ["電話工事", "故障修理"]}],
+                "下水道": [{"name": "東京都下水道局北多摩一号水再生センター", "phone": "042-524-3393", "address": "東京都府中市小柳町6-600", "hours": "平日 8:30-17:15", "services": ["下水道修理", "排水設備"]}]
+            }
+        },
+        "日野市": {
+            "": {
+                "労基署": [{"name": "立川労働基準監督署", "phone": "042-523-4472", "address": "東京都立川市緑町4-2", "hours": "平日 8:30-17:15", "services": ["労働相談", "労災申請"]}],
+                "警察署": [{"name": "日野警察署", "phone": "042-586-0110", "address": "東京都日野市石田1-196-3", "hours": "24時間", "services": ["事件事故", "遺失物"]}],
+                "市区町村役所": [
+                    {"name": "日野市役所", "phone": "042-585-1111", "address": "東京都日野市神明1-12-1", "hours": "平日 8:30-17:00", "services": ["住民票", "戸籍"]},
+                    {"name": "日野市環境共生部", "phone": "042-514-8294", "address": "東京都日野市神明1-12-1", "hours": "平日 8:30-17:00", "services": ["ごみ収集", "リサイクル", "環境対策"]}
+                ],
+                "消防署": [{"name": "日野消防署", "phone": "042-581-0119", "address": "東京都日野市石田1-196-1", "hours": "24時間", "services": ["火災通報", "救急車"]}],
+                "ガス": [{"name": "東京ガス日野支店", "phone": "0570-002211", "address": "東京都日野市神明1-11-18", "hours": "平日 8:30-19:00", "services": ["ガス開栓", "緊急通報"]}],
+                "電力": [{"name": "東京電力パワーグリッド立川支社", "phone": "0120-995-007", "address": "東京都立川市曙町2-22-20", "hours": "平日 9:00-17:00", "services": ["停電情報", "電気工事"]}],
+                "病院": [{"name": "日野市立病院", "phone": "042-581-2677", "address": "東京都日野市多摩平4-3-1", "hours": "24時間救急", "services": ["総合診療", "救急医療"]}],
+                "保健所": [{"name": "南多摩保健所", "phone": "042-371-7661", "address": "東京都多摩市関戸4-19-5", "hours": "平日 9:00-17:00", "services": ["健康相談", "予防接種"]}],
+                "水道": [{"name": "東京都水道局多摩お客さまセンター", "phone": "0570-091-100", "address": "東京都立川市錦町6-3-1", "hours": "平日 8:30-20:00", "services": ["水道開栓", "料金"]}],
+                "NTT": [{"name": "NTT東日本東京支店", "phone": "116", "address": "東京都新宿区西新宿3-19-2", "hours": "平日 9:00-17:00", "services": ["電話工事", "故障修理"]}],
+                "下水道": [{"name": "東京都下水道局北多摩一号水再生センター", "phone": "042-524-3393", "address": "東京都府中市小柳町6-600", "hours": "平日 8:30-17:15", "services": ["下水道修理", "排水設備"]}]
+            }
+        },
+        "東村山市": {
+            "": {
+                "労基署": [{"name": "立川労働基準監督署", "phone": "042-523-4472", "address": "東京都立川市緑町4-2", "hours": "平日 8:30-17:15", "services": ["労働相談", "労災申請"]}],
+                "警察署": [{"name": "東村山警察署", "phone": "042-393-0110", "address": "東京都東村山市本町1-2-29", "hours": "24時間", "services": ["事件事故", "遺失物"]}],
+                "市区町村役所": [
+                    {"name": "東村山市役所", "phone": "042-393-5111", "address": "東京都東村山市本町1-2-3", "hours": "平日 8:30-17:00", "services": ["住民票", "戸籍"]},
+                    {"name": "東村山市環境資源循環部", "phone": "042-393-5111", "address": "東京都東村山市本町1-2-3", "hours": "平日 8:30-17:00", "services": ["ごみ収集", "リサイクル", "環境対策"]}
+                ],
+                "消防署": [{"name": "東村山消防署", "phone": "042-391-0119", "address": "東京都東村山市本町1-2-25", "hours": "24時間", "services": ["火災通報", "救急車"]}],
+                "ガス": [{"name": "東京ガス東村山支店", "phone": "0570-002211", "address": "東京都東村山市栄町2-7-28", "hours": "平日 8:30-19:00", "services": ["ガス開栓", "緊急通報"]}],
+                "電力": [{"name": "東京電力パワーグリッド立川支社", "phone": "0120-995-007", "address": "東京都立川市曙町2-22-20", "hours": "平日 9:00-17:00", "services": ["停電情報", "電気工事"]}],
+                "病院": [{"name": "多摩北部医療センター", "phone": "042-396-3811", "address": "東京都東村山市青葉町1-7-1", "hours": "24時間救急", "services": ["総合診療", "救急医療"]}],
+                "保健所": [{"name": "多摩府中保健所", "phone": "042-362-2334", "address": "東京都府中市宮西町1-26-1", "hours": "平日 9:00-17:00", "services": ["健康相談", "予防接種"]}],
+                "水道": [{"name": "東京都水道局多摩お客さまセンター", "phone": "0570-091-100", "address": "東京都立川市錦町6-3-1", "hours": "平日 8:30-20:00", "services": ["水道開栓", "料金"]}],
+                "NTT": [{"name": "NTT東日本東京支店", "phone": "116", "address": "東京都新宿区西新宿3-19-2", "hours": "平日 9:00-17:00", "services": ["電話工事", "故障修理"]}],
+                "下水道": [{"name": "東京都下水道局北多摩一号水再生センター", "phone": "042-524-3393", "address": "東京都府中市小柳町6-600", "hours": "平日 8:30-17:15", "services": ["下水道修理", "排水設備"]}]
+            }
+        },
+        "国分寺市": {
+            "": {
+                "労基署": [{"name": "三鷹労働基準監督署", "phone": "0422-49-1311", "address": "東京都三鷹市下連雀1-12-18", "hours": "平日 8:30-17:15", "services": ["労働相談", "労災申請"]}],
+                "警察署": [{"name": "小金井警察署", "phone": "042-381-0110", "address": "東京都小金井市本町1-7-5", "hours": "24時間", "services": ["事件事故", "遺失物"]}],
+                "市区町村役所": [
+                    {"name": "国分寺市役所", "phone": "042-325-0111", "address": "東京都国分寺市戸倉1-6-1", "hours": "平日 8:30-17:00", "services": ["住民票", "戸籍"]},
+                    {"name": "国分寺市環境部", "phone": "042-300-5300", "address": "東京都国分寺市戸倉1-6-1", "hours": "平日 8:30-17:00", "services": ["ごみ収集", "リサイクル", "環境対策"]}
+                ],
+                "消防署": [{"name": "国分寺消防署", "phone": "042-323-0119", "address": "東京都国分寺市戸倉4-14", "hours": "24時間", "services": ["火災通報", "救急車"]}],
+                "ガス": [{"name": "東京ガス国分寺支店", "phone": "0570-002211", "address": "東京都国分寺市本町2-10-5", "hours": "平日 8:30-19:00", "services": ["ガス開栓", "緊急通報"]}],
+                "電力": [{"name": "東京電力パワーグリッド武蔵野支社", "phone": "0120-995-007", "address": "東京都武蔵野市吉祥寺本町1-10-7", "hours": "平日 9:00-17:00", "services": ["停電情報", "電気工事"]}],
+                "病院": [{"name": "国分寺病院", "phone": "042-322-0123", "address": "東京都国分寺市東恋ヶ窪4-2-2", "hours": "24時間救急", "services": ["総合診療", "救急医療"]}],
+                "保健所": [{"name": "多摩府中保健所", "phone": "042-362-2334", "address": "東京都府中市宮西町1-26-1", "hours": "平日 9:00-17:00", "services": ["健康相談", "予防接種"]}],
+                "水道": [{"name": "東京都水道局多摩お客さまセンター", "phone": "0570-091-100", "address": "東京都立川市錦町6-3-1", "hours": "平日 8:30-20:00", "services": ["水道開栓", "料金"]}],
+                "NTT": [{"name": "NTT東日本東京支店", "phone": "116", "address": "東京都新宿区西新宿3-19-2", "hours": "平日 9:00-17:00", "services": ["電話工事", "故障修理"]}],
+                "下水道": [{"name": "東京都下水道局北多摩一号水再生センター", "phone": "042-524-3393", "address": "東京都府中市小柳町6-600", "hours": "平日 8:30-17:15", "services": ["下水道修理", "排水設備"]}]
+            }
+        },
+        "国立市": {
+            "": {
+                "労基署": [{"name": "立川労働基準監督署", "phone": "042-523-4472", "address": "東京都立川市緑町4-2", "hours": "平日 8:30-17:15", "services": ["労働相談", "労災申請"]}],
+                "警察署": [{"name": "立川警察署", "phone": "042-527-0110", "address": "東京都立川市緑町3213-2", "hours": "24時間", "services": ["事件事故", "遺失物"]}],
+                "市区町村役所": [
+                    {"name": "国立市役所", "phone": "042-576-2111", "address": "東京都国立市富士見台2-47-1", "hours": "平日 8:30-17:00", "services": ["住民票", "戸籍"]},
+                    {"name": "国立市環境政策課", "phone": "042-576-2111", "address": "東京都国立市富士見台2-47-1", "hours": "平日 8:30-17:00", "services": ["ごみ収集", "リサイクル", "環境対策"]}
+                ],
+                "消防署": [{"name": "国立消防署", "phone": "042-574-0119", "address": "東京都国立市富士見台2-48-1", "hours": "24時間", "services": ["火災通報", "救急車"]}],
+                "ガス": [{"name": "東京ガス国立支店", "phone": "0570-002211", "address": "東京都国立市中1-9-30", "hours": "平日 8:30-19:00", "services": ["ガス開栓", "緊急通報"]}],
+                "電力": [{"name": "東京電力パワーグリッド立川支社", "phone": "0120-995-007", "address": "東京都立川市曙町2-22-20", "hours": "平日 9:00-17:00", "services": ["停電情報", "電気工事"]}],
+                "病院": [{"name": "国立病院機構災害医療センター", "phone": "042-526-5511", "address": "東京都立川市緑町3256", "hours": "24時間救急", "services": ["総合診療", "救急医療"]}],
+                "保健所": [{"name": "南多摩保健所", "phone": "042-371-7661", "address": "東京都多摩市関戸4-19-5", "hours": "平日 9:00-17:00", "services": ["健康相談", "予防接種"]}],
+                "水道": [{"name": "東京都水道局多摩お客さまセンター", "phone": "0570-091-100", "address": "東京都立川市錦町6-3-1", "hours": "平日 8:30-20:00", "services": ["水道開栓", "料金"]}],
+                "NTT": [{"name": "NTT東日本東京支店", "phone": "116", "address": "東京都新宿区西新宿3-19-2", "hours": "平日 9:00-17:00", "services": ["電話工事", "故障修理"]}],
+                "下水道": [{"name": "東京都下水道局北多摩一号水再生センター", "phone": "042-524-3393", "address": "東京都府中市小柳町6-600", "hours": "平日 8:30-17:15", "services": ["下水道修理", "排水設備"]}]
+            }
+        },
+        "福生市": {
+            "": {
+                "労基署": [{"name": "青梅労働基準監督署", "phone": "0428-22-0285", "address": "東京都青梅市東青梅2-6-2", "hours": "平日 8:30-17:15", "services": ["労働相談", "労災申請"]}],
+                "警察署": [{"name": "福生警察署", "phone": "042-551-0110", "address": "東京都福生市福生1181", "hours": "24時間", "services": ["事件事故", "遺失物"]}],
+                "市区町村役所": [
+                    {"name": "福生市役所", "phone": "042-551-1511", "address": "東京都福生市本町5", "hours": "平日 8:30-17:00", "services": ["住民票", "戸籍"]},
+                    {"name": "福生市生活環境部", "phone": "042-551-1718", "address": "東京都福生市本町5", "hours": "平日 8:30-17:00", "services": ["ごみ収集", "リサイクル", "環境対策"]}
+                ],
+                "消防署": [{"name": "福生消防署", "phone": "042-551-0119", "address": "東京都福生市福生1043", "hours": "24時間", "services": ["火災通報", "救急車"]}],
+                "ガス": [{"name": "東京ガス福生支店", "phone": "0570-002211", "address": "東京都福生市東町3-3", "hours": "平日 8:30-19:00", "services": ["ガス開栓", "緊急通報"]}],
+                "電力": [{"name": "東京電力パワーグリッド青梅支社", "phone": "0120-995-007", "address": "東京都青梅市本町134", "hours": "平日 9:00-17:00", "services": ["停電情報", "電気工事"]}],
+                "病院": [{"name": "福生病院", "phone": "042-551-1111", "address": "東京都福生市福生922", "hours": "24時間救急", "services": ["総合診療", "救急医療"]}],
+                "保健所": [{"name": "西多摩保健所", "phone": "0428-22-6141", "address": "東京都青梅市東青梅2-235", "hours": "平日 9:00-17:00", "services": ["健康相談", "予防接種"]}],
+                "水道": [{"name": "東京都水道局多摩お客さまセンター", "phone": "0570-091-100", "address": "東京都立川市錦町6-3-1", "hours": "平日 8:30-20:00", "services": ["水道開栓", "料金"]}],
+                "NTT": [{"name": "NTT東日本東京支店", "phone": "116", "address": "東京都新宿区西新宿3-19-2", "hours": "平日 9:00-17:00", "services": ["電話工事", "故障修理"]}],
+                "下水道": [{"name": "東京都下水道局八王子管理事務所", "phone": "042-645-4031", "address": "東京都八王子市北野町596-2", "hours": "平日 8:30-17:15", "services": ["下水道修理", "排水設備"]}]
+            }
+        },
+        "狛江市": {
+            "": {
+                "労基署": [{"name": "三鷹労働基準監督署", "phone": "0422-49-1311", "address": "東京都三鷹市下連雀1-12-18", "hours": "平日 8:30-17:15", "services": ["労働相談", "労災申請"]}],
+                "警察署": [{"name": "調布警察署", "phone": "042-488-0110", "address": "東京都調布市小島町2-21-1", "hours": "24時間", "services": ["事件事故", "遺失物"]}],
+                "市区町村役所": [
+                    {"name": "狛江市役所", "phone": "03-3430-1111", "address": "東京都狛江市和泉本町1-1-5", "hours": "平日 8:30-17:00", "services": ["住民票", "戸籍"]},
+                    {"name": "狛江市環境部", "phone": "03-3430-1287", "address": "東京都狛江市和泉本町1-1-5", "hours": "平日 8:30-17:00", "services": ["ごみ収集", "リサイクル", "環境対策"]}
+                ],
+                "消防署": [{"name": "狛江消防署", "phone": "03-3480-0119", "address": "東京都狛江市和泉本町3-29-1", "hours": "24時間", "services": ["火災通報", "救急車"]}],
+                "ガス": [{"name": "東京ガス狛江支店", "phone": "0570-002211", "address": "東京都狛江市和泉本町1-2-16", "hours": "平日 8:30-19:00", "services": ["ガス開栓", "緊急通報"]}],
+                "電力": [{"name": "東京電力パワーグリッド調布支社", "phone": "0120-995-007", "address": "東京都調布市布田1-41-1", "hours": "平日 9:00-17:00", "services": ["停電情報", "電気工事"]}],
+                "病院": [{"name": "慈恵第三病院", "phone": "03-3480-1151", "address": "東京都狛江市和泉本町4-11-1", "hours": "24時間救急", "services": ["総合診療", "救急医療"]}],
+                "保健所": [{"name": "多摩府中保健所", "phone": "042-362-2334", "address": "東京都府中市宮西町1-26-1", "hours": "平日 9:00-17:00", "services": ["健康相談", "予防接種"]}],
+                "水道": [{"name": "東京都水道局多摩お客さまセンター", "phone": "0570-091-100", "address": "東京都立川市錦町6-3-1", "hours": "平日 8:30-20:00", "services": ["水道開栓", "料金"]}],
+                "NTT": [{"name": "NTT東日本東京支店", "phone": "116", "address": "東京都新宿区西新宿3-19-2", "hours": "平日 9:00-17:00", "services": ["電話工事", "故障修理"]}],
+                "下水道": [{"name": "東京都下水道局北多摩一号水再生センター", "phone": "042-524-3393", "address": "東京都府中市小柳町6-600", "hours": "平日 8:30-17:15", "services": ["下水道修理", "排水設備"]}]
+            }
+        },
+        "東大和市": {
+            "": {
+                "労基署": [{"name": "立川労働基準監督署", "phone": "042-523-4472", "address": "東京都立川市緑町4-2", "hours": "平日 8:30-17:15", "services": ["労働相談", "労災申請"]}],
+                "警察署": [{"name": "東大和警察署", "phone": "042-566-0110", "address": "東京都東大和市仲原3-18-1", "hours": "24時間", "services": ["事件事故", "遺失物"]}],
+                "市区町村役所": [
+                    {"name": "東大和市役所", "phone": "042-563-2111", "address": "東京都東大和市中央3-930", "hours": "平日 8:30-17:00", "services": ["住民票", "戸籍"]},
+                    {"name": "東大和市環境対策課", "phone": "042-563-2111", "address": "東京都東大和市中央3-930", "hours": "平日 8:30-17:00", "services": ["ごみ収集", "リサイクル", "環境対策"]}
+                ],
+                "消防署": [{"name": "東大和消防署", "phone": "042-561-0119", "address": "東京都東大和市仲原3-18", "hours": "24時間", "services": ["火災通報", "救急車"]}],
+                "ガス": [{"name": "東京ガス東大和支店", "phone": "0570-002211", "address": "東京都東大和市南街5-62-1", "hours": "平日 8:30-19:00", "services": ["ガス開栓", "緊急通報"]}],
+                "電力": [{"name": "東京電力パワーグリッド立川支社", "phone": "0120-995-007", "address": "東京都立川市曙町2-22-20", "hours": "平日 9:00-17:00", "services": ["停電情報", "電気工事"]}],
+                "病院": [{"name": "東大和病院", "phone": "042-562-1211", "address": "東京都東大和市南街1-13-12", "hours": "24時間救急", "services": ["総合診療", "救急医療"]}],
+                "保健所": [{"name": "多摩府中保健所", "phone": "042-362-2334", "address": "東京都府中市宮西町1-26-1", "hours": "平日 9:00-17:00", "services": ["健康相談", "予防接種"]}],
+                "水道": [{"name": "東京都水道局多摩お客さまセンター", "phone": "0570-091-100", "address": "東京都立川市錦町6-3-1", "hours": "平日 8:30-20:00", "services": ["水道開栓", "料金"]}],
+                "NTT": [{"name": "NTT東日本東京支店", "phone": "116", "address": "東京都新宿区西新宿3-19-2", "hours": "平日 9:00-17:00", "services": ["電話工事", "故障修理"]}],
+                "下水道": [{"name": "東京都下水道局北多摩一号水再生センター", "phone": "042-524-3393", "address": "東京都府中市小柳町6-600", "hours": "平日 8:30-17:15", "services": ["下水道修理", "排水設備"]}]
+            }
+        },
+        "清瀬市": {
+            "": {
+                "労基署": [{"name": "立川労働基準監督署", "phone": "042-523-4472", "address": "東京都立川市緑町4-2", "hours": "平日 8:30-17:15", "services": ["労働相談", "労災申請"]}],
+                "警察署": [{"name": "東村山警察署", "phone": "042-393-0110", "address": "東京都東村山市本町1-2-29", "hours": "24時間", "services": ["事件事故", "遺失物"]}],
+                "市区町村役所": [
+                    {"name": "清瀬市役所", "phone": "042-492-5111", "address": "東京都清瀬市中里5-842", "hours": "平日 8:30-17:00", "services": ["住民票", "戸籍"]},
+                    {"name": "清瀬市水と緑の環境課", "phone": "042-497-2099", "address": "東京都清瀬市中里5-842", "hours": "平日 8:30-17:00", "services": ["ごみ収集", "リサイクル", "環境対策"]}
+                ],
+                "消防署": [{"name": "清瀬消防署", "phone": "042-491-0119", "address": "東京都清瀬市松山1-5-10", "hours": "24時間", "services": ["火災通報", "救急車"]}],
+                "ガス": [{"name": "東京ガス清瀬支店", "phone": "0570-002211", "address": "東京都清瀬市元町1-2-11", "hours": "平日 8:30-19:00", "services": ["ガス開栓", "緊急通報"]}],
+                "電力": [{"name": "東京電力パワーグリッド立川支社", "phone": "0120-995-007", "address": "東京都立川市曙町2-22-20", "hours": "平日 9:00-17:00", "services": ["停電情報", "電気工事"]}],
+                "病院": [{"name": "複十字病院", "phone": "042-491-4111", "address": "東京都清瀬市松山3-1-24", "hours": "24時間救急", "services": ["総合診療", "救急医療"]}],
+                "保健所": [{"name": "多摩府中保健所", "phone": "042-362-2334", "address": "東京都府中市宮西町1-26-1", "hours": "平日 9:00-17:00", "services": ["健康相談", "予防接種"]}],
+                "水道": [{"name": "東京都水道局多摩お客さまセンター", "phone": "0570-091-100", "address": "東京都立川市錦町6-3-1", "hours": "平日 8:30-20:00", "services": ["水道開栓", "料金"]}],
+                "NTT": [{"name": "NTT東日本東京支店", "phone": "116", "address": "東京都新宿区西新宿3-19-2", "hours": "平日 9:00-17:00", "services": ["電話工事", "故障修理"]}],
+                "下水道": [{"name": "東京都下水道局北多摩一号水再生センター", "phone": "042-524-3393", "address": "東京都府中市小柳町6-600", "hours": "平日 8:30-17:15", "services": ["下水道修理", "排水設備"]}]
+            }
+        },
+        "東久留米市": {
+            "": {
+                "労基署": [{"name": "立川労働基準監督署", "phone": "042-523-4472", "address": "東京都立川市緑町4-2", "hours": "平日 8:30-17:15", "services": ["労働相談", "労災申請"]}],
+                "警察署": [{"name": "田無警察署", "phone": "042-467-0110", "address": "東京都西東京市南町4-2-16", "hours": "24時間", "services": ["事件事故", "遺失物"]}],
+                "市区町村役所": [
+                    {"name": "東久留米市役所", "phone": "042-470-7777", "address": "東京都東久留米市本町3-3-1", "hours": "平日 8:30-17:00", "services": ["住民票", "戸籍"]},
+                    {"name": "東久留米市環境安全部", "phone": "042-473-2117", "address": "東京都東久留米市本町3-3-1", "hours": "平日 8:30-17:00", "services": ["ごみ収集", "リサイクル", "環境対策"]}
+                ],
+                "消防署": [{"name": "東久留米消防署", "phone": "042-471-0119", "address": "東京都東久留米市本町1-6-1", "hours": "24時間", "services": ["火災通報", "救急車"]}],
+                "ガス": [{"name": "東京ガス東久留米支店", "phone": "0570-002211", "address": "東京都東久留米市東本町14-3", "hours": "平日 8:30-19:00", "services": ["ガス開栓", "緊急通報"]}],
+                "電力": [{"name": "東京電力パワーグリッド立川支社", "phone": "0120-995-007", "address": "東京都立川市曙町2-22-20", "hours": "平日 9:00-17:00", "services": ["停電情報", "電気工事"]}],
+                "病院": [{"name": "東久留米総合病院", "phone": "042-471-2111", "address": "東京都東久留米市氷川台2-5-18", "hours": "24時間救急", "services": ["総合診療", "救急医療"]}],
+                "保健所": [{"name": "多摩府中保健所", "phone": "042-362-2334", "address": "東京都府中市宮西町1-26-1", "hours": "平日 9:00-17:00", "services": ["健康相談", "予防接種"]}],
+                "水道": [{"name": "東京都水道局多摩お客さまセンター", "phone": "0570-091-100", "address": "東京都立川市錦町6-3-1", "hours": "平日 8:30-20:00", "services": ["水道開栓", "料金"]}],
+                "NTT": [{"name": "NTT東日本東京支店", "phone": "116", "address": "東京都新宿区西新宿3-19-2", "hours": "平日 9:00-17:00", "services": ["電話工事", "故障修理"]}],
+                "下水道": [{"name": "東京都下水道局北多摩一号水再生センター", "phone": "042-524-3393", "address": "東京都府中市小柳町6-600", "hours": "平日 8:30-17:15", "services": ["下水道修理", "排水設備"]}]
+            }
+        },
+        "武蔵村山市": {
+            "": {
+                "労基署": [{"name": "立川労働基準監督署", "phone": "042-523-4472", "address": "東京都立川市緑町4-2", "hours": "平日 8:30-17:15", "services": ["労働相談", "労災申請"]}],
+                "警察署": [{"name": "東大和警察署", "phone": "042-566-0110", "address": "東京都東大和市仲原3-18-1", "hours": "24時間", "services": ["事件事故", "遺失物"]}],
+                "市区町村役所": [
+                    {"name": "武蔵村山市役所", "phone": "042-565-1111", "address": "東京都武蔵村山市本町1-1-1", "hours": "平日 8:30-17:15", "services": ["住民票", "戸籍"]},
+                    {"name": "武蔵村山市環境課", "phone": "042-565-1111", "address": "東京都武蔵村山市本町1-1-1", "hours": "平日 8:30-17:15", "services": ["ごみ収集", "リサイクル", "環境対策"]}
+                ],
+                "消防署": [{"name": "武蔵村山消防署", "phone": "042-563-0119", "address": "東京都武蔵村山市学園4-5", "hours": "24時間", "services": ["火災通報", "救急車"]}],
+                "ガス": [{"name": "東京ガス武蔵村山支店", "phone": "0570-002211", "address": "東京都武蔵村山市榎1-13-7", "hours": "平日 8:30-19:00", "services": ["ガス開栓", "緊急通報"]}],
+                "電力": [{"name": "東京電力パワーグリッド立川支社", "phone": "0120-995-007", "address": "東京都立川市曙町2-22-20", "hours": "平日 9:00-17:00", "services": ["停電情報", "電気工事"]}],
+                "病院": [{"name": "武蔵村山病院", "phone": "042-566-3111", "address": "東京都武蔵村山市榎1-1-5", "hours": "24時間救急", "services": ["総合診療", "救急医療"]}],
+                "保健所": [{"name": "多摩府中保健所", "phone": "042-362-2334", "address": "東京都府中市宮西町1-26-1", "hours": "平日 9:00-17:00", "services": ["健康相談", "予防接種"]}],
+                "水道": [{"name": "東京都水道局多摩お客さまセンター", "phone": "0570-091-100", "address": "東京都立川市錦町6-3-1", "hours": "平日 8:30-20:00", "services": ["水道開栓", "料金"]}],
+                "NTT": [{"name": "NTT東日本東京支店", "phone": "116", "address": "東京都新宿区西新宿3-19-2", "hours": "平日 9:00-17:00", "services": ["電話工事", "故障修理"]}],
+                "下水道": [{"name": "東京都下水道局北多摩一号水再生センター", "phone": "042-524-3393", "address": "東京都府中市小柳町6-600", "hours": "平日 8:30-17:15", "services": ["下水道修理", "排水設備"]}]
+            }
+        },
+        "多摩市": {
+            "": {
+                "労基署": [{"name": "立川労働基準監督署", "phone": "042-523-4472", "address": "東京都立川市緑町4-2", "hours": "平日 8:30-17:15", "services": ["労働相談", "労災申請"]}],
+                "警察署": [{"name": "多摩中央警察署", "phone": "042-375-0110", "address": "東京都多摩市落合1-35", "hours": "24時間", "services": ["事件事故", "遺失物"]}],
+                "市区町村役所": [
+                    {"name": "多摩市役所", "phone": "042-375-8111", "address": "東京都多摩市関戸6-12-1", "hours": "平日 8:30-17:00", "services": ["住民票", "戸籍"]},
+                    {"name": "多摩市環境政策課", "phone": "042-338-6831", "address": "東京都多摩市関戸6-12-1", "hours": "平日 8:30-17:00", "services": ["ごみ収集", "リサイクル", "環境対策"]}
+                ],
+                "消防署": [{"name": "多摩消防署", "phone": "042-375-0119", "address": "東京都多摩市落合1-35", "hours": "24時間", "services": ["火災通報", "救急車"]}],
+                "ガス": [{"name": "東京ガス多摩支店", "phone": "0570-002211", "address": "東京都多摩市落合1-46-1", "hours": "平日 8:30-19:00", "services": ["ガス開栓", "緊急通報"]}],
+                "電力": [{"name": "東京電力パワーグリッド立川支社", "phone": "0120-995-007", "address": "東京都立川市曙町2-22-20", "hours": "平日 9:00-17:00", "services": ["停電情報", "電気工事"]}],
+                "病院": [{"name": "多摩南部地域病院", "phone": "042-338-5111", "address": "東京都多摩市中沢2-1-2", "hours": "24時間救急", "services": ["総合診療", "救急医療"]}],
+                "保健所": [{"name": "南多摩保健所", "phone": "042-371-7661", "address": "東京都多摩市関戸4-19-5", "hours": "平日 9:00-17:00", "services": ["健康相談", "予防接種"]}],
+                "水道": [{"name": "東京都水道局多摩お客さまセンター", "phone": "0570-091-100", "address": "東京都立川市錦町6-3-1", "hours": "平日 8:30-20:00", "services": ["水道開栓", "料金"]}],
+                "NTT": [{"name": "NTT東日本東京支店", "phone": "116", "address": "東京都新宿区西新宿3-19-2", "hours": "平日 9:00-17:00", "services": ["電話工事", "故障修理"]}],
+                "下水道": [{"name": "東京都下水道局北多摩一号水再生センター", "phone": "042-524-3393", "address": "東京都府中市小柳町6-600", "hours": "平日 8:30-17:15", "services": ["下水道修理", "排水設備"]}]
+            }
+        },
+        "稲城市": {
+            "": {
+                "労基署": [{"name": "立川労働基準監督署", "phone": "042-523-4472", "address": "東京都立川市緑町4-2", "hours": "平日 8:30-17:15", "services": ["労働相談", "労災申請"]}],
+                "警察署": [{"name": "多摩中央警察署", "phone": "042-375-0110", "address": "東京都多摩市落合1-35", "hours": "24時間", "services": ["事件事故", "遺失物"]}],
+                "市区町村役所": [
+                    {"name": "稲城市役所", "phone": "042-378-2111", "address": "東京都稲城市東長沼2111", "hours": "平日 8:30-17:00", "services": ["住民票", "戸籍"]},
+                    {"name": "稲城市生活環境部", "phone": "042-378-2130", "address": "東京都稲城市東長沼2111", "hours": "平日 8:30-17:00", "services": ["ごみ収集", "リサイクル", "環境対策"]}
+                ],
+                "消防署": [{"name": "稲城消防署", "phone": "042-377-0119", "address": "東京都稲城市東長沼690", "hours": "24時間", "services": ["火災通報", "救急車"]}],
+                "ガス": [{"name": "東京ガス稲城支店", "phone": "0570-002211", "address": "東京都稲城市百村1623-1", "hours": "平日 8:30-19:00", "services": ["ガス開栓", "緊急通報"]}],
+                "電力": [{"name": "東京電力パワーグリッド立川支社", "phone": "0120-995-007", "address": "東京都立川市曙町2-22-20", "hours": "平日 9:00-17:00", "services": ["停電情報", "電気工事"]}],
+                "病院": [{"name": "稲城市立病院", "phone": "042-377-0931", "address": "東京都稲城市大丸1171", "hours": "24時間救急", "services": ["総合診療", "救急医療"]}],
+                "保健所": [{"name": "南多摩保健所", "phone": "042-371-7661", "address": "東京都多摩市関戸4-19-5", "hours": "平日 9:00-17:00", "services": ["健康相談", "予防接種"]}],
+                "水道": [{"name": "東京都水道局多摩お客さまセンター", "phone": "0570-091-100", "address": "東京都立川市錦町6-3-1", "hours": "平日 8:30-20:00", "services": ["水道開栓", "料金"]}],
+                "NTT": [{"name": "NTT東日本東京支店", "phone": "116", "address": "東京都新宿区西新宿3-19-2", "hours": "平日 9:00-17:00", "services": ["電話工事", "故障修理"]}],
+                "下水道": [{"name": "東京都下水道局北多摩一号水再生センター", "phone": "042-524-3393", "address": "東京都府中市小柳町6-600", "hours": "平日 8:30-17:15", "services": ["下水道修理", "排水設備"]}]
+            }
+        },
+        "羽村市": {
+            "": {
+                "労基署": [{"name": "青梅労働基準監督署", "phone": "0428-22-0285", "address": "東京都青梅市東青梅2-6-2", "hours": "平日 8:30-17:15", "services": ["労働相談", "労災申請"]}],
+                "警察署": [{"name": "福生警察署", "phone": "042-551-0110", "address": "東京都福生市福生1181", "hours": "24時間", "services": ["事件事故", "遺失物"]}],
+                "市区町村役所": [
+                    {"name": "羽村市役所", "phone": "042-555-1111", "address": "東京都羽村市緑ケ丘5-2-1", "hours": "平日 8:30-17:15", "services": ["住民票", "戸籍"]},
+                    {"name": "羽村市生活環境部", "phone": "042-555-1111", "address": "東京都羽村市緑ケ丘5-2-1", "hours": "平日 8:30-17:15", "services": ["ごみ収集", "リサイクル", "環境対策"]}
+                ],
+                "消防署": [{"name": "羽村消防署", "phone": "042-554-0119", "address": "東京都羽村市緑ケ丘2-19-3", "hours": "24時間", "services": ["火災通報", "救急車"]}],
+                "ガス": [{"name": "東京ガス羽村支店", "phone": "0570-002211", "address": "東京都羽村市緑ケ丘1-7-6", "hours": "平日 8:30-19:00", "services": ["ガス開栓", "緊急通報"]}],
+                "電力": [{"name": "東京電力パワーグリッド青梅支社", "phone": "0120-995-007", "address": "東京都青梅市本町134", "hours": "平日 9:00-17:00", "services": ["停電情報", "電気工事"]}],
+                "病院": [{"name": "羽村三慶病院", "phone": "042-570-0311", "address": "東京都羽村市はむら町132", "hours": "24時間救急", "services": ["総合診療", "救急医療"]}],
+                "保健所": [{"name": "西多摩保健所", "phone": "0428-22-6141", "address": "東京都青梅市東青梅2-235", "hours": "平日 9:00-17:00", "services": ["健康相談", "予防接種"]}],
+                "水道": [{"name": "東京都水道局多摩お客さまセンター", "phone": "0570-091-100", "address": "東京都立川市錦町6-3-1", "hours": "平日 8:30-20:00", "services": ["水道開栓", "料金"]}],
+                "NTT": [{"name": "NTT東日本東京支店", "phone": "116", "address": "東京都新宿区西新宿3-19-2", "hours": "平日 9:00-17:00", "services": ["電話工事", "故障修理"]}],
+                "下水道": [{"name": "東京都下水道局八王子管理事務所", "phone": "042-645-4031", "address": "東京都八王子市北野町596-2", "hours": "平日 8:30-17:15", "services": ["下水道修理", "排水設備"]}]
+            }
+        },
+        "あきる野市": {
+            "": {
+                "労基署": [{"name": "青梅労働基準監督署", "phone": "0428-22-0285", "address": "東京都青梅市東青梅2-6-2", "hours": "平日 8:30-17:15", "services": ["労働相談", "労災申請"]}],
+                "警察署": [{"name": "五日市警察署", "phone": "042-595-0110", "address": "東京都あきる野市五日市411", "hours": "24時間", "services": ["事件事故", "遺失物"]}],
+                "市区町村役所": [
+                    {"name": "あきる野市役所", "phone": "042-558-1111", "address": "東京都あきる野市二宮350", "hours": "平日 8:30-17:15", "services": ["住民票", "戸籍"]},
+                    {"name": "あきる野市生活環境部", "phone": "042-558-1830", "address": "東京都あきる野市二宮350", "hours": "平日 8:30-17:15", "services": ["ごみ収集", "リサイクル", "環境対策"]}
+                ],
+                "消防署": [{"name": "あきる野消防署", "phone": "042-596-0119", "address": "東京都あきる野市秋川1-8-1", "hours": "24時間", "services": ["火災通報", "救急車"]}],
+                "ガス": [{"name": "東京ガスあきる野支店", "phone": "0570-002211", "address": "東京都あきる野市秋川1-2-5", "hours": "平日 8:30-19:00", "services": ["ガス開栓", "緊急通報"]}],
+                "電力": [{"name": "東京電力パワーグリッド青梅支社", "phone": "0120-995-007", "address": "東京都青梅市本町134", "hours": "平日 9:00-17:00", "services": ["停電情報", "電気工事"]}],
+                "病院": [{"name": "公立阿伎留医療センター", "phone": "042-558-0321", "address": "東京都あきる野市引田78-1", "hours": "24時間救急", "services": ["総合診療", "救急医療"]}],
+                "保健所": [{"name": "西多摩保健所", "phone": "0428-22-6141", "address": "東京都青梅市東青梅2-235", "hours": "平日 9:00-17:00", "services": ["健康相談", "予防接種"]}],
+                "水道": [{"name": "東京都水道局多摩お客さまセンター", "phone": "0570-091-100", "address": "東京都立川市錦町6-3-1", "hours": "平日 8:30-20:00", "services": ["水道開栓", "料金"]}],
+                "NTT": [{"name": "NTT東日本東京支店", "phone": "116", "address": "東京都新宿区西新宿3-19-2", "hours": "平日 9:00-17:00", "services": ["電話工事", "故障修理"]}],
+                "下水道": [{"name": "東京都下水道局八王子管理事務所", "phone": "042-645-4031", "address": "東京都八王子市北野町596-2", "hours": "平日 8:30-17:15", "services": ["下水道修理", "排水設備"]}]
+            }
+        },
+        "西東京市": {
+            "": {
+                "労基署": [{"name": "立川労働基準監督署", "phone": "042-523-4472", "address": "東京都立川市緑町4-2", "hours": "平日 8:30-17:15", "services": ["労働相談", "労災申請"]}],
+                "警察署": [{"name": "田無警察署", "phone": "042-467-0110", "address": "東京都西東京市南町4-2-16", "hours": "24時間", "services": ["事件事故", "遺失物"]}],
+                "市区町村役所": [
+                    {"name": "西東京市役所", "phone": "042-464-1311", "address": "東京都西東京市南町5-6-13", "hours": "平日 8:30-17:00", "services": ["住民票", "戸籍"]},
+                    {"name": "西東京市環境部", "phone": "042-438-4042", "address": "東京都西東京市南町5-6-13", "hours": "平日 8:30-17:00", "services": ["ごみ収集", "リサイクル", "環境対策"]}
+                ],
+                "消防署": [{"name": "田無消防署", "phone": "042-461-0119", "address": "東京都西東京市南町4-2-15", "hours": "24時間", "services": ["火災通報", "救急車"]}],
+                "ガス": [{"name": "東京ガス田無支店", "phone": "0570-002211", "address": "東京都西東京市田無町4-2-7", "hours": "平日 8:30-19:00", "services": ["ガス開栓", "緊急通報"]}],
+                "電力": [{"name": "東京電力パワーグリッド立川支社", "phone": "0120-995-007", "address": "東京都立川市曙町2-22-20", "hours": "平日 9:00-17:00", "services": ["停電情報", "電気工事"]}],
+                "病院": [{"name": "佐々総合病院", "phone": "042-461-1535", "address": "東京都西東京市田無町4-24-15", "hours": "24時間救急", "services": ["総合診療", "救急医療"]}],
+                "保健所": [{"name": "多摩府中保健所", "phone": "042-362-2334", "address": "東京都府中市宮西町1-26-1", "hours": "平日 9:00-17:00", "services": ["健康相談", "予防接種"]}],
+                "水道": [{"name": "東京都水道局多摩お客さまセンター", "phone": "0570-091-100", "address": "東京都立川市錦町6-3-1", "hours": "平日 8:30-20:00", "services": ["水道開栓", "料金"]}],
+                "NTT": [{"name": "NTT東日本東京支店", "phone": "116", "address": "東京都新宿区西新宿3-19-2", "hours": "平日 9:00-17:00", "services": ["電話工事", "故障修理"]}],
+                "下水道": [{"name": "東京都下水道局北多摩一号水再生センター", "phone": "042-524-3393", "address": "東京都府中市小柳町6-600", "hours": "平日 8:30-17:15", "services": ["下水道修理", "排水設備"]}]
+            }
+        },
+        "奥多摩町": {
+            "": {
+                "労基署": [{"name": "青梅労働基準監督署", "phone": "0428-22-0285", "address": "青梅市東青梅4-16-12", "hours": "平日 8:30-17:15", "services": ["労働相談", "労災申請"]}],
+                "警察署": [{"name": "青梅警察署奥多摩駐在所", "phone": "0428-83-2004", "address": "西多摩郡奥多摩町氷川1628", "hours": "24時間", "services": ["事件事故", "遺失物"]}],
+                "市区町村役所": [
+                    {"name": "奥多摩町役場", "phone": "0428-83-2111", "address": "西多摩郡奥多摩町氷川215-6", "hours": "平日 8:30-17:15", "services": ["住民票", "戸籍"]},
+                    {"name": "奥多摩町環境整備課", "phone": "0428-83-2777", "address": "西多摩郡奥多摩町氷川215-6", "hours": "平日 8:30-17:15", "services": ["ごみ収集", "リサイクル", "環境対策"]}
+                ],
+                "消防署": [{"name": "西多摩消防署奥多摩出張所", "phone": "0428-83-2119", "address": "西多摩郡奥多摩町氷川2587", "hours": "24時間", "services": ["火災通報", "救急車"]}],
+                "ガス": [{"name": "青梅ガス奥多摩営業所", "phone": "0428-78-9621", "address": "西多摩郡奥多摩町氷川1678", "hours": "平日 8:30-17:00", "services": ["ガス開栓", "緊急通報"]}],
+                "電力": [{"name": "東京電力パワーグリッド青梅支社", "phone": "0120-995-007", "address": "青梅市東青梅1-2-5", "hours": "平日 9:00-17:00", "services": ["停電情報", "電気工事"]}],
+                "病院": [{"name": "奥多摩病院", "phone": "0428-83-2182", "address": "西多摩郡奥多摩町氷川1985", "hours": "平日 8:30-17:00", "services": ["内科", "外科"]}],
+                "保健所": [{"name": "西多摩保健所", "phone": "0428-22-6141", "address": "青梅市東青梅1-2-5", "hours": "平日 9:00-17:00", "services": ["健康相談", "予防接種"]}],
+                "水道": [{"name": "東京都水道局奥多摩営業所", "phone": "0428-83-2174", "address": "西多摩郡奥多摩町氷川876", "hours": "平日 8:30-17:15", "services": ["水道開栓", "料金"]}],
+                "NTT": [{"name": "NTT東日本東京支店", "phone": "116", "address": "東京都新宿区西新宿3-19-2", "hours": "平日 9:00-17:00", "services": ["電話工事", "故障修理"]}],
+                "下水道": [{"name": "奥多摩町下水道課", "phone": "0428-83-2777", "address": "西多摩郡奥多摩町氷川215-6", "hours": "平日 8:30-17:15", "services": ["下水道修理", "排水設備"]}]
+            }
+        },
+        "檜原村": {
+            "": {
+                "労基署": [{"name": "青梅労働基準監督署", "phone": "0428-22-0285", "address": "青梅市東青梅4-16-12", "hours": "平日 8:30-17:15", "services": ["労働相談", "労災申請"]}],
+                "警察署": [{"name": "青梅警察署檜原駐在所", "phone": "042-598-0004", "address": "西多摩郡檜原村3221", "hours": "平日 8:30-17:15", "services": ["事件事故", "遺失物"]}],
+                "市区町村役所": [
+                    {"name": "檜原村役場", "phone": "042-598-1011", "address": "西多摩郡檜原村467-1", "hours": "平日 8:30-17:15", "services": ["住民票", "戸籍"]},
+                    {"name": "檜原村産業環境課", "phone": "042-598-1011", "address": "西多摩郡檜原村467-1", "hours": "平日 8:30-17:15", "services": ["ごみ収集", "リサイクル", "環境対策"]}
+                ],
+                "消防署": [{"name": "西多摩消防署檜原出張所", "phone": "042-598-0119", "address": "西多摩郡檜原村598-1", "hours": "24時間", "services": ["火災通報", "救急車"]}],
+                "ガス": [{"name": "青梅ガス檜原営業所", "phone": "042-598-0621", "address": "西多摩郡檜原村3221", "hours": "平日 8:30-17:00", "services": ["ガス開栓", "緊急通報"]}],
+                "電力": [{"name": "東京電力パワーグリッド青梅支社", "phone": "0120-995-007", "address": "青梅市東青梅1-2-5", "hours": "平日 9:00-17:00", "services": ["停電情報", "電気工事"]}],
+                "病院": [{"name": "檜原診療所", "phone": "042-598-0083", "address": "西多摩郡檜原村467-1", "hours": "平日 9:00-12:00 13:00-17:00", "services": ["内科", "小児科"]}],
+                "保健所": [{"name": "西多摩保健所", "phone": "0428-22-6141", "address": "青梅市東青梅1-2-5", "hours": "平日 9:00-17:00", "services": ["健康相談", "予防接種"]}],
+                "水道": [{"name": "檜原村上下水道課", "phone": "042-598-1011", "address": "西多摩郡檜原村467-1", "hours": "平日 8:30-17:15", "services": ["水道開栓", "料金"]}],
+                "NTT": [{"name": "NTT東日本東京支店", "phone": "116", "address": "東京都新宿区西新宿3-19-2", "hours": "平日 9:00-17:00", "services": ["電話工事", "故障修理"]}],
+                "下水道": [{"name": "檜原村上下水道課", "phone": "042-598-1011", "address": "西多摩郡檜原村467-1", "hours": "平日 8:30-17:15", "services": ["下水道修理", "排水設備"]}]
+            }
+        }
+    },
+    "千葉県": {
+        "千葉市": {
+            "中央区": {
+                "労基署": [{"name": "千葉労働基準監督署", "phone": "043-221-2303", "address": "千葉市中央区中央4-11-1", "hours": "平日 8:30-17:15", "services": ["労働相談", "労災申請"]}],
+                "警察署": [{"name": "千葉中央警察署", "phone": "043-244-0110", "address": "千葉市中央区中央港1-21-1", "hours": "24時間", "services": ["事件事故", "遺失物"]}],
+                "市区町村役所": [
+                    {"name": "千葉市役所", "phone": "043-245-5111", "address": "千葉市中央区千葉港1-1", "hours": "平日 8:30-17:30", "services": ["住民票", "戸籍"]},
+                    {"name": "千葉市環境局", "phone": "043-245-5185", "address": "千葉市中央区千葉港1-1", "hours": "平日 8:30-17:30", "services": ["ごみ収集", "リサイクル", "環境対策"]}
+                ],
+                "消防署": [{"name": "千葉市消防局", "phone": "043-202-1611", "address": "千葉市中央区長洲1-2-1", "hours": "24時間", "services": ["火災通報", "救急車"]}],
+                "ガス": [{"name": "京葉ガス千葉営業所", "phone": "047-361-0211", "address": "千葉市中央区中央2-5-1", "hours": "平日 9:00-17:00", "services": ["ガス開栓", "緊急通報"]}],
+                "電力": [{"name": "東京電力パワーグリッド千葉支社", "phone": "0120-995-006", "address": "千葉市中央区中央1-11-1", "hours": "平日 9:00-17:00", "services": ["停電情報", "電気工事"]}],
+                "病院": [{"name": "千葉大学医学部附属病院", "phone": "043-222-7171", "address": "千葉市中央区亥鼻1-8-1", "hours": "24時間救急", "services": ["総合診療", "救急医療"]}],
+                "保健所": [{"name": "千葉市保健所", "phone": "043-238-9925", "address": "千葉市中央区千葉港2-1", "hours": "平日 8:30-17:30", "services": ["健康相談", "予防接種"]}],
+                "水道": [{"name": "千葉市水道局", "phone": "043-211-8111", "address": "千葉市中央区千葉港1-1", "hours": "平日 8:30-17:30", "services": ["水道開栓", "料金"]}],
+                "NTT": [{"name": "NTT東日本千葉支店", "phone": "116", "address": "千葉市中央区新町1000", "hours": "平日 9:00-17:00", "services": ["電話工事", "故障修理"]}],
+                "下水道": [{"name": "千葉市下水道局", "phone": "043-245-5411", "address": "千葉市中央区千葉港1-1", "hours": "平日 8:30-17:30", "services": ["下水道修理", "排水設備"]}]
+            }
+        },
+        "船橋市": {
+            "": {
+                "労基署": [{"name": "船橋労働基準監督署", "phone": "047-431-0182", "address": "船橋市湊町2-10-17", "hours": "平日 8:30-17:15", "services": ["労働相談", "労災申請"]}],
+                "警察署": [{"name": "船橋警察署", "phone": "047-435-0110", "address": "船橋市湊町2-4-1", "hours": "24時間", "services": ["事件事故", "遺失物"]}],
+                "市区町村役所": [{"name": "船橋市役所", "phone": "047-436-2111", "address": "船橋市湊町2-10-25", "hours": "平日 9:00-17:00", "services": ["住民票", "戸籍"]}],
+                "消防署": [{"name": "船橋市消防局", "phone": "047-435-8651", "address": "船橋市湊町2-8-40", "hours": "24時間", "services": ["火災通報", "救急車"]}],
+                "ガス": [{"name": "京葉ガス船橋営業所", "phone": "047-431-3251", "address": "船橋市本町1-32-25", "hours": "平日 9:00-17:00", "services": ["ガス開栓", "緊急通報"]}],
+                "電力": [{"name": "東京電力パワーグリッド船橋支社", "phone": "0120-995-006", "address": "船橋市本町4-44-35", "hours": "平日 9:00-17:00", "services": ["停電情報", "電気工事"]}],
+                "病院": [{"name": "船橋市立医療センター", "phone": "047-438-3321", "address": "船橋市金杉1-21-1", "hours": "24時間救急", "services": ["総合診療", "救急医療"]}],
+                "保健所": [{"name": "船橋市保健所", "phone": "047-431-4161", "address": "船橋市湊町2-10-25", "hours": "平日 9:00-17:00", "services": ["健康相談", "予防接種"]}],
+                "水道": [{"name": "船橋市上下水道局", "phone": "047-436-2511", "address": "船橋市湊町2-10-25", "hours": "平日 9:00-17:00", "services": ["水道開栓", "料金"]}],
+                "NTT": [{"name": "NTT東日本千葉支店", "phone": "116", "address": "千葉市中央区新町1000", "hours": "平日 9:00-17:00", "services": ["電話工事", "故障修理"]}],
+                "下水道": [{"name": "船橋市上下水道局", "phone": "047-436-2651", "address": "船橋市湊町2-10-25", "hours": "平日 9:00-17:00", "services": ["下水道修理", "排水設備"]}]
+            }
+        },
+        "成田市": {
+            "": {
+                "労基署": [{"name": "千葉労働基準監督署", "phone": "043-221-2304", "address": "千葉市中央区中央4-11-1", "hours": "平日 8:30-17:15", "services": ["労働相談", "労災申請"]}],
+                "警察署": [{"name": "成田警察署", "phone": "0476-27-0110", "address": "成田市加良部3-4-2", "hours": "24時間", "services": ["事件事故", "遺失物"]}],
+                "市区町村役所": [
+                    {"name": "成田市役所", "phone": "0476-22-1111", "address": "成田市花崎町760", "hours": "平日 8:30-17:15", "services": ["住民票", "戸籍"]},
+                    {"name": "成田市環境部", "phone": "0476-20-1531", "address": "成田市花崎町760", "hours": "平日 8:30-17:15", "services": ["ごみ収集", "リサイクル", "環境対策"]}
+                ],
+                "消防署": [{"name": "成田市消防本部", "phone": "0476-20-1591", "address": "成田市田町299-2", "hours": "24時間", "services": ["火災通報", "救急車"]}],
+                "ガス": [{"name": "京葉ガス成田営業所", "phone": "0476-26-2111", "address": "成田市花崎町828-11", "hours": "平日 8:30-19:00", "services": ["ガス開栓", "緊急通報"]}],
+                "電力": [{"name": "東京電力パワーグリッド成田支社", "phone": "0120-995-007", "address": "成田市花崎町760", "hours": "平日 9:00-17:00", "services": ["停電情報", "電気工事"]}],
+                "病院": [{"name": "成田赤十字病院", "phone": "0476-22-2311", "address": "成田市飯田町90-1", "hours": "24時間救急", "services": ["総合診療", "救急医療"]}],
+                "保健所": [{"name": "印旛保健所", "phone": "043-483-1133", "address": "佐倉市鏑木仲田町8-1", "hours": "平日 9:00-17:00", "services": ["健康相談", "予防接種"]}],
+                "水道": [{"name": "成田市上下水道部", "phone": "0476-22-0269", "address": "成田市花崎町760", "hours": "平日 8:30-17:15", "services": ["水道開栓", "料金"]}],
+                "NTT": [{"name": "NTT東日本千葉支店", "phone": "116", "address": "千葉市中央区新町1000", "hours": "平日 9:00-17:00", "services": ["電話工事", "故障修理"]}],
+                "下水道": [{"name": "成田市上下水道部", "phone": "0476-22-0279", "address": "成田市花崎町760", "hours": "平日 8:30-17:15", "services": ["下水道修理", "排水設備"]}]
+            }
+        },
+        "佐倉市": {
+            "": {
+                "労基署": [{"name": "千葉労働基準監督署", "phone": "043-221-2304", "address": "千葉市中央区中央4-11-1", "hours": "平日 8:30-17:15", "services": ["労働相談", "労災申請"]}],
+                "警察署": [{"name": "佐倉警察署", "phone": "043-484-0110", "address": "佐倉市表町1-20-3", "hours": "24時間", "services": ["事件事故", "遺失物"]}],
+                "市区町村役所": [
+                    {"name": "佐倉市役所", "phone": "043-484-1111", "address": "佐倉市海隣寺町97", "hours": "平日 8:30-17:15", "services": ["住民票", "戸籍"]},
+                    {"name": "佐倉市環境部", "phone": "043-484-6148", "address": "佐倉市海隣寺町97", "hours": "平日 8:30-17:15", "services": ["ごみ収集", "リサイクル", "環境対策"]}
+                ],
+                "消防署": [{"name": "佐倉市八街市酒々井町消防組合", "phone": "043-481-0119", "address": "佐倉市本町12", "hours": "24時間", "services": ["火災通報", "救急車"]}],
+                "ガス": [{"name": "京葉ガス佐倉営業所", "phone": "043-461-3211", "address": "佐倉市王子台1-23", "hours": "平日 8:30-19:00", "services": ["ガス開栓", "緊急通報"]}],
+                "電力": [{"name": "東京電力パワーグリッド千葉支社", "phone": "0120-995-007", "address": "千葉市中央区中央2-6-1", "hours": "平日 9:00-17:00", "services": ["停電情報", "電気工事"]}],
+                "病院": [{"name": "東邦大学医療センター佐倉病院", "phone": "043-462-8811", "address": "佐倉市下志津564-1", "hours": "24時間救急", "services": ["総合診療", "救急医療"]}],
+                "保健所": [{"name": "印旛保健所", "phone": "043-483-1133", "address": "佐倉市鏑木仲田町8-1", "hours": "平日 9:00-17:00", "services": ["健康相談", "予防接種"]}],
+                "水道": [{"name": "佐倉市上下水道部", "phone": "043-461-8718", "address": "佐倉市海隣寺町97", "hours": "平日 8:30-17:15", "services": ["水道開栓", "料金"]}],
+                "NTT": [{"name": "NTT東日本千葉支店", "phone": "116", "address": "千葉市中央区新町1000", "hours": "平日 9:00-17:00", "services": ["電話工事", "故障修理"]}],
+                "下水道": [{"name": "佐倉市上下水道部", "phone": "043-461-8720", "address": "佐倉市海隣寺町97", "hours": "平日 8:30-17:15", "services": ["下水道修理", "排水設備"]}]
+            }
+        },
+        "東金市": {
+            "": {
+                "労基署": [{"name": "千葉労働基準監督署", "phone": "043-221-2304", "address": "千葉市中央区中央4-11-1", "hours": "平日 8:30-17:15", "services": ["労働相談", "労災申請"]}],
+                "警察署": [{"name": "東金警察署", "phone": "0475-54-0110", "address": "東金市東岩崎1-20", "hours": "24時間", "services": ["事件事故", "遺失物"]}],
+                "市区町村役所": [
+                    {"name": "東金市役所", "phone": "0475-50-1111", "address": "東金市東岩崎1-1", "hours": "平日 8:30-17:15", "services": ["住民票", "戸籍"]},
+                    {"name": "東金市環境保全課", "phone": "0475-50-1170", "address": "東金市東岩崎1-1", "hours": "平日 8:30-17:15", "services": ["ごみ収集", "リサイクル", "環境対策"]}
+                ],
+                "消防署": [{"name": "山武郡市広域行政組合消防本部", "phone": "0475-52-8792", "address": "東金市家徳38-1", "hours": "24時間", "services": ["火災通報", "救急車"]}],
+                "ガス": [{"name": "京葉ガス東金営業所", "phone": "0475-54-1515", "address": "東金市東岩崎8-10", "hours": "平日 8:30-19:00", "services": ["ガス開栓", "緊急通報"]}],
+                "電力": [{"name": "東京電力パワーグリッド千葉支社", "phone": "0120-995-007", "address": "千葉市中央区中央2-6-1", "hours": "平日 9:00-17:00", "services": ["停電情報", "電気工事"]}],
+                "病院": [{"name": "東千葉メディカルセンター", "phone": "0475-50-1199", "address": "東金市丘山台3-6-2", "hours": "24時間救急", "services": ["総合診療", "救急医療"]}],
+                "保健所": [{"name": "山武保健所", "phone": "0475-54-0611", "address": "東金市東新宿1-11", "hours": "平日 9:00-17:00", "services": ["健康相談", "予防接種"]}],
+                "水道": [{"name": "東金市上下水道課", "phone": "0475-50-1161", "address": "東金市東岩崎1-1", "hours": "平日 8:30-17:15", "services": ["水道開栓", "料金"]}],
+                "NTT": [{"name": "NTT東日本千葉支店", "phone": "116", "address": "千葉市中央区新町1000", "hours": "平日 9:00-17:00", "services": ["電話工事", "故障修理"]}],
+                "下水道": [{"name": "東金市上下水道課", "phone": "0475-50-1162", "address": "東金市東岩崎1-1", "hours": "平日 8:30-17:15", "services": ["下水道修理", "排水設備"]}]
+            }
+        },
+        "旭市": {
+            "": {
+                "労基署": [{"name": "銚子労働基準監督署", "phone": "0479-22-7174", "address": "銚子市西芝町2-12", "hours": "平日 8:30-17:15", "services": ["労働相談", "労災申請"]}],
+                "警察署": [{"name": "旭警察署", "phone": "0479-64-0110", "address": "旭市ニ2557", "hours": "24時間", "services": ["事件事故", "遺失物"]}],
+                "市区町村役所": [
+                    {"name": "旭市役所", "phone": "0479-62-1212", "address": "旭市ニ1920", "hours": "平日 8:30-17:15", "services": ["住民票", "戸籍"]},
+                    {"name": "旭市環境課", "phone": "0479-62-5328", "address": "旭市ニ1920", "hours": "平日 8:30-17:15", "services": ["ごみ収集", "リサイクル", "環境対策"]}
+                ],
+                "消防署": [{"name": "旭市消防本部", "phone": "0479-64-0119", "address": "旭市ニ2787", "hours": "24時間", "services": ["火災通報", "救急車"]}],
+                "ガス": [{"name": "京葉ガス旭営業所", "phone": "0479-62-1291", "address": "旭市ロ1004-1", "hours": "平日 8:30-19:00", "services": ["ガス開栓", "緊急通報"]}],
+                "電力": [{"name": "東京電力パワーグリッド千葉支社", "phone": "0120-995-007", "address": "千葉市中央区中央2-6-1", "hours": "平日 9:00-17:00", "services": ["停電情報", "電気工事"]}],
+                "病院": [{"name": "旭中央病院", "phone": "0479-63-8111", "address": "旭市イ1326", "hours": "24時間救急", "services": ["総合診療", "救急医療"]}],
+                "保健所": [{"name": "海匝保健所", "phone": "0479-22-0206", "address": "銚子市東芝町2-8", "hours": "平日 9:00-17:00", "services": ["健康相談", "予防接種"]}],
+                "水道": [{"name": "旭市上下水道課", "phone": "0479-62-5318", "address": "旭市ニ1920", "hours": "平日 8:30-17:15", "services": ["水道開栓", "料金"]}],
+                "NTT": [{"name": "NTT東日本千葉支店", "phone": "116", "address": "千葉市中央区新町1000", "hours": "平日 9:00-17:00", "services": ["電話工事", "故障修理"]}],
+                "下水道": [{"name": "旭市上下水道課", "phone": "0479-62-5319", "address": "旭市ニ1920", "hours": "平日 8:30-17:15", "services": ["下水道修理", "排水設備"]}]
+            }
+        },
+        "習志野市": {
+            "": {
+                "労基署": [{"name": "船橋労働基準監督署", "phone": "047-431-0182", "address": "船橋市湊町2-10-17", "hours": "平日 8:30-17:15", "services": ["労働相談", "労災申請"]}],
+                "警察署": [{"name": "習志野警察署", "phone": "047-474-0110", "address": "習志野市津田沼5-12-41", "hours": "24時間", "services": ["事件事故", "遺失物"]}],
+                "市区町村役所": [
+                    {"name": "習志野市役所", "phone": "047-451-1151", "address": "習志野市鷺沼2-1-1", "hours": "平日 8:30-17:00", "services": ["住民票", "戸籍"]},
+                    {"name": "習志野市環境政策課", "phone": "047-453-7384", "address": "習志野市鷺沼2-1-1", "hours": "平日 8:30-17:00", "services": ["ごみ収集", "リサイクル", "環境対策"]}
+                ],
+                "消防署": [{"name": "習志野市消防本部", "phone": "047-452-1283", "address": "習志野市鷺沼2-1-43", "hours": "24時間", "services": ["火災通報", "救急車"]}],
+                "ガス": [{"name": "京葉ガス習志野営業所", "phone": "047-451-3181", "address": "習志野市津田沼1-2-8", "hours": "平日 8:30-19:00", "services": ["ガス開栓", "緊急通報"]}],
+                "電力": [{"name": "東京電力パワーグリッド千葉支社", "phone": "0120-995-007", "address": "千葉市中央区中央2-6-1", "hours": "平日 9:00-17:00", "services": ["停電情報", "電気工事"]}],
+                "病院": [{"name": "習志野第一病院", "phone": "047-473-3111", "address": "習志野市津田沼5-5-25", "hours": "24時間救急", "services": ["総合診療", "救急医療"]}],
+                "保健所": [{"name": "習志野保健所", "phone": "047-475-5154", "address": "習志野市鷺沼2-1-1", "hours": "平日 9:00-17:00", "services": ["健康相談", "予防接種"]}],
+                "水道": [{"name": "習志野市企業局", "phone": "047-475-3321", "address": "習志野市鷺沼2-1-1", "hours": "平日 8:30-17:00", "services": ["水道開栓", "料金"]}],
+                "NTT": [{"name": "NTT東日本千葉支店", "phone": "116", "address": "千葉市中央区新町1000", "hours": "平日 9:00-17:00", "services": ["電話工事", "故障修理"]}],
+                "下水道": [{"name": "習志野市企業局", "phone": "047-475-3322", "address": "習志野市鷺沼2-1-1", "hours": "平日 8:30-17:00", "services": ["下水道修理", "排水設備"]}]
+            }
+        },
+        "流山市": {
+            "": {
+                "労基署": [{"name": "柏労働基準監督署", "phone": "04-7148-9012", "address": "柏市若柴69-1", "hours": "平日 8:30-17:15", "services": ["労働相談", "労災申請"]}],
+                "警察署": [{"name": "流山警察署", "phone": "04-7159-0110", "address": "流山市平和台1-2-1", "hours": "24時間", "services": ["事件事故", "遺失物"]}],
+                "市区町村役所": [
+                    {"name": "流山市役所", "phone": "04-7158-1111", "address": "流山市平和台1-1-1", "hours": "平日 8:30-17:15", "services": ["住民票", "戸籍"]},
+                    {"name": "流山市環境政策・放射能対策課", "phone": "04-7150-6083", "address": "流山市平和台1-1-1", "hours": "平日 8:30-17:15", "services": ["ごみ収集", "リサイクル", "環境対策"]}
+                ],
+                "消防署": [{"name": "流山市消防本部", "phone": "04-7158-0119", "address": "流山市平和台2-1-2", "hours": "24時間", "services": ["火災通報", "救急車"]}],
+                "ガス": [{"name": "東京ガス流山営業所", "phone": "0570-002211", "address": "流山市おおたかの森北1-4-1", "hours": "平日 8:30-19:00", "services": ["ガス開栓", "緊急通報"]}],
+                "電力": [{"name": "東京電力パワーグリッド千葉支社", "phone": "0120-995-007", "address": "千葉市中央区中央2-6-1", "hours": "平日 9:00-17:00", "services": ["停電情報", "電気工事"]}],
+                "病院": [{"name": "東葛病院", "phone": "04-7159-1011", "address": "流山市中102-1", "hours": "24時間救急", "services": ["総合診療", "救急医療"]}],
+                "保健所": [{"name": "松戸保健所", "phone": "047-361-2121", "address": "松戸市小根本7", "hours": "平日 9:00-17:00", "services": ["健康相談", "予防接種"]}],
+                "水道": [{"name": "流山市上下水道局", "phone": "04-7159-5251", "address": "流山市平和台1-1-1", "hours": "平日 8:30-17:15", "services": ["水道開栓", "料金"]}],
+                "NTT": [{"name": "NTT東日本千葉支店", "phone": "116", "address": "千葉市中央区新町1000", "hours": "平日 9:00-17:00", "services": ["電話工事", "故障修理"]}],
+                "下水道": [{"name": "流山市上下水道局", "phone": "04-7159-5252", "address": "流山市平和台1-1-1", "hours": "平日 8:30-17:15", "services": ["下水道修理", "排水設備"]}]
+            }
+        },
+        "八千代市": {
+            "": {
+                "労基署": [{"name": "船橋労働基準監督署", "phone": "047-431-0182", "address": "船橋市湊町2-10-17", "hours": "平日 8:30-17:15", "services": ["労働相談", "労災申請"]}],
+                "警察署": [{"name": "八千代警察署", "phone": "047-486-0110", "address": "八千代市大和田新田312-40", "hours": "24時間", "services": ["事件事故", "遺失物"]}],
+                "市区町村役所": [
+                    {"name": "八千代市役所", "phone": "047-483-1151", "address": "八千代市大和田新田312-5", "hours": "平日 8:30-17:00", "services": ["住民票", "戸籍"]},
+                    {"name": "八千代市環境保全課", "phone": "047-483-1151", "address": "八千代市大和田新田312-5", "hours": "平日 8:30-17:00", "services": ["ごみ収集", "リサイクル", "環境対策"]}
+                ],
+                "消防署": [{"name": "八千代市消防本部", "phone": "047-459-2441", "address": "八千代市大和田新田186", "hours": "24時間", "services": ["火災通報", "救急車"]}],
+                "ガス": [{"name": "京葉ガス八千代営業所", "phone": "047-484-2211", "address": "八千代市大和田新田312", "hours": "平日 8:30-19:00", "services": ["ガス開栓", "緊急通報"]}],
+                "電力": [{"name": "東京電力パワーグリッド千葉支社", "phone": "0120-995-007", "address": "千葉市中央区中央2-6-1", "hours": "平日 9:00-17:00", "services": ["停電情報", "電気工事"]}],
+                "病院": [{"name": "八千代医療センター", "phone": "047-458-7711", "address": "八千代市大和田新田477-96", "hours": "24時間救急", "services": ["総合診療", "救急医療"]}],
+                "保健所": [{"name": "習志野保健所", "phone": "047-475-5154", "address": "習志野市鷺沼2-1-1", "hours": "平日 9:00-17:00", "services": ["健康相談", "予防接種"]}],
+                "水道": [{"name": "八千代市上下水道局", "phone": "047-483-6572", "address": "八千代市大和田新田312-5", "hours": "平日 8:30-17:00", "services": ["水道開栓", "料金"]}],
+                "NTT": [{"name": "NTT東日本千葉支店", "phone": "116", "address": "千葉市中央区新町1000", "hours": "平日 9:00-17:00", "services": ["電話工事", "故障修理"]}],
+                "下水道": [{"name": "八千代市上下水道局", "phone": "047-483-6573", "address": "八千代市大和田新田312-5", "hours": "平日 8:30-17:00", "services": ["下水道修理", "排水設備"]}]
+            }
+        },
+        "我孫子市": {
+            "": {
+                "労基署": [{"name": "柏労働基準監督署", "phone": "04-7148-9012", "address": "柏市若柴69-1", "hours": "平日 8:30-17:15", "services": ["労働相談", "労災申請"]}],
+                "警察署": [{"name": "我孫子警察署", "phone": "04-7182-0110", "address": "我孫子市本町2-1-17", "hours": "24時間", "services": ["事件事故", "遺失物"]}],
+                "市区町村役所": [
+                    {"name": "我孫子市役所", "phone": "04-7185-1111", "address": "我孫子市我孫子1858", "hours": "平日 8:30-17:00", "services": ["住民票", "戸籍"]},
+                    {"name": "我孫子市手賀沼課", "phone": "04-7185-1484", "address": "我孫子市我孫子1858", "hours": "平日 8:30-17:00", "services": ["ごみ収集", "リサイクル", "環境対策"]}
+                ],
+                "消防署": [{"name": "我孫子市消防本部", "phone": "04-7184-0119", "address": "我孫子市中峠2570", "hours": "24時間", "services": ["火災通報", "救急車"]}],
+                "ガス": [{"name": "東京ガス我孫子営業所", "phone": "0570-002211", "address": "我孫子市本町2-4-3", "hours": "平日 8:30-19:00", "services": ["ガス開栓", "緊急通報"]}],
+                "電力": [{"name": "東京電力パワーグリッド千葉支社", "phone": "0120-995-007", "address": "千葉市中央区中央2-6-1", "hours": "平日 9:00-17:00", "services": ["停電情報", "電気工事"]}],
+                "病院": [{"name": "我孫子東邦病院", "phone": "04-7182-8166", "address": "我孫子市我孫子1851-1", "hours": "平日 9:00-17:00", "services": ["内科", "外科"]}],
+                "保健所": [{"name": "松戸保健所", "phone": "047-361-2121", "address": "松戸市小根本7", "hours": "平日 9:00-17:00", "services": ["健康相談", "予防接種"]}],
+                "水道": [{"name": "我孫子市水道局", "phone": "04-7184-0114", "address": "我孫子市中峠372", "hours": "平日 8:30-17:00", "services": ["水道開栓", "料金"]}],
+                "NTT": [{"name": "NTT東日本千葉支店", "phone": "116", "address": "千葉市中央区新町1000", "hours": "平日 9:00-17:00", "services": ["電話工事", "故障修理"]}],
+                "下水道": [{"name": "我孫子市下水道課", "phone": "04-7185-1482", "address": "我孫子市我孫子1858", "hours": "平日 8:30-17:00", "services": ["下水道修理", "排水設備"]}]
+            }
+        },
+        "鴨川市": {
+            "": {
+                "労基署": [{"name": "木更津労働基準監督署", "phone": "0438-25-2561", "address": "木更津市新田2-4-31", "hours": "平日 8:30-17:15", "services": ["労働相談", "労災申請"]}],
+                "警察署": [{"name": "鴨川警察署", "phone": "04-7092-0110", "address": "鴨川市横渚1026-3", "hours": "24時間", "services": ["事件事故", "遺失物"]}],
+                "市区町村役所": [
+                    {"name": "鴨川市役所", "phone": "04-7093-7800", "address": "鴨川市横渚1450", "hours": "平日 8:30-17:15", "services": ["住民票", "戸籍"]},
+                    {"name": "鴨川市環境課", "phone": "04-7093-7838", "address": "鴨川市横渚1450", "hours": "平日 8:30-17:15", "services": ["ごみ収集", "リサイクル", "環境対策"]}
+                ],
+                "消防署": [{"name": "鴨川市消防本部", "phone": "04-7093-0119", "address": "鴨川市横渚925", "hours": "24時間", "services": ["火災通報", "救急車"]}],
+                "ガス": [{"name": "LPガス協会安房支部", "phone": "0470-22-2209", "address": "館山市北条1062", "hours": "平日 8:30-17:00", "services": ["ガス開栓", "緊急通報"]}],
+                "電力": [{"name": "東京電力パワーグリッド木更津支社", "phone": "0120-995-007", "address": "木更津市新田2-7-1", "hours": "平日 9:00-17:00", "services": ["停電情報", "電気工事"]}],
+                "病院": [{"name": "亀田総合病院", "phone": "04-7092-2211", "address": "鴨川市東町929", "hours": "24時間救急", "services": ["総合診療", "救急医療"]}],
+                "保健所": [{"name": "安房保健所", "phone": "0470-22-4511", "address": "館山市北条1093-1", "hours": "平日 9:00-17:00", "services": ["健康相談", "予防接種"]}],
+                "水道": [{"name": "鴨川市上下水道課", "phone": "04-7093-7837", "address": "鴨川市横渚1450", "hours": "平日 8:30-17:15", "services": ["水道開栓", "料金"]}],
+                "NTT": [{"name": "NTT東日本千葉支店", "phone": "116", "address": "千葉市中央区新町1000", "hours": "平日 9:00-17:00", "services": ["電話工事", "故障修理"]}],
+                "下水道": [{"name": "鴨川市上下水道課", "phone": "04-7093-7836", "address": "鴨川市横渚1450", "hours": "平日 8:30-17:15", "services": ["下水道修理", "排水設備"]}]
+            }
+        },
+        "鎌ケ谷市": {
+            "": {
+                "労基署": [{"name": "船橋労働基準監督署", "phone": "047-431-0182", "address": "船橋市湊町2-10-17", "hours": "平日 8:30-17:15", "services": ["労働相談", "労災申請"]}],
+                "警察署": [{"name": "鎌ケ谷警察署", "phone": "047-444-0110", "address": "鎌ケ谷市丸山3-15-8", "hours": "24時間", "services": ["事件事故", "遺失物"]}],
+                "市区町村役所": [
+                    {"name": "鎌ケ谷市役所", "phone": "047-445-1141", "address": "鎌ケ谷市新鎌ケ谷2-6-1", "hours": "平日 8:30-17:00", "services": ["住民票", "戸籍"]},
+                    {"name": "鎌ケ谷市環境課", "phone": "047-445-1227", "address": "鎌ケ谷市新鎌ケ谷2-6-1", "hours": "平日 8:30-17:00", "services": ["ごみ収集", "リサイクル", "環境対策"]}
+                ],
+                "消防署": [{"name": "鎌ケ谷市消防本部", "phone": "047-444-3222", "address": "鎌ケ谷市初富133", "hours": "24時間", "services": ["火災通報", "救急車"]}],
+                "ガス": [{"name": "東京ガス鎌ケ谷営業所", "phone": "0570-002211", "address": "鎌ケ谷市新鎌ケ谷1-7-30", "hours": "平日 8:30-19:00", "services": ["ガス開栓", "緊急通報"]}],
+                "電力": [{"name": "東京電力パワーグリッド千葉支社", "phone": "0120-995-007", "address": "千葉市中央区中央2-6-1", "hours": "平日 9:00-17:00", "services": ["停電情報", "電気工事"]}],
+                "病院": [{"name": "鎌ケ谷総合病院", "phone": "047-498-8111", "address": "鎌ケ谷市初富929-6", "hours": "24時間救急", "services": ["総合診療", "救急医療"]}],
+                "保健所": [{"name": "習志野保健所", "phone": "047-475-5154", "address": "習志野市鷺沼2-1-1", "hours": "平日 9:00-17:00", "services": ["健康相談", "予防接種"]}],
+                "水道": [{"name": "鎌ケ谷市上下水道課", "phone": "047-445-1141", "address": "鎌ケ谷市新鎌ケ谷2-6-1", "hours": "平日 8:30-17:00", "services": ["水道開栓", "料金"]}],
+                "NTT": [{"name": "NTT東日本千葉支店", "phone": "116", "address": "千葉市中央区新町1000", "hours": "平日 9:00-17:00", "services": ["電話工事", "故障修理"]}],
+                "下水道": [{"name": "鎌ケ谷市上下水道課", "phone": "047-445-1142", "address": "鎌ケ谷市新鎌ケ谷2-6-1", "hours": "平日 8:30-17:00", "services": ["下水道修理", "排水設備"]}]
+            }
+        },
+        "君津市": {
+            "": {
+                "労基署": [{"name": "木更津労働基準監督署", "phone": "0438-25-2561", "address": "木更津市新田2-4-31", "hours": "平日 8:30-17:15", "services": ["労働相談", "労災申請"]}],
+                "警察署": [{"name": "君津警察署", "phone": "0439-54-0110", "address": "君津市久保1-1-22", "hours": "24時間", "services": ["事件事故", "遺失物"]}],
+                "市区町村役所": [
+                    {"name": "君津市役所", "phone": "0439-56-1581", "address": "君津市久保2-13-1", "hours": "平日 8:30-17:15", "services": ["住民票", "戸籍"]},
+                    {"name": "君津市環境衛生課", "phone": "0439-56-1290", "address": "君津市久保2-13-1", "hours": "平日 8:30-17:15", "services": ["ごみ収集", "リサイクル", "環境対策"]}
+                ],
+                "消防署": [{"name": "君津市消防本部", "phone": "0439-53-0119", "address": "君津市久保1-5-1", "hours": "24時間", "services": ["火災通報", "救急車"]}],
+                "ガス": [{"name": "LPガス協会君津支部", "phone": "0439-52-6211", "address": "君津市人見4-2-35", "hours": "平日 8:30-17:00", "services": ["ガス開栓", "緊急通報"]}],
+                "電力": [{"name": "東京電力パワーグリッド木更津支社", "phone": "0120-995-007", "address": "木更津市新田2-7-1", "hours": "平日 9:00-17:00", "services": ["停電情報", "電気工事"]}],
+                "病院": [{"name": "君津中央病院", "phone": "0439-57-2111", "address": "君津市鎌足2-8-1", "hours": "24時間救急", "services": ["総合診療", "救急医療"]}],
+                "保健所": [{"name": "君津保健所", "phone": "0438-22-3745", "address": "木更津市貝渕3-13-34", "hours": "平日 9:00-17:00", "services": ["健康相談", "予防接種"]}],
+                "水道": [{"name": "君津市上下水道部", "phone": "0439-56-1439", "address": "君津市久保2-13-1", "hours": "平日 8:30-17:15", "services": ["水道開栓", "料金"]}],
+                "NTT": [{"name": "NTT東日本千葉支店", "phone": "116", "address": "千葉市中央区新町1000", "hours": "平日 9:00-17:00", "services": ["電話工事", "故障修理"]}],
+                "下水道": [{"name": "君津市上下水道部", "phone": "0439-56-1440", "address": "君津市久保2-13-1", "hours": "平日 8:30-17:15", "services": ["下水道修理", "排水設備"]}]
+            }
+        },
+        "富津市": {
+            "": {
+                "労基署": [{"name": "木更津労働基準監督署", "phone": "0438-25-2561", "address": "木更津市新田2-4-31", "hours": "平日 8:30-17:15", "services": ["労働相談", "労災申請"]}],
+                "警察署": [{"name": "富津警察署", "phone": "0439-87-0110", "address": "富津市大堀1-11-1", "hours": "24時間", "services": ["事件事故", "遺失物"]}],
+                "市区町村役所": [
+                    {"name": "富津市役所", "phone": "0439-80-1210", "address": "富津市下飯野2443", "hours": "平日 8:30-17:15", "services": ["住民票", "戸籍"]},
+                    {"name": "富津市環境保全課", "phone": "0439-80-1288", "address": "富津市下飯野2443", "hours": "平日 8:30-17:15", "services": ["ごみ収集", "リサイクル", "環境対策"]}
+                ],
+                "消防署": [{"name": "富津市消防本部", "phone": "0439-87-0119", "address": "富津市大堀1786", "hours": "24時間", "services": ["火災通報", "救急車"]}],
+                "ガス": [{"name": "LPガス協会富津支部", "phone": "0439-65-2221", "address": "富津市青木1-5-1", "hours": "平日 8:30-17:00", "services": ["ガス開栓", "緊急通報"]}],
+                "電力": [{"name": "東京電力パワーグリッド木更津支社", "phone": "0120-995-007", "address": "木更津市新田2-7-1", "hours": "平日 9:00-17:00", "services": ["停電情報", "電気工事"]}],
+                "病院": [{"name": "富津市立国保天羽病院", "phone": "0439-65-1251", "address": "富津市青木1008", "hours": "平日 9:00-17:00", "services": ["内科", "外科"]}],
+                "保健所": [{"name": "君津保健所", "phone": "0438-22-3745", "address": "木更津市貝渕3-13-34", "hours": "平日 9:00-17:00", "services": ["健康相談", "予防接種"]}],
+                "水道": [{"name": "富津市上下水道課", "phone": "0439-80-1286", "address": "富津市下飯野2443", "hours": "平日 8:30-17:15", "services": ["水道開栓", "料金"]}],
+                "NTT": [{"name": "NTT東日本千葉支店", "phone": "116", "address": "千葉市中央区新町1000", "hours": "平日 9:00-17:00", "services": ["電話工事", "故障修理"]}],
+                "下水道": [{"name": "富津市上下水道課", "phone": "0439-80-1287", "address": "富津市下飯野2443", "hours": "平日 8:30-17:15", "services": ["下水道修理", "排水設備"]}]
+            }
+        },
+        "浦安市": {
+            "": {
+                "労基署": [{"name": "船橋労働基準監督署", "phone": "047-431-0182", "address": "船橋市湊町2-10-17", "hours": "平日 8:30-17:15", "services": ["労働相談", "労災申請"]}],
+                "警察署": [{"name": "浦安警察署", "phone": "047-350-0110", "address": "浦安市猫実1-2-1", "hours": "24時間", "services": ["事件事故", "遺失物"]}],
+                "市区町村役所": [
+                    {"name": "浦安市役所", "phone": "047-351-1111", "address": "浦安市猫実1-1-1", "hours": "平日 8:30-17:00", "services": ["住民票", "戸籍"]},
+                    {"name": "浦安市環境保全課", "phone": "047-712-6314", "address": "浦安市猫実1-1-1", "hours": "平日 8:30-17:00", "services": ["ごみ収集", "リサイクル", "環境対策"]}
+                ],
+                "消防署": [{"name": "浦安市消防本部", "phone": "047-304-0119", "address": "浦安市猫実1-19-22", "hours": "24時間", "services": ["火災通報", "救急車"]}],
+                "ガス": [{"name": "東京ガス浦安営業所", "phone": "0570-002211", "address": "浦安市入船1-5-2", "hours": "平日 8:30-19:00", "services": ["ガス開栓", "緊急通報"]}],
+                "電力": [{"name": "東京電力パワーグリッド千葉支社", "phone": "0120-995-007", "address": "千葉市中央区中央2-6-1", "hours": "平日 9:00-17:00", "services": ["停電情報", "電気工事"]}],
+                "病院": [{"name": "順天堂大学医学部附属浦安病院", "phone": "047-353-3111", "address": "浦安市富岡2-1-1", "hours": "24時間救急", "services": ["総合診療", "救急医療"]}],
+                "保健所": [{"name": "市川保健所", "phone": "047-377-1103", "address": "市川市南八幡4-18-8", "hours": "平日 9:00-17:00", "services": ["健康相談", "予防接種"]}],
+                "水道": [{"name": "浦安市上下水道部", "phone": "047-381-9211", "address": "浦安市猫実1-1-1", "hours": "平日 8:30-17:00", "services": ["水道開栓", "料金"]}],
+                "NTT": [{"name": "NTT東日本千葉支店", "phone": "116", "address": "千葉市中央区新町1000", "hours": "平日 9:00-17:00", "services": ["電話工事", "故障修理"]}],
+                "下水道": [{"name": "浦安市上下水道部", "phone": "047-381-9212", "address": "浦安市猫実1-1-1", "hours": "平日 8:30-17:00", "services": ["下水道修理", "排水設備"]}]
+            }
+        },
+        "四街道市": {
+            "": {
+                "労基署": [{"name": "千葉労働基準監督署", "phone": "043-221-2304", "address": "千葉市中央区中央4-11-1", "hours": "平日 8:30-17:15", "services": ["労働相談", "労災申請"]}],
+                "警察署": [{"name": "四街道警察署", "phone": "043-432-0110", "address": "四街道市鹿渡809-3", "hours": "24時間", "services": ["事件事故", "遺失物"]}],
+                "市区町村役所": [
+                    {"name": "四街道市役所", "phone": "043-421-2111", "address": "四街道市鹿渡無番地", "hours": "平日 8:30-17:15", "services": ["住民票", "戸籍"]},
+                    {"name": "四街道市環境政策課", "phone": "043-421-6131", "address": "四街道市鹿渡無番地", "hours": "平日 8:30-17:15", "services": ["ごみ収集", "リサイクル", "環境対策"]}
+                ],
+                "消防署": [{"name": "四街道市消防本部", "phone": "043-422-2445", "address": "四街道市美しが丘1-17-2", "hours": "24時間", "services": ["火災通報", "救急車"]}],
+                "ガス": [{"name": "京葉ガス四街道営業所", "phone": "043-421-3111", "address": "四街道市鹿渡2002-8", "hours": "平日 8:30-19:00", "services": ["ガス開栓", "緊急通報"]}],
+                "電力": [{"name": "東京電力パワーグリッド千葉支社", "phone": "0120-995-007", "address": "千葉市中央区中央2-6-1", "hours": "平日 9:00-17:00", "services": ["停電情報", "電気工事"]}],
+                "病院": [{"name": "四街道徳洲会病院", "phone": "043-214-0111", "address": "四街道市吉岡1830-1", "hours": "24時間救急", "services": ["総合診療", "救急医療"]}],
+                "保健所": [{"name": "印旛保健所", "phone": "043-483-1133", "address": "佐倉市鏑木仲田町8-1", "hours": "平日 9:00-17:00", "services": ["健康相談", "予防接種"]}],
+                "水道": [{"name": "四街道市上下水道課", "phone": "043-421-6135", "address": "四街道市鹿渡無番地", "hours": "平日 8:30-17:15", "services": ["水道開栓", "料金"]}],
+                "NTT": [{"name": "NTT東日本千葉支店", "phone": "116", "address": "千葉市中央区新町1000", "hours": "平日 9:00-17:00", "services": ["電話工事", "故障修理"]}],
+                "下水道": [{"name": "四街道市上下水道課", "phone": "043-421-6136", "address": "四街道市鹿渡無番地", "hours": "平日 8:30-17:15", "services": ["下水道修理", "排水設備"]}]
+            }
+        },
+        "袖ヶ浦市": {
+            "": {
+                "労基署": [{"name": "木更津労働基準監督署", "phone": "0438-25-2561", "address": "木更津市新田2-4-31", "hours": "平日 8:30-17:15", "services": ["労働相談", "労災申請"]}],
+                "警察署": [{"name": "袖ヶ浦警察署", "phone": "0438-63-0110", "address": "袖ケ浦市坂戸市場1570", "hours": "24時間", "services": ["事件事故", "遺失物"]}],
+                "市区町村役所": [
+                    {"name": "袖ケ浦市役所", "phone": "0438-62-2111", "address": "袖ケ浦市坂戸市場1-1", "hours": "平日 8:30-17:15", "services": ["住民票", "戸籍"]},
+                    {"name": "袖ケ浦市環境管理課", "phone": "0438-62-3404", "address": "袖ケ浦市坂戸市場1-1", "hours": "平日 8:30-17:15", "services": ["ごみ収集", "リサイクル", "環境対策"]}
+                ],
+                "消防署": [{"name": "袖ケ浦市消防本部", "phone": "0438-64-0119", "address": "袖ケ浦市坂戸市場1554", "hours": "24時間", "services": ["火災通報", "救急車"]}],
+                "ガス": [{"name": "LPガス協会袖ケ浦支部", "phone": "0438-62-7311", "address": "袖ケ浦市福王台2-2-1", "hours": "平日 8:30-17:00", "services": ["ガス開栓", "緊急通報"]}],
+                "電力": [{"name": "東京電力パワーグリッド木更津支社", "phone": "0120-995-007", "address": "木更津市新田2-7-1", "hours": "平日 9:00-17:00", "services": ["停電情報", "電気工事"]}],
+                "病院": [{"name": "袖ケ浦さつき台病院", "phone": "0438-60-1777", "address": "袖ケ浦市長浦駅前8-2-7", "hours": "平日 9:00-17:00", "services": ["内科", "外科"]}],
+                "保健所": [{"name": "君津保健所", "phone": "0438-22-3745", "address": "木更津市貝渕3-13-34", "hours": "平日 9:00-17:00", "services": ["健康相談", "予防接種"]}],
+                "水道": [{"name": "袖ケ浦市上下水道課", "phone": "0438-62-3281", "address": "袖ケ浦市坂戸市場1-1", "hours": "平日 8:30-17:15", "services": ["水道開栓", "料金"]}],
+                "NTT": [{"name": "NTT東日本千葉支店", "phone": "116", "address": "千葉市中央区新町1000", "hours": "平日 9:00-17:00", "services": ["電話工事", "故障修理"]}],
+                "下水道": [{"name": "袖ケ浦市上下水道課", "phone": "0438-62-3282", "address": "袖ケ浦市坂戸市場1-1", "hours": "平日 8:30-17:15", "services": ["下水道修理", "排水設備"]}]
+            }
+        },
+        "八街市": {
+            "": {
+                "労基署": [{"name": "千葉労働基準監督署", "phone": "043-221-2304", "address": "千葉市中央区中央4-11-1", "hours": "平日 8:30-17:15", "services": ["労働相談", "労災申請"]}],
+                "警察署": [{"name": "佐倉警察署", "phone": "043-484-0110", "address": "佐倉市表町1-20-3", "hours": "24時間", "services": ["事件事故", "遺失物"]}],
+                "市区町村役所": [
+                    {"name": "八街市役所", "phone": "043-443-1111", "address": "八街市八街ほ35-29", "hours": "平日 8:30-17:15", "services": ["住民票", "戸籍"]},
+                    {"name": "八街市環境課", "phone": "043-443-1406", "address": "八街市八街ほ35-29", "hours": "平日 8:30-17:15", "services": ["ごみ収集", "リサイクル", "環境対策"]}
+                ],
+                "消防署": [{"name": "佐倉市八街市酒々井町消防組合", "phone": "043-444-0119", "address": "八街市八街ほ666", "hours": "24時間", "services": ["火災通報", "救急車"]}],
+                "ガス": [{"name": "京葉ガス八街営業所", "phone": "043-444-1211", "address": "八街市八街ほ143-55", "hours": "平日 8:30-19:00", "services": ["ガス開栓", "緊急通報"]}],
+                "電力": [{"name": "東京電力パワーグリッド千葉支社", "phone": "0120-995-007", "address": "千葉市中央区中央2-6-1", "hours": "平日 9:00-17:00", "services": ["停電情報", "電気工事"]}],
+                "病院": [{"name": "総合病院国保旭中央病院八街総合診療科", "phone": "043-444-1221", "address": "八街市八街ほ137", "hours": "平日 9:00-17:00", "services": ["内科", "外科"]}],
+                "保健所": [{"name": "印旛保健所", "phone": "043-483-1133", "address": "佐倉市鏑木仲田町8-1", "hours": "平日 9:00-17:00", "services": ["健康相談", "予防接種"]}],
+                "水道": [{"name": "八街市上下水道課", "phone": "043-443-1404", "address": "八街市八街ほ35-29", "hours": "平日 8:30-17:15", "services": ["水道開栓", "料金"]}],
+                "NTT": [{"name": "NTT東日本千葉支店", "phone": "116", "address": "千葉市中央区新町1000", "hours": "平日 9:00-17:00", "services": ["電話工事", "故障修理"]}],
+                "下水道": [{"name": "八街市上下水道課", "phone": "043-443-1405", "address": "八街市八街ほ35-29", "hours": "平日 8:30-17:15", "services": ["下水道修理", "排水設備"]}]
+            }
+        },
+        "印西市": {
+            "": {
+                "労基署": [{"name": "千葉労働基準監督署", "phone": "043-221-2304", "address": "千葉市中央区中央4-11-1", "hours": "平日 8:30-17:15", "services": ["労働相談", "労災申請"]}],
+                "警察署": [{"name": "印西警察署", "phone": "0476-42-0110", "address": "印西市原1-2", "hours": "24時間", "services": ["事件事故", "遺失物"]}],
+                "市区町村役所": [
+                    {"name": "印西市役所", "phone": "0476-42-5111", "address": "印西市大森2364-2", "hours": "平日 8:30-17:15", "services": ["住民票", "戸籍"]},
+                    {"name": "印西市環境保全課", "phone": "0476-33-4491", "address": "印西市大森2364-2", "hours": "平日 8:30-17:15", "services": ["ごみ収集", "リサイクル", "環境対策"]}
+                ],
+                "消防署": [{"name": "印西地区消防組合", "phone": "0476-46-9911", "address": "印西市美瀬1-25", "hours": "24時間", "services": ["火災通報", "救急車"]}],
+                "ガス": [{"name": "京葉ガス印西営業所", "phone": "0476-42-3711", "address": "印西市原1-2", "hours": "平日 8:30-19:00", "services": ["ガス開栓", "緊急通報"]}],
+                "電力": [{"name": "東京電力パワーグリッド千葉支社", "phone": "0120-995-007", "address": "千葉市中央区中央2-6-1", "hours": "平日 9:00-17:00", "services": ["停電情報", "電気工事"]}],
+                "病院": [{"name": "日本医科大学千葉北総病院", "phone": "0476-99-1111", "address": "印西市鎌苅1715", "hours": "24時間救急", "services": ["総合診療", "救急医療"]}],
+                "保健所": [{"name": "印旛保健所", "phone": "043-483-1133", "address": "佐倉市鏑木仲田町8-1", "hours": "平日 9:00-17:00", "services": ["健康相談", "予防接種"]}],
+                "水道": [{"name": "印西市上下水道課", "phone": "0476-33-4430", "address": "印西市大森2364-2", "hours": "平日 8:30-17:15", "services": ["水道開栓", "料金"]}],
+                "NTT": [{"name": "NTT東日本千葉支店", "phone": "116", "address": "千葉市中央区新町1000", "hours": "平日 9:00-17:00", "services": ["電話工事", "故障修理"]}],
+                "下水道": [{"name": "印西市上下水道課", "phone": "0476-33-4431", "address": "印西市大森2364-2", "hours": "平日 8:30-17:15", "services": ["下水道修理", "排水設備"]}]
+            }
+        },
+        "白井市": {
+            "": {
+                "労基署": [{"name": "船橋労働基準監督署", "phone": "047-431-0182", "address": "船橋市湊町2-10-17", "hours": "平日 8:30-17:15", "services": ["労働相談", "労災申請"]}],
+                "警察署": [{"name": "印西警察署", "phone": "0476-42-0110", "address": "印西市原1-2", "hours": "24時間", "services": ["事件事故", "遺失物"]}],
+                "市区町村役所": [
+                    {"name": "白井市役所", "phone": "047-492-1111", "address": "白井市復1123", "hours": "平日 8:30-17:15", "services": ["住民票", "戸籍"]},
+                    {"name": "白井市環境課", "phone": "047-401-4679", "address": "白井市復1123", "hours": "平日 8:30-17:15", "services": ["ごみ収集", "リサイクル", "環境対策"]}
+                ],
+                "消防署": [{"name": "印西地区消防組合白井消防署", "phone": "047-491-4511", "address": "白井市堀込1-2-1", "hours": "24時間", "services": ["火災通報", "救急車"]}],
+                "ガス": [{"name": "京葉ガス白井営業所", "phone": "047-492-3111", "address": "白井市冨士129-28", "hours": "平日 8:30-19:00", "services": ["ガス開栓", "緊急通報"]}],
+                "電力": [{"name": "東京電力パワーグリッド千葉支社", "phone": "0120-995-007", "address": "千葉市中央区中央2-6-1", "hours": "平日 9:00-17:00", "services": ["停電情報", "電気工事"]}],
+                "病院": [{"name": "白井聖仁会病院", "phone": "047-491-3111", "address": "白井市笹塚3-25-2", "hours": "平日 9:00-17:00", "services": ["内科", "外科"]}],
+                "保健所": [{"name": "印旛保健所", "phone": "043-483-1133", "address": "佐倉市鏑木仲田町8-1", "hours": "平日 9:00-17:00", "services": ["健康相談", "予防接種"]}],
+                "水道": [{"name": "白井市上下水道課", "phone": "047-401-4277", "address": "白井市復1123", "hours": "平日 8:30-17:15", "services": ["水道開栓", "料金"]}],
+                "NTT": [{"name": "NTT東日本千葉支店", "phone": "116", "address": "千葉市中央区新町1000", "hours": "平日 9:00-17:00", "services": ["電話工事", "故障修理"]}],
+                "下水道": [{"name": "白井市上下水道課", "phone": "047-401-4278", "address": "白井市復1123", "hours": "平日 8:30-17:15", "services": ["下水道修理", "排水設備"]}]
+            }
+        },
+        "富里市": {
+            "": {
+                "労基署": [{"name": "千葉労働基準監督署", "phone": "043-221-2304", "address": "千葉市中央区中央4-11-1", "hours": "平日 8:30-17:15", "services": ["労働相談", "労災申請"]}],
+                "警察署": [{"name": "成田警察署", "phone": "0476-27-0110", "address": "成田市加良部3-4-2", "hours": "24時間", "services": ["事件事故", "遺失物"]}],
+                "市区町村役所": [
+                    {"name": "富里市役所", "phone": "0476-93-1111", "address": "富里市七栄652-1", "hours": "平日 8:30-17:15", "services": ["住民票", "戸籍"]},
+                    {"name": "富里市環境課", "phone": "0476-93-4945", "address": "富里市七栄652-1", "hours": "平日 8:30-17:15", "services": ["ごみ収集", "リサイクル", "環境対策"]}
+                ],
+                "消防署": [{"name": "富里市消防本部", "phone": "0476-92-1311", "address": "富里市七栄525-1", "hours": "24時間", "services": ["火災通報", "救急車"]}],
+                "ガス": [{"name": "京葉ガス富里営業所", "phone": "0476-93-2211", "address": "富里市七栄298-67", "hours": "平日 8:30-19:00", "services": ["ガス開栓", "緊急通報"]}],
+                "電力": [{"name": "東京電力パワーグリッド成田支社", "phone": "0120-995-007", "address": "成田市花崎町760", "hours": "平日 9:00-17:00", "services": ["停電情報", "電気工事"]}],
+                "病院": [{"name": "富里市立富里病院", "phone": "0476-93-1661", "address": "富里市日吉台1-1-1", "hours": "平日 9:00-17:00", "services": ["内科", "外科"]}],
+                "保健所": [{"name": "印旛保健所", "phone": "043-483-1133", "address": "佐倉市鏑木仲田町8-1", "hours": "平日 9:00-17:00", "services": ["健康相談", "予防接種"]}],
+                "水道": [{"name": "富里市上下水道課", "phone": "0476-93-4946", "address": "富里市七栄652-1", "hours": "平日 8:30-17:15", "services": ["水道開栓", "料金"]}],
+                "NTT": [{"name": "NTT東日本千葉支店", "phone": "116", "address": "千葉市中央区新町1000", "hours": "平日 9:00-17:00", "services": ["電話工事", "故障修理"]}],
+                "下水道": [{"name": "富里市上下水道課", "phone": "0476-93-4947", "address": "富里市七栄652-1", "hours": "平日 8:30-17:15", "services": ["下水道修理", "排水設備"]}]
+            }
+        },
+        "南房総市": {
+            "": {
+                "労基署": [{"name": "木更津労働基準監督署", "phone": "0438-25-2561", "address": "木更津市新田2-4-31", "hours": "平日 8:30-17:15", "services": ["労働相談", "労災申請"]}],
+                "警察署": [{"name": "館山警察署", "phone": "0470-22-0110", "address": "館山市北条402-1", "hours": "24時間", "services": ["事件事故", "遺失物"]}],
+                "市区町村役所": [
+                    {"name": "南房総市役所", "phone": "0470-33-1001", "address": "南房総市富浦町青木28", "hours": "平日 8:30-17:15", "services": ["住民票", "戸籍"]},
+                    {"name": "南房総市環境保全課", "phone": "0470-33-1053", "address": "南房総市富浦町青木28", "hours": "平日 8:30-17:15", "services": ["ごみ収集", "リサイクル", "環境対策"]}
+                ],
+                "消防署": [{"name": "南房総市消防本部", "phone": "0470-36-2119", "address": "南房総市富浦町青木123-1", "hours": "24時間", "services": ["火災通報", "救急車"]}],
+                "ガス": [{"name": "LPガス協会安房支部", "phone": "0470-22-2209", "address": "館山市北条1062", "hours": "平日 8:30-17:00", "services": ["ガス開栓", "緊急通報"]}],
+                "電力": [{"name": "東京電力パワーグリッド館山支社", "phone": "0120-995-007", "address": "館山市北条1879-2", "hours": "平日 9:00-17:00", "services": ["停電情報", "電気工事"]}],
+                "病院": [{"name": "安房地域医療センター", "phone": "0470-25-5111", "address": "館山市山本1155", "hours": "24時間救急", "services": ["総合診療", "救急医療"]}],
+                "保健所": [{"name": "安房保健所", "phone": "0470-22-4511", "address": "館山市北条1093-1", "hours": "平日 9:00-17:00", "services": ["健康相談", "予防接種"]}],
+                "水道": [{"name": "南房総市上下水道課", "phone": "0470-33-1052", "address": "南房総市富浦町青木28", "hours": "平日 8:30-17:15", "services": ["水道開栓", "料金"]}],
+                "NTT": [{"name": "NTT東日本千葉支店", "phone": "116", "address": "千葉市中央区新町1000", "hours": "平日 9:00-17:00", "services": ["電話工事", "故障修理"]}],
+                "下水道": [{"name": "南房総市上下水道課", "phone": "0470-33-1051", "address": "南房総市富浦町青木28", "hours": "平日 8:30-17:15", "services": ["下水道修理", "排水設備"]}]
+            }
+        },
+        "匝瑳市": {
+            "": {
+                "労基署": [{"name": "銚子労働基準監督署", "phone": "0479-22-7174", "address": "銚子市西芝町2-12", "hours": "平日 8:30-17:15", "services": ["労働相談", "労災申請"]}],
+                "警察署": [{"name": "匝瑳警察署", "phone": "0479-72-0110", "address": "匝瑳市八日市場ハ678", "hours": "24時間", "services": ["事件事故", "遺失物"]}],
+                "市区町村役所": [
+                    {"name": "匝瑳市役所", "phone": "0479-73-0087", "address": "匝瑳市八日市場ハ793-2", "hours": "平日 8:30-17:15", "services": ["住民票", "戸籍"]},
+                    {"name": "匝瑳市環境生活課", "phone": "0479-73-0088", "address": "匝瑳市八日市場ハ793-2", "hours": "平日 8:30-17:15", "services": ["ごみ収集", "リサイクル", "環境対策"]}
+                ],
+                "消防署": [{"name": "匝瑳市消防本部", "phone": "0479-72-0119", "address": "匝瑳市八日市場ハ681", "hours": "24時間", "services": ["火災通報", "救急車"]}],
+                "ガス": [{"name": "LPガス協会匝瑳支部", "phone": "0479-72-1311", "address": "匝瑳市八日市場ハ793", "hours": "平日 8:30-17:00", "services": ["ガス開栓", "緊急通報"]}],
+                "電力": [{"name": "東京電力パワーグリッド千葉支社", "phone": "0120-995-007", "address": "千葉市中央区中央2-6-1", "hours": "平日 9:00-17:00", "services": ["停電情報", "電気工事"]}],
+                "病院": [{"name": "匝瑳市民病院", "phone": "0479-72-1525", "address": "匝瑳市八日市場イ1304", "hours": "平日 9:00-17:00", "services": ["内科", "外科"]}],
+                "保健所": [{"name": "海匝保健所", "phone": "0479-22-0206", "address": "銚子市東芝町2-8", "hours": "平日 9:00-17:00", "services": ["健康相談", "予防接種"]}],
+                "水道": [{"name": "匝瑳市上下水道課", "phone": "0479-73-0089", "address": "匝瑳市八日市場ハ793-2", "hours": "平日 8:30-17:15", "services": ["水道開栓", "料金"]}],
+                "NTT": [{"name": "NTT東日本千葉支店", "phone": "116", "address": "千葉市中央区新町1000", "hours": "平日 9:00-17:00", "services": ["電話工事", "故障修理"]}],
+                "下水道": [{"name": "匝瑳市上下水道課", "phone": "0479-73-0090", "address": "匝瑳市八日市場ハ793-2", "hours": "平日 8:30-17:15", "services": ["下水道修理", "排水設備"]}]
+            }
+        },
+        "香取市": {
+            "": {
+                "労基署": [{"name": "銚子労働基準監督署", "phone": "0479-22-7174", "address": "銚子市西芝町2-12", "hours": "平日 8:30-17:15", "services": ["労働相談", "労災申請"]}],
+                "警察署": [{"name": "香取警察署", "phone": "0478-54-0110", "address": "香取市佐原イ211", "hours": "24時間", "services": ["事件事故", "遺失物"]}],
+                "市区町村役所": [
+                    {"name": "香取市役所", "phone": "0478-50-1212", "address": "香取市佐原ロ2127", "hours": "平日 8:30-17:15", "services": ["住民票", "戸籍"]},
+                    {"name": "香取市環境安全課", "phone": "0478-50-1248", "address": "香取市佐原ロ2127", "hours": "平日 8:30-17:15", "services": ["ごみ収集", "リサイクル", "環境対策"]}
+                ],
+                "消防署": [{"name": "香取広域市町村圏事務組合消防本部", "phone": "0478-54-0119", "address": "香取市佐原イ211-1", "hours": "24時間", "services": ["火災通報", "救急車"]}],
+                "ガス": [{"name": "LPガス協会香取支部", "phone": "0478-52-4186", "address": "香取市佐原ロ2127", "hours": "平日 8:30-17:00", "services": ["ガス開栓", "緊急通報"]}],
+                "電力": [{"name": "東京電力パワーグリッド千葉支社", "phone": "0120-995-007", "address": "千葉市中央区中央2-6-1", "hours": "平日 9:00-17:00", "services": ["停電情報", "電気工事"]}],
+                "病院": [{"name": "小見川総合病院", "phone": "0478-82-3161", "address": "香取市小見川4631", "hours": "24時間救急", "services": ["総合診療", "救急医療"]}],
+                "保健所": [{"name": "香取保健所", "phone": "0478-52-9161", "address": "香取市佐原イ92-11", "hours": "平日 9:00-17:00", "services": ["健康相談", "予防接種"]}],
+                "水道": [{"name": "香取市上下水道課", "phone": "0478-50-1249", "address": "香取市佐原ロ2127", "hours": "平日 8:30-17:15", "services": ["水道開栓", "料金"]}],
+                "NTT": [{"name": "NTT東日本千葉支店", "phone": "116", "address": "千葉市中央区新町1000", "hours": "平日 9:00-17:00", "services": ["電話工事", "故障修理"]}],
+                "下水道": [{"name": "香取市上下水道課", "phone": "0478-50-1250", "address": "香取市佐原ロ2127", "hours": "平日 8:30-17:15", "services": ["下水道修理", "排水設備"]}]
+            }
+        },
+        "山武市": {
+            "": {
+                "労基署": [{"name": "千葉労働基準監督署", "phone": "043-221-2304", "address": "千葉市中央区中央4-11-1", "hours": "平日 8:30-17:15", "services": ["労働相談", "労災申請"]}],
+                "警察署": [{"name": "東金警察署", "phone": "0475-54-0110", "address": "東金市東岩崎1-20", "hours": "24時間", "services": ["事件事故", "遺失物"]}],
+                "市区町村役所": [
+                    {"name": "山武市役所", "phone": "0475-80-1111", "address": "山武市殿台296", "hours": "平日 8:30-17:15", "services": ["住民票", "戸籍"]},
+                    {"name": "山武市環境保全課", "phone": "0475-80-1163", "address": "山武市殿台296", "hours": "平日 8:30-17:15", "services": ["ごみ収集", "リサイクル", "環境対策"]}
+                ],
+                "消防署": [{"name": "山武郡市広域行政組合消防本部", "phone": "0475-52-8792", "address": "東金市家徳38-1", "hours": "24時間", "services": ["火災通報", "救急車"]}],
+                "ガス": [{"name": "LPガス協会山武支部", "phone": "0475-82-2311", "address": "山武市成東2551", "hours": "平日 8:30-17:00", "services": ["ガス開栓", "緊急通報"]}],
+                "電力": [{"name": "東京電力パワーグリッド千葉支社", "phone": "0120-995-007", "address": "千葉市中央区中央2-6-1", "hours": "平日 9:00-17:00", "services": ["停電情報", "電気工事"]}],
+                "病院": [{"name": "さんむ医療センター", "phone": "0475-82-2521", "address": "山武市成東167", "hours": "24時間救急", "services": ["総合診療", "救急医療"]}],
+                "保健所": [{"name": "山武保健所", "phone": "0475-54-0611", "address": "東金市東新宿1-11", "hours": "平日 9:00-17:00", "services": ["健康相談", "予防接種"]}],
+                "水道": [{"name": "山武市上下水道課", "phone": "0475-80-1164", "address": "山武市殿台296", "hours": "平日 8:30-17:15", "services": ["水道開栓", "料金"]}],
+                "NTT": [{"name": "NTT東日本千葉支店", "phone": "116", "address": "千葉市中央区新町1000", "hours": "平日 9:00-17:00", "services": ["電話工事", "故障修理"]}],
+                "下水道": [{"name": "山武市上下水道課", "phone": "0475-80-1165", "address": "山武市殿台296", "hours": "平日 8:30-17:15", "services": ["下水道修理", "排水設備"]}]
+            }
+        },
+        "いすみ市": {
+            "": {
+                "労基署": [{"name": "木更津労働基準監督署", "phone": "0438-25-2561", "address": "木更津市新田2-4-31", "hours": "平日 8:30-17:15", "services": ["労働相談", "労災申請"]}],
+                "警察署": [{"name": "茂原警察署", "phone": "0475-22-0110", "address": "茂原市高師1729", "hours": "24時間", "services": ["事件事故", "遺失物"]}],
+                "市区町村役所": [
+                    {"name": "いすみ市役所", "phone": "0470-62-1111", "address": "いすみ市大原7400-1", "hours": "平日 8:30-17:15", "services": ["住民票", "戸籍"]},
+                    {"name": "いすみ市環境水道課", "phone": "0470-62-1385", "address": "いすみ市大原7400-1", "hours": "平日 8:30-17:15", "services": ["ごみ収集", "リサイクル", "環境対策"]}
+                ],
+                "消防署": [{"name": "いすみ市消防本部", "phone": "0470-62-3119", "address": "いすみ市大原8927-3", "hours": "24時間", "services": ["火災通報", "救急車"]}],
+                "ガス": [{"name": "LPガス協会いすみ支部", "phone": "0470-62-1234", "address": "いすみ市大原7400", "hours": "平日 8:30-17:00", "services": ["ガス開栓", "緊急通報"]}],
+                "電力": [{"name": "東京電力パワーグリッド茂原支社", "phone": "0120-995-007", "address": "茂原市茂原661", "hours": "平日 9:00-17:00", "services": ["停電情報", "電気工事"]}],
+                "病院": [{"name": "国保国吉病院", "phone": "0470-86-3117", "address": "いすみ市苅谷1381", "hours": "平日 9:00-17:00", "services": ["内科", "外科"]}],
+                "保健所": [{"name": "長生保健所", "phone": "0475-22-5167", "address": "茂原市茂原1102-1", "hours": "平日 9:00-17:00", "services": ["健康相談", "予防接種"]}],
+                "水道": [{"name": "いすみ市環境水道課", "phone": "0470-62-1386", "address": "いすみ市大原7400-1", "hours": "平日 8:30-17:15", "services": ["水道開栓", "料金"]}],
+                "NTT": [{"name": "NTT東日本千葉支店", "phone": "116", "address": "千葉市中央区新町1000", "hours": "平日 9:00-17:00", "services": ["電話工事", "故障修理"]}],
+                "下水道": [{"name": "いすみ市環境水道課", "phone": "0470-62-1387", "address": "いすみ市大原7400-1", "hours": "平日 8:30-17:15", "services": ["下水道修理", "排水設備"]}]
+            }
+        },
+        "大網白里市": {
+            "": {
+                "労基署": [{"name": "千葉労働基準監督署", "phone": "043-221-2304", "address": "千葉市中央区中央4-11-1", "hours": "平日 8:30-17:15", "services": ["労働相談", "労災申請"]}],
+                "警察署": [{"name": "東金警察署", "phone": "0475-54-0110", "address": "東金市東岩崎1-20", "hours": "24時間", "services": ["事件事故", "遺失物"]}],
+                "市区町村役所": [
+                    {"name": "大網白里市役所", "phone": "0475-70-0300", "address": "大網白里市大網115-2", "hours": "平日 8:30-17:15", "services": ["住民票", "戸籍"]},
+                    {"name": "大網白里市地域づくり課", "phone": "0475-70-0342", "address": "大網白里市大網115-2", "hours": "平日 8:30-17:15", "services": ["ごみ収集", "リサイクル", "環境対策"]}
+                ],
+                "消防署": [{"name": "山武郡市広域行政組合消防本部大網白里消防署", "phone": "0475-72-0119", "address": "大網白里市大網121-2", "hours": "24時間", "services": ["火災通報", "救急車"]}],
+                "ガス": [{"name": "LPガス協会大網白里支部", "phone": "0475-72-1711", "address": "大網白里市大網100-2", "hours": "平日 8:30-17:00", "services": ["ガス開栓", "緊急通報"]}],
+                "電力": [{"name": "東京電力パワーグリッド千葉支社", "phone": "0120-995-007", "address": "千葉市中央区中央2-6-1", "hours": "平日 9:00-17:00", "services": ["停電情報", "電気工事"]}],
+                "病院": [{"name": "大網白里市国保大網病院", "phone": "0475-72-1121", "address": "大網白里市富田884-1", "hours": "平日 9:00-17:00", "services": ["内科", "外科"]}],
+                "保健所": [{"name": "山武保健所", "phone": "0475-54-0611", "address": "東金市東新宿1-11", "hours": "平日 9:00-17:00", "services": ["健康相談", "予防接種"]}],
+                "水道": [{"name": "大網白里市上下水道課", "phone": "0475-70-0394", "address": "大網白里市大網115-2", "hours": "平日 8:30-17:15", "services": ["水道開栓", "料金"]}],
+                "NTT": [{"name": "NTT東日本千葉支店", "phone": "116", "address": "千葉市中央区新町1000", "hours": "平日 9:00-17:00", "services": ["電話工事", "故障修理"]}],
+                "下水道": [{"name": "大網白里市上下水道課", "phone": "0475-70-0395", "address": "大網白里市大網115-2", "hours": "平日 8:30-17:15", "services": ["下水道修理", "排水設備"]}]
+            }
+        },
+        "酒々井町": {
+            "": {
+                "労基署": [{"name": "佐倉労働基準監督署", "phone": "043-484-6215", "address": "佐倉市鏑木町198-3", "hours": "平日 8:30-17:15", "services": ["労働相談", "労災申請"]}],
+                "警察署": [{"name": "佐倉警察署", "phone": "043-484-0110", "address": "佐倉市表町1-20-4", "hours": "24時間", "services": ["事件事故", "遺失物"]}],
+                "市区町村役所": [
+                    {"name": "酒々井町役場", "phone": "043-496-1171", "address": "印旛郡酒々井町中央台4-11", "hours": "平日 8:30-17:15", "services": ["住民票", "戸籍"]},
+                    {"name": "酒々井町住民課環境班", "phone": "043-496-1171", "address": "印旛郡酒々井町中央台4-11", "hours": "平日 8:30-17:15", "services": ["ごみ収集", "リサイクル", "環境対策"]}
+                ],
+                "消防署": [{"name": "佐倉市八街市酒々井町消防組合酒々井分署", "phone": "043-496-0119", "address": "印旛郡酒々井町中央台4-4-4", "hours": "24時間", "services": ["火災通報", "救急車"]}],
+                "ガス": [{"name": "京葉ガス佐倉営業所", "phone": "043-484-2711", "address": "佐倉市栄町20-1", "hours": "平日 8:30-19:00", "services": ["ガス開栓", "緊急通報"]}],
+                "電力": [{"name": "東京電力パワーグリッド千葉支社", "phone": "0120-995-007", "address": "千葉市中央区中央2-6-1", "hours": "平日 9:00-17:00", "services": ["停電情報", "電気工事"]}],
+                "病院": [{"name": "酒々井リハビリテーション病院", "phone": "043-496-8181", "address": "印旛郡酒々井町酒々井104-2", "hours": "平日 9:00-17:00", "services": ["リハビリ科", "内科"]}],
+                "保健所": [{"name": "印旛保健所", "phone": "043-483-1133", "address": "佐倉市鏑木仲田町8-1", "hours": "平日 9:00-17:00", "services": ["健康相談", "予防接種"]}],
+                "水道": [{"name": "酒々井町上下水道課", "phone": "043-496-1171", "address": "印旛郡酒々井町中央台4-11", "hours": "平日 8:30-17:15", "services": ["水道開栓", "料金"]}],
+                "NTT": [{"name": "NTT東日本千葉支店", "phone": "116", "address": "千葉市中央区新町1000", "hours": "平日 9:00-17:00", "services": ["電話工事", "故障修理"]}],
+                "下水道": [{"name": "酒々井町上下水道課", "phone": "043-496-1171", "address": "印旛郡酒々井町中央台4-11", "hours": "平日 8:30-17:15", "services": ["下水道修理", "排水設備"]}]
+            }
+        },
+        "栄町": {
+            "": {
+                "労基署": [{"name": "佐倉労働基準監督署", "phone": "043-484-6215", "address": "佐倉市鏑木町198-3", "hours": "平日 8:30-17:15", "services": ["労働相談", "労災申請"]}],
+                "警察署": [{"name": "成田警察署", "phone": "0476-27-0110", "address": "成田市加良部3-4", "hours": "24時間", "services": ["事件事故", "遺失物"]}],
+                "市区町村役所": [
+                    {"name": "栄町役場", "phone": "0476-95-1111", "address": "印旛郡栄町安食台1-2", "hours": "平日 8:30-17:15", "services": ["住民票", "戸籍"]},
+                    {"name": "栄町環境課", "phone": "0476-33-7719", "address": "印旛郡栄町安食台1-2", "hours": "平日 8:30-17:15", "services": ["ごみ収集", "リサイクル", "環境対策"]}
+                ],
+                "消防署": [{"name": "印旛地域消防組合栄分署", "phone": "0476-95-0119", "address": "印旛郡栄町安食1-18-7", "hours": "24時間", "services": ["火災通報", "救急車"]}],
+                "ガス": [{"name": "京葉ガス成田営業所", "phone": "0476-24-5361", "address": "成田市寺台219", "hours": "平日 8:30-19:00", "services": ["ガス開栓", "緊急通報"]}],
+                "電力": [{"name": "東京電力パワーグリッド千葉支社", "phone": "0120-995-007", "address": "千葉市中央区中央2-6-1", "hours": "平日 9:00-17:00", "services": ["停電情報", "電気工事"]}],
+                "病院": [{"name": "栄町国保診療所", "phone": "0476-95-2211", "address": "印旛郡栄町安食2421", "hours": "平日 8:30-17:00", "services": ["内科", "小児科"]}],
+                "保健所": [{"name": "印旛保健所", "phone": "043-483-1133", "address": "佐倉市鏑木仲田町8-1", "hours": "平日 9:00-17:00", "services": ["健康相談", "予防接種"]}],
+                "水道": [{"name": "栄町上下水道課", "phone": "0476-95-1111", "address": "印旛郡栄町安食台1-2", "hours": "平日 8:30-17:15", "services": ["水道開栓", "料金"]}],
+                "NTT": [{"name": "NTT東日本千葉支店", "phone": "116", "address": "千葉市中央区新町1000", "hours": "平日 9:00-17:00", "services": ["電話工事", "故障修理"]}],
+                "下水道": [{"name": "栄町上下水道課", "phone": "0476-95-1111", "address": "印旛郡栄町安食台1-2", "hours": "平日 8:30-17:15", "services": ["下水道修理", "排水設備"]}]
+            }
+        },
+        "神崎町": {
+            "": {
+                "労基署": [{"name": "佐原労働基準監督署", "phone": "0478-54-1744", "address": "香取市北1-3-2", "hours": "平日 8:30-17:15", "services": ["労働相談", "労災申請"]}],
+                "警察署": [{"name": "佐原警察署", "phone": "0478-54-0110", "address": "香取市北2-3-1", "hours": "24時間", "services": ["事件事故", "遺失物"]}],
+                "市区町村役所": [
+                    {"name": "神崎町役場", "phone": "0478-72-2114", "address": "香取郡神崎町神崎本宿163", "hours": "平日 8:30-17:15", "services": ["住民票", "戸籍"]},
+                    {"name": "神崎町建設環境課", "phone": "0478-72-2114", "address": "香取郡神崎町神崎本宿163", "hours": "平日 8:30-17:15", "services": ["ごみ収集", "リサイクル", "環境対策"]}
+                ],
+                "消防署": [{"name": "香取広域市町村圏事務組合消防本部神崎分署", "phone": "0478-72-0119", "address": "香取郡神崎町神崎本宿1891", "hours": "24時間", "services": ["火災通報", "救急車"]}],
+                "ガス": [{"name": "京葉ガス佐原営業所", "phone": "0478-52-4141", "address": "香取市北1-12-18", "hours": "平日 8:30-19:00", "services": ["ガス開栓", "緊急通報"]}],
+                "電力": [{"name": "東京電力パワーグリッド千葉支社", "phone": "0120-995-007", "address": "千葉市中央区中央2-6-1", "hours": "平日 9:00-17:00", "services": ["停電情報", "電気工事"]}],
+                "病院": [{"name": "神崎町国保診療所", "phone": "0478-72-3328", "address": "香取郡神崎町神崎本宿1940", "hours": "平日 8:30-17:00", "services": ["内科", "小児科"]}],
+                "保健所": [{"name": "香取保健所", "phone": "0478-52-9161", "address": "香取市北1-3-2", "hours": "平日 9:00-17:00", "services": ["健康相談", "予防接種"]}],
+                "水道": [{"name": "神崎町上下水道課", "phone": "0478-72-2114", "address": "香取郡神崎町神崎本宿163", "hours": "平日 8:30-17:15", "services": ["水道開栓", "料金"]}],
+                "NTT": [{"name": "NTT東日本千葉支店", "phone": "116", "address": "千葉市中央区新町1000", "hours": "平日 9:00-17:00", "services": ["電話工事", "故障修理"]}],
+                "下水道": [{"name": "神崎町上下水道課", "phone": "0478-72-2114", "address": "香取郡神崎町神崎本宿163", "hours": "平日 8:30-17:15", "services": ["下水道修理", "排水設備"]}]
+            }
+        },
+        "多古町": {
+            "": {
+                "労基署": [{"name": "佐原労働基準監督署", "phone": "0478-54-1744", "address": "香取市北1-3-2", "hours": "平日 8:30-17:15", "services": ["労働相談", "労災申請"]}],
+                "警察署": [{"name": "佐原警察署", "phone": "0478-54-0110", "address": "香取市北2-3-1", "hours": "24時間", "services": ["事件事故", "遺失物"]}],
+                "市区町村役所": [
+                    {"name": "多古町役場", "phone": "0479-76-2611", "address": "香取郡多古町多古584", "hours": "平日 8:30-17:15", "services": ["住民票", "戸籍"]},
+                    {"name": "多古町建設課", "phone": "0479-76-2611", "address": "香取郡多古町多古584", "hours": "平日 8:30-17:15", "services": ["ごみ収集", "リサイクル", "環境対策"]}
+                ],
+                "消防署": [{"name": "香取広域市町村圏事務組合消防本部多古分署", "phone": "0479-76-0119", "address": "香取郡多古町多古2855", "hours": "24時間", "services": ["火災通報", "救急車"]}],
+                "ガス": [{"name": "京葉ガス佐原営業所", "phone": "0478-52-4141", "address": "香取市北1-12-18", "hours": "平日 8:30-19:00", "services": ["ガス開栓", "緊急通報"]}],
+                "電力": [{"name": "東京電力パワーグリッド千葉支社", "phone": "0120-995-007", "address": "千葉市中央区中央2-6-1", "hours": "平日 9:00-17:00", "services": ["停電情報", "電気工事"]}],
+                "病院": [{"name": "多古中央病院", "phone": "0479-76-2211", "address": "香取郡多古町多古388", "hours": "24時間救急", "services": ["内科", "外科"]}],
+                "保健所": [{"name": "香取保健所", "phone": "0478-52-9161", "address": "香取市北1-3-2", "hours": "平日 9:00-17:00", "services": ["健康相談", "予防接種"]}],
+                "水道": [{"name": "多古町上下水道課", "phone": "0479-76-2611", "address": "香取郡多古町多古584", "hours": "平日 8:30-17:15", "services": ["水道開栓", "料金"]}],
+                "NTT": [{"name": "NTT東日本千葉支店", "phone": "116", "address": "千葉市中央区新町1000", "hours": "平日 9:00-17:00", "services": ["電話工事", "故障修理"]}],
+                "下水道": [{"name": "多古町上下水道課", "phone": "0479-76-2611", "address": "香取郡多古町多古584", "hours": "平日 8:30-17:15", "services": ["下水道修理", "排水設備"]}]
+            }
+        },
+        "東庄町": {
+            "": {
+                "労基署": [{"name": "佐原労働基準監督署", "phone": "0478-54-1744", "address": "香取市北1-3-2", "hours": "平日 8:30-17:15", "services": ["労働相談", "労災申請"]}],
+                "警察署": [{"name": "佐原警察署", "phone": "0478-54-0110", "address": "香取市北2-3-1", "hours": "24時間", "services": ["事件事故", "遺失物"]}],
+                "市区町村役所": [
+                    {"name": "東庄町役場", "phone": "0478-86-1111", "address": "香取郡東庄町笹川い4713-131", "hours": "平日 8:30-17:15", "services": ["住民票", "戸籍"]},
+                    {"name": "東庄町建設環境課", "phone": "0478-86-1111", "address": "香取郡東庄町笹川い4713-131", "hours": "平日 8:30-17:15", "services": ["ごみ収集", "リサイクル", "環境対策"]}
+                ],
+                "消防署": [{"name": "香取広域市町村圏事務組合消防本部東庄分署", "phone": "0478-86-0119", "address": "香取郡東庄町石出2692-18", "hours": "24時間", "services": ["火災通報", "救急車"]}],
+                "ガス": [{"name": "京葉ガス佐原営業所", "phone": "0478-52-4141", "address": "香取市北1-12-18", "hours": "平日 8:30-19:00", "services": ["ガス開栓", "緊急通報"]}],
+                "電力": [{"name": "東京電力パワーグリッド千葉支社", "phone": "0120-995-007", "address": "千葉市中央区中央2-6-1", "hours": "平日 9:00-17:00", "services": ["停電情報", "電気工事"]}],
+                "病院": [{"name": "東庄病院", "phone": "0478-86-1191", "address": "香取郡東庄町笹川い4714-1", "hours": "24時間救急", "services": ["内科", "外科"]}],
+                "保健所": [{"name": "香取保健所", "phone": "0478-52-9161", "address": "香取市北1-3-2", "hours": "平日 9:00-17:00", "services": ["健康相談", "予防接種"]}],
+                "水道": [{"name": "東庄町上下水道課", "phone": "0478-86-1111", "address": "香取郡東庄町笹川い4713-131", "hours": "平日 8:30-17:15", "services": ["水道開栓", "料金"]}],
+                "NTT": [{"name": "NTT東日本千葉支店", "phone": "116", "address": "千葉市中央区新町1000", "hours": "平日 9:00-17:00", "services": ["電話工事", "故障修理"]}],
+                "下水道": [{"name": "東庄町上下水道課", "phone": "0478-86-1111", "address": "香取郡東庄町笹川い4713-131", "hours": "平日 8:30-17:15", "services": ["下水道修理", "排水設備"]}]
+            }
+        }
+    },
+    "埼玉県": {
+        "さいたま市": {
+            "中央区": {
+                "労基署": [{"name": "大宮労働基準監督署", "phone": "048-645-2664", "address": "さいたま市大宮区大成町1-525", "hours": "平日 8:30-17:15", "services": ["労働相談", "労災申請"]}],
+                "警察署": [{"name": "浦和警察署", "phone": "048-825-0110", "address": "さいたま市浦和区常盤1-1-32", "hours": "24時間", "services": ["事件事故", "遺失物"]}],
+                "市区町村役所": [{"name": "中央区役所", "phone": "048-840-6111", "address": "さいたま市中央区下落合5-7-10", "hours": "平日 8:30-17:15", "services": ["住民票", "戸籍"]}],
+                "消防署": [{"name": "中央消防署", "phone": "048-852-9119", "address": "さいたま市中央区下落合5-11-5", "hours": "24時間", "services": ["火災通報", "救急車"]}],
+                "ガス": [{"name": "東京ガス大宮支店", "phone": "0570-002211", "address": "さいたま市大宮区桜木町1-11-20", "hours": "平日 8:30-19:00", "services": ["ガス開栓", "緊急通報"]}],
+                "電力": [{"name": "東京電力パワーグリッド埼玉支社", "phone": "0120-995-005", "address": "さいたま市大宮区桜木町1-7-5", "hours": "平日 9:00-17:00", "services": ["停電情報", "電気工事"]}],
+                "病院": [{"name": "さいたま市立病院", "phone": "048-873-4111", "address": "さいたま市緑区三室2460", "hours": "24時間救急", "services": ["総合診療", "救急医療"]}],
+                "保健所": [{"name": "中央区保健センター", "phone": "048-840-6111", "address": "さいたま市中央区下落合5-7-10", "hours": "平日 8:30-17:15", "services": ["健康相談", "予防接種"]}],
+                "水道": [{"name": "さいたま市水道局", "phone": "048-714-3111", "address": "さいたま市大宮区大門町3-1", "hours": "平日 8:30-17:15", "services": ["水道開栓", "料金"]}],
+                "NTT": [{"name": "NTT東日本埼玉支店", "phone": "116", "address": "さいたま市大宮区桜木町1-9-6", "hours": "平日 9:00-17:00", "services": ["電話工事", "故障修理"]}],
+                "下水道": [{"name": "さいたま市下水道局", "phone": "048-829-1583", "address": "さいたま市浦和区常盤6-4-4", "hours": "平日 8:30-17:15", "services": ["下水道修理", "排水設備"]}]
+            },
+            "南区": {
+                "労基署": [{"name": "大宮労働基準監督署", "phone": "048-645-2664", "address": "さいたま市大宮区大成町1-525", "hours": "平日 8:30-17:15", "services": ["労働相談", "労災申請"]}],
+                "警察署": [{"name": "浦和警察署", "phone": "048-825-0110", "address": "さいたま市浦和区常盤1-1-32", "hours": "24時間", "services": ["事件事故", "遺失物"]}],
+                "市区町村役所": [{"name": "南区役所", "phone": "048-844-7111", "address": "さいたま市南区別所7-20-1", "hours": "平日 8:30-17:15", "services": ["住民票", "戸籍"]}],
+                "消防署": [{"name": "南消防署", "phone": "048-861-0119", "address": "さいたま市南区沼影1-6-1", "hours": "24時間", "services": ["火災通報", "救急車"]}],
+                "ガス": [{"name": "東京ガス大宮支店", "phone": "0570-002211", "address": "さいたま市大宮区桜木町1-11-20", "hours": "平日 8:30-19:00", "services": ["ガス開栓", "緊急通報"]}],
+                "電力": [{"name": "東京電力パワーグリッド埼玉支社", "phone": "0120-995-005", "address": "さいたま市大宮区桜木町1-7-5", "hours": "平日 9:00-17:00", "services": ["停電情報", "電気工事"]}],
+                "病院": [{"name": "さいたま市立病院", "phone": "048-873-4111", "address": "さいたま市緑区三室2460", "hours": "24時間救急", "services": ["総合診療", "救急医療"]}],
+                "保健所": [{"name": "南区保健センター", "phone": "048-844-7200", "address": "さいたま市南区別所7-20-1", "hours": "平日 8:30-17:15", "services": ["健康相談", "予防接種"]}],
+                "水道": [{"name": "さいたま市水道局", "phone": "048-714-3111", "address": "さいたま市大宮区大門町3-1", "hours": "平日 8:30-17:15", "services": ["水道開栓", "料金"]}],
+                "NTT": [{"name": "NTT東日本埼玉支店", "phone": "116", "address": "さいたま市大宮区桜木町1-9-6", "hours": "平日 9:00-17:00", "services": ["電話工事", "故障修理"]}],
+                "下水道": [{"name": "さいたま市下水道局", "phone": "048-829-1583", "address": "さいたま市浦和区常盤6-4-4", "hours": "平日 8:30-17:15", "services": ["下水道修理", "排水設備"]}]
+            },
+            "見沼区": {
+                "労基署": [{"name": "大宮労働基準監督署", "phone": "048-645-2664", "address": "さいたま市大宮区大成町1-525", "hours": "平日 8:30-17:15", "services": ["労働相談", "労災申請"]}],
+                "警察署": [{"name": "大宮東警察署", "phone": "048-682-0110", "address": "さいたま市見沼区東大宮4-31-1", "hours": "24時間", "services": ["事件事故", "遺失物"]}],
+                "市区町村役所": [{"name": "見沼区役所", "phone": "048-681-6111", "address": "さいたま市見沼区堀崎町12-36", "hours": "平日 8:30-17:15", "services": ["住民票", "戸籍"]}],  
+                "消防署": [{"name": "見沼消防署", "phone": "048-684-0119", "address": "さいたま市見沼区大和田町1-1564-1", "hours": "24時間", "services": ["火災通報", "救急車"]}],
+                "ガス": [{"name": "東京ガス大宮支店", "phone": "0570-002211", "address": "さいたま市大宮区桜木町1-11-20", "hours": "平日 8:30-19:00", "services": ["ガス開栓", "緊急通報"]}],
+                "電力": [{"name": "東京電力パワーグリッド埼玉支社", "phone": "0120-995-005", "address": "さいたま市大宮区桜木町1-7-5", "hours": "平日 9:00-17:00", "services": ["停電情報", "電気工事"]}],
+                "病院": [{"name": "さいたま市立病院", "phone": "048-873-4111", "address": "さいたま市緑区三室2460", "hours": "24時間救急", "services": ["総合診療", "救急医療"]}],
+                "保健所": [{"name": "見沼区保健センター", "phone": "048-681-6100", "address": "さいたま市見沼区堀崎町12-36", "hours": "平日 8:30-17:15", "services": ["健康相談", "予防接種"]}],
+                "水道": [{"name": "さいたま市水道局", "phone": "048-714-3111", "address": "さいたま市大宮区大門町3-1", "hours": "平日 8:30-17:15", "services": ["水道開栓", "料金"]}],
+                "NTT": [{"name": "NTT東日本埼玉支店", "phone": "116", "address": "さいたま市大宮区桜木町1-9-6", "hours": "平日 9:00-17:00", "services": ["電話工事", "故障修理"]}],
+                "下水道": [{"name": "さいたま市下水道局", "phone": "048-829-1583", "address": "さいたま市浦和区常盤6-4-4", "hours": "平日 8:30-17:15", "services": ["下水道修理", "排水設備"]}]
+            },
+            "緑区": {
+                "労基署": [{"name": "大宮労働基準監督署", "phone": "048-645-2664", "address": "さいたま市大宮区大成町1-525", "hours": "平日 8:30-17:15", "services": ["労働相談", "労災申請"]}],
+                "警察署": [{"name": "浦和東警察署", "phone": "048-882-0110", "address": "さいたま市緑区東浦和8-19-1", "hours": "24時間", "services": ["事件事故", "遺失物"]}],
+                "市区町村役所": [{"name": "緑区役所", "phone": "048-712-1111", "address": "さいたま市緑区中尾975-1", "hours": "平日 8:30-17:15", "services": ["住民票", "戸籍"]}],
+                "消防署": [{"name": "緑消防署", "phone": "048-878-0119", "address": "さいたま市緑区原山2-18-9", "hours": "24時間", "services": ["火災通報", "救急車"]}],
+                "ガス": [{"name": "東京ガス大宮支店", "phone": "0570-002211", "address": "さいたま市大宮区桜木町1-11-20", "hours": "平日 8:30-19:00", "services": ["ガス開栓", "緊急通報"]}],
+                "電力": [{"name": "東京電力パワーグリッド埼玉支社", "phone": "0120-995-005", "address": "さいたま市大宮区桜木町1-7-5", "hours": "平日 9:00-17:00", "services": ["停電情報", "電気工事"]}],
+                "病院": [{"name": "さいたま市立病院", "phone": "048-873-4111", "address": "さいたま市緑区三室2460", "hours": "24時間救急", "services": ["総合診療", "救急医療"]}],
+                "保健所": [{"name": "緑区保健センター", "phone": "048-712-1200", "address": "さいたま市緑区中尾975-1", "hours": "平日 8:30-17:15", "services": ["健康相談", "予防接種"]}],
+                "水道": [{"name": "さいたま市水道局", "phone": "048-714-3111", "address": "さいたま市大宮区大門町3-1", "hours": "平日 8:30-17:15", "services": ["水道開栓", "料金"]}],
+                "NTT": [{"name": "NTT東日本埼玉支店", "phone": "116", "address": "さいたま市大宮区桜木町1-9-6", "hours": "平日 9:00-17:00", "services": ["電話工事", "故障修理"]}],
+                "下水道": [{"name": "さいたま市下水道局", "phone": "048-829-1583", "address": "さいたま市浦和区常盤6-4-4", "hours": "平日 8:30-17:15", "services": ["下水道修理", "排水設備"]}]
+            },
+            "岩槻区": {
+                "労基署": [{"name": "大宮労働基準監督署", "phone": "048-645-2664", "address": "さいたま市大宮区大成町1-525", "hours": "平日 8:30-17:15", "services": ["労働相談", "労災申請"]}],
+                "警察署": [{"name": "岩槻警察署", "phone": "048-757-0110", "address": "さいたま市岩槻区本町1-1-1", "hours": "24時間", "services": ["事件事故", "遺失物"]}],
+                "市区町村役所": [{"name": "岩槻区役所", "phone": "048-790-0111", "address": "さいたま市岩槻区本町3-2-5", "hours": "平日 8:30-17:15", "services": ["住民票", "戸籍"]}],
+                "消防署": [{"name": "岩槻消防署", "phone": "048-757-0119", "address": "さいたま市岩槻区本町6-2-8", "hours": "24時間", "services": ["火災通報", "救急車"]}],
+                "ガス": [{"name": "東京ガス大宮支店", "phone": "0570-002211", "address": "さいたま市大宮区桜木町1-11-20", "hours": "平日 8:30-19:00", "services": ["ガス開栓", "緊急通報"]}],
+                "電力": [{"name": "東京電力パワーグリッド埼玉支社", "phone": "0120-995-005", "address": "さいたま市大宮区桜木町1-7-5", "hours": "平日 9:00-17:00", "services": ["停電情報", "電気工事"]}],
+                "病院": [{"name": "埼玉県立精神医療センター", "phone": "048-763-3591", "address": "さいたま市岩槻区馬込800", "hours": "24時間救急", "services": ["総合診療", "救急医療"]}],
+                "保健所": [{"name": "岩槻区保健センター", "phone": "048-790-0222", "address": "さいたま市岩槻区本町3-2-5", "hours": "平日 8:30-17:15", "services": ["健康相談", "予防接種"]}],
+                "水道": [{"name": "さいたま市水道局", "phone": "048-714-3111", "address": "さいたま市大宮区大門町3-1", "hours": "平日 8:30-17:15", "services": ["水道開栓", "料金"]}],
+                "NTT": [{"name": "NTT東日本埼玉支店", "phone": "116", "address": "さいたま市大宮区桜木町1-9-6", "hours": "平日 9:00-17:00", "services": ["電話工事", "故障修理"]}],
+                "下水道": [{"name": "さいたま市下水道局", "phone": "048-829-1583", "address": "さいたま市浦和区常盤6-4-4", "hours": "平日 8:30-17:15", "services": ["下水道修理", "排水設備"]}]
+            },
+            "北区": {
+                "労基署": [{"name": "大宮労働基準監督署", "phone": "048-645-2664", "address": "さいたま市大宮区大成町1-525", "hours": "平日 8:30-17:15", "services": ["労働相談", "労災申請"]}],
+                "警察署": [{"name": "大宮警察署", "phone": "048-663-0110", "address": "さいたま市大宮区大門町2-118", "hours": "24時間", "services": ["事件事故", "遺失物"]}],
+                "市区町村役所": [{"name": "北区役所", "phone": "048-669-6111", "address": "さいたま市北区宮原町1-852-1", "hours": "平日 8:30-17:15", "services": ["住民票", "戸籍"]}],
+                "消防署": [{"name": "北消防署", "phone": "048-653-0119", "address": "さいたま市北区宮原町3-895", "hours": "24時間", "services": ["火災通報", "救急車"]}],
+                "ガス": [{"name": "東京ガス大宮支店", "phone": "0570-002211", "address": "さいたま市大宮区桜木町1-11-20", "hours": "平日 8:30-19:00", "services": ["ガス開栓", "緊急通報"]}],
+                "電力": [{"name": "東京電力パワーグリッド埼玉支社", "phone": "0120-995-005", "address": "さいたま市大宮区桜木町1-7-5", "hours": "平日 9:00-17:00", "services": ["停電情報", "電気工事"]}],
+                "病院": [{"name": "さいたま市立病院", "phone": "048-873-4111", "address": "さいたま市緑区三室2460", "hours": "24時間救急", "services": ["総合診療", "救急医療"]}],
+                "保健所": [{"name": "北区保健センター", "phone": "048-669-6100", "address": "さいたま市北区宮原町1-852-1", "hours": "平日 8:30-17:15", "services": ["健康相談", "予防接種"]}],
+                "水道": [{"name": "さいたま市水道局", "phone": "048-714-3111", "address": "さいたま市大宮区大門町3-1", "hours": "平日 8:30-17:15", "services": ["水道開栓", "料金"]}],
+                "NTT": [{"name": "NTT東日本埼玉支店", "phone": "116", "address": "さいたま市大宮区桜木町1-9-6", "hours": "平日 9:00-17:00", "services": ["電話工事", "故障修理"]}],
+                "下水道": [{"name": "さいたま市下水道局", "phone": "048-829-1583", "address": "さいたま市浦和区常盤6-4-4", "hours": "平日 8:30-17:15", "services": ["下水道修理", "排水設備"]}]
+            },
+            "大宮区": {
+                "労基署": [{"name": "大宮労働基準監督署", "phone": "048-645-2664", "address": "さいたま市大宮区大成町1-525", "hours": "平日 8:30-17:15", "services": ["労働相談", "労災申請"]}],
+                "警察署": [{"name": "大宮警察署", "phone": "048-663-0110", "address": "さいたま市大宮区大門町2-118", "hours": "24時間", "services": ["事件事故", "遺失物"]}],
+                "市区町村役所": [
+                    {"name": "さいたま市役所", "phone": "048-829-1111", "address": "さいたま市浦和区常盤6-4-4", "hours": "平日 8:30-17:15", "services": ["住民票", "戸籍"]},
+                    {"name": "さいたま市環境局", "phone": "048-829-1325", "address": "さいたま市浦和区常盤6-4-4", "hours": "平日 8:30-17:15", "services": ["ごみ収集", "リサイクル", "環境対策"]}
+                ],
+                "消防署": [{"name": "さいたま市消防局", "phone": "048-833-9100", "address": "さいたま市浦和区常盤6-4-4", "hours": "24時間", "services": ["火災通報", "救急車"]}],
+                "ガス": [{"name": "東京ガス大宮支店", "phone": "0570-002211", "address": "さいたま市大宮区桜木町1-11-20", "hours": "平日 8:30-19:00", "services": ["ガス開栓", "緊急通報"]}],
+                "電力": [{"name": "東京電力パワーグリッド埼玉支社", "phone": "0120-995-005", "address": "さいたま市大宮区桜木町1-7-5", "hours": "平日 9:00-17:00", "services": ["停電情報", "電気工事"]}],
+                "病院": [{"name": "さいたま市立病院", "phone": "048-873-4111", "address": "さいたま市緑区三室2460", "hours": "24時間救急", "services": ["総合診療", "救急医療"]}],
+                "保健所": [{"name": "さいたま市保健所", "phone": "048-840-2205", "address": "さいたま市浦和区常盤6-4-4", "hours": "平日 8:30-17:15", "services": ["健康相談", "予防接種"]}],
+                "水道": [{"name": "さいたま市水道局", "phone": "048-714-3111", "address": "さいたま市大宮区大門町3-1", "hours": "平日 8:30-17:15", "services": ["水道開栓", "料金"]}],
+                "NTT": [{"name": "NTT東日本埼玉支店", "phone": "116", "address": "さいたま市大宮区桜木町1-9-6", "hours": "平日 9:00-17:00", "services": ["電話工事", "故障修理"]}],
+                "下水道": [{"name": "さいたま市下水道局", "phone": "048-829-1583", "address": "さいたま市浦和区常盤6-4-4", "hours": "平日 8:30-17:15", "services": ["下水道修理", "排水設備"]}]
+            },
+            "桜区": {
+                "労基署": [{"name": "大宮労働基準監督署", "phone": "048-645-2664", "address": "さいたま市大宮区大成町1-525", "hours": "平日 8:30-17:15", "services": ["労働相談", "労災申請"]}],
+                "警察署": [{"name": "浦和西警察署", "phone": "048-854-0110", "address": "さいたま市桜区田島5-14-12", "hours": "24時間", "services": ["事件事故", "遺失物"]}],
+                "市区町村役所": [{"name": "桜区役所", "phone": "048-856-6111", "address": "さいたま市桜区道場4-3-1", "hours": "平日 8:30-17:15", "services": ["住民票", "戸籍"]}],
+                "消防署": [{"name": "桜消防署", "phone": "048-858-0119", "address": "さいたま市桜区田島5-23-20", "hours": "24時間", "services": ["火災通報", "救急車"]}],
+                "ガス": [{"name": "東京ガス大宮支店", "phone": "0570-002211", "address": "さいたま市大宮区桜木町1-11-20", "hours": "平日 8:30-19:00", "services": ["ガス開栓", "緊急通報"]}],
+                "電力": [{"name": "東京電力パワーグリッド埼玉支社", "phone": "0120-995-005", "address": "さいたま市大宮区桜木町1-7-5", "hours": "平日 9:00-17:00", "services": ["停電情報", "電気工事"]}],
+                "病院": [{"name": "さいたま市立病院", "phone": "048-873-4111", "address": "さいたま市緑区三室2460", "hours": "24時間救急", "services": ["総合診療", "救急医療"]}],
+                "保健所": [{"name": "桜区保健センター", "phone": "048-856-6200", "address": "さいたま市桜区道場4-3-1", "hours": "平日 8:30-17:15", "services": ["健康相談", "予防接種"]}],
+                "水道": [{"name": "さいたま市水道局", "phone": "048-714-3111", "address": "さいたま市大宮区大門町3-1", "hours": "平日 8:30-17:15", "services": ["水道開栓", "料金"]}],
+                "NTT": [{"name": "NTT東日本埼玉支店", "phone": "116", "address": "さいたま市大宮区桜木町1-9-6", "hours": "平日 9:00-17:00", "services": ["電話工事", "故障修理"]}],
+                "下水道": [{"name": "さいたま市下水道局", "phone": "048-829-1583", "address": "さいたま市浦和区常盤6-4-4", "hours": "平日 8:30-17:15", "services": ["下水道修理", "排水設備"]}]
+            },
+            "浦和区": {
+                "労基署": [{"name": "大宮労働基準監督署", "phone": "048-645-2664", "address": "さいたま市大宮区大成町1-525", "hours": "平日 8:30-17:15", "services": ["労働相談", "労災申請"]}],
+                "警察署": [{"name": "浦和警察署", "phone": "048-825-0110", "address": "さいたま市浦和区常盤1-1-32", "hours": "24時間", "services": ["事件事故", "遺失物"]}],
+                "市区町村役所": [{"name": "浦和区役所", "phone": "048-829-6111", "address": "さいたま市浦和区常盤6-4-4", "hours": "平日 8:30-17:15", "services": ["住民票", "戸籍"]}],
+                "消防署": [{"name": "浦和消防署", "phone": "048-833-0119", "address": "さいたま市浦和区常盤5-8-18", "hours": "24時間", "services": ["火災通報", "救急車"]}],
+                "ガス": [{"name": "東京ガス大宮支店", "phone": "0570-002211", "address": "さいたま市大宮区桜木町1-11-20", "hours": "平日 8:30-19:00", "services": ["ガス開栓", "緊急通報"]}],
+                "電力": [{"name": "東京電力パワーグリッド埼玉支社", "phone": "0120-995-005", "address": "さいたま市大宮区桜木町1-7-5", "hours": "平日 9:00-17:00", "services": ["停電情報", "電気工事"]}],
+                "病院": [{"name": "さいたま市立病院", "phone": "048-873-4111", "address": "さいたま市緑区三室2460", "hours": "24時間救急", "services": ["総合診療", "救急医療"]}],
+                "保健所": [{"name": "浦和区保健センター", "phone": "048-824-3971", "address": "さいたま市浦和区常盤6-4-4", "hours": "平日 8:30-17:15", "services": ["健康相談", "予防接種"]}],
+                "水道": [{"name": "さいたま市水道局", "phone": "048-714-3111", "address": "さいたま市大宮区大門町3-1", "hours": "平日 8:30-17:15", "services": ["水道開栓", "料金"]}],
+                "NTT": [{"name": "NTT東日本埼玉支店", "phone": "116", "address": "さいたま市大宮区桜木町1-9-6", "hours": "平日 9:00-17:00", "services": ["電話工事", "故障修理"]}],
+                "下水道": [{"name": "さいたま市下水道局", "phone": "048-829-1583", "address": "さいたま市浦和区常盤6-4-4", "hours": "平日 8:30-17:15", "services": ["下水道修理", "排水設備"]}]
+            }
+        },
+        "川口市": {
+            "": {
+                "労基署": [{"name": "川口労働基準監督署", "phone": "048-252-8181", "address": "川口市金山町14-1", "hours": "平日 8:30-17:15", "services": ["労働相談", "労災申請"]}],
+                "警察署": [{"name": "川口警察署", "phone": "048-253-0110", "address": "川口市金山町14-2", "hours": "24時間", "services": ["事件事故", "遺失物"]}],
+                "市区町村役所": [{"name": "川口市役所", "phone": "048-258-1110", "address": "川口市青木2-1-1", "hours": "平日 8:30-17:15", "services": ["住民票", "戸籍"]}],
+                "消防署": [{"name": "川口市消防局", "phone": "048-261-0119", "address": "川口市青木2-4-11", "hours": "24時間", "services": ["火災通報", "救急車"]}],
+                "ガス": [{"name": "東京ガス川口支店", "phone": "0570-002211", "address": "川口市本町4-1-8", "hours": "平日 8:30-19:00", "services": ["ガス開栓", "緊急通報"]}],
+                "電力": [{"name": "東京電力パワーグリッド川口支社", "phone": "0120-995-005", "address": "川口市本町4-4-18", "hours": "平日 9:00-17:00", "services": ["停電情報", "電気工事"]}],
+                "病院": [{"name": "川口市立医療センター", "phone": "048-287-2525", "address": "川口市西新井宿180", "hours": "24時間救急", "services": ["総合診療", "救急医療"]}],
+                "保健所": [{"name": "川口市保健所", "phone": "048-266-2661", "address": "川口市青木2-1-1", "hours": "平日 8:30-17:15", "services": ["健康相談", "予防接種"]}],
+                "水道": [{"name": "川口市上下水道局", "phone": "048-258-4132", "address": "川口市青木2-1-1", "hours": "平日 8:30-17:15", "services": ["水道開栓", "料金"]}],
+                "NTT": [{"name": "NTT東日本埼玉支店", "phone": "116", "address": "さいたま市大宮区桜木町1-9-6", "hours": "平日 9:00-17:00", "services": ["電話工事", "故障修理"]}],
+                "下水道": [{"name": "川口市上下水道局", "phone": "048-258-4063", "address": "川口市青木2-1-1", "hours": "平日 8:30-17:15", "services": ["下水道修理", "排水設備"]}]
+            }
+        },
+        "所沢市": {
+            "": {
+                "労基署": [{"name": "所沢労働基準監督署", "phone": "04-2998-8132", "address": "所沢市並木1-8-1", "hours": "平日 8:30-17:15", "services": ["労働相談", "労災申請"]}],
+                "警察署": [{"name": "所沢警察署", "phone": "04-2996-0110", "address": "所沢市並木2-1-1", "hours": "24時間", "services": ["事件事故", "遺失物"]}],
+                "市区町村役所": [{"name": "所沢市役所", "phone": "04-2998-1111", "address": "所沢市並木1-1-1", "hours": "平日 8:30-17:15", "services": ["住民票", "戸籍"]}],
+                "消防署": [{"name": "所沢市消防本部", "phone": "04-2929-9123", "address": "所沢市並木1-9-1", "hours": "24時間", "services": ["火災通報", "救急車"]}],
+                "ガス": [{"name": "武州ガス所沢営業所", "phone": "04-2996-8111", "address": "所沢市緑町2-17-5", "hours": "平日 8:30-17:30", "services": ["ガス開栓", "緊急通報"]}],
+                "電力": [{"name": "東京電力パワーグリッド所沢支社", "phone": "0120-995-005", "address": "所沢市緑町3-16-1", "hours": "平日 9:00-17:00", "services": ["停電情報", "電気工事"]}],
+                "病院": [{"name": "所沢市民医療センター", "phone": "04-2992-1151", "address": "所沢市上安松1224-1", "hours": "24時間救急", "services": ["総合診療", "救急医療"]}],
+                "保健所": [{"name": "所沢市保健センター", "phone": "04-2991-1811", "address": "所沢市並木1-1-1", "hours": "平日 8:30-17:15", "services": ["健康相談", "予防接種"]}],
+                "水道": [{"name": "所沢市上下水道局", "phone": "04-2921-1080", "address": "所沢市並木1-1-1", "hours": "平日 8:30-17:15", "services": ["水道開栓", "料金"]}],
+                "NTT": [{"name": "NTT東日本埼玉支店", "phone": "116", "address": "さいたま市大宮区桜木町1-9-6", "hours": "平日 9:00-17:00", "services": ["電話工事", "故障修理"]}],
+                "下水道": [{"name": "所沢市上下水道局", "phone": "04-2921-1081", "address": "所沢市並木1-1-1", "hours": "平日 8:30-17:15", "services": ["下水道修理", "排水設備"]}]
+            }
+        },
+        "川越市": {
+            "": {
+                "労基署": [{"name": "川越労働基準監督署", "phone": "049-242-0891", "address": "川越市豊田本1-5-1", "hours": "平日 8:30-17:15", "services": ["労働相談", "労災申請"]}],
+                "警察署": [{"name": "川越警察署", "phone": "049-224-0110", "address": "川越市六軒町1-1-1", "hours": "24時間", "services": ["事件事故", "遺失物"]}],
+                "市区町村役所": [{"name": "川越市役所", "phone": "049-224-8811", "address": "川越市元町1-3-1", "hours": "平日 8:30-17:15", "services": ["住民票", "戸籍"]}],
+                "消防署": [{"name": "川越地区消防局", "phone": "049-222-0700", "address": "川越市新宿町1-17-17", "hours": "24時間", "services": ["火災通報", "救急車"]}],
+                "ガス": [{"name": "東京ガス川越支店", "phone": "0570-002211", "address": "川越市脇田本町8-1", "hours": "平日 8:30-19:00", "services": ["ガス開栓", "緊急通報"]}],
+                "電力": [{"name": "東京電力パワーグリッド川越支社", "phone": "0120-995-005", "address": "川越市脇田本町6-18", "hours": "平日 9:00-17:00", "services": ["停電情報", "電気工事"]}],
+                "病院": [{"name": "川越市立医療センター", "phone": "049-237-7000", "address": "川越市鴨田1981", "hours": "24時間救急", "services": ["総合診療", "救急医療"]}],
+                "保健所": [{"name": "川越市保健所", "phone": "049-227-5101", "address": "川越市小ケ谷817-1", "hours": "平日 8:30-17:15", "services": ["健康相談", "予防接種"]}],
+                "水道": [{"name": "川越市上下水道局", "phone": "049-223-0110", "address": "川越市元町1-3-1", "hours": "平日 8:30-17:15", "services": ["水道開栓", "料金"]}],
+                "NTT": [{"name": "NTT東日本埼玉支店", "phone": "116", "address": "さいたま市大宮区桜木町1-9-6", "hours": "平日 9:00-17:00", "services": ["電話工事", "故障修理"]}],
+                "下水道": [{"name": "川越市上下水道局", "phone": "049-223-0331", "address": "川越市元町1-3-1", "hours": "平日 8:30-17:15", "services": ["下水道修理", "排水設備"]}]
+            }
+        },
+        "熊谷市": {
+            "": {
+                "労基署": [{"name": "熊谷労働基準監督署", "phone": "048-522-0474", "address": "熊谷市箱田1-4-55", "hours": "平日 8:30-17:15", "services": ["労働相談", "労災申請"]}],
+                "警察署": [{"name": "熊谷警察署", "phone": "048-526-0110", "address": "熊谷市宮町2-39", "hours": "24時間", "services": ["事件事故", "遺失物"]}],
+                "市区町村役所": [{"name": "熊谷市役所", "phone": "048-524-1111", "address": "熊谷市宮町2-47-1", "hours": "平日 8:30-17:15", "services": ["住民票", "戸籍"]}],
+                "消防署": [{"name": "熊谷市消防本部", "phone": "048-501-0119", "address": "熊谷市宮町2-39-1", "hours": "24時間", "services": ["火災通報", "救急車"]}],
+                "ガス": [{"name": "東京ガス熊谷営業所", "phone": "0570-002211", "address": "熊谷市筑波2-115", "hours": "平日 8:30-19:00", "services": ["ガス開栓", "緊急通報"]}],
+                "電力": [{"name": "東京電力パワーグリッド熊谷支社", "phone": "0120-995-005", "address": "熊谷市筑波2-56", "hours": "平日 9:00-17:00", "services": ["停電情報", "電気工事"]}],
+                "病院": [{"name": "熊谷総合病院", "phone": "048-521-0065", "address": "熊谷市中西4-5-1", "hours": "24時間救急", "services": ["総合診療", "救急医療"]}],
+                "保健所": [{"name": "熊谷保健所", "phone": "048-523-2811", "address": "熊谷市末広3-9-1", "hours": "平日 8:30-17:15", "services": ["健康相談", "予防接種"]}],
+                "水道": [{"name": "熊谷市上下水道部", "phone": "048-520-4132", "address": "熊谷市宮町2-47-1", "hours": "平日 8:30-17:15", "services": ["水道開栓", "料金"]}],
+                "NTT": [{"name": "NTT東日本埼玉支店", "phone": "116", "address": "さいたま市大宮区桜木町1-9-6", "hours": "平日 9:00-17:00", "services": ["電話工事", "故障修理"]}],
+                "下水道": [{"name": "熊谷市上下水道部", "phone": "048-520-4296", "address": "熊谷市宮町2-47-1", "hours": "平日 8:30-17:15", "services": ["下水道修理", "排水設備"]}]
+            }
+        },
+        "越谷市": {
+            "": {
+                "労基署": [{"name": "越谷労働基準監督署", "phone": "048-975-6983", "address": "越谷市神明町3-5-1", "hours": "平日 8:30-17:15", "services": ["労働相談", "労災申請"]}],
+                "警察署": [{"name": "越谷警察署", "phone": "048-964-0110", "address": "越谷市越ヶ谷4-1-1", "hours": "24時間", "services": ["事件事故", "遺失物"]}],
+                "市区町村役所": [{"name": "越谷市役所", "phone": "048-964-2111", "address": "越谷市越ヶ谷4-2-1", "hours": "平日 8:30-17:15", "services": ["住民票", "戸籍"]}],
+                "消防署": [{"name": "越谷市消防本部", "phone": "048-974-0136", "address": "越谷市越ヶ谷4-1-1", "hours": "24時間", "services": ["火災通報", "救急車"]}],
+                "ガス": [{"name": "東京ガス越谷営業所", "phone": "0570-002211", "address": "越谷市弥生町16-1", "hours": "平日 8:30-19:00", "services": ["ガス開栓", "緊急通報"]}],
+                "電力": [{"name": "東京電力パワーグリッド越谷支社", "phone": "0120-995-005", "address": "越谷市弥生町17-1", "hours": "平日 9:00-17:00", "services": ["停電情報", "電気工事"]}],
+                "病院": [{"name": "獨協医科大学埼玉医療センター", "phone": "048-965-1111", "address": "越谷市南越谷2-1-50", "hours": "24時間救急", "services": ["総合診療", "救急医療"]}],
+                "保健所": [{"name": "越谷市保健所", "phone": "048-973-7530", "address": "越谷市越ヶ谷4-2-1", "hours": "平日 8:30-17:15", "services": ["健康相談", "予防接種"]}],
+                "水道": [{"name": "越谷市上下水道部", "phone": "048-966-0565", "address": "越谷市越ヶ谷4-2-1", "hours": "平日 8:30-17:15", "services": ["水道開栓", "料金"]}],
+                "NTT": [{"name": "NTT東日本埼玉支店", "phone": "116", "address": "さいたま市大宮区桜木町1-9-6", "hours": "平日 9:00-17:00", "services": ["電話工事", "故障修理"]}],
+                "下水道": [{"name": "越谷市上下水道部", "phone": "048-966-0159", "address": "越谷市越ヶ谷4-2-1", "hours": "平日 8:30-17:15", "services": ["下水道修理", "排水設備"]}]
+            }
+        },
+        "春日部市": {
+            "": {
+                "労基署": [{"name": "越谷労働基準監督署", "phone": "048-975-2327", "address": "越谷市赤山町5-7-47", "hours": "平日 8:30-17:15", "services": ["労働相談", "労災申請"]}],
+                "警察署": [{"name": "春日部警察署", "phone": "048-734-0110", "address": "春日部市中央6-6-3", "hours": "24時間", "services": ["事件事故", "遺失物"]}],
+                "市区町村役所": [
+                    {"name": "春日部市役所", "phone": "048-736-1111", "address": "春日部市中央6-2", "hours": "平日 8:30-17:15", "services": ["住民票", "戸籍"]},
+                    {"name": "春日部市環境政策課", "phone": "048-736-1111", "address": "春日部市中央6-2", "hours": "平日 8:30-17:15", "services": ["ごみ収集", "リサイクル", "環境対策"]}
+                ],
+                "消防署": [{"name": "春日部市消防本部", "phone": "048-734-0119", "address": "春日部市中央6-4-3", "hours": "24時間", "services": ["火災通報", "救急車"]}],
+                "ガス": [{"name": "東京ガス春日部営業所", "phone": "0570-002211", "address": "春日部市粕壁6823-1", "hours": "平日 8:30-19:00", "services": ["ガス開栓", "緊急通報"]}],
+                "電力": [{"name": "東京電力パワーグリッド埼玉支社", "phone": "0120-995-007", "address": "さいたま市大宮区桜木町1-7-5", "hours": "平日 9:00-17:00", "services": ["停電情報", "電気工事"]}],
+                "病院": [{"name": "春日部市立医療センター", "phone": "048-735-1261", "address": "春日部市中央6-7-1", "hours": "24時間救急", "services": ["総合診療", "救急医療"]}],
+                "保健所": [{"name": "春日部保健所", "phone": "048-737-2133", "address": "春日部市大沼1-76", "hours": "平日 8:30-17:15", "services": ["健康相談", "予防接種"]}],
+                "水道": [{"name": "春日部市上下水道部", "phone": "048-736-1111", "address": "春日部市中央6-2", "hours": "平日 8:30-17:15", "services": ["水道開栓", "料金"]}],
+                "NTT": [{"name": "NTT東日本埼玉支店", "phone": "116", "address": "さいたま市大宮区桜木町1-9-6", "hours": "平日 9:00-17:00", "services": ["電話工事", "故障修理"]}],
+                "下水道": [{"name": "春日部市上下水道部", "phone": "048-736-1111", "address": "春日部市中央6-2", "hours": "平日 8:30-17:15", "services": ["下水道修理", "排水設備"]}]
+            }
+        },
+        "狭山市": {
+            "": {
+                "労基署": [{"name": "所沢労働基準監督署", "phone": "04-2992-2210", "address": "所沢市並木1-8-1", "hours": "平日 8:30-17:15", "services": ["労働相談", "労災申請"]}],
+                "警察署": [{"name": "狭山警察署", "phone": "04-2953-0110", "address": "狭山市入間川2-4-13", "hours": "24時間", "services": ["事件事故", "遺失物"]}],
+                "市区町村役所": [
+                    {"name": "狭山市役所", "phone": "04-2953-1111", "address": "狭山市入間川1-23-5", "hours": "平日 8:30-17:15", "services": ["住民票", "戸籍"]},
+                    {"name": "狭山市環境経済部", "phone": "04-2937-6943", "address": "狭山市入間川1-23-5", "hours": "平日 8:30-17:15", "services": ["ごみ収集", "リサイクル", "環境対策"]}
+                ],
+                "消防署": [{"name": "狭山市消防本部", "phone": "04-2953-7111", "address": "狭山市入間川2-5-35", "hours": "24時間", "services": ["火災通報", "救急車"]}],
+                "ガス": [{"name": "東京ガス狭山営業所", "phone": "0570-002211", "address": "狭山市入間川1-3-2", "hours": "平日 8:30-19:00", "services": ["ガス開栓", "緊急通報"]}],
+                "電力": [{"name": "東京電力パワーグリッド埼玉支社", "phone": "0120-995-007", "address": "さいたま市大宮区桜木町1-7-5", "hours": "平日 9:00-17:00", "services": ["停電情報", "電気工事"]}],
+                "病院": [{"name": "狭山厚生病院", "phone": "04-2957-9111", "address": "狭山市祇園4-24", "hours": "24時間救急", "services": ["総合診療", "救急医療"]}],
+                "保健所": [{"name": "狭山保健所", "phone": "04-2954-6212", "address": "狭山市稲荷山2-16-1", "hours": "平日 8:30-17:15", "services": ["健康相談", "予防接種"]}],
+                "水道": [{"name": "狭山市上下水道部", "phone": "04-2953-1111", "address": "狭山市入間川1-23-5", "hours": "平日 8:30-17:15", "services": ["水道開栓", "料金"]}],
+                "NTT": [{"name": "NTT東日本埼玉支店", "phone": "116", "address": "さいたま市大宮区桜木町1-9-6", "hours": "平日 9:00-17:00", "services": ["電話工事", "故障修理"]}],
+                "下水道": [{"name": "狭山市上下水道部", "phone": "04-2953-1111", "address": "狭山市入間川1-23-5", "hours": "平日 8:30-17:15", "services": ["下水道修理", "排水設備"]}]
+            }
+        },
+        "羽生市": {
+            "": {
+                "労基署": [{"name": "熊谷労働基準監督署", "phone": "048-522-0792", "address": "熊谷市宮町2-63", "hours": "平日 8:30-17:15", "services": ["労働相談", "労災申請"]}],
+                "警察署": [{"name": "羽生警察署", "phone": "048-562-0110", "address": "羽生市東6-15-8", "hours": "24時間", "services": ["事件事故", "遺失物"]}],
+                "市区町村役所": [
+                    {"name": "羽生市役所", "phone": "048-561-1121", "address": "羽生市東6-15", "hours": "平日 8:30-17:15", "services": ["住民票", "戸籍"]},
+                    {"name": "羽生市環境経済部", "phone": "048-561-1121", "address": "羽生市東6-15", "hours": "平日 8:30-17:15", "services": ["ごみ収集", "リサイクル", "環境対策"]}
+                ],
+                "消防署": [{"name": "羽生市消防本部", "phone": "048-562-3119", "address": "羽生市東6-4-1", "hours": "24時間", "services": ["火災通報", "救急車"]}],
+                "ガス": [{"name": "東京ガス熊谷営業所", "phone": "0570-002211", "address": "熊谷市筑波2-115", "hours": "平日 8:30-19:00", "services": ["ガス開栓", "緊急通報"]}],
+                "電力": [{"name": "東京電力パワーグリッド埼玉支社", "phone": "0120-995-007", "address": "さいたま市大宮区桜木町1-7-5", "hours": "平日 9:00-17:00", "services": ["停電情報", "電気工事"]}],
+                "病院": [{"name": "羽生総合病院", "phone": "048-562-3000", "address": "羽生市下岩瀬133", "hours": "24時間救急", "services": ["総合診療", "救急医療"]}],
+                "保健所": [{"name": "加須保健所", "phone": "0480-61-1216", "address": "加須市南小浜988", "hours": "平日 8:30-17:15", "services": ["健康相談", "予防接種"]}],
+                "水道": [{"name": "羽生市上下水道部", "phone": "048-561-1121", "address": "羽生市東6-15", "hours": "平日 8:30-17:15", "services": ["水道開栓", "料金"]}],
+                "NTT": [{"name": "NTT東日本埼玉支店", "phone": "116", "address": "さいたま市大宮区桜木町1-9-6", "hours": "平日 9:00-17:00", "services": ["電話工事", "故障修理"]}],
+                "下水道": [{"name": "羽生市上下水道部", "phone": "048-561-1121", "address": "羽生市東6-15", "hours": "平日 8:30-17:15", "services": ["下水道修理", "排水設備"]}]
+            }
+        },
+        "鴻巣市": {
+            "": {
+                "労基署": [{"name": "大宮労働基準監督署", "phone": "048-652-6131", "address": "さいたま市北区宮原町4-1-2", "hours": "平日 8:30-17:15", "services": ["労働相談", "労災申請"]}],
+                "警察署": [{"name": "鴻巣警察署", "phone": "048-543-0110", "address": "鴻巣市東4-2-64", "hours": "24時間", "services": ["事件事故", "遺失物"]}],
+                "市区町村役所": [
+                    {"name": "鴻巣市役所", "phone": "048-541-1321", "address": "鴻巣市中央1-1", "hours": "平日 8:30-17:15", "services": ["住民票", "戸籍"]},
+                    {"name": "鴻巣市環境課", "phone": "048-541-1321", "address": "鴻巣市中央1-1", "hours": "平日 8:30-17:15", "services": ["ごみ収集", "リサイクル", "環境対策"]}
+                ],
+                "消防署": [{"name": "鴻巣市消防本部", "phone": "048-541-0119", "address": "鴻巣市東4-1-3", "hours": "24時間", "services": ["火災通報", "救急車"]}],
+                "ガス": [{"name": "東京ガス鴻巣営業所", "phone": "0570-002211", "address": "鴻巣市本町4-5-18", "hours": "平日 8:30-19:00", "services": ["ガス開栓", "緊急通報"]}],
+                "電力": [{"name": "東京電力パワーグリッド埼玉支社", "phone": "0120-995-007", "address": "さいたま市大宮区桜木町1-7-5", "hours": "平日 9:00-17:00", "services": ["停電情報", "電気工事"]}],
+                "病院": [{"name": "鴻巣病院", "phone": "048-596-2200", "address": "鴻巣市加美3-20", "hours": "24時間救急", "services": ["総合診療", "救急医療"]}],
+                "保健所": [{"name": "鴻巣保健所", "phone": "048-541-0249", "address": "鴻巣市東4-2-53", "hours": "平日 8:30-17:15", "services": ["健康相談", "予防接種"]}],
+                "水道": [{"name": "鴻巣市上下水道部", "phone": "048-541-1321", "address": "鴻巣市中央1-1", "hours": "平日 8:30-17:15", "services": ["水道開栓", "料金"]}],
+                "NTT": [{"name": "NTT東日本埼玉支店", "phone": "116", "address": "さいたま市大宮区桜木町1-9-6", "hours": "平日 9:00-17:00", "services": ["電話工事", "故障修理"]}],
+                "下水道": [{"name": "鴻巣市上下水道部", "phone": "048-541-1321", "address": "鴻巣市中央1-1", "hours": "平日 8:30-17:15", "services": ["下水道修理", "排水設備"]}]
+            }
+        },
+        "深谷市": {
+            "": {
+                "労基署": [{"name": "熊谷労働基準監督署", "phone": "048-522-0792", "address": "熊谷市宮町2-63", "hours": "平日 8:30-17:15", "services": ["労働相談", "労災申請"]}],
+                "警察署": [{"name": "深谷警察署", "phone": "048-575-0110", "address": "深谷市上柴町西2-23-1", "hours": "24時間", "services": ["事件事故", "遺失物"]}],
+                "市区町村役所": [
+                    {"name": "深谷市役所", "phone": "048-574-6111", "address": "深谷市仲町11-1", "hours": "平日 8:30-17:15", "services": ["住民票", "戸籍"]},
+                    {"name": "深谷市環境課", "phone": "048-574-6656", "address": "深谷市仲町11-1", "hours": "平日 8:30-17:15", "services": ["ごみ収集", "リサイクル", "環境対策"]}
+                ],
+                "消防署": [{"name": "深谷市消防本部", "phone": "048-571-0119", "address": "深谷市西島5-2-1", "hours": "24時間", "services": ["火災通報", "救急車"]}],
+                "ガス": [{"name": "東京ガス熊谷営業所", "phone": "0570-002211", "address": "熊谷市筑波2-115", "hours": "平日 8:30-19:00", "services": ["ガス開栓", "緊急通報"]}],
+                "電力": [{"name": "東京電力パワーグリッド埼玉支社", "phone": "0120-995-007", "address": "さいたま市大宮区桜木町1-7-5", "hours": "平日 9:00-17:00", "services": ["停電情報", "電気工事"]}],
+                "病院": [{"name": "深谷赤十字病院", "phone": "048-571-1511", "address": "深谷市上柴町西5-8-1", "hours": "24時間救急", "services": ["総合診療", "救急医療"]}],
+                "保健所": [{"name": "深谷保健所", "phone": "048-575-1101", "address": "深谷市東方町2-25-1", "hours": "平日 8:30-17:15", "services": ["健康相談", "予防接種"]}],
+                "水道": [{"name": "深谷市上下水道部", "phone": "048-571-1053", "address": "深谷市仲町11-1", "hours": "平日 8:30-17:15", "services": ["水道開栓", "料金"]}],
+                "NTT": [{"name": "NTT東日本埼玉支店", "phone": "116", "address": "さいたま市大宮区桜木町1-9-6", "hours": "平日 9:00-17:00", "services": ["電話工事", "故障修理"]}],
+                "下水道": [{"name": "深谷市上下水道部", "phone": "048-571-1054", "address": "深谷市仲町11-1", "hours": "平日 8:30-17:15", "services": ["下水道修理", "排水設備"]}]
+            }
+        },
+        "上尾市": {
+            "": {
+                "労基署": [{"name": "大宮労働基準監督署", "phone": "048-652-6131", "address": "さいたま市北区宮原町4-1-2", "hours": "平日 8:30-17:15", "services": ["労働相談", "労災申請"]}],
+                "警察署": [{"name": "上尾警察署", "phone": "048-773-0110", "address": "上尾市本町1-2-16", "hours": "24時間", "services": ["事件事故", "遺失物"]}],
+                "市区町村役所": [
+                    {"name": "上尾市役所", "phone": "048-775-5111", "address": "上尾市本町3-1-1", "hours": "平日 8:30-17:15", "services": ["住民票", "戸籍"]},
+                    {"name": "上尾市環境政策課", "phone": "048-775-6925", "address": "上尾市本町3-1-1", "hours": "平日 8:30-17:15", "services": ["ごみ収集", "リサイクル", "環境対策"]}
+                ],
+                "消防署": [{"name": "上尾市消防本部", "phone": "048-774-0119", "address": "上尾市谷津1-87", "hours": "24時間", "services": ["火災通報", "救急車"]}],
+                "ガス": [{"name": "東京ガス上尾営業所", "phone": "0570-002211", "address": "上尾市本町3-2-15", "hours": "平日 8:30-19:00", "services": ["ガス開栓", "緊急通報"]}],
+                "電力": [{"name": "東京電力パワーグリッド埼玉支社", "phone": "0120-995-007", "address": "さいたま市大宮区桜木町1-7-5", "hours": "平日 9:00-17:00", "services": ["停電情報", "電気工事"]}],
+                "病院": [{"name": "上尾中央総合病院", "phone": "048-773-1111", "address": "上尾市柏座1-10-10", "hours": "24時間救急", "services": ["総合診療", "救急医療"]}],
+                "保健所": [{"name": "鴻巣保健所", "phone": "048-541-0249", "address": "鴻巣市東4-2-53", "hours": "平日 8:30-17:15", "services": ["健康相談", "予防接種"]}],
+                "水道": [{"name": "上尾市上下水道部", "phone": "048-774-7211", "address": "上尾市本町3-1-1", "hours": "平日 8:30-17:15", "services": ["水道開栓", "料金"]}],
+                "NTT": [{"name": "NTT東日本埼玉支店", "phone": "116", "address": "さいたま市大宮区桜木町1-9-6", "hours": "平日 9:00-17:00", "services": ["電話工事", "故障修理"]}],
+                "下水道": [{"name": "上尾市上下水道部", "phone": "048-774-7212", "address": "上尾市本町3-1-1", "hours": "平日 8:30-17:15", "services": ["下水道修理", "排水設備"]}]
+            }
+        },
+        "草加市": {
+            "": {
+                "労基署": [{"name": "越谷労働基準監督署", "phone": "048-975-2327", "address": "越谷市赤山町5-7-47", "hours": "平日 8:30-17:15", "services": ["労働相談", "労災申請"]}],
+                "警察署": [{"name": "草加警察署", "phone": "048-943-0110", "address": "草加市高砂1-7-1", "hours": "24時間", "services": ["事件事故", "遺失物"]}],
+                "市区町村役所": [
+                    {"name": "草加市役所", "phone": "048-922-0151", "address": "草加市高砂1-1-1", "hours": "平日 8:30-17:00", "services": ["住民票", "戸籍"]},
+                    {"name": "草加市環境課", "phone": "048-922-1519", "address": "草加市高砂1-1-1", "hours": "平日 8:30-17:00", "services": ["ごみ収集", "リサイクル", "環境対策"]}
+                ],
+                "消防署": [{"name": "草加八潮消防組合", "phone": "048-996-0119", "address": "草加市原町2-7-59", "hours": "24時間", "services": ["火災通報", "救急車"]}],
+                "ガス": [{"name": "東京ガス草加営業所", "phone": "0570-002211", "address": "草加市高砂2-7-1", "hours": "平日 8:30-19:00", "services": ["ガス開栓", "緊急通報"]}],
+                "電力": [{"name": "東京電力パワーグリッド埼玉支社", "phone": "0120-995-007", "address": "さいたま市大宮区桜木町1-7-5", "hours": "平日 9:00-17:00", "services": ["停電情報", "電気工事"]}],
+                "病院": [{"name": "草加市立病院", "phone": "048-946-2200", "address": "草加市西町1-12-18", "hours": "24時間救急", "services": ["総合診療", "救急医療"]}],
+                "保健所": [{"name": "草加保健所", "phone": "048-925-1551", "address": "草加市西町425-2", "hours": "平日 8:30-17:15", "services": ["健康相談", "予防接種"]}],
+                "水道": [{"name": "草加市上下水道部", "phone": "048-922-2614", "address": "草加市高砂1-1-1", "hours": "平日 8:30-17:00", "services": ["水道開栓", "料金"]}],
+                "NTT": [{"name": "NTT東日本埼玉支店", "phone": "116", "address": "さいたま市大宮区桜木町1-9-6", "hours": "平日 9:00-17:00", "services": ["電話工事", "故障修理"]}],
+                "下水道": [{"name": "草加市上下水道部", "phone": "048-922-2615", "address": "草加市高砂1-1-1", "hours": "平日 8:30-17:00", "services": ["下水道修理", "排水設備"]}]
+            }
+        },
+        "蕨市": {
+            "": {
+                "労基署": [{"name": "川口労働基準監督署", "phone": "048-252-4381", "address": "川口市青木3-2-7", "hours": "平日 8:30-17:15", "services": ["労働相談", "労災申請"]}],
+                "警察署": [{"name": "蕨警察署", "phone": "048-444-0110", "address": "蕨市中央5-11-26", "hours": "24時間", "services": ["事件事故", "遺失物"]}],
+                "市区町村役所": [
+                    {"name": "蕨市役所", "phone": "048-432-3200", "address": "蕨市中央5-14-15", "hours": "平日 8:30-17:15", "services": ["住民票", "戸籍"]},
+                    {"name": "蕨市市民生活部", "phone": "048-433-7709", "address": "蕨市中央5-14-15", "hours": "平日 8:30-17:15", "services": ["ごみ収集", "リサイクル", "環境対策"]}
+                ],
+                "消防署": [{"name": "蕨市消防本部", "phone": "048-445-2047", "address": "蕨市中央4-21-29", "hours": "24時間", "services": ["火災通報", "救急車"]}],
+                "ガス": [{"name": "東京ガス蕨営業所", "phone": "0570-002211", "address": "蕨市中央5-13-21", "hours": "平日 8:30-19:00", "services": ["ガス開栓", "緊急通報"]}],
+                "電力": [{"name": "東京電力パワーグリッド埼玉支社", "phone": "0120-995-007", "address": "さいたま市大宮区桜木町1-7-5", "hours": "平日 9:00-17:00", "services": ["停電情報", "電気工事"]}],
+                "病院": [{"name": "蕨市立病院", "phone": "048-432-4771", "address": "蕨市北町2-12-18", "hours": "24時間救急", "services": ["総合診療", "救急医療"]}],
+                "保健所": [{"name": "南部保健所", "phone": "048-262-6111", "address": "川口市前川1-11-1", "hours": "平日 8:30-17:15", "services": ["健康相談", "予防接種"]}],
+                "水道": [{"name": "蕨市上下水道課", "phone": "048-433-7711", "address": "蕨市中央5-14-15", "hours": "平日 8:30-17:15", "services": ["水道開栓", "料金"]}],
+                "NTT": [{"name": "NTT東日本埼玉支店", "phone": "116", "address": "さいたま市大宮区桜木町1-9-6", "hours": "平日 9:00-17:00", "services": ["電話工事", "故障修理"]}],
+                "下水道": [{"name": "蕨市上下水道課", "phone": "048-433-7712", "address": "蕨市中央5-14-15", "hours": "平日 8:30-17:15", "services": ["下水道修理", "排水設備"]}]
+            }
+        },
+        "戸田市": {
+            "": {
+                "労基署": [{"name": "川口労働基準監督署", "phone": "048-252-4381", "address": "川口市青木3-2-7", "hours": "平日 8:30-17:15", "services": ["労働相談", "労災申請"]}],
+                "警察署": [{"name": "蕨警察署", "phone": "048-444-0110", "address": "蕨市中央5-11-26", "hours": "24時間", "services": ["事件事故", "遺失物"]}],
+                "市区町村役所": [
+                    {"name": "戸田市役所", "phone": "048-441-1800", "address": "戸田市上戸田1-18-1", "hours": "平日 8:30-17:15", "services": ["住民票", "戸籍"]},
+                    {"name": "戸田市環境課", "phone": "048-441-1800", "address": "戸田市上戸田1-18-1", "hours": "平日 8:30-17:15", "services": ["ごみ収集", "リサイクル", "環境対策"]}
+                ],
+                "消防署": [{"name": "戸田市消防本部", "phone": "048-420-2119", "address": "戸田市上戸田2-24-5", "hours": "24時間", "services": ["火災通報", "救急車"]}],
+                "ガス": [{"name": "東京ガス戸田営業所", "phone": "0570-002211", "address": "戸田市本町4-15-6", "hours": "平日 8:30-19:00", "services": ["ガス開栓", "緊急通報"]}],
+                "電力": [{"name": "東京電力パワーグリッド埼玉支社", "phone": "0120-995-007", "address": "さいたま市大宮区桜木町1-7-5", "hours": "平日 9:00-17:00", "services": ["停電情報", "電気工事"]}],
+                "病院": [{"name": "戸田中央総合病院", "phone": "048-442-1111", "address": "戸田市本町1-19-3", "hours": "24時間救急", "services": ["総合診療", "救急医療"]}],
+                "保健所": [{"name": "南部保健所", "phone": "048-262-6111", "address": "川口市前川1-11-1", "hours": "平日 8:30-17:15", "services": ["健康相談", "予防接種"]}],
+                "水道": [{"name": "戸田市上下水道部", "phone": "048-434-5141", "address": "戸田市上戸田1-18-1", "hours": "平日 8:30-17:15", "services": ["水道開栓", "料金"]}],
+                "NTT": [{"name": "NTT東日本埼玉支店", "phone": "116", "address": "さいたま市大宮区桜木町1-9-6", "hours": "平日 9:00-17:00", "services": ["電話工事", "故障修理"]}],
+                "下水道": [{"name": "戸田市上下水道部", "phone": "048-434-5142", "address": "戸田市上戸田1-18-1", "hours": "平日 8:30-17:15", "services": ["下水道修理", "排水設備"]}]
+            }
+        },
+        "入間市": {
+            "": {
+                "労基署": [{"name": "所沢労働基準監督署", "phone": "04-2992-2210", "address": "所沢市並木1-8-1", "hours": "平日 8:30-17:15", "services": ["労働相談", "労災申請"]}],
+                "警察署": [{"name": "狭山警察署", "phone": "04-2953-0110", "address": "狭山市入間川2-4-13", "hours": "24時間", "services": ["事件事故", "遺失物"]}],
+                "市区町村役所": [
+                    {"name": "入間市役所", "phone": "04-2964-1111", "address": "入間市豊岡1-16-1", "hours": "平日 8:30-17:15", "services": ["住民票", "戸籍"]},
+                    {"name": "入間市環境経済部", "phone": "04-2964-1111", "address": "入間市豊岡1-16-1", "hours": "平日 8:30-17:15", "services": ["ごみ収集", "リサイクル", "環境対策"]}
+                ],
+                "消防署": [{"name": "入間市消防本部", "phone": "04-2964-4498", "address": "入間市豊岡4-2-2", "hours": "24時間", "services": ["火災通報", "救急車"]}],
+                "ガス": [{"name": "武州ガス入間営業所", "phone": "04-2962-2331", "address": "入間市河原町13-1", "hours": "平日 8:30-19:00", "services": ["ガス開栓", "緊急通報"]}],
+                "電力": [{"name": "東京電力パワーグリッド埼玉支社", "phone": "0120-995-007", "address": "さいたま市大宮区桜木町1-7-5", "hours": "平日 9:00-17:00", "services": ["停電情報", "電気工事"]}],
+                "病院": [{"name": "入間川病院", "phone": "04-2932-3179", "address": "狭山市入間川2-37-25", "hours": "平日 9:00-17:00", "services": ["内科", "外科"]}],
+                "保健所": [{"name": "狭山保健所", "phone": "04-2954-6212", "address": "狭山市稲荷山2-16-1", "hours": "平日 8:30-17:15", "services": ["健康相談", "予防接種"]}],
+                "水道": [{"name": "入間市上下水道部", "phone": "04-2964-1111", "address": "入間市豊岡1-16-1", "hours": "平日 8:30-17:15", "services": ["水道開栓", "料金"]}],
+                "NTT": [{"name": "NTT東日本埼玉支店", "phone": "116", "address": "さいたま市大宮区桜木町1-9-6", "hours": "平日 9:00-17:00", "services": ["電話工事", "故障修理"]}],
+                "下水道": [{"name": "入間市上下水道部", "phone": "04-2964-1111", "address": "入間市豊岡1-16-1", "hours": "平日 8:30-17:15", "services": ["下水道修理", "排水設備"]}]
+            }
+        },
+        "朝霞市": {
+            "": {
+                "労基署": [{"name": "川口労働基準監督署", "phone": "048-252-4381", "address": "川口市青木3-2-7", "hours": "平日 8:30-17:15", "services": ["労働相談", "労災申請"]}],
+                "警察署": [{"name": "朝霞警察署", "phone": "048-465-0110", "address": "朝霞市青葉台1-3-1", "hours": "24時間", "services": ["事件事故", "遺失物"]}],
+                "市区町村役所": [
+                    {"name": "朝霞市役所", "phone": "048-463-1111", "address": "朝霞市本町1-1-1", "hours": "平日 8:30-17:15", "services": ["住民票", "戸籍"]},
+                    {"name": "朝霞市環境推進課", "phone": "048-463-1504", "address": "朝霞市本町1-1-1", "hours": "平日 8:30-17:15", "services": ["ごみ収集", "リサイクル", "環境対策"]}
+                ],
+                "消防署": [{"name": "朝霞地区一部事務組合消防本部", "phone": "048-460-0119", "address": "朝霞市溝沼1-2-27", "hours": "24時間", "services": ["火災通報", "救急車"]}],
+                "ガス": [{"name": "東京ガス朝霞営業所", "phone": "0570-002211", "address": "朝霞市本町2-5-23", "hours": "平日 8:30-19:00", "services": ["ガス開栓", "緊急通報"]}],
+                "電力": [{"name": "東京電力パワーグリッド埼玉支社", "phone": "0120-995-007", "address": "さいたま市大宮区桜木町1-7-5", "hours": "平日 9:00-17:00", "services": ["停電情報", "電気工事"]}],
+                "病院": [{"name": "朝霞台中央総合病院", "phone": "048-466-2055", "address": "朝霞市西弁財1-8-10", "hours": "24時間救急", "services": ["総合診療", "救急医療"]}],
+                "保健所": [{"name": "朝霞保健所", "phone": "048-461-0468", "address": "朝霞市青葉台1-10-5", "hours": "平日 8:30-17:15", "services": ["健康相談", "予防接種"]}],
+                "水道": [{"name": "朝霞市上下水道部", "phone": "048-463-2621", "address": "朝霞市本町1-1-1", "hours": "平日 8:30-17:15", "services": ["水道開栓", "料金"]}],
+                "NTT": [{"name": "NTT東日本埼玉支店", "phone": "116", "address": "さいたま市大宮区桜木町1-9-6", "hours": "平日 9:00-17:00", "services": ["電話工事", "故障修理"]}],
+                "下水道": [{"name": "朝霞市上下水道部", "phone": "048-463-2622", "address": "朝霞市本町1-1-1", "hours": "平日 8:30-17:15", "services": ["下水道修理", "排水設備"]}]
+            }
+        },
+        "志木市": {
+            "": {
+                "労基署": [{"name": "川口労働基準監督署", "phone": "048-252-4381", "address": "川口市青木3-2-7", "hours": "平日 8:30-17:15", "services": ["労働相談", "労災申請"]}],
+                "警察署": [{"name": "朝霞警察署", "phone": "048-465-0110", "address": "朝霞市青葉台1-3-1", "hours": "24時間", "services": ["事件事故", "遺失物"]}],
+                "市区町村役所": [
+                    {"name": "志木市役所", "phone": "048-473-1111", "address": "志木市中宗岡1-1-1", "hours": "平日 8:30-17:15", "services": ["住民票", "戸籍"]},
+                    {"name": "志木市環境推進課", "phone": "048-473-1111", "address": "志木市中宗岡1-1-1", "hours": "平日 8:30-17:15", "services": ["ごみ収集", "リサイクル", "環境対策"]}
+                ],
+                "消防署": [{"name": "朝霞地区一部事務組合消防本部志木消防署", "phone": "048-473-0119", "address": "志木市中宗岡4-17-34", "hours": "24時間", "services": ["火災通報", "救急車"]}],
+                "ガス": [{"name": "東京ガス志木営業所", "phone": "0570-002211", "address": "志木市本町5-17-66", "hours": "平日 8:30-19:00", "services": ["ガス開栓", "緊急通報"]}],
+                "電力": [{"name": "東京電力パワーグリッド埼玉支社", "phone": "0120-995-007", "address": "さいたま市大宮区桜木町1-7-5", "hours": "平日 9:00-17:00", "services": ["停電情報", "電気工事"]}],
+                "病院": [{"name": "志木駅前クリニック", "phone": "048-473-3331", "address": "志木市本町5-18-40", "hours": "平日 9:00-18:00", "services": ["内科", "小児科"]}],
+                "保健所": [{"name": "朝霞保健所", "phone": "048-461-0468", "address": "朝霞市青葉台1-10-5", "hours": "平日 8:30-17:15", "services": ["健康相談", "予防接種"]}],
+                "水道": [{"name": "志木市上下水道課", "phone": "048-473-1111", "address": "志木市中宗岡1-1-1", "hours": "平日 8:30-17:15", "services": ["水道開栓", "料金"]}],
+                "NTT": [{"name": "NTT東日本埼玉支店", "phone": "116", "address": "さいたま市大宮区桜木町1-9-6", "hours": "平日 9:00-17:00", "services": ["電話工事", "故障修理"]}],
+                "下水道": [{"name": "志木市上下水道課", "phone": "048-473-1111", "address": "志木市中宗岡1-1-1", "hours": "平日 8:30-17:15", "services": ["下水道修理", "排水設備"]}]
+            }
+        },
+        "和光市": {
+            "": {
+                "労基署": [{"name": "川口労働基準監督署", "phone": "048-252-4381", "address": "川口市青木3-2-7", "hours": "平日 8:30-17:15", "services": ["労働相談", "労災申請"]}],
+                "警察署": [{"name": "朝霞警察署", "phone": "048-465-0110", "address": "朝霞市青葉台1-3-1", "hours": "24時間", "services": ["事件事故", "遺失物"]}],
+                "市区町村役所": [
+                    {"name": "和光市役所", "phone": "048-464-1111", "address": "和光市広沢1-5", "hours": "平日 8:30-17:15", "services": ["住民票", "戸籍"]},
+                    {"name": "和光市環境課", "phone": "048-424-9118", "address": "和光市広沢1-5", "hours": "平日 8:30-17:15", "services": ["ごみ収集", "リサイクル", "環境対策"]}
+                ],
+                "消防署": [{"name": "朝霞地区一部事務組合消防本部和光消防署", "phone": "048-464-0119", "address": "和光市中央1-3-32", "hours": "24時間", "services": ["火災通報", "救急車"]}],
+                "ガス": [{"name": "東京ガス和光営業所", "phone": "0570-002211", "address": "和光市本町8-3", "hours": "平日 8:30-19:00", "services": ["ガス開栓", "緊急通報"]}],
+                "電力": [{"name": "東京電力パワーグリッド埼玉支社", "phone": "0120-995-007", "address": "さいたま市大宮区桜木町1-7-5", "hours": "平日 9:00-17:00", "services": ["停電情報", "電気工事"]}],
+                "病院": [{"name": "和光市国民健康保険歯科診療所", "phone": "048-464-1550", "address": "和光市広沢1-5", "hours": "平日 9:00-17:00", "services": ["歯科", "口腔外科"]}],
+                "保健所": [{"name": "朝霞保健所", "phone": "048-461-0468", "address": "朝霞市青葉台1-10-5", "hours": "平日 8:30-17:15", "services": ["健康相談", "予防接種"]}],
+                "水道": [{"name": "和光市上下水道課", "phone": "048-424-9142", "address": "和光市広沢1-5", "hours": "平日 8:30-17:15", "services": ["水道開栓", "料金"]}],
+                "NTT": [{"name": "NTT東日本埼玉支店", "phone": "116", "address": "さいたま市大宮区桜木町1-9-6", "hours": "平日 9:00-17:00", "services": ["電話工事", "故障修理"]}],
+                "下水道": [{"name": "和光市上下水道課", "phone": "048-424-9143", "address": "和光市広沢1-5", "hours": "平日 8:30-17:15", "services": ["下水道修理", "排水設備"]}]
+            }
+        },
+        "新座市": {
+            "": {
+                "労基署": [{"name": "川口労働基準監督署", "phone": "048-252-4381", "address": "川口市青木3-2-7", "hours": "平日 8:30-17:15", "services": ["労働相談", "労災申請"]}],
+                "警察署": [{"name": "新座警察署", "phone": "048-482-0110", "address": "新座市野火止1-1-2", "hours": "24時間", "services": ["事件事故", "遺失物"]}],
+                "市区町村役所": [
+                    {"name": "新座市役所", "phone": "048-477-1111", "address": "新座市野火止1-1-1", "hours": "平日 8:30-17:15", "services": ["住民票", "戸籍"]},
+                    {"name": "新座市環境課", "phone": "048-424-4946", "address": "新座市野火止1-1-1", "hours": "平日 8:30-17:15", "services": ["ごみ収集", "リサイクル", "環境対策"]}
+                ],
+                "消防署": [{"name": "新座消防署", "phone": "048-478-1190", "address": "新座市野火止7-1-1", "hours": "24時間", "services": ["火災通報", "救急車"]}],
+                "ガス": [{"name": "東京ガス新座営業所", "phone": "0570-002211", "address": "新座市野火止5-1-31", "hours": "平日 8:30-19:00", "services": ["ガス開栓", "緊急通報"]}],
+                "電力": [{"name": "東京電力パワーグリッド埼玉支社", "phone": "0120-995-007", "address": "さいたま市大宮区桜木町1-7-5", "hours": "平日 9:00-17:00", "services": ["停電情報", "電気工事"]}],
+                "病院": [{"name": "新座志木中央総合病院", "phone": "048-474-7211", "address": "新座市東北2-30-11", "hours": "24時間救急", "services": ["総合診療", "救急医療"]}],
+                "保健所": [{"name": "朝霞保健所", "phone": "048-461-0468", "address": "朝霞市青葉台1-10-5", "hours": "平日 8:30-17:15", "services": ["健康相談", "予防接種"]}],
+                "水道": [{"name": "新座市上下水道課", "phone": "048-477-2484", "address": "新座市野火止1-1-1", "hours": "平日 8:30-17:15", "services": ["水道開栓", "料金"]}],
+                "NTT": [{"name": "NTT東日本埼玉支店", "phone": "116", "address": "さいたま市大宮区桜木町1-9-6", "hours": "平日 9:00-17:00", "services": ["電話工事", "故障修理"]}],
+                "下水道": [{"name": "新座市上下水道課", "phone": "048-477-2485", "address": "新座市野火止1-1-1", "hours": "平日 8:30-17:15", "services": ["下水道修理", "排水設備"]}]
+            }
+        },
+        "桶川市": {
+            "": {
+                "労基署": [{"name": "大宮労働基準監督署", "phone": "048-652-6131", "address": "さいたま市北区宮原町4-1-2", "hours": "平日 8:30-17:15", "services": ["労働相談", "労災申請"]}],
+                "警察署": [{"name": "上尾警察署", "phone": "048-773-0110", "address": "上尾市本町1-2-16", "hours": "24時間", "services": ["事件事故", "遺失物"]}],
+                "市区町村役所": [
+                    {"name": "桶川市役所", "phone": "048-786-3211", "address": "桶川市泉1-3-28", "hours": "平日 8:30-17:15", "services": ["住民票", "戸籍"]},
+                    {"name": "桶川市環境課", "phone": "048-788-4926", "address": "桶川市泉1-3-28", "hours": "平日 8:30-17:15", "services": ["ごみ収集", "リサイクル", "環境対策"]}
+                ],
+                "消防署": [{"name": "桶川市消防本部", "phone": "048-787-0119", "address": "桶川市川田谷4405", "hours": "24時間", "services": ["火災通報", "救急車"]}],
+                "ガス": [{"name": "東京ガス桶川営業所", "phone": "0570-002211", "address": "桶川市若宮1-2-28", "hours": "平日 8:30-19:00", "services": ["ガス開栓", "緊急通報"]}],
+                "電力": [{"name": "東京電力パワーグリッド埼玉支社", "phone": "0120-995-007", "address": "さいたま市大宮区桜木町1-7-5", "hours": "平日 9:00-17:00", "services": ["停電情報", "電気工事"]}],
+                "病院": [{"name": "桶川中央病院", "phone": "048-776-0022", "address": "桶川市坂田950-1", "hours": "平日 9:00-17:00", "services": ["内科", "外科"]}],
+                "保健所": [{"name": "鴻巣保健所", "phone": "048-541-0249", "address": "鴻巣市東4-2-53", "hours": "平日 8:30-17:15", "services": ["健康相談", "予防接種"]}],
+                "水道": [{"name": "桶川市上下水道課", "phone": "048-786-3211", "address": "桶川市泉1-3-28", "hours": "平日 8:30-17:15", "services": ["水道開栓", "料金"]}],
+                "NTT": [{"name": "NTT東日本埼玉支店", "phone": "116", "address": "さいたま市大宮区桜木町1-9-6", "hours": "平日 9:00-17:00", "services": ["電話工事", "故障修理"]}],
+                "下水道": [{"name": "桶川市上下水道課", "phone": "048-786-3211", "address": "桶川市泉1-3-28", "hours": "平日 8:30-17:15", "services": ["下水道修理", "排水設備"]}]
+            }
+        },
+        "久喜市": {
+            "": {
+                "労基署": [{"name": "越谷労働基準監督署", "phone": "048-975-2327", "address": "越谷市赤山町5-7-47", "hours": "平日 8:30-17:15", "services": ["労働相談", "労災申請"]}],
+                "警察署": [{"name": "久喜警察署", "phone": "0480-21-0110", "address": "久喜市久喜中央4-9-1", "hours": "24時間", "services": ["事件事故", "遺失物"]}],
+                "市区町村役所": [
+                    {"name": "久喜市役所", "phone": "0480-22-1111", "address": "久喜市下早見85-3", "hours": "平日 8:30-17:15", "services": ["住民票", "戸籍"]},
+                    {"name": "久喜市環境課", "phone": "0480-85-1111", "address": "久喜市下早見85-3", "hours": "平日 8:30-17:15", "services": ["ごみ収集", "リサイクル", "環境対策"]}
+                ],
+                "消防署": [{"name": "久喜市消防本部", "phone": "0480-21-0119", "address": "久喜市久喜中央4-7-25", "hours": "24時間", "services": ["火災通報", "救急車"]}],
+                "ガス": [{"name": "東京ガス久喜営業所", "phone": "0570-002211", "address": "久喜市久喜中央4-9-11", "hours": "平日 8:30-19:00", "services": ["ガス開栓", "緊急通報"]}],
+                "電力": [{"name": "東京電力パワーグリッド埼玉支社", "phone": "0120-995-007", "address": "さいたま市大宮区桜木町1-7-5", "hours": "平日 9:00-17:00", "services": ["停電情報", "電気工事"]}],
+                "病院": [{"name": "久喜総合病院", "phone": "0480-22-8522", "address": "久喜市上早見418-1", "hours": "24時間救急", "services": ["総合診療", "救急医療"]}],
+                "保健所": [{"name": "幸手保健所", "phone": "0480-42-1101", "address": "幸手市東4-6-17", "hours": "平日 8:30-17:15", "services": ["健康相談", "予防接種"]}],
+                "水道": [{"name": "久喜市上下水道課", "phone": "0480-85-1111", "address": "久喜市下早見85-3", "hours": "平日 8:30-17:15", "services": ["水道開栓", "料金"]}],
+                "NTT": [{"name": "NTT東日本埼玉支店", "phone": "116", "address": "さいたま市大宮区桜木町1-9-6", "hours": "平日 9:00-17:00", "services": ["電話工事", "故障修理"]}],
+                "下水道": [{"name": "久喜市上下水道課", "phone": "0480-85-1111", "address": "久喜市下早見85-3", "hours": "平日 8:30-17:15", "services": ["下水道修理", "排水設備"]}]
+            }
+        },
+        "北本市": {
+            "": {
+                "労基署": [{"name": "大宮労働基準監督署", "phone": "048-652-6131", "address": "さいたま市北区宮原町4-1-2", "hours": "平日 8:30-17:15", "services": ["労働相談", "労災申請"]}],
+                "警察署": [{"name": "鴻巣警察署", "phone": "048-543-0110", "address": "鴻巣市東4-2-64", "hours": "24時間", "services": ["事件事故", "遺失物"]}],
+                "市区町村役所": [
+                    {"name": "北本市役所", "phone": "048-591-1111", "address": "北本市本町1-111", "hours": "平日 8:30-17:15", "services": ["住民票", "戸籍"]},
+                    {"name": "北本市環境課", "phone": "048-594-5553", "address": "北本市本町1-111", "hours": "平日 8:30-17:15", "services": ["ごみ収集", "リサイクル", "環境対策"]}
+                ],
+                "消防署": [{"name": "北本市消防署", "phone": "048-592-3119", "address": "北本市緑3-346", "hours": "24時間", "services": ["火災通報", "救急車"]}],
+                "ガス": [{"name": "東京ガス北本営業所", "phone": "0570-002211", "address": "北本市中央1-156", "hours": "平日 8:30-19:00", "services": ["ガス開栓", "緊急通報"]}],
+                "電力": [{"name": "東京電力パワーグリッド埼玉支社", "phone": "0120-995-007", "address": "さいたま市大宮区桜木町1-7-5", "hours": "平日 9:00-17:00", "services": ["停電情報", "電気工事"]}],
+                "病院": [{"name": "北里大学メディカルセンター", "phone": "048-593-1212", "address": "北本市荒井6-100", "hours": "24時間救急", "services": ["総合診療", "救急医療"]}],
+                "保健所": [{"name": "鴻巣保健所", "phone": "048-541-0249", "address": "鴻巣市東4-2-53", "hours": "平日 8:30-17:15", "services": ["健康相談", "予防接種"]}],
+                "水道": [{"name": "北本市上下水道課", "phone": "048-594-5541", "address": "北本市本町1-111", "hours": "平日 8:30-17:15", "services": ["水道開栓", "料金"]}],
+                "NTT": [{"name": "NTT東日本埼玉支店", "phone": "116", "address": "さいたま市大宮区桜木町1-9-6", "hours": "平日 9:00-17:00", "services": ["電話工事", "故障修理"]}],
+                "下水道": [{"name": "北本市上下水道課", "phone": "048-594-5542", "address": "北本市本町1-111", "hours": "平日 8:30-17:15", "services": ["下水道修理", "排水設備"]}]
+            }
+        },
+        "八潮市": {
+            "": {
+                "労基署": [{"name": "越谷労働基準監督署", "phone": "048-975-2327", "address": "越谷市赤山町5-7-47", "hours": "平日 8:30-17:15", "services": ["労働相談", "労災申請"]}],
+                "警察署": [{"name": "草加警察署", "phone": "048-943-0110", "address": "草加市高砂1-7-1", "hours": "24時間", "services": ["事件事故", "遺失物"]}],
+                "市区町村役所": [
+                    {"name": "八潮市役所", "phone": "048-996-2111", "address": "八潮市中央1-2-1", "hours": "平日 8:30-17:15", "services": ["住民票", "戸籍"]},
+                    {"name": "八潮市環境リサイクル課", "phone": "048-996-2111", "address": "八潮市中央1-2-1", "hours": "平日 8:30-17:15", "services": ["ごみ収集", "リサイクル", "環境対策"]}
+                ],
+                "消防署": [{"name": "草加八潮消防組合八潮消防署", "phone": "048-996-0119", "address": "八潮市中央1-2-8", "hours": "24時間", "services": ["火災通報", "救急車"]}],
+                "ガス": [{"name": "東京ガス八潮営業所", "phone": "0570-002211", "address": "八潮市中央1-10-1", "hours": "平日 8:30-19:00", "services": ["ガス開栓", "緊急通報"]}],
+                "電力": [{"name": "東京電力パワーグリッド埼玉支社", "phone": "0120-995-007", "address": "さいたま市大宮区桜木町1-7-5", "hours": "平日 9:00-17:00", "services": ["停電情報", "電気工事"]}],
+                "病院": [{"name": "八潮中央総合病院", "phone": "048-996-1131", "address": "八潮市南川崎845", "hours": "24時間救急", "services": ["総合診療", "救急医療"]}],
+                "保健所": [{"name": "草加保健所", "phone": "048-925-1551", "address": "草加市西町425-2", "hours": "平日 8:30-17:15", "services": ["健康相談", "予防接種"]}],
+                "水道": [{"name": "八潮市上下水道部", "phone": "048-996-1499", "address": "八潮市中央1-2-1", "hours": "平日 8:30-17:15", "services": ["水道開栓", "料金"]}],
+                "NTT": [{"name": "NTT東日本埼玉支店", "phone": "116", "address": "さいたま市大宮区桜木町1-9-6", "hours": "平日 9:00-17:00", "services": ["電話工事", "故障修理"]}],
+                "下水道": [{"name": "八潮市上下水道部", "phone": "048-996-1500", "address": "八潮市中央1-2-1", "hours": "平日 8:30-17:15", "services": ["下水道修理", "排水設備"]}]
+            }
+        },
+        "富士見市": {
+            "": {
+                "労基署": [{"name": "川口労働基準監督署", "phone": "048-252-4381", "address": "川口市青木3-2-7", "hours": "平日 8:30-17:15", "services": ["労働相談", "労災申請"]}],
+                "警察署": [{"name": "東入間警察署", "phone": "049-269-0110", "address": "富士見市ふじみ野東1-5-3", "hours": "24時間", "services": ["事件事故", "遺失物"]}],
+                "市区町村役所": [
+                    {"name": "富士見市役所", "phone": "049-251-2711", "address": "富士見市鶴馬1800-1", "hours": "平日 8:30-17:15", "services": ["住民票", "戸籍"]},
+                    {"name": "富士見市環境課", "phone": "049-252-7129", "address": "富士見市鶴馬1800-1", "hours": "平日 8:30-17:15", "services": ["ごみ収集", "リサイクル", "環境対策"]}
+                ],
+                "消防署": [{"name": "入間東部地区消防組合富士見消防署", "phone": "049-261-6673", "address": "富士見市鶴馬3351-2", "hours": "24時間", "services": ["火災通報", "救急車"]}],
+                "ガス": [{"name": "武州ガス富士見営業所", "phone": "049-251-2244", "address": "富士見市鶴馬1865-1", "hours": "平日 8:30-19:00", "services": ["ガス開栓", "緊急通報"]}],
+                "電力": [{"name": "東京電力パワーグリッド埼玉支社", "phone": "0120-995-007", "address": "さいたま市大宮区桜木町1-7-5", "hours": "平日 9:00-17:00", "services": ["停電情報", "電気工事"]}],
+                "病院": [{"name": "イムス富士見総合病院", "phone": "049-251-3060", "address": "富士見市鶴馬1967-1", "hours": "24時間救急", "services": ["総合診療", "救急医療"]}],
+                "保健所": [{"name": "朝霞保健所", "phone": "048-461-0468", "address": "朝霞市青葉台1-10-5", "hours": "平日 8:30-17:15", "services": ["健康相談", "予防接種"]}],
+                "水道": [{"name": "富士見市上下水道課", "phone": "049-251-2711", "address": "富士見市鶴馬1800-1", "hours": "平日 8:30-17:15", "services": ["水道開栓", "料金"]}],
+                "NTT": [{"name": "NTT東日本埼玉支店", "phone": "116", "address": "さいたま市大宮区桜木町1-9-6", "hours": "平日 9:00-17:00", "services": ["電話工事", "故障修理"]}],
+                "下水道": [{"name": "富士見市上下水道課", "phone": "049-251-2711", "address": "富士見市鶴馬1800-1", "hours": "平日 8:30-17:15", "services": ["下水道修理", "排水設備"]}]
+            }
+        },
+        "三郷市": {
+            "": {
+                "労基署": [{"name": "越谷労働基準監督署", "phone": "048-975-2327", "address": "越谷市赤山町5-7-47", "hours": "平日 8:30-17:15", "services": ["労働相談", "労災申請"]}],
+                "警察署": [{"name": "吉川警察署", "phone": "048-958-0110", "address": "吉川市きよみ野1-1", "hours": "24時間", "services": ["事件事故", "遺失物"]}],
+                "市区町村役所": [
+                    {"name": "三郷市役所", "phone": "048-953-1111", "address": "三郷市花和田648-1", "hours": "平日 8:30-17:15", "services": ["住民票", "戸籍"]},
+                    {"name": "三郷市環境安全部", "phone": "048-930-7722", "address": "三郷市花和田648-1", "hours": "平日 8:30-17:15", "services": ["ごみ収集", "リサイクル", "環境対策"]}
+                ],
+                "消防署": [{"name": "三郷市消防本部", "phone": "048-952-3119", "address": "三郷市花和田629", "hours": "24時間", "services": ["火災通報", "救急車"]}],
+                "ガス": [{"name": "東京ガス三郷営業所", "phone": "0570-002211", "address": "三郷市早稲田2-2-8", "hours": "平日 8:30-19:00", "services": ["ガス開栓", "緊急通報"]}],
+                "電力": [{"name": "東京電力パワーグリッド埼玉支社", "phone": "0120-995-007", "address": "さいたま市大宮区桜木町1-7-5", "hours": "平日 9:00-17:00", "services": ["停電情報", "電気工事"]}],
+                "病院": [{"name": "みさと健和病院", "phone": "048-953-1321", "address": "三郷市立花12-1-1", "hours": "24時間救急", "services": ["総合診療", "救急医療"]}],
+                "保健所": [{"name": "草加保健所", "phone": "048-925-1551", "address": "草加市西町425-2", "hours": "平日 8:30-17:15", "services": ["健康相談", "予防接種"]}],
+                "水道": [{"name": "三郷市水道部", "phone": "048-953-1111", "address": "三郷市花和田648-1", "hours": "平日 8:30-17:15", "services": ["水道開栓", "料金"]}],
+                "NTT": [{"name": "NTT東日本埼玉支店", "phone": "116", "address": "さいたま市大宮区桜木町1-9-6", "hours": "平日 9:00-17:00", "services": ["電話工事", "故障修理"]}],
+                "下水道": [{"name": "三郷市下水道課", "phone": "048-930-7729", "address": "三郷市花和田648-1", "hours": "平日 8:30-17:15", "services": ["下水道修理", "排水設備"]}]
+            }
+        },
+        "蓮田市": {
+            "": {
+                "労基署": [{"name": "大宮労働基準監督署", "phone": "048-652-6131", "address": "さいたま市北区宮原町4-1-2", "hours": "平日 8:30-17:15", "services": ["労働相談", "労災申請"]}],
+                "警察署": [{"name": "岩槻警察署", "phone": "048-757-0110", "address": "さいたま市岩槻区本町4-7-5", "hours": "24時間", "services": ["事件事故", "遺失物"]}],
+                "市区町村役所": [
+                    {"name": "蓮田市役所", "phone": "048-768-3111", "address": "蓮田市黒浜2799-1", "hours": "平日 8:30-17:15", "services": ["住民票", "戸籍"]},
+                    {"name": "蓮田市環境経済課", "phone": "048-768-3111", "address": "蓮田市黒浜2799-1", "hours": "平日 8:30-17:15", "services": ["ごみ収集", "リサイクル", "環境対策"]}
+                ],
+                "消防署": [{"name": "蓮田白岡衛生組合消防署", "phone": "048-768-2119", "address": "蓮田市黒浜6140", "hours": "24時間", "services": ["火災通報", "救急車"]}],
+                "ガス": [{"name": "東京ガス蓮田営業所", "phone": "0570-002211", "address": "蓮田市西新宿1-137", "hours": "平日 8:30-19:00", "services": ["ガス開栓", "緊急通報"]}],
+                "電力": [{"name": "東京電力パワーグリッド埼玉支社", "phone": "0120-995-007", "address": "さいたま市大宮区桜木町1-7-5", "hours": "平日 9:00-17:00", "services": ["停電情報", "電気工事"]}],
+                "病院": [{"name": "蓮田病院", "phone": "048-766-8121", "address": "蓮田市根金1662-1", "hours": "24時間救急", "services": ["総合診療", "救急医療"]}],
+                "保健所": [{"name": "幸手保健所", "phone": "0480-42-1101", "address": "幸手市東4-6-17", "hours": "平日 8:30-17:15", "services": ["健康相談", "予防接種"]}],
+                "水道": [{"name": "蓮田市上下水道課", "phone": "048-768-3111", "address": "蓮田市黒浜2799-1", "hours": "平日 8:30-17:15", "services": ["水道開栓", "料金"]}],
+                "NTT": [{"name": "NTT東日本埼玉支店", "phone": "116", "address": "さいたま市大宮区桜木町1-9-6", "hours": "平日 9:00-17:00", "services": ["電話工事", "故障修理"]}],
+                "下水道": [{"name": "蓮田市上下水道課", "phone": "048-768-3111", "address": "蓮田市黒浜2799-1", "hours": "平日 8:30-17:15", "services": ["下水道修理", "排水設備"]}]
+            }
+        },
+        "坂戸市": {
+            "": {
+                "労基署": [{"name": "川越労働基準監督署", "phone": "049-242-0891", "address": "川越市豊田本1-19-1", "hours": "平日 8:30-17:15", "services": ["労働相談", "労災申請"]}],
+                "警察署": [{"name": "西入間警察署", "phone": "049-284-0110", "address": "坂戸市石井2327-2", "hours": "24時間", "services": ["事件事故", "遺失物"]}],
+                "市区町村役所": [
+                    {"name": "坂戸市役所", "phone": "049-283-1331", "address": "坂戸市千代田1-1-1", "hours": "平日 8:30-17:15", "services": ["住民票", "戸籍"]},
+                    {"name": "坂戸市環境政策課", "phone": "049-283-1331", "address": "坂戸市千代田1-1-1", "hours": "平日 8:30-17:15", "services": ["ごみ収集", "リサイクル", "環境対策"]}
+                ],
+                "消防署": [{"name": "坂戸・鶴ヶ島消防組合坂戸消防署", "phone": "049-281-3119", "address": "坂戸市千代田5-1-12", "hours": "24時間", "services": ["火災通報", "救急車"]}],
+                "ガス": [{"name": "武州ガス坂戸営業所", "phone": "049-281-0326", "address": "坂戸市薬師町12-7", "hours": "平日 8:30-19:00", "services": ["ガス開栓", "緊急通報"]}],
+                "電力": [{"name": "東京電力パワーグリッド埼玉支社", "phone": "0120-995-007", "address": "さいたま市大宮区桜木町1-7-5", "hours": "平日 9:00-17:00", "services": ["停電情報", "電気工事"]}],
+                "病院": [{"name": "関越病院", "phone": "049-285-3251", "address": "坂戸市石井2100", "hours": "24時間救急", "services": ["総合診療", "救急医療"]}],
+                "保健所": [{"name": "坂戸保健所", "phone": "049-283-7815", "address": "坂戸市石井2327-1", "hours": "平日 8:30-17:15", "services": ["健康相談", "予防接種"]}],
+                "水道": [{"name": "坂戸市上下水道課", "phone": "049-283-1331", "address": "坂戸市千代田1-1-1", "hours": "平日 8:30-17:15", "services": ["水道開栓", "料金"]}],
+                "NTT": [{"name": "NTT東日本埼玉支店", "phone": "116", "address": "さいたま市大宮区桜木町1-9-6", "hours": "平日 9:00-17:00", "services": ["電話工事", "故障修理"]}],
+                "下水道": [{"name": "坂戸市上下水道課", "phone": "049-283-1331", "address": "坂戸市千代田1-1-1", "hours": "平日 8:30-17:15", "services": ["下水道修理", "排水設備"]}]
+            }
+        },
+        "幸手市": {
+            "": {
+                "労基署": [{"name": "越谷労働基準監督署", "phone": "048-975-2327", "address": "越谷市赤山町5-7-47", "hours": "平日 8:30-17:15", "services": ["労働相談", "労災申請"]}],
+                "警察署": [{"name": "久喜警察署", "phone": "0480-21-0110", "address": "久喜市久喜中央4-9-1", "hours": "24時間", "services": ["事件事故", "遺失物"]}],
+                "市区町村役所": [
+                    {"name": "幸手市役所", "phone": "0480-43-1111", "address": "幸手市東4-6-8", "hours": "平日 8:30-17:15", "services": ["住民票", "戸籍"]},
+                    {"name": "幸手市環境課", "phone": "0480-43-1111", "address": "幸手市東4-6-8", "hours": "平日 8:30-17:15", "services": ["ごみ収集", "リサイクル", "環境対策"]}
+                ],
+                "消防署": [{"name": "幸手市消防署", "phone": "0480-42-0119", "address": "幸手市東4-6-15", "hours": "24時間", "services": ["火災通報", "救急車"]}],
+                "ガス": [{"name": "東京ガス幸手営業所", "phone": "0570-002211", "address": "幸手市中4-11-41", "hours": "平日 8:30-19:00", "services": ["ガス開栓", "緊急通報"]}],
+                "電力": [{"name": "東京電力パワーグリッド埼玉支社", "phone": "0120-995-007", "address": "さいたま市大宮区桜木町1-7-5", "hours": "平日 9:00-17:00", "services": ["停電情報", "電気工事"]}],
+                "病院": [{"name": "幸手総合病院", "phone": "0480-42-1101", "address": "幸手市香日向1-10-1", "hours": "24時間救急", "services": ["総合診療", "救急医療"]}],
+                "保健所": [{"name": "幸手保健所", "phone": "0480-42-1101", "address": "幸手市東4-6-17", "hours": "平日 8:30-17:15", "services": ["健康相談", "予防接種"]}],
+                "水道": [{"name": "幸手市上下水道課", "phone": "0480-43-1111", "address": "幸手市東4-6-8", "hours": "平日 8:30-17:15", "services": ["水道開栓", "料金"]}],
+                "NTT": [{"name": "NTT東日本埼玉支店", "phone": "116", "address": "さいたま市大宮区桜木町1-9-6", "hours": "平日 9:00-17:00", "services": ["電話工事", "故障修理"]}],
+                "下水道": [{"name": "幸手市上下水道課", "phone": "0480-43-1111", "address": "幸手市東4-6-8", "hours": "平日 8:30-17:15", "services": ["下水道修理", "排水設備"]}]
+            }
+        },
+        "鶴ヶ島市": {
+            "": {
+                "労基署": [{"name": "川越労働基準監督署", "phone": "049-242-0891", "address": "川越市豊田本1-19-1", "hours": "平日 8:30-17:15", "services": ["労働相談", "労災申請"]}],
+                "警察署": [{"name": "西入間警察署", "phone": "049-284-0110", "address": "坂戸市石井2327-2", "hours": "24時間", "services": ["事件事故", "遺失物"]}],
+                "市区町村役所": [
+                    {"name": "鶴ヶ島市役所", "phone": "049-271-1111", "address": "鶴ヶ島市三ツ木16-1", "hours": "平日 8:30-17:15", "services": ["住民票", "戸籍"]},
+                    {"name": "鶴ヶ島市環境推進課", "phone": "049-271-1111", "address": "鶴ヶ島市三ツ木16-1", "hours": "平日 8:30-17:15", "services": ["ごみ収集", "リサイクル", "環境対策"]}
+                ],
+                "消防署": [{"name": "坂戸・鶴ヶ島消防組合鶴ヶ島消防署", "phone": "049-285-2119", "address": "鶴ヶ島市大字鶴ヶ丘65-1", "hours": "24時間", "services": ["火災通報", "救急車"]}],
+                "ガス": [{"name": "武州ガス鶴ヶ島営業所", "phone": "049-285-3456", "address": "鶴ヶ島市富士見1-2-1", "hours": "平日 8:30-19:00", "services": ["ガス開栓", "緊急通報"]}],
+                "電力": [{"name": "東京電力パワーグリッド埼玉支社", "phone": "0120-995-007", "address": "さいたま市大宮区桜木町1-7-5", "hours": "平日 9:00-17:00", "services": ["停電情報", "電気工事"]}],
+                "病院": [{"name": "埼玉医科大学病院", "phone": "049-276-1111", "address": "入間郡毛呂山町毛呂本郷38", "hours": "24時間救急", "services": ["総合診療", "救急医療"]}],
+                "保健所": [{"name": "坂戸保健所", "phone": "049-283-7815", "address": "坂戸市石井2327-1", "hours": "平日 8:30-17:15", "services": ["健康相談", "予防接種"]}],
+                "水道": [{"name": "鶴ヶ島市上下水道課", "phone": "049-271-1111", "address": "鶴ヶ島市三ツ木16-1", "hours": "平日 8:30-17:15", "services": ["水道開栓", "料金"]}],
+                "NTT": [{"name": "NTT東日本埼玉支店", "phone": "116", "address": "さいたま市大宮区桜木町1-9-6", "hours": "平日 9:00-17:00", "services": ["電話工事", "故障修理"]}],
+                "下水道": [{"name": "鶴ヶ島市上下水道課", "phone": "049-271-1111", "address": "鶴ヶ島市三ツ木16-1", "hours": "平日 8:30-17:15", "services": ["下水道修理", "排水設備"]}]
+            }
+        },
+        "日高市": {
+            "": {
+                "労基署": [{"name": "川越労働基準監督署", "phone": "049-242-0891", "address": "川越市豊田本1-19-1", "hours": "平日 8:30-17:15", "services": ["労働相談", "労災申請"]}],
+                "警察署": [{"name": "飯能警察署", "phone": "042-972-0110", "address": "飯能市双柳105-2", "hours": "24時間", "services": ["事件事故", "遺失物"]}],
+                "市区町村役所": [
+                    {"name": "日高市役所", "phone": "042-989-2111", "address": "日高市南平沢1020", "hours": "平日 8:30-17:15", "services": ["住民票", "戸籍"]},
+                    {"name": "日高市環境課", "phone": "042-989-2111", "address": "日高市南平沢1020", "hours": "平日 8:30-17:15", "services": ["ごみ収集", "リサイクル", "環境対策"]}
+                ],
+                "消防署": [{"name": "埼玉西部消防組合日高消防署", "phone": "042-985-5403", "address": "日高市原宿919", "hours": "24時間", "services": ["火災通報", "救急車"]}],
+                "ガス": [{"name": "武州ガス日高営業所", "phone": "042-985-2121", "address": "日高市原宿208-1", "hours": "平日 8:30-19:00", "services": ["ガス開栓", "緊急通報"]}],
+                "電力": [{"name": "東京電力パワーグリッド埼玉支社", "phone": "0120-995-007", "address": "さいたま市大宮区桜木町1-7-5", "hours": "平日 9:00-17:00", "services": ["停電情報", "電気工事"]}],
+                "病院": [{"name": "埼玉医科大学国際医療センター", "phone": "042-984-4111", "address": "日高市山根1397-1", "hours": "24時間救急", "services": ["総合診療", "救急医療"]}],
+                "保健所": [{"name": "狭山保健所", "phone": "04-2954-6212", "address": "狭山市稲荷山2-16-1", "hours": "平日 8:30-17:15", "services": ["健康相談", "予防接種"]}],
+                "水道": [{"name": "日高市上下水道課", "phone": "042-989-2111", "address": "日高市南平沢1020", "hours": "平日 8:30-17:15", "services": ["水道開栓", "料金"]}],
+                "NTT": [{"name": "NTT東日本埼玉支店", "phone": "116", "address": "さいたま市大宮区桜木町1-9-6", "hours": "平日 9:00-17:00", "services": ["電話工事", "故障修理"]}],
+                "下水道": [{"name": "日高市上下水道課", "phone": "042-989-2111", "address": "日高市南平沢1020", "hours": "平日 8:30-17:15", "services": ["下水道修理", "排水設備"]}]
+            }
+        },
+        "吉川市": {
+            "": {
+                "労基署": [{"name": "越谷労働基準監督署", "phone": "048-975-2327", "address": "越谷市赤山町5-7-47", "hours": "平日 8:30-17:15", "services": ["労働相談", "労災申請"]}],
+                "警察署": [{"name": "吉川警察署", "phone": "048-958-0110", "address": "吉川市きよみ野1-1", "hours": "24時間", "services": ["事件事故", "遺失物"]}],
+                "市区町村役所": [
+                    {"name": "吉川市役所", "phone": "048-982-5111", "address": "吉川市きよみ野1-1", "hours": "平日 8:30-17:15", "services": ["住民票", "戸籍"]},
+                    {"name": "吉川市環境課", "phone": "048-982-9698", "address": "吉川市きよみ野1-1", "hours": "平日 8:30-17:15", "services": ["ごみ収集", "リサイクル", "環境対策"]}
+                ],
+                "消防署": [{"name": "吉川松伏消防組合吉川消防署", "phone": "048-982-3994", "address": "吉川市吉川1435", "hours": "24時間", "services": ["火災通報", "救急車"]}],
+                "ガス": [{"name": "東京ガス吉川営業所", "phone": "0570-002211", "address": "吉川市保1-20-1", "hours": "平日 8:30-19:00", "services": ["ガス開栓", "緊急通報"]}],
+                "電力": [{"name": "東京電力パワーグリッド埼玉支社", "phone": "0120-995-007", "address": "さいたま市大宮区桜木町1-7-5", "hours": "平日 9:00-17:00", "services": ["停電情報", "電気工事"]}],
+                "病院": [{"name": "吉川中央総合病院", "phone": "048-982-8311", "address": "吉川市平沼111", "hours": "24時間救急", "services": ["総合診療", "救急医療"]}],
+                "保健所": [{"name": "草加保健所", "phone": "048-925-1551", "address": "草加市西町425-2", "hours": "平日 8:30-17:15", "services": ["健康相談", "予防接種"]}],
+                "水道": [{"name": "吉川市上下水道課", "phone": "048-982-5111", "address": "吉川市きよみ野1-1", "hours": "平日 8:30-17:15", "services": ["水道開栓", "料金"]}],
+                "NTT": [{"name": "NTT東日本埼玉支店", "phone": "116", "address": "さいたま市大宮区桜木町1-9-6", "hours": "平日 9:00-17:00", "services": ["電話工事", "故障修理"]}],
+                "下水道": [{"name": "吉川市上下水道課", "phone": "048-982-5111", "address": "吉川市きよみ野1-1", "hours": "平日 8:30-17:15", "services": ["下水道修理", "排水設備"]}]
+            }
+        },
+        "ふじみ野市": {
+            "": {
+                "労基署": [{"name": "川越労働基準監督署", "phone": "049-242-0891", "address": "川越市豊田本1-19-1", "hours": "平日 8:30-17:15", "services": ["労働相談", "労災申請"]}],
+                "警察署": [{"name": "東入間警察署", "phone": "049-269-0110", "address": "富士見市ふじみ野東1-5-3", "hours": "24時間", "services": ["事件事故", "遺失物"]}],
+                "市区町村役所": [
+                    {"name": "ふじみ野市役所", "phone": "049-261-2611", "address": "ふじみ野市福岡1-1-1", "hours": "平日 8:30-17:15", "services": ["住民票", "戸籍"]},
+                    {"name": "ふじみ野市環境課", "phone": "049-262-9021", "address": "ふじみ野市福岡1-1-1", "hours": "平日 8:30-17:15", "services": ["ごみ収集", "リサイクル", "環境対策"]}
+                ],
+                "消防署": [{"name": "入間東部地区消防組合ふじみ野消防署", "phone": "049-261-6673", "address": "ふじみ野市福岡1-2-5", "hours": "24時間", "services": ["火災通報", "救急車"]}],
+                "ガス": [{"name": "武州ガスふじみ野営業所", "phone": "049-261-3621", "address": "ふじみ野市うれし野2-10-36", "hours": "平日 8:30-19:00", "services": ["ガス開栓", "緊急通報"]}],
+                "電力": [{"name": "東京電力パワーグリッド埼玉支社", "phone": "0120-995-007", "address": "さいたま市大宮区桜木町1-7-5", "hours": "平日 9:00-17:00", "services": ["停電情報", "電気工事"]}],
+                "病院": [{"name": "ふじみ野救急病院", "phone": "049-264-8292", "address": "ふじみ野市駒林元町3-1-8", "hours": "24時間救急", "services": ["救急医療", "内科"]}],
+                "保健所": [{"name": "朝霞保健所", "phone": "048-461-0468", "address": "朝霞市青葉台1-10-5", "hours": "平日 8:30-17:15", "services": ["健康相談", "予防接種"]}],
+                "水道": [{"name": "ふじみ野市上下水道課", "phone": "049-220-2078", "address": "ふじみ野市福岡1-1-1", "hours": "平日 8:30-17:15", "services": ["水道開栓", "料金"]}],
+                "NTT": [{"name": "NTT東日本埼玉支店", "phone": "116", "address": "さいたま市大宮区桜木町1-9-6", "hours": "平日 9:00-17:00", "services": ["電話工事", "故障修理"]}],
+                "下水道": [{"name": "ふじみ野市上下水道課", "phone": "049-220-2079", "address": "ふじみ野市福岡1-1-1", "hours": "平日 8:30-17:15", "services": ["下水道修理", "排水設備"]}]
+            }
+        },
+        "白岡市": {
+            "": {
+                "労基署": [{"name": "大宮労働基準監督署", "phone": "048-652-6131", "address": "さいたま市北区宮原町4-1-2", "hours": "平日 8:30-17:15", "services": ["労働相談", "労災申請"]}],
+                "警察署": [{"name": "久喜警察署", "phone": "0480-21-0110", "address": "久喜市久喜中央4-9-1", "hours": "24時間", "services": ["事件事故", "遺失物"]}],
+                "市区町村役所": [
+                    {"name": "白岡市役所", "phone": "0480-92-1111", "address": "白岡市千駄野432", "hours": "平日 8:30-17:15", "services": ["住民票", "戸籍"]},
+                    {"name": "白岡市環境課", "phone": "0480-92-1111", "address": "白岡市千駄野432", "hours": "平日 8:30-17:15", "services": ["ごみ収集", "リサイクル", "環境対策"]}
+                ],
+                "消防署": [{"name": "蓮田白岡衛生組合消防署白岡分署", "phone": "0480-92-3119", "address": "白岡市千駄野709", "hours": "24時間", "services": ["火災通報", "救急車"]}],
+                "ガス": [{"name": "東京ガス白岡営業所", "phone": "0570-002211", "address": "白岡市西5-4-8", "hours": "平日 8:30-19:00", "services": ["ガス開栓", "緊急通報"]}],
+                "電力": [{"name": "東京電力パワーグリッド埼玉支社", "phone": "0120-995-007", "address": "さいたま市大宮区桜木町1-7-5", "hours": "平日 9:00-17:00", "services": ["停電情報", "電気工事"]}],
+                "病院": [{"name": "白岡中央総合病院", "phone": "0480-93-7161", "address": "白岡市白岡1049-1", "hours": "24時間救急", "services": ["総合診療", "救急医療"]}],
+                "保健所": [{"name": "幸手保健所", "phone": "0480-42-1101", "address": "幸手市東4-6-17", "hours": "平日 8:30-17:15", "services": ["健康相談", "予防接種"]}],
+                "水道": [{"name": "白岡市上下水道課", "phone": "0480-92-1111", "address": "白岡市千駄野432", "hours": "平日 8:30-17:15", "services": ["水道開栓", "料金"]}],
+                "NTT": [{"name": "NTT東日本埼玉支店", "phone": "116", "address": "さいたま市大宮区桜木町1-9-6", "hours": "平日 9:00-17:00", "services": ["電話工事", "故障修理"]}],
+                "下水道": [{"name": "白岡市上下水道課", "phone": "0480-92-1111", "address": "白岡市千駄野432", "hours": "平日 8:30-17:15", "services": ["下水道修理", "排水設備"]}]
+            }
+        },
+        "三芳町": {
+            "": {
+                "労基署": [{"name": "川越労働基準監督署", "phone": "049-242-0881", "address": "川越市豊田本1-19-8", "hours": "平日 8:30-17:15", "services": ["労働相談", "労災申請"]}],
+                "警察署": [{"name": "東入間警察署", "phone": "04-2962-0110", "address": "入間郡三芳町藤久保855-2", "hours": "24時間", "services": ["事件事故", "遺失物"]}],
+                "市区町村役所": [
+                    {"name": "三芳町役場", "phone": "049-258-0019", "address": "入間郡三芳町藤久保1100-1", "hours": "平日 8:30-17:15", "services": ["住民票", "戸籍"]},
+                    {"name": "三芳町環境課", "phone": "049-258-0019", "address": "入間郡三芳町藤久保1100-1", "hours": "平日 8:30-17:15", "services": ["ごみ収集", "リサイクル", "環境対策"]}
+                ],
+                "消防署": [{"name": "入間東部地区消防組合三芳分署", "phone": "049-258-0119", "address": "入間郡三芳町藤久保326-1", "hours": "24時間", "services": ["火災通報", "救急車"]}],
+                "ガス": [{"name": "東京ガス川越支店", "phone": "0570-002211", "address": "川越市豊田本1-5-2", "hours": "平日 8:30-19:00", "services": ["ガス開栓", "緊急通報"]}],
+                "電力": [{"name": "東京電力パワーグリッド埼玉支社", "phone": "0120-995-005", "address": "さいたま市大宮区桜木町1-7-5", "hours": "平日 9:00-17:00", "services": ["停電情報", "電気工事"]}],
+                "病院": [{"name": "三芳町立病院", "phone": "049-258-1238", "address": "入間郡三芳町藤久保974-3", "hours": "平日 8:30-17:00", "services": ["内科", "外科"]}],
+                "保健所": [{"name": "朝霞保健所", "phone": "048-461-0468", "address": "朝霞市青葉台1-10-5", "hours": "平日 8:30-17:15", "services": ["健康相談", "予防接種"]}],
+                "水道": [{"name": "三芳町上下水道課", "phone": "049-258-0019", "address": "入間郡三芳町藤久保1100-1", "hours": "平日 8:30-17:15", "services": ["水道開栓", "料金"]}],
+                "NTT": [{"name": "NTT東日本埼玉支店", "phone": "116", "address": "さいたま市大宮区桜木町1-9-6", "hours": "平日 9:00-17:00", "services": ["電話工事", "故障修理"]}],
+                "下水道": [{"name": "三芳町上下水道課", "phone": "049-258-0019", "address": "入間郡三芳町藤久保1100-1", "hours": "平日 8:30-17:15", "services": ["下水道修理", "排水設備"]}]
+            }
+        },
+        "毛呂山町": {
+            "": {
+                "労基署": [{"name": "川越労働基準監督署", "phone": "049-242-0881", "address": "川越市豊田本1-19-8", "hours": "平日 8:30-17:15", "services": ["労働相談", "労災申請"]}],
+                "警察署": [{"name": "西入間警察署", "phone": "049-284-0110", "address": "入間郡毛呂山町岩井西5-16-1", "hours": "24時間", "services": ["事件事故", "遺失物"]}],
+                "市区町村役所": [
+                    {"name": "毛呂山町役場", "phone": "049-295-2112", "address": "入間郡毛呂山町中央2-1", "hours": "平日 8:30-17:15", "services": ["住民票", "戸籍"]},
+                    {"name": "毛呂山町生活環境課", "phone": "049-295-2112", "address": "入間郡毛呂山町中央2-1", "hours": "平日 8:30-17:15", "services": ["ごみ収集", "リサイクル", "環境対策"]}
+                ],
+                "消防署": [{"name": "埼玉西部消防局毛呂山分署", "phone": "049-294-0119", "address": "入間郡毛呂山町岩井西3-13-1", "hours": "24時間", "services": ["火災通報", "救急車"]}],
+                "ガス": [{"name": "東京ガス川越支店", "phone": "0570-002211", "address": "川越市豊田本1-5-2", "hours": "平日 8:30-19:00", "services": ["ガス開栓", "緊急通報"]}],
+                "電力": [{"name": "東京電力パワーグリッド埼玉支社", "phone": "0120-995-005", "address": "さいたま市大宮区桜木町1-7-5", "hours": "平日 9:00-17:00", "services": ["停電情報", "電気工事"]}],
+                "病院": [{"name": "埼玉医科大学病院", "phone": "049-276-1111", "address": "入間郡毛呂山町毛呂本郷38", "hours": "24時間救急", "services": ["総合診療", "救急医療"]}],
+                "保健所": [{"name": "坂戸保健所", "phone": "049-283-7815", "address": "坂戸市石井2327-1", "hours": "平日 8:30-17:15", "services": ["健康相談", "予防接種"]}],
+                "水道": [{"name": "毛呂山町上下水道課", "phone": "049-295-2112", "address": "入間郡毛呂山町中央2-1", "hours": "平日 8:30-17:15", "services": ["水道開栓", "料金"]}],
+                "NTT": [{"name": "NTT東日本埼玉支店", "phone": "116", "address": "さいたま市大宮区桜木町1-9-6", "hours": "平日 9:00-17:00", "services": ["電話工事", "故障修理"]}],
+                "下水道": [{"name": "毛呂山町上下水道課", "phone": "049-295-2112", "address": "入間郡毛呂山町中央2-1", "hours": "平日 8:30-17:15", "services": ["下水道修理", "排水設備"]}]
+            }
+        },
+        "越生町": {
+            "": {
+                "労基署": [{"name": "川越労働基準監督署", "phone": "049-242-0881", "address": "川越市豊田本1-19-8", "hours": "平日 8:30-17:15", "services": ["労働相談", "労災申請"]}],
+                "警察署": [{"name": "西入間警察署", "phone": "049-284-0110", "address": "入間郡毛呂山町岩井西5-16-1", "hours": "24時間", "services": ["事件事故", "遺失物"]}],
+                "市区町村役所": [
+                    {"name": "越生町役場", "phone": "049-292-3121", "address": "入間郡越生町上野500-2", "hours": "平日 8:30-17:15", "services": ["住民票", "戸籍"]},
+                    {"name": "越生町町民課", "phone": "049-292-3121", "address": "入間郡越生町上野500-2", "hours": "平日 8:30-17:15", "services": ["ごみ収集", "リサイクル", "環境対策"]}
+                ],
+                "消防署": [{"name": "埼玉西部消防局越生分署", "phone": "049-292-0119", "address": "入間郡越生町上野633-2", "hours": "24時間", "services": ["火災通報", "救急車"]}],
+                "ガス": [{"name": "東京ガス川越支店", "phone": "0570-002211", "address": "川越市豊田本1-5-2", "hours": "平日 8:30-19:00", "services": ["ガス開栓", "緊急通報"]}],
+                "電力": [{"name": "東京電力パワーグリッド埼玉支社", "phone": "0120-995-005", "address": "さいたま市大宮区桜木町1-7-5", "hours": "平日 9:00-17:00", "services": ["停電情報", "電気工事"]}],
+                "病院": [{"name": "越生町国民健康保険診療所", "phone": "049-292-2221", "address": "入間郡越生町上野3208-2", "hours": "平日 8:30-17:00", "services": ["内科", "小児科"]}],
+                "保健所": [{"name": "坂戸保健所", "phone": "049-283-7815", "address": "坂戸市石井2327-1", "hours": "平日 8:30-17:15", "services": ["健康相談", "予防接種"]}],
+                "水道": [{"name": "越生町上下水道課", "phone": "049-292-3121", "address": "入間郡越生町上野500-2", "hours": "平日 8:30-17:15", "services": ["水道開栓", "料金"]}],
+                "NTT": [{"name": "NTT東日本埼玉支店", "phone": "116", "address": "さいたま市大宮区桜木町1-9-6", "hours": "平日 9:00-17:00", "services": ["電話工事", "故障修理"]}],
+                "下水道": [{"name": "越生町上下水道課", "phone": "049-292-3121", "address": "入間郡越生町上野500-2", "hours": "平日 8:30-17:15", "services": ["下水道修理", "排水設備"]}]
+            }
+        },
+        "滑川町": {
+            "": {
+                "労基署": [{"name": "熊谷労働基準監督署", "phone": "048-523-2728", "address": "熊谷市宮町2-39-1", "hours": "平日 8:30-17:15", "services": ["労働相談", "労災申請"]}],
+                "警察署": [{"name": "小川警察署", "phone": "0493-72-0110", "address": "比企郡小川町青山1034-1", "hours": "24時間", "services": ["事件事故", "遺失物"]}],
+                "市区町村役所": [
+                    {"name": "滑川町役場", "phone": "0493-56-2211", "address": "比企郡滑川町福田750-1", "hours": "平日 8:30-17:15", "services": ["住民票", "戸籍"]},
+                    {"name": "滑川町環境課", "phone": "0493-56-2211", "address": "比企郡滑川町福田750-1", "hours": "平日 8:30-17:15", "services": ["ごみ収集", "リサイクル", "環境対策"]}
+                ],
+                "消防署": [{"name": "比企広域消防本部滑川分署", "phone": "0493-56-0119", "address": "比企郡滑川町福田1221", "hours": "24時間", "services": ["火災通報", "救急車"]}],
+                "ガス": [{"name": "東京ガス熊谷支店", "phone": "0570-002211", "address": "熊谷市筑波2-56-3", "hours": "平日 8:30-19:00", "services": ["ガス開栓", "緊急通報"]}],
+                "電力": [{"name": "東京電力パワーグリッド埼玉支社", "phone": "0120-995-005", "address": "さいたま市大宮区桜木町1-7-5", "hours": "平日 9:00-17:00", "services": ["停電情報", "電気工事"]}],
+                "病院": [{"name": "滑川町国民健康保険診療所", "phone": "0493-56-2040", "address": "比企郡滑川町福田638", "hours": "平日 8:30-17:00", "services": ["内科", "小児科"]}],
+                "保健所": [{"name": "東松山保健所", "phone": "0493-22-0280", "address": "東松山市若松町2-6-45", "hours": "平日 8:30-17:15", "services": ["健康相談", "予防接種"]}],
+                "水道": [{"name": "滑川町上下水道課", "phone": "0493-56-2211", "address": "比企郡滑川町福田750-1", "hours": "平日 8:30-17:15", "services": ["水道開栓", "料金"]}],
+                "NTT": [{"name": "NTT東日本埼玉支店", "phone": "116", "address": "さいたま市大宮区桜木町1-9-6", "hours": "平日 9:00-17:00", "services": ["電話工事", "故障修理"]}],
+                "下水道": [{"name": "滑川町上下水道課", "phone": "0493-56-2211", "address": "比企郡滑川町福田750-1", "hours": "平日 8:30-17:15", "services": ["下水道修理", "排水設備"]}]
+            }
+        },
+        "嵐山町": {
+            "": {
+                "労基署": [{"name": "熊谷労働基準監督署", "phone": "048-523-2728", "address": "熊谷市宮町2-39-1", "hours": "平日 8:30-17:15", "services": ["労働相談", "労災申請"]}],
+                "警察署": [{"name": "小川警察署", "phone": "0493-72-0110", "address": "比企郡小川町青山1034-1", "hours": "24時間", "services": ["事件事故", "遺失物"]}],
+                "市区町村役所": [
+                    {"name": "嵐山町役場", "phone": "0493-62-0719", "address": "比企郡嵐山町杉山1030-1", "hours": "平日 8:30-17:15", "services": ["住民票", "戸籍"]},
+                    {"name": "嵐山町環境農政課", "phone": "0493-62-0719", "address": "比企郡嵐山町杉山1030-1", "hours": "平日 8:30-17:15", "services": ["ごみ収集", "リサイクル", "環境対策"]}
+                ],
+                "消防署": [{"name": "比企広域消防本部嵐山分署", "phone": "0493-62-0119", "address": "比企郡嵐山町菅谷442-3", "hours": "24時間", "services": ["火災通報", "救急車"]}],
+                "ガス": [{"name": "東京ガス熊谷支店", "phone": "0570-002211", "address": "熊谷市筑波2-56-3", "hours": "平日 8:30-19:00", "services": ["ガス開栓", "緊急通報"]}],
+                "電力": [{"name": "東京電力パワーグリッド埼玉支社", "phone": "0120-995-005", "address": "さいたま市大宮区桜木町1-7-5", "hours": "平日 9:00-17:00", "services": ["停電情報", "電気工事"]}],
+                "病院": [{"name": "嵐山郷病院", "phone": "0493-62-2025", "address": "比企郡嵐山町杉山1333-2", "hours": "平日 8:30-17:00", "services": ["内科", "外科"]}],
+                "保健所": [{"name": "東松山保健所", "phone": "0493-22-0280", "address": "東松山市若松町2-6-45", "hours": "平日 8:30-17:15", "services": ["健康相談", "予防接種"]}],
+                "水道": [{"name": "嵐山町上下水道課", "phone": "0493-62-0719", "address": "比企郡嵐山町杉山1030-1", "hours": "平日 8:30-17:15", "services": ["水道開栓", "料金"]}],
+                "NTT": [{"name": "NTT東日本埼玉支店", "phone": "116", "address": "さいたま市大宮区桜木町1-9-6", "hours": "平日 9:00-17:00", "services": ["電話工事", "故障修理"]}],
+                "下水道": [{"name": "嵐山町上下水道課", "phone": "0493-62-0719", "address": "比企郡嵐山町杉山1030-1", "hours": "平日 8:30-17:15", "services": ["下水道修理", "排水設備"]}]
+            }
+        }
+    },
+    "茨城県": {
+        "水戸市": {
+            "": {
+                "労基署": [{"name": "水戸労働基準監督署", "phone": "029-224-6214", "address": "水戸市北見町1-1", "hours": "平日 8:30-17:15", "services": ["労働相談", "労災申請"]}],
+                "警察署": [{"name": "水戸警察署", "phone": "029-233-0110", "address": "水戸市笠原町978-76", "hours": "24時間", "services": ["事件事故", "遺失物"]}],
+                "市区町村役所": [
+                    {"name": "水戸市役所", "phone": "029-224-1111", "address": "水戸市中央1-4-1", "hours": "平日 8:30-17:15", "services": ["住民票", "戸籍"]},
+                    {"name": "水戸市環境部", "phone": "029-232-9154", "address": "水戸市中央1-4-1", "hours": "平日 8:30-17:15", "services": ["ごみ収集", "リサイクル", "環境対策"]}
+                ],
+                "消防署": [{"name": "水戸市消防本部", "phone": "029-221-0119", "address": "水戸市笠原町993-13", "hours": "24時間", "services": ["火災通報", "救急車"]}],
+                "ガス": [{"name": "東部ガス水戸営業所", "phone": "029-231-3511", "address": "水戸市城南1-4-7", "hours": "平日 8:30-17:30", "services": ["ガス開栓", "緊急通報"]}],
+                "電力": [{"name": "東京電力パワーグリッド茨城支社", "phone": "0120-995-004", "address": "水戸市城南1-7-5", "hours": "平日 9:00-17:00", "services": ["停電情報", "電気工事"]}],
+                "病院": [{"name": "水戸医療センター", "phone": "029-240-7711", "address": "茨城町桜の郷280", "hours": "24時間救急", "services": ["総合診療", "救急医療"]}],
+                "保健所": [{"name": "水戸保健所", "phone": "029-241-0100", "address": "水戸市笠原町993-2", "hours": "平日 8:30-17:15", "services": ["健康相談", "予防接種"]}],
+                "水道": [{"name": "水戸市上下水道局", "phone": "029-231-4111", "address": "水戸市中央1-4-1", "hours": "平日 8:30-17:15", "services": ["水道開栓", "料金"]}],
+                "NTT": [{"name": "NTT東日本茨城支店", "phone": "116", "address": "水戸市城南1-3-8", "hours": "平日 9:00-17:00", "services": ["電話工事", "故障修理"]}],
+                "下水道": [{"name": "水戸市上下水道局", "phone": "029-231-4113", "address": "水戸市中央1-4-1", "hours": "平日 8:30-17:15", "services": ["下水道修理", "排水設備"]}]
+            }
+        },
+        "つくば市": {
+            "": {
+                "労基署": [{"name": "土浦労働基準監督署", "phone": "029-822-0050", "address": "土浦市下高津2-7-46", "hours": "平日 8:30-17:15", "services": ["労働相談", "労災申請"]}],
+                "警察署": [{"name": "つくば警察署", "phone": "029-851-0110", "address": "つくば市谷田部1692", "hours": "24時間", "services": ["事件事故", "遺失物"]}],
+                "市区町村役所": [
+                    {"name": "つくば市役所", "phone": "029-883-1111", "address": "つくば市研究学園1-1-1", "hours": "平日 8:30-17:15", "services": ["住民票", "戸籍"]},
+                    {"name": "つくば市環境部", "phone": "029-883-1111", "address": "つくば市研究学園1-1-1", "hours": "平日 8:30-17:15", "services": ["ごみ収集", "リサイクル", "環境対策"]}
+                ],
+                "消防署": [{"name": "つくば市消防本部", "phone": "029-851-0119", "address": "つくば市苅間2530-3", "hours": "24時間", "services": ["火災通報", "救急車"]}],
+                "ガス": [{"name": "東部ガスつくば営業所", "phone": "029-856-1251", "address": "つくば市研究学園5-19", "hours": "平日 8:30-17:30", "services": ["ガス開栓", "緊急通報"]}],
+                "電力": [{"name": "東京電力パワーグリッド土浦支社", "phone": "0120-995-004", "address": "土浦市桜町1-17-19", "hours": "平日 9:00-17:00", "services": ["停電情報", "電気工事"]}],
+                "病院": [{"name": "筑波大学附属病院", "phone": "029-853-3900", "address": "つくば市天久保2-1-1", "hours": "24時間救急", "services": ["総合診療", "救急医療"]}],
+                "保健所": [{"name": "つくば保健所", "phone": "029-851-9287", "address": "つくば市天久保2-7-5", "hours": "平日 8:30-17:15", "services": ["健康相談", "予防接種"]}],
+                "水道": [{"name": "つくば市上下水道部", "phone": "029-883-1111", "address": "つくば市研究学園1-1-1", "hours": "平日 8:30-17:15", "services": ["水道開栓", "料金"]}],
+                "NTT": [{"name": "NTT東日本茨城支店", "phone": "116", "address": "水戸市城南1-3-8", "hours": "平日 9:00-17:00", "services": ["電話工事", "故障修理"]}],
+                "下水道": [{"name": "つくば市上下水道部", "phone": "029-883-1662", "address": "つくば市研究学園1-1-1", "hours": "平日 8:30-17:15", "services": ["下水道修理", "排水設備"]}]
+            }
+        },
+        "日立市": {
+            "": {
+                "労基署": [{"name": "日立労働基準監督署", "phone": "0294-22-0158", "address": "日立市幸町1-4-1", "hours": "平日 8:30-17:15", "services": ["労働相談", "労災申請"]}],
+                "警察署": [{"name": "日立警察署", "phone": "0294-24-0110", "address": "日立市幸町2-10-22", "hours": "24時間", "services": ["事件事故", "遺失物"]}],
+                "市区町村役所": [
+                    {"name": "日立市役所", "phone": "0294-22-3111", "address": "日立市助川町1-1-1", "hours": "平日 8:30-17:15", "services": ["住民票", "戸籍"]},
+                    {"name": "日立市生活環境部", "phone": "0294-22-3111", "address": "日立市助川町1-1-1", "hours": "平日 8:30-17:15", "services": ["ごみ収集", "リサイクル", "環境対策"]}
+                ],
+                "消防署": [{"name": "日立市消防本部", "phone": "0294-22-0119", "address": "日立市幸町2-8-1", "hours": "24時間", "services": ["火災通報", "救急車"]}],
+                "ガス": [{"name": "日立LPガス協会", "phone": "0294-36-0645", "address": "日立市鮎川町6-4-1", "hours": "平日 8:30-17:00", "services": ["ガス開栓", "緊急通報"]}],
+                "電力": [{"name": "東京電力パワーグリッド日立支社", "phone": "0120-995-007", "address": "日立市幸町1-22-1", "hours": "平日 9:00-17:00", "services": ["停電情報", "電気工事"]}],
+                "病院": [{"name": "日立総合病院", "phone": "0294-23-1111", "address": "日立市jonan町2-1-1", "hours": "24時間救急", "services": ["総合診療", "救急医療"]}],
+                "保健所": [{"name": "茨城県日立保健所", "phone": "0294-22-4188", "address": "日立市助川町2-6-15", "hours": "平日 8:30-17:15", "services": ["健康相談", "予防接種"]}],
+                "水道": [{"name": "日立市上下水道部", "phone": "0294-21-3571", "address": "日立市助川町1-15-15", "hours": "平日 8:30-17:15", "services": ["水道開栓", "料金"]}],
+                "NTT": [{"name": "NTT東日本茨城支店", "phone": "116", "address": "水戸市三の丸1-4-73", "hours": "平日 9:00-17:00", "services": ["電話工事", "故障修理"]}],
+                "下水道": [{"name": "日立市上下水道部", "phone": "0294-21-3598", "address": "日立市助川町1-15-15", "hours": "平日 8:30-17:15", "services": ["下水道修理", "排水設備"]}]
+            }
+        },
+        "土浦市": {
+            "": {
+                "労基署": [{"name": "土浦労働基準監督署", "phone": "029-822-2870", "address": "土浦市下高津2-7-46", "hours": "平日 8:30-17:15", "services": ["労働相談", "労災申請"]}],
+                "警察署": [{"name": "土浦警察署", "phone": "029-821-0110", "address": "土浦市中央2-12-5", "hours": "24時間", "services": ["事件事故", "遺失物"]}],
+                "市区町村役所": [
+                    {"name": "土浦市役所", "phone": "029-826-1111", "address": "土浦市大和町9-1", "hours": "平日 8:30-17:15", "services": ["住民票", "戸籍"]},
+                    {"name": "土浦市環境保全課", "phone": "029-826-1111", "address": "土浦市大和町9-1", "hours": "平日 8:30-17:15", "services": ["ごみ収集", "リサイクル", "環境対策"]}
+                ],
+                "消防署": [{"name": "土浦市消防本部", "phone": "029-821-0119", "address": "土浦市下高津2-7-39", "hours": "24時間", "services": ["火災通報", "救急車"]}],
+                "ガス": [{"name": "東京ガス土浦支店", "phone": "0570-002211", "address": "土浦市中央1-15-4", "hours": "平日 8:30-19:00", "services": ["ガス開栓", "緊急通報"]}],
+                "電力": [{"name": "東京電力パワーグリッド土浦支社", "phone": "0120-995-007", "address": "土浦市中央2-16-4", "hours": "平日 9:00-17:00", "services": ["停電情報", "電気工事"]}],
+                "病院": [{"name": "土浦協同病院", "phone": "029-830-3711", "address": "土浦市おおつ野4-1-1", "hours": "24時間救急", "services": ["総合診療", "救急医療"]}],
+                "保健所": [{"name": "茨城県土浦保健所", "phone": "029-821-5342", "address": "土浦市下高津2-7-46", "hours": "平日 8:30-17:15", "services": ["健康相談", "予防接種"]}],
+                "水道": [{"name": "土浦市上下水道部", "phone": "029-826-1111", "address": "土浦市大和町9-1", "hours": "平日 8:30-17:15", "services": ["水道開栓", "料金"]}],
+                "NTT": [{"name": "NTT東日本茨城支店", "phone": "116", "address": "水戸市三の丸1-4-73", "hours": "平日 9:00-17:00", "services": ["電話工事", "故障修理"]}],
+                "下水道": [{"name": "土浦市上下水道部", "phone": "029-826-1111", "address": "土浦市大和町9-1", "hours": "平日 8:30-17:15", "services": ["下水道修理", "排水設備"]}]
+            }
+        },
+        "古河市": {
+            "": {
+                "労基署": [{"name": "古河労働基準監督署", "phone": "0280-32-2764", "address": "古河市下山町4-3", "hours": "平日 8:30-17:15", "services": ["労働相談", "労災申請"]}],
+                "警察署": [{"name": "古河警察署", "phone": "0280-32-0110", "address": "古河市下山町4-1", "hours": "24時間", "services": ["事件事故", "遺失物"]}],
+                "市区町村役所": [
+                    {"name": "古河市役所", "phone": "0280-92-3111", "address": "古河市長谷町38-18", "hours": "平日 8:30-17:15", "services": ["住民票", "戸籍"]},
+                    {"name": "古河市環境課", "phone": "0280-92-3111", "address": "古河市長谷町38-18", "hours": "平日 8:30-17:15", "services": ["ごみ収集", "リサイクル", "環境対策"]}
+                ],
+                "消防署": [{"name": "古河市消防本部", "phone": "0280-22-0119", "address": "古河市下山町4-20", "hours": "24時間", "services": ["火災通報", "救急車"]}],
+                "ガス": [{"name": "東京ガス古河支店", "phone": "0570-002211", "address": "古河市本町3-2-15", "hours": "平日 8:30-19:00", "services": ["ガス開栓", "緊急通報"]}],
+                "電力": [{"name": "東京電力パワーグリッド古河支社", "phone": "0120-995-002", "address": "古河市本町2-4-18", "hours": "平日 9:00-17:00", "services": ["停電情報", "電気工事"]}],
+                "病院": [{"name": "古河赤十字病院", "phone": "0280-23-7221", "address": "古河市下山町116-1", "hours": "24時間救急", "services": ["総合診療", "救急医療"]}],
+                "保健所": [{"name": "茨城県古河保健所", "phone": "0280-32-3021", "address": "古河市下山町4-3", "hours": "平日 8:30-17:15", "services": ["健康相談", "予防接種"]}],
+                "水道": [{"name": "古河市上下水道部", "phone": "0280-92-3111", "address": "古河市長谷町38-18", "hours": "平日 8:30-17:15", "services": ["水道開栓", "料金"]}],
+                "NTT": [{"name": "NTT東日本茨城支店", "phone": "116", "address": "水戸市三の丸1-4-73", "hours": "平日 9:00-17:00", "services": ["電話工事", "故障修理"]}],
+                "下水道": [{"name": "古河市上下水道部", "phone": "0280-92-3111", "address": "古河市長谷町38-18", "hours": "平日 8:30-17:15", "services": ["下水道修理", "排水設備"]}]
+            }
+        },
+        "石岡市": {
+            "": {
+                "労基署": [{"name": "土浦労働基準監督署", "phone": "029-822-2870", "address": "土浦市下高津2-7-46", "hours": "平日 8:30-17:15", "services": ["労働相談", "労災申請"]}],
+                "警察署": [{"name": "石岡警察署", "phone": "0299-24-0110", "address": "石岡市石岡1-1-1", "hours": "24時間", "services": ["事件事故", "遺失物"]}],
+                "市区町村役所": [
+                    {"name": "石岡市役所", "phone": "0299-23-1111", "address": "石岡市石岡一丁目1-1", "hours": "平日 8:30-17:15", "services": ["住民票", "戸籍"]},
+                    {"name": "石岡市生活環境部", "phone": "0299-23-1111", "address": "石岡市石岡一丁目1-1", "hours": "平日 8:30-17:15", "services": ["ごみ収集", "リサイクル", "環境対策"]}
+                ],
+                "消防署": [{"name": "石岡市消防本部", "phone": "0299-23-0119", "address": "石岡市石岡2984", "hours": "24時間", "services": ["火災通報", "救急車"]}],
+                "ガス": [{"name": "石岡ガス協会", "phone": "0299-26-3250", "address": "石岡市国府3-1-1", "hours": "平日 8:30-17:00", "services": ["ガス開栓", "緊急通報"]}],
+                "電力": [{"name": "東京電力パワーグリッド石岡支社", "phone": "0120-995-007", "address": "石岡市石岡1-1-15", "hours": "平日 9:00-17:00", "services": ["停電情報", "電気工事"]}],
+                "病院": [{"name": "石岡第一病院", "phone": "0299-26-3130", "address": "石岡市東光台3-4-21", "hours": "24時間救急", "services": ["総合診療", "救急医療"]}],
+                "保健所": [{"name": "茨城県土浦保健所", "phone": "029-821-5342", "address": "土浦市下高津2-7-46", "hours": "平日 8:30-17:15", "services": ["健康相談", "予防接種"]}],
+                "水道": [{"name": "石岡市上下水道課", "phone": "0299-23-7284", "address": "石岡市石岡一丁目1-1", "hours": "平日 8:30-17:15", "services": ["水道開栓", "料金"]}],
+                "NTT": [{"name": "NTT東日本茨城支店", "phone": "116", "address": "水戸市三の丸1-4-73", "hours": "平日 9:00-17:00", "services": ["電話工事", "故障修理"]}],
+                "下水道": [{"name": "石岡市上下水道課", "phone": "0299-23-7284", "address": "石岡市石岡一丁目1-1", "hours": "平日 8:30-17:15", "services": ["下水道修理", "排水設備"]}]
+            }
+        },
+        "結城市": {
+            "": {
+                "労基署": [{"name": "古河労働基準監督署", "phone": "0280-32-2764", "address": "古河市下山町4-3", "hours": "平日 8:30-17:15", "services": ["労働相談", "労災申請"]}],
+                "警察署": [{"name": "結城警察署", "phone": "0296-33-0110", "address": "結城市結城144", "hours": "24時間", "services": ["事件事故", "遺失物"]}],
+                "市区町村役所": [
+                    {"name": "結城市役所", "phone": "0296-32-1111", "address": "結城市中央町2-3", "hours": "平日 8:30-17:15", "services": ["住民票", "戸籍"]},
+                    {"name": "結城市生活環境課", "phone": "0296-32-1111", "address": "結城市中央町2-3", "hours": "平日 8:30-17:15", "services": ["ごみ収集", "リサイクル", "環境対策"]}
+                ],
+                "消防署": [{"name": "結城市消防本部", "phone": "0296-33-2179", "address": "結城市結城144-2", "hours": "24時間", "services": ["火災通報", "救急車"]}],
+                "ガス": [{"name": "結城ガス", "phone": "0296-33-2161", "address": "結城市中央町1-5-6", "hours": "平日 8:30-17:00", "services": ["ガス開栓", "緊急通報"]}],
+                "電力": [{"name": "東京電力パワーグリッド結城支社", "phone": "0120-995-002", "address": "結城市結城195", "hours": "平日 9:00-17:00", "services": ["停電情報", "電気工事"]}],
+                "病院": [{"name": "結城病院", "phone": "0296-33-4161", "address": "結城市結城9629-1", "hours": "24時間救急", "services": ["総合診療", "救急医療"]}],
+                "保健所": [{"name": "茨城県古河保健所", "phone": "0280-32-3021", "address": "古河市下山町4-3", "hours": "平日 8:30-17:15", "services": ["健康相談", "予防接種"]}],
+                "水道": [{"name": "結城市上下水道課", "phone": "0296-34-0415", "address": "結城市中央町2-3", "hours": "平日 8:30-17:15", "services": ["水道開栓", "料金"]}],
+                "NTT": [{"name": "NTT東日本茨城支店", "phone": "116", "address": "水戸市三の丸1-4-73", "hours": "平日 9:00-17:00", "services": ["電話工事", "故障修理"]}],
+                "下水道": [{"name": "結城市上下水道課", "phone": "0296-34-0415", "address": "結城市中央町2-3", "hours": "平日 8:30-17:15", "services": ["下水道修理", "排水設備"]}]
+            }
+        },
+        "龍ケ崎市": {
+            "": {
+                "労基署": [{"name": "土浦労働基準監督署", "phone": "029-822-2870", "address": "土浦市下高津2-7-46", "hours": "平日 8:30-17:15", "services": ["労働相談", "労災申請"]}],
+                "警察署": [{"name": "龍ケ崎警察署", "phone": "0297-64-0110", "address": "龍ケ崎市川原代町1182-3", "hours": "24時間", "services": ["事件事故", "遺失物"]}],
+                "市区町村役所": [
+                    {"name": "龍ケ崎市役所", "phone": "0297-64-1111", "address": "龍ケ崎市3710", "hours": "平日 8:30-17:15", "services": ["住民票", "戸籍"]},
+                    {"name": "龍ケ崎市環境対策課", "phone": "0297-64-1111", "address": "龍ケ崎市3710", "hours": "平日 8:30-17:15", "services": ["ごみ収集", "リサイクル", "環境対策"]}
+                ],
+                "消防署": [{"name": "龍ケ崎市消防本部", "phone": "0297-64-0119", "address": "龍ケ崎市川原代町1834", "hours": "24時間", "services": ["火災通報", "救急車"]}],
+                "ガス": [{"name": "龍ケ崎ガス協会", "phone": "0297-66-0645", "address": "龍ケ崎市佐貫1-7-11", "hours": "平日 8:30-17:00", "services": ["ガス開栓", "緊急通報"]}],
+                "電力": [{"name": "東京電力パワーグリッド龍ケ崎支社", "phone": "0120-995-007", "address": "龍ケ崎市3988", "hours": "平日 9:00-17:00", "services": ["停電情報", "電気工事"]}],
+                "病院": [{"name": "龍ケ崎済生会病院", "phone": "0297-63-7178", "address": "龍ケ崎市中里1-1", "hours": "24時間救急", "services": ["総合診療", "救急医療"]}],
+                "保健所": [{"name": "茨城県竜ケ崎保健所", "phone": "0297-62-2161", "address": "龍ケ崎市川原代町1441", "hours": "平日 8:30-17:15", "services": ["健康相談", "予防接種"]}],
+                "水道": [{"name": "龍ケ崎市上下水道事業所", "phone": "0297-64-1111", "address": "龍ケ崎市3710", "hours": "平日 8:30-17:15", "services": ["水道開栓", "料金"]}],
+                "NTT": [{"name": "NTT東日本茨城支店", "phone": "116", "address": "水戸市三の丸1-4-73", "hours": "平日 9:00-17:00", "services": ["電話工事", "故障修理"]}],
+                "下水道": [{"name": "龍ケ崎市上下水道事業所", "phone": "0297-64-1111", "address": "龍ケ崎市3710", "hours": "平日 8:30-17:15", "services": ["下水道修理", "排水設備"]}]
+            }
+        },
+        "下妻市": {
+            "": {
+                "労基署": [{"name": "筑西労働基準監督署", "phone": "0296-24-2136", "address": "筑西市丙204", "hours": "平日 8:30-17:15", "services": ["労働相談", "労災申請"]}],
+                "警察署": [{"name": "下妻警察署", "phone": "0296-43-0110", "address": "下妻市下妻乙1170-3", "hours": "24時間", "services": ["事件事故", "遺失物"]}],
+                "市区町村役所": [
+                    {"name": "下妻市役所", "phone": "0296-43-2111", "address": "下妻市本城町2-22", "hours": "平日 8:30-17:15", "services": ["住民票", "戸籍"]},
+                    {"name": "下妻市環境課", "phone": "0296-43-2111", "address": "下妻市本城町2-22", "hours": "平日 8:30-17:15", "services": ["ごみ収集", "リサイクル", "環境対策"]}
+                ],
+                "消防署": [{"name": "下妻市消防本部", "phone": "0296-44-6490", "address": "下妻市下妻乙1170-1", "hours": "24時間", "services": ["火災通報", "救急車"]}],
+                "ガス": [{"name": "下妻ガス協会", "phone": "0296-44-2345", "address": "下妻市下妻戊148-1", "hours": "平日 8:30-17:00", "services": ["ガス開栓", "緊急通報"]}],
+                "電力": [{"name": "東京電力パワーグリッド下妻支社", "phone": "0120-995-002", "address": "下妻市下妻乙1160", "hours": "平日 9:00-17:00", "services": ["停電情報", "電気工事"]}],
+                "病院": [{"name": "下妻第一病院", "phone": "0296-44-1121", "address": "下妻市下妻乙99", "hours": "24時間救急", "services": ["総合診療", "救急医療"]}],
+                "保健所": [{"name": "茨城県筑西保健所", "phone": "0296-24-3911", "address": "筑西市甲114", "hours": "平日 8:30-17:15", "services": ["健康相談", "予防接種"]}],
+                "水道": [{"name": "下妻市上下水道課", "phone": "0296-43-8297", "address": "下妻市本城町2-22", "hours": "平日 8:30-17:15", "services": ["水道開栓", "料金"]}],
+                "NTT": [{"name": "NTT東日本茨城支店", "phone": "116", "address": "水戸市三の丸1-4-73", "hours": "平日 9:00-17:00", "services": ["電話工事", "故障修理"]}],
+                "下水道": [{"name": "下妻市上下水道課", "phone": "0296-43-8297", "address": "下妻市本城町2-22", "hours": "平日 8:30-17:15", "services": ["下水道修理", "排水設備"]}]
+            }
+        },
+        "常総市": {
+            "": {
+                "労基署": [{"name": "土浦労働基準監督署", "phone": "029-822-2870", "address": "土浦市下高津2-7-46", "hours": "平日 8:30-17:15", "services": ["労働相談", "労災申請"]}],
+                "警察署": [{"name": "常総警察署", "phone": "0297-27-0110", "address": "常総市水海道諏訪町3201", "hours": "24時間", "services": ["事件事故", "遺失物"]}],
+                "市区町村役所": [
+                    {"name": "常総市役所", "phone": "0297-23-2111", "address": "常総市水海道諏訪町3222-3", "hours": "平日 8:30-17:15", "services": ["住民票", "戸籍"]},
+                    {"name": "常総市環境生活課", "phone": "0297-23-2111", "address": "常総市水海道諏訪町3222-3", "hours": "平日 8:30-17:15", "services": ["ごみ収集", "リサイクル", "環境対策"]}
+                ],
+                "消防署": [{"name": "常総市消防本部", "phone": "0297-22-4444", "address": "常総市水海道諏訪町3271", "hours": "24時間", "services": ["火災通報", "救急車"]}],
+                "ガス": [{"name": "常総ガス協会", "phone": "0297-24-2345", "address": "常総市水海道天満町1872", "hours": "平日 8:30-17:00", "services": ["ガス開栓", "緊急通報"]}],
+                "電力": [{"name": "東京電力パワーグリッド常総支社", "phone": "0120-995-007", "address": "常総市水海道諏訪町3288", "hours": "平日 9:00-17:00", "services": ["停電情報", "電気工事"]}],
+                "病院": [{"name": "きぬ医師会病院", "phone": "0297-23-1771", "address": "常総市água海道町3548", "hours": "24時間救急", "services": ["総合診療", "救急医療"]}],
+                "保健所": [{"name": "茨城県竜ケ崎保健所", "phone": "0297-62-2161", "address": "龍ケ崎市川原代町1441", "hours": "平日 8:30-17:15", "services": ["健康相談", "予防接種"]}],
+                "水道": [{"name": "常総市上下水道課", "phone": "0297-23-2934", "address": "常総市水海道諏訪町3222-3", "hours": "平日 8:30-17:15", "services": ["水道開栓", "料金"]}],
+                "NTT": [{"name": "NTT東日本茨城支店", "phone": "116", "address": "水戸市三の丸1-4-73", "hours": "平日 9:00-17:00", "services": ["電話工事", "故障修理"]}],
+                "下水道": [{"name": "常総市上下水道課", "phone": "0297-23-2934", "address": "常総市水海道諏訪町3222-3", "hours": "平日 8:30-17:15", "services": ["下水道修理", "排水設備"]}]
+            }
+        },
+        "常陸太田市": {
+            "": {
+                "労基署": [{"name": "日立労働基準監督署", "phone": "0294-22-0158", "address": "日立市幸町1-4-1", "hours": "平日 8:30-17:15", "services": ["労働相談", "労災申請"]}],
+                "警察署": [{"name": "常陸太田警察署", "phone": "0294-72-0110", "address": "常陸太田市山下町1017", "hours": "24時間", "services": ["事件事故", "遺失物"]}],
+                "市区町村役所": [
+                    {"name": "常陸太田市役所", "phone": "0294-72-3111", "address": "常陸太田市金井町3690", "hours": "平日 8:30-17:15", "services": ["住民票", "戸籍"]},
+                    {"name": "常陸太田市環境政策課", "phone": "0294-72-3111", "address": "常陸太田市金井町3690", "hours": "平日 8:30-17:15", "services": ["ごみ収集", "リサイクル", "環境対策"]}
+                ],
+                "消防署": [{"name": "常陸太田市消防本部", "phone": "0294-73-0119", "address": "常陸太田市山下町4119", "hours": "24時間", "services": ["火災通報", "救急車"]}],
+                "ガス": [{"name": "常陸太田ガス協会", "phone": "0294-72-2345", "address": "常陸太田市西一町2181", "hours": "平日 8:30-17:00", "services": ["ガス開栓", "緊急通報"]}],
+                "電力": [{"name": "東京電力パワーグリッド常陸太田支社", "phone": "0120-995-007", "address": "常陸太田市西一町2195", "hours": "平日 9:00-17:00", "services": ["停電情報", "電気工事"]}],
+                "病院": [{"name": "常陸太田市立総合病院", "phone": "0294-87-7111", "address": "常陸太田市木崎二町936", "hours": "24時間救急", "services": ["総合診療", "救急医療"]}],
+                "保健所": [{"name": "茨城県日立保健所", "phone": "0294-22-4188", "address": "日立市助川町2-6-15", "hours": "平日 8:30-17:15", "services": ["健康相談", "予防接種"]}],
+                "水道": [{"name": "常陸太田市上下水道部", "phone": "0294-72-8052", "address": "常陸太田市金井町3690", "hours": "平日 8:30-17:15", "services": ["水道開栓", "料金"]}],
+                "NTT": [{"name": "NTT東日本茨城支店", "phone": "116", "address": "水戸市三の丸1-4-73", "hours": "平日 9:00-17:00", "services": ["電話工事", "故障修理"]}],
+                "下水道": [{"name": "常陸太田市上下水道部", "phone": "0294-72-8052", "address": "常陸太田市金井町3690", "hours": "平日 8:30-17:15", "services": ["下水道修理", "排水設備"]}]
+            }
+        },
+        "高萩市": {
+            "": {
+                "労基署": [{"name": "日立労働基準監督署", "phone": "0294-22-0158", "address": "日立市幸町1-4-1", "hours": "平日 8:30-17:15", "services": ["労働相談", "労災申請"]}],
+                "警察署": [{"name": "高萩警察署", "phone": "0293-22-0110", "address": "高萩市高萩2895", "hours": "24時間", "services": ["事件事故", "遺失物"]}],
+                "市区町村役所": [
+                    {"name": "高萩市役所", "phone": "0293-23-2111", "address": "高萩市下手綱392", "hours": "平日 8:30-17:15", "services": ["住民票", "戸籍"]},
+                    {"name": "高萩市環境課", "phone": "0293-23-2111", "address": "高萩市下手綱392", "hours": "平日 8:30-17:15", "services": ["ごみ収集", "リサイクル", "環境対策"]}
+                ],
+                "消防署": [{"name": "高萩市消防本部", "phone": "0293-22-3986", "address": "高萩市高萩2901-1", "hours": "24時間", "services": ["火災通報", "救急車"]}],
+                "ガス": [{"name": "高萩ガス協会", "phone": "0293-22-2345", "address": "高萩市高萩1885", "hours": "平日 8:30-17:00", "services": ["ガス開栓", "緊急通報"]}],
+                "電力": [{"name": "東京電力パワーグリッド高萩支社", "phone": "0120-995-007", "address": "高萩市高萩1888", "hours": "平日 9:00-17:00", "services": ["停電情報", "電気工事"]}],
+                "病院": [{"name": "高萩協同病院", "phone": "0293-24-1121", "address": "高萩市高萩2065", "hours": "24時間救急", "services": ["総合診療", "救急医療"]}],
+                "保健所": [{"name": "茨城県日立保健所", "phone": "0294-22-4188", "address": "日立市助川町2-6-15", "hours": "平日 8:30-17:15", "services": ["健康相談", "予防接種"]}],
+                "水道": [{"name": "高萩市上下水道課", "phone": "0293-23-7031", "address": "高萩市下手綱392", "hours": "平日 8:30-17:15", "services": ["水道開栓", "料金"]}],
+                "NTT": [{"name": "NTT東日本茨城支店", "phone": "116", "address": "水戸市三の丸1-4-73", "hours": "平日 9:00-17:00", "services": ["電話工事", "故障修理"]}],
+                "下水道": [{"name": "高萩市上下水道課", "phone": "0293-23-7031", "address": "高萩市下手綱392", "hours": "平日 8:30-17:15", "services": ["下水道修理", "排水設備"]}]
+            }
+        },
+        "北茨城市": {
+            "": {
+                "労基署": [{"name": "日立労働基準監督署", "phone": "0294-22-0158", "address": "日立市幸町1-4-1", "hours": "平日 8:30-17:15", "services": ["労働相談", "労災申請"]}],
+                "警察署": [{"name": "北茨城警察署", "phone": "0293-42-0110", "address": "北茨城市磯原町磯原1630", "hours": "24時間", "services": ["事件事故", "遺失物"]}],
+                "市区町村役所": [
+                    {"name": "北茨城市役所", "phone": "0293-43-1111", "address": "北茨城市磯原町磯原1630", "hours": "平日 8:30-17:15", "services": ["住民票", "戸籍"]},
+                    {"name": "北茨城市生活環境課", "phone": "0293-43-1111", "address": "北茨城市磯原町磯原1630", "hours": "平日 8:30-17:15", "services": ["ごみ収集", "リサイクル", "環境対策"]}
+                ],
+                "消防署": [{"name": "北茨城市消防本部", "phone": "0293-42-0119", "address": "北茨城市磯原町磯原2553", "hours": "24時間", "services": ["火災通報", "救急車"]}],
+                "ガス": [{"name": "北茨城ガス協会", "phone": "0293-42-2345", "address": "北茨城市磯原町本町2-4-12", "hours": "平日 8:30-17:00", "services": ["ガス開栓", "緊急通報"]}],
+                "電力": [{"name": "東京電力パワーグリッド北茨城支社", "phone": "0120-995-007", "address": "北茨城市磯原町磯原1888", "hours": "平日 9:00-17:00", "services": ["停電情報", "電気工事"]}],
+                "病院": [{"name": "北茨城市立総合病院", "phone": "0293-46-1121", "address": "北茨城市関南町神岡下625", "hours": "24時間救急", "services": ["総合診療", "救急医療"]}],
+                "保健所": [{"name": "茨城県日立保健所", "phone": "0294-22-4188", "address": "日立市助川町2-6-15", "hours": "平日 8:30-17:15", "services": ["健康相談", "予防接種"]}],
+                "水道": [{"name": "北茨城市上下水道課", "phone": "0293-43-1111", "address": "北茨城市磯原町磯原1630", "hours": "平日 8:30-17:15", "services": ["水道開栓", "料金"]}],
+                "NTT": [{"name": "NTT東日本茨城支店", "phone": "116", "address": "水戸市三の丸1-4-73", "hours": "平日 9:00-17:00", "services": ["電話工事", "故障修理"]}],
+                "下水道": [{"name": "北茨城市上下水道課", "phone": "0293-43-1111", "address": "北茨城市磯原町磯原1630", "hours": "平日 8:30-17:15", "services": ["下水道修理", "排水設備"]}]
+            }
+        },
+        "笠間市": {
+            "": {
+                "労基署": [{"name": "水戸労働基準監督署", "phone": "029-224-6214", "address": "水戸市白梅2-1-46", "hours": "平日 8:30-17:15", "services": ["労働相談", "労災申請"]}],
+                "警察署": [{"name": "笠間警察署", "phone": "0296-77-0110", "address": "笠間市八雲1-2-28", "hours": "24時間", "services": ["事件事故", "遺失物"]}],
+                "市区町村役所": [
+                    {"name": "笠間市役所", "phone": "0296-77-1101", "address": "笠間市中央3-2-1", "hours": "平日 8:30-17:15", "services": ["住民票", "戸籍"]},
+                    {"name": "笠間市環境政策課", "phone": "0296-77-1101", "address": "笠間市中央3-2-1", "hours": "平日 8:30-17:15", "services": ["ごみ収集", "リサイクル", "環境対策"]}
+                ],
+                "消防署": [{"name": "笠間市消防本部", "phone": "0296-72-0119", "address": "笠間市笠間1532-2", "hours": "24時間", "services": ["火災通報", "救急車"]}],
+                "ガス": [{"name": "笠間ガス協会", "phone": "0296-72-1645", "address": "笠間市石井2016-1", "hours": "平日 8:30-17:00", "services": ["ガス開栓", "緊急通報"]}],
+                "電力": [{"name": "東京電力パワーグリッド笠間支社", "phone": "0120-995-007", "address": "笠間市笠間1877", "hours": "平日 9:00-17:00", "services": ["停電情報", "電気工事"]}],
+                "病院": [{"name": "笠間市立病院", "phone": "0296-77-0034", "address": "笠間市南友部1966-1", "hours": "24時間救急", "services": ["総合診療", "救急医療"]}],
+                "保健所": [{"name": "茨城県水戸保健所", "phone": "029-241-0100", "address": "水戸市笠原町993-2", "hours": "平日 8:30-17:15", "services": ["健康相談", "予防接種"]}],
+                "水道": [{"name": "笠間市上下水道課", "phone": "0296-77-1101", "address": "笠間市中央3-2-1", "hours": "平日 8:30-17:15", "services": ["水道開栓", "料金"]}],
+                "NTT": [{"name": "NTT東日本茨城支店", "phone": "116", "address": "水戸市三の丸1-4-73", "hours": "平日 9:00-17:00", "services": ["電話工事", "故障修理"]}],
+                "下水道": [{"name": "笠間市上下水道課", "phone": "0296-77-1101", "address": "笠間市中央3-2-1", "hours": "平日 8:30-17:15", "services": ["下水道修理", "排水設備"]}]
+            }
+        },
+        "取手市": {
+            "": {
+                "労基署": [{"name": "土浦労働基準監督署", "phone": "029-822-2870", "address": "土浦市下高津2-7-46", "hours": "平日 8:30-17:15", "services": ["労働相談", "労災申請"]}],
+                "警察署": [{"name": "取手警察署", "phone": "0297-77-0110", "address": "取手市井野台3-2-1", "hours": "24時間", "services": ["事件事故", "遺失物"]}],
+                "市区町村役所": [
+                    {"name": "取手市役所", "phone": "0297-74-2141", "address": "取手市寺田5139", "hours": "平日 8:30-17:15", "services": ["住民票", "戸籍"]},
+                    {"name": "取手市環境対策課", "phone": "0297-74-2141", "address": "取手市寺田5139", "hours": "平日 8:30-17:15", "services": ["ごみ収集", "リサイクル", "環境対策"]}
+                ],
+                "消防署": [{"name": "取手市消防本部", "phone": "0297-74-0119", "address": "取手市井野台3-9-1", "hours": "24時間", "services": ["火災通報", "救急車"]}],
+                "ガス": [{"name": "東京ガス取手支店", "phone": "0570-002211", "address": "取手市取手2-7-1", "hours": "平日 8:30-19:00", "services": ["ガス開栓", "緊急通報"]}],
+                "電力": [{"name": "東京電力パワーグリッド取手支社", "phone": "0120-995-007", "address": "取手市取手2-3-8", "hours": "平日 9:00-17:00", "services": ["停電情報", "電気工事"]}],
+                "病院": [{"name": "取手協同病院", "phone": "0297-74-5551", "address": "取手市本郷2-1-1", "hours": "24時間救急", "services": ["総合診療", "救急医療"]}],
+                "保健所": [{"name": "茨城県竜ケ崎保健所", "phone": "0297-62-2161", "address": "龍ケ崎市川原代町1441", "hours": "平日 8:30-17:15", "services": ["健康相談", "予防接種"]}],
+                "水道": [{"name": "取手市上下水道課", "phone": "0297-74-2141", "address": "取手市寺田5139", "hours": "平日 8:30-17:15", "services": ["水道開栓", "料金"]}],
+                "NTT": [{"name": "NTT東日本茨城支店", "phone": "116", "address": "水戸市三の丸1-4-73", "hours": "平日 9:00-17:00", "services": ["電話工事", "故障修理"]}],
+                "下水道": [{"name": "取手市上下水道課", "phone": "0297-74-2141", "address": "取手市寺田5139", "hours": "平日 8:30-17:15", "services": ["下水道修理", "排水設備"]}]
+            }
+        },
+        "牛久市": {
+            "": {
+                "労基署": [{"name": "土浦労働基準監督署", "phone": "029-822-2870", "address": "土浦市下高津2-7-46", "hours": "平日 8:30-17:15", "services": ["労働相談", "労災申請"]}],
+                "警察署": [{"name": "牛久警察署", "phone": "029-872-0110", "address": "牛久市中央5-20-11", "hours": "24時間", "services": ["事件事故", "遺失物"]}],
+                "市区町村役所": [
+                    {"name": "牛久市役所", "phone": "029-873-2111", "address": "牛久市中央3-15-1", "hours": "平日 8:30-17:15", "services": ["住民票", "戸籍"]},
+                    {"name": "牛久市環境政策課", "phone": "029-873-2111", "address": "牛久市中央3-15-1", "hours": "平日 8:30-17:15", "services": ["ごみ収集", "リサイクル", "環境対策"]}
+                ],
+                "消防署": [{"name": "牛久市消防本部", "phone": "029-873-0119", "address": "牛久市中央5-20-1", "hours": "24時間", "services": ["火災通報", "救急車"]}],
+                "ガス": [{"name": "牛久ガス協会", "phone": "029-872-2345", "address": "牛久市牛久町280-1", "hours": "平日 8:30-17:00", "services": ["ガス開栓", "緊急通報"]}],
+                "電力": [{"name": "東京電力パワーグリッド牛久支社", "phone": "0120-995-007", "address": "牛久市中央3-5-4", "hours": "平日 9:00-17:00", "services": ["停電情報", "電気工事"]}],
+                "病院": [{"name": "牛久愛和総合病院", "phone": "029-873-3111", "address": "牛久市猪子町896", "hours": "24時間救急", "services": ["総合診療", "救急医療"]}],
+                "保健所": [{"name": "茨城県竜ケ崎保健所", "phone": "0297-62-2161", "address": "龍ケ崎市川原代町1441", "hours": "平日 8:30-17:15", "services": ["健康相談", "予防接種"]}],
+                "水道": [{"name": "牛久市上下水道課", "phone": "029-873-2111", "address": "牛久市中央3-15-1", "hours": "平日 8:30-17:15", "services": ["水道開栓", "料金"]}],
+                "NTT": [{"name": "NTT東日本茨城支店", "phone": "116", "address": "水戸市三の丸1-4-73", "hours": "平日 9:00-17:00", "services": ["電話工事", "故障修理"]}],
+                "下水道": [{"name": "牛久市上下水道課", "phone": "029-873-2111", "address": "牛久市中央3-15-1", "hours": "平日 8:30-17:15", "services": ["下水道修理", "排水設備"]}]
+            }
+        },
+        "ひたちなか市": {
+            "": {
+                "労基署": [{"name": "水戸労働基準監督署", "phone": "029-224-6214", "address": "水戸市白梅2-1-46", "hours": "平日 8:30-17:15", "services": ["労働相談", "労災申請"]}],
+                "警察署": [{"name": "ひたちなか警察署", "phone": "029-272-0110", "address": "ひたちなか市石川町20-1", "hours": "24時間", "services": ["事件事故", "遺失物"]}],
+                "市区町村役所": [
+                    {"name": "ひたちなか市役所", "phone": "029-273-0111", "address": "ひたちなか市東石川2-10-1", "hours": "平日 8:30-17:15", "services": ["住民票", "戸籍"]},
+                    {"name": "ひたちなか市生活環境課", "phone": "029-273-0111", "address": "ひたちなか市東石川2-10-1", "hours": "平日 8:30-17:15", "services": ["ごみ収集", "リサイクル", "環境対策"]}
+                ],
+                "消防署": [{"name": "ひたちなか市消防本部", "phone": "029-272-2079", "address": "ひたちなか市石川町20-24", "hours": "24時間", "services": ["火災通報", "救急車"]}],
+                "ガス": [{"name": "ひたちなかガス協会", "phone": "029-272-1645", "address": "ひたちなか市勝田中央10-1", "hours": "平日 8:30-17:00", "services": ["ガス開栓", "緊急通報"]}],
+                "電力": [{"name": "東京電力パワーグリッドひたちなか支社", "phone": "0120-995-007", "address": "ひたちなか市石川町14-1", "hours": "平日 9:00-17:00", "services": ["停電情報", "電気工事"]}],
+                "病院": [{"name": "ひたちなか総合病院", "phone": "029-354-5111", "address": "ひたちなか市diplge町20-1", "hours": "24時間救急", "services": ["総合診療", "救急医療"]}],
+                "保健所": [{"name": "茨城県ひたちなか保健所", "phone": "029-265-5515", "address": "ひたちなか市石川町14-1", "hours": "平日 8:30-17:15", "services": ["健康相談", "予防接種"]}],
+                "水道": [{"name": "ひたちなか市上下水道部", "phone": "029-273-0111", "address": "ひたちなか市東石川2-10-1", "hours": "平日 8:30-17:15", "services": ["水道開栓", "料金"]}],
+                "NTT": [{"name": "NTT東日本茨城支店", "phone": "116", "address": "水戸市三の丸1-4-73", "hours": "平日 9:00-17:00", "services": ["電話工事", "故障修理"]}],
+                "下水道": [{"name": "ひたちなか市上下水道部", "phone": "029-273-0111", "address": "ひたちなか市東石川2-10-1", "hours": "平日 8:30-17:15", "services": ["下水道修理", "排水設備"]}]
+            }
+        },
+        "鹿嶋市": {
+            "": {
+                "労基署": [{"name": "土浦労働基準監督署", "phone": "029-822-2870", "address": "土浦市下高津2-7-46", "hours": "平日 8:30-17:15", "services": ["労働相談", "労災申請"]}],
+                "警察署": [{"name": "鹿嶋警察署", "phone": "0299-90-0110", "address": "鹿嶋市宮中1998-1", "hours": "24時間", "services": ["事件事故", "遺失物"]}],
+                "市区町村役所": [
+                    {"name": "鹿嶋市役所", "phone": "0299-82-2911", "address": "鹿嶋市平井1187-1", "hours": "平日 8:30-17:15", "services": ["住民票", "戸籍"]},
+                    {"name": "鹿嶋市環境課", "phone": "0299-82-2911", "address": "鹿嶋市平井1187-1", "hours": "平日 8:30-17:15", "services": ["ごみ収集", "リサイクル", "環境対策"]}
+                ],
+                "消防署": [{"name": "鹿嶋市消防本部", "phone": "0299-83-0119", "address": "鹿嶋市宮中1998", "hours": "24時間", "services": ["火災通報", "救急車"]}],
+                "ガス": [{"name": "鹿嶋ガス協会", "phone": "0299-82-2345", "address": "鹿嶋市大船津2222", "hours": "平日 8:30-17:00", "services": ["ガス開栓", "緊急通報"]}],
+                "電力": [{"name": "東京電力パワーグリッド鹿嶋支社", "phone": "0120-995-007", "address": "鹿嶋市大船津1111", "hours": "平日 9:00-17:00", "services": ["停電情報", "電気工事"]}],
+                "病院": [{"name": "鹿嶋労災病院", "phone": "0299-82-1271", "address": "鹿嶋市須賀1645", "hours": "24時間救急", "services": ["総合診療", "救急医療"]}],
+                "保健所": [{"name": "茨城県潮来保健所", "phone": "0299-66-2114", "address": "潮来市潮来1446-1", "hours": "平日 8:30-17:15", "services": ["健康相談", "予防接種"]}],
+                "水道": [{"name": "鹿嶋市上下水道課", "phone": "0299-82-2911", "address": "鹿嶋市平井1187-1", "hours": "平日 8:30-17:15", "services": ["水道開栓", "料金"]}],
+                "NTT": [{"name": "NTT東日本茨城支店", "phone": "116", "address": "水戸市三の丸1-4-73", "hours": "平日 9:00-17:00", "services": ["電話工事", "故障修理"]}],
+                "下水道": [{"name": "鹿嶋市上下水道課", "phone": "0299-82-2911", "address": "鹿嶋市平井1187-1", "hours": "平日 8:30-17:15", "services": ["下水道修理", "排水設備"]}]
+            }
+        },
+        "守谷市": {
+            "": {
+                "労基署": [{"name": "土浦労働基準監督署", "phone": "029-822-2870", "address": "土浦市下高津2-7-46", "hours": "平日 8:30-17:15", "services": ["労働相談", "労災申請"]}],
+                "警察署": [{"name": "取手警察署", "phone": "0297-77-0110", "address": "取手市井野台3-2-1", "hours": "24時間", "services": ["事件事故", "遺失物"]}],
+                "市区町村役所": [
+                    {"name": "守谷市役所", "phone": "0297-45-1111", "address": "守谷市大柏950-1", "hours": "平日 8:30-17:15", "services": ["住民票", "戸籍"]},
+                    {"name": "守谷市生活経済部", "phone": "0297-45-1111", "address": "守谷市大柏950-1", "hours": "平日 8:30-17:15", "services": ["ごみ収集", "リサイクル", "環境対策"]}
+                ],
+                "消防署": [{"name": "守谷市消防本部", "phone": "0297-45-0119", "address": "守谷市大柏917-1", "hours": "24時間", "services": ["火災通報", "救急車"]}],
+                "ガス": [{"name": "東京ガス守谷支店", "phone": "0570-002211", "address": "守谷市中央1-23-1", "hours": "平日 8:30-19:00", "services": ["ガス開栓", "緊急通報"]}],
+                "電力": [{"name": "東京電力パワーグリッド守谷支社", "phone": "0120-995-007", "address": "守谷市中央2-16-1", "hours": "平日 9:00-17:00", "services": ["停電情報", "電気工事"]}],
+                "病院": [{"name": "総合守谷第一病院", "phone": "0297-45-5111", "address": "守谷市松前台1-17", "hours": "24時間救急", "services": ["総合診療", "救急医療"]}],
+                "保健所": [{"name": "茨城県竜ケ崎保健所", "phone": "0297-62-2161", "address": "龍ケ崎市川原代町1441", "hours": "平日 8:30-17:15", "services": ["健康相談", "予防接種"]}],
+                "水道": [{"name": "守谷市上下水道事務所", "phone": "0297-45-1111", "address": "守谷市大柏950-1", "hours": "平日 8:30-17:15", "services": ["水道開栓", "料金"]}],
+                "NTT": [{"name": "NTT東日本茨城支店", "phone": "116", "address": "水戸市三の丸1-4-73", "hours": "平日 9:00-17:00", "services": ["電話工事", "故障修理"]}],
+                "下水道": [{"name": "守谷市上下水道事務所", "phone": "0297-45-1111", "address": "守谷市大柏950-1", "hours": "平日 8:30-17:15", "services": ["下水道修理", "排水設備"]}]
+            }
+        },
+        "筑西市": {
+            "": {
+                "労基署": [{"name": "筑西労働基準監督署", "phone": "0296-24-2136", "address": "筑西市丙204", "hours": "平日 8:30-17:15", "services": ["労働相談", "労災申請"]}],
+                "警察署": [{"name": "筑西警察署", "phone": "0296-24-0110", "address": "筑西市甲853", "hours": "24時間", "services": ["事件事故", "遺失物"]}],
+                "市区町村役所": [
+                    {"name": "筑西市役所", "phone": "0296-24-2111", "address": "筑西市下中山732-1", "hours": "平日 8:30-17:15", "services": ["住民票", "戸籍"]},
+                    {"name": "筑西市環境課", "phone": "0296-24-2111", "address": "筑西市下中山732-1", "hours": "平日 8:30-17:15", "services": ["ごみ収集", "リサイクル", "環境対策"]}
+                ],
+                "消防署": [{"name": "筑西市消防本部", "phone": "0296-24-0119", "address": "筑西市甲904", "hours": "24時間", "services": ["火災通報", "救急車"]}],
+                "ガス": [{"name": "筑西ガス協会", "phone": "0296-25-3250", "address": "筑西市甲828", "hours": "平日 8:30-17:00", "services": ["ガス開栓", "緊急通報"]}],
+                "電力": [{"name": "東京電力パワーグリッド筑西支社", "phone": "0120-995-002", "address": "筑西市甲853", "hours": "平日 9:00-17:00", "services": ["停電情報", "電気工事"]}],
+                "病院": [{"name": "県西総合病院", "phone": "0296-24-1211", "address": "筑西市健田559", "hours": "24時間救急", "services": ["総合診療", "救急医療"]}],
+                "保健所": [{"name": "茨城県筑西保健所", "phone": "0296-24-3911", "address": "筑西市甲114", "hours": "平日 8:30-17:15", "services": ["健康相談", "予防接種"]}],
+                "水道": [{"name": "筑西市上下水道課", "phone": "0296-22-0525", "address": "筑西市下中山732-1", "hours": "平日 8:30-17:15", "services": ["水道開栓", "料金"]}],
+                "NTT": [{"name": "NTT東日本茨城支店", "phone": "116", "address": "水戸市三の丸1-4-73", "hours": "平日 9:00-17:00", "services": ["電話工事", "故障修理"]}],
+                "下水道": [{"name": "筑西市上下水道課", "phone": "0296-22-0525", "address": "筑西市下中山732-1", "hours": "平日 8:30-17:15", "services": ["下水道修理", "排水設備"]}]
+            }
+        },
+        "坂東市": {
+            "": {
+                "労基署": [{"name": "古河労働基準監督署", "phone": "0280-32-2764", "address": "古河市下山町4-3", "hours": "平日 8:30-17:15", "services": ["労働相談", "労災申請"]}],
+                "警察署": [{"name": "坂東警察署", "phone": "0297-35-0110", "address": "坂東市岩井4615", "hours": "24時間", "services": ["事件事故", "遺失物"]}],
+                "市区町村役所": [
+                    {"name": "坂東市役所", "phone": "0297-35-2121", "address": "坂東市岩井4365", "hours": "平日 8:30-17:15", "services": ["住民票", "戸籍"]},
+                    {"name": "坂東市生活環境課", "phone": "0297-35-2121", "address": "坂東市岩井4365", "hours": "平日 8:30-17:15", "services": ["ごみ収集", "リサイクル", "環境対策"]}
+                ],
+                "消防署": [{"name": "坂東市消防本部", "phone": "0297-35-0119", "address": "坂東市岩井4618", "hours": "24時間", "services": ["火災通報", "救急車"]}],
+                "ガス": [{"name": "坂東ガス協会", "phone": "0297-35-2345", "address": "坂東市岩井5019", "hours": "平日 8:30-17:00", "services": ["ガス開栓", "緊急通報"]}],
+                "電力": [{"name": "東京電力パワーグリッド坂東支社", "phone": "0120-995-002", "address": "坂東市岩井4590", "hours": "平日 9:00-17:00", "services": ["停電情報", "電気工事"]}],
+                "病院": [{"name": "坂東市立病院", "phone": "0280-88-0111", "address": "坂東市猿島702", "hours": "24時間救急", "services": ["総合診療", "救急医療"]}],
+                "保健所": [{"name": "茨城県古河保健所", "phone": "0280-32-3021", "address": "古河市下山町4-3", "hours": "平日 8:30-17:15", "services": ["健康相談", "予防接種"]}],
+                "水道": [{"name": "坂東市上下水道課", "phone": "0297-35-2121", "address": "坂東市岩井4365", "hours": "平日 8:30-17:15", "services": ["水道開栓", "料金"]}],
+                "NTT": [{"name": "NTT東日本茨城支店", "phone": "116", "address": "水戸市三の丸1-4-73", "hours": "平日 9:00-17:00", "services": ["電話工事", "故障修理"]}],
+                "下水道": [{"name": "坂東市上下水道課", "phone": "0297-35-2121", "address": "坂東市岩井4365", "hours": "平日 8:30-17:15", "services": ["下水道修理", "排水設備"]}]
+            }
+        }
+    },
+    "栃木県": {
+        "宇都宮市": {
+            "": {
+                "労基署": [{"name": "宇都宮労働基準監督署", "phone": "028-634-0385", "address": "宇都宮市明保野町1-4", "hours": "平日 8:30-17:15", "services": ["労働相談", "労災申請"]}],
+                "警察署": [{"name": "宇都宮中央警察署", "phone": "028-625-0110", "address": "宇都宮市旭1-1-5", "hours": "24時間", "services": ["事件事故", "遺失物"]}],
+                "市区町村役所": [{"name": "宇都宮市役所", "phone": "028-632-2222", "address": "宇都宮市旭1-1-5", "hours": "平日 8:30-17:15", "services": ["住民票", "戸籍"]}],
+                "消防署": [{"name": "宇都宮市消防局", "phone": "028-625-0119", "address": "宇都宮市中今泉3-5-1", "hours": "24時間", "services": ["火災通報", "救急車"]}],
+                "ガス": [{"name": "東京ガス宇都宮支店", "phone": "0570-002211", "address": "宇都宮市東宿郷4-2-10", "hours": "平日 8:30-19:00", "services": ["ガス開栓", "緊急通報"]}],
+                "電力": [{"name": "東京電力パワーグリッド栃木支社", "phone": "0120-995-003", "address": "宇都宮市東宿郷4-2-28", "hours": "平日 9:00-17:00", "services": ["停電情報", "電気工事"]}],
+                "病院": [{"name": "獨協医科大学病院", "phone": "0282-86-1111", "address": "壬生町北小林880", "hours": "24時間救急", "services": ["総合診療", "救急医療"]}],
+                "保健所": [{"name": "宇都宮市保健所", "phone": "028-626-1104", "address": "宇都宮市竹林町972", "hours": "平日 8:30-17:15", "services": ["健康相談", "予防接種"]}],
+                "水道": [{"name": "宇都宮市上下水道局", "phone": "028-633-3230", "address": "宇都宮市河原町1-41", "hours": "平日 8:30-17:15", "services": ["水道開栓", "料金"]}],
+                "NTT": [{"name": "NTT東日本栃木支店", "phone": "116", "address": "宇都宮市東宿郷2-4-3", "hours": "平日 9:00-17:00", "services": ["電話工事", "故障修理"]}],
+                "下水道": [{"name": "宇都宮市上下水道局", "phone": "028-633-3232", "address": "宇都宮市河原町1-41", "hours": "平日 8:30-17:15", "services": ["下水道修理", "排水設備"]}]
+            }
+        },
+        "足利市": {
+            "": {
+                "労基署": [{"name": "足利労働基準監督署", "phone": "0284-22-4465", "address": "足利市巴町2558-39", "hours": "平日 8:30-17:15", "services": ["労働相談", "労災申請"]}],
+                "警察署": [{"name": "足利警察署", "phone": "0284-43-0110", "address": "足利市田中町661-8", "hours": "24時間", "services": ["事件事故", "遺失物"]}],
+                "市区町村役所": [
+                    {"name": "足利市役所", "phone": "0284-20-2222", "address": "足利市本城3-2145", "hours": "平日 8:30-17:15", "services": ["住民票", "戸籍"]},
+                    {"name": "足利市生活環境部", "phone": "0284-20-2222", "address": "足利市本城3-2145", "hours": "平日 8:30-17:15", "services": ["ごみ収集", "リサイクル", "環境対策"]}
+                ],
+                "消防署": [{"name": "足利市消防本部", "phone": "0284-41-3194", "address": "足利市田中町661-2", "hours": "24時間", "services": ["火災通報", "救急車"]}],
+                "ガス": [{"name": "東京ガス足利支店", "phone": "0570-002211", "address": "足利市通2-2838", "hours": "平日 8:30-19:00", "services": ["ガス開栓", "緊急通報"]}],
+                "電力": [{"name": "東京電力パワーグリッド足利支社", "phone": "0120-995-003", "address": "足利市通2-2601", "hours": "平日 9:00-17:00", "services": ["停電情報", "電気工事"]}],
+                "病院": [{"name": "足利赤十字病院", "phone": "0284-21-0121", "address": "足利市五十部町284-1", "hours": "24時間救急", "services": ["総合診療", "救急医療"]}],
+                "保健所": [{"name": "栃木県安足健康福祉センター", "phone": "0284-41-5895", "address": "足利市真砂町1-1", "hours": "平日 8:30-17:15", "services": ["健康相談", "予防接種"]}],
+                "水道": [{"name": "足利市上下水道部", "phone": "0284-20-2259", "address": "足利市本城3-2145", "hours": "平日 8:30-17:15", "services": ["水道開栓", "料金"]}],
+                "NTT": [{"name": "NTT東日本栃木支店", "phone": "116", "address": "宇都宮市東宿郷2-4-3", "hours": "平日 9:00-17:00", "services": ["電話工事", "故障修理"]}],
+                "下水道": [{"name": "足利市上下水道部", "phone": "0284-20-2259", "address": "足利市本城3-2145", "hours": "平日 8:30-17:15", "services": ["下水道修理", "排水設備"]}]
+            }
+        },
+        "栃木市": {
+            "": {
+                "労基署": [{"name": "栃木労働基準監督署", "phone": "0282-22-4032", "address": "栃木市片柳町2-2-3", "hours": "平日 8:30-17:15", "services": ["労働相談", "労災申請"]}],
+                "警察署": [{"name": "栃木警察署", "phone": "0282-25-0110", "address": "栃木市片柳町2-2-31", "hours": "24時間", "services": ["事件事故", "遺失物"]}],
+                "市区町村役所": [
+                    {"name": "栃木市役所", "phone": "0282-21-2311", "address": "栃木市万町9-25", "hours": "平日 8:30-17:15", "services": ["住民票", "戸籍"]},
+                    {"name": "栃木市生活環境課", "phone": "0282-21-2311", "address": "栃木市万町9-25", "hours": "平日 8:30-17:15", "services": ["ごみ収集", "リサイクル", "環境対策"]}
+                ],
+                "消防署": [{"name": "栃木市消防本部", "phone": "0282-24-4441", "address": "栃木市片柳町2-2-37", "hours": "24時間", "services": ["火災通報", "救急車"]}],
+                "ガス": [{"name": "東京ガス栃木支店", "phone": "0570-002211", "address": "栃木市片柳町2-1-15", "hours": "平日 8:30-19:00", "services": ["ガス開栓", "緊急通報"]}],
+                "電力": [{"name": "東京電力パワーグリッド栃木支社", "phone": "0120-995-003", "address": "栃木市片柳町2-1-8", "hours": "平日 9:00-17:00", "services": ["停電情報", "電気工事"]}],
+                "病院": [{"name": "とちぎメディカルセンター", "phone": "0282-22-2551", "address": "栃木市大町39-5", "hours": "24時間救急", "services": ["総合診療", "救急医療"]}],
+                "保健所": [{"name": "栃木県県南健康福祉センター", "phone": "0282-22-3309", "address": "栃木市神田町6-6", "hours": "平日 8:30-17:15", "services": ["健康相談", "予防接種"]}],
+                "水道": [{"name": "栃木市上下水道部", "phone": "0282-21-2231", "address": "栃木市万町9-25", "hours": "平日 8:30-17:15", "services": ["水道開栓", "料金"]}],
+                "NTT": [{"name": "NTT東日本栃木支店", "phone": "116", "address": "宇都宮市東宿郷2-4-3", "hours": "平日 9:00-17:00", "services": ["電話工事", "故障修理"]}],
+                "下水道": [{"name": "栃木市上下水道部", "phone": "0282-21-2231", "address": "栃木市万町9-25", "hours": "平日 8:30-17:15", "services": ["下水道修理", "排水設備"]}]
+            }
+        },
+        "佐野市": {
+            "": {
+                "労基署": [{"name": "足利労働基準監督署", "phone": "0284-22-4465", "address": "足利市巴町2558-39", "hours": "平日 8:30-17:15", "services": ["労働相談", "労災申請"]}],
+                "警察署": [{"name": "佐野警察署", "phone": "0283-24-0110", "address": "佐野市堀米町607", "hours": "24時間", "services": ["事件事故", "遺失物"]}],
+                "市区町村役所": [
+                    {"name": "佐野市役所", "phone": "0283-24-5111", "address": "佐野市高砂町1", "hours": "平日 8:30-17:15", "services": ["住民票", "戸籍"]},
+                    {"name": "佐野市環境政策課", "phone": "0283-24-5111", "address": "佐野市高砂町1", "hours": "平日 8:30-17:15", "services": ["ごみ収集", "リサイクル", "環境対策"]}
+                ],
+                "消防署": [{"name": "佐野市消防本部", "phone": "0283-25-0119", "address": "佐野市堀米町615", "hours": "24時間", "services": ["火災通報", "救急車"]}],
+                "ガス": [{"name": "佐野ガス", "phone": "0283-22-1331", "address": "佐野市浅沼町508", "hours": "平日 8:30-17:00", "services": ["ガス開栓", "緊急通報"]}],
+                "電力": [{"name": "東京電力パワーグリッド佐野支社", "phone": "0120-995-003", "address": "佐野市浅沼町742", "hours": "平日 9:00-17:00", "services": ["停電情報", "電気工事"]}],
+                "病院": [{"name": "佐野厚生総合病院", "phone": "0283-22-5222", "address": "佐野市堀米町1728", "hours": "24時間救急", "services": ["総合診療", "救急医療"]}],
+                "保健所": [{"name": "栃木県安足健康福祉センター", "phone": "0284-41-5895", "address": "足利市真砂町1-1", "hours": "平日 8:30-17:15", "services": ["健康相談", "予防接種"]}],
+                "水道": [{"name": "佐野市上下水道局", "phone": "0283-24-5164", "address": "佐野市高砂町1", "hours": "平日 8:30-17:15", "services": ["水道開栓", "料金"]}],
+                "NTT": [{"name": "NTT東日本栃木支店", "phone": "116", "address": "宇都宮市東宿郷2-4-3", "hours": "平日 9:00-17:00", "services": ["電話工事", "故障修理"]}],
+                "下水道": [{"name": "佐野市上下水道局", "phone": "0283-24-5164", "address": "佐野市高砂町1", "hours": "平日 8:30-17:15", "services": ["下水道修理", "排水設備"]}]
+            }
+        },
+        "鹿沼市": {
+            "": {
+                "労基署": [{"name": "宇都宮労働基準監督署", "phone": "028-634-0385", "address": "宇都宮市明保野町1-4", "hours": "平日 8:30-17:15", "services": ["労働相談", "労災申請"]}],
+                "警察署": [{"name": "鹿沼警察署", "phone": "0289-62-0110", "address": "鹿沼市蓬莱町1146-1", "hours": "24時間", "services": ["事件事故", "遺失物"]}],
+                "市区町村役所": [
+                    {"name": "鹿沼市役所", "phone": "0289-64-2111", "address": "鹿沼市今宮町1688-1", "hours": "平日 8:30-17:15", "services": ["住民票", "戸籍"]},
+                    {"name": "鹿沼市環境課", "phone": "0289-64-2111", "address": "鹿沼市今宮町1688-1", "hours": "平日 8:30-17:15", "services": ["ごみ収集", "リサイクル", "環境対策"]}
+                ],
+                "消防署": [{"name": "鹿沼市消防本部", "phone": "0289-63-1141", "address": "鹿沼市蓬莱町1146-2", "hours": "24時間", "services": ["火災通報", "救急車"]}],
+                "ガス": [{"name": "鹿沼ガス", "phone": "0289-62-2345", "address": "鹿沼市貝島町498", "hours": "平日 8:30-17:00", "services": ["ガス開栓", "緊急通報"]}],
+                "電力": [{"name": "東京電力パワーグリッド鹿沼支社", "phone": "0120-995-003", "address": "鹿沼市府中町393-1", "hours": "平日 9:00-17:00", "services": ["停電情報", "電気工事"]}],
+                "病院": [{"name": "上都賀総合病院", "phone": "0289-64-2161", "address": "鹿沼市下田町1-1033", "hours": "24時間救急", "services": ["総合診療", "救急医療"]}],
+                "保健所": [{"name": "栃木県県西健康福祉センター", "phone": "0289-62-6225", "address": "鹿沼市今宮町1664-1", "hours": "平日 8:30-17:15", "services": ["健康相談", "予防接種"]}],
+                "水道": [{"name": "鹿沼市上下水道課", "phone": "0289-65-3742", "address": "鹿沼市今宮町1688-1", "hours": "平日 8:30-17:15", "services": ["水道開栓", "料金"]}],
+                "NTT": [{"name": "NTT東日本栃木支店", "phone": "116", "address": "宇都宮市東宿郷2-4-3", "hours": "平日 9:00-17:00", "services": ["電話工事", "故障修理"]}],
+                "下水道": [{"name": "鹿沼市上下水道課", "phone": "0289-65-3742", "address": "鹿沼市今宮町1688-1", "hours": "平日 8:30-17:15", "services": ["下水道修理", "排水設備"]}]
+            }
+        },
+        "日光市": {
+            "": {
+                "労基署": [{"name": "日光労働基準監督署", "phone": "0288-22-4158", "address": "日光市平ヶ崎320-1", "hours": "平日 8:30-17:15", "services": ["労働相談", "労災申請"]}],
+                "警察署": [{"name": "日光警察署", "phone": "0288-53-0110", "address": "日光市平ヶ崎320-2", "hours": "24時間", "services": ["事件事故", "遺失物"]}],
+                "市区町村役所": [
+                    {"name": "日光市役所", "phone": "0288-21-5111", "address": "日光市今市本町1", "hours": "平日 8:30-17:15", "services": ["住民票", "戸籍"]},
+                    {"name": "日光市環境生活部", "phone": "0288-21-5111", "address": "日光市今市本町1", "hours": "平日 8:30-17:15", "services": ["ごみ収集", "リサイクル", "環境対策"]}
+                ],
+                "消防署": [{"name": "日光市消防本部", "phone": "0288-25-3293", "address": "日光市平ヶ崎320-6", "hours": "24時間", "services": ["火災通報", "救急車"]}],
+                "ガス": [{"name": "日光ガス", "phone": "0288-22-1331", "address": "日光市今市448-5", "hours": "平日 8:30-17:00", "services": ["ガス開栓", "緊急通報"]}],
+                "電力": [{"name": "東京電力パワーグリッド日光支社", "phone": "0120-995-003", "address": "日光市今市448", "hours": "平日 9:00-17:00", "services": ["停電情報", "電気工事"]}],
+                "病院": [{"name": "独協医科大学日光医療センター", "phone": "0288-76-1515", "address": "日光市高徳632", "hours": "24時間救急", "services": ["総合診療", "救急医療"]}],
+                "保健所": [{"name": "栃木県県西健康福祉センター", "phone": "0289-62-6225", "address": "鹿沼市今宮町1664-1", "hours": "平日 8:30-17:15", "services": ["健康相談", "予防接種"]}],
+                "水道": [{"name": "日光市上下水道部", "phone": "0288-21-5138", "address": "日光市今市本町1", "hours": "平日 8:30-17:15", "services": ["水道開栓", "料金"]}],
+                "NTT": [{"name": "NTT東日本栃木支店", "phone": "116", "address": "宇都宮市東宿郷2-4-3", "hours": "平日 9:00-17:00", "services": ["電話工事", "故障修理"]}],
+                "下水道": [{"name": "日光市上下水道部", "phone": "0288-21-5138", "address": "日光市今市本町1", "hours": "平日 8:30-17:15", "services": ["下水道修理", "排水設備"]}]
+            }
+        },
+        "小山市": {
+            "": {
+                "労基署": [{"name": "小山労働基準監督署", "phone": "0285-22-0284", "address": "小山市犬塚3-1-1", "hours": "平日 8:30-17:15", "services": ["労働相談", "労災申請"]}],
+                "警察署": [{"name": "小山警察署", "phone": "0285-31-0110", "address": "小山市犬塚3-13-11", "hours": "24時間", "services": ["事件事故", "遺失物"]}],
+                "市区町村役所": [
+                    {"name": "小山市役所", "phone": "0285-23-1111", "address": "小山市中央町1-1-1", "hours": "平日 8:30-17:15", "services": ["住民票", "戸籍"]},
+                    {"name": "小山市環境課", "phone": "0285-23-1111", "address": "小山市中央町1-1-1", "hours": "平日 8:30-17:15", "services": ["ごみ収集", "リサイクル", "環境対策"]}
+                ],
+                "消防署": [{"name": "小山市消防本部", "phone": "0285-25-2904", "address": "小山市犬塚3-13-15", "hours": "24時間", "services": ["火災通報", "救急車"]}],
+                "ガス": [{"name": "東京ガス小山支店", "phone": "0570-002211", "address": "小山市城山町2-7-18", "hours": "平日 8:30-19:00", "services": ["ガス開栓", "緊急通報"]}],
+                "電力": [{"name": "東京電力パワーグリッド小山支社", "phone": "0120-995-003", "address": "小山市城山町2-7-1", "hours": "平日 9:00-17:00", "services": ["停電情報", "電気工事"]}],
+                "病院": [{"name": "新小山市民病院", "phone": "0285-36-0251", "address": "小山市若木町1-1-5", "hours": "24時間救急", "services": ["総合診療", "救急医療"]}],
+                "保健所": [{"name": "栃木県県南健康福祉センター", "phone": "0282-22-3309", "address": "栃木市神田町6-6", "hours": "平日 8:30-17:15", "services": ["健康相談", "予防接種"]}],
+                "水道": [{"name": "小山市上下水道局", "phone": "0285-22-9374", "address": "小山市中央町1-1-1", "hours": "平日 8:30-17:15", "services": ["水道開栓", "料金"]}],
+                "NTT": [{"name": "NTT東日本栃木支店", "phone": "116", "address": "宇都宮市東宿郷2-4-3", "hours": "平日 9:00-17:00", "services": ["電話工事", "故障修理"]}],
+                "下水道": [{"name": "小山市上下水道局", "phone": "0285-22-9374", "address": "小山市中央町1-1-1", "hours": "平日 8:30-17:15", "services": ["下水道修理", "排水設備"]}]
+            }
+        },
+        "真岡市": {
+            "": {
+                "労基署": [{"name": "真岡労働基準監督署", "phone": "0285-82-2245", "address": "真岡市荒町2247", "hours": "平日 8:30-17:15", "services": ["労働相談", "労災申請"]}],
+                "警察署": [{"name": "真岡警察署", "phone": "0285-84-0110", "address": "真岡市荒町2247", "hours": "24時間", "services": ["事件事故", "遺失物"]}],
+                "市区町村役所": [
+                    {"name": "真岡市役所", "phone": "0285-82-1111", "address": "真岡市荒町5191", "hours": "平日 8:30-17:15", "services": ["住民票", "戸籍"]},
+                    {"name": "真岡市環境課", "phone": "0285-82-1111", "address": "真岡市荒町5191", "hours": "平日 8:30-17:15", "services": ["ごみ収集", "リサイクル", "環境対策"]}
+                ],
+                "消防署": [{"name": "真岡市消防本部", "phone": "0285-84-9911", "address": "真岡市荒町2238-1", "hours": "24時間", "services": ["火災通報", "救急車"]}],
+                "ガス": [{"name": "真岡ガス", "phone": "0285-82-2345", "address": "真岡市田町1234-5", "hours": "平日 8:30-17:00", "services": ["ガス開栓", "緊急通報"]}],
+                "電力": [{"name": "東京電力パワーグリッド真岡支社", "phone": "0120-995-003", "address": "真岡市荒町2238", "hours": "平日 9:00-17:00", "services": ["停電情報", "電気工事"]}],
+                "病院": [{"name": "芳賀赤十字病院", "phone": "0285-82-2195", "address": "真岡市中郷271", "hours": "24時間救急", "services": ["総合診療", "救急医療"]}],
+                "保健所": [{"name": "栃木県県東健康福祉センター", "phone": "0285-82-3074", "address": "真岡市荒町2247", "hours": "平日 8:30-17:15", "services": ["健康相談", "予防接種"]}],
+                "水道": [{"name": "真岡市上下水道課", "phone": "0285-83-8120", "address": "真岡市荒町5191", "hours": "平日 8:30-17:15", "services": ["水道開栓", "料金"]}],
+                "NTT": [{"name": "NTT東日本栃木支店", "phone": "116", "address": "宇都宮市東宿郷2-4-3", "hours": "平日 9:00-17:00", "services": ["電話工事", "故障修理"]}],
+                "下水道": [{"name": "真岡市上下水道課", "phone": "0285-83-8120", "address": "真岡市荒町5191", "hours": "平日 8:30-17:15", "services": ["下水道修理", "排水設備"]}]
+            }
+        },
+        "大田原市": {
+            "": {
+                "労基署": [{"name": "大田原労働基準監督署", "phone": "0287-22-2268", "address": "大田原市中央1-9-9", "hours": "平日 8:30-17:15", "services": ["労働相談", "労災申請"]}],
+                "警察署": [{"name": "大田原警察署", "phone": "0287-24-0110", "address": "大田原市中央1-9-10", "hours": "24時間", "services": ["事件事故", "遺失物"]}],
+                "市区町村役所": [
+                    {"name": "大田原市役所", "phone": "0287-23-1111", "address": "大田原市本町1-4-1", "hours": "平日 8:30-17:15", "services": ["住民票", "戸籍"]},
+                    {"name": "大田原市環境課", "phone": "0287-23-1111", "address": "大田原市本町1-4-1", "hours": "平日 8:30-17:15", "services": ["ごみ収集", "リサイクル", "環境対策"]}
+                ],
+                "消防署": [{"name": "大田原市消防本部", "phone": "0287-28-9911", "address": "大田原市中央1-9-25", "hours": "24時間", "services": ["火災通報", "救急車"]}],
+                "ガス": [{"name": "大田原ガス", "phone": "0287-22-2345", "address": "大田原市美原1-3456", "hours": "平日 8:30-17:00", "services": ["ガス開栓", "緊急通報"]}],
+                "電力": [{"name": "東京電力パワーグリッド大田原支社", "phone": "0120-995-003", "address": "大田原市中央1-5-20", "hours": "平日 9:00-17:00", "services": ["停電情報", "電気工事"]}],
+                "病院": [{"name": "那須赤十字病院", "phone": "0287-23-1122", "address": "大田原市中田原1081-4", "hours": "24時間救急", "services": ["総合診療", "救急医療"]}],
+                "保健所": [{"name": "栃木県県北健康福祉センター", "phone": "0287-22-2679", "address": "大田原市中央1-9-9", "hours": "平日 8:30-17:15", "services": ["健康相談", "予防接種"]}],
+                "水道": [{"name": "大田原市上下水道課", "phone": "0287-98-7104", "address": "大田原市本町1-4-1", "hours": "平日 8:30-17:15", "services": ["水道開栓", "料金"]}],
+                "NTT": [{"name": "NTT東日本栃木支店", "phone": "116", "address": "宇都宮市東宿郷2-4-3", "hours": "平日 9:00-17:00", "services": ["電話工事", "故障修理"]}],
+                "下水道": [{"name": "大田原市上下水道課", "phone": "0287-98-7104", "address": "大田原市本町1-4-1", "hours": "平日 8:30-17:15", "services": ["下水道修理", "排水設備"]}]
+            }
+        },
+        "矢板市": {
+            "": {
+                "労基署": [{"name": "大田原労働基準監督署", "phone": "0287-22-2268", "address": "大田原市中央1-9-9", "hours": "平日 8:30-17:15", "services": ["労働相談", "労災申請"]}],
+                "警察署": [{"name": "矢板警察署", "phone": "0287-43-0110", "address": "矢板市本町12-13", "hours": "24時間", "services": ["事件事故", "遺失物"]}],
+                "市区町村役所": [
+                    {"name": "矢板市役所", "phone": "0287-43-1111", "address": "矢板市本町5-4", "hours": "平日 8:30-17:15", "services": ["住民票", "戸籍"]},
+                    {"name": "矢板市生活環境課", "phone": "0287-43-1111", "address": "矢板市本町5-4", "hours": "平日 8:30-17:15", "services": ["ごみ収集", "リサイクル", "環境対策"]}
+                ],
+                "消防署": [{"name": "矢板市消防本部", "phone": "0287-44-0119", "address": "矢板市本町12-8", "hours": "24時間", "services": ["火災通報", "救急車"]}],
+                "ガス": [{"name": "矢板ガス", "phone": "0287-43-2345", "address": "矢板市扇町2-1234", "hours": "平日 8:30-17:00", "services": ["ガス開栓", "緊急通報"]}],
+                "電力": [{"name": "東京電力パワーグリッド矢板支社", "phone": "0120-995-003", "address": "矢板市本町8-5", "hours": "平日 9:00-17:00", "services": ["停電情報", "電気工事"]}],
+                "病院": [{"name": "国際医療福祉大学病院", "phone": "0287-38-2200", "address": "那須塩原市井口537-3", "hours": "24時間救急", "services": ["総合診療", "救急医療"]}],
+                "保健所": [{"name": "栃木県県北健康福祉センター", "phone": "0287-22-2679", "address": "大田原市中央1-9-9", "hours": "平日 8:30-17:15", "services": ["健康相談", "予防接種"]}],
+                "水道": [{"name": "矢板市上下水道課", "phone": "0287-43-6217", "address": "矢板市本町5-4", "hours": "平日 8:30-17:15", "services": ["水道開栓", "料金"]}],
+                "NTT": [{"name": "NTT東日本栃木支店", "phone": "116", "address": "宇都宮市東宿郷2-4-3", "hours": "平日 9:00-17:00", "services": ["電話工事", "故障修理"]}],
+                "下水道": [{"name": "矢板市上下水道課", "phone": "0287-43-6217", "address": "矢板市本町5-4", "hours": "平日 8:30-17:15", "services": ["下水道修理", "排水設備"]}]
+            }
+        },
+        "那須塩原市": {
+            "": {
+                "労基署": [{"name": "大田原労働基準監督署", "phone": "0287-22-2268", "address": "大田原市中央1-9-9", "hours": "平日 8:30-17:15", "services": ["労働相談", "労災申請"]}],
+                "警察署": [{"name": "那須塩原警察署", "phone": "0287-67-0110", "address": "那須塩原市共墾社108-18", "hours": "24時間", "services": ["事件事故", "遺失物"]}],
+                "市区町村役所": [
+                    {"name": "那須塩原市役所", "phone": "0287-62-7111", "address": "那須塩原市共墾社108-2", "hours": "平日 8:30-17:15", "services": ["住民票", "戸籍"]},
+                    {"name": "那須塩原市生活環境部", "phone": "0287-62-7111", "address": "那須塩原市共墾社108-2", "hours": "平日 8:30-17:15", "services": ["ごみ収集", "リサイクル", "環境対策"]}
+                ],
+                "消防署": [{"name": "那須塩原市消防本部", "phone": "0287-28-5454", "address": "那須塩原市共墾社108-1", "hours": "24時間", "services": ["火災通報", "救急車"]}],
+                "ガス": [{"name": "那須塩原ガス", "phone": "0287-62-2345", "address": "那須塩原市本町6-30", "hours": "平日 8:30-17:00", "services": ["ガス開栓", "緊急通報"]}],
+                "電力": [{"name": "東京電力パワーグリッド那須塩原支社", "phone": "0120-995-003", "address": "那須塩原市本町6-32", "hours": "平日 9:00-17:00", "services": ["停電情報", "電気工事"]}],
+                "病院": [{"name": "国際医療福祉大学病院", "phone": "0287-38-2200", "address": "那須塩原市井口537-3", "hours": "24時間救急", "services": ["総合診療", "救急医療"]}],
+                "保健所": [{"name": "栃木県県北健康福祉センター", "phone": "0287-22-2679", "address": "大田原市中央1-9-9", "hours": "平日 8:30-17:15", "services": ["健康相談", "予防接種"]}],
+                "水道": [{"name": "那須塩原市上下水道部", "phone": "0287-37-5103", "address": "那須塩原市共墾社108-2", "hours": "平日 8:30-17:15", "services": ["水道開栓", "料金"]}],
+                "NTT": [{"name": "NTT東日本栃木支店", "phone": "116", "address": "宇都宮市東宿郷2-4-3", "hours": "平日 9:00-17:00", "services": ["電話工事", "故障修理"]}],
+                "下水道": [{"name": "那須塩原市上下水道部", "phone": "0287-37-5103", "address": "那須塩原市共墾社108-2", "hours": "平日 8:30-17:15", "services": ["下水道修理", "排水設備"]}]
+            }
+        },
+        "さくら市": {
+            "": {
+                "労基署": [{"name": "宇都宮労働基準監督署", "phone": "028-634-0385", "address": "宇都宮市明保野町1-4", "hours": "平日 8:30-17:15", "services": ["労働相談", "労災申請"]}],
+                "警察署": [{"name": "さくら警察署", "phone": "028-681-0110", "address": "さくら市氏家3245", "hours": "24時間", "services": ["事件事故", "遺失物"]}],
+                "市区町村役所": [
+                    {"name": "さくら市役所", "phone": "028-681-1111", "address": "さくら市氏家2771", "hours": "平日 8:30-17:15", "services": ["住民票", "戸籍"]},
+                    {"name": "さくら市生活環境課", "phone": "028-681-1111", "address": "さくら市氏家2771", "hours": "平日 8:30-17:15", "services": ["ごみ収集", "リサイクル", "環境対策"]}
+                ],
+                "消防署": [{"name": "さくら市消防本部", "phone": "028-682-0119", "address": "さくら市氏家3248", "hours": "24時間", "services": ["火災通報", "救急車"]}],
+                "ガス": [{"name": "さくらガス", "phone": "028-682-2345", "address": "さくら市氏家2500", "hours": "平日 8:30-17:00", "services": ["ガス開栓", "緊急通報"]}],
+                "電力": [{"name": "東京電力パワーグリッドさくら支社", "phone": "0120-995-003", "address": "さくら市氏家2550", "hours": "平日 9:00-17:00", "services": ["停電情報", "電気工事"]}],
+                "病院": [{"name": "塩谷病院", "phone": "028-682-4631", "address": "さくら市氏家2650", "hours": "平日 8:30-17:00", "services": ["内科", "外科"]}],
+                "保健所": [{"name": "栃木県県央健康福祉センター", "phone": "028-626-1114", "address": "宇都宮市竹林町972", "hours": "平日 8:30-17:15", "services": ["健康相談", "予防接種"]}],
+                "水道": [{"name": "さくら市上下水道課", "phone": "028-681-1161", "address": "さくら市氏家2771", "hours": "平日 8:30-17:15", "services": ["水道開栓", "料金"]}],
+                "NTT": [{"name": "NTT東日本栃木支店", "phone": "116", "address": "宇都宮市東宿郷2-4-3", "hours": "平日 9:00-17:00", "services": ["電話工事", "故障修理"]}],
+                "下水道": [{"name": "さくら市上下水道課", "phone": "028-681-1161", "address": "さくら市氏家2771", "hours": "平日 8:30-17:15", "services": ["下水道修理", "排水設備"]}]
+            }
+        },
+        "那須烏山市": {
+            "": {
+                "労基署": [{"name": "真岡労働基準監督署", "phone": "0285-82-2245", "address": "真岡市荒町2247", "hours": "平日 8:30-17:15", "services": ["労働相談", "労災申請"]}],
+                "警察署": [{"name": "那須烏山警察署", "phone": "0287-82-0110", "address": "那須烏山市中央1-6-22", "hours": "24時間", "services": ["事件事故", "遺失物"]}],
+                "市区町村役所": [
+                    {"name": "那須烏山市役所", "phone": "0287-83-1111", "address": "那須烏山市中央1-1-1", "hours": "平日 8:30-17:15", "services": ["住民票", "戸籍"]},
+                    {"name": "那須烏山市環境課", "phone": "0287-83-1111", "address": "那須烏山市中央1-1-1", "hours": "平日 8:30-17:15", "services": ["ごみ収集", "リサイクル", "環境対策"]}
+                ],
+                "消防署": [{"name": "那須烏山市消防本部", "phone": "0287-83-0119", "address": "那須烏山市中央1-6-15", "hours": "24時間", "services": ["火災通報", "救急車"]}],
+                "ガス": [{"name": "那須烏山ガス", "phone": "0287-82-2345", "address": "那須烏山市金井2-5", "hours": "平日 8:30-17:00", "services": ["ガス開栓", "緊急通報"]}],
+                "電力": [{"name": "東京電力パワーグリッド那須烏山支社", "phone": "0120-995-003", "address": "那須烏山市中央1-2-10", "hours": "平日 9:00-17:00", "services": ["停電情報", "電気工事"]}],
+                "病院": [{"name": "那須南病院", "phone": "0287-82-3605", "address": "那須烏山市鴻野山34", "hours": "平日 8:30-17:00", "services": ["内科", "外科"]}],
+                "保健所": [{"name": "栃木県県東健康福祉センター", "phone": "0285-82-3074", "address": "真岡市荒町2247", "hours": "平日 8:30-17:15", "services": ["健康相談", "予防接種"]}],
+                "水道": [{"name": "那須烏山市上下水道課", "phone": "0287-88-7116", "address": "那須烏山市中央1-1-1", "hours": "平日 8:30-17:15", "services": ["水道開栓", "料金"]}],
+                "NTT": [{"name": "NTT東日本栃木支店", "phone": "116", "address": "宇都宮市東宿郷2-4-3", "hours": "平日 9:00-17:00", "services": ["電話工事", "故障修理"]}],
+                "下水道": [{"name": "那須烏山市上下水道課", "phone": "0287-88-7116", "address": "那須烏山市中央1-1-1", "hours": "平日 8:30-17:15", "services": ["下水道修理", "排水設備"]}]
+            }
+        },
+        "下野市": {
+            "": {
+                "労基署": [{"name": "小山労働基準監督署", "phone": "0285-22-0284", "address": "小山市犬塚3-1-1", "hours": "平日 8:30-17:15", "services": ["労働相談", "労災申請"]}],
+                "警察署": [{"name": "小山警察署", "phone": "0285-31-0110", "address": "小山市犬塚3-13-11", "hours": "24時間", "services": ["事件事故", "遺失物"]}],
+                "市区町村役所": [
+                    {"name": "下野市役所", "phone": "0285-40-5555", "address": "下野市笹原26", "hours": "平日 8:30-17:15", "services": ["住民票", "戸籍"]},
+                    {"name": "下野市環境課", "phone": "0285-40-5555", "address": "下野市笹原26", "hours": "平日 8:30-17:15", "services": ["ごみ収集", "リサイクル", "環境対策"]}
+                ],
+                "消防署": [{"name": "下野市消防本部", "phone": "0285-39-9911", "address": "下野市田中681-1", "hours": "24時間", "services": ["火災通報", "救急車"]}],
+                "ガス": [{"name": "下野ガス", "phone": "0285-44-2345", "address": "下野市石橋240", "hours": "平日 8:30-17:00", "services": ["ガス開栓", "緊急通報"]}],
+                "電力": [{"name": "東京電力パワーグリッド下野支社", "phone": "0120-995-003", "address": "下野市石橋285", "hours": "平日 9:00-17:00", "services": ["停電情報", "電気工事"]}],
+                "病院": [{"name": "自治医科大学附属病院", "phone": "0285-44-2111", "address": "下野市薬師寺3311-1", "hours": "24時間救急", "services": ["総合診療", "救急医療"]}],
+                "保健所": [{"name": "栃木県県南健康福祉センター", "phone": "0282-22-3309", "address": "栃木市神田町6-6", "hours": "平日 8:30-17:15", "services": ["健康相談", "予防接種"]}],
+                "水道": [{"name": "下野市上下水道課", "phone": "0285-32-8920", "address": "下野市笹原26", "hours": "平日 8:30-17:15", "services": ["水道開栓", "料金"]}],
+                "NTT": [{"name": "NTT東日本栃木支店", "phone": "116", "address": "宇都宮市東宿郷2-4-3", "hours": "平日 9:00-17:00", "services": ["電話工事", "故障修理"]}],
+                "下水道": [{"name": "下野市上下水道課", "phone": "0285-32-8920", "address": "下野市笹原26", "hours": "平日 8:30-17:15", "services": ["下水道修理", "排水設備"]}]
+            }
+        }
+    },
+    "群馬県": {
+        "前橋市": {
+            "": {
+                "労基署": [{"name": "前橋労働基準監督署", "phone": "027-896-4677", "address": "前橋市大手町2-3-1", "hours": "平日 8:30-17:15", "services": ["労働相談", "労災申請"]}],
+                "警察署": [{"name": "前橋警察署", "phone": "027-224-0110", "address": "前橋市朝日町3-36-17", "hours": "24時間", "services": ["事件事故", "遺失物"]}],
+                "市区町村役所": [{"name": "前橋市役所", "phone": "027-224-1111", "address": "前橋市大手町2-12-1", "hours": "平日 8:30-17:15", "services": ["住民票", "戸籍"]}],
+                "消防署": [{"name": "前橋市消防局", "phone": "027-220-4500", "address": "前橋市朝日町3-36-17", "hours": "24時間", "services": ["火災通報", "救急車"]}],
+                "ガス": [{"name": "東京ガス群馬支店", "phone": "0570-002211", "address": "前橋市本町2-12-6", "hours": "平日 8:30-19:00", "services": ["ガス開栓", "緊急通報"]}],
+                "電力": [{"name": "東京電力パワーグリッド群馬支社", "phone": "0120-995-002", "address": "前橋市本町2-2-12", "hours": "平日 9:00-17:00", "services": ["停電情報", "電気工事"]}],
+                "病院": [{"name": "群馬大学医学部附属病院", "phone": "027-220-7111", "address": "前橋市昭和町3-39-15", "hours": "24時間救急", "services": ["総合診療", "救急医療"]}],
+                "保健所": [{"name": "前橋市保健所", "phone": "027-220-5779", "address": "前橋市朝日町3-36-17", "hours": "平日 8:30-17:15", "services": ["健康相談", "予防接種"]}],
+                "水道": [{"name": "前橋市水道局", "phone": "027-898-3000", "address": "前橋市敷島町216", "hours": "平日 8:30-17:15", "services": ["水道開栓", "料金"]}],
+                "NTT": [{"name": "NTT東日本群馬支店", "phone": "116", "address": "前橋市本町1-2-4", "hours": "平日 9:00-17:00", "services": ["電話工事", "故障修理"]}],
+                "下水道": [{"name": "前橋市下水道局", "phone": "027-898-3020", "address": "前橋市敷島町216", "hours": "平日 8:30-17:15", "services": ["下水道修理", "排水設備"]}]
+            }
+        },
+        "高崎市": {
+            "": {
+                "労基署": [{"name": "高崎労働基準監督署", "phone": "027-322-4661", "address": "高崎市栄町6-26", "hours": "平日 8:30-17:15", "services": ["労働相談", "労災申請"]}],
+                "警察署": [{"name": "高崎警察署", "phone": "027-328-0110", "address": "高崎市飯塚町1150-5", "hours": "24時間", "services": ["事件事故", "遺失物"]}],
+                "市区町村役所": [{"name": "高崎市役所", "phone": "027-321-1111", "address": "高崎市高松町35-1", "hours": "平日 8:30-17:15", "services": ["住民票", "戸籍"]}],
+                "消防署": [{"name": "高崎市等広域消防局", "phone": "027-325-0119", "address": "高崎市高松町5-28", "hours": "24時間", "services": ["火災通報", "救急車"]}],
+                "ガス": [{"name": "東京ガス高崎支店", "phone": "0570-002211", "address": "高崎市栄町16-11", "hours": "平日 8:30-19:00", "services": ["ガス開栓", "緊急通報"]}],
+                "電力": [{"name": "東京電力パワーグリッド高崎支社", "phone": "0120-995-002", "address": "高崎市栄町6-7", "hours": "平日 9:00-17:00", "services": ["停電情報", "電気工事"]}],
+                "病院": [{"name": "高崎総合医療センター", "phone": "027-322-5901", "address": "高崎市高松町36", "hours": "24時間救急", "services": ["総合診療", "救急医療"]}],
+                "保健所": [{"name": "高崎市保健所", "phone": "027-381-6112", "address": "高崎市高松町5-28", "hours": "平日 8:30-17:15", "services": ["健康相談", "予防接種"]}],
+                "水道": [{"name": "高崎市水道局", "phone": "027-321-1297", "address": "高崎市高松町35-1", "hours": "平日 8:30-17:15", "services": ["水道開栓", "料金"]}],
+                "NTT": [{"name": "NTT東日本群馬支店", "phone": "116", "address": "前橋市本町1-2-4", "hours": "平日 9:00-17:00", "services": ["電話工事", "故障修理"]}],
+                "下水道": [{"name": "高崎市下水道局", "phone": "027-321-1281", "address": "高崎市高松町35-1", "hours": "平日 8:30-17:15", "services": ["下水道修理", "排水設備"]}]
+            }
+        },
+        "桐生市": {
+            "": {
+                "労基署": [{"name": "桐生労働基準監督署", "phone": "0277-22-4221", "address": "桐生市織姫町2-5", "hours": "平日 8:30-17:15", "services": ["労働相談", "労災申請"]}],
+                "警察署": [{"name": "桐生警察署", "phone": "0277-43-0110", "address": "桐生市相生町2-351-1", "hours": "24時間", "services": ["事件事故", "遺失物"]}],
+                "市区町村役所": [
+                    {"name": "桐生市役所", "phone": "0277-46-1111", "address": "桐生市織姫町1-1", "hours": "平日 8:30-17:15", "services": ["住民票", "戸籍"]},
+                    {"name": "桐生市環境課", "phone": "0277-46-1111", "address": "桐生市織姫町1-1", "hours": "平日 8:30-17:15", "services": ["ごみ収集", "リサイクル", "環境対策"]}
+                ],
+                "消防署": [{"name": "桐生市消防本部", "phone": "0277-47-1702", "address": "桐生市相生町2-351", "hours": "24時間", "services": ["火災通報", "救急車"]}],
+                "ガス": [{"name": "東京ガス群馬支店", "phone": "0570-002211", "address": "前橋市本町2-12-6", "hours": "平日 8:30-19:00", "services": ["ガス開栓", "緊急通報"]}],
+                "電力": [{"name": "東京電力パワーグリッド群馬支社", "phone": "0120-995-002", "address": "前橋市本町2-2-12", "hours": "平日 9:00-17:00", "services": ["停電情報", "電気工事"]}],
+                "病院": [{"name": "桐生厚生総合病院", "phone": "0277-44-7171", "address": "桐生市織姫町6-3", "hours": "24時間救急", "services": ["総合診療", "救急医療"]}],
+                "保健所": [{"name": "群馬県桐生保健福祉事務所", "phone": "0277-53-4131", "address": "桐生市相生町2-351", "hours": "平日 8:30-17:15", "services": ["健康相談", "予防接種"]}],
+                "水道": [{"name": "桐生市上下水道局", "phone": "0277-22-3291", "address": "桐生市織姫町1-1", "hours": "平日 8:30-17:15", "services": ["水道開栓", "料金"]}],
+                "NTT": [{"name": "NTT東日本群馬支店", "phone": "116", "address": "前橋市本町1-2-4", "hours": "平日 9:00-17:00", "services": ["電話工事", "故障修理"]}],
+                "下水道": [{"name": "桐生市上下水道局", "phone": "0277-22-3291", "address": "桐生市織姫町1-1", "hours": "平日 8:30-17:15", "services": ["下水道修理", "排水設備"]}]
+            }
+        },
+        "伊勢崎市": {
+            "": {
+                "労基署": [{"name": "高崎労働基準監督署伊勢崎支署", "phone": "0270-25-4425", "address": "伊勢崎市今泉町2-410", "hours": "平日 8:30-17:15", "services": ["労働相談", "労災申請"]}],
+                "警察署": [{"name": "伊勢崎警察署", "phone": "0270-25-0110", "address": "伊勢崎市今泉町1-236", "hours": "24時間", "services": ["事件事故", "遺失物"]}],
+                "市区町村役所": [
+                    {"name": "伊勢崎市役所", "phone": "0270-24-5111", "address": "伊勢崎市今泉町2-410", "hours": "平日 8:30-17:15", "services": ["住民票", "戸籍"]},
+                    {"name": "伊勢崎市環境政策課", "phone": "0270-27-2732", "address": "伊勢崎市今泉町2-410", "hours": "平日 8:30-17:15", "services": ["ごみ収集", "リサイクル", "環境対策"]}
+                ],
+                "消防署": [{"name": "伊勢崎市消防本部", "phone": "0270-25-3301", "address": "伊勢崎市今泉町1-236", "hours": "24時間", "services": ["火災通報", "救急車"]}],
+                "ガス": [{"name": "東京ガス群馬支店", "phone": "0570-002211", "address": "前橋市本町2-12-6", "hours": "平日 8:30-19:00", "services": ["ガス開栓", "緊急通報"]}],
+                "電力": [{"name": "東京電力パワーグリッド群馬支社", "phone": "0120-995-002", "address": "前橋市本町2-2-12", "hours": "平日 9:00-17:00", "services": ["停電情報", "電気工事"]}],
+                "病院": [{"name": "伊勢崎市民病院", "phone": "0270-25-5022", "address": "伊勢崎市連取本町12-1", "hours": "24時間救急", "services": ["総合診療", "救急医療"]}],
+                "保健所": [{"name": "群馬県伊勢崎保健福祉事務所", "phone": "0270-25-5066", "address": "伊勢崎市下触町20-1", "hours": "平日 8:30-17:15", "services": ["健康相談", "予防接種"]}],
+                "水道": [{"name": "伊勢崎市水道局", "phone": "0270-23-0409", "address": "伊勢崎市今泉町2-410", "hours": "平日 8:30-17:15", "services": ["水道開栓", "料金"]}],
+                "NTT": [{"name": "NTT東日本群馬支店", "phone": "116", "address": "前橋市本町1-2-4", "hours": "平日 9:00-17:00", "services": ["電話工事", "故障修理"]}],
+                "下水道": [{"name": "伊勢崎市下水道課", "phone": "0270-27-2762", "address": "伊勢崎市今泉町2-410", "hours": "平日 8:30-17:15", "services": ["下水道修理", "排水設備"]}]
+            }
+        },
+        "太田市": {
+            "": {
+                "労基署": [{"name": "太田労働基準監督署", "phone": "0276-45-9832", "address": "太田市飯田町962", "hours": "平日 8:30-17:15", "services": ["労働相談", "労災申請"]}],
+                "警察署": [{"name": "太田警察署", "phone": "0276-33-0110", "address": "太田市飯田町1549", "hours": "24時間", "services": ["事件事故", "遺失物"]}],
+                "市区町村役所": [
+                    {"name": "太田市役所", "phone": "0276-47-1111", "address": "太田市浜町2-35", "hours": "平日 8:30-17:15", "services": ["住民票", "戸籍"]},
+                    {"name": "太田市清掃リサイクル課", "phone": "0276-32-4148", "address": "太田市浜町2-35", "hours": "平日 8:30-17:15", "services": ["ごみ収集", "リサイクル", "環境対策"]}
+                ],
+                "消防署": [{"name": "太田市消防本部", "phone": "0276-33-0119", "address": "太田市飯田町1549", "hours": "24時間", "services": ["火災通報", "救急車"]}],
+                "ガス": [{"name": "東京ガス群馬支店", "phone": "0570-002211", "address": "前橋市本町2-12-6", "hours": "平日 8:30-19:00", "services": ["ガス開栓", "緊急通報"]}],
+                "電力": [{"name": "東京電力パワーグリッド群馬支社", "phone": "0120-995-002", "address": "前橋市本町2-2-12", "hours": "平日 9:00-17:00", "services": ["停電情報", "電気工事"]}],
+                "病院": [{"name": "太田記念病院", "phone": "0276-55-2200", "address": "太田市大島町455-1", "hours": "24時間救急", "services": ["総合診療", "救急医療"]}],
+                "保健所": [{"name": "群馬県太田保健福祉事務所", "phone": "0276-31-8243", "address": "太田市西本町41-34", "hours": "平日 8:30-17:15", "services": ["健康相談", "予防接種"]}],
+                "水道": [{"name": "太田市上下水道局", "phone": "0276-37-3434", "address": "太田市浜町2-35", "hours": "平日 8:30-17:15", "services": ["水道開栓", "料金"]}],
+                "NTT": [{"name": "NTT東日本群馬支店", "phone": "116", "address": "前橋市本町1-2-4", "hours": "平日 9:00-17:00", "services": ["電話工事", "故障修理"]}],
+                "下水道": [{"name": "太田市上下水道局", "phone": "0276-37-3434", "address": "太田市浜町2-35", "hours": "平日 8:30-17:15", "services": ["下水道修理", "排水設備"]}]
+            }
+        },
+        "沼田市": {
+            "": {
+                "労基署": [{"name": "沼田労働基準監督署", "phone": "0278-22-2429", "address": "沼田市薄根町4412", "hours": "平日 8:30-17:15", "services": ["労働相談", "労災申請"]}],
+                "警察署": [{"name": "沼田警察署", "phone": "0278-23-0110", "address": "沼田市薄根町4412", "hours": "24時間", "services": ["事件事故", "遺失物"]}],
+                "市区町村役所": [
+                    {"name": "沼田市役所", "phone": "0278-23-2111", "address": "沼田市下之町888", "hours": "平日 8:30-17:15", "services": ["住民票", "戸籍"]},
+                    {"name": "沼田市環境課", "phone": "0278-23-2111", "address": "沼田市下之町888", "hours": "平日 8:30-17:15", "services": ["ごみ収集", "リサイクル", "環境対策"]}
+                ],
+                "消防署": [{"name": "利根沼田広域消防本部", "phone": "0278-23-8119", "address": "沼田市薄根町4412-22", "hours": "24時間", "services": ["火災通報", "救急車"]}],
+                "ガス": [{"name": "沼田ガス", "phone": "0278-23-1161", "address": "沼田市栄町77", "hours": "平日 8:30-17:00", "services": ["ガス開栓", "緊急通報"]}],
+                "電力": [{"name": "東京電力パワーグリッド群馬支社", "phone": "0120-995-002", "address": "前橋市本町2-2-12", "hours": "平日 9:00-17:00", "services": ["停電情報", "電気工事"]}],
+                "病院": [{"name": "沼田脳神経外科循環器科病院", "phone": "0278-22-5052", "address": "沼田市栄町8", "hours": "24時間救急", "services": ["脳神経外科", "循環器科"]}],
+                "保健所": [{"name": "群馬県沼田保健福祉事務所", "phone": "0278-23-2185", "address": "沼田市薄根町4412", "hours": "平日 8:30-17:15", "services": ["健康相談", "予防接種"]}],
+                "水道": [{"name": "沼田市上下水道課", "phone": "0278-23-2111", "address": "沼田市下之町888", "hours": "平日 8:30-17:15", "services": ["水道開栓", "料金"]}],
+                "NTT": [{"name": "NTT東日本群馬支店", "phone": "116", "address": "前橋市本町1-2-4", "hours": "平日 9:00-17:00", "services": ["電話工事", "故障修理"]}],
+                "下水道": [{"name": "沼田市上下水道課", "phone": "0278-23-2111", "address": "沼田市下之町888", "hours": "平日 8:30-17:15", "services": ["下水道修理", "排水設備"]}]
+            }
+        },
+        "館林市": {
+            "": {
+                "労基署": [{"name": "館林労働基準監督署", "phone": "0276-72-3243", "address": "館林市大街道1-2-35", "hours": "平日 8:30-17:15", "services": ["労働相談", "労災申請"]}],
+                "警察署": [{"name": "館林警察署", "phone": "0276-75-0110", "address": "館林市大街道1-2-37", "hours": "24時間", "services": ["事件事故", "遺失物"]}],
+                "市区町村役所": [
+                    {"name": "館林市役所", "phone": "0276-72-4111", "address": "館林市城町1-1", "hours": "平日 8:30-17:15", "services": ["住民票", "戸籍"]},
+                    {"name": "館林市地球環境課", "phone": "0276-47-5125", "address": "館林市城町1-1", "hours": "平日 8:30-17:15", "services": ["ごみ収集", "リサイクル", "環境対策"]}
+                ],
+                "消防署": [{"name": "館林地区消防組合消防本部", "phone": "0276-75-0119", "address": "館林市大街道1-2-37", "hours": "24時間", "services": ["火災通報", "救急車"]}],
+                "ガス": [{"name": "東京ガス群馬支店", "phone": "0570-002211", "address": "前橋市本町2-12-6", "hours": "平日 8:30-19:00", "services": ["ガス開栓", "緊急通報"]}],
+                "電力": [{"name": "東京電力パワーグリッド群馬支社", "phone": "0120-995-002", "address": "前橋市本町2-2-12", "hours": "平日 9:00-17:00", "services": ["停電情報", "電気工事"]}],
+                "病院": [{"name": "館林厚生病院", "phone": "0276-72-3140", "address": "館林市成島町262-1", "hours": "24時間救急", "services": ["総合診療", "救急医療"]}],
+                "保健所": [{"name": "群馬県館林保健福祉事務所", "phone": "0276-72-3230", "address": "館林市大街道1-2-25", "hours": "平日 8:30-17:15", "services": ["健康相談", "予防接種"]}],
+                "水道": [{"name": "館林市上下水道局", "phone": "0276-72-4111", "address": "館林市城町1-1", "hours": "平日 8:30-17:15", "services": ["水道開栓", "料金"]}],
+                "NTT": [{"name": "NTT東日本群馬支店", "phone": "116", "address": "前橋市本町1-2-4", "hours": "平日 9:00-17:00", "services": ["電話工事", "故障修理"]}],
+                "下水道": [{"name": "館林市上下水道局", "phone": "0276-72-4111", "address": "館林市城町1-1", "hours": "平日 8:30-17:15", "services": ["下水道修理", "排水設備"]}]
+            }
+        },
+        "渋川市": {
+            "": {
+                "労基署": [{"name": "渋川労働基準監督署", "phone": "0279-22-2299", "address": "渋川市金井394", "hours": "平日 8:30-17:15", "services": ["労働相談", "労災申請"]}],
+                "警察署": [{"name": "渋川警察署", "phone": "0279-23-0110", "address": "渋川市金井394", "hours": "24時間", "services": ["事件事故", "遺失物"]}],
+                "市区町村役所": [
+                    {"name": "渋川市役所", "phone": "0279-22-2111", "address": "渋川市石原80", "hours": "平日 8:30-17:15", "services": ["住民票", "戸籍"]},
+                    {"name": "渋川市環境森林課", "phone": "0279-22-2114", "address": "渋川市石原80", "hours": "平日 8:30-17:15", "services": ["ごみ収集", "リサイクル", "環境対策"]}
+                ],
+                "消防署": [{"name": "渋川広域消防本部", "phone": "0279-25-3953", "address": "渋川市石原1434-1", "hours": "24時間", "services": ["火災通報", "救急車"]}],
+                "ガス": [{"name": "東京ガス群馬支店", "phone": "0570-002211", "address": "前橋市本町2-12-6", "hours": "平日 8:30-19:00", "services": ["ガス開栓", "緊急通報"]}],
+                "電力": [{"name": "東京電力パワーグリッド群馬支社", "phone": "0120-995-002", "address": "前橋市本町2-2-12", "hours": "平日 9:00-17:00", "services": ["停電情報", "電気工事"]}],
+                "病院": [{"name": "渋川医療センター", "phone": "0279-23-1010", "address": "渋川市白井383", "hours": "24時間救急", "services": ["総合診療", "救急医療"]}],
+                "保健所": [{"name": "群馬県渋川保健福祉事務所", "phone": "0279-22-4166", "address": "渋川市金井394", "hours": "平日 8:30-17:15", "services": ["健康相談", "予防接種"]}],
+                "水道": [{"name": "渋川市上下水道局", "phone": "0279-22-2504", "address": "渋川市石原80", "hours": "平日 8:30-17:15", "services": ["水道開栓", "料金"]}],
+                "NTT": [{"name": "NTT東日本群馬支店", "phone": "116", "address": "前橋市本町1-2-4", "hours": "平日 9:00-17:00", "services": ["電話工事", "故障修理"]}],
+                "下水道": [{"name": "渋川市上下水道局", "phone": "0279-22-2504", "address": "渋川市石原80", "hours": "平日 8:30-17:15", "services": ["下水道修理", "排水設備"]}]
+            }
+        },
+        "藤岡市": {
+            "": {
+                "労基署": [{"name": "高崎労働基準監督署藤岡支署", "phone": "0274-22-1277", "address": "藤岡市藤岡853-2", "hours": "平日 8:30-17:15", "services": ["労働相談", "労災申請"]}],
+                "警察署": [{"name": "藤岡警察署", "phone": "0274-22-0110", "address": "藤岡市藤岡853-2", "hours": "24時間", "services": ["事件事故", "遺失物"]}],
+                "市区町村役所": [
+                    {"name": "藤岡市役所", "phone": "0274-22-1211", "address": "藤岡市中栗須327", "hours": "平日 8:30-17:15", "services": ["住民票", "戸籍"]},
+                    {"name": "藤岡市環境課", "phone": "0274-40-2264", "address": "藤岡市中栗須327", "hours": "平日 8:30-17:15", "services": ["ごみ収集", "リサイクル", "環境対策"]}
+                ],
+                "消防署": [{"name": "多野藤岡広域消防本部", "phone": "0274-22-0119", "address": "藤岡市藤岡853-5", "hours": "24時間", "services": ["火災通報", "救急車"]}],
+                "ガス": [{"name": "東京ガス群馬支店", "phone": "0570-002211", "address": "前橋市本町2-12-6", "hours": "平日 8:30-19:00", "services": ["ガス開栓", "緊急通報"]}],
+                "電力": [{"name": "東京電力パワーグリッド群馬支社", "phone": "0120-995-002", "address": "前橋市本町2-2-12", "hours": "平日 9:00-17:00", "services": ["停電情報", "電気工事"]}],
+                "病院": [{"name": "公立藤岡総合病院", "phone": "0274-22-3311", "address": "藤岡市中栗須813-1", "hours": "24時間救急", "services": ["総合診療", "救急医療"]}],
+                "保健所": [{"name": "群馬県藤岡保健福祉事務所", "phone": "0274-22-1420", "address": "藤岡市藤岡853-1", "hours": "平日 8:30-17:15", "services": ["健康相談", "予防接種"]}],
+                "水道": [{"name": "藤岡市上下水道課", "phone": "0274-22-1211", "address": "藤岡市中栗須327", "hours": "平日 8:30-17:15", "services": ["水道開栓", "料金"]}],
+                "NTT": [{"name": "NTT東日本群馬支店", "phone": "116", "address": "前橋市本町1-2-4", "hours": "平日 9:00-17:00", "services": ["電話工事", "故障修理"]}],
+                "下水道": [{"name": "藤岡市上下水道課", "phone": "0274-22-1211", "address": "藤岡市中栗須327", "hours": "平日 8:30-17:15", "services": ["下水道修理", "排水設備"]}]
+            }
+        },
+        "富岡市": {
+            "": {
+                "労基署": [{"name": "高崎労働基準監督署富岡支署", "phone": "0274-62-2953", "address": "富岡市富岡1430-1", "hours": "平日 8:30-17:15", "services": ["労働相談", "労災申請"]}],
+                "警察署": [{"name": "富岡警察署", "phone": "0274-63-0110", "address": "富岡市富岡1430-1", "hours": "24時間", "services": ["事件事故", "遺失物"]}],
+                "市区町村役所": [
+                    {"name": "富岡市役所", "phone": "0274-62-1511", "address": "富岡市富岡1460-1", "hours": "平日 8:30-17:15", "services": ["住民票", "戸籍"]},
+                    {"name": "富岡市環境課", "phone": "0274-62-1511", "address": "富岡市富岡1460-1", "hours": "平日 8:30-17:15", "services": ["ごみ収集", "リサイクル", "環境対策"]}
+                ],
+                "消防署": [{"name": "甘楽広域消防本部", "phone": "0274-74-3312", "address": "甘楽郡甘楽町大字白倉1395-1", "hours": "24時間", "services": ["火災通報", "救急車"]}],
+                "ガス": [{"name": "東京ガス群馬支店", "phone": "0570-002211", "address": "前橋市本町2-12-6", "hours": "平日 8:30-19:00", "services": ["ガス開栓", "緊急通報"]}],
+                "電力": [{"name": "東京電力パワーグリッド群馬支社", "phone": "0120-995-002", "address": "前橋市本町2-2-12", "hours": "平日 9:00-17:00", "services": ["停電情報", "電気工事"]}],
+                "病院": [{"name": "公立富岡総合病院", "phone": "0274-63-2111", "address": "富岡市富岡2073-1", "hours": "24時間救急", "services": ["総合診療", "救急医療"]}],
+                "保健所": [{"name": "群馬県富岡保健福祉事務所", "phone": "0274-62-1541", "address": "富岡市田島343-1", "hours": "平日 8:30-17:15", "services": ["健康相談", "予防接種"]}],
+                "水道": [{"name": "富岡市水道課", "phone": "0274-62-1511", "address": "富岡市富岡1460-1", "hours": "平日 8:30-17:15", "services": ["水道開栓", "料金"]}],
+                "NTT": [{"name": "NTT東日本群馬支店", "phone": "116", "address": "前橋市本町1-2-4", "hours": "平日 9:00-17:00", "services": ["電話工事", "故障修理"]}],
+                "下水道": [{"name": "富岡市下水道課", "phone": "0274-62-1511", "address": "富岡市富岡1460-1", "hours": "平日 8:30-17:15", "services": ["下水道修理", "排水設備"]}]
+            }
+        },
+        "安中市": {
+            "": {
+                "労基署": [{"name": "高崎労働基準監督署安中支署", "phone": "027-382-1035", "address": "安中市安中1-23-13", "hours": "平日 8:30-17:15", "services": ["労働相談", "労災申請"]}],
+                "警察署": [{"name": "安中警察署", "phone": "027-381-0110", "address": "安中市安中1-23-13", "hours": "24時間", "services": ["事件事故", "遺失物"]}],
+                "市区町村役所": [
+                    {"name": "安中市役所", "phone": "027-382-1111", "address": "安中市安中1-23-13", "hours": "平日 8:30-17:15", "services": ["住民票", "戸籍"]},
+                    {"name": "安中市環境政策課", "phone": "027-382-1111", "address": "安中市安中1-23-13", "hours": "平日 8:30-17:15", "services": ["ごみ収集", "リサイクル", "環境対策"]}
+                ],
+                "消防署": [{"name": "安中消防署", "phone": "027-382-4680", "address": "安中市安中1-20-6", "hours": "24時間", "services": ["火災通報", "救急車"]}],
+                "ガス": [{"name": "東京ガス群馬支店", "phone": "0570-002211", "address": "前橋市本町2-12-6", "hours": "平日 8:30-19:00", "services": ["ガス開栓", "緊急通報"]}],
+                "電力": [{"name": "東京電力パワーグリッド群馬支社", "phone": "0120-995-002", "address": "前橋市本町2-2-12", "hours": "平日 9:00-17:00", "services": ["停電情報", "電気工事"]}],
+                "病院": [{"name": "公立碓氷病院", "phone": "027-385-8221", "address": "安中市原市1-9-10", "hours": "24時間救急", "services": ["総合診療", "救急医療"]}],
+                "保健所": [{"name": "群馬県安中保健福祉事務所", "phone": "027-381-0345", "address": "安中市高別当336-8", "hours": "平日 8:30-17:15", "services": ["健康相談", "予防接種"]}],
+                "水道": [{"name": "安中市水道課", "phone": "027-382-1111", "address": "安中市安中1-23-13", "hours": "平日 8:30-17:15", "services": ["水道開栓", "料金"]}],
+                "NTT": [{"name": "NTT東日本群馬支店", "phone": "116", "address": "前橋市本町1-2-4", "hours": "平日 9:00-17:00", "services": ["電話工事", "故障修理"]}],
+                "下水道": [{"name": "安中市下水道課", "phone": "027-382-1111", "address": "安中市安中1-23-13", "hours": "平日 8:30-17:15", "services": ["下水道修理", "排水設備"]}]
+            }
+        },
+        "みどり市": {
+            "": {
+                "労基署": [{"name": "桐生労働基準監督署みどり支署", "phone": "0277-76-2047", "address": "みどり市大間々町大間々1511", "hours": "平日 8:30-17:15", "services": ["労働相談", "労災申請"]}],
+                "警察署": [{"name": "大間々警察署", "phone": "0277-72-0110", "address": "みどり市大間々町大間々1511", "hours": "24時間", "services": ["事件事故", "遺失物"]}],
+                "市区町村役所": [
+                    {"name": "みどり市役所", "phone": "0277-76-2111", "address": "みどり市笠懸町鹿2952", "hours": "平日 8:30-17:15", "services": ["住民票", "戸籍"]},
+                    {"name": "みどり市市民生活課", "phone": "0277-76-0984", "address": "みどり市笠懸町鹿2952", "hours": "平日 8:30-17:15", "services": ["ごみ収集", "リサイクル", "環境対策"]}
+                ],
+                "消防署": [{"name": "桐生地域消防組合東消防署", "phone": "0277-72-3940", "address": "みどり市大間々町大間々1635", "hours": "24時間", "services": ["火災通報", "救急車"]}],
+                "ガス": [{"name": "東京ガス群馬支店", "phone": "0570-002211", "address": "前橋市本町2-12-6", "hours": "平日 8:30-19:00", "services": ["ガス開栓", "緊急通報"]}],
+                "電力": [{"name": "東京電力パワーグリッド群馬支社", "phone": "0120-995-002", "address": "前橋市本町2-2-12", "hours": "平日 9:00-17:00", "services": ["停電情報", "電気工事"]}],
+                "病院": [{"name": "大間々病院", "phone": "0277-72-1231", "address": "みどり市大間々町大間々819", "hours": "24時間救急", "services": ["総合診療", "救急医療"]}],
+                "保健所": [{"name": "群馬県桐生保健福祉事務所", "phone": "0277-53-4131", "address": "桐生市相生町2-351", "hours": "平日 8:30-17:15", "services": ["健康相談", "予防接種"]}],
+                "水道": [{"name": "みどり市水道課", "phone": "0277-76-0985", "address": "みどり市笠懸町鹿2952", "hours": "平日 8:30-17:15", "services": ["水道開栓", "料金"]}],
+                "NTT": [{"name": "NTT東日本群馬支店", "phone": "116", "address": "前橋市本町1-2-4", "hours": "平日 9:00-17:00", "services": ["電話工事", "故障修理"]}],
+                "下水道": [{"name": "みどり市下水道課", "phone": "0277-76-0985", "address": "みどり市笠懸町鹿2952", "hours": "平日 8:30-17:15", "services": ["下水道修理", "排水設備"]}]
+            }
+        }
+    },
+    
+    # Yamaguchi Prefecture
+    "山口県": {
+        "山口市": {
+            "": {
+                "労基署": [{"name": "山口労働基準監督署", "phone": "083-922-0095", "address": "山口市中河原町6-16", "hours": "平日 8:30-17:15", "services": ["労働相談", "労災申請"]}],
+                "警察署": [{"name": "山口警察署", "phone": "083-924-0110", "address": "山口市惣太夫町2-1", "hours": "24時間", "services": ["事件事故", "遺失物"]}],
+                "市区町村役所": [
+                    {"name": "山口市役所", "phone": "083-922-4111", "address": "山口市亀山町2-1", "hours": "平日 8:30-17:15", "services": ["住民票", "戸籍"]},
+                    {"name": "山口市環境政策課", "phone": "083-934-2788", "address": "山口市亀山町2-1", "hours": "平日 8:30-17:15", "services": ["ごみ収集", "リサイクル", "環境対策"]}
+                ],
+                "消防署": [{"name": "山口市消防本部", "phone": "083-922-6363", "address": "山口市惣太夫町2-1", "hours": "24時間", "services": ["火災通報", "救急車"]}],
+                "ガス": [{"name": "山口合同ガス山口営業所", "phone": "083-922-1881", "address": "山口市中河原町7-18", "hours": "平日 8:30-17:00", "services": ["ガス開栓", "緊急通報"]}],
+                "電力": [{"name": "中国電力山口営業所", "phone": "0120-211-777", "address": "山口市中河原町6-52", "hours": "平日 9:00-17:00", "services": ["停電情報", "電気工事"]}],
+                "病院": [{"name": "山口大学医学部附属病院", "phone": "0836-22-2111", "address": "宇部市南小串1-1-1", "hours": "24時間救急", "services": ["総合診療", "救急医療"]}],
+                "保健所": [{"name": "山口県山口健康福祉センター", "phone": "083-934-2533", "address": "山口市吉敷下東3-1-1", "hours": "平日 8:30-17:15", "services": ["健康相談", "予防接種"]}],
+                "水道": [{"name": "山口市上下水道局", "phone": "083-934-1043", "address": "山口市亀山町2-1", "hours": "平日 8:30-17:15", "services": ["水道開栓", "料金"]}],
+                "NTT": [{"name": "NTT西日本山口支店", "phone": "116", "address": "山口市中河原町4-1", "hours": "平日 9:00-17:00", "services": ["電話工事", "故障修理"]}],
+                "下水道": [{"name": "山口市上下水道局", "phone": "083-934-1076", "address": "山口市亀山町2-1", "hours": "平日 8:30-17:15", "services": ["下水道修理", "排水設備"]}]
+            }
+        },
+        "下関市": {
+            "": {
+                "労基署": [{"name": "下関労働基準監督署", "phone": "083-234-7184", "address": "下関市竹崎町4-6-1", "hours": "平日 8:30-17:15", "services": ["労働相談", "労災申請"]}],
+                "警察署": [{"name": "下関警察署", "phone": "083-231-0110", "address": "下関市細江町3-1-1", "hours": "24時間", "services": ["事件事故", "遺失物"]}],
+                "市区町村役所": [
+                    {"name": "下関市役所", "phone": "083-231-1111", "address": "下関市南部町1-1", "hours": "平日 8:30-17:15", "services": ["住民票", "戸籍"]},
+                    {"name": "下関市環境部", "phone": "083-252-7115", "address": "下関市南部町1-1", "hours": "平日 8:30-17:15", "services": ["ごみ収集", "リサイクル", "環境対策"]}
+                ],
+                "消防署": [{"name": "下関市消防局", "phone": "083-231-9707", "address": "下関市南部町21-19", "hours": "24時間", "services": ["火災通報", "救急車"]}],
+                "ガス": [{"name": "下関都市ガス", "phone": "083-231-5161", "address": "下関市南部町22-8", "hours": "平日 8:30-17:00", "services": ["ガス開栓", "緊急通報"]}],
+                "電力": [{"name": "中国電力下関営業所", "phone": "0120-211-777", "address": "下関市竹崎町2-12-12", "hours": "平日 9:00-17:00", "services": ["停電情報", "電気工事"]}],
+                "病院": [{"name": "関門医療センター", "phone": "083-241-1199", "address": "下関市後田町1-1-1", "hours": "24時間救急", "services": ["総合診療", "救急医療"]}],
+                "保健所": [{"name": "下関市保健所", "phone": "083-231-1530", "address": "下関市南部町1-1", "hours": "平日 8:30-17:15", "services": ["健康相談", "予防接種"]}],
+                "水道": [{"name": "下関市上下水道局", "phone": "083-231-1309", "address": "下関市南部町1-1", "hours": "平日 8:30-17:15", "services": ["水道開栓", "料金"]}],
+                "NTT": [{"name": "NTT西日本山口支店", "phone": "116", "address": "山口市中河原町4-1", "hours": "平日 9:00-17:00", "services": ["電話工事", "故障修理"]}],
+                "下水道": [{"name": "下関市上下水道局", "phone": "083-231-1309", "address": "下関市南部町1-1", "hours": "平日 8:30-17:15", "services": ["下水道修理", "排水設備"]}]
+            }
+        },
+        "宇部市": {
+            "": {
+                "労基署": [{"name": "宇部労働基準監督署", "phone": "0836-31-1211", "address": "宇部市琴芝町1-2-46", "hours": "平日 8:30-17:15", "services": ["労働相談", "労災申請"]}],
+                "警察署": [{"name": "宇部警察署", "phone": "0836-21-0110", "address": "宇部市琴芝町1-2-46", "hours": "24時間", "services": ["事件事故", "遺失物"]}],
+                "市区町村役所": [{"name": "宇部市役所", "phone": "0836-31-4111", "address": "宇部市常盤町1-7-1", "hours": "平日 8:30-17:15", "services": ["住民票", "戸籍"]}],
+                "消防署": [{"name": "宇部市消防本部", "phone": "0836-21-7599", "address": "宇部市琴芝町1-2-18", "hours": "24時間", "services": ["火災通報", "救急車"]}],
+                "ガス": [{"name": "宇部ガス", "phone": "0836-31-3111", "address": "宇部市相生町8-1", "hours": "平日 8:30-17:00", "services": ["ガス開栓", "緊急通報"]}],
+                "電力": [{"name": "中国電力宇部営業所", "phone": "0120-211-777", "address": "宇部市常盤町1-6-18", "hours": "平日 9:00-17:00", "services": ["停電情報", "電気工事"]}],
+                "病院": [{"name": "山口大学医学部附属病院", "phone": "0836-22-2111", "address": "宇部市南小串1-1-1", "hours": "24時間救急", "services": ["総合診療", "救急医療"]}],
+                "保健所": [{"name": "山口県宇部健康福祉センター", "phone": "0836-31-3200", "address": "宇部市琴芝町1-1-50", "hours": "平日 8:30-17:15", "services": ["健康相談", "予防接種"]}],
+                "水道": [{"name": "宇部市上下水道局", "phone": "0836-21-2171", "address": "宇部市常盤町1-7-1", "hours": "平日 8:30-17:15", "services": ["水道開栓", "料金"]}],
+                "NTT": [{"name": "NTT西日本山口支店", "phone": "116", "address": "山口市中河原町4-1", "hours": "平日 9:00-17:00", "services": ["電話工事", "故障修理"]}],
+                "下水道": [{"name": "宇部市上下水道局", "phone": "0836-21-2171", "address": "宇部市常盤町1-7-1", "hours": "平日 8:30-17:15", "services": ["下水道修理", "排水設備"]}]
+            }
+        },
+        "萩市": {
+            "": {
+                "労基署": [{"name": "萩労働基準監督署", "phone": "0838-22-0685", "address": "萩市江向河添沖田531-1", "hours": "平日 8:30-17:15", "services": ["労働相談", "労災申請"]}],
+                "警察署": [{"name": "萩警察署", "phone": "0838-26-0110", "address": "萩市江向602-8", "hours": "24時間", "services": ["事件事故", "遺失物"]}],
+                "市区町村役所": [{"name": "萩市役所", "phone": "0838-22-3111", "address": "萩市大字江向510", "hours": "平日 8:30-17:15", "services": ["住民票", "戸籍"]}],
+                "消防署": [{"name": "萩市消防本部", "phone": "0838-25-4131", "address": "萩市江向河添沖田547-1", "hours": "24時間", "services": ["火災通報", "救急車"]}],
+                "ガス": [{"name": "萩ガス", "phone": "0838-22-1515", "address": "萩市江向459-2", "hours": "平日 8:30-17:00", "services": ["ガス開栓", "緊急通報"]}],
+                "電力": [{"name": "中国電力萩営業所", "phone": "0120-211-777", "address": "萩市江向384-1", "hours": "平日 9:00-17:00", "services": ["停電情報", "電気工事"]}],
+                "病院": [{"name": "萩市民病院", "phone": "0838-22-0306", "address": "萩市大字椿東山王2568", "hours": "24時間救急", "services": ["総合診療", "救急医療"]}],
+                "保健所": [{"name": "山口県萩健康福祉センター", "phone": "0838-25-2667", "address": "萩市江向河添沖田531-1", "hours": "平日 8:30-17:15", "services": ["健康相談", "予防接種"]}],
+                "水道": [{"name": "萩市上下水道局", "phone": "0838-25-3321", "address": "萩市大字江向510", "hours": "平日 8:30-17:15", "services": ["水道開栓", "料金"]}],
+                "NTT": [{"name": "NTT西日本山口支店", "phone": "116", "address": "山口市中河原町4-1", "hours": "平日 9:00-17:00", "services": ["電話工事", "故障修理"]}],
+                "下水道": [{"name": "萩市上下水道局", "phone": "0838-25-3321", "address": "萩市大字江向510", "hours": "平日 8:30-17:15", "services": ["下水道修理", "排水設備"]}]
+            }
+        },
+        "防府市": {
+            "": {
+                "労基署": [{"name": "防府労働基準監督署", "phone": "0835-22-2716", "address": "防府市駅南町9-33", "hours": "平日 8:30-17:15", "services": ["労働相談", "労災申請"]}],
+                "警察署": [{"name": "防府警察署", "phone": "0835-22-0110", "address": "防府市駅南町15-1", "hours": "24時間", "services": ["事件事故", "遺失物"]}],
+                "市区町村役所": [{"name": "防府市役所", "phone": "0835-23-2111", "address": "防府市寿町7-1", "hours": "平日 8:30-17:15", "services": ["住民票", "戸籍"]}],
+                "消防署": [{"name": "防府市消防本部", "phone": "0835-25-7999", "address": "防府市駅南町15-40", "hours": "24時間", "services": ["火災通報", "救急車"]}],
+                "ガス": [{"name": "防府ガス", "phone": "0835-22-1357", "address": "防府市駅南町4-15", "hours": "平日 8:30-17:00", "services": ["ガス開栓", "緊急通報"]}],
+                "電力": [{"name": "中国電力防府営業所", "phone": "0120-211-777", "address": "防府市栄町2-4-1", "hours": "平日 9:00-17:00", "services": ["停電情報", "電気工事"]}],
+                "病院": [{"name": "防府胃腸病院", "phone": "0835-22-3339", "address": "防府市駅南町14-33", "hours": "平日 9:00-17:00", "services": ["胃腸科", "外科"]}],
+                "保健所": [{"name": "山口県防府健康福祉センター", "phone": "0835-22-3631", "address": "防府市駅南町13-40", "hours": "平日 8:30-17:15", "services": ["健康相談", "予防接種"]}],
+                "水道": [{"name": "防府市上下水道局", "phone": "0835-25-2294", "address": "防府市寿町7-1", "hours": "平日 8:30-17:15", "services": ["水道開栓", "料金"]}],
+                "NTT": [{"name": "NTT西日本山口支店", "phone": "116", "address": "山口市中河原町4-1", "hours": "平日 9:00-17:00", "services": ["電話工事", "故障修理"]}],
+                "下水道": [{"name": "防府市上下水道局", "phone": "0835-25-2294", "address": "防府市寿町7-1", "hours": "平日 8:30-17:15", "services": ["下水道修理", "排水設備"]}]
+            }
+        },
+        "周南市": {
+            "": {
+                "労基署": [{"name": "周南労働基準監督署", "phone": "0834-21-4795", "address": "周南市築港町8-1", "hours": "平日 8:30-17:15", "services": ["労働相談", "労災申請"]}],
+                "警察署": [{"name": "周南警察署", "phone": "0834-21-0110", "address": "周南市築港町8-33", "hours": "24時間", "services": ["事件事故", "遺失物"]}],
+                "市区町村役所": [{"name": "周南市役所", "phone": "0834-22-8211", "address": "周南市岐山通1-1", "hours": "平日 8:30-17:15", "services": ["住民票", "戸籍"]}],
+                "消防署": [{"name": "周南市消防本部", "phone": "0834-23-2345", "address": "周南市築港町8-33", "hours": "24時間", "services": ["火災通報", "救急車"]}],
+                "ガス": [{"name": "山口合同ガス周南営業所", "phone": "0834-31-4646", "address": "周南市みなみ銀座2-28", "hours": "平日 8:30-17:00", "services": ["ガス開栓", "緊急通報"]}],
+                "電力": [{"name": "中国電力周南営業所", "phone": "0120-211-777", "address": "周南市築港町8-1", "hours": "平日 9:00-17:00", "services": ["停電情報", "電気工事"]}],
+                "病院": [{"name": "周南市立新南陽市民病院", "phone": "0834-61-2500", "address": "周南市宮の前2-3-15", "hours": "24時間救急", "services": ["総合診療", "救急医療"]}],
+                "保健所": [{"name": "山口県周南健康福祉センター", "phone": "0834-33-6423", "address": "周南市築港町6-28", "hours": "平日 8:30-17:15", "services": ["健康相談", "予防接種"]}],
+                "水道": [{"name": "周南市上下水道局", "phone": "0834-22-8572", "address": "周南市岐山通1-1", "hours": "平日 8:30-17:15", "services": ["水道開栓", "料金"]}],
+                "NTT": [{"name": "NTT西日本山口支店", "phone": "116", "address": "山口市中河原町4-1", "hours": "平日 9:00-17:00", "services": ["電話工事", "故障修理"]}],
+                "下水道": [{"name": "周南市上下水道局", "phone": "0834-22-8579", "address": "周南市岐山通1-1", "hours": "平日 8:30-17:15", "services": ["下水道修理", "排水設備"]}]
+            }
+        },
+        "岩国市": {
+            "": {
+                "労基署": [{"name": "岩国労働基準監督署", "phone": "0827-21-3246", "address": "岩国市麻里布町2-3-5", "hours": "平日 8:30-17:15", "services": ["労働相談", "労災申請"]}],
+                "警察署": [{"name": "岩国警察署", "phone": "0827-21-0110", "address": "岩国市麻里布町2-1-10", "hours": "24時間", "services": ["事件事故", "遺失物"]}],
+                "市区町村役所": [{"name": "岩国市役所", "phone": "0827-29-5000", "address": "岩国市今津町1-14-51", "hours": "平日 8:30-17:15", "services": ["住民票", "戸籍"]}],
+                "消防署": [{"name": "岩国地区消防組合", "phone": "0827-21-2555", "address": "岩国市麻里布町2-1-10", "hours": "24時間", "services": ["火災通報", "救急車"]}],
+                "ガス": [{"name": "岩国ガス", "phone": "0827-21-3966", "address": "岩国市麻里布町3-2-28", "hours": "平日 8:30-17:00", "services": ["ガス開栓", "緊急通報"]}],
+                "電力": [{"name": "中国電力岩国営業所", "phone": "0120-211-777", "address": "岩国市麻里布町2-6-25", "hours": "平日 9:00-17:00", "services": ["停電情報", "電気工事"]}],
+                "病院": [{"name": "岩国医療センター", "phone": "0827-34-1000", "address": "岩国市愛宕町1-1-1", "hours": "24時間救急", "services": ["総合診療", "救急医療"]}],
+                "保健所": [{"name": "山口県岩国健康福祉センター", "phone": "0827-29-1518", "address": "岩国市麻里布町2-6-25", "hours": "平日 8:30-17:15", "services": ["健康相談", "予防接種"]}],
+                "水道": [{"name": "岩国市水道局", "phone": "0827-32-1472", "address": "岩国市今津町1-14-51", "hours": "平日 8:30-17:15", "services": ["水道開栓", "料金"]}],
+                "NTT": [{"name": "NTT西日本山口支店", "phone": "116", "address": "山口市中河原町4-1", "hours": "平日 9:00-17:00", "services": ["電話工事", "故障修理"]}],
+                "下水道": [{"name": "岩国市下水道課", "phone": "0827-29-5190", "address": "岩国市今津町1-14-51", "hours": "平日 8:30-17:15", "services": ["下水道修理", "排水設備"]}]
+            }
+        },
+        "光市": {
+            "": {
+                "労基署": [{"name": "周南労働基準監督署光分室", "phone": "0833-71-0580", "address": "光市中央6-1-1", "hours": "平日 8:30-17:15", "services": ["労働相談", "労災申請"]}],
+                "警察署": [{"name": "光警察署", "phone": "0833-72-0110", "address": "光市中央6-1-1", "hours": "24時間", "services": ["事件事故", "遺失物"]}],
+                "市区町村役所": [{"name": "光市役所", "phone": "0833-72-1400", "address": "光市中央6-1-1", "hours": "平日 8:30-17:15", "services": ["住民票", "戸籍"]}],
+                "消防署": [{"name": "光市消防本部", "phone": "0833-72-5646", "address": "光市中央5-1-1", "hours": "24時間", "services": ["火災通報", "救急車"]}],
+                "ガス": [{"name": "光ガス", "phone": "0833-72-0983", "address": "光市虹ケ浜2-10-1", "hours": "平日 8:30-17:00", "services": ["ガス開栓", "緊急通報"]}],
+                "電力": [{"name": "中国電力光営業所", "phone": "0120-211-777", "address": "光市中央3-2-1", "hours": "平日 9:00-17:00", "services": ["停電情報", "電気工事"]}],
+                "病院": [{"name": "光市立光総合病院", "phone": "0833-72-1000", "address": "光市虹ケ浜2-10-1", "hours": "24時間救急", "services": ["総合診療", "救急医療"]}],
+                "保健所": [{"name": "山口県周南健康福祉センター", "phone": "0834-33-6423", "address": "周南市築港町6-28", "hours": "平日 8:30-17:15", "services": ["健康相談", "予防接種"]}],
+                "水道": [{"name": "光市上下水道局", "phone": "0833-72-1473", "address": "光市中央6-1-1", "hours": "平日 8:30-17:15", "services": ["水道開栓", "料金"]}],
+                "NTT": [{"name": "NTT西日本山口支店", "phone": "116", "address": "山口市中河原町4-1", "hours": "平日 9:00-17:00", "services": ["電話工事", "故障修理"]}],
+                "下水道": [{"name": "光市上下水道局", "phone": "0833-72-1473", "address": "光市中央6-1-1", "hours": "平日 8:30-17:15", "services": ["下水道修理", "排水設備"]}]
+            }
+        },
+        "長門市": {
+            "": {
+                "労基署": [{"name": "萩労働基準監督署長門分室", "phone": "0837-22-2323", "address": "長門市東深川1324-1", "hours": "平日 8:30-17:15", "services": ["労働相談", "労災申請"]}],
+                "警察署": [{"name": "長門警察署", "phone": "0837-22-0110", "address": "長門市東深川1334-8", "hours": "24時間", "services": ["事件事故", "遺失物"]}],
+                "市区町村役所": [{"name": "長門市役所", "phone": "0837-23-1111", "address": "長門市東深川1339-2", "hours": "平日 8:30-17:15", "services": ["住民票", "戸籍"]}],
+                "消防署": [{"name": "長門市消防本部", "phone": "0837-26-1199", "address": "長門市東深川1334-4", "hours": "24時間", "services": ["火災通報", "救急車"]}],
+                "ガス": [{"name": "長門ガス", "phone": "0837-22-2704", "address": "長門市東深川正明市1061-88", "hours": "平日 8:30-17:00", "services": ["ガス開栓", "緊急通報"]}],
+                "電力": [{"name": "中国電力長門営業所", "phone": "0120-211-777", "address": "長門市東深川1324-1", "hours": "平日 9:00-17:00", "services": ["停電情報", "電気工事"]}],
+                "病院": [{"name": "長門総合病院", "phone": "0837-22-2220", "address": "長門市東深川85", "hours": "24時間救急", "services": ["総合診療", "救急医療"]}],
+                "保健所": [{"name": "山口県萩健康福祉センター", "phone": "0838-25-2667", "address": "萩市江向河添沖田531-1", "hours": "平日 8:30-17:15", "services": ["健康相談", "予防接種"]}],
+                "水道": [{"name": "長門市上下水道局", "phone": "0837-23-1262", "address": "長門市東深川1339-2", "hours": "平日 8:30-17:15", "services": ["水道開栓", "料金"]}],
+                "NTT": [{"name": "NTT西日本山口支店", "phone": "116", "address": "山口市中河原町4-1", "hours": "平日 9:00-17:00", "services": ["電話工事", "故障修理"]}],
+                "下水道": [{"name": "長門市上下水道局", "phone": "0837-23-1262", "address": "長門市東深川1339-2", "hours": "平日 8:30-17:15", "services": ["下水道修理", "排水設備"]}]
+            }
+        },
+        "柳井市": {
+            "": {
+                "労基署": [{"name": "岩国労働基準監督署柳井分室", "phone": "0820-22-2530", "address": "柳井市南町3-9-3", "hours": "平日 8:30-17:15", "services": ["労働相談", "労災申請"]}],
+                "警察署": [{"name": "柳井警察署", "phone": "0820-23-0110", "address": "柳井市南町3-9-8", "hours": "24時間", "services": ["事件事故", "遺失物"]}],
+                "市区町村役所": [{"name": "柳井市役所", "phone": "0820-22-2111", "address": "柳井市南町1-10-2", "hours": "平日 8:30-17:15", "services": ["住民票", "戸籍"]}],
+                "消防署": [{"name": "柳井地区広域消防組合", "phone": "0820-23-7774", "address": "柳井市南町3-9-8", "hours": "24時間", "services": ["火災通報", "救急車"]}],
+                "ガス": [{"name": "柳井ガス", "phone": "0820-22-1422", "address": "柳井市中央2-8-17", "hours": "平日 8:30-17:00", "services": ["ガス開栓", "緊急通報"]}],
+                "電力": [{"name": "中国電力柳井営業所", "phone": "0120-211-777", "address": "柳井市南町3-5-8", "hours": "平日 9:00-17:00", "services": ["停電情報", "電気工事"]}],
+                "病院": [{"name": "周東総合病院", "phone": "0820-22-3456", "address": "柳井市古開作1000-1", "hours": "24時間救急", "services": ["総合診療", "救急医療"]}],
+                "保健所": [{"name": "山口県柳井健康福祉センター", "phone": "0820-22-3631", "address": "柳井市南町1-10-3", "hours": "平日 8:30-17:15", "services": ["健康相談", "予防接種"]}],
+                "水道": [{"name": "柳井市水道局", "phone": "0820-22-2111", "address": "柳井市南町1-10-2", "hours": "平日 8:30-17:15", "services": ["水道開栓", "料金"]}],
+                "NTT": [{"name": "NTT西日本山口支店", "phone": "116", "address": "山口市中河原町4-1", "hours": "平日 9:00-17:00", "services": ["電話工事", "故障修理"]}],
+                "下水道": [{"name": "柳井市上下水道局", "phone": "0820-22-2111", "address": "柳井市南町1-10-2", "hours": "平日 8:30-17:15", "services": ["下水道修理", "排水設備"]}]
+            }
+        },
+        "美祢市": {
+            "": {
+                "労基署": [{"name": "宇部労働基準監督署美祢分室", "phone": "0837-52-1251", "address": "美祢市大嶺町東分315-11", "hours": "平日 8:30-17:15", "services": ["労働相談", "労災申請"]}],
+                "警察署": [{"name": "美祢警察署", "phone": "0837-52-0110", "address": "美祢市大嶺町東分315-7", "hours": "24時間", "services": ["事件事故", "遺失物"]}],
+                "市区町村役所": [{"name": "美祢市役所", "phone": "0837-52-1110", "address": "美祢市大嶺町東分326-1", "hours": "平日 8:30-17:15", "services": ["住民票", "戸籍"]}],
+                "消防署": [{"name": "美祢市消防本部", "phone": "0837-54-0119", "address": "美祢市大嶺町東分315-15", "hours": "24時間", "services": ["火災通報", "救急車"]}],
+                "ガス": [{"name": "美祢ガス", "phone": "0837-52-0178", "address": "美祢市大嶺町東分279-2", "hours": "平日 8:30-17:00", "services": ["ガス開栓", "緊急通報"]}],
+                "電力": [{"name": "中国電力美祢営業所", "phone": "0120-211-777", "address": "美祢市大嶺町東分315-11", "hours": "平日 9:00-17:00", "services": ["停電情報", "電気工事"]}],
+                "病院": [{"name": "美祢市立病院", "phone": "0837-52-1155", "address": "美祢市大嶺町東分758-3", "hours": "平日 8:30-17:00", "services": ["総合診療", "内科"]}],
+                "保健所": [{"name": "山口県宇部健康福祉センター", "phone": "0836-31-3200", "address": "宇部市琴芝町1-1-50", "hours": "平日 8:30-17:15", "services": ["健康相談", "予防接種"]}],
+                "水道": [{"name": "美祢市上下水道局", "phone": "0837-52-5227", "address": "美祢市大嶺町東分326-1", "hours": "平日 8:30-17:15", "services": ["水道開栓", "料金"]}],
+                "NTT": [{"name": "NTT西日本山口支店", "phone": "116", "address": "山口市中河原町4-1", "hours": "平日 9:00-17:00", "services": ["電話工事", "故障修理"]}],
+                "下水道": [{"name": "美祢市上下水道局", "phone": "0837-52-5227", "address": "美祢市大嶺町東分326-1", "hours": "平日 8:30-17:15", "services": ["下水道修理", "排水設備"]}]
+            }
+        },
+        "下松市": {
+            "": {
+                "労基署": [{"name": "周南労働基準監督署", "phone": "0834-21-4795", "address": "周南市築港町8-1", "hours": "平日 8:30-17:15", "services": ["労働相談", "労災申請"]}],
+                "警察署": [{"name": "下松警察署", "phone": "0833-44-0110", "address": "下松市中央町21-3", "hours": "24時間", "services": ["事件事故", "遺失物"]}],
+                "市区町村役所": [{"name": "下松市役所", "phone": "0833-45-1700", "address": "下松市大手町3-3-3", "hours": "平日 8:30-17:15", "services": ["住民票", "戸籍"]}],
+                "消防署": [{"name": "下松市消防本部", "phone": "0833-45-1792", "address": "下松市中央町21-15", "hours": "24時間", "services": ["火災通報", "救急車"]}],
+                "ガス": [{"name": "下松ガス", "phone": "0833-41-0178", "address": "下松市栄町1-4-8", "hours": "平日 8:30-17:00", "services": ["ガス開栓", "緊急通報"]}],
+                "電力": [{"name": "中国電力下松営業所", "phone": "0120-211-777", "address": "下松市中央町21-1", "hours": "平日 9:00-17:00", "services": ["停電情報", "電気工事"]}],
+                "病院": [{"name": "下松市立市民病院", "phone": "0833-41-2030", "address": "下松市西豊井1180-1", "hours": "24時間救急", "services": ["総合診療", "救急医療"]}],
+                "保健所": [{"name": "山口県周南健康福祉センター", "phone": "0834-33-6423", "address": "周南市築港町6-28", "hours": "平日 8:30-17:15", "services": ["健康相談", "予防接種"]}],
+                "水道": [{"name": "下松市上下水道局", "phone": "0833-45-1829", "address": "下松市大手町3-3-3", "hours": "平日 8:30-17:15", "services": ["水道開栓", "料金"]}],
+                "NTT": [{"name": "NTT西日本山口支店", "phone": "116", "address": "山口市中河原町4-1", "hours": "平日 9:00-17:00", "services": ["電話工事", "故障修理"]}],
+                "下水道": [{"name": "下松市上下水道局", "phone": "0833-45-1829", "address": "下松市大手町3-3-3", "hours": "平日 8:30-17:15", "services": ["下水道修理", "排水設備"]}]
+            }
+        },
+        "山陽小野田市": {
+            "": {
+                "労基署": [{"name": "宇部労働基準監督署", "phone": "0836-31-1211", "address": "宇部市琴芝町1-2-46", "hours": "平日 8:30-17:15", "services": ["労働相談", "労災申請"]}],
+                "警察署": [{"name": "山陽小野田警察署", "phone": "0836-84-0110", "address": "山陽小野田市中川6-4-1", "hours": "24時間", "services": ["事件事故", "遺失物"]}],
+                "市区町村役所": [{"name": "山陽小野田市役所", "phone": "0836-82-1111", "address": "山陽小野田市日の出1-1-1", "hours": "平日 8:30-17:15", "services": ["住民票", "戸籍"]}],
+                "消防署": [{"name": "山陽小野田市消防本部", "phone": "0836-83-2702", "address": "山陽小野田市中川6-4-1", "hours": "24時間", "services": ["火災通報", "救急車"]}],
+                "ガス": [{"name": "山陽小野田ガス", "phone": "0836-83-2111", "address": "山陽小野田市栄町9-25", "hours": "平日 8:30-17:00", "services": ["ガス開栓", "緊急通報"]}],
+                "電力": [{"name": "中国電力小野田営業所", "phone": "0120-211-777", "address": "山陽小野田市中川6-2-15", "hours": "平日 9:00-17:00", "services": ["停電情報", "電気工事"]}],
+                "病院": [{"name": "山陽小野田市民病院", "phone": "0836-83-2355", "address": "山陽小野田市東高泊1863-1", "hours": "24時間救急", "services": ["総合診療", "救急医療"]}],
+                "保健所": [{"name": "山口県宇部健康福祉センター", "phone": "0836-31-3200", "address": "宇部市琴芝町1-1-50", "hours": "平日 8:30-17:15", "services": ["健康相談", "予防接種"]}],
+                "水道": [{"name": "山陽小野田市公営企業局", "phone": "0836-82-1168", "address": "山陽小野田市日の出1-1-1", "hours": "平日 8:30-17:15", "services": ["水道開栓", "料金"]}],
+                "NTT": [{"name": "NTT西日本山口支店", "phone": "116", "address": "山口市中河原町4-1", "hours": "平日 9:00-17:00", "services": ["電話工事", "故障修理"]}],
+                "下水道": [{"name": "山陽小野田市公営企業局", "phone": "0836-82-1168", "address": "山陽小野田市日の出1-1-1", "hours": "平日 8:30-17:15", "services": ["下水道修理", "排水設備"]}]
+            }
+        },
+        "周防大島町": {
+            "": {
+                "労基署": [{"name": "柳井労働基準監督署", "phone": "0820-22-3654", "address": "柳井市南町1-6-7", "hours": "平日 8:30-17:15", "services": ["労働相談", "労災申請"]}],
+                "警察署": [{"name": "大島警察署", "phone": "0820-74-0110", "address": "大島郡周防大島町大字久賀5066-1", "hours": "24時間", "services": ["事件事故", "遺失物"]}],
+                "市区町村役所": [
+                    {"name": "周防大島町役場", "phone": "0820-74-1000", "address": "大島郡周防大島町大字久賀10650-1", "hours": "平日 8:30-17:15", "services": ["住民票", "戸籍"]},
+                    {"name": "周防大島町環境生活課", "phone": "0820-79-1001", "address": "大島郡周防大島町大字久賀10650-1", "hours": "平日 8:30-17:15", "services": ["ごみ収集", "リサイクル", "環境対策"]}
+                ],
+                "消防署": [{"name": "大島地区消防組合", "phone": "0820-74-0119", "address": "大島郡周防大島町大字久賀5113", "hours": "24時間", "services": ["火災通報", "救急車"]}],
+                "ガス": [{"name": "周防大島ガス協会", "phone": "0820-74-2941", "address": "大島郡周防大島町大字久賀5066", "hours": "平日 8:30-17:00", "services": ["ガス開栓", "緊急通報"]}],
+                "電力": [{"name": "中国電力柳井営業所", "phone": "0120-211-777", "address": "柳井市南町2-4-14", "hours": "平日 9:00-17:00", "services": ["停電情報", "電気工事"]}],
+                "病院": [{"name": "周防大島町立橘医院", "phone": "0820-77-0397", "address": "大島郡周防大島町大字西安下庄2757-4", "hours": "平日 8:30-17:00", "services": ["内科", "外科"]}],
+                "保健所": [{"name": "山口県柳井健康福祉センター", "phone": "0820-22-3631", "address": "柳井市南町1-10-3", "hours": "平日 8:30-17:15", "services": ["健康相談", "予防接種"]}],
+                "水道": [{"name": "周防大島町上下水道課", "phone": "0820-79-1003", "address": "大島郡周防大島町大字久賀10650-1", "hours": "平日 8:30-17:15", "services": ["水道開栓", "料金"]}],
+                "NTT": [{"name": "NTT西日本山口支店", "phone": "116", "address": "山口市中河原町4-1", "hours": "平日 9:00-17:00", "services": ["電話工事", "故障修理"]}],
+                "下水道": [{"name": "周防大島町上下水道課", "phone": "0820-79-1003", "address": "大島郡周防大島町大字久賀10650-1", "hours": "平日 8:30-17:15", "services": ["下水道修理", "排水設備"]}]
+            }
+        },
+        "和木町": {
+            "": {
+                "労基署": [{"name": "岩国労働基準監督署", "phone": "0827-24-2171", "address": "岩国市麻里布町2-6-25", "hours": "平日 8:30-17:15", "services": ["労働相談", "労災申請"]}],
+                "警察署": [{"name": "岩国警察署和木交番", "phone": "0827-52-2004", "address": "玖珂郡和木町和木2-1-1", "hours": "24時間", "services": ["事件事故", "遺失物"]}],
+                "市区町村役所": [
+                    {"name": "和木町役場", "phone": "0827-52-2135", "address": "玖珂郡和木町和木1-1-1", "hours": "平日 8:30-17:15", "services": ["住民票", "戸籍"]},
+                    {"name": "和木町住民サービス課", "phone": "0827-52-5810", "address": "玖珂郡和木町和木1-1-1", "hours": "平日 8:30-17:15", "services": ["ごみ収集", "リサイクル", "環境対策"]}
+                ],
+                "消防署": [{"name": "玖珂地区消防組合和木分署", "phone": "0827-52-0119", "address": "玖珂郡和木町和木2-1-31", "hours": "24時間", "services": ["火災通報", "救急車"]}],
+                "ガス": [{"name": "岩谷産業和木営業所", "phone": "0827-53-2941", "address": "玖珂郡和木町和木6-1-2", "hours": "平日 8:30-17:00", "services": ["ガス開栓", "緊急通報"]}],
+                "電力": [{"name": "中国電力岩国営業所", "phone": "0120-211-777", "address": "岩国市麻里布町2-6-25", "hours": "平日 9:00-17:00", "services": ["停電情報", "電気工事"]}],
+                "病院": [{"name": "和木町国民健康保険診療所", "phone": "0827-52-2662", "address": "玖珂郡和木町和木1-1-23", "hours": "平日 8:30-17:00", "services": ["内科", "小児科"]}],
+                "保健所": [{"name": "山口県岩国健康福祉センター", "phone": "0827-29-1518", "address": "岩国市麻里布町2-6-25", "hours": "平日 8:30-17:15", "services": ["健康相談", "予防接種"]}],
+                "水道": [{"name": "和木町上下水道課", "phone": "0827-52-2135", "address": "玖珂郡和木町和木1-1-1", "hours": "平日 8:30-17:15", "services": ["水道開栓", "料金"]}],
+                "NTT": [{"name": "NTT西日本山口支店", "phone": "116", "address": "山口市中河原町4-1", "hours": "平日 9:00-17:00", "services": ["電話工事", "故障修理"]}],
+                "下水道": [{"name": "和木町上下水道課", "phone": "0827-52-2135", "address": "玖珂郡和木町和木1-1-1", "hours": "平日 8:30-17:15", "services": ["下水道修理", "排水設備"]}]
+            }
+        },
+        "上関町": {
+            "": {
+                "労基署": [{"name": "柳井労働基準監督署", "phone": "0820-22-3654", "address": "柳井市南町1-6-7", "hours": "平日 8:30-17:15", "services": ["労働相談", "労災申請"]}],
+                "警察署": [{"name": "熊毛警察署上関駐在所", "phone": "0820-62-0004", "address": "熊毛郡上関町長島503", "hours": "平日 8:30-17:15", "services": ["事件事故", "遺失物"]}],
+                "市区町村役所": [
+                    {"name": "上関町役場", "phone": "0820-62-0316", "address": "熊毛郡上関町長島503", "hours": "平日 8:30-17:15", "services": ["住民票", "戸籍"]},
+                    {"name": "上関町町民課", "phone": "0820-62-0314", "address": "熊毛郡上関町長島503", "hours": "平日 8:30-17:15", "services": ["ごみ収集", "リサイクル", "環境対策"]}
+                ],
+                "消防署": [{"name": "熊毛地区消防組合上関分署", "phone": "0820-62-0119", "address": "熊毛郡上関町長島895-13", "hours": "24時間", "services": ["火災通報", "救急車"]}],
+                "ガス": [{"name": "上関町ガス事業協同組合", "phone": "0820-62-1234", "address": "熊毛郡上関町長島503", "hours": "平日 8:30-17:00", "services": ["ガス開栓", "緊急通報"]}],
+                "電力": [{"name": "中国電力柳井営業所", "phone": "0120-211-777", "address": "柳井市南町2-4-14", "hours": "平日 9:00-17:00", "services": ["停電情報", "電気工事"]}],
+                "病院": [{"name": "上関町国民健康保険上関病院", "phone": "0820-62-0621", "address": "熊毛郡上関町長島731", "hours": "平日 8:30-17:00", "services": ["内科", "外科"]}],
+                "保健所": [{"name": "山口県柳井健康福祉センター", "phone": "0820-22-3631", "address": "柳井市南町1-10-3", "hours": "平日 8:30-17:15", "services": ["健康相談", "予防接種"]}],
+                "水道": [{"name": "上関町水道課", "phone": "0820-62-0316", "address": "熊毛郡上関町長島503", "hours": "平日 8:30-17:15", "services": ["水道開栓", "料金"]}],
+                "NTT": [{"name": "NTT西日本山口支店", "phone": "116", "address": "山口市中河原町4-1", "hours": "平日 9:00-17:00", "services": ["電話工事", "故障修理"]}],
+                "下水道": [{"name": "上関町水道課", "phone": "0820-62-0316", "address": "熊毛郡上関町長島503", "hours": "平日 8:30-17:15", "services": ["下水道修理", "排水設備"]}]
+            }
+        },
+        "田布施町": {
+            "": {
+                "労基署": [{"name": "柳井労働基準監督署", "phone": "0820-22-3654", "address": "柳井市南町1-6-7", "hours": "平日 8:30-17:15", "services": ["労働相談", "労災申請"]}],
+                "警察署": [{"name": "柳井警察署田布施交番", "phone": "0820-52-2004", "address": "熊毛郡田布施町中央南2-1", "hours": "24時間", "services": ["事件事故", "遺失物"]}],
+                "市区町村役所": [
+                    {"name": "田布施町役場", "phone": "0820-52-5803", "address": "熊毛郡田布施町下田布施3440-1", "hours": "平日 8:30-17:15", "services": ["住民票", "戸籍"]},
+                    {"name": "田布施町町民福祉課", "phone": "0820-52-5812", "address": "熊毛郡田布施町下田布施3440-1", "hours": "平日 8:30-17:15", "services": ["ごみ収集", "リサイクル", "環境対策"]}
+                ],
+                "消防署": [{"name": "熊毛地区消防組合田布施分署", "phone": "0820-52-0119", "address": "熊毛郡田布施町下田布施3167-1", "hours": "24時間", "services": ["火災通報", "救急車"]}],
+                "ガス": [{"name": "田布施ガス協会", "phone": "0820-52-3941", "address": "熊毛郡田布施町中央南2-3-5", "hours": "平日 8:30-17:00", "services": ["ガス開栓", "緊急通報"]}],
+                "電力": [{"name": "中国電力柳井営業所", "phone": "0120-211-777", "address": "柳井市南町2-4-14", "hours": "平日 9:00-17:00", "services": ["停電情報", "電気工事"]}],
+                "病院": [{"name": "田布施町立国民健康保険田布施総合病院", "phone": "0820-52-2171", "address": "熊毛郡田布施町下田布施2071", "hours": "24時間救急", "services": ["内科", "外科"]}],
+                "保健所": [{"name": "山口県柳井健康福祉センター", "phone": "0820-22-3631", "address": "柳井市南町1-10-3", "hours": "平日 8:30-17:15", "services": ["健康相談", "予防接種"]}],
+                "水道": [{"name": "田布施町上下水道課", "phone": "0820-52-5807", "address": "熊毛郡田布施町下田布施3440-1", "hours": "平日 8:30-17:15", "services": ["水道開栓", "料金"]}],
+                "NTT": [{"name": "NTT西日本山口支店", "phone": "116", "address": "山口市中河原町4-1", "hours": "平日 9:00-17:00", "services": ["電話工事", "故障修理"]}],
+                "下水道": [{"name": "田布施町上下水道課", "phone": "0820-52-5807", "address": "熊毛郡田布施町下田布施3440-1", "hours": "平日 8:30-17:15", "services": ["下水道修理", "排水設備"]}]
+            }
+        },
+        "平生町": {
+            "": {
+                "労基署": [{"name": "柳井労働基準監督署", "phone": "0820-22-3654", "address": "柳井市南町1-6-7", "hours": "平日 8:30-17:15", "services": ["労働相談", "労災申請"]}],
+                "警察署": [{"name": "柳井警察署平生交番", "phone": "0820-56-2004", "address": "熊毛郡平生町平生町210-1", "hours": "24時間", "services": ["事件事故", "遺失物"]}],
+                "市区町村役所": [
+                    {"name": "平生町役場", "phone": "0820-56-7111", "address": "熊毛郡平生町平生町210-1", "hours": "平日 8:30-17:15", "services": ["住民票", "戸籍"]},
+                    {"name": "平生町町民課", "phone": "0820-56-7115", "address": "熊毛郡平生町平生町210-1", "hours": "平日 8:30-17:15", "services": ["ごみ収集", "リサイクル", "環境対策"]}
+                ],
+                "消防署": [{"name": "熊毛地区消防組合平生分署", "phone": "0820-56-0119", "address": "熊毛郡平生町平生町278-3", "hours": "24時間", "services": ["火災通報", "救急車"]}],
+                "ガス": [{"name": "平生ガス協会", "phone": "0820-56-2941", "address": "熊毛郡平生町平生町285-6", "hours": "平日 8:30-17:00", "services": ["ガス開栓", "緊急通報"]}],
+                "電力": [{"name": "中国電力柳井営業所", "phone": "0120-211-777", "address": "柳井市南町2-4-14", "hours": "平日 9:00-17:00", "services": ["停電情報", "電気工事"]}],
+                "病院": [{"name": "平生町立病院", "phone": "0820-56-2882", "address": "熊毛郡平生町平生町368", "hours": "平日 8:30-17:00", "services": ["内科", "外科"]}],
+                "保健所": [{"name": "山口県柳井健康福祉センター", "phone": "0820-22-3631", "address": "柳井市南町1-10-3", "hours": "平日 8:30-17:15", "services": ["健康相談", "予防接種"]}],
+                "水道": [{"name": "平生町上下水道課", "phone": "0820-56-7117", "address": "熊毛郡平生町平生町210-1", "hours": "平日 8:30-17:15", "services": ["水道開栓", "料金"]}],
+                "NTT": [{"name": "NTT西日本山口支店", "phone": "116", "address": "山口市中河原町4-1", "hours": "平日 9:00-17:00", "services": ["電話工事", "故障修理"]}],
+                "下水道": [{"name": "平生町上下水道課", "phone": "0820-56-7117", "address": "熊毛郡平生町平生町210-1", "hours": "平日 8:30-17:15", "services": ["下水道修理", "排水設備"]}]
+            }
+        },
+        "阿武町": {
+            "": {
+                "労基署": [{"name": "萩労働基準監督署", "phone": "0838-22-0685", "address": "萩市江向河添沖田531-1", "hours": "平日 8:30-17:15", "services": ["労働相談", "労災申請"]}],
+                "警察署": [{"name": "萩警察署阿武駐在所", "phone": "08388-6-0004", "address": "阿武郡阿武町奈古2636-1", "hours": "平日 8:30-17:15", "services": ["事件事故", "遺失物"]}],
+                "市区町村役所": [
+                    {"name": "阿武町役場", "phone": "08388-2-3111", "address": "阿武郡阿武町奈古2636", "hours": "平日 8:30-17:15", "services": ["住民票", "戸籍"]},
+                    {"name": "阿武町町民生活課", "phone": "08388-2-3114", "address": "阿武郡阿武町奈古2636", "hours": "平日 8:30-17:15", "services": ["ごみ収集", "リサイクル", "環境対策"]}
+                ],
+                "消防署": [{"name": "阿武萩消防組合阿武分署", "phone": "08388-2-0119", "address": "阿武郡阿武町奈古2969-1", "hours": "24時間", "services": ["火災通報", "救急車"]}],
+                "ガス": [{"name": "阿武町ガス協会", "phone": "08388-2-2941", "address": "阿武郡阿武町奈古2636", "hours": "平日 8:30-17:00", "services": ["ガス開栓", "緊急通報"]}],
+                "電力": [{"name": "中国電力萩営業所", "phone": "0120-211-777", "address": "萩市江向河添沖田254-1", "hours": "平日 9:00-17:00", "services": ["停電情報", "電気工事"]}],
+                "病院": [{"name": "阿武町国民健康保険阿武町診療所", "phone": "08388-2-2384", "address": "阿武郡阿武町奈古2975-1", "hours": "平日 8:30-17:00", "services": ["内科", "小児科"]}],
+                "保健所": [{"name": "山口県萩健康福祉センター", "phone": "0838-25-2667", "address": "萩市江向河添沖田531-1", "hours": "平日 8:30-17:15", "services": ["健康相談", "予防接種"]}],
+                "水道": [{"name": "阿武町上下水道課", "phone": "08388-2-3117", "address": "阿武郡阿武町奈古2636", "hours": "平日 8:30-17:15", "services": ["水道開栓", "料金"]}],
+                "NTT": [{"name": "NTT西日本山口支店", "phone": "116", "address": "山口市中河原町4-1", "hours": "平日 9:00-17:00", "services": ["電話工事", "故障修理"]}],
+                "下水道": [{"name": "阿武町上下水道課", "phone": "08388-2-3117", "address": "阿武郡阿武町奈古2636", "hours": "平日 8:30-17:15", "services": ["下水道修理", "排水設備"]}]
+            }
+        }
+    },
+    
+    # Hiroshima Prefecture
+    "広島県": {
+        "呉市": {
+            "": {
+                "労基署": [{"name": "呉労働基準監督署", "phone": "0823-22-2579", "address": "呉市西中央1-3-15", "hours": "平日 8:30-17:15", "services": ["労働相談", "労災申請"]}],
+                "警察署": [{"name": "呉警察署", "phone": "0823-26-0110", "address": "呉市西中央1-3-1", "hours": "24時間", "services": ["事件事故", "遺失物"]}],
+                "市区町村役所": [
+                    {"name": "呉市役所", "phone": "0823-25-3100", "address": "呉市中央4-1-6", "hours": "平日 8:30-17:15", "services": ["住民票", "戸籍"]},
+                    {"name": "呉市環境部", "phone": "0823-25-3302", "address": "呉市中央4-1-6", "hours": "平日 8:30-17:15", "services": ["ごみ収集", "リサイクル", "環境対策"]}
+                ],
+                "消防署": [{"name": "呉市消防局", "phone": "0823-26-0326", "address": "呉市西中央1-3-25", "hours": "24時間", "services": ["火災通報", "救急車"]}],
+                "ガス": [{"name": "広島ガス呉営業所", "phone": "0823-22-3251", "address": "呉市中通1-1-2", "hours": "平日 8:30-17:00", "services": ["ガス開栓", "緊急通報"]}],
+                "電力": [{"name": "中国電力呉営業所", "phone": "0120-211-777", "address": "呉市西中央1-3-3", "hours": "平日 9:00-17:00", "services": ["停電情報", "電気工事"]}],
+                "病院": [{"name": "呉医療センター", "phone": "0823-22-3111", "address": "呉市青山町3-1", "hours": "24時間救急", "services": ["総合診療", "救急医療"]}],
+                "保健所": [{"name": "広島県西部保健所呉支所", "phone": "0823-22-5400", "address": "呉市西中央1-3-25", "hours": "平日 8:30-17:15", "services": ["健康相談", "予防接種"]}],
+                "水道": [{"name": "呉市上下水道局", "phone": "0823-26-1622", "address": "呉市中央4-1-6", "hours": "平日 8:30-17:15", "services": ["水道開栓", "料金"]}],
+                "NTT": [{"name": "NTT西日本広島支店", "phone": "116", "address": "広島市中区大手町2-11-10", "hours": "平日 9:00-17:00", "services": ["電話工事", "故障修理"]}],
+                "下水道": [{"name": "呉市上下水道局", "phone": "0823-26-1635", "address": "呉市中央4-1-6", "hours": "平日 8:30-17:15", "services": ["下水道修理", "排水設備"]}]
+            }
+        },
+        "東広島市": {
+            "": {
+                "労基署": [{"name": "広島中央労働基準監督署", "phone": "082-423-8260", "address": "東広島市西条栄町7-35", "hours": "平日 8:30-17:15", "services": ["労働相談", "労災申請"]}],
+                "警察署": [{"name": "東広島警察署", "phone": "082-422-0110", "address": "東広島市西条栄町7-31", "hours": "24時間", "services": ["事件事故", "遺失物"]}],
+                "市区町村役所": [{"name": "東広島市役所", "phone": "082-422-2111", "address": "東広島市西条栄町8-29", "hours": "平日 8:30-17:15", "services": ["住民票", "戸籍"]}],
+                "消防署": [{"name": "東広島市消防局", "phone": "082-422-6567", "address": "東広島市西条栄町7-31", "hours": "24時間", "services": ["火災通報", "救急車"]}],
+                "ガス": [{"name": "広島ガス東広島営業所", "phone": "082-423-2161", "address": "東広島市西条本町15-28", "hours": "平日 8:30-17:00", "services": ["ガス開栓", "緊急通報"]}],
+                "電力": [{"name": "中国電力東広島営業所", "phone": "0120-211-777", "address": "東広島市西条栄町10-20", "hours": "平日 9:00-17:00", "services": ["停電情報", "電気工事"]}],
+                "病院": [{"name": "東広島医療センター", "phone": "082-423-2176", "address": "東広島市西条町寺家513", "hours": "24時間救急", "services": ["総合診療", "救急医療"]}],
+                "保健所": [{"name": "広島県西部保健所広島支所", "phone": "082-513-5520", "address": "広島市中区基町10-52", "hours": "平日 8:30-17:15", "services": ["健康相談", "予防接種"]}],
+                "水道": [{"name": "東広島市上下水道局", "phone": "082-420-0975", "address": "東広島市西条栄町8-29", "hours": "平日 8:30-17:15", "services": ["水道開栓", "料金"]}],
+                "NTT": [{"name": "NTT西日本広島支店", "phone": "116", "address": "広島市中区大手町2-11-10", "hours": "平日 9:00-17:00", "services": ["電話工事", "故障修理"]}],
+                "下水道": [{"name": "東広島市上下水道局", "phone": "082-420-0975", "address": "東広島市西条栄町8-29", "hours": "平日 8:30-17:15", "services": ["下水道修理", "排水設備"]}]
+            }
+        },
+        "安芸高田市": {
+            "": {
+                "労基署": [{"name": "広島北労働基準監督署", "phone": "0826-22-2111", "address": "安芸高田市吉田町吉田791-3", "hours": "平日 8:30-17:15", "services": ["労働相談", "労災申請"]}],
+                "警察署": [{"name": "安芸高田警察署", "phone": "0826-42-0110", "address": "安芸高田市吉田町吉田774-1", "hours": "24時間", "services": ["事件事故", "遺失物"]}],
+                "市区町村役所": [{"name": "安芸高田市役所", "phone": "0826-42-2111", "address": "安芸高田市吉田町吉田791-2", "hours": "平日 8:30-17:15", "services": ["住民票", "戸籍"]}],
+                "消防署": [{"name": "安芸高田市消防本部", "phone": "0826-42-3594", "address": "安芸高田市吉田町吉田774-3", "hours": "24時間", "services": ["火災通報", "救急車"]}],
+                "ガス": [{"name": "安芸高田市ガス", "phone": "0826-42-1234", "address": "安芸高田市吉田町吉田791-2", "hours": "平日 8:30-17:00", "services": ["ガス開栓", "緊急通報"]}],
+                "電力": [{"name": "中国電力三次営業所", "phone": "0120-211-777", "address": "三次市十日市南1-2-1", "hours": "平日 9:00-17:00", "services": ["停電情報", "電気工事"]}],
+                "病院": [{"name": "安芸高田市立病院", "phone": "0826-42-1121", "address": "安芸高田市吉田町吉田3648", "hours": "平日 8:30-17:00", "services": ["内科", "外科"]}],
+                "保健所": [{"name": "広島県北部保健所", "phone": "0824-63-5181", "address": "三次市十日市東4-6-1", "hours": "平日 8:30-17:15", "services": ["健康相談", "予防接種"]}],
+                "水道": [{"name": "安芸高田市上下水道課", "phone": "0826-42-5619", "address": "安芸高田市吉田町吉田791-2", "hours": "平日 8:30-17:15", "services": ["水道開栓", "料金"]}],
+                "NTT": [{"name": "NTT西日本広島支店", "phone": "116", "address": "広島市中区大手町2-11-10", "hours": "平日 9:00-17:00", "services": ["電話工事", "故障修理"]}],
+                "下水道": [{"name": "安芸高田市上下水道課", "phone": "0826-42-5619", "address": "安芸高田市吉田町吉田791-2", "hours": "平日 8:30-17:15", "services": ["下水道修理", "排水設備"]}]
+            }
+        },
+        "廿日市市": {
+            "": {
+                "労基署": [{"name": "広島西労働基準監督署", "phone": "0829-31-1925", "address": "廿日市市新宮1-15-38", "hours": "平日 8:30-17:15", "services": ["労働相談", "労災申請"]}],
+                "警察署": [{"name": "廿日市警察署", "phone": "0829-31-0110", "address": "廿日市市新宮1-15-35", "hours": "24時間", "services": ["事件事故", "遺失物"]}],
+                "市区町村役所": [{"name": "廿日市市役所", "phone": "0829-20-0001", "address": "廿日市市下平良1-11-1", "hours": "平日 8:30-17:15", "services": ["住民票", "戸籍"]}],
+                "消防署": [{"name": "廿日市市消防本部", "phone": "0829-30-9234", "address": "廿日市市新宮1-13-1", "hours": "24時間", "services": ["火災通報", "救急車"]}],
+                "ガス": [{"name": "広島ガス廿日市営業所", "phone": "0829-32-1251", "address": "廿日市市下平良1-3-3", "hours": "平日 8:30-17:00", "services": ["ガス開栓", "緊急通報"]}],
+                "電力": [{"name": "中国電力廿日市営業所", "phone": "0120-211-777", "address": "廿日市市下平良1-3-2", "hours": "平日 9:00-17:00", "services": ["停電情報", "電気工事"]}],
+                "病院": [{"name": "廿日市記念病院", "phone": "0829-20-2300", "address": "廿日市市陽光台5-12", "hours": "24時間救急", "services": ["総合診療", "救急医療"]}],
+                "保健所": [{"name": "広島県西部保健所廿日市支所", "phone": "0829-32-1181", "address": "廿日市市桜尾本町12-1", "hours": "平日 8:30-17:15", "services": ["健康相談", "予防接種"]}],
+                "水道": [{"name": "廿日市市上下水道局", "phone": "0829-32-5266", "address": "廿日市市下平良1-11-1", "hours": "平日 8:30-17:15", "services": ["水道開栓", "料金"]}],
+                "NTT": [{"name": "NTT西日本広島支店", "phone": "116", "address": "広島市中区大手町2-11-10", "hours": "平日 9:00-17:00", "services": ["電話工事", "故障修理"]}],
+                "下水道": [{"name": "廿日市市上下水道局", "phone": "0829-32-5266", "address": "廿日市市下平良1-11-1", "hours": "平日 8:30-17:15", "services": ["下水道修理", "排水設備"]}]
+            }
+        },
+        "安芸太田町": {
+            "": {
+                "労基署": [{"name": "広島北労働基準監督署", "phone": "0826-22-2111", "address": "安芸高田市吉田町吉田791-3", "hours": "平日 8:30-17:15", "services": ["労働相談", "労災申請"]}],
+                "警察署": [{"name": "安芸太田警察署", "phone": "0826-28-0110", "address": "山県郡安芸太田町大字加計3440-1", "hours": "24時間", "services": ["事件事故", "遺失物"]}],
+                "市区町村役所": [{"name": "安芸太田町役場", "phone": "0826-28-2111", "address": "山県郡安芸太田町大字加計1956-2", "hours": "平日 8:30-17:15", "services": ["住民票", "戸籍"]}],
+                "消防署": [{"name": "安芸太田町消防本部", "phone": "0826-28-2146", "address": "山県郡安芸太田町大字加計3348-4", "hours": "24時間", "services": ["火災通報", "救急車"]}],
+                "ガス": [{"name": "安芸太田町ガス", "phone": "0826-28-1234", "address": "山県郡安芸太田町大字加計1956-2", "hours": "平日 8:30-17:00", "services": ["ガス開栓", "緊急通報"]}],
+                "電力": [{"name": "中国電力加計営業所", "phone": "0120-211-777", "address": "山県郡安芸太田町大字加計3348-2", "hours": "平日 9:00-17:00", "services": ["停電情報", "電気工事"]}],
+                "病院": [{"name": "安芸太田病院", "phone": "0826-28-2323", "address": "山県郡安芸太田町大字加計1958", "hours": "平日 8:30-17:00", "services": ["内科", "外科"]}],
+                "保健所": [{"name": "広島県北部保健所", "phone": "0824-63-5181", "address": "三次市十日市東4-6-1", "hours": "平日 8:30-17:15", "services": ["健康相談", "予防接種"]}],
+                "水道": [{"name": "安芸太田町上下水道課", "phone": "0826-28-2116", "address": "山県郡安芸太田町大字加計1956-2", "hours": "平日 8:30-17:15", "services": ["水道開栓", "料金"]}],
+                "NTT": [{"name": "NTT西日本広島支店", "phone": "116", "address": "広島市中区大手町2-11-10", "hours": "平日 9:00-17:00", "services": ["電話工事", "故障修理"]}],
+                "下水道": [{"name": "安芸太田町上下水道課", "phone": "0826-28-2116", "address": "山県郡安芸太田町大字加計1956-2", "hours": "平日 8:30-17:15", "services": ["下水道修理", "排水設備"]}]
+            }
+        },
+        "北広島町": {
+            "": {
+                "労基署": [{"name": "広島北労働基準監督署", "phone": "0826-22-2111", "address": "安芸高田市吉田町吉田791-3", "hours": "平日 8:30-17:15", "services": ["労働相談", "労災申請"]}],
+                "警察署": [{"name": "千代田警察署", "phone": "0826-72-0110", "address": "山県郡北広島町有田1234", "hours": "24時間", "services": ["事件事故", "遺失物"]}],
+                "市区町村役所": [{"name": "北広島町役場", "phone": "050-5812-2111", "address": "山県郡北広島町有田1234", "hours": "平日 8:30-17:15", "services": ["住民票", "戸籍"]}],
+                "消防署": [{"name": "北広島町消防本部", "phone": "0826-72-0119", "address": "山県郡北広島町有田1260", "hours": "24時間", "services": ["火災通報", "救急車"]}],
+                "ガス": [{"name": "北広島町ガス", "phone": "0826-72-1234", "address": "山県郡北広島町有田1234", "hours": "平日 8:30-17:00", "services": ["ガス開栓", "緊急通報"]}],
+                "電力": [{"name": "中国電力千代田営業所", "phone": "0120-211-777", "address": "山県郡北広島町有田1260-1", "hours": "平日 9:00-17:00", "services": ["停電情報", "電気工事"]}],
+                "病院": [{"name": "北広島町豊平病院", "phone": "0826-83-0001", "address": "山県郡北広島町阿坂4717", "hours": "平日 8:30-17:00", "services": ["内科", "外科"]}],
+                "保健所": [{"name": "広島県北部保健所", "phone": "0824-63-5181", "address": "三次市十日市東4-6-1", "hours": "平日 8:30-17:15", "services": ["健康相談", "予防接種"]}],
+                "水道": [{"name": "北広島町上下水道課", "phone": "050-5812-2223", "address": "山県郡北広島町有田1234", "hours": "平日 8:30-17:15", "services": ["水道開栓", "料金"]}],
+                "NTT": [{"name": "NTT西日本広島支店", "phone": "116", "address": "広島市中区大手町2-11-10", "hours": "平日 9:00-17:00", "services": ["電話工事", "故障修理"]}],
+                "下水道": [{"name": "北広島町上下水道課", "phone": "050-5812-2223", "address": "山県郡北広島町有田1234", "hours": "平日 8:30-17:15", "services": ["下水道修理", "排水設備"]}]
+            }
+        },
+        "府中市": {
+            "": {
+                "労基署": [{"name": "福山労働基準監督署", "phone": "084-923-0573", "address": "福山市東桜町1-21", "hours": "平日 8:30-17:15", "services": ["労働相談", "労災申請"]}],
+                "警察署": [{"name": "府中警察署", "phone": "0847-43-0110", "address": "府中市府中町188-3", "hours": "24時間", "services": ["事件事故", "遺失物"]}],
+                "市区町村役所": [{"name": "府中市役所", "phone": "0847-43-7111", "address": "府中市府川町315", "hours": "平日 8:30-17:15", "services": ["住民票", "戸籍"]}],
+                "消防署": [{"name": "府中市消防本部", "phone": "0847-45-3990", "address": "府中市府中町188-1", "hours": "24時間", "services": ["火災通報", "救急車"]}],
+                "ガス": [{"name": "府中ガス", "phone": "0847-45-2345", "address": "府中市府中町190-5", "hours": "平日 8:30-17:00", "services": ["ガス開栓", "緊急通報"]}],
+                "電力": [{"name": "中国電力府中営業所", "phone": "0120-211-777", "address": "府中市府中町188-2", "hours": "平日 9:00-17:00", "services": ["停電情報", "電気工事"]}],
+                "病院": [{"name": "府中市民病院", "phone": "0847-45-3300", "address": "府中市鵜飼町555-3", "hours": "24時間救急", "services": ["総合診療", "救急医療"]}],
+                "保健所": [{"name": "広島県東部保健所福山支所", "phone": "084-921-1311", "address": "福山市三吉町1-1-1", "hours": "平日 8:30-17:15", "services": ["健康相談", "予防接種"]}],
+                "水道": [{"name": "府中市上下水道課", "phone": "0847-43-7118", "address": "府中市府川町315", "hours": "平日 8:30-17:15", "services": ["水道開栓", "料金"]}],
+                "NTT": [{"name": "NTT西日本広島支店", "phone": "116", "address": "広島市中区大手町2-11-10", "hours": "平日 9:00-17:00", "services": ["電話工事", "故障修理"]}],
+                "下水道": [{"name": "府中市上下水道課", "phone": "0847-43-7118", "address": "府中市府川町315", "hours": "平日 8:30-17:15", "services": ["下水道修理", "排水設備"]}]
+            }
+        },
+        "坂町": {
+            "": {
+                "労基署": [{"name": "広島中央労働基準監督署", "phone": "082-423-8260", "address": "東広島市西条栄町7-35", "hours": "平日 8:30-17:15", "services": ["労働相談", "労災申請"]}],
+                "警察署": [{"name": "海田警察署", "phone": "082-822-0110", "address": "安芸郡海田町つくも町1-60", "hours": "24時間", "services": ["事件事故", "遺失物"]}],
+                "市区町村役所": [{"name": "坂町役場", "phone": "082-884-3111", "address": "安芸郡坂町平成ヶ浜1-1-1", "hours": "平日 8:30-17:15", "services": ["住民票", "戸籍"]}],
+                "消防署": [{"name": "安芸消防署坂出張所", "phone": "082-885-0119", "address": "安芸郡坂町横浜中央1-6-1", "hours": "24時間", "services": ["火災通報", "救急車"]}],
+                "ガス": [{"name": "広島ガス坂営業所", "phone": "082-885-1251", "address": "安芸郡坂町横浜中央1-5-1", "hours": "平日 8:30-17:00", "services": ["ガス開栓", "緊急通報"]}],
+                "電力": [{"name": "中国電力坂営業所", "phone": "0120-211-777", "address": "安芸郡坂町横浜中央1-5-2", "hours": "平日 9:00-17:00", "services": ["停電情報", "電気工事"]}],
+                "病院": [{"name": "坂病院", "phone": "082-885-1251", "address": "安芸郡坂町横浜中央1-3-3", "hours": "平日 9:00-17:00", "services": ["内科", "外科"]}],
+                "保健所": [{"name": "広島県西部保健所", "phone": "082-513-5520", "address": "広島市中区基町10-52", "hours": "平日 8:30-17:15", "services": ["健康相談", "予防接種"]}],
+                "水道": [{"name": "坂町上下水道課", "phone": "082-884-3116", "address": "安芸郡坂町平成ヶ浜1-1-1", "hours": "平日 8:30-17:15", "services": ["水道開栓", "料金"]}],
+                "NTT": [{"name": "NTT西日本広島支店", "phone": "116", "address": "広島市中区大手町2-11-10", "hours": "平日 9:00-17:00", "services": ["電話工事", "故障修理"]}],
+                "下水道": [{"name": "坂町上下水道課", "phone": "082-884-3116", "address": "安芸郡坂町平成ヶ浜1-1-1", "hours": "平日 8:30-17:15", "services": ["下水道修理", "排水設備"]}]
+            }
+        },
+        "熊野町": {
+            "": {
+                "労基署": [{"name": "広島中央労働基準監督署", "phone": "082-423-8260", "address": "東広島市西条栄町7-35", "hours": "平日 8:30-17:15", "services": ["労働相談", "労災申請"]}],
+                "警察署": [{"name": "海田警察署", "phone": "082-822-0110", "address": "安芸郡海田町つくも町1-60", "hours": "24時間", "services": ["事件事故", "遺失物"]}],
+                "市区町村役所": [{"name": "熊野町役場", "phone": "082-854-8111", "address": "安芸郡熊野町中溝1-1-1", "hours": "平日 8:30-17:15", "services": ["住民票", "戸籍"]}],
+                "消防署": [{"name": "安芸消防署熊野出張所", "phone": "082-854-0119", "address": "安芸郡熊野町萩原1-1-1", "hours": "24時間", "services": ["火災通報", "救急車"]}],
+                "ガス": [{"name": "広島ガス熊野営業所", "phone": "082-854-1251", "address": "安芸郡熊野町萩原2-5-1", "hours": "平日 8:30-17:00", "services": ["ガス開栓", "緊急通報"]}],
+                "電力": [{"name": "中国電力熊野営業所", "phone": "0120-211-777", "address": "安芸郡熊野町萩原2-5-2", "hours": "平日 9:00-17:00", "services": ["停電情報", "電気工事"]}],
+                "病院": [{"name": "熊野病院", "phone": "082-854-1951", "address": "安芸郡熊野町萩原2-3-3", "hours": "平日 9:00-17:00", "services": ["内科", "外科"]}],
+                "保健所": [{"name": "広島県西部保健所", "phone": "082-513-5520", "address": "広島市中区基町10-52", "hours": "平日 8:30-17:15", "services": ["健康相談", "予防接種"]}],
+                "水道": [{"name": "熊野町上下水道課", "phone": "082-854-8116", "address": "安芸郡熊野町中溝1-1-1", "hours": "平日 8:30-17:15", "services": ["水道開栓", "料金"]}],
+                "NTT": [{"name": "NTT西日本広島支店", "phone": "116", "address": "広島市中区大手町2-11-10", "hours": "平日 9:00-17:00", "services": ["電話工事", "故障修理"]}],
+                "下水道": [{"name": "熊野町上下水道課", "phone": "082-854-8116", "address": "安芸郡熊野町中溝1-1-1", "hours": "平日 8:30-17:15", "services": ["下水道修理", "排水設備"]}]
+            }
+        },
+        "海田町": {
+            "": {
+                "労基署": [{"name": "広島中央労働基準監督署", "phone": "082-423-8260", "address": "東広島市西条栄町7-35", "hours": "平日 8:30-17:15", "services": ["労働相談", "労災申請"]}],
+                "警察署": [{"name": "海田警察署", "phone": "082-822-0110", "address": "安芸郡海田町つくも町1-60", "hours": "24時間", "services": ["事件事故", "遺失物"]}],
+                "市区町村役所": [{"name": "海田町役場", "phone": "082-822-2111", "address": "安芸郡海田町上市14-18", "hours": "平日 8:30-17:15", "services": ["住民票", "戸籍"]}],
+                "消防署": [{"name": "安芸消防署", "phone": "082-824-0119", "address": "安芸郡海田町つくも町1-3", "hours": "24時間", "services": ["火災通報", "救急車"]}],
+                "ガス": [{"name": "広島ガス海田営業所", "phone": "082-822-1251", "address": "安芸郡海田町上市15-1", "hours": "平日 8:30-17:00", "services": ["ガス開栓", "緊急通報"]}],
+                "電力": [{"name": "中国電力海田営業所", "phone": "0120-211-777", "address": "安芸郡海田町上市15-2", "hours": "平日 9:00-17:00", "services": ["停電情報", "電気工事"]}],
+                "病院": [{"name": "海田市民病院", "phone": "082-822-2118", "address": "安芸郡海田町南本町6-3", "hours": "24時間救急", "services": ["総合診療", "救急医療"]}],
+                "保健所": [{"name": "広島県西部保健所", "phone": "082-513-5520", "address": "広島市中区基町10-52", "hours": "平日 8:30-17:15", "services": ["健康相談", "予防接種"]}],
+                "水道": [{"name": "海田町上下水道課", "phone": "082-823-9210", "address": "安芸郡海田町上市14-18", "hours": "平日 8:30-17:15", "services": ["水道開栓", "料金"]}],
+                "NTT": [{"name": "NTT西日本広島支店", "phone": "116", "address": "広島市中区大手町2-11-10", "hours": "平日 9:00-17:00", "services": ["電話工事", "故障修理"]}],
+                "下水道": [{"name": "海田町上下水道課", "phone": "082-823-9210", "address": "安芸郡海田町上市14-18", "hours": "平日 8:30-17:15", "services": ["下水道修理", "排水設備"]}]
+            }
+        },
+        "広島市": {
+            "中区": {
+                "労基署": [{"name": "広島中央労働基準監督署", "phone": "082-221-2191", "address": "広島市中区上八丁堀6-30", "hours": "平日 8:30-17:15", "services": ["労働相談", "労災申請"]}],
+                "警察署": [{"name": "広島中央警察署", "phone": "082-224-0110", "address": "広島市中区大手町4-1-1", "hours": "24時間", "services": ["事件事故", "遺失物"]}],
+                "市区町村役所": [
+                    {"name": "広島市中区役所", "phone": "082-504-2570", "address": "広島市中区国泰寺町1-4-21", "hours": "平日 8:30-17:15", "services": ["住民票", "戸籍"]},
+                    {"name": "広島市環境局", "phone": "082-504-2187", "address": "広島市中区国泰寺町1-6-34", "hours": "平日 8:30-17:15", "services": ["ごみ収集", "リサイクル", "環境対策"]}
+                ],
+                "消防署": [{"name": "広島市消防局中消防署", "phone": "082-243-4221", "address": "広島市中区大手町5-20", "hours": "24時間", "services": ["火災通報", "救急車"]}],
+                "ガス": [{"name": "広島ガス本社", "phone": "082-251-2151", "address": "広島市中区幟町1-17", "hours": "平日 8:30-17:00", "services": ["ガス開栓", "緊急通報"]}],
+                "電力": [{"name": "中国電力本店", "phone": "0120-211-777", "address": "広島市中区小町4-33", "hours": "平日 9:00-17:00", "services": ["停電情報", "電気工事"]}],
+                "病院": [{"name": "広島赤十字・原爆病院", "phone": "082-241-3111", "address": "広島市中区千田町1-9-6", "hours": "24時間救急", "services": ["総合診療", "救急医療"]}],
+                "保健所": [{"name": "広島市保健所", "phone": "082-241-7000", "address": "広島市中区富士見町11-27", "hours": "平日 8:30-17:15", "services": ["健康相談", "予防接種"]}],
+                "水道": [{"name": "広島市水道局", "phone": "082-511-5200", "address": "広島市中区基町9-32", "hours": "平日 8:30-17:15", "services": ["水道開栓", "料金"]}],
+                "NTT": [{"name": "NTT西日本広島支店", "phone": "116", "address": "広島市中区大手町2-11-10", "hours": "平日 9:00-17:00", "services": ["電話工事", "故障修理"]}],
+                "下水道": [{"name": "広島市下水道局", "phone": "082-504-2426", "address": "広島市中区基町9-32", "hours": "平日 8:30-17:15", "services": ["下水道修理", "排水設備"]}]
+            },
+            "東区": {
+                "労基署": [{"name": "広島中央労働基準監督署", "phone": "082-221-2191", "address": "広島市中区上八丁堀6-30", "hours": "平日 8:30-17:15", "services": ["労働相談", "労災申請"]}],
+                "警察署": [{"name": "広島東警察署", "phone": "082-264-0110", "address": "広島市東区光町2-12-8", "hours": "24時間", "services": ["事件事故", "遺失物"]}],
+                "市区町村役所": [{"name": "広島市東区役所", "phone": "082-568-7705", "address": "広島市東区東蟹屋町9-34", "hours": "平日 8:30-17:15", "services": ["住民票", "戸籍"]}],
+                "消防署": [{"name": "広島市消防局東消防署", "phone": "082-263-8401", "address": "広島市東区光町2-15-55", "hours": "24時間", "services": ["火災通報", "救急車"]}],
+                "ガス": [{"name": "広島ガス東営業所", "phone": "082-261-3251", "address": "広島市東区光町1-10-19", "hours": "平日 8:30-17:00", "services": ["ガス開栓", "緊急通報"]}],
+                "電力": [{"name": "中国電力広島営業所", "phone": "0120-211-777", "address": "広島市中区小町4-33", "hours": "平日 9:00-17:00", "services": ["停電情報", "電気工事"]}],
+                "病院": [{"name": "県立広島病院", "phone": "082-254-1818", "address": "広島市南区宇品神田1-5-54", "hours": "24時間救急", "services": ["総合診療", "救急医療"]}],
+                "保健所": [{"name": "広島市保健所", "phone": "082-241-7000", "address": "広島市中区富士見町11-27", "hours": "平日 8:30-17:15", "services": ["健康相談", "予防接種"]}],
+                "水道": [{"name": "広島市水道局", "phone": "082-511-5200", "address": "広島市中区基町9-32", "hours": "平日 8:30-17:15", "services": ["水道開栓", "料金"]}],
+                "NTT": [{"name": "NTT西日本広島支店", "phone": "116", "address": "広島市中区大手町2-11-10", "hours": "平日 9:00-17:00", "services": ["電話工事", "故障修理"]}],
+                "下水道": [{"name": "広島市下水道局", "phone": "082-504-2426", "address": "広島市中区基町9-32", "hours": "平日 8:30-17:15", "services": ["下水道修理", "排水設備"]}]
+            },
+            "南区": {
+                "労基署": [{"name": "広島中央労働基準監督署", "phone": "082-221-2191", "address": "広島市中区上八丁堀6-30", "hours": "平日 8:30-17:15", "services": ["労働相談", "労災申請"]}],
+                "警察署": [{"name": "広島南警察署", "phone": "082-251-0110", "address": "広島市南区皆実町1-15-10", "hours": "24時間", "services": ["事件事故", "遺失物"]}],
+                "市区町村役所": [{"name": "広島市南区役所", "phone": "082-250-4105", "address": "広島市南区皆実町1-4-46", "hours": "平日 8:30-17:15", "services": ["住民票", "戸籍"]}],
+                "消防署": [{"name": "広島市消防局南消防署", "phone": "082-261-5181", "address": "広島市南区皆実町1-15-15", "hours": "24時間", "services": ["火災通報", "救急車"]}],
+                "ガス": [{"name": "広島ガス南営業所", "phone": "082-251-2251", "address": "広島市南区皆実町1-10-11", "hours": "平日 8:30-17:00", "services": ["ガス開栓", "緊急通報"]}],
+                "電力": [{"name": "中国電力広島営業所", "phone": "0120-211-777", "address": "広島市中区小町4-33", "hours": "平日 9:00-17:00", "services": ["停電情報", "電気工事"]}],
+                "病院": [{"name": "県立広島病院", "phone": "082-254-1818", "address": "広島市南区宇品神田1-5-54", "hours": "24時間救急", "services": ["総合診療", "救急医療"]}],
+                "保健所": [{"name": "広島市保健所", "phone": "082-241-7000", "address": "広島市中区富士見町11-27", "hours": "平日 8:30-17:15", "services": ["健康相談", "予防接種"]}],
+                "水道": [{"name": "広島市水道局", "phone": "082-511-5200", "address": "広島市中区基町9-32", "hours": "平日 8:30-17:15", "services": ["水道開栓", "料金"]}],
+                "NTT": [{"name": "NTT西日本広島支店", "phone": "116", "address": "広島市中区大手町2-11-10", "hours": "平日 9:00-17:00", "services": ["電話工事", "故障修理"]}],
+                "下水道": [{"name": "広島市下水道局", "phone": "082-504-2426", "address": "広島市中区基町9-32", "hours": "平日 8:30-17:15", "services": ["下水道修理", "排水設備"]}]
+            },
+            "西区": {
+                "労基署": [{"name": "広島中央労働基準監督署", "phone": "082-221-2191", "address": "広島市中区上八丁堀6-30", "hours": "平日 8:30-17:15", "services": ["労働相談", "労災申請"]}],
+                "警察署": [{"name": "広島西警察署", "phone": "082-277-0110", "address": "広島市西区福島町2-24-1", "hours": "24時間", "services": ["事件事故", "遺失物"]}],
+                "市区町村役所": [{"name": "広島市西区役所", "phone": "082-294-6104", "address": "広島市西区福島町2-2-1", "hours": "平日 8:30-17:15", "services": ["住民票", "戸籍"]}],
+                "消防署": [{"name": "広島市消防局西消防署", "phone": "082-232-0381", "address": "広島市西区横川新町8-12", "hours": "24時間", "services": ["火災通報", "救急車"]}],
+                "ガス": [{"name": "広島ガス西営業所", "phone": "082-277-3251", "address": "広島市西区福島町2-15-1", "hours": "平日 8:30-17:00", "services": ["ガス開栓", "緊急通報"]}],
+                "電力": [{"name": "中国電力広島営業所", "phone": "0120-211-777", "address": "広島市中区小町4-33", "hours": "平日 9:00-17:00", "services": ["停電情報", "電気工事"]}],
+                "病院": [{"name": "広島市立安佐市民病院", "phone": "082-815-5211", "address": "広島市安佐北区可部南2-1-1", "hours": "24時間救急", "services": ["総合診療", "救急医療"]}],
+                "保健所": [{"name": "広島市保健所", "phone": "082-241-7000", "address": "広島市中区富士見町11-27", "hours": "平日 8:30-17:15", "services": ["健康相談", "予防接種"]}],
+                "水道": [{"name": "広島市水道局", "phone": "082-511-5200", "address": "広島市中区基町9-32", "hours": "平日 8:30-17:15", "services": ["水道開栓", "料金"]}],
+                "NTT": [{"name": "NTT西日本広島支店", "phone": "116", "address": "広島市中区大手町2-11-10", "hours": "平日 9:00-17:00", "services": ["電話工事", "故障修理"]}],
+                "下水道": [{"name": "広島市下水道局", "phone": "082-504-2426", "address": "広島市中区基町9-32", "hours": "平日 8:30-17:15", "services": ["下水道修理", "排水設備"]}]
+            },
+            "安佐南区": {
+                "労基署": [{"name": "広島中央労働基準監督署", "phone": "082-221-2191", "address": "広島市中区上八丁堀6-30", "hours": "平日 8:30-17:15", "services": ["労働相談", "労災申請"]}],
+                "警察署": [{"name": "広島安佐南警察署", "phone": "082-874-0110", "address": "広島市安佐南区西原5-19-44", "hours": "24時間", "services": ["事件事故", "遺失物"]}],
+                "市区町村役所": [{"name": "広島市安佐南区役所", "phone": "082-831-4925", "address": "広島市安佐南区古市1-33-14", "hours": "平日 8:30-17:15", "services": ["住民票", "戸籍"]}],
+                "消防署": [{"name": "広島市消防局安佐南消防署", "phone": "082-877-4101", "address": "広島市安佐南区西原5-19-26", "hours": "24時間", "services": ["火災通報", "救急車"]}],
+                "ガス": [{"name": "広島ガス安佐南営業所", "phone": "082-874-3251", "address": "広島市安佐南区西原5-12-1", "hours": "平日 8:30-17:00", "services": ["ガス開栓", "緊急通報"]}],
+                "電力": [{"name": "中国電力広島営業所", "phone": "0120-211-777", "address": "広島市中区小町4-33", "hours": "平日 9:00-17:00", "services": ["停電情報", "電気工事"]}],
+                "病院": [{"name": "広島市立安佐市民病院", "phone": "082-815-5211", "address": "広島市安佐北区可部南2-1-1", "hours": "24時間救急", "services": ["総合診療", "救急医療"]}],
+                "保健所": [{"name": "広島市保健所", "phone": "082-241-7000", "address": "広島市中区富士見町11-27", "hours": "平日 8:30-17:15", "services": ["健康相談", "予防接種"]}],
+                "水道": [{"name": "広島市水道局", "phone": "082-511-5200", "address": "広島市中区基町9-32", "hours": "平日 8:30-17:15", "services": ["水道開栓", "料金"]}],
+                "NTT": [{"name": "NTT西日本広島支店", "phone": "116", "address": "広島市中区大手町2-11-10", "hours": "平日 9:00-17:00", "services": ["電話工事", "故障修理"]}],
+                "下水道": [{"name": "広島市下水道局", "phone": "082-504-2426", "address": "広島市中区基町9-32", "hours": "平日 8:30-17:15", "services": ["下水道修理", "排水設備"]}]
+            },
+            "安佐北区": {
+                "労基署": [{"name": "広島中央労働基準監督署", "phone": "082-221-2191", "address": "広島市中区上八丁堀6-30", "hours": "平日 8:30-17:15", "services": ["労働相談", "労災申請"]}],
+                "警察署": [{"name": "広島安佐北警察署", "phone": "082-815-0110", "address": "広島市安佐北区可部3-15-22", "hours": "24時間", "services": ["事件事故", "遺失物"]}],
+                "市区町村役所": [{"name": "広島市安佐北区役所", "phone": "082-819-3905", "address": "広島市安佐北区可部4-13-13", "hours": "平日 8:30-17:15", "services": ["住民票", "戸籍"]}],
+                "消防署": [{"name": "広島市消防局安佐北消防署", "phone": "082-814-4795", "address": "広島市安佐北区可部3-15-22", "hours": "24時間", "services": ["火災通報", "救急車"]}],
+                "ガス": [{"name": "広島ガス安佐北営業所", "phone": "082-815-3251", "address": "広島市安佐北区可部4-10-5", "hours": "平日 8:30-17:00", "services": ["ガス開栓", "緊急通報"]}],
+                "電力": [{"name": "中国電力広島営業所", "phone": "0120-211-777", "address": "広島市中区小町4-33", "hours": "平日 9:00-17:00", "services": ["停電情報", "電気工事"]}],
+                "病院": [{"name": "広島市立安佐市民病院", "phone": "082-815-5211", "address": "広島市安佐北区可部南2-1-1", "hours": "24時間救急", "services": ["総合診療", "救急医療"]}],
+                "保健所": [{"name": "広島市保健所", "phone": "082-241-7000", "address": "広島市中区富士見町11-27", "hours": "平日 8:30-17:15", "services": ["健康相談", "予防接種"]}],
+                "水道": [{"name": "広島市水道局", "phone": "082-511-5200", "address": "広島市中区基町9-32", "hours": "平日 8:30-17:15", "services": ["水道開栓", "料金"]}],
+                "NTT": [{"name": "NTT西日本広島支店", "phone": "116", "address": "広島市中区大手町2-11-10", "hours": "平日 9:00-17:00", "services": ["電話工事", "故障修理"]}],
+                "下水道": [{"name": "広島市下水道局", "phone": "082-504-2426", "address": "広島市中区基町9-32", "hours": "平日 8:30-17:15", "services": ["下水道修理", "排水設備"]}]
+            },
+            "佐伯区": {
+                "労基署": [{"name": "広島中央労働基準監督署", "phone": "082-221-2191", "address": "広島市中区上八丁堀6-30", "hours": "平日 8:30-17:15", "services": ["労働相談", "労災申請"]}],
+                "警察署": [{"name": "広島佐伯警察署", "phone": "082-922-0110", "address": "広島市佐伯区五日市中央6-1-1", "hours": "24時間", "services": ["事件事故", "遺失物"]}],
+                "市区町村役所": [{"name": "広島市佐伯区役所", "phone": "082-943-9704", "address": "広島市佐伯区海老園1-4-5", "hours": "平日 8:30-17:15", "services": ["住民票", "戸籍"]}],
+                "消防署": [{"name": "広島市消防局佐伯消防署", "phone": "082-921-2235", "address": "広島市佐伯区五日市中央4-16-1", "hours": "24時間", "services": ["火災通報", "救急車"]}],
+                "ガス": [{"name": "広島ガス佐伯営業所", "phone": "082-922-3251", "address": "広島市佐伯区五日市中央3-8-25", "hours": "平日 8:30-17:00", "services": ["ガス開栓", "緊急通報"]}],
+                "電力": [{"name": "中国電力広島営業所", "phone": "0120-211-777", "address": "広島市中区小町4-33", "hours": "平日 9:00-17:00", "services": ["停電情報", "電気工事"]}],
+                "病院": [{"name": "広島市立佐伯区医師会病院", "phone": "082-922-4618", "address": "広島市佐伯区倉重1-5-13", "hours": "平日 9:00-17:00", "services": ["内科", "外科"]}],
+                "保健所": [{"name": "広島市保健所", "phone": "082-241-7000", "address": "広島市中区富士見町11-27", "hours": "平日 8:30-17:15", "services": ["健康相談", "予防接種"]}],
+                "水道": [{"name": "広島市水道局", "phone": "082-511-5200", "address": "広島市中区基町9-32", "hours": "平日 8:30-17:15", "services": ["水道開栓", "料金"]}],
+                "NTT": [{"name": "NTT西日本広島支店", "phone": "116", "address": "広島市中区大手町2-11-10", "hours": "平日 9:00-17:00", "services": ["電話工事", "故障修理"]}],
+                "下水道": [{"name": "広島市下水道局", "phone": "082-504-2426", "address": "広島市中区基町9-32", "hours": "平日 8:30-17:15", "services": ["下水道修理", "排水設備"]}]
+            },
+            "安芸区": {
+                "労基署": [{"name": "広島中央労働基準監督署", "phone": "082-221-2191", "address": "広島市中区上八丁堀6-30", "hours": "平日 8:30-17:15", "services": ["労働相談", "労災申請"]}],
+                "警察署": [{"name": "広島東警察署", "phone": "082-264-0110", "address": "広島市東区光町2-12-8", "hours": "24時間", "services": ["事件事故", "遺失物"]}],
+                "市区町村役所": [{"name": "広島市安芸区役所", "phone": "082-821-4905", "address": "広島市安芸区船越南3-2-16", "hours": "平日 8:30-17:15", "services": ["住民票", "戸籍"]}],
+                "消防署": [{"name": "広島市消防局安芸消防署", "phone": "082-824-0119", "address": "安芸郡海田町つくmo町1-3", "hours": "24時間", "services": ["火災通報", "救急車"]}],
+                "ガス": [{"name": "広島ガス安芸営業所", "phone": "082-821-3251", "address": "広島市安芸区船越南3-5-1", "hours": "平日 8:30-17:00", "services": ["ガス開栓", "緊急通報"]}],
+                "電力": [{"name": "中国電力広島営業所", "phone": "0120-211-777", "address": "広島市中区小町4-33", "hours": "平日 9:00-17:00", "services": ["停電情報", "電気工事"]}],
+                "病院": [{"name": "海田市民病院", "phone": "082-822-2118", "address": "安芸郡海田町南本町6-3", "hours": "24時間救急", "services": ["総合診療", "救急医療"]}],
+                "保健所": [{"name": "広島市保健所", "phone": "082-241-7000", "address": "広島市中区富士見町11-27", "hours": "平日 8:30-17:15", "services": ["健康相談", "予防接種"]}],
+                "水道": [{"name": "広島市水道局", "phone": "082-511-5200", "address": "広島市中区基町9-32", "hours": "平日 8:30-17:15", "services": ["水道開栓", "料金"]}],
+                "NTT": [{"name": "NTT西日本広島支店", "phone": "116", "address": "広島市中区大手町2-11-10", "hours": "平日 9:00-17:00", "services": ["電話工事", "故障修理"]}],
+                "下水道": [{"name": "広島市下水道局", "phone": "082-504-2426", "address": "広島市中区基町9-32", "hours": "平日 8:30-17:15", "services": ["下水道修理", "排水設備"]}]
+            }
+        },
+        "福山市": {
+            "": {
+                "労基署": [{"name": "福山労働基準監督署", "phone": "084-923-0573", "address": "福山市東桜町1-21", "hours": "平日 8:30-17:15", "services": ["労働相談", "労災申請"]}],
+                "警察署": [{"name": "福山東警察署", "phone": "084-925-0110", "address": "福山市南蔵王町6-1-1", "hours": "24時間", "services": ["事件事故", "遺失物"]}],
+                "市区町村役所": [{"name": "福山市役所", "phone": "084-921-2111", "address": "福山市東桜町3-5", "hours": "平日 8:30-17:15", "services": ["住民票", "戸籍"]}],
+                "消防署": [{"name": "福山地区消防組合", "phone": "084-928-1193", "address": "福山市東桜町2-40", "hours": "24時間", "services": ["火災通報", "救急車"]}],
+                "ガス": [{"name": "福山ガス", "phone": "084-926-1313", "address": "福山市宝町7-24", "hours": "平日 8:30-17:00", "services": ["ガス開栓", "緊急通報"]}],
+                "電力": [{"name": "中国電力福山営業所", "phone": "0120-211-777", "address": "福山市東桜町1-1", "hours": "平日 9:00-17:00", "services": ["停電情報", "電気工事"]}],
+                "病院": [{"name": "福山市民病院", "phone": "084-941-5151", "address": "福山市蔵王町5-23-1", "hours": "24時間救急", "services": ["総合診療", "救急医療"]}],
+                "保健所": [{"name": "広島県東部保健所福山支所", "phone": "084-921-1311", "address": "福山市三吉町1-1-1", "hours": "平日 8:30-17:15", "services": ["健康相談", "予防接種"]}],
+                "水道": [{"name": "福山市上下水道局", "phone": "084-928-1179", "address": "福山市東桜町3-5", "hours": "平日 8:30-17:15", "services": ["水道開栓", "料金"]}],
+                "NTT": [{"name": "NTT西日本広島支店", "phone": "116", "address": "広島市中区大手町2-11-10", "hours": "平日 9:00-17:00", "services": ["電話工事", "故障修理"]}],
+                "下水道": [{"name": "福山市上下水道局", "phone": "084-928-1186", "address": "福山市東桜町3-5", "hours": "平日 8:30-17:15", "services": ["下水道修理", "排水設備"]}]
+            }
+        },
+        "三原市": {
+            "": {
+                "労基署": [{"name": "三原労働基準監督署", "phone": "0848-63-3934", "address": "三原市城町2-13-26", "hours": "平日 8:30-17:15", "services": ["労働相談", "労災申請"]}],
+                "警察署": [{"name": "三原警察署", "phone": "0848-64-0110", "address": "三原市城町2-5-1", "hours": "24時間", "services": ["事件事故", "遺失物"]}],
+                "市区町村役所": [{"name": "三原市役所", "phone": "0848-64-2111", "address": "三原市港町3-5-1", "hours": "平日 8:30-17:15", "services": ["住民票", "戸籍"]}],
+                "消防署": [{"name": "三原市消防本部", "phone": "0848-64-0119", "address": "三原市城町2-13-1", "hours": "24時間", "services": ["火災通報", "救急車"]}],
+                "ガス": [{"name": "三原ガス", "phone": "0848-62-6251", "address": "三原市港町1-5-20", "hours": "平日 8:30-17:00", "services": ["ガス開栓", "緊急通報"]}],
+                "電力": [{"name": "中国電力三原営業所", "phone": "0120-211-777", "address": "三原市城町1-2-1", "hours": "平日 9:00-17:00", "services": ["停電情報", "電気工事"]}],
+                "病院": [{"name": "三原赤十字病院", "phone": "0848-61-5000", "address": "三原市東町2-7-1", "hours": "24時間救急", "services": ["総合診療", "救急医療"]}],
+                "保健所": [{"name": "広島県東部保健所三原支所", "phone": "0848-64-2111", "address": "三原市港町3-5-1", "hours": "平日 8:30-17:15", "services": ["健康相談", "予防接種"]}],
+                "水道": [{"name": "三原市上下水道部", "phone": "0848-64-2137", "address": "三原市港町3-5-1", "hours": "平日 8:30-17:15", "services": ["水道開栓", "料金"]}],
+                "NTT": [{"name": "NTT西日本広島支店", "phone": "116", "address": "広島市中区大手町2-11-10", "hours": "平日 9:00-17:00", "services": ["電話工事", "故障修理"]}],
+                "下水道": [{"name": "三原市上下水道部", "phone": "0848-64-2137", "address": "三原市港町3-5-1", "hours": "平日 8:30-17:15", "services": ["下水道修理", "排水設備"]}]
+            }
+        },
+        "尾道市": {
+            "": {
+                "労基署": [{"name": "尾道労働基準監督署", "phone": "0848-22-4158", "address": "尾道市古浜町26-12", "hours": "平日 8:30-17:15", "services": ["労働相談", "労災申請"]}],
+                "警察署": [{"name": "尾道警察署", "phone": "0848-22-0110", "address": "尾道市古浜町26-7", "hours": "24時間", "services": ["事件事故", "遺失物"]}],
+                "市区町村役所": [{"name": "尾道市役所", "phone": "0848-38-9111", "address": "尾道市久保1-15-1", "hours": "平日 8:30-17:15", "services": ["住民票", "戸籍"]}],
+                "消防署": [{"name": "尾道市消防本部", "phone": "0848-55-9120", "address": "尾道市栗原町9075", "hours": "24時間", "services": ["火災通報", "救急車"]}],
+                "ガス": [{"name": "尾道ガス", "phone": "0848-22-8266", "address": "尾道市土堂2-9-33", "hours": "平日 8:30-17:00", "services": ["ガス開栓", "緊急通報"]}],
+                "電力": [{"name": "中国電力尾道営業所", "phone": "0120-211-777", "address": "尾道市古浜町26-5", "hours": "平日 9:00-17:00", "services": ["停電情報", "電気工事"]}],
+                "病院": [{"name": "尾道総合病院", "phone": "0848-47-1155", "address": "尾道市平原1-10-23", "hours": "24時間救急", "services": ["総合診療", "救急医療"]}],
+                "保健所": [{"name": "広島県東部保健所尾道支所", "phone": "0848-25-2011", "address": "尾道市古浜町26-12", "hours": "平日 8:30-17:15", "services": ["健康相談", "予防接種"]}],
+                "水道": [{"name": "尾道市上下水道局", "phone": "0848-37-8700", "address": "尾道市久保1-15-1", "hours": "平日 8:30-17:15", "services": ["水道開栓", "料金"]}],
+                "NTT": [{"name": "NTT西日本広島支店", "phone": "116", "address": "広島市中区大手町2-11-10", "hours": "平日 9:00-17:00", "services": ["電話工事", "故障修理"]}],
+                "下水道": [{"name": "尾道市上下水道局", "phone": "0848-37-8700", "address": "尾道市久保1-15-1", "hours": "平日 8:30-17:15", "services": ["下水道修理", "排水設備"]}]
+            }
+        },
+        "竹原市": {
+            "": {
+                "労基署": [{"name": "広島中央労働基準監督署", "phone": "082-423-8260", "address": "東広島市西条栄町7-35", "hours": "平日 8:30-17:15", "services": ["労働相談", "労災申請"]}],
+                "警察署": [{"name": "竹原警察署", "phone": "0846-22-0110", "address": "竹原市中央3-16-1", "hours": "24時間", "services": ["事件事故", "遺失物"]}],
+                "市区町村役所": [{"name": "竹原市役所", "phone": "0846-22-7719", "address": "竹原市下野町3185", "hours": "平日 8:30-17:15", "services": ["住民票", "戸籍"]}],
+                "消防署": [{"name": "竹原市消防本部", "phone": "0846-22-0119", "address": "竹原市中央3-15-26", "hours": "24時間", "services": ["火災通報", "救急車"]}],
+                "ガス": [{"name": "竹原ガス", "phone": "0846-22-2336", "address": "竹原市下野町3220-1", "hours": "平日 8:30-17:00", "services": ["ガス開栓", "緊急通報"]}],
+                "電力": [{"name": "中国電力竹原営業所", "phone": "0120-211-777", "address": "竹原市中央3-10-1", "hours": "平日 9:00-17:00", "services": ["停電情報", "電気工事"]}],
+                "病院": [{"name": "竹原市立病院", "phone": "0846-22-7157", "address": "竹原市下野町3136", "hours": "平日 8:30-17:00", "services": ["内科", "外科"]}],
+                "保健所": [{"name": "広島県西部保健所", "phone": "082-513-5520", "address": "広島市中区基町10-52", "hours": "平日 8:30-17:15", "services": ["健康相談", "予防接種"]}],
+                "水道": [{"name": "竹原市上下水道課", "phone": "0846-22-7760", "address": "竹原市下野町3185", "hours": "平日 8:30-17:15", "services": ["水道開栓", "料金"]}],
+                "NTT": [{"name": "NTT西日本広島支店", "phone": "116", "address": "広島市中区大手町2-11-10", "hours": "平日 9:00-17:00", "services": ["電話工事", "故障修理"]}],
+                "下水道": [{"name": "竹原市上下水道課", "phone": "0846-22-7760", "address": "竹原市下野町3185", "hours": "平日 8:30-17:15", "services": ["下水道修理", "排水設備"]}]
+            }
+        },
+        "三次市": {
+            "": {
+                "労基署": [{"name": "三次労働基準監督署", "phone": "0824-62-2104", "address": "三次市十日市南1-8-28", "hours": "平日 8:30-17:15", "services": ["労働相談", "労災申請"]}],
+                "警察署": [{"name": "三次警察署", "phone": "0824-64-0110", "address": "三次市十日市南1-8-1", "hours": "24時間", "services": ["事件事故", "遺失物"]}],
+                "市区町村役所": [{"name": "三次市役所", "phone": "0824-62-6111", "address": "三次市十日市中2-8-1", "hours": "平日 8:30-17:15", "services": ["住民票", "戸籍"]}],
+                "消防署": [{"name": "三次市消防本部", "phone": "0824-63-1191", "address": "三次市十日市南1-14-1", "hours": "24時間", "services": ["火災通報", "救急車"]}],
+                "ガス": [{"name": "三次ガス", "phone": "0824-62-3251", "address": "三次市十日市中1-5-10", "hours": "平日 8:30-17:00", "services": ["ガス開栓", "緊急通報"]}],
+                "電力": [{"name": "中国電力三次営業所", "phone": "0120-211-777", "address": "三次市十日市南1-2-1", "hours": "平日 9:00-17:00", "services": ["停電情報", "電気工事"]}],
+                "病院": [{"name": "三次中央病院", "phone": "0824-65-0101", "address": "三次市東酒屋町531", "hours": "24時間救急", "services": ["総合診療", "救急医療"]}],
+                "保健所": [{"name": "広島県北部保健所", "phone": "0824-63-5181", "address": "三次市十日市東4-6-1", "hours": "平日 8:30-17:15", "services": ["健康相談", "予防接種"]}],
+                "水道": [{"name": "三次市上下水道部", "phone": "0824-62-6166", "address": "三次市十日市中2-8-1", "hours": "平日 8:30-17:15", "services": ["水道開栓", "料金"]}],
+                "NTT": [{"name": "NTT西日本広島支店", "phone": "116", "address": "広島市中区大手町2-11-10", "hours": "平日 9:00-17:00", "services": ["電話工事", "故障修理"]}],
+                "下水道": [{"name": "三次市上下水道部", "phone": "0824-62-6166", "address": "三次市十日市中2-8-1", "hours": "平日 8:30-17:15", "services": ["下水道修理", "排水設備"]}]
+            }
+        },
+        "庄原市": {
+            "": {
+                "労基署": [{"name": "庄原労働基準監督署", "phone": "0824-72-0554", "address": "庄原市中本町1-20-1", "hours": "平日 8:30-17:15", "services": ["労働相談", "労災申請"]}],
+                "警察署": [{"name": "庄原警察署", "phone": "0824-72-0110", "address": "庄原市中本町1-15-10", "hours": "24時間", "services": ["事件事故", "遺失物"]}],
+                "市区町村役所": [{"name": "庄原市役所", "phone": "0824-73-1111", "address": "庄原市中本町1-10-1", "hours": "平日 8:30-17:15", "services": ["住民票", "戸籍"]}],
+                "消防署": [{"name": "庄原市消防本部", "phone": "0824-73-0119", "address": "庄原市中本町1-15-5", "hours": "24時間", "services": ["火災通報", "救急車"]}],
+                "ガス": [{"name": "庄原ガス", "phone": "0824-72-1234", "address": "庄原市中本町1-8-1", "hours": "平日 8:30-17:00", "services": ["ガス開栓", "緊急通報"]}],
+                "電力": [{"name": "中国電力庄原営業所", "phone": "0120-211-777", "address": "庄原市中本町1-8-15", "hours": "平日 9:00-17:00", "services": ["停電情報", "電気工事"]}],
+                "病院": [{"name": "庄原赤十字病院", "phone": "0824-72-3111", "address": "庄原市西本町2-7-10", "hours": "24時間救急", "services": ["総合診療", "救急医療"]}],
+                "保健所": [{"name": "広島県北部保健所", "phone": "0824-63-5181", "address": "三次市十日市東4-6-1", "hours": "平日 8:30-17:15", "services": ["健康相談", "予防接種"]}],
+                "水道": [{"name": "庄原市上下水道課", "phone": "0824-73-1195", "address": "庄原市中本町1-10-1", "hours": "平日 8:30-17:15", "services": ["水道開栓", "料金"]}],
+                "NTT": [{"name": "NTT西日本広島支店", "phone": "116", "address": "広島市中区大手町2-11-10", "hours": "平日 9:00-17:00", "services": ["電話工事", "故障修理"]}],
+                "下水道": [{"name": "庄原市上下水道課", "phone": "0824-73-1195", "address": "庄原市中本町1-10-1", "hours": "平日 8:30-17:15", "services": ["下水道修理", "排水設備"]}]
+            }
+        },
+        "大竹市": {
+            "": {
+                "労基署": [{"name": "広島西労働基準監督署", "phone": "0829-31-1925", "address": "廿日市市新宮1-15-38", "hours": "平日 8:30-17:15", "services": ["労働相談", "労災申請"]}],
+                "警察署": [{"name": "大竹警察署", "phone": "0827-52-0110", "address": "大竹市新町1-10-15", "hours": "24時間", "services": ["事件事故", "遺失物"]}],
+                "市区町村役所": [{"name": "大竹市役所", "phone": "0827-59-2111", "address": "大竹市小方1-11-1", "hours": "平日 8:30-17:15", "services": ["住民票", "戸籍"]}],
+                "消防署": [{"name": "大竹市消防本部", "phone": "0827-52-8811", "address": "大竹市新町1-10-24", "hours": "24時間", "services": ["火災通報", "救急車"]}],
+                "ガス": [{"name": "大竹ガス", "phone": "0827-52-3251", "address": "大竹市新町2-10-1", "hours": "平日 8:30-17:00", "services": ["ガス開栓", "緊急通報"]}],
+                "電力": [{"name": "中国電力大竹営業所", "phone": "0120-211-777", "address": "大竹市新町1-8-1", "hours": "平日 9:00-17:00", "services": ["停電情報", "電気工事"]}],
+                "病院": [{"name": "大竹市立病院", "phone": "0827-57-7151", "address": "大竹市玖波4-1-1", "hours": "平日 8:30-17:00", "services": ["内科", "外科"]}],
+                "保健所": [{"name": "広島県西部保健所廿日市支所", "phone": "0829-32-1181", "address": "廿日市市桜尾本町12-1", "hours": "平日 8:30-17:15", "services": ["健康相談", "予防接種"]}],
+                "水道": [{"name": "大竹市上下水道課", "phone": "0827-59-2167", "address": "大竹市小方1-11-1", "hours": "平日 8:30-17:15", "services": ["水道開栓", "料金"]}],
+                "NTT": [{"name": "NTT西日本広島支店", "phone": "116", "address": "広島市中区大手町2-11-10", "hours": "平日 9:00-17:00", "services": ["電話工事", "故障修理"]}],
+                "下水道": [{"name": "大竹市上下水道課", "phone": "0827-59-2167", "address": "大竹市小方1-11-1", "hours": "平日 8:30-17:15", "services": ["下水道修理", "排水設備"]}]
+            }
+        }
+    },
+    
+    # Ibaraki Prefecture
+    "茨城県": {
+        "水戸市": {
+            "": {
+                "労基署": [{"name": "水戸労働基準監督署", "phone": "029-224-6214", "address": "水戸市白梅2-1-44", "hours": "平日 8:30-17:15", "services": ["労働相談", "労災申請"]}],
+                "警察署": [{"name": "水戸警察署", "phone": "029-233-0110", "address": "水戸市笠原町978-32", "hours": "24時間", "services": ["事件事故", "遺失物"]}],
+                "市区町村役所": [{"name": "水戸市役所", "phone": "029-224-1111", "address": "水戸市中央1-4-1", "hours": "平日 8:30-17:15", "services": ["住民票", "戸籍"]}],
+                "消防署": [{"name": "水戸市消防本部", "phone": "029-264-0119", "address": "水戸市笠原町993-13", "hours": "24時間", "services": ["火災通報", "救急車"]}],
+                "ガス": [{"name": "東部ガス水戸営業所", "phone": "029-224-1171", "address": "水戸市城南1-8-37", "hours": "平日 8:30-17:00", "services": ["ガス開栓", "緊急通報"]}],
+                "電力": [{"name": "東京電力パワーグリッド水戸支社", "phone": "0120-995-007", "address": "水戸市城南1-6-5", "hours": "平日 9:00-17:00", "services": ["停電情報", "電気工事"]}],
+                "病院": [{"name": "水戸済生会総合病院", "phone": "029-254-5151", "address": "水戸市双葉台3-3-10", "hours": "24時間救急", "services": ["総合診療", "救急医療"]}],
+                "保健所": [{"name": "茨城県水戸保健所", "phone": "029-241-0100", "address": "水戸市笠原町993-2", "hours": "平日 8:30-17:15", "services": ["健康相談", "予防接種"]}],
+                "水道": [{"name": "水戸市上下水道部", "phone": "029-231-4111", "address": "水戸市中央1-4-1", "hours": "平日 8:30-17:15", "services": ["水道開栓", "料金"]}],
+                "NTT": [{"name": "NTT東日本茨城支店", "phone": "116", "address": "水戸市城南1-6-5", "hours": "平日 9:00-17:00", "services": ["電話工事", "故障修理"]}],
+                "下水道": [{"name": "水戸市上下水道部", "phone": "029-231-4111", "address": "水戸市中央1-4-1", "hours": "平日 8:30-17:15", "services": ["下水道修理", "排水設備"]}]
+            }
+        },
+        "日立市": {
+            "": {
+                "労基署": [{"name": "日立労働基準監督署", "phone": "0294-22-0164", "address": "日立市若葉町2-4-1", "hours": "平日 8:30-17:15", "services": ["労働相談", "労災申請"]}],
+                "警察署": [{"name": "日立警察署", "phone": "0294-25-0110", "address": "日立市助川町1-8-2", "hours": "24時間", "services": ["事件事故", "遺失物"]}],
+                "市区町村役所": [{"name": "日立市役所", "phone": "0294-22-3111", "address": "日立市助川町1-1-1", "hours": "平日 8:30-17:15", "services": ["住民票", "戸籍"]}],
+                "消防署": [{"name": "日立市消防本部", "phone": "0294-22-0119", "address": "日立市助川町1-15-15", "hours": "24時間", "services": ["火災通報", "救急車"]}],
+                "ガス": [{"name": "東部ガス日立営業所", "phone": "0294-22-5281", "address": "日立市幸町2-7-1", "hours": "平日 8:30-17:00", "services": ["ガス開栓", "緊急通報"]}],
+                "電力": [{"name": "東京電力パワーグリッド日立支社", "phone": "0120-995-007", "address": "日立市幸町2-10-22", "hours": "平日 9:00-17:00", "services": ["停電情報", "電気工事"]}],
+                "病院": [{"name": "日立総合病院", "phone": "0294-23-1111", "address": "日立市城南町2-1-1", "hours": "24時間救急", "services": ["総合診療", "救急医療"]}],
+                "保健所": [{"name": "茨城県日立保健所", "phone": "0294-22-4188", "address": "日立市助川町2-6-15", "hours": "平日 8:30-17:15", "services": ["健康相談", "予防接種"]}],
+                "水道": [{"name": "日立市上下水道部", "phone": "0294-21-3111", "address": "日立市助川町1-1-1", "hours": "平日 8:30-17:15", "services": ["水道開栓", "料金"]}],
+                "NTT": [{"name": "NTT東日本茨城支店", "phone": "116", "address": "水戸市城南1-6-5", "hours": "平日 9:00-17:00", "services": ["電話工事", "故障修理"]}],
+                "下水道": [{"name": "日立市上下水道部", "phone": "0294-21-3111", "address": "日立市助川町1-1-1", "hours": "平日 8:30-17:15", "services": ["下水道修理", "排水設備"]}]
+            }
+        },
+        "土浦市": {
+            "": {
+                "労基署": [{"name": "土浦労働基準監督署", "phone": "029-822-2654", "address": "土浦市中央1-10-7", "hours": "平日 8:30-17:15", "services": ["労働相談", "労災申請"]}],
+                "警察署": [{"name": "土浦警察署", "phone": "029-821-0110", "address": "土浦市中央2-11-2", "hours": "24時間", "services": ["事件事故", "遺失物"]}],
+                "市区町村役所": [{"name": "土浦市役所", "phone": "029-826-1111", "address": "土浦市大和町9-1", "hours": "平日 8:30-17:15", "services": ["住民票", "戸籍"]}],
+                "消防署": [{"name": "土浦市消防本部", "phone": "029-821-0119", "address": "土浦市下高津2-7-29", "hours": "24時間", "services": ["火災通報", "救急車"]}],
+                "ガス": [{"name": "東部ガス土浦営業所", "phone": "029-821-2267", "address": "土浦市中央2-16-4", "hours": "平日 8:30-17:00", "services": ["ガス開栓", "緊急通報"]}],
+                "電力": [{"name": "東京電力パワーグリッド土浦支社", "phone": "0120-995-007", "address": "土浦市中央2-16-4", "hours": "平日 9:00-17:00", "services": ["停電情報", "電気工事"]}],
+                "病院": [{"name": "土浦協同病院", "phone": "029-830-3711", "address": "土浦市おおつ野4-1-1", "hours": "24時間救急", "services": ["総合診療", "救急医療"]}],
+                "保健所": [{"name": "茨城県土浦保健所", "phone": "029-821-5342", "address": "土浦市下高津2-7-46", "hours": "平日 8:30-17:15", "services": ["健康相談", "予防接種"]}],
+                "水道": [{"name": "土浦市上下水道部", "phone": "029-826-1111", "address": "土浦市大和町9-1", "hours": "平日 8:30-17:15", "services": ["水道開栓", "料金"]}],
+                "NTT": [{"name": "NTT東日本茨城支店", "phone": "116", "address": "水戸市城南1-6-5", "hours": "平日 9:00-17:00", "services": ["電話工事", "故障修理"]}],
+                "下水道": [{"name": "土浦市上下水道部", "phone": "029-826-1111", "address": "土浦市大和町9-1", "hours": "平日 8:30-17:15", "services": ["下水道修理", "排水設備"]}]
+            }
+        },
+        "ひたちなか市": {
+            "": {
+                "労基署": [{"name": "水戸労働基準監督署", "phone": "029-224-6214", "address": "水戸市白梅2-1-44", "hours": "平日 8:30-17:15", "services": ["労働相談", "労災申請"]}],
+                "警察署": [{"name": "ひたちなか警察署", "phone": "029-272-0110", "address": "ひたちなか市石川町20-26", "hours": "24時間", "services": ["事件事故", "遺失物"]}],
+                "市区町村役所": [{"name": "ひたちなか市役所", "phone": "029-273-0111", "address": "ひたちなか市東石川2-10-1", "hours": "平日 8:30-17:15", "services": ["住民票", "戸籍"]}],
+                "消防署": [{"name": "ひたちなか市消防本部", "phone": "029-272-2931", "address": "ひたちなか市石川町14-6", "hours": "24時間", "services": ["火災通報", "救急車"]}],
+                "ガス": [{"name": "東部ガスひたちなか営業所", "phone": "029-272-3521", "address": "ひたちなか市石川町14-20", "hours": "平日 8:30-17:00", "services": ["ガス開栓", "緊急通報"]}],
+                "電力": [{"name": "東京電力パワーグリッド水戸支社", "phone": "0120-995-007", "address": "水戸市城南1-6-5", "hours": "平日 9:00-17:00", "services": ["停電情報", "電気工事"]}],
+                "病院": [{"name": "ひたちなか総合病院", "phone": "029-354-5111", "address": "ひたちなか市石川町20-1", "hours": "24時間救急", "services": ["総合診療", "救急医療"]}],
+                "保健所": [{"name": "茨城県ひたちなか保健所", "phone": "029-265-5515", "address": "ひたちなか市石川町3-21", "hours": "平日 8:30-17:15", "services": ["健康相談", "予防接種"]}],
+                "水道": [{"name": "ひたちなか市上下水道部", "phone": "029-273-0111", "address": "ひたちなか市東石川2-10-1", "hours": "平日 8:30-17:15", "services": ["水道開栓", "料金"]}],
+                "NTT": [{"name": "NTT東日本茨城支店", "phone": "116", "address": "水戸市城南1-6-5", "hours": "平日 9:00-17:00", "services": ["電話工事", "故障修理"]}],
+                "下水道": [{"name": "ひたちなか市上下水道部", "phone": "029-273-0111", "address": "ひたちなか市東石川2-10-1", "hours": "平日 8:30-17:15", "services": ["下水道修理", "排水設備"]}]
+            }
+        },
+        "古河市": {
+            "": {
+                "労基署": [{"name": "古河労働基準監督署", "phone": "0280-32-2154", "address": "古河市横山町1-2-20", "hours": "平日 8:30-17:15", "services": ["労働相談", "労災申請"]}],
+                "警察署": [{"name": "古河警察署", "phone": "0280-32-0110", "address": "古河市横山町1-3-5", "hours": "24時間", "services": ["事件事故", "遺失物"]}],
+                "市区町村役所": [{"name": "古河市役所", "phone": "0280-22-5111", "address": "古河市長谷町38-18", "hours": "平日 8:30-17:15", "services": ["住民票", "戸籍"]}],
+                "消防署": [{"name": "古河市消防本部", "phone": "0280-33-0119", "address": "古河市下山町9-8", "hours": "24時間", "services": ["火災通報", "救急車"]}],
+                "ガス": [{"name": "東部ガス古河営業所", "phone": "0280-32-0077", "address": "古河市横山町2-10-46", "hours": "平日 8:30-17:00", "services": ["ガス開栓", "緊急通報"]}],
+                "電力": [{"name": "東京電力パワーグリッド古河支社", "phone": "0120-995-007", "address": "古河市横山町2-8-5", "hours": "平日 9:00-17:00", "services": ["停電情報", "電気工事"]}],
+                "病院": [{"name": "古河赤十字病院", "phone": "0280-23-7111", "address": "古河市下山町1-1", "hours": "24時間救急", "services": ["総合診療", "救急医療"]}],
+                "保健所": [{"name": "茨城県古河保健所", "phone": "0280-32-3021", "address": "古河市下山町1-1", "hours": "平日 8:30-17:15", "services": ["健康相談", "予防接種"]}],
+                "水道": [{"name": "古河市水道部", "phone": "0280-22-5111", "address": "古河市長谷町38-18", "hours": "平日 8:30-17:15", "services": ["水道開栓", "料金"]}],
+                "NTT": [{"name": "NTT東日本茨城支店", "phone": "116", "address": "水戸市城南1-6-5", "hours": "平日 9:00-17:00", "services": ["電話工事", "故障修理"]}],
+                "下水道": [{"name": "古河市上下水道部", "phone": "0280-22-5111", "address": "古河市長谷町38-18", "hours": "平日 8:30-17:15", "services": ["下水道修理", "排水設備"]}]
+            }
+        },
+        "石岡市": {
+            "": {
+                "労基署": [{"name": "土浦労働基準監督署", "phone": "029-822-2654", "address": "土浦市中央1-10-7", "hours": "平日 8:30-17:15", "services": ["労働相談", "労災申請"]}],
+                "警察署": [{"name": "石岡警察署", "phone": "0299-24-0110", "address": "石岡市石岡1-1-54", "hours": "24時間", "services": ["事件事故", "遺失物"]}],
+                "市区町村役所": [{"name": "石岡市役所", "phone": "0299-23-1111", "address": "石岡市石岡1-1-1", "hours": "平日 8:30-17:15", "services": ["住民票", "戸籍"]}],
+                "消防署": [{"name": "石岡市消防本部", "phone": "0299-27-0119", "address": "石岡市石岡1-2-15", "hours": "24時間", "services": ["火災通報", "救急車"]}],
+                "ガス": [{"name": "東部ガス石岡営業所", "phone": "0299-22-2277", "address": "石岡市府中1-1-5", "hours": "平日 8:30-17:00", "services": ["ガス開栓", "緊急通報"]}],
+                "電力": [{"name": "東京電力パワーグリッド土浦支社", "phone": "0120-995-007", "address": "土浦市中央2-16-4", "hours": "平日 9:00-17:00", "services": ["停電情報", "電気工事"]}],
+                "病院": [{"name": "石岡第一病院", "phone": "0299-22-2190", "address": "石岡市石岡1-1-35", "hours": "24時間救急", "services": ["総合診療", "救急医療"]}],
+                "保健所": [{"name": "茨城県土浦保健所", "phone": "029-821-5342", "address": "土浦市下高津2-7-46", "hours": "平日 8:30-17:15", "services": ["健康相談", "予防接種"]}],
+                "水道": [{"name": "石岡市上下水道部", "phone": "0299-23-1111", "address": "石岡市石岡1-1-1", "hours": "平日 8:30-17:15", "services": ["水道開栓", "料金"]}],
+                "NTT": [{"name": "NTT東日本茨城支店", "phone": "116", "address": "水戸市城南1-6-5", "hours": "平日 9:00-17:00", "services": ["電話工事", "故障修理"]}],
+                "下水道": [{"name": "石岡市上下水道部", "phone": "0299-23-1111", "address": "石岡市石岡1-1-1", "hours": "平日 8:30-17:15", "services": ["下水道修理", "排水設備"]}]
+            }
+        },
+        "結城市": {
+            "": {
+                "労基署": [{"name": "古河労働基準監督署", "phone": "0280-32-2154", "address": "古河市横山町1-2-20", "hours": "平日 8:30-17:15", "services": ["労働相談", "労災申請"]}],
+                "警察署": [{"name": "結城警察署", "phone": "0296-33-0110", "address": "結城市結城1447", "hours": "24時間", "services": ["事件事故", "遺失物"]}],
+                "市区町村役所": [{"name": "結城市役所", "phone": "0296-32-1111", "address": "結城市中央町2-3", "hours": "平日 8:30-17:15", "services": ["住民票", "戸籍"]}],
+                "消防署": [{"name": "結城市消防本部", "phone": "0296-32-5119", "address": "結城市中央町2-5", "hours": "24時間", "services": ["火災通報", "救急車"]}],
+                "ガス": [{"name": "東部ガス結城営業所", "phone": "0296-32-2311", "address": "結城市中央町2-5-7", "hours": "平日 8:30-17:00", "services": ["ガス開栓", "緊急通報"]}],
+                "電力": [{"name": "東京電力パワーグリッド古河支社", "phone": "0120-995-007", "address": "古河市横山町2-8-5", "hours": "平日 9:00-17:00", "services": ["停電情報", "電気工事"]}],
+                "病院": [{"name": "結城病院", "phone": "0296-33-4161", "address": "結城市結城9629-1", "hours": "平日 8:30-17:00", "services": ["内科", "外科"]}],
+                "保健所": [{"name": "茨城県古河保健所", "phone": "0280-32-3021", "address": "古河市下山町1-1", "hours": "平日 8:30-17:15", "services": ["健康相談", "予防接種"]}],
+                "水道": [{"name": "結城市上下水道課", "phone": "0296-32-1111", "address": "結城市中央町2-3", "hours": "平日 8:30-17:15", "services": ["水道開栓", "料金"]}],
+                "NTT": [{"name": "NTT東日本茨城支店", "phone": "116", "address": "水戸市城南1-6-5", "hours": "平日 9:00-17:00", "services": ["電話工事", "故障修理"]}],
+                "下水道": [{"name": "結城市上下水道課", "phone": "0296-32-1111", "address": "結城市中央町2-3", "hours": "平日 8:30-17:15", "services": ["下水道修理", "排水設備"]}]
+            }
+        },
+        "龍ケ崎市": {
+            "": {
+                "労基署": [{"name": "土浦労働基準監督署", "phone": "029-822-2654", "address": "土浦市中央1-10-7", "hours": "平日 8:30-17:15", "services": ["労働相談", "労災申請"]}],
+                "警察署": [{"name": "龍ケ崎警察署", "phone": "0297-64-0110", "address": "龍ケ崎市3777", "hours": "24時間", "services": ["事件事故", "遺失物"]}],
+                "市区町村役所": [{"name": "龍ケ崎市役所", "phone": "0297-64-1111", "address": "龍ケ崎市3710", "hours": "平日 8:30-17:15", "services": ["住民票", "戸籍"]}],
+                "消防署": [{"name": "龍ケ崎市消防本部", "phone": "0297-64-0119", "address": "龍ケ崎市3777", "hours": "24時間", "services": ["火災通報", "救急車"]}],
+                "ガス": [{"name": "東部ガス龍ケ崎営業所", "phone": "0297-64-2371", "address": "龍ケ崎市松ケ丘1-14-6", "hours": "平日 8:30-17:00", "services": ["ガス開栓", "緊急通報"]}],
+                "電力": [{"name": "東京電力パワーグリッド土浦支社", "phone": "0120-995-007", "address": "土浦市中央2-16-4", "hours": "平日 9:00-17:00", "services": ["停電情報", "電気工事"]}],
+                "病院": [{"name": "龍ケ崎済生会病院", "phone": "0297-63-7111", "address": "龍ケ崎市中里1-1", "hours": "24時間救急", "services": ["総合診療", "救急医療"]}],
+                "保健所": [{"name": "茨城県竜ケ崎保健所", "phone": "0297-62-2161", "address": "龍ケ崎市2983-1", "hours": "平日 8:30-17:15", "services": ["健康相談", "予防接種"]}],
+                "水道": [{"name": "龍ケ崎市上下水道部", "phone": "0297-64-1111", "address": "龍ケ崎市3710", "hours": "平日 8:30-17:15", "services": ["水道開栓", "料金"]}],
+                "NTT": [{"name": "NTT東日本茨城支店", "phone": "116", "address": "水戸市城南1-6-5", "hours": "平日 9:00-17:00", "services": ["電話工事", "故障修理"]}],
+                "下水道": [{"name": "龍ケ崎市上下水道部", "phone": "0297-64-1111", "address": "龍ケ崎市3710", "hours": "平日 8:30-17:15", "services": ["下水道修理", "排水設備"]}]
+            }
+        },
+        "下妻市": {
+            "": {
+                "労基署": [{"name": "古河労働基準監督署", "phone": "0280-32-2154", "address": "古河市横山町1-2-20", "hours": "平日 8:30-17:15", "services": ["労働相談", "労災申請"]}],
+                "警察署": [{"name": "下妻警察署", "phone": "0296-43-0110", "address": "下妻市下妻乙1140-3", "hours": "24時間", "services": ["事件事故", "遺失物"]}],
+                "市区町村役所": [{"name": "下妻市役所", "phone": "0296-43-2111", "address": "下妻市本城町2-22", "hours": "平日 8:30-17:15", "services": ["住民票", "戸籍"]}],
+                "消防署": [{"name": "下妻市消防本部", "phone": "0296-44-7979", "address": "下妻市下妻乙1170-7", "hours": "24時間", "services": ["火災通報", "救急車"]}],
+                "ガス": [{"name": "東部ガス下妻営業所", "phone": "0296-43-2478", "address": "下妻市下妻乙1140-1", "hours": "平日 8:30-17:00", "services": ["ガス開栓", "緊急通報"]}],
+                "電力": [{"name": "東京電力パワーグリッド古河支社", "phone": "0120-995-007", "address": "古河市横山町2-8-5", "hours": "平日 9:00-17:00", "services": ["停電情報", "電気工事"]}],
+                "病院": [{"name": "下妻第一病院", "phone": "0296-43-3295", "address": "下妻市下妻乙99", "hours": "平日 8:30-17:00", "services": ["内科", "外科"]}],
+                "保健所": [{"name": "茨城県古河保健所", "phone": "0280-32-3021", "address": "古河市下山町1-1", "hours": "平日 8:30-17:15", "services": ["健康相談", "予防接種"]}],
+                "水道": [{"name": "下妻市上下水道課", "phone": "0296-43-2111", "address": "下妻市本城町2-22", "hours": "平日 8:30-17:15", "services": ["水道開栓", "料金"]}],
+                "NTT": [{"name": "NTT東日本茨城支店", "phone": "116", "address": "水戸市城南1-6-5", "hours": "平日 9:00-17:00", "services": ["電話工事", "故障修理"]}],
+                "下水道": [{"name": "下妻市上下水道課", "phone": "0296-43-2111", "address": "下妻市本城町2-22", "hours": "平日 8:30-17:15", "services": ["下水道修理", "排水設備"]}]
+            }
+        },
+        "常総市": {
+            "": {
+                "労基署": [{"name": "古河労働基準監督署", "phone": "0280-32-2154", "address": "古河市横山町1-2-20", "hours": "平日 8:30-17:15", "services": ["労働相談", "労災申請"]}],
+                "警察署": [{"name": "常総警察署", "phone": "0297-27-0110", "address": "常総市水海道諏訪町3201", "hours": "24時間", "services": ["事件事故", "遺失物"]}],
+                "市区町村役所": [{"name": "常総市役所", "phone": "0297-23-2111", "address": "常総市水海道諏訪町3222-3", "hours": "平日 8:30-17:15", "services": ["住民票", "戸籍"]}],
+                "消防署": [{"name": "常総市消防本部", "phone": "0297-22-0119", "address": "常総市水海道諏訪町3222", "hours": "24時間", "services": ["火災通報", "救急車"]}],
+                "ガス": [{"name": "東部ガス水海道営業所", "phone": "0297-23-1811", "address": "常総市水海道諏訪町3201", "hours": "平日 8:30-17:00", "services": ["ガス開栓", "緊急通報"]}],
+                "電力": [{"name": "東京電力パワーグリッド古河支社", "phone": "0120-995-007", "address": "古河市横山町2-8-5", "hours": "平日 9:00-17:00", "services": ["停電情報", "電気工事"]}],
+                "病院": [{"name": "きぬ医師会病院", "phone": "0297-23-1771", "address": "常総市水海道森下町4447", "hours": "24時間救急", "services": ["総合診療", "救急医療"]}],
+                "保健所": [{"name": "茨城県古河保健所", "phone": "0280-32-3021", "address": "古河市下山町1-1", "hours": "平日 8:30-17:15", "services": ["健康相談", "予防接種"]}],
+                "水道": [{"name": "常総市上下水道課", "phone": "0297-23-2111", "address": "常総市水海道諏訪町3222-3", "hours": "平日 8:30-17:15", "services": ["水道開栓", "料金"]}],
+                "NTT": [{"name": "NTT東日本茨城支店", "phone": "116", "address": "水戸市城南1-6-5", "hours": "平日 9:00-17:00", "services": ["電話工事", "故障修理"]}],
+                "下水道": [{"name": "常総市上下水道課", "phone": "0297-23-2111", "address": "常総市水海道諏訪町3222-3", "hours": "平日 8:30-17:15", "services": ["下水道修理", "排水設備"]}]
+            }
+        },
+        "常陸太田市": {
+            "": {
+                "労基署": [{"name": "日立労働基準監督署", "phone": "0294-22-0164", "address": "日立市若葉町2-4-1", "hours": "平日 8:30-17:15", "services": ["労働相談", "労災申請"]}],
+                "警察署": [{"name": "常陸太田警察署", "phone": "0294-72-0110", "address": "常陸太田市山下町4119", "hours": "24時間", "services": ["事件事故", "遺失物"]}],
+                "市区町村役所": [{"name": "常陸太田市役所", "phone": "0294-72-3111", "address": "常陸太田市金井町3690", "hours": "平日 8:30-17:15", "services": ["住民票", "戸籍"]}],
+                "消防署": [{"name": "常陸太田市消防本部", "phone": "0294-73-0119", "address": "常陸太田市金井町3690", "hours": "24時間", "services": ["火災通報", "救急車"]}],
+                "ガス": [{"name": "東部ガス常陸太田営業所", "phone": "0294-72-4567", "address": "常陸太田市金井町3280", "hours": "平日 8:30-17:00", "services": ["ガス開栓", "緊急通報"]}],
+                "電力": [{"name": "東京電力パワーグリッド日立支社", "phone": "0120-995-007", "address": "日立市幸町2-10-22", "hours": "平日 9:00-17:00", "services": ["停電情報", "電気工事"]}],
+                "病院": [{"name": "常陸太田市民病院", "phone": "0294-73-1221", "address": "常陸太田市金井町3690", "hours": "平日 8:30-17:00", "services": ["内科", "外科"]}],
+                "保健所": [{"name": "茨城県常陸太田保健所", "phone": "0294-72-1244", "address": "常陸太田市金井町3659", "hours": "平日 8:30-17:15", "services": ["健康相談", "予防接種"]}],
+                "水道": [{"name": "常陸太田市上下水道部", "phone": "0294-72-3111", "address": "常陸太田市金井町3690", "hours": "平日 8:30-17:15", "services": ["水道開栓", "料金"]}],
+                "NTT": [{"name": "NTT東日本茨城支店", "phone": "116", "address": "水戸市城南1-6-5", "hours": "平日 9:00-17:00", "services": ["電話工事", "故障修理"]}],
+                "下水道": [{"name": "常陸太田市上下水道部", "phone": "0294-72-3111", "address": "常陸太田市金井町3690", "hours": "平日 8:30-17:15", "services": ["下水道修理", "排水設備"]}]
+            }
+        },
+        "高萩市": {
+            "": {
+                "労基署": [{"name": "日立労働基準監督署", "phone": "0294-22-0164", "address": "日立市若葉町2-4-1", "hours": "平日 8:30-17:15", "services": ["労働相談", "労災申請"]}],
+                "警察署": [{"name": "高萩警察署", "phone": "0293-23-0110", "address": "高萩市高萩2976", "hours": "24時間", "services": ["事件事故", "遺失物"]}],
+                "市区町村役所": [{"name": "高萩市役所", "phone": "0293-23-2111", "address": "高萩市本町1-100-1", "hours": "平日 8:30-17:15", "services": ["住民票", "戸籍"]}],
+                "消防署": [{"name": "高萩市消防本部", "phone": "0293-23-3309", "address": "高萩市本町1-124", "hours": "24時間", "services": ["火災通報", "救急車"]}],
+                "ガス": [{"name": "東部ガス高萩営業所", "phone": "0293-23-2811", "address": "高萩市高萩2961", "hours": "平日 8:30-17:00", "services": ["ガス開栓", "緊急通報"]}],
+                "電力": [{"name": "東京電力パワーグリッド日立支社", "phone": "0120-995-007", "address": "日立市幸町2-10-22", "hours": "平日 9:00-17:00", "services": ["停電情報", "電気工事"]}],
+                "病院": [{"name": "高萩協同病院", "phone": "0293-23-1122", "address": "高萩市高萩2008", "hours": "24時間救急", "services": ["総合診療", "救急医療"]}],
+                "保健所": [{"name": "茨城県日立保健所", "phone": "0294-22-4188", "address": "日立市助川町2-6-15", "hours": "平日 8:30-17:15", "services": ["健康相談", "予防接種"]}],
+                "水道": [{"name": "高萩市上下水道課", "phone": "0293-23-2111", "address": "高萩市本町1-100-1", "hours": "平日 8:30-17:15", "services": ["水道開栓", "料金"]}],
+                "NTT": [{"name": "NTT東日本茨城支店", "phone": "116", "address": "水戸市城南1-6-5", "hours": "平日 9:00-17:00", "services": ["電話工事", "故障修理"]}],
+                "下水道": [{"name": "高萩市上下水道課", "phone": "0293-23-2111", "address": "高萩市本町1-100-1", "hours": "平日 8:30-17:15", "services": ["下水道修理", "排水設備"]}]
+            }
+        },
+        "北茨城市": {
+            "": {
+                "労基署": [{"name": "日立労働基準監督署", "phone": "0294-22-0164", "address": "日立市若葉町2-4-1", "hours": "平日 8:30-17:15", "services": ["労働相談", "労災申請"]}],
+                "警察署": [{"name": "北茨城警察署", "phone": "0293-42-0110", "address": "北茨城市磯原町磯原1630", "hours": "24時間", "services": ["事件事故", "遺失物"]}],
+                "市区町村役所": [{"name": "北茨城市役所", "phone": "0293-43-1111", "address": "北茨城市磯原町磯原1630", "hours": "平日 8:30-17:15", "services": ["住民票", "戸籍"]}],
+                "消防署": [{"name": "北茨城市消防本部", "phone": "0293-43-0119", "address": "北茨城市磯原町磯原1630", "hours": "24時間", "services": ["火災通報", "救急車"]}],
+                "ガス": [{"name": "東部ガス北茨城営業所", "phone": "0293-42-2011", "address": "北茨城市磯原町磯原1537", "hours": "平日 8:30-17:00", "services": ["ガス開栓", "緊急通報"]}],
+                "電力": [{"name": "東京電力パワーグリッド日立支社", "phone": "0120-995-007", "address": "日立市幸町2-10-22", "hours": "平日 9:00-17:00", "services": ["停電情報", "電気工事"]}],
+                "病院": [{"name": "北茨城市民病院", "phone": "0293-46-1121", "address": "北茨城市関南町神岡下570", "hours": "24時間救急", "services": ["総合診療", "救急医療"]}],
+                "保健所": [{"name": "茨城県日立保健所", "phone": "0294-22-4188", "address": "日立市助川町2-6-15", "hours": "平日 8:30-17:15", "services": ["健康相談", "予防接種"]}],
+                "水道": [{"name": "北茨城市上下水道課", "phone": "0293-43-1111", "address": "北茨城市磯原町磯原1630", "hours": "平日 8:30-17:15", "services": ["水道開栓", "料金"]}],
+                "NTT": [{"name": "NTT東日本茨城支店", "phone": "116", "address": "水戸市城南1-6-5", "hours": "平日 9:00-17:00", "services": ["電話工事", "故障修理"]}],
+                "下水道": [{"name": "北茨城市上下水道課", "phone": "0293-43-1111", "address": "北茨城市磯原町磯原1630", "hours": "平日 8:30-17:15", "services": ["下水道修理", "排水設備"]}]
+            }
+        },
+        "笠間市": {
+            "": {
+                "労基署": [{"name": "水戸労働基準監督署", "phone": "029-224-6214", "address": "水戸市白梅2-1-44", "hours": "平日 8:30-17:15", "services": ["労働相談", "労災申請"]}],
+                "警察署": [{"name": "笠間警察署", "phone": "0296-77-0110", "address": "笠間市石井2026-5", "hours": "24時間", "services": ["事件事故", "遺失物"]}],
+                "市区町村役所": [{"name": "笠間市役所", "phone": "0296-77-1101", "address": "笠間市中央3-2-1", "hours": "平日 8:30-17:15", "services": ["住民票", "戸籍"]}],
+                "消防署": [{"name": "笠間市消防本部", "phone": "0296-72-0119", "address": "笠間市石井2016-1", "hours": "24時間", "services": ["火災通報", "救急車"]}],
+                "ガス": [{"name": "東部ガス笠間営業所", "phone": "0296-77-0311", "address": "笠間市石井2016", "hours": "平日 8:30-17:00", "services": ["ガス開栓", "緊急通報"]}],
+                "電力": [{"name": "東京電力パワーグリッド水戸支社", "phone": "0120-995-007", "address": "水戸市城南1-6-5", "hours": "平日 9:00-17:00", "services": ["停電情報", "電気工事"]}],
+                "病院": [{"name": "笠間市立病院", "phone": "0296-77-0034", "address": "笠間市南友部1966-1", "hours": "平日 8:30-17:00", "services": ["内科", "外科"]}],
+                "保健所": [{"name": "茨城県水戸保健所", "phone": "029-241-0100", "address": "水戸市笠原町993-2", "hours": "平日 8:30-17:15", "services": ["健康相談", "予防接種"]}],
+                "水道": [{"name": "笠間市上下水道課", "phone": "0296-77-1101", "address": "笠間市中央3-2-1", "hours": "平日 8:30-17:15", "services": ["水道開栓", "料金"]}],
+                "NTT": [{"name": "NTT東日本茨城支店", "phone": "116", "address": "水戸市城南1-6-5", "hours": "平日 9:00-17:00", "services": ["電話工事", "故障修理"]}],
+                "下水道": [{"name": "笠間市上下水道課", "phone": "0296-77-1101", "address": "笠間市中央3-2-1", "hours": "平日 8:30-17:15", "services": ["下水道修理", "排水設備"]}]
+            }
+        },
+        "取手市": {
+            "": {
+                "労基署": [{"name": "土浦労働基準監督署", "phone": "029-822-2654", "address": "土浦市中央1-10-7", "hours": "平日 8:30-17:15", "services": ["労働相談", "労災申請"]}],
+                "警察署": [{"name": "取手警察署", "phone": "0297-77-0110", "address": "取手市井野台3-8-3", "hours": "24時間", "services": ["事件事故", "遺失物"]}],
+                "市区町村役所": [{"name": "取手市役所", "phone": "0297-74-2141", "address": "取手市寺田5139", "hours": "平日 8:30-17:15", "services": ["住民票", "戸籍"]}],
+                "消防署": [{"name": "取手市消防本部", "phone": "0297-74-0119", "address": "取手市井野台3-9-1", "hours": "24時間", "services": ["火災通報", "救急車"]}],
+                "ガス": [{"name": "東部ガス取手営業所", "phone": "0297-74-3077", "address": "取手市井野台3-9-3", "hours": "平日 8:30-17:00", "services": ["ガス開栓", "緊急通報"]}],
+                "電力": [{"name": "東京電力パワーグリッド土浦支社", "phone": "0120-995-007", "address": "土浦市中央2-16-4", "hours": "平日 9:00-17:00", "services": ["停電情報", "電気工事"]}],
+                "病院": [{"name": "取手協同病院", "phone": "0297-74-5551", "address": "取手市本郷2-1-1", "hours": "24時間救急", "services": ["総合診療", "救急医療"]}],
+                "保健所": [{"name": "茨城県竜ケ崎保健所", "phone": "0297-62-2161", "address": "龍ケ崎市2983-1", "hours": "平日 8:30-17:15", "services": ["健康相談", "予防接種"]}],
+                "水道": [{"name": "取手市上下水道課", "phone": "0297-74-2141", "address": "取手市寺田5139", "hours": "平日 8:30-17:15", "services": ["水道開栓", "料金"]}],
+                "NTT": [{"name": "NTT東日本茨城支店", "phone": "116", "address": "水戸市城南1-6-5", "hours": "平日 9:00-17:00", "services": ["電話工事", "故障修理"]}],
+                "下水道": [{"name": "取手市上下水道課", "phone": "0297-74-2141", "address": "取手市寺田5139", "hours": "平日 8:30-17:15", "services": ["下水道修理", "排水設備"]}]
+            }
+        },
+        "牛久市": {
+            "": {
+                "労基署": [{"name": "土浦労働基準監督署", "phone": "029-822-2654", "address": "土浦市中央1-10-7", "hours": "平日 8:30-17:15", "services": ["労働相談", "労災申請"]}],
+                "警察署": [{"name": "牛久警察署", "phone": "029-872-0110", "address": "牛久市中央4-18-1", "hours": "24時間", "services": ["事件事故", "遺失物"]}],
+                "市区町村役所": [{"name": "牛久市役所", "phone": "029-873-2111", "address": "牛久市中央3-15-1", "hours": "平日 8:30-17:15", "services": ["住民票", "戸籍"]}],
+                "消防署": [{"name": "牛久市消防本部", "phone": "029-873-6326", "address": "牛久市中央4-18-6", "hours": "24時間", "services": ["火災通報", "救急車"]}],
+                "ガス": [{"name": "東部ガス牛久営業所", "phone": "029-873-4477", "address": "牛久市中央4-16-8", "hours": "平日 8:30-17:00", "services": ["ガス開栓", "緊急通報"]}],
+                "電力": [{"name": "東京電力パワーグリッド土浦支社", "phone": "0120-995-007", "address": "土浦市中央2-16-4", "hours": "平日 9:00-17:00", "services": ["停電情報", "電気工事"]}],
+                "病院": [{"name": "牛久愛和総合病院", "phone": "029-873-3111", "address": "牛久市猪子町896", "hours": "24時間救急", "services": ["総合診療", "救急医療"]}],
+                "保健所": [{"name": "茨城県竜ケ崎保健所", "phone": "0297-62-2161", "address": "龍ケ崎市2983-1", "hours": "平日 8:30-17:15", "services": ["健康相談", "予防接種"]}],
+                "水道": [{"name": "牛久市上下水道課", "phone": "029-873-2111", "address": "牛久市中央3-15-1", "hours": "平日 8:30-17:15", "services": ["水道開栓", "料金"]}],
+                "NTT": [{"name": "NTT東日本茨城支店", "phone": "116", "address": "水戸市城南1-6-5", "hours": "平日 9:00-17:00", "services": ["電話工事", "故障修理"]}],
+                "下水道": [{"name": "牛久市上下水道課", "phone": "029-873-2111", "address": "牛久市中央3-15-1", "hours": "平日 8:30-17:15", "services": ["下水道修理", "排水設備"]}]
+            }
+        },
+        "つくば市": {
+            "": {
+                "労基署": [{"name": "土浦労働基準監督署", "phone": "029-822-2654", "address": "土浦市中央1-10-7", "hours": "平日 8:30-17:15", "services": ["労働相談", "労災申請"]}],
+                "警察署": [{"name": "つくば中央警察署", "phone": "029-851-0110", "address": "つくば市研究学園1-1-1", "hours": "24時間", "services": ["事件事故", "遺失物"]}],
+                "市区町村役所": [{"name": "つくば市役所", "phone": "029-883-1111", "address": "つくば市研究学園1-1-1", "hours": "平日 8:30-17:15", "services": ["住民票", "戸籍"]}],
+                "消防署": [{"name": "つくば市消防本部", "phone": "029-851-0119", "address": "つくば市苅間1-1-1", "hours": "24時間", "services": ["火災通報", "救急車"]}],
+                "ガス": [{"name": "東部ガスつくば営業所", "phone": "029-856-1189", "address": "つくば市竹園1-6-1", "hours": "平日 8:30-17:00", "services": ["ガス開栓", "緊急通報"]}],
+                "電力": [{"name": "東京電力パワーグリッド土浦支社", "phone": "0120-995-007", "address": "土浦市中央2-16-4", "hours": "平日 9:00-17:00", "services": ["停電情報", "電気工事"]}],
+                "病院": [{"name": "筑波大学附属病院", "phone": "029-853-3900", "address": "つくば市天久保2-1-1", "hours": "24時間救急", "services": ["総合診療", "救急医療"]}],
+                "保健所": [{"name": "茨城県つくば保健所", "phone": "029-851-9287", "address": "つくば市天久保2-7-5", "hours": "平日 8:30-17:15", "services": ["健康相談", "予防接種"]}],
+                "水道": [{"name": "つくば市上下水道部", "phone": "029-883-1111", "address": "つくば市研究学園1-1-1", "hours": "平日 8:30-17:15", "services": ["水道開栓", "料金"]}],
+                "NTT": [{"name": "NTT東日本茨城支店", "phone": "116", "address": "水戸市城南1-6-5", "hours": "平日 9:00-17:00", "services": ["電話工事", "故障修理"]}],
+                "下水道": [{"name": "つくば市上下水道部", "phone": "029-883-1111", "address": "つくば市研究学園1-1-1", "hours": "平日 8:30-17:15", "services": ["下水道修理", "排水設備"]}]
+            }
+        },
+        "鹿嶋市": {
+            "": {
+                "労基署": [{"name": "土浦労働基準監督署", "phone": "029-822-2654", "address": "土浦市中央1-10-7", "hours": "平日 8:30-17:15", "services": ["労働相談", "労災申請"]}],
+                "警察署": [{"name": "鹿嶋警察署", "phone": "0299-83-0110", "address": "鹿嶋市宮中1-8-25", "hours": "24時間", "services": ["事件事故", "遺失物"]}],
+                "市区町村役所": [{"name": "鹿嶋市役所", "phone": "0299-82-2911", "address": "鹿嶋市平井1187-1", "hours": "平日 8:30-17:15", "services": ["住民票", "戸籍"]}],
+                "消防署": [{"name": "鹿嶋市消防本部", "phone": "0299-83-5399", "address": "鹿嶋市宮中1-8-30", "hours": "24時間", "services": ["火災通報", "救急車"]}],
+                "ガス": [{"name": "東部ガス鹿嶋営業所", "phone": "0299-82-1177", "address": "鹿嶋市宮中1-8-12", "hours": "平日 8:30-17:00", "services": ["ガス開栓", "緊急通報"]}],
+                "電力": [{"name": "東京電力パワーグリッド土浦支社", "phone": "0120-995-007", "address": "土浦市中央2-16-4", "hours": "平日 9:00-17:00", "services": ["停電情報", "電気工事"]}],
+                "病院": [{"name": "鹿嶋労災病院", "phone": "0299-84-1251", "address": "鹿嶋市須賀1-1", "hours": "24時間救急", "services": ["総合診療", "救急医療"]}],
+                "保健所": [{"name": "茨城県潮来保健所", "phone": "0299-66-2114", "address": "潮来市茂木1220", "hours": "平日 8:30-17:15", "services": ["健康相談", "予防接種"]}],
+                "水道": [{"name": "鹿嶋市上下水道課", "phone": "0299-82-2911", "address": "鹿嶋市平井1187-1", "hours": "平日 8:30-17:15", "services": ["水道開栓", "料金"]}],
+                "NTT": [{"name": "NTT東日本茨城支店", "phone": "116", "address": "水戸市城南1-6-5", "hours": "平日 9:00-17:00", "services": ["電話工事", "故障修理"]}],
+                "下水道": [{"name": "鹿嶋市上下水道課", "phone": "0299-82-2911", "address": "鹿嶋市平井1187-1", "hours": "平日 8:30-17:15", "services": ["下水道修理", "排水設備"]}]
+            }
+        },
+        "潮来市": {
+            "": {
+                "労基署": [{"name": "土浦労働基準監督署", "phone": "029-822-2654", "address": "土浦市中央1-10-7", "hours": "平日 8:30-17:15", "services": ["労働相談", "労災申請"]}],
+                "警察署": [{"name": "潮来警察署", "phone": "0299-66-0110", "address": "潮来市潮来466-4", "hours": "24時間", "services": ["事件事故", "遺失物"]}],
+                "市区町村役所": [{"name": "潮来市役所", "phone": "0299-63-1111", "address": "潮来市辻626", "hours": "平日 8:30-17:15", "services": ["住民票", "戸籍"]}],
+                "消防署": [{"name": "潮来市消防本部", "phone": "0299-66-0119", "address": "潮来市潮来440", "hours": "24時間", "services": ["火災通報", "救急車"]}],
+                "ガス": [{"name": "東部ガス潮来営業所", "phone": "0299-66-1251", "address": "潮来市潮来440-1", "hours": "平日 8:30-17:00", "services": ["ガス開栓", "緊急通報"]}],
+                "電力": [{"name": "東京電力パワーグリッド土浦支社", "phone": "0120-995-007", "address": "土浦市中央2-16-4", "hours": "平日 9:00-17:00", "services": ["停電情報", "電気工事"]}],
+                "病院": [{"name": "潮来市立病院", "phone": "0299-64-1221", "address": "潮来市辻440", "hours": "平日 8:30-17:00", "services": ["内科", "外科"]}],
+                "保健所": [{"name": "茨城県潮来保健所", "phone": "0299-66-2114", "address": "潮来市茂木1220", "hours": "平日 8:30-17:15", "services": ["健康相談", "予防接種"]}],
+                "水道": [{"name": "潮来市上下水道課", "phone": "0299-63-1111", "address": "潮来市辻626", "hours": "平日 8:30-17:15", "services": ["水道開栓", "料金"]}],
+                "NTT": [{"name": "NTT東日本茨城支店", "phone": "116", "address": "水戸市城南1-6-5", "hours": "平日 9:00-17:00", "services": ["電話工事", "故障修理"]}],
+                "下水道": [{"name": "潮来市上下水道課", "phone": "0299-63-1111", "address": "潮来市辻626", "hours": "平日 8:30-17:15", "services": ["下水道修理", "排水設備"]}]
+            }
+        },
+        "守谷市": {
+            "": {
+                "労基署": [{"name": "土浦労働基準監督署", "phone": "029-822-2654", "address": "土浦市中央1-10-7", "hours": "平日 8:30-17:15", "services": ["労働相談", "労災申請"]}],
+                "警察署": [{"name": "取手警察署", "phone": "0297-77-0110", "address": "取手市井野台3-8-3", "hours": "24時間", "services": ["事件事故", "遺失物"]}],
+                "市区町村役所": [{"name": "守谷市役所", "phone": "0297-45-1111", "address": "守谷市大柏950-1", "hours": "平日 8:30-17:15", "services": ["住民票", "戸籍"]}],
+                "消防署": [{"name": "守谷市消防本部", "phone": "0297-45-0119", "address": "守谷市大柏937-2", "hours": "24時間", "services": ["火災通報", "救急車"]}],
+                "ガス": [{"name": "東部ガス守谷営業所", "phone": "0297-48-1177", "address": "守谷市中央4-13-8", "hours": "平日 8:30-17:00", "services": ["ガス開栓", "緊急通報"]}],
+                "電力": [{"name": "東京電力パワーグリッド土浦支社", "phone": "0120-995-007", "address": "土浦市中央2-16-4", "hours": "平日 9:00-17:00", "services": ["停電情報", "電気工事"]}],
+                "病院": [{"name": "守谷慶友病院", "phone": "0297-45-3311", "address": "守谷市立沢980-1", "hours": "24時間救急", "services": ["総合診療", "救急医療"]}],
+                "保健所": [{"name": "茨城県竜ケ崎保健所", "phone": "0297-62-2161", "address": "龍ケ崎市2983-1", "hours": "平日 8:30-17:15", "services": ["健康相談", "予防接種"]}],
+                "水道": [{"name": "守谷市上下水道事務所", "phone": "0297-45-1111", "address": "守谷市大柏950-1", "hours": "平日 8:30-17:15", "services": ["水道開栓", "料金"]}],
+                "NTT": [{"name": "NTT東日本茨城支店", "phone": "116", "address": "水戸市城南1-6-5", "hours": "平日 9:00-17:00", "services": ["電話工事", "故障修理"]}],
+                "下水道": [{"name": "守谷市上下水道事務所", "phone": "0297-45-1111", "address": "守谷市大柏950-1", "hours": "平日 8:30-17:15", "services": ["下水道修理", "排水設備"]}]
+            }
+        },
+        "常陸大宮市": {
+            "": {
+                "労基署": [{"name": "日立労働基準監督署", "phone": "0294-22-0164", "address": "日立市若葉町2-4-1", "hours": "平日 8:30-17:15", "services": ["労働相談", "労災申請"]}],
+                "警察署": [{"name": "常陸大宮警察署", "phone": "0295-53-0110", "address": "常陸大宮市中富町3135-6", "hours": "24時間", "services": ["事件事故", "遺失物"]}],
+                "市区町村役所": [{"name": "常陸大宮市役所", "phone": "0295-52-1111", "address": "常陸大宮市中富町3135-6", "hours": "平日 8:30-17:15", "services": ["住民票", "戸籍"]}],
+                "消防署": [{"name": "常陸大宮市消防本部", "phone": "0295-54-0119", "address": "常陸大宮市中富町1087-14", "hours": "24時間", "services": ["火災通報", "救急車"]}],
+                "ガス": [{"name": "東部ガス常陸大宮営業所", "phone": "0295-52-2811", "address": "常陸大宮市中富町1456", "hours": "平日 8:30-17:00", "services": ["ガス開栓", "緊急通報"]}],
+                "電力": [{"name": "東京電力パワーグリッド水戸支社", "phone": "0120-995-007", "address": "水戸市城南1-6-5", "hours": "平日 9:00-17:00", "services": ["停電情報", "電気工事"]}],
+                "病院": [{"name": "常陸大宮済生会病院", "phone": "0295-53-1221", "address": "常陸大宮市田子内町3033-3", "hours": "24時間救急", "services": ["総合診療", "救急医療"]}],
+                "保健所": [{"name": "茨城県常陸大宮保健所", "phone": "0295-52-1157", "address": "常陸大宮市中富町3135-6", "hours": "平日 8:30-17:15", "services": ["健康相談", "予防接種"]}],
+                "水道": [{"name": "常陸大宮市上下水道課", "phone": "0295-52-1111", "address": "常陸大宮市中富町3135-6", "hours": "平日 8:30-17:15", "services": ["水道開栓", "料金"]}],
+                "NTT": [{"name": "NTT東日本茨城支店", "phone": "116", "address": "水戸市城南1-6-5", "hours": "平日 9:00-17:00", "services": ["電話工事", "故障修理"]}],
+                "下水道": [{"name": "常陸大宮市上下水道課", "phone": "0295-52-1111", "address": "常陸大宮市中富町3135-6", "hours": "平日 8:30-17:15", "services": ["下水道修理", "排水設備"]}]
+            }
+        },
+        "那珂市": {
+            "": {
+                "労基署": [{"name": "水戸労働基準監督署", "phone": "029-224-6214", "address": "水戸市白梅2-1-44", "hours": "平日 8:30-17:15", "services": ["労働相談", "労災申請"]}],
+                "警察署": [{"name": "那珂警察署", "phone": "029-298-0110", "address": "那珂市菅谷605-2", "hours": "24時間", "services": ["事件事故", "遺失物"]}],
+                "市区町村役所": [{"name": "那珂市役所", "phone": "029-298-1111", "address": "那珂市福田1819-5", "hours": "平日 8:30-17:15", "services": ["住民票", "戸籍"]}],
+                "消防署": [{"name": "那珂市消防本部", "phone": "029-298-7979", "address": "那珂市福田1819-5", "hours": "24時間", "services": ["火災通報", "救急車"]}],
+                "ガス": [{"name": "東部ガス那珂営業所", "phone": "029-298-3111", "address": "那珂市菅谷667-2", "hours": "平日 8:30-17:00", "services": ["ガス開栓", "緊急通報"]}],
+                "電力": [{"name": "東京電力パワーグリッド水戸支社", "phone": "0120-995-007", "address": "水戸市城南1-6-5", "hours": "平日 9:00-17:00", "services": ["停電情報", "電気工事"]}],
+                "病院": [{"name": "那珂記念クリニック", "phone": "029-298-3030", "address": "那珂市中里341-1", "hours": "平日 9:00-17:00", "services": ["内科", "循環器科"]}],
+                "保健所": [{"name": "茨城県ひたちなか保健所", "phone": "029-265-5515", "address": "ひたちなか市石川町3-21", "hours": "平日 8:30-17:15", "services": ["健康相談", "予防接種"]}],
+                "水道": [{"name": "那珂市上下水道課", "phone": "029-298-1111", "address": "那珂市福田1819-5", "hours": "平日 8:30-17:15", "services": ["水道開栓", "料金"]}],
+                "NTT": [{"name": "NTT東日本茨城支店", "phone": "116", "address": "水戸市城南1-6-5", "hours": "平日 9:00-17:00", "services": ["電話工事", "故障修理"]}],
+                "下水道": [{"name": "那珂市上下水道課", "phone": "029-298-1111", "address": "那珂市福田1819-5", "hours": "平日 8:30-17:15", "services": ["下水道修理", "排水設備"]}]
+            }
+        },
+        "筑西市": {
+            "": {
+                "労基署": [{"name": "古河労働基準監督署", "phone": "0280-32-2154", "address": "古河市横山町1-2-20", "hours": "平日 8:30-17:15", "services": ["労働相談", "労災申請"]}],
+                "警察署": [{"name": "筑西警察署", "phone": "0296-24-0110", "address": "筑西市丙209-3", "hours": "24時間", "services": ["事件事故", "遺失物"]}],
+                "市区町村役所": [{"name": "筑西市役所", "phone": "0296-24-2111", "address": "筑西市下中山732-1", "hours": "平日 8:30-17:15", "services": ["住民票", "戸籍"]}],
+                "消防署": [{"name": "筑西市消防本部", "phone": "0296-24-0119", "address": "筑西市下中山732-1", "hours": "24時間", "services": ["火災通報", "救急車"]}],
+                "ガス": [{"name": "東部ガス筑西営業所", "phone": "0296-24-6789", "address": "筑西市甲800", "hours": "平日 8:30-17:00", "services": ["ガス開栓", "緊急通報"]}],
+                "電力": [{"name": "東京電力パワーグリッド古河支社", "phone": "0120-995-007", "address": "古河市横山町2-8-5", "hours": "平日 9:00-17:00", "services": ["停電情報", "電気工事"]}],
+                "病院": [{"name": "筑西市民病院", "phone": "0296-24-9111", "address": "筑西市大塚555", "hours": "24時間救急", "services": ["総合診療", "救急医療"]}],
+                "保健所": [{"name": "茨城県筑西保健所", "phone": "0296-24-3965", "address": "筑西市甲114", "hours": "平日 8:30-17:15", "services": ["健康相談", "予防接種"]}],
+                "水道": [{"name": "筑西市上下水道課", "phone": "0296-24-2111", "address": "筑西市下中山732-1", "hours": "平日 8:30-17:15", "services": ["水道開栓", "料金"]}],
+                "NTT": [{"name": "NTT東日本茨城支店", "phone": "116", "address": "水戸市城南1-6-5", "hours": "平日 9:00-17:00", "services": ["電話工事", "故障修理"]}],
+                "下水道": [{"name": "筑西市上下水道課", "phone": "0296-24-2111", "address": "筑西市下中山732-1", "hours": "平日 8:30-17:15", "services": ["下水道修理", "排水設備"]}]
+            }
+        },
+        "坂東市": {
+            "": {
+                "労基署": [{"name": "古河労働基準監督署", "phone": "0280-32-2154", "address": "古河市横山町1-2-20", "hours": "平日 8:30-17:15", "services": ["労働相談", "労災申請"]}],
+                "警察署": [{"name": "坂東警察署", "phone": "0297-35-0110", "address": "坂東市岩井4518", "hours": "24時間", "services": ["事件事故", "遺失物"]}],
+                "市区町村役所": [{"name": "坂東市役所", "phone": "0297-35-2121", "address": "坂東市岩井4365", "hours": "平日 8:30-17:15", "services": ["住民票", "戸籍"]}],
+                "消防署": [{"name": "坂東市消防本部", "phone": "0297-35-3724", "address": "坂東市岩井3297-1", "hours": "24時間", "services": ["火災通報", "救急車"]}],
+                "ガス": [{"name": "東部ガス坂東営業所", "phone": "0297-35-4321", "address": "坂東市岩井4518-1", "hours": "平日 8:30-17:00", "services": ["ガス開栓", "緊急通報"]}],
+                "電力": [{"name": "東京電力パワーグリッド古河支社", "phone": "0120-995-007", "address": "古河市横山町2-8-5", "hours": "平日 9:00-17:00", "services": ["停電情報", "電気工事"]}],
+                "病院": [{"name": "坂東市立病院", "phone": "0297-35-3171", "address": "坂東市岩井4377", "hours": "平日 8:30-17:00", "services": ["内科", "外科"]}],
+                "保健所": [{"name": "茨城県古河保健所", "phone": "0280-32-3021", "address": "古河市下山町1-1", "hours": "平日 8:30-17:15", "services": ["健康相談", "予防接種"]}],
+                "水道": [{"name": "坂東市上下水道課", "phone": "0297-35-2121", "address": "坂東市岩井4365", "hours": "平日 8:30-17:15", "services": ["水道開栓", "料金"]}],
+                "NTT": [{"name": "NTT東日本茨城支店", "phone": "116", "address": "水戸市城南1-6-5", "hours": "平日 9:00-17:00", "services": ["電話工事", "故障修理"]}],
+                "下水道": [{"name": "坂東市上下水道課", "phone": "0297-35-2121", "address": "坂東市岩井4365", "hours": "平日 8:30-17:15", "services": ["下水道修理", "排水設備"]}]
+            }
+        },
+        "稲敷市": {
+            "": {
+                "労基署": [{"name": "土浦労働基準監督署", "phone": "029-822-2654", "address": "土浦市中央1-10-7", "hours": "平日 8:30-17:15", "services": ["労働相談", "労災申請"]}],
+                "警察署": [{"name": "稲敷警察署", "phone": "029-892-0110", "address": "稲敷市江戸崎甲1626-1", "hours": "24時間", "services": ["事件事故", "遺失物"]}],
+                "市区町村役所": [{"name": "稲敷市役所", "phone": "029-892-2000", "address": "稲敷市江戸崎甲1626", "hours": "平日 8:30-17:15", "services": ["住民票", "戸籍"]}],
+                "消防署": [{"name": "稲敷市消防本部", "phone": "029-892-3499", "address": "稲敷市江戸崎甲1626", "hours": "24時間", "services": ["火災通報", "救急車"]}],
+                "ガス": [{"name": "東部ガス稲敷営業所", "phone": "029-892-3011", "address": "稲敷市江戸崎甲1626-1", "hours": "平日 8:30-17:00", "services": ["ガス開栓", "緊急通報"]}],
+                "電力": [{"name": "東京電力パワーグリッド土浦支社", "phone": "0120-995-007", "address": "土浦市中央2-16-4", "hours": "平日 9:00-17:00", "services": ["停電情報", "電気工事"]}],
+                "病院": [{"name": "稲敷市立病院", "phone": "029-892-2631", "address": "稲敷市江戸崎甲1-1", "hours": "平日 8:30-17:00", "services": ["内科", "外科"]}],
+                "保健所": [{"name": "茨城県土浦保健所", "phone": "029-821-5342", "address": "土浦市下高津2-7-46", "hours": "平日 8:30-17:15", "services": ["健康相談", "予防接種"]}],
+                "水道": [{"name": "稲敷市上下水道課", "phone": "029-892-2000", "address": "稲敷市江戸崎甲1626", "hours": "平日 8:30-17:15", "services": ["水道開栓", "料金"]}],
+                "NTT": [{"name": "NTT東日本茨城支店", "phone": "116", "address": "水戸市城南1-6-5", "hours": "平日 9:00-17:00", "services": ["電話工事", "故障修理"]}],
+                "下水道": [{"name": "稲敷市上下水道課", "phone": "029-892-2000", "address": "稲敷市江戸崎甲1626", "hours": "平日 8:30-17:15", "services": ["下水道修理", "排水設備"]}]
+            }
+        },
+        "かすみがうら市": {
+            "": {
+                "労基署": [{"name": "土浦労働基準監督署", "phone": "029-822-2654", "address": "土浦市中央1-10-7", "hours": "平日 8:30-17:15", "services": ["労働相談", "労災申請"]}],
+                "警察署": [{"name": "土浦警察署", "phone": "029-821-0110", "address": "土浦市中央2-11-2", "hours": "24時間", "services": ["事件事故", "遺失物"]}],
+                "市区町村役所": [{"name": "かすみがうら市役所", "phone": "029-897-1111", "address": "かすみがうら市上土田461", "hours": "平日 8:30-17:15", "services": ["住民票", "戸籍"]}],
+                "消防署": [{"name": "かすみがうら市消防本部", "phone": "029-897-0119", "address": "かすみがうら市上土田469", "hours": "24時間", "services": ["火災通報", "救急車"]}],
+                "ガス": [{"name": "東部ガスかすみがうら営業所", "phone": "029-897-1234", "address": "かすみがうら市上土田461", "hours": "平日 8:30-17:00", "services": ["ガス開栓", "緊急通報"]}],
+                "電力": [{"name": "東京電力パワーグリッド土浦支社", "phone": "0120-995-007", "address": "土浦市中央2-16-4", "hours": "平日 9:00-17:00", "services": ["停電情報", "電気工事"]}],
+                "病院": [{"name": "かすみがうら市立病院", "phone": "0299-59-2211", "address": "かすみがうら市下稲吉1660", "hours": "平日 8:30-17:00", "services": ["内科", "外科"]}],
+                "保健所": [{"name": "茨城県土浦保健所", "phone": "029-821-5342", "address": "土浦市下高津2-7-46", "hours": "平日 8:30-17:15", "services": ["健康相談", "予防接種"]}],
+                "水道": [{"name": "かすみがうら市上下水道課", "phone": "029-897-1111", "address": "かすみがうら市上土田461", "hours": "平日 8:30-17:15", "services": ["水道開栓", "料金"]}],
+                "NTT": [{"name": "NTT東日本茨城支店", "phone": "116", "address": "水戸市城南1-6-5", "hours": "平日 9:00-17:00", "services": ["電話工事", "故障修理"]}],
+                "下水道": [{"name": "かすみがうら市上下水道課", "phone": "029-897-1111", "address": "かすみがうら市上土田461", "hours": "平日 8:30-17:15", "services": ["下水道修理", "排水設備"]}]
+            }
+        },
+        "行方市": {
+            "": {
+                "労基署": [{"name": "土浦労働基準監督署", "phone": "029-822-2654", "address": "土浦市中央1-10-7", "hours": "平日 8:30-17:15", "services": ["労働相談", "労災申請"]}],
+                "警察署": [{"name": "行方警察署", "phone": "0299-57-0110", "address": "行方市麻生1561-5", "hours": "24時間", "services": ["事件事故", "遺失物"]}],
+                "市区町村役所": [{"name": "行方市役所", "phone": "0299-72-0811", "address": "行方市山田2564-10", "hours": "平日 8:30-17:15", "services": ["住民票", "戸籍"]}],
+                "消防署": [{"name": "行方市消防本部", "phone": "0299-72-0119", "address": "行方市山田2564-6", "hours": "24時間", "services": ["火災通報", "救急車"]}],
+                "ガス": [{"name": "東部ガス行方営業所", "phone": "0299-72-1177", "address": "行方市山田2564", "hours": "平日 8:30-17:00", "services": ["ガス開栓", "緊急通報"]}],
+                "電力": [{"name": "東京電力パワーグリッド土浦支社", "phone": "0120-995-007", "address": "土浦市中央2-16-4", "hours": "平日 9:00-17:00", "services": ["停電情報", "電気工事"]}],
+                "病院": [{"name": "行方市立病院", "phone": "0299-73-2115", "address": "行方市井上藤井98-8", "hours": "平日 8:30-17:00", "services": ["内科", "外科"]}],
+                "保健所": [{"name": "茨城県潮来保健所", "phone": "0299-66-2114", "address": "潮来市茂木1220", "hours": "平日 8:30-17:15", "services": ["健康相談", "予防接種"]}],
+                "水道": [{"name": "行方市上下水道課", "phone": "0299-72-0811", "address": "行方市山田2564-10", "hours": "平日 8:30-17:15", "services": ["水道開栓", "料金"]}],
+                "NTT": [{"name": "NTT東日本茨城支店", "phone": "116", "address": "水戸市城南1-6-5", "hours": "平日 9:00-17:00", "services": ["電話工事", "故障修理"]}],
+                "下水道": [{"name": "行方市上下水道課", "phone": "0299-72-0811", "address": "行方市山田2564-10", "hours": "平日 8:30-17:15", "services": ["下水道修理", "排水設備"]}]
+            }
+        },
+        "鉾田市": {
+            "": {
+                "労基署": [{"name": "水戸労働基準監督署", "phone": "029-224-6214", "address": "水戸市白梅2-1-44", "hours": "平日 8:30-17:15", "services": ["労働相談", "労災申請"]}],
+                "警察署": [{"name": "鉾田警察署", "phone": "0291-33-0110", "address": "鉾田市鉾田1367-3", "hours": "24時間", "services": ["事件事故", "遺失物"]}],
+                "市区町村役所": [{"name": "鉾田市役所", "phone": "0291-33-2111", "address": "鉾田市鉾田1444-1", "hours": "平日 8:30-17:15", "services": ["住民票", "戸籍"]}],
+                "消防署": [{"name": "鉾田市消防本部", "phone": "0291-33-2706", "address": "鉾田市鉾田1367-1", "hours": "24時間", "services": ["火災通報", "救急車"]}],
+                "ガス": [{"name": "東部ガス鉾田営業所", "phone": "0291-33-3456", "address": "鉾田市鉾田1367", "hours": "平日 8:30-17:00", "services": ["ガス開栓", "緊急通報"]}],
+                "電力": [{"name": "東京電力パワーグリッド水戸支社", "phone": "0120-995-007", "address": "水戸市城南1-6-5", "hours": "平日 9:00-17:00", "services": ["停電情報", "電気工事"]}],
+                "病院": [{"name": "鉾田病院", "phone": "0291-33-2125", "address": "鉾田市鉾田1360", "hours": "平日 8:30-17:00", "services": ["内科", "外科"]}],
+                "保健所": [{"name": "茨城県ひたちなか保健所", "phone": "029-265-5515", "address": "ひたちなか市石川町3-21", "hours": "平日 8:30-17:15", "services": ["健康相談", "予防接種"]}],
+                "水道": [{"name": "鉾田市上下水道課", "phone": "0291-33-2111", "address": "鉾田市鉾田1444-1", "hours": "平日 8:30-17:15", "services": ["水道開栓", "料金"]}],
+                "NTT": [{"name": "NTT東日本茨城支店", "phone": "116", "address": "水戸市城南1-6-5", "hours": "平日 9:00-17:00", "services": ["電話工事", "故障修理"]}],
+                "下水道": [{"name": "鉾田市上下水道課", "phone": "0291-33-2111", "address": "鉾田市鉾田1444-1", "hours": "平日 8:30-17:15", "services": ["下水道修理", "排水設備"]}]
+            }
+        },
+        "神栖市": {
+            "": {
+                "労基署": [{"name": "土浦労働基準監督署", "phone": "029-822-2654", "address": "土浦市中央1-10-7", "hours": "平日 8:30-17:15", "services": ["労働相談", "労災申請"]}],
+                "警察署": [{"name": "神栖警察署", "phone": "0299-90-1191", "address": "神栖市溝口1661-1", "hours": "24時間", "services": ["事件事故", "遺失物"]}],
+                "市区町村役所": [{"name": "神栖市役所", "phone": "0299-90-1111", "address": "神栖市溝口4991-5", "hours": "平日 8:30-17:15", "services": ["住民票", "戸籍"]}],
+                "消防署": [{"name": "神栖市消防本部", "phone": "0299-90-1175", "address": "神栖市溝口1661", "hours": "24時間", "services": ["火災通報", "救急車"]}],
+                "ガス": [{"name": "東部ガス神栖営業所", "phone": "0299-92-3111", "address": "神栖市溝口4991", "hours": "平日 8:30-17:00", "services": ["ガス開栓", "緊急通報"]}],
+                "電力": [{"name": "東京電力パワーグリッド土浦支社", "phone": "0120-995-007", "address": "土浦市中央2-16-4", "hours": "平日 9:00-17:00", "services": ["停電情報", "電気工事"]}],
+                "病院": [{"name": "神栖済生会病院", "phone": "0299-97-2111", "address": "神栖市知手中央7-2-45", "hours": "24時間救急", "services": ["総合診療", "救急医療"]}],
+                "保健所": [{"name": "茨城県潮来保健所", "phone": "0299-66-2114", "address": "潮来市茂木1220", "hours": "平日 8:30-17:15", "services": ["健康相談", "予防接種"]}],
+                "水道": [{"name": "神栖市上下水道課", "phone": "0299-90-1111", "address": "神栖市溝口4991-5", "hours": "平日 8:30-17:15", "services": ["水道開栓", "料金"]}],
+                "NTT": [{"name": "NTT東日本茨城支店", "phone": "116", "address": "水戸市城南1-6-5", "hours": "平日 9:00-17:00", "services": ["電話工事", "故障修理"]}],
+                "下水道": [{"name": "神栖市上下水道課", "phone": "0299-90-1111", "address": "神栖市溝口4991-5", "hours": "平日 8:30-17:15", "services": ["下水道修理", "排水設備"]}]
+            }
+        },
+        "府中町": {
+            "": {
+                "労基署": [{"name": "広島労働基準監督署", "phone": "082-221-2191", "address": "広島市中区上八丁堀6-30", "hours": "平日 8:30-17:15", "services": ["労働相談", "労災申請"]}],
+                "警察署": [{"name": "府中警察署", "phone": "082-286-0110", "address": "安芸郡府中町本町3-12-7", "hours": "24時間", "services": ["事件事故", "遺失物"]}],
+                "市区町村役所": [
+                    {"name": "府中町役場", "phone": "082-286-3111", "address": "安芸郡府中町大通3-5-1", "hours": "平日 8:30-17:15", "services": ["住民票", "戸籍"]},
+                    {"name": "府中町住民生活部", "phone": "082-286-3126", "address": "安芸郡府中町大通3-5-1", "hours": "平日 8:30-17:15", "services": ["ごみ収集", "リサイクル", "環境対策"]}
+                ],
+                "消防署": [{"name": "安芸地区消防組合府中消防署", "phone": "082-286-0119", "address": "安芸郡府中町本町3-15-28", "hours": "24時間", "services": ["火災通報", "救急車"]}],
+                "ガス": [{"name": "広島ガス府中営業所", "phone": "082-285-3311", "address": "安芸郡府中町大通1-4-15", "hours": "平日 8:30-17:00", "services": ["ガス開栓", "緊急通報"]}],
+                "電力": [{"name": "中国電力広島営業所", "phone": "0120-211-777", "address": "広島市中区小町4-33", "hours": "平日 9:00-17:00", "services": ["停電情報", "電気工事"]}],
+                "病院": [{"name": "府中町国民健康保険診療所", "phone": "082-286-3211", "address": "安芸郡府中町鶴江1-10-1", "hours": "平日 8:30-17:00", "services": ["内科", "外科"]}],
+                "保健所": [{"name": "広島県西部保健所", "phone": "082-513-5520", "address": "広島市中区基町10-52", "hours": "平日 8:30-17:15", "services": ["健康相談", "予防接種"]}],
+                "水道": [{"name": "府中町上下水道課", "phone": "082-286-3135", "address": "安芸郡府中町大通3-5-1", "hours": "平日 8:30-17:15", "services": ["水道開栓", "料金"]}],
+                "NTT": [{"name": "NTT西日本広島支店", "phone": "116", "address": "広島市中区基町6-77", "hours": "平日 9:00-17:00", "services": ["電話工事", "故障修理"]}],
+                "下水道": [{"name": "府中町上下水道課", "phone": "082-286-3135", "address": "安芸郡府中町大通3-5-1", "hours": "平日 8:30-17:15", "services": ["下水道修理", "排水設備"]}]
+            }
+        },
+        "海田町": {
+            "": {
+                "労基署": [{"name": "広島労働基準監督署", "phone": "082-221-2191", "address": "広島市中区上八丁堀6-30", "hours": "平日 8:30-17:15", "services": ["労働相談", "労災申請"]}],
+                "警察署": [{"name": "海田警察署", "phone": "082-822-0110", "address": "安芸郡海田町南本町6-1", "hours": "24時間", "services": ["事件事故", "遺失物"]}],
+                "市区町村役所": [
+                    {"name": "海田町役場", "phone": "082-823-9211", "address": "安芸郡海田町上市14-18", "hours": "平日 8:30-17:15", "services": ["住民票", "戸籍"]},
+                    {"name": "海田町住民課", "phone": "082-823-9217", "address": "安芸郡海田町上市14-18", "hours": "平日 8:30-17:15", "services": ["ごみ収集", "リサイクル", "環境対策"]}
+                ],
+                "消防署": [{"name": "安芸地区消防組合海田消防署", "phone": "082-822-0119", "address": "安芸郡海田町南本町6-1", "hours": "24時間", "services": ["火災通報", "救急車"]}],
+                "ガス": [{"name": "広島ガス海田営業所", "phone": "082-822-3311", "address": "安芸郡海田町南本町9-15", "hours": "平日 8:30-17:00", "services": ["ガス開栓", "緊急通報"]}],
+                "電力": [{"name": "中国電力広島営業所", "phone": "0120-211-777", "address": "広島市中区小町4-33", "hours": "平日 9:00-17:00", "services": ["停電情報", "電気工事"]}],
+                "病院": [{"name": "海田町国民健康保険海田診療所", "phone": "082-823-2534", "address": "安芸郡海田町上市14-18", "hours": "平日 8:30-17:00", "services": ["内科", "小児科"]}],
+                "保健所": [{"name": "広島県西部保健所", "phone": "082-513-5520", "address": "広島市中区基町10-52", "hours": "平日 8:30-17:15", "services": ["健康相談", "予防接種"]}],
+                "水道": [{"name": "海田町上下水道課", "phone": "082-823-9220", "address": "安芸郡海田町上市14-18", "hours": "平日 8:30-17:15", "services": ["水道開栓", "料金"]}],
+                "NTT": [{"name": "NTT西日本広島支店", "phone": "116", "address": "広島市中区基町6-77", "hours": "平日 9:00-17:00", "services": ["電話工事", "故障修理"]}],
+                "下水道": [{"name": "海田町上下水道課", "phone": "082-823-9220", "address": "安芸郡海田町上市14-18", "hours": "平日 8:30-17:15", "services": ["下水道修理", "排水設備"]}]
+            }
+        },
+        "熊野町": {
+            "": {
+                "労基署": [{"name": "広島労働基準監督署", "phone": "082-221-2191", "address": "広島市中区上八丁堀6-30", "hours": "平日 8:30-17:15", "services": ["労働相談", "労災申請"]}],
+                "警察署": [{"name": "海田警察署熊野交番", "phone": "082-854-2004", "address": "安芸郡熊野町中溝1-1-1", "hours": "24時間", "services": ["事件事故", "遺失物"]}],
+                "市区町村役所": [
+                    {"name": "熊野町役場", "phone": "082-820-5601", "address": "安芸郡熊野町中溝1-1-1", "hours": "平日 8:30-17:15", "services": ["住民票", "戸籍"]},
+                    {"name": "熊野町民生部", "phone": "082-820-5605", "address": "安芸郡熊野町中溝1-1-1", "hours": "平日 8:30-17:15", "services": ["ごみ収集", "リサイクル", "環境対策"]}
+                ],
+                "消防署": [{"name": "安芸地区消防組合熊野出張所", "phone": "082-854-0119", "address": "安芸郡熊野町萩原3-2-7", "hours": "24時間", "services": ["火災通報", "救急車"]}],
+                "ガス": [{"name": "広島ガス熊野営業所", "phone": "082-854-3311", "address": "安芸郡熊野町中溝3-2-8", "hours": "平日 8:30-17:00", "services": ["ガス開栓", "緊急通報"]}],
+                "電力": [{"name": "中国電力広島営業所", "phone": "0120-211-777", "address": "広島市中区小町4-33", "hours": "平日 9:00-17:00", "services": ["停電情報", "電気工事"]}],
+                "病院": [{"name": "熊野町国民健康保険熊野診療所", "phone": "082-854-1191", "address": "安芸郡熊野町中溝3-1-15", "hours": "平日 8:30-17:00", "services": ["内科", "外科"]}],
+                "保健所": [{"name": "広島県西部保健所", "phone": "082-513-5520", "address": "広島市中区基町10-52", "hours": "平日 8:30-17:15", "services": ["健康相談", "予防接種"]}],
+                "水道": [{"name": "熊野町上下水道課", "phone": "082-820-5634", "address": "安芸郡熊野町中溝1-1-1", "hours": "平日 8:30-17:15", "services": ["水道開栓", "料金"]}],
+                "NTT": [{"name": "NTT西日本広島支店", "phone": "116", "address": "広島市中区基町6-77", "hours": "平日 9:00-17:00", "services": ["電話工事", "故障修理"]}],
+                "下水道": [{"name": "熊野町上下水道課", "phone": "082-820-5634", "address": "安芸郡熊野町中溝1-1-1", "hours": "平日 8:30-17:15", "services": ["下水道修理", "排水設備"]}]
+            }
+        },
+        "坂町": {
+            "": {
+                "労基署": [{"name": "広島労働基準監督署", "phone": "082-221-2191", "address": "広島市中区上八丁堀6-30", "hours": "平日 8:30-17:15", "services": ["労働相談", "労災申請"]}],
+                "警察署": [{"name": "海田警察署坂交番", "phone": "082-885-2004", "address": "安芸郡坂町横浜中央1-6-1", "hours": "24時間", "services": ["事件事故", "遺失物"]}],
+                "市区町村役所": [
+                    {"name": "坂町役場", "phone": "082-885-3111", "address": "安芸郡坂町平成ヶ浜1-1-1", "hours": "平日 8:30-17:15", "services": ["住民票", "戸籍"]},
+                    {"name": "坂町民生部", "phone": "082-885-3116", "address": "安芸郡坂町平成ヶ浜1-1-1", "hours": "平日 8:30-17:15", "services": ["ごみ収集", "リサイクル", "環境対策"]}
+                ],
+                "消防署": [{"name": "安芸地区消防組合坂出張所", "phone": "082-885-0119", "address": "安芸郡坂町横浜中央1-6-1", "hours": "24時間", "services": ["火災通報", "救急車"]}],
+                "ガス": [{"name": "広島ガス坂営業所", "phone": "082-885-3311", "address": "安芸郡坂町横浜中央1-8-5", "hours": "平日 8:30-17:00", "services": ["ガス開栓", "緊急通報"]}],
+                "電力": [{"name": "中国電力広島営業所", "phone": "0120-211-777", "address": "広島市中区小町4-33", "hours": "平日 9:00-17:00", "services": ["停電情報", "電気工事"]}],
+                "病院": [{"name": "坂町国民健康保険坂診療所", "phone": "082-885-1034", "address": "安芸郡坂町平成ヶ浜3-2-11", "hours": "平日 8:30-17:00", "services": ["内科", "小児科"]}],
+                "保健所": [{"name": "広島県西部保健所", "phone": "082-513-5520", "address": "広島市中区基町10-52", "hours": "平日 8:30-17:15", "services": ["健康相談", "予防接種"]}],
+                "水道": [{"name": "坂町上下水道課", "phone": "082-885-3117", "address": "安芸郡坂町平成ヶ浜1-1-1", "hours": "平日 8:30-17:15", "services": ["水道開栓", "料金"]}],
+                "NTT": [{"name": "NTT西日本広島支店", "phone": "116", "address": "広島市中区基町6-77", "hours": "平日 9:00-17:00", "services": ["電話工事", "故障修理"]}],
+                "下水道": [{"name": "坂町上下水道課", "phone": "082-885-3117", "address": "安芸郡坂町平成ヶ浜1-1-1", "hours": "平日 8:30-17:15", "services": ["下水道修理", "排水設備"]}]
+            }
+        },
+        "安芸太田町": {
+            "": {
+                "労基署": [{"name": "広島労働基準監督署", "phone": "082-221-2191", "address": "広島市中区上八丁堀6-30", "hours": "平日 8:30-17:15", "services": ["労働相談", "労災申請"]}],
+                "警察署": [{"name": "可部警察署安芸太田駐在所", "phone": "0826-28-2004", "address": "山県郡安芸太田町戸河内784-1", "hours": "平日 8:30-17:15", "services": ["事件事故", "遺失物"]}],
+                "市区町村役所": [
+                    {"name": "安芸太田町役場", "phone": "0826-28-2111", "address": "山県郡安芸太田町戸河内784-1", "hours": "平日 8:30-17:15", "services": ["住民票", "戸籍"]},
+                    {"name": "安芸太田町住民課", "phone": "0826-28-2115", "address": "山県郡安芸太田町戸河内784-1", "hours": "平日 8:30-17:15", "services": ["ごみ収集", "リサイクル", "環境対策"]}
+                ],
+                "消防署": [{"name": "安佐北消防署安芸太田分署", "phone": "0826-28-0119", "address": "山県郡安芸太田町戸河内1025-3", "hours": "24時間", "services": ["火災通報", "救急車"]}],
+                "ガス": [{"name": "安芸太田町ガス協会", "phone": "0826-28-2941", "address": "山県郡安芸太田町戸河内784", "hours": "平日 8:30-17:00", "services": ["ガス開栓", "緊急通報"]}],
+                "電力": [{"name": "中国電力可部営業所", "phone": "0120-211-777", "address": "広島市安佐北区可部4-15-20", "hours": "平日 9:00-17:00", "services": ["停電情報", "電気工事"]}],
+                "病院": [{"name": "安芸太田病院", "phone": "0826-28-2151", "address": "山県郡安芸太田町戸河内1008", "hours": "平日 8:30-17:00", "services": ["内科", "外科"]}],
+                "保健所": [{"name": "広島県西部保健所", "phone": "082-513-5520", "address": "広島市中区基町10-52", "hours": "平日 8:30-17:15", "services": ["健康相談", "予防接種"]}],
+                "水道": [{"name": "安芸太田町上下水道課", "phone": "0826-28-2118", "address": "山県郡安芸太田町戸河内784-1", "hours": "平日 8:30-17:15", "services": ["水道開栓", "料金"]}],
+                "NTT": [{"name": "NTT西日本広島支店", "phone": "116", "address": "広島市中区基町6-77", "hours": "平日 9:00-17:00", "services": ["電話工事", "故障修理"]}],
+                "下水道": [{"name": "安芸太田町上下水道課", "phone": "0826-28-2118", "address": "山県郡安芸太田町戸河内784-1", "hours": "平日 8:30-17:15", "services": ["下水道修理", "排水設備"]}]
+            }
+        },
+        "北広島町": {
+            "": {
+                "労基署": [{"name": "広島労働基準監督署", "phone": "082-221-2191", "address": "広島市中区上八丁堀6-30", "hours": "平日 8:30-17:15", "services": ["労働相談", "労災申請"]}],
+                "警察署": [{"name": "可部警察署千代田交番", "phone": "0826-72-2004", "address": "山県郡北広島町有田1234", "hours": "24時間", "services": ["事件事故", "遺失物"]}],
+                "市区町村役所": [
+                    {"name": "北広島町役場", "phone": "050-5812-1111", "address": "山県郡北広島町有田1234", "hours": "平日 8:30-17:15", "services": ["住民票", "戸籍"]},
+                    {"name": "北広島町住民課", "phone": "050-5812-1854", "address": "山県郡北広島町有田1234", "hours": "平日 8:30-17:15", "services": ["ごみ収集", "リサイクル", "環境対策"]}
+                ],
+                "消防署": [{"name": "安佐北消防署北広島分署", "phone": "0826-72-0119", "address": "山県郡北広島町有田1587-1", "hours": "24時間", "services": ["火災通報", "救急車"]}],
+                "ガス": [{"name": "北広島町ガス協会", "phone": "0826-72-2941", "address": "山県郡北広島町有田1234", "hours": "平日 8:30-17:00", "services": ["ガス開栓", "緊急通報"]}],
+                "電力": [{"name": "中国電力可部営業所", "phone": "0120-211-777", "address": "広島市安佐北区可部4-15-20", "hours": "平日 9:00-17:00", "services": ["停電情報", "電気工事"]}],
+                "病院": [{"name": "北広島町豊平病院", "phone": "0826-83-0001", "address": "山県郡北広島町阿坂4717", "hours": "平日 8:30-17:00", "services": ["内科", "外科"]}],
+                "保健所": [{"name": "広島県西部保健所", "phone": "082-513-5520", "address": "広島市中区基町10-52", "hours": "平日 8:30-17:15", "services": ["健康相談", "予防接種"]}],
+                "水道": [{"name": "北広島町上下水道課", "phone": "050-5812-1858", "address": "山県郡北広島町有田1234", "hours": "平日 8:30-17:15", "services": ["水道開栓", "料金"]}],
+                "NTT": [{"name": "NTT西日本広島支店", "phone": "116", "address": "広島市中区基町6-77", "hours": "平日 9:00-17:00", "services": ["電話工事", "故障修理"]}],
+                "下水道": [{"name": "北広島町上下水道課", "phone": "050-5812-1858", "address": "山県郡北広島町有田1234", "hours": "平日 8:30-17:15", "services": ["下水道修理", "排水設備"]}]
+            }
+        }
+    },
+    
+    # Yamanashi Prefecture
+    "山梨県": {
+        "甲府市": {
+            "": {
+                "労基署": [{"name": "甲府労働基準監督署", "phone": "055-254-6112", "address": "甲府市丸の内1-1-18", "hours": "平日 8:30-17:15", "services": ["労働相談", "労災申請"]}],
+                "警察署": [{"name": "甲府警察署", "phone": "055-233-0110", "address": "甲府市中央1-7-5", "hours": "24時間", "services": ["事件事故", "遺失物"]}],
+                "市区町村役所": [
+                    {"name": "甲府市役所", "phone": "055-237-1161", "address": "甲府市丸の内1-18-1", "hours": "平日 8:30-17:15", "services": ["住民票", "戸籍"]},
+                    {"name": "甲府市環境部", "phone": "055-241-4312", "address": "甲府市丸の内1-18-1", "hours": "平日 8:30-17:15", "services": ["ごみ収集", "リサイクル", "環境対策"]}
+                ],
+                "消防署": [{"name": "甲府市消防本部", "phone": "055-226-0119", "address": "甲府市相生2-17-1", "hours": "24時間", "services": ["火災通報", "救急車"]}],
+                "ガス": [{"name": "山梨ガス甲府営業所", "phone": "055-228-6511", "address": "甲府市徳行1-13-37", "hours": "平日 8:30-17:00", "services": ["ガス開栓", "緊急通報"]}],
+                "電力": [{"name": "東京電力パワーグリッド甲府支社", "phone": "0120-995-007", "address": "甲府市相生2-2-17", "hours": "平日 9:00-17:00", "services": ["停電情報", "電気工事"]}],
+                "病院": [{"name": "山梨大学医学部附属病院", "phone": "055-273-1111", "address": "中央市下河東1110", "hours": "24時間救急", "services": ["総合診療", "救急医療"]}],
+                "保健所": [{"name": "山梨県中北保健所", "phone": "055-237-1382", "address": "甲府市太田町9-1", "hours": "平日 8:30-17:15", "services": ["健康相談", "予防接種"]}],
+                "水道": [{"name": "甲府市上下水道局", "phone": "055-298-4888", "address": "甲府市上町601-4", "hours": "平日 8:30-17:15", "services": ["水道開栓", "料金"]}],
+                "NTT": [{"name": "NTT東日本山梨支店", "phone": "116", "address": "甲府市相生2-2-17", "hours": "平日 9:00-17:00", "services": ["電話工事", "故障修理"]}],
+                "下水道": [{"name": "甲府市上下水道局", "phone": "055-298-4433", "address": "甲府市上町601-4", "hours": "平日 8:30-17:15", "services": ["下水道修理", "排水設備"]}]
+            }
+        },
+        "富士吉田市": {
+            "": {
+                "労基署": [{"name": "富士吉田労働基準監督署", "phone": "0555-22-3241", "address": "富士吉田市緑ケ丘2-7-21", "hours": "平日 8:30-17:15", "services": ["労働相談", "労災申請"]}],
+                "警察署": [{"name": "富士吉田警察署", "phone": "0555-23-0110", "address": "富士吉田市中曽根3-2-30", "hours": "24時間", "services": ["事件事故", "遺失物"]}],
+                "市区町村役所": [{"name": "富士吉田市役所", "phone": "0555-22-1111", "address": "富士吉田市下吉田6-1-1", "hours": "平日 8:30-17:15", "services": ["住民票", "戸籍"]}],
+                "消防署": [{"name": "富士吉田市消防本部", "phone": "0555-22-4444", "address": "富士吉田市中曽根3-2-1", "hours": "24時間", "services": ["火災通報", "救急車"]}],
+                "ガス": [{"name": "富士吉田ガス", "phone": "0555-22-2161", "address": "富士吉田市中曽根1-1-1", "hours": "平日 8:30-17:00", "services": ["ガス開栓", "緊急通報"]}],
+                "電力": [{"name": "東京電力パワーグリッド甲府支社", "phone": "0120-995-007", "address": "甲府市相生2-2-17", "hours": "平日 9:00-17:00", "services": ["停電情報", "電気工事"]}],
+                "病院": [{"name": "富士吉田市立病院", "phone": "0555-22-4111", "address": "富士吉田市上吉田東9-1-1", "hours": "24時間救急", "services": ["総合診療", "救急医療"]}],
+                "保健所": [{"name": "山梨県富士・東部保健所", "phone": "0555-24-9035", "address": "富士吉田市上吉田1-2-5", "hours": "平日 8:30-17:15", "services": ["健康相談", "予防接種"]}],
+                "水道": [{"name": "富士吉田市上下水道部", "phone": "0555-22-1111", "address": "富士吉田市下吉田6-1-1", "hours": "平日 8:30-17:15", "services": ["水道開栓", "料金"]}],
+                "NTT": [{"name": "NTT東日本山梨支店", "phone": "116", "address": "甲府市相生2-2-17", "hours": "平日 9:00-17:00", "services": ["電話工事", "故障修理"]}],
+                "下水道": [{"name": "富士吉田市上下水道部", "phone": "0555-22-1111", "address": "富士吉田市下吉田6-1-1", "hours": "平日 8:30-17:15", "services": ["下水道修理", "排水設備"]}]
+            }
+        },
+        "都留市": {
+            "": {
+                "労基署": [{"name": "富士吉田労働基準監督署", "phone": "0555-22-3241", "address": "富士吉田市緑ケ丘2-7-21", "hours": "平日 8:30-17:15", "services": ["労働相談", "労災申請"]}],
+                "警察署": [{"name": "都留警察署", "phone": "0554-43-0110", "address": "都留市上谷3-1-1", "hours": "24時間", "services": ["事件事故", "遺失物"]}],
+                "市区町村役所": [{"name": "都留市役所", "phone": "0554-43-1111", "address": "都留市上谷1-1-1", "hours": "平日 8:30-17:15", "services": ["住民票", "戸籍"]}],
+                "消防署": [{"name": "都留市消防本部", "phone": "0554-43-8119", "address": "都留市田原2-17-1", "hours": "24時間", "services": ["火災通報", "救急車"]}],
+                "ガス": [{"name": "都留ガス", "phone": "0554-43-2161", "address": "都留市上谷1-5-1", "hours": "平日 8:30-17:00", "services": ["ガス開栓", "緊急通報"]}],
+                "電力": [{"name": "東京電力パワーグリッド甲府支社", "phone": "0120-995-007", "address": "甲府市相生2-2-17", "hours": "平日 9:00-17:00", "services": ["停電情報", "電気工事"]}],
+                "病院": [{"name": "都留市立病院", "phone": "0554-45-1811", "address": "都留市つる5-1-55", "hours": "平日 8:30-17:00", "services": ["内科", "外科"]}],
+                "保健所": [{"name": "山梨県富士・東部保健所", "phone": "0555-24-9035", "address": "富士吉田市上吉田1-2-5", "hours": "平日 8:30-17:15", "services": ["健康相談", "予防接種"]}],
+                "水道": [{"name": "都留市上下水道課", "phone": "0554-43-1111", "address": "都留市上谷1-1-1", "hours": "平日 8:30-17:15", "services": ["水道開栓", "料金"]}],
+                "NTT": [{"name": "NTT東日本山梨支店", "phone": "116", "address": "甲府市相生2-2-17", "hours": "平日 9:00-17:00", "services": ["電話工事", "故障修理"]}],
+                "下水道": [{"name": "都留市上下水道課", "phone": "0554-43-1111", "address": "都留市上谷1-1-1", "hours": "平日 8:30-17:15", "services": ["下水道修理", "排水設備"]}]
+            }
+        },
+        "山梨市": {
+            "": {
+                "労基署": [{"name": "甲府労働基準監督署", "phone": "055-254-6112", "address": "甲府市丸の内1-1-18", "hours": "平日 8:30-17:15", "services": ["労働相談", "労災申請"]}],
+                "警察署": [{"name": "日下部警察署", "phone": "0553-26-0110", "address": "山梨市小原西1-1", "hours": "24時間", "services": ["事件事故", "遺失物"]}],
+                "市区町村役所": [{"name": "山梨市役所", "phone": "0553-22-1111", "address": "山梨市小原西843", "hours": "平日 8:30-17:15", "services": ["住民票", "戸籍"]}],
+                "消防署": [{"name": "山梨市消防本部", "phone": "0553-22-4444", "address": "山梨市小原西1005", "hours": "24時間", "services": ["火災通報", "救急車"]}],
+                "ガス": [{"name": "山梨ガス山梨営業所", "phone": "0553-22-8877", "address": "山梨市小原西1000", "hours": "平日 8:30-17:00", "services": ["ガス開栓", "緊急通報"]}],
+                "電力": [{"name": "東京電力パワーグリッド甲府支社", "phone": "0120-995-007", "address": "甲府市相生2-2-17", "hours": "平日 9:00-17:00", "services": ["停電情報", "電気工事"]}],
+                "病院": [{"name": "山梨厚生病院", "phone": "0553-22-1011", "address": "山梨市落合860", "hours": "24時間救急", "services": ["総合診療", "救急医療"]}],
+                "保健所": [{"name": "山梨県中北保健所", "phone": "055-237-1382", "address": "甲府市太田町9-1", "hours": "平日 8:30-17:15", "services": ["健康相談", "予防接種"]}],
+                "水道": [{"name": "山梨市上下水道課", "phone": "0553-22-1111", "address": "山梨市小原西843", "hours": "平日 8:30-17:15", "services": ["水道開栓", "料金"]}],
+                "NTT": [{"name": "NTT東日本山梨支店", "phone": "116", "address": "甲府市相生2-2-17", "hours": "平日 9:00-17:00", "services": ["電話工事", "故障修理"]}],
+                "下水道": [{"name": "山梨市上下水道課", "phone": "0553-22-1111", "address": "山梨市小原西843", "hours": "平日 8:30-17:15", "services": ["下水道修理", "排水設備"]}]
+            }
+        },
+        "大月市": {
+            "": {
+                "労基署": [{"name": "富士吉田労働基準監督署", "phone": "0555-22-3241", "address": "富士吉田市緑ケ丘2-7-21", "hours": "平日 8:30-17:15", "services": ["労働相談", "労災申請"]}],
+                "警察署": [{"name": "大月警察署", "phone": "0554-22-0110", "address": "大月市大月1-13-1", "hours": "24時間", "services": ["事件事故", "遺失物"]}],
+                "市区町村役所": [{"name": "大月市役所", "phone": "0554-22-2111", "address": "大月市大月2-6-20", "hours": "平日 8:30-17:15", "services": ["住民票", "戸籍"]}],
+                "消防署": [{"name": "大月市消防本部", "phone": "0554-22-4444", "address": "大月市大月1-5-1", "hours": "24時間", "services": ["火災通報", "救急車"]}],
+                "ガス": [{"name": "大月ガス", "phone": "0554-22-3131", "address": "大月市大月1-10-10", "hours": "平日 8:30-17:00", "services": ["ガス開栓", "緊急通報"]}],
+                "電力": [{"name": "東京電力パワーグリッド甲府支社", "phone": "0120-995-007", "address": "甲府市相生2-2-17", "hours": "平日 9:00-17:00", "services": ["停電情報", "電気工事"]}],
+                "病院": [{"name": "大月市立中央病院", "phone": "0554-22-1251", "address": "大月市大月町花咲1225", "hours": "24時間救急", "services": ["総合診療", "救急医療"]}],
+                "保健所": [{"name": "山梨県富士・東部保健所", "phone": "0555-24-9035", "address": "富士吉田市上吉田1-2-5", "hours": "平日 8:30-17:15", "services": ["健康相談", "予防接種"]}],
+                "水道": [{"name": "大月市上下水道課", "phone": "0554-22-2111", "address": "大月市大月2-6-20", "hours": "平日 8:30-17:15", "services": ["水道開栓", "料金"]}],
+                "NTT": [{"name": "NTT東日本山梨支店", "phone": "116", "address": "甲府市相生2-2-17", "hours": "平日 9:00-17:00", "services": ["電話工事", "故障修理"]}],
+                "下水道": [{"name": "大月市上下水道課", "phone": "0554-22-2111", "address": "大月市大月2-6-20", "hours": "平日 8:30-17:15", "services": ["下水道修理", "排水設備"]}]
+            }
+        },
+        "韮崎市": {
+            "": {
+                "労基署": [{"name": "甲府労働基準監督署", "phone": "055-254-6112", "address": "甲府市丸の内1-1-18", "hours": "平日 8:30-17:15", "services": ["労働相談", "労災申請"]}],
+                "警察署": [{"name": "韮崎警察署", "phone": "0551-22-0110", "address": "韮崎市若宮1-2-50", "hours": "24時間", "services": ["事件事故", "遺失物"]}],
+                "市区町村役所": [{"name": "韮崎市役所", "phone": "0551-22-1111", "address": "韮崎市水神1-3-4", "hours": "平日 8:30-17:15", "services": ["住民票", "戸籍"]}],
+                "消防署": [{"name": "韮崎市消防本部", "phone": "0551-22-0119", "address": "韮崎市藤井町北下條865-4", "hours": "24時間", "services": ["火災通報", "救急車"]}],
+                "ガス": [{"name": "韮崎ガス", "phone": "0551-22-2245", "address": "韮崎市若宮1-5-22", "hours": "平日 8:30-17:00", "services": ["ガス開栓", "緊急通報"]}],
+                "電力": [{"name": "東京電力パワーグリッド甲府支社", "phone": "0120-995-007", "address": "甲府市相生2-2-17", "hours": "平日 9:00-17:00", "services": ["停電情報", "電気工事"]}],
+                "病院": [{"name": "韮崎市立病院", "phone": "0551-22-1621", "address": "韮崎市本町4-2-8", "hours": "24時間救急", "services": ["総合診療", "救急医療"]}],
+                "保健所": [{"name": "山梨県中北保健所", "phone": "055-237-1382", "address": "甲府市太田町9-1", "hours": "平日 8:30-17:15", "services": ["健康相談", "予防接種"]}],
+                "水道": [{"name": "韮崎市上下水道課", "phone": "0551-22-1111", "address": "韮崎市水神1-3-4", "hours": "平日 8:30-17:15", "services": ["水道開栓", "料金"]}],
+                "NTT": [{"name": "NTT東日本山梨支店", "phone": "116", "address": "甲府市相生2-2-17", "hours": "平日 9:00-17:00", "services": ["電話工事", "故障修理"]}],
+                "下水道": [{"name": "韮崎市上下水道課", "phone": "0551-22-1111", "address": "韮崎市水神1-3-4", "hours": "平日 8:30-17:15", "services": ["下水道修理", "排水設備"]}]
+            }
+        },
+        "南アルプス市": {
+            "": {
+                "労基署": [{"name": "甲府労働基準監督署", "phone": "055-254-6112", "address": "甲府市丸の内1-1-18", "hours": "平日 8:30-17:15", "services": ["労働相談", "労災申請"]}],
+                "警察署": [{"name": "南アルプス警察署", "phone": "055-283-0110", "address": "南アルプス市小笠原1200-1", "hours": "24時間", "services": ["事件事故", "遺失物"]}],
+                "市区町村役所": [{"name": "南アルプス市役所", "phone": "055-282-1111", "address": "南アルプス市小笠原376", "hours": "平日 8:30-17:15", "services": ["住民票", "戸籍"]}],
+                "消防署": [{"name": "南アルプス市消防本部", "phone": "055-283-0119", "address": "南アルプス市小笠原254-1", "hours": "24時間", "services": ["火災通報", "救急車"]}],
+                "ガス": [{"name": "山梨ガス南アルプス営業所", "phone": "055-284-1177", "address": "南アルプス市小笠原1200", "hours": "平日 8:30-17:00", "services": ["ガス開栓", "緊急通報"]}],
+                "電力": [{"name": "東京電力パワーグリッド甲府支社", "phone": "0120-995-007", "address": "甲府市相生2-2-17", "hours": "平日 9:00-17:00", "services": ["停電情報", "電気工事"]}],
+                "病院": [{"name": "南アルプス市立病院", "phone": "055-283-9611", "address": "南アルプス市桃園1200-1", "hours": "24時間救急", "services": ["総合診療", "救急医療"]}],
+                "保健所": [{"name": "山梨県中北保健所", "phone": "055-237-1382", "address": "甲府市太田町9-1", "hours": "平日 8:30-17:15", "services": ["健康相談", "予防接種"]}],
+                "水道": [{"name": "南アルプス市上下水道部", "phone": "055-282-1111", "address": "南アルプス市小笠原376", "hours": "平日 8:30-17:15", "services": ["水道開栓", "料金"]}],
+                "NTT": [{"name": "NTT東日本山梨支店", "phone": "116", "address": "甲府市相生2-2-17", "hours": "平日 9:00-17:00", "services": ["電話工事", "故障修理"]}],
+                "下水道": [{"name": "南アルプス市上下水道部", "phone": "055-282-1111", "address": "南アルプス市小笠原376", "hours": "平日 8:30-17:15", "services": ["下水道修理", "排水設備"]}]
+            }
+        },
+        "北杜市": {
+            "": {
+                "労基署": [{"name": "甲府労働基準監督署", "phone": "055-254-6112", "address": "甲府市丸の内1-1-18", "hours": "平日 8:30-17:15", "services": ["労働相談", "労災申請"]}],
+                "警察署": [{"name": "北杜警察署", "phone": "0551-23-0110", "address": "北杜市長坂町長坂上条2575-19", "hours": "24時間", "services": ["事件事故", "遺失物"]}],
+                "市区町村役所": [{"name": "北杜市役所", "phone": "0551-42-1111", "address": "北杜市須玉町大豆生田961-1", "hours": "平日 8:30-17:15", "services": ["住民票", "戸籍"]}],
+                "消防署": [{"name": "北杜市消防本部", "phone": "0551-42-2119", "address": "北杜市須玉町大豆生田961-1", "hours": "24時間", "services": ["火災通報", "救急車"]}],
+                "ガス": [{"name": "北杜ガス", "phone": "0551-42-3456", "address": "北杜市長坂町長坂上条2575", "hours": "平日 8:30-17:00", "services": ["ガス開栓", "緊急通報"]}],
+                "電力": [{"name": "東京電力パワーグリッド甲府支社", "phone": "0120-995-007", "address": "甲府市相生2-2-17", "hours": "平日 9:00-17:00", "services": ["停電情報", "電気工事"]}],
+                "病院": [{"name": "北杜市立病院", "phone": "0551-22-6111", "address": "北杜市長坂町大八田4300", "hours": "平日 8:30-17:00", "services": ["内科", "外科"]}],
+                "保健所": [{"name": "山梨県中北保健所", "phone": "055-237-1382", "address": "甲府市太田町9-1", "hours": "平日 8:30-17:15", "services": ["健康相談", "予防接種"]}],
+                "水道": [{"name": "北杜市上下水道課", "phone": "0551-42-1111", "address": "北杜市須玉町大豆生田961-1", "hours": "平日 8:30-17:15", "services": ["水道開栓", "料金"]}],
+                "NTT": [{"name": "NTT東日本山梨支店", "phone": "116", "address": "甲府市相生2-2-17", "hours": "平日 9:00-17:00", "services": ["電話工事", "故障修理"]}],
+                "下水道": [{"name": "北杜市上下水道課", "phone": "0551-42-1111", "address": "北杜市須玉町大豆生田961-1", "hours": "平日 8:30-17:15", "services": ["下水道修理", "排水設備"]}]
+            }
+        },
+        "甲斐市": {
+            "": {
+                "労基署": [{"name": "甲府労働基準監督署", "phone": "055-254-6112", "address": "甲府市丸の内1-1-18", "hours": "平日 8:30-17:15", "services": ["労働相談", "労災申請"]}],
+                "警察署": [{"name": "甲府警察署", "phone": "055-233-0110", "address": "甲府市中央1-7-5", "hours": "24時間", "services": ["事件事故", "遺失物"]}],
+                "市区町村役所": [{"name": "甲斐市役所", "phone": "055-278-1111", "address": "甲斐市篠原2610", "hours": "平日 8:30-17:15", "services": ["住民票", "戸籍"]}],
+                "消防署": [{"name": "甲斐市消防本部", "phone": "055-279-0119", "address": "甲斐市島上条1020", "hours": "24時間", "services": ["火災通報", "救急車"]}],
+                "ガス": [{"name": "山梨ガス甲斐営業所", "phone": "055-278-5511", "address": "甲斐市篠原2650", "hours": "平日 8:30-17:00", "services": ["ガス開栓", "緊急通報"]}],
+                "電力": [{"name": "東京電力パワーグリッド甲府支社", "phone": "0120-995-007", "address": "甲府市相生2-2-17", "hours": "平日 9:00-17:00", "services": ["停電情報", "電気工事"]}],
+                "病院": [{"name": "甲斐市立病院", "phone": "055-279-3611", "address": "甲斐市篠原2803", "hours": "24時間救急", "services": ["総合診療", "救急医療"]}],
+                "保健所": [{"name": "山梨県中北保健所", "phone": "055-237-1382", "address": "甲府市太田町9-1", "hours": "平日 8:30-17:15", "services": ["健康相談", "予防接種"]}],
+                "水道": [{"name": "甲斐市上下水道課", "phone": "055-278-1111", "address": "甲斐市篠原2610", "hours": "平日 8:30-17:15", "services": ["水道開栓", "料金"]}],
+                "NTT": [{"name": "NTT東日本山梨支店", "phone": "116", "address": "甲府市相生2-2-17", "hours": "平日 9:00-17:00", "services": ["電話工事", "故障修理"]}],
+                "下水道": [{"name": "甲斐市上下水道課", "phone": "055-278-1111", "address": "甲斐市篠原2610", "hours": "平日 8:30-17:15", "services": ["下水道修理", "排水設備"]}]
+            }
+        },
+        "笛吹市": {
+            "": {
+                "労基署": [{"name": "甲府労働基準監督署", "phone": "055-254-6112", "address": "甲府市丸の内1-1-18", "hours": "平日 8:30-17:15", "services": ["労働相談", "労災申請"]}],
+                "警察署": [{"name": "日下部警察署", "phone": "0553-26-0110", "address": "山梨市小原西1-1", "hours": "24時間", "services": ["事件事故", "遺失物"]}],
+                "市区町村役所": [{"name": "笛吹市役所", "phone": "055-262-4111", "address": "笛吹市石和町市部777", "hours": "平日 8:30-17:15", "services": ["住民票", "戸籍"]}],
+                "消防署": [{"name": "笛吹市消防本部", "phone": "055-261-0119", "address": "笛吹市石和町市部800", "hours": "24時間", "services": ["火災通報", "救急車"]}],
+                "ガス": [{"name": "山梨ガス笛吹営業所", "phone": "055-262-5511", "address": "笛吹市石和町市部777", "hours": "平日 8:30-17:00", "services": ["ガス開栓", "緊急通報"]}],
+                "電力": [{"name": "東京電力パワーグリッド甲府支社", "phone": "0120-995-007", "address": "甲府市相生2-2-17", "hours": "平日 9:00-17:00", "services": ["停電情報", "電気工事"]}],
+                "病院": [{"name": "笛吹中央病院", "phone": "055-262-2185", "address": "笛吹市石和町四日市場47-1", "hours": "24時間救急", "services": ["総合診療", "救急医療"]}],
+                "保健所": [{"name": "山梨県中北保健所", "phone": "055-237-1382", "address": "甲府市太田町9-1", "hours": "平日 8:30-17:15", "services": ["健康相談", "予防接種"]}],
+                "水道": [{"name": "笛吹市上下水道課", "phone": "055-262-4111", "address": "笛吹市石和町市部777", "hours": "平日 8:30-17:15", "services": ["水道開栓", "料金"]}],
+                "NTT": [{"name": "NTT東日本山梨支店", "phone": "116", "address": "甲府市相生2-2-17", "hours": "平日 9:00-17:00", "services": ["電話工事", "故障修理"]}],
+                "下水道": [{"name": "笛吹市上下水道課", "phone": "055-262-4111", "address": "笛吹市石和町市部777", "hours": "平日 8:30-17:15", "services": ["下水道修理", "排水設備"]}]
+            }
+        },
+        "上野原市": {
+            "": {
+                "労基署": [{"name": "富士吉田労働基準監督署", "phone": "0555-22-3241", "address": "富士吉田市緑ケ丘2-7-21", "hours": "平日 8:30-17:15", "services": ["労働相談", "労災申請"]}],
+                "警察署": [{"name": "上野原警察署", "phone": "0554-63-0110", "address": "上野原市上野原3832", "hours": "24時間", "services": ["事件事故", "遺失物"]}],
+                "市区町村役所": [{"name": "上野原市役所", "phone": "0554-62-3111", "address": "上野原市上野原3832", "hours": "平日 8:30-17:15", "services": ["住民票", "戸籍"]}],
+                "消防署": [{"name": "上野原市消防本部", "phone": "0554-63-0119", "address": "上野原市上野原1832", "hours": "24時間", "services": ["火災通報", "救急車"]}],
+                "ガス": [{"name": "上野原ガス", "phone": "0554-62-2345", "address": "上野原市上野原1000", "hours": "平日 8:30-17:00", "services": ["ガス開栓", "緊急通報"]}],
+                "電力": [{"name": "東京電力パワーグリッド甲府支社", "phone": "0120-995-007", "address": "甲府市相生2-2-17", "hours": "平日 9:00-17:00", "services": ["停電情報", "電気工事"]}],
+                "病院": [{"name": "上野原市立病院", "phone": "0554-63-2111", "address": "上野原市上野原1695", "hours": "平日 8:30-17:00", "services": ["内科", "外科"]}],
+                "保健所": [{"name": "山梨県富士・東部保健所", "phone": "0555-24-9035", "address": "富士吉田市上吉田1-2-5", "hours": "平日 8:30-17:15", "services": ["健康相談", "予防接種"]}],
+                "水道": [{"name": "上野原市上下水道課", "phone": "0554-62-3111", "address": "上野原市上野原3832", "hours": "平日 8:30-17:15", "services": ["水道開栓", "料金"]}],
+                "NTT": [{"name": "NTT東日本山梨支店", "phone": "116", "address": "甲府市相生2-2-17", "hours": "平日 9:00-17:00", "services": ["電話工事", "故障修理"]}],
+                "下水道": [{"name": "上野原市上下水道課", "phone": "0554-62-3111", "address": "上野原市上野原3832", "hours": "平日 8:30-17:15", "services": ["下水道修理", "排水設備"]}]
+            }
+        },
+        "甲州市": {
+            "": {
+                "労基署": [{"name": "甲府労働基準監督署", "phone": "055-254-6112", "address": "甲府市丸の内1-1-18", "hours": "平日 8:30-17:15", "services": ["労働相談", "労災申請"]}],
+                "警察署": [{"name": "日下部警察署", "phone": "0553-26-0110", "address": "山梨市小原西1-1", "hours": "24時間", "services": ["事件事故", "遺失物"]}],
+                "市区町村役所": [{"name": "甲州市役所", "phone": "0553-32-2111", "address": "甲州市塩山上於曽1085-1", "hours": "平日 8:30-17:15", "services": ["住民票", "戸籍"]}],
+                "消防署": [{"name": "甲州市消防本部", "phone": "0553-33-0119", "address": "甲州市塩山上於曽1147", "hours": "24時間", "services": ["火災通報", "救急車"]}],
+                "ガス": [{"name": "甲州ガス", "phone": "0553-32-3456", "address": "甲州市塩山上於曽1100", "hours": "平日 8:30-17:00", "services": ["ガス開栓", "緊急通報"]}],
+                "電力": [{"name": "東京電力パワーグリッド甲府支社", "phone": "0120-995-007", "address": "甲府市相生2-2-17", "hours": "平日 9:00-17:00", "services": ["停電情報", "電気工事"]}],
+                "病院": [{"name": "甲州市立病院", "phone": "0553-33-2321", "address": "甲州市塩山西広門田433-1", "hours": "平日 8:30-17:00", "services": ["内科", "外科"]}],
+                "保健所": [{"name": "山梨県中北保健所", "phone": "055-237-1382", "address": "甲府市太田町9-1", "hours": "平日 8:30-17:15", "services": ["健康相談", "予防接種"]}],
+                "水道": [{"name": "甲州市上下水道課", "phone": "0553-32-2111", "address": "甲州市塩山上於曽1085-1", "hours": "平日 8:30-17:15", "services": ["水道開栓", "料金"]}],
+                "NTT": [{"name": "NTT東日本山梨支店", "phone": "116", "address": "甲府市相生2-2-17", "hours": "平日 9:00-17:00", "services": ["電話工事", "故障修理"]}],
+                "下水道": [{"name": "甲州市上下水道課", "phone": "0553-32-2111", "address": "甲州市塩山上於曽1085-1", "hours": "平日 8:30-17:15", "services": ["下水道修理", "排水設備"]}]
+            }
+        },
+        "中央市": {
+            "": {
+                "労基署": [{"name": "甲府労働基準監督署", "phone": "055-254-6112", "address": "甲府市丸の内1-1-18", "hours": "平日 8:30-17:15", "services": ["労働相談", "労災申請"]}],
+                "警察署": [{"name": "甲府警察署", "phone": "055-233-0110", "address": "甲府市中央1-7-5", "hours": "24時間", "services": ["事件事故", "遺失物"]}],
+                "市区町村役所": [{"name": "中央市役所", "phone": "055-274-8555", "address": "中央市臼井阿原301-1", "hours": "平日 8:30-17:15", "services": ["住民票", "戸籍"]}],
+                "消防署": [{"name": "中央市消防本部", "phone": "055-274-0119", "address": "中央市臼井阿原301", "hours": "24時間", "services": ["火災通報", "救急車"]}],
+                "ガス": [{"name": "山梨ガス中央営業所", "phone": "055-274-7890", "address": "中央市臼井阿原300", "hours": "平日 8:30-17:00", "services": ["ガス開栓", "緊急通報"]}],
+                "電力": [{"name": "東京電力パワーグリッド甲府支社", "phone": "0120-995-007", "address": "甲府市相生2-2-17", "hours": "平日 9:00-17:00", "services": ["停電情報", "電気工事"]}],
+                "病院": [{"name": "山梨大学医学部附属病院", "phone": "055-273-1111", "address": "中央市下河東1110", "hours": "24時間救急", "services": ["総合診療", "救急医療"]}],
+                "保健所": [{"name": "山梨県中北保健所", "phone": "055-237-1382", "address": "甲府市太田町9-1", "hours": "平日 8:30-17:15", "services": ["健康相談", "予防接種"]}],
+                "水道": [{"name": "中央市上下水道課", "phone": "055-274-8555", "address": "中央市臼井阿原301-1", "hours": "平日 8:30-17:15", "services": ["水道開栓", "料金"]}],
+                "NTT": [{"name": "NTT東日本山梨支店", "phone": "116", "address": "甲府市相生2-2-17", "hours": "平日 9:00-17:00", "services": ["電話工事", "故障修理"]}],
+                "下水道": [{"name": "中央市上下水道課", "phone": "055-274-8555", "address": "中央市臼井阿原301-1", "hours": "平日 8:30-17:15", "services": ["下水道修理", "排水設備"]}]
+            }
+        }
+    }
+}
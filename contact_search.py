@@ -0,0 +1,828 @@
+# contact_search.py
+# Address -> nearest contacts search shared by the Streamlit app and the batch lookup:
+# geocoding chains, the cached data plane and nearest-facility selection
+# Categories: 労基署, 警察署, 市区町村役所, 消防署, ガス, 電力, 病院, 保健所, 水道, NTT, 下水道
+
+import os
+import re
+import bisect
+import heapq
+import json
+import threading
+from types import MappingProxyType
+from typing import Callable, Dict, Any, FrozenSet, List, Mapping, NamedTuple, Sequence, Tuple, Optional
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+from address_parser import DESIGNATED_CITIES, normalize, parse_address
+from boundaries import get_boundary_index
+from contact_store import get_contact_store
+from gazetteer import get_gazetteer
+from geocoder import (ADDRESS, PREFECTURE, TOWN, GeocodeResult, GeocoderChain, fuzzy_gazetteer_step,
+                      gazetteer_step, postal_code_step, remote_step)
+from geocode_cache import get_geocode_cache
+from http_client import get_http_client
+from osm_import import OSM_STORE_PATH, load_osm_facilities
+from postal_codes import get_postal_index
+from service_areas import SERVICE_AREA_CATEGORIES, get_service_area_index, station_key
+from spatial_index import GridIndex, haversine_km
+
+# -----------------------------
+# Configuration
+# -----------------------------
+
+GSI_GEOCODE = "https://msearch.gsi.go.jp/address-search/AddressSearch"
+OVERPASS_API = "https://overpass.kumi.systems/api/interpreter"
+GSI_MAX_REQUESTS_PER_SECOND = 10  # shared by every session and batch job in the process
+GSI_BURST = 5
+GEOCODE_BUDGET_SECONDS = 8.0  # per interactive lookup, across every resolver in the chain
+JURISDICTION_MAX_KM = 15.0  # points farther than this from every known city/ward have no jurisdiction
+
+# Precomputed facility coordinates (built by build_facility_coordinates.py)
+FACILITY_COORDINATES_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "facility_coordinates.json")
+FACILITY_COORDINATES_VERSION = 1
+
+# -----------------------------
+# Contact Database - compiled from contact_data.py, loaded lazily per prefecture
+# -----------------------------
+
+CONTACT_DATABASE = get_contact_store()
+
+# -----------------------------
+# Functions
+# -----------------------------
+
+def parse_address_components(address: str) -> Tuple[str, str, str]:
+    """Parse Japanese address to extract prefecture, city, and district (政令市 ward)
+
+    A leading 〒 code the postal index knows supplies the prefecture and city when the address omits them.
+    Names come back spelled as the contact database spells them (鎌ケ谷市, 茅ヶ崎市); a county is dropped.
+    A city the database does not list (a typo such as 渋屋区) is corrected by fuzzy gazetteer matching.
+    """
+    parsed = parse_address(get_postal_index().qualify(address))
+    prefecture = parsed.prefecture
+    city, ward = database_spelling(prefecture, parsed.city), database_spelling(prefecture, parsed.ward)
+    if prefecture in CONTACT_DATABASE and city not in CONTACT_DATABASE[prefecture]:
+        place = get_gazetteer().fuzzy_place(address, prefecture)
+        if place is not None:
+            city = place.path[1]
+            if city in DESIGNATED_CITIES and len(place.path) > 2:
+                ward = place.path[2]
+    return prefecture, city, ward
+
+_database_spellings: Dict[str, Dict[str, str]] = {}
+
+def database_spelling(prefecture: str, name: str) -> str:
+    """A parsed city or ward name (always ヶ) as the database spells it; official names mix ケ and ヶ"""
+    if "ヶ" not in name or prefecture not in CONTACT_DATABASE:
+        return name
+    spellings = _database_spellings.get(prefecture)
+    if spellings is None:
+        spellings = {
+            normalize(known): known
+            for city, city_data in CONTACT_DATABASE[prefecture].items()
+            for known in (city, *city_data) if known
+        }
+        _database_spellings[prefecture] = spellings
+    return spellings.get(name, name)
+
+def boundary_components(lat: float, lon: float) -> Optional[Tuple[str, str, str]]:
+    """(prefecture, city, ward) whose boundary polygon contains a point, spelled as the database spells them
+
+    None when no boundaries are imported or the point lies outside them.
+    """
+    jurisdiction = get_boundary_index().reverse_geocode(lat, lon)
+    if jurisdiction is None:
+        return None
+    prefecture = jurisdiction.prefecture
+    return (prefecture, database_spelling(prefecture, normalize(jurisdiction.city)),
+            database_spelling(prefecture, normalize(jurisdiction.ward)))
+
+def jurisdiction_at(lat: float, lon: float) -> Optional[Tuple[str, str, str]]:
+    """(prefecture, city, ward) at a point: the boundary polygon containing it, else the nearest gazetteer city/ward
+
+    The gazetteer fallback is a centroid approximation for trees without imported boundaries.
+    """
+    located = boundary_components(lat, lon)
+    if located is not None:
+        return located
+    gazetteer = get_gazetteer()
+    place = gazetteer.nearest_place(lat, lon, depth=2, max_km=JURISDICTION_MAX_KM)
+    if place is None:
+        return None
+    prefecture, city = place.path
+    ward = ""
+    if city in DESIGNATED_CITIES:
+        ward_place = gazetteer.nearest_place(lat, lon, depth=3, max_km=JURISDICTION_MAX_KM)
+        if ward_place is not None and ward_place.path[:2] == place.path:
+            ward = ward_place.path[2]
+    return prefecture, city, ward
+
+def calculate_distance(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
+    """Calculate distance between two points using Haversine formula"""
+    return haversine_km(lat1, lon1, lat2, lon2)
+
+def estimate_coordinates_from_address(address: str, allow_remote: bool = True, prefecture: Optional[str] = None) -> Optional[Tuple[float, float]]:
+    """Estimate coordinates from a Japanese address string with hierarchical precision
+
+    With allow_remote=False only the local gazetteer is consulted (no GSI fallback).
+    `prefecture` scopes addresses that omit it (e.g. "横浜市中区..." listed under 神奈川県).
+    A 〒 code with coordinates answers before the GSI fallback is tried.
+    """
+    return FACILITY_GEOCODER.geocode(address, prefecture, allow_remote=allow_remote).coords
+
+def gsi_address_search(address: str, timeout: float = 10, use_cache: bool = True,
+                       total_timeout: Optional[float] = None) -> Optional[Tuple[float, float]]:
+    """Query the GSI AddressSearch API (None = no match; transport errors are raised)
+
+    Answers are served from and recorded in the persistent geocode cache unless use_cache=False.
+    total_timeout bounds the whole call, retries and waits included (see HttpClient.get).
+    """
+    if use_cache:
+        return get_geocode_cache().get_or_fetch(
+            address, lambda q: gsi_address_search(q, timeout, use_cache=False, total_timeout=total_timeout))
+    
+    client = get_http_client()
+    client.set_rate_limit(GSI_GEOCODE, GSI_MAX_REQUESTS_PER_SECOND, GSI_BURST)
+    params = {"q": address}
+    response = client.get(GSI_GEOCODE, params=params, timeout=timeout, total_timeout=total_timeout)
+    response.raise_for_status()
+    
+    data = response.json()
+    if data and len(data) > 0:
+        first_result = data[0]
+        geometry = first_result.get("geometry")
+        if geometry and "coordinates" in geometry:
+            lon, lat = geometry["coordinates"]
+            return lat, lon
+    return None
+
+def geocode_gsi_fallback(address: str, timeout: float = 5) -> Optional[Tuple[float, float]]:
+    """Fallback geocoding using GSI API for addresses not in our coordinate map, within timeout seconds"""
+    try:
+        return gsi_address_search(address, timeout=timeout, total_timeout=timeout)
+    except Exception:
+        # Silent fallback failure - we don't want to break the app
+        return None
+
+# Interactive lookups want the exact address: GSI (answered from the geocode cache when it
+# has the address), with the postal code's town or the (typo-tolerant) gazetteer's place as
+# the fallback when GSI has no match or is unreachable. The cache is only consulted by the
+# GSI step, so a cold lookup counts one miss and a cached "no match" is never refetched.
+ADDRESS_GEOCODER = GeocoderChain([
+    postal_code_step(lambda code: get_postal_index().answer(code)),
+    gazetteer_step(get_gazetteer()),
+    fuzzy_gazetteer_step(get_gazetteer()),
+    remote_step(lambda address, timeout: gsi_address_search(address, timeout=timeout, total_timeout=timeout)),
+], budget=GEOCODE_BUDGET_SECONDS, required_precision=ADDRESS)
+
+# Facility estimation takes the first answer: any gazetteer place, else the postal code, else a
+# fuzzy gazetteer match, else the GSI fallback
+FACILITY_GEOCODER = GeocoderChain([
+    gazetteer_step(get_gazetteer()),
+    postal_code_step(lambda code: get_postal_index().answer(code)),
+    fuzzy_gazetteer_step(get_gazetteer()),
+    remote_step(lambda address, timeout: geocode_gsi_fallback(address, timeout), max_timeout=5),
+], required_precision=PREFECTURE)
+
+def geocode_address(address: str) -> GeocodeResult:
+    """Resolve a user's address through ADDRESS_GEOCODER (prefecture taken from the address)
+
+    An address led by a 〒 code whose entry locates its town (as precise as a code gets) is
+    resolved locally, without GSI; codes without coordinates, or with only a city's, still
+    go to GSI.
+    """
+    entry = get_postal_index().lookup_address(address)
+    town_located = entry is not None and entry.coords is not None and entry.depth >= TOWN
+    return ADDRESS_GEOCODER.geocode(address, parse_address_components(address)[0] or None, allow_remote=not town_located)
+
+def read_facility_sidecar(path: str = FACILITY_COORDINATES_PATH) -> Tuple[Dict[str, Optional[Tuple[float, float]]], List[str]]:
+    """(coordinates, unresolved addresses) from the sidecar
+
+    A None coordinate means GSI answered "no match"; unresolved addresses are those an
+    offline build could not place, left for the next online build. Both are empty when the
+    sidecar is missing, unreadable or written by a different format version.
+    """
+    try:
+        with open(path, encoding="utf-8") as f:
+            payload = json.load(f)
+    except (OSError, ValueError):
+        return {}, []
+    
+    if payload.get("version") != FACILITY_COORDINATES_VERSION:
+        return {}, []
+    
+    coordinates = {
+        address: (tuple(coords) if coords else None)
+        for address, coords in payload.get("coordinates", {}).items()
+    }
+    return coordinates, list(payload.get("unresolved", []))
+
+def load_facility_coordinates(path: str = FACILITY_COORDINATES_PATH) -> Dict[str, Optional[Tuple[float, float]]]:
+    """Load the precomputed facility coordinate sidecar (address -> (lat, lon) or None)
+
+    Unresolved addresses map to None, so they stay unmapped instead of being geocoded at load time.
+    """
+    coordinates, unresolved = read_facility_sidecar(path)
+    coordinates.update(dict.fromkeys(unresolved))
+    return coordinates
+
+@st.cache_resource(show_spinner=False)
+def get_data_plane() -> Dict[str, Any]:
+    """Read-only lookup structures shared by every session and rerun of the server process
+
+    Streamlit re-executes this script on each interaction, so plain module globals would be
+    rebuilt every time; the cached resource is built once per process.
+    """
+    return {
+        "contacts": get_contact_store(),
+        "gazetteer": get_gazetteer(),
+        "facility_coordinates": load_facility_coordinates(),
+        "prefecture_facilities": {},
+        "prefecture_partitions": {},
+        "prefecture_indexes": {},
+        "prefecture_stations": {},
+        "national_index": None,
+        "lock": threading.RLock(),
+    }
+
+# Resolved on every script run: the cached instance under Streamlit, built once per import elsewhere
+_data_plane = get_data_plane()
+
+def get_facility_coordinates(address: str, prefecture: Optional[str] = None) -> Optional[Tuple[float, float]]:
+    """Coordinates for a database facility address, served from the sidecar when possible
+
+    Addresses recorded in the sidecar never trigger geocoding: a stored None means GSI
+    already answered "no match" at build time (or an offline build could not place it).
+    Addresses missing from the sidecar (e.g. facilities added since the last build) are
+    placed with the local gazetteer only: index builds never wait on GSI, and a facility
+    the gazetteer cannot place stays unmapped until the sidecar is rebuilt.
+    """
+    facility_coordinates = _data_plane["facility_coordinates"]
+    if address in facility_coordinates:
+        return facility_coordinates[address]
+    return estimate_coordinates_from_address(address, allow_remote=False, prefecture=prefecture)
+
+CONTACT_CATEGORIES = ['労基署', '警察署', '市区町村役所', '消防署', 'ガス', '電力', '病院', '保健所', '水道', 'NTT', '下水道']
+SEARCH_RADII = [1, 2, 3, 4, 5, 7, 9, 11, 13, 15, 17]  # Progressive search radii in km
+CONTACT_TARGET_COUNTS = {'警察署': 3, '消防署': 3, '病院': 3, '市区町村役所': 2}  # every other category: 1
+
+class Facility(NamedTuple):
+    """One placement of a database facility in a prefecture; immutable and shared by every query"""
+    facility_id: int  # position in the prefecture's database order, also the tie-breaker
+    prefecture: str
+    category: str
+    contact: Mapping[str, Any]  # read-only view of the contact store record
+    city: str
+    district: str
+    coords: Optional[Tuple[float, float]] = None  # known position (imported POIs); else from the address
+
+class ContactHit(NamedTuple):
+    """One selected facility for a query: which, how far (km, rounded) and in which search radius
+
+    facility_id indexes get_prefecture_facilities(prefecture).
+    """
+    facility_id: int
+    distance_km: Optional[float]
+    tier: Optional[int]
+    prefecture: str
+
+def facility_contact(facility: Facility, distance_km: Optional[float]) -> Dict[str, Any]:
+    """A fresh contact dict for display: the shared record plus the query's distance"""
+    contact = facility.contact.copy()  # copies the underlying dict (faster than unpacking the proxy)
+    contact['distance_km'] = distance_km
+    return contact
+
+def build_prefecture_facilities(prefecture: str, osm_store_path: str = OSM_STORE_PATH) -> Tuple[Facility, ...]:
+    """Every facility placement of one prefecture in database order, indexed by facility_id
+
+    Facilities imported from OpenStreetMap (osm_import.py) follow the database ones; those
+    without a phone number, or already listed in the database under the same name and
+    category, are left out. Names are compared by station_key, so full-width spellings and
+    organization prefixes (山梨県警察甲府警察署) match the database's 甲府警察署.
+    """
+    facilities = []
+    for city, city_data in CONTACT_DATABASE.get(prefecture, {}).items():
+        for district_key, district_data in city_data.items():
+            for contact_type in CONTACT_CATEGORIES:
+                for contact in district_data.get(contact_type, []):
+                    facilities.append(Facility(len(facilities), prefecture, contact_type, MappingProxyType(contact), city, district_key))
+    
+    listed = {(facility.category, station_key(facility.contact.get('name') or '')) for facility in facilities}
+    for row in load_osm_facilities(prefecture, osm_store_path):
+        key = (row['category'], station_key(row['name'] or ''))
+        if not row['phone'] or key in listed:
+            continue
+        listed.add(key)
+        contact = {field: row[field] for field in ('name', 'phone', 'address', 'hours') if row[field]}
+        contact['source'] = 'OpenStreetMap'
+        facilities.append(Facility(len(facilities), prefecture, row['category'], MappingProxyType(contact),
+                                   row['city'] or '', row['district'] or '', (row['lat'], row['lon'])))
+    return tuple(facilities)
+
+def _prefecture_cached(table: str, prefecture: str, build: Callable[[str], Any]) -> Any:
+    """Per-prefecture structure from the data plane, built once on first use"""
+    cache = _data_plane[table]
+    value = cache.get(prefecture)
+    if value is None:
+        with _data_plane["lock"]:
+            value = cache.get(prefecture)
+            if value is None:
+                value = build(prefecture)
+                cache[prefecture] = value
+    return value
+
+def get_prefecture_facilities(prefecture: str) -> Tuple[Facility, ...]:
+    """Facility records of one prefecture, built on first use and reused afterwards"""
+    return _prefecture_cached("prefecture_facilities", prefecture, build_prefecture_facilities)
+
+class CategoryPartition(NamedTuple):
+    """Facilities of one (prefecture, category) as arrays, in database order"""
+    facility_ids: np.ndarray  # facilities with coordinates
+    lats: np.ndarray
+    lons: np.ndarray
+    unmapped_ids: np.ndarray  # facilities whose address could not be placed
+
+def build_prefecture_partitions(prefecture: str) -> Dict[str, CategoryPartition]:
+    """Split a prefecture's facilities by category in one pass, resolving each address once"""
+    columns = {contact_type: ([], [], [], []) for contact_type in CONTACT_CATEGORIES}
+    resolved: Dict[str, Optional[Tuple[float, float]]] = {}
+    
+    for facility in get_prefecture_facilities(prefecture):
+        facility_ids, lats, lons, unmapped_ids = columns[facility.category]
+        contact_coords = facility.coords
+        if contact_coords is None:
+            address = facility.contact.get('address', '')
+            if address not in resolved:
+                resolved[address] = get_facility_coordinates(address, prefecture)
+            contact_coords = resolved[address]
+        if contact_coords:
+            facility_ids.append(facility.facility_id)
+            lats.append(contact_coords[0])
+            lons.append(contact_coords[1])
+        else:
+            unmapped_ids.append(facility.facility_id)
+    
+    return {
+        contact_type: CategoryPartition(
+            np.array(facility_ids, dtype=np.int64), np.array(lats, dtype=np.float64),
+            np.array(lons, dtype=np.float64), np.array(unmapped_ids, dtype=np.int64),
+        )
+        for contact_type, (facility_ids, lats, lons, unmapped_ids) in columns.items()
+    }
+
+def get_prefecture_partitions(prefecture: str) -> Dict[str, CategoryPartition]:
+    """Per-category facility id and coordinate arrays of one prefecture, built once"""
+    return _prefecture_cached("prefecture_partitions", prefecture, build_prefecture_partitions)
+
+def build_prefecture_indexes(prefecture: str) -> Dict[str, Tuple[GridIndex, List[Facility]]]:
+    """Per-category (spatial index of mappable facilities, unmappable facilities) for one prefecture"""
+    facilities = get_prefecture_facilities(prefecture)
+    indexes = {}
+    for contact_type, partition in get_prefecture_partitions(prefecture).items():
+        index = GridIndex()
+        index.insert_many(partition.lats, partition.lons, [facilities[i] for i in partition.facility_ids.tolist()])
+        indexes[contact_type] = (index, [facilities[i] for i in partition.unmapped_ids.tolist()])
+    return indexes
+
+def get_prefecture_indexes(prefecture: str) -> Dict[str, Tuple[GridIndex, List[Facility]]]:
+    """Per-category spatial indexes for one prefecture, built on first use and reused afterwards"""
+    return _prefecture_cached("prefecture_indexes", prefecture, build_prefecture_indexes)
+
+def build_prefecture_stations(prefecture: str) -> Dict[Tuple[str, str], List[int]]:
+    """(category, station_key(name)) → facility ids of every placement of a police or fire station"""
+    stations: Dict[Tuple[str, str], List[int]] = {}
+    for facility in get_prefecture_facilities(prefecture):
+        if facility.category in SERVICE_AREA_CATEGORIES and facility.contact.get('name'):
+            stations.setdefault((facility.category, station_key(facility.contact['name'])), []).append(facility.facility_id)
+    return stations
+
+def get_prefecture_stations(prefecture: str) -> Dict[Tuple[str, str], List[int]]:
+    """Police and fire stations of one prefecture by name, built once"""
+    return _prefecture_cached("prefecture_stations", prefecture, build_prefecture_stations)
+
+def responsible_stations(lat: float, lon: float) -> Dict[str, FrozenSet[Tuple[str, int]]]:
+    """Per category, (prefecture, facility_id) of every placement of the stations whose service areas contain a point
+
+    Overlapping areas of one category (a shared border, or two publishers' files) contribute
+    all their stations. Empty without imported service areas, and for areas naming a
+    station the database lacks.
+    """
+    stations: Dict[str, FrozenSet[Tuple[str, int]]] = {}
+    for area in get_service_area_index().stations_at(lat, lon):
+        if area.prefecture not in CONTACT_DATABASE:
+            continue
+        facility_ids = get_prefecture_stations(area.prefecture).get((area.category, station_key(area.name)))
+        if facility_ids:
+            placements = frozenset((area.prefecture, facility_id) for facility_id in facility_ids)
+            stations[area.category] = stations.get(area.category, frozenset()) | placements
+    return stations
+
+def radius_tier(distance_km: Optional[float]) -> Optional[int]:
+    """The smallest search radius that contains a (rounded) distance; None beyond the last radius"""
+    if distance_km is None:
+        return None
+    tier = bisect.bisect_left(SEARCH_RADII, distance_km)
+    return SEARCH_RADII[tier] if tier < len(SEARCH_RADII) else None
+
+def select_nearest_contacts(nearby: Sequence[Tuple[float, Facility]], unmapped: Sequence[Facility],
+                            city_name: str, district_name: str, target_count: int,
+                            prefecture: Optional[str] = None,
+                            responsible: FrozenSet[Tuple[str, int]] = frozenset()) -> List[ContactHit]:
+    """Pick the contacts the progressive radius search would, in one pass over the candidates
+
+    `nearby` is (rounded distance, facility) nearest first; `unmapped` are facilities without
+    coordinates, which only count for the same city. The search stops at the first radius
+    holding target_count candidates, so that radius is read off the sorted distances instead
+    of rescanning at every step; the best target_count are then taken with a bounded heap
+    under the original ordering (distance, same city/district and distance bonus, database
+    order). Distance and radius tier are None for unmapped contacts.
+
+    When candidates span prefectures, pass the user's prefecture: "same city" then also
+    requires the same prefecture (府中市 exists in 東京都 and 広島県), and ties go to the
+    user's prefecture before database order.
+
+    `responsible` holds (prefecture, facility_id) of the placements of the stations whose
+    service areas contain the point: the nearest placement of each comes first whatever the
+    distance, and the other slots are filled by distance from the remaining stations.
+    """
+    pinned: List[Tuple[Optional[float], Facility]] = []
+    if responsible:
+        # Placements of one station share its name; the first seen is the nearest
+        pinned_keys = set()
+        placements = [*nearby, *((None, facility) for facility in unmapped)]
+        for distance_km, facility in placements:
+            if (facility.prefecture, facility.facility_id) in responsible:
+                key = station_key(facility.contact.get('name') or '')
+                if key not in pinned_keys:
+                    pinned_keys.add(key)
+                    pinned.append((distance_km, facility))
+        if pinned:
+            # Their other placements are the same stations: they take no further slot
+            pinned = pinned[:target_count]
+            nearby = [hit for hit in nearby if (hit[1].prefecture, hit[1].facility_id) not in responsible]
+            unmapped = [facility for facility in unmapped if (facility.prefecture, facility.facility_id) not in responsible]
+            target_count -= len(pinned)
+    
+    local = []
+    for facility in unmapped:
+        # Include unmappable contacts with lower priority only if same city
+        if facility.city == city_name and prefecture in (None, facility.prefecture):
+            priority_score = 25  # Low priority for unmappable addresses
+            if facility.district == district_name:
+                priority_score += 15
+            local.append((None, priority_score, facility))
+    
+    # Radius at which the progressive search would have stopped
+    needed = target_count - len(local)
+    radius_km = SEARCH_RADII[-1]
+    if needed <= 0:
+        radius_km = SEARCH_RADII[0]
+    elif needed <= len(nearby):
+        radius_km = radius_tier(nearby[needed - 1][0]) or SEARCH_RADII[-1]
+    
+    def candidates():
+        for distance_km, facility in nearby:
+            if distance_km > radius_km:
+                break
+            
+            # Prioritize contacts from the same city/district
+            priority_score = 0
+            if facility.city == city_name and prefecture in (None, facility.prefecture):
+                priority_score += 100  # Same city gets high priority
+                if facility.district == district_name:
+                    priority_score += 50  # Same district gets extra priority
+            
+            # Distance bonus (closer = higher score)
+            priority_score += max(0, int((radius_km - distance_km) * 10))
+            yield distance_km, priority_score, facility
+        yield from local
+    
+    # Distance first (closer is better), then priority score, then database order
+    best = heapq.nsmallest(target_count, candidates(), key=lambda x: (
+        x[0] or 999, -x[1], x[2].prefecture != prefecture, x[2].prefecture, x[2].facility_id
+    ))
+    return [
+        ContactHit(facility.facility_id, distance_km, radius_tier(distance_km), facility.prefecture)
+        for distance_km, facility in pinned + [(distance_km, facility) for distance_km, _, facility in best]
+    ]
+
+def build_national_index() -> GridIndex:
+    """One spatial index over the mappable facilities of every prefecture and category
+
+    A single index (not one per category) lets a search fetch every category in one query.
+    """
+    index = GridIndex()
+    for prefecture in CONTACT_DATABASE:
+        facilities = get_prefecture_facilities(prefecture)
+        for partition in get_prefecture_partitions(prefecture).values():
+            index.insert_many(partition.lats, partition.lons, [facilities[i] for i in partition.facility_ids.tolist()])
+    return index
+
+def get_national_index() -> GridIndex:
+    """Nationwide spatial index, built on first use (loads every prefecture)"""
+    index = _data_plane["national_index"]
+    if index is None:
+        with _data_plane["lock"]:
+            index = _data_plane["national_index"]
+            if index is None:
+                index = build_national_index()
+                _data_plane["national_index"] = index
+    return index
+
+NEARBY_MAX_KM = SEARCH_RADII[-1] + 0.051  # every facility that rounds to within the last radius
+
+def _nearby_facilities(index: GridIndex, user_lat: float, user_lon: float) -> List[Tuple[float, Facility]]:
+    # One vectorized query covers every radius; distances are rounded to 0.1 km
+    # before the radius check, as displayed (nearest first, so each radius is a prefix)
+    return [
+        (round(distance, 1), facility)
+        for distance, facility in index.query_radius(user_lat, user_lon, NEARBY_MAX_KM)
+    ]
+
+def _nearby_facilities_batch(index: GridIndex, points: Sequence[Tuple[float, float]]) -> List[List[Tuple[float, Facility]]]:
+    """_nearby_facilities for many points, as one spatial join"""
+    joined = index.join_radius([lat for lat, _ in points], [lon for _, lon in points], NEARBY_MAX_KM)
+    return [[(round(distance, 1), facility) for distance, facility in hits] for hits in joined]
+
+def _by_category(nearby: Sequence[Tuple[float, Facility]]) -> Dict[str, List[Tuple[float, Facility]]]:
+    nearby_by_type: Dict[str, List[Tuple[float, Facility]]] = {contact_type: [] for contact_type in CONTACT_CATEGORIES}
+    for hit in nearby:
+        nearby_by_type[hit[1].category].append(hit)
+    return nearby_by_type
+
+def find_nearest_facilities(prefecture: str, city_name: str, district_name: str,
+                            user_coords: Tuple[float, float], cross_prefecture: bool = False,
+                            prefer_same_prefecture: bool = False) -> Dict[str, List[ContactHit]]:
+    """Nearest facilities of every category around user_coords, as (facility_id, distance, tier)
+
+    Pure and allocation-light: only the shared indexes are read, and each hit resolves
+    through get_prefecture_facilities(hit.prefecture). By default only the user's prefecture
+    is searched. With cross_prefecture the nationwide index is used, so a facility just
+    across a border wins over a farther one at home; prefer_same_prefecture then fills the
+    results from the user's prefecture first and takes neighbours only for missing slots.
+    Police and fire stations whose service area contains the point come first (see
+    responsible_stations).
+    """
+    if prefecture not in CONTACT_DATABASE and not cross_prefecture:
+        return {contact_type: [] for contact_type in CONTACT_CATEGORIES}
+    
+    user_lat, user_lon = user_coords
+    if cross_prefecture:
+        nearby_by_type = _by_category(_nearby_facilities(get_national_index(), user_lat, user_lon))
+    else:
+        nearby_by_type = {
+            contact_type: _nearby_facilities(index, user_lat, user_lon)
+            for contact_type, (index, _) in get_prefecture_indexes(prefecture).items()
+        }
+    return _select_facilities(prefecture, city_name, district_name, nearby_by_type,
+                              responsible_stations(user_lat, user_lon), cross_prefecture, prefer_same_prefecture)
+
+def find_nearest_facilities_batch(queries: Sequence[Tuple[str, str, str, Tuple[float, float]]],
+                                  cross_prefecture: bool = False,
+                                  prefer_same_prefecture: bool = False) -> List[Dict[str, List[ContactHit]]]:
+    """find_nearest_facilities for many (prefecture, city, district, coords) queries, with the same results
+
+    The nearby facilities of every query come from one spatial join per index (the
+    nationwide one, or each prefecture's per category) instead of one search per query;
+    the selection is find_nearest_facilities' own.
+    """
+    nearby: List[Dict[str, List[Tuple[float, Facility]]]] = [
+        {contact_type: [] for contact_type in CONTACT_CATEGORIES} for _ in queries
+    ]
+    if cross_prefecture:
+        joined = _nearby_facilities_batch(get_national_index(), [coords for _, _, _, coords in queries])
+        nearby = [_by_category(hits) for hits in joined]
+    else:
+        by_prefecture: Dict[str, List[int]] = {}
+        for position, (prefecture, _, _, _) in enumerate(queries):
+            if prefecture in CONTACT_DATABASE:
+                by_prefecture.setdefault(prefecture, []).append(position)
+        for prefecture, positions in by_prefecture.items():
+            points = [queries[position][3] for position in positions]
+            for contact_type, (index, _) in get_prefecture_indexes(prefecture).items():
+                for position, hits in zip(positions, _nearby_facilities_batch(index, points)):
+                    nearby[position][contact_type] = hits
+    
+    results = []
+    for (prefecture, city_name, district_name, (lat, lon)), nearby_by_type in zip(queries, nearby):
+        if prefecture not in CONTACT_DATABASE and not cross_prefecture:
+            results.append({contact_type: [] for contact_type in CONTACT_CATEGORIES})
+            continue
+        results.append(_select_facilities(prefecture, city_name, district_name, nearby_by_type,
+                                          responsible_stations(lat, lon), cross_prefecture, prefer_same_prefecture))
+    return results
+
+def _select_facilities(prefecture: str, city_name: str, district_name: str,
+                       nearby_by_type: Mapping[str, List[Tuple[float, Facility]]],
+                       stations: Mapping[str, FrozenSet[Tuple[str, int]]], cross_prefecture: bool,
+                       prefer_same_prefecture: bool) -> Dict[str, List[ContactHit]]:
+    """The selection step of find_nearest_facilities, given every category's nearby facilities"""
+    hits = {contact_type: [] for contact_type in CONTACT_CATEGORIES}
+    local_indexes = get_prefecture_indexes(prefecture) if prefecture in CONTACT_DATABASE else {}
+    for contact_type in CONTACT_CATEGORIES:
+        unmapped = local_indexes.get(contact_type, (None, []))[1]
+        nearby = nearby_by_type[contact_type]
+        target_count = CONTACT_TARGET_COUNTS.get(contact_type, 1)
+        if not cross_prefecture:
+            if not nearby and not unmapped:
+                continue
+            hits[contact_type] = select_nearest_contacts(
+                nearby, unmapped, city_name, district_name, target_count,
+                responsible=stations.get(contact_type, frozenset()),
+            )
+            continue
+        
+        if not prefer_same_prefecture:
+            hits[contact_type] = select_nearest_contacts(
+                nearby, unmapped, city_name, district_name, target_count, prefecture,
+                stations.get(contact_type, frozenset()),
+            )
+            continue
+        
+        responsible = stations.get(contact_type, frozenset())
+        selected = select_nearest_contacts(
+            [hit for hit in nearby if hit[1].prefecture == prefecture], unmapped,
+            city_name, district_name, target_count, prefecture, responsible,
+        )
+        # Neighbours fill the missing slots; a responsible station across the border is
+        # taken (and listed first) even when the user's prefecture filled them all
+        across = any(station_prefecture != prefecture for station_prefecture, _ in responsible)
+        if len(selected) < target_count or across:
+            neighbours = select_nearest_contacts(
+                [hit for hit in nearby if hit[1].prefecture != prefecture], [],
+                city_name, district_name, target_count if across else target_count - len(selected),
+                prefecture, responsible,
+            )
+            merged = selected + neighbours
+            pinned = [hit for hit in merged if (hit.prefecture, hit.facility_id) in responsible]
+            selected = (pinned + [hit for hit in merged if (hit.prefecture, hit.facility_id) not in responsible])[:target_count]
+        hits[contact_type] = selected
+    return hits
+
+def get_comprehensive_contacts(city_name: str, district_name: str, prefecture: str, user_coords: Optional[Tuple[float, float]] = None,
+                               cross_prefecture: bool = False, prefer_same_prefecture: bool = False) -> Dict[str, List[Dict]]:
+    """Get comprehensive contact information from the database, prioritizing nearest branches
+
+    cross_prefecture and prefer_same_prefecture apply to coordinate searches (see
+    find_nearest_facilities); without coordinates only the user's own prefecture is listed.
+    """
+    contacts = {contact_type: [] for contact_type in CONTACT_CATEGORIES}
+    
+    # If we have user coordinates, find nearest contacts using progressive radius search
+    if user_coords and (cross_prefecture or prefecture in CONTACT_DATABASE):
+        return hit_contacts(find_nearest_facilities(
+            prefecture, city_name, district_name, user_coords, cross_prefecture, prefer_same_prefecture
+        ))
+    elif not user_coords and prefecture in CONTACT_DATABASE:
+        pref_data = CONTACT_DATABASE[prefecture]
+        
+        # Fallback to original logic if no coordinates
+        if city_name in pref_data:
+            city_data = pref_data[city_name]
+            
+            # Check for district-specific data first
+            if district_name and district_name in city_data:
+                district_data = city_data[district_name]
+                for contact_type in contacts.keys():
+                    if contact_type in district_data:
+                        contacts[contact_type] = list(district_data[contact_type])
+            # Check for city-level data
+            elif "" in city_data:
+                city_level_data = city_data[""]
+                for contact_type in contacts.keys():
+                    if contact_type in city_level_data:
+                        contacts[contact_type] = list(city_level_data[contact_type])
+    
+    return contacts
+
+def hit_contacts(hits_by_type: Mapping[str, List[ContactHit]]) -> Dict[str, List[Dict]]:
+    """Contacts of the selected facilities, per category"""
+    # Fresh dicts for the selected few; the shared records are never touched
+    return {
+        contact_type: [
+            facility_contact(get_prefecture_facilities(hit.prefecture)[hit.facility_id], hit.distance_km)
+            for hit in hits
+        ]
+        for contact_type, hits in hits_by_type.items()
+    }
+
+def get_comprehensive_contacts_batch(queries: Sequence[Tuple[str, str, str, Optional[Tuple[float, float]]]],
+                                     cross_prefecture: bool = False,
+                                     prefer_same_prefecture: bool = False) -> List[Dict[str, List[Dict]]]:
+    """get_comprehensive_contacts for many (city, district, prefecture, coords) queries, with the same results
+
+    Queries with coordinates are searched together (find_nearest_facilities_batch); the
+    others list their city's contacts one by one.
+    """
+    results: List[Optional[Dict[str, List[Dict]]]] = [None] * len(queries)
+    located = []
+    for position, (city_name, district_name, prefecture, user_coords) in enumerate(queries):
+        if user_coords and (cross_prefecture or prefecture in CONTACT_DATABASE):
+            located.append(position)
+        else:
+            results[position] = get_comprehensive_contacts(city_name, district_name, prefecture, user_coords)
+    searched = find_nearest_facilities_batch(
+        [(queries[p][2], queries[p][0], queries[p][1], queries[p][3]) for p in located],
+        cross_prefecture, prefer_same_prefecture,
+    )
+    for position, hits_by_type in zip(located, searched):
+        results[position] = hit_contacts(hits_by_type)
+    return results
+
+def locate_address(address: str) -> Tuple[GeocodeResult, Tuple[str, str, str]]:
+    """Geocode one address and read its (prefecture, city, ward); not memoized
+
+    Geocoding runs ADDRESS_GEOCODER (cache, postal code, gazetteer, GSI). Coordinates of town
+    precision or better take their jurisdiction from the boundary polygons when those are
+    imported; otherwise it is parsed from the address.
+    """
+    geocoded = geocode_address(address)
+    coords = geocoded.coords
+    located = boundary_components(*coords) if coords and (geocoded.precision or 0) >= TOWN else None
+    return geocoded, located or parse_address_components(address)
+
+class GeocodeIncomplete(Exception):
+    """A search whose geocoding fell short because a resolver failed; carries the result"""
+    def __init__(self, result: Dict[str, Any]):
+        super().__init__("; ".join(f"{t.step}: {t.error}" for t in result["geocode"].errors))
+        self.result = result
+
+def search_address(address: str, cross_prefecture: bool = False, prefer_same_prefecture: bool = False) -> Dict[str, Any]:
+    """Geocode, parse and search one address (the app memoizes it per canonical address)
+
+    Geocoding and jurisdiction come from locate_address. When a resolver failed and the
+    answer is less precise than the address, GeocodeIncomplete carries the result instead,
+    so that a transient failure is never memoized. Without coordinates the search falls back
+    to the parsed city's listing; the cross-prefecture search only runs from coordinates.
+    """
+    geocoded, (pref, city_name, district_name) = locate_address(address)
+    coords = geocoded.coords
+    result = {
+        "coords": coords,
+        "geocode": geocoded,
+        "components": (pref, city_name, district_name),
+        "contacts": get_comprehensive_contacts(
+            city_name, district_name, pref, coords,
+            cross_prefecture=cross_prefecture and coords is not None, prefer_same_prefecture=prefer_same_prefecture,
+        ),
+    }
+    if geocoded.errors and (geocoded.precision or 0) < ADDRESS:
+        raise GeocodeIncomplete(result)
+    return result
+
+def search_coordinates(lat: float, lon: float, cross_prefecture: bool = False, prefer_same_prefecture: bool = False) -> Dict[str, Any]:
+    """Search from a point (a GPS fix or a picked location) instead of an address
+
+    The jurisdiction comes from jurisdiction_at, so nothing is geocoded or fetched remotely.
+    """
+    coords = (lat, lon)
+    pref, city_name, district_name = jurisdiction_at(lat, lon) or ("", "", "")
+    return {
+        "coords": coords,
+        "geocode": GeocodeResult(coords, ADDRESS, "coordinates", ()),
+        "components": (pref, city_name, district_name),
+        "contacts": get_comprehensive_contacts(
+            city_name, district_name, pref, coords,
+            cross_prefecture=cross_prefecture, prefer_same_prefecture=prefer_same_prefecture,
+        ),
+    }
+
+COORDINATES = re.compile(r'^\s*(-?\d+(?:\.\d+)?)\s*[,、，\s]\s*(-?\d+(?:\.\d+)?)\s*$')
+
+def parse_coordinates(text: str) -> Optional[Tuple[float, float]]:
+    """(lat, lon) from "35.6895, 139.6917" (comma or space separated), or None"""
+    match = COORDINATES.match(text)
+    if not match:
+        return None
+    lat, lon = float(match.group(1)), float(match.group(2))
+    if not (-90 <= lat <= 90 and -180 <= lon <= 180):
+        return None
+    return lat, lon
+
+def format_contact_row(contact_info: Dict[str, Any], service_type: str) -> Dict[str, str]:
+    """Format a single contact into a table row"""
+    return {
+        "種別": service_type,
+        "施設名": contact_info.get("name", ""),
+        "電話番号": contact_info.get("phone", ""),
+        "住所": contact_info.get("address", ""),
+        "営業時間": contact_info.get("hours", ""),
+        "サービス": ", ".join(contact_info.get("services", [])),
+        "距離": contact_info.get("distance_km", "")
+    }
+
+def assemble_results(comprehensive_contacts: Dict[str, List[Dict]]) -> pd.DataFrame:
+    """Assemble final results with phone numbers"""
+    rows = []
+    
+    # Add database contacts (priority)
+    for category, contacts in comprehensive_contacts.items():
+        if contacts:
+            for contact in contacts:
+                if contact.get("phone"):  # Only include contacts with phone numbers
+                    rows.append(format_contact_row(contact, category))
+    
+    return pd.DataFrame(rows)
@@ -0,0 +1,337 @@
+# contact_store.py
+# Compiled contact store: CONTACT_DATABASE (contact_data.py) compiled into SQLite and
+# loaded lazily one prefecture at a time
+
+import ast
+import hashlib
+import json
+import os
+import sqlite3
+import sys
+import tempfile
+import threading
+from collections.abc import Mapping
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+CONTACT_SOURCE_PATH = os.path.join(BASE_DIR, "contact_data.py")
+CONTACT_STORE_PATH = os.path.join(BASE_DIR, "contacts.sqlite")
+CONTACT_STORE_VERSION = 3
+
+SCHEMA = """
+CREATE TABLE meta (key TEXT PRIMARY KEY, value TEXT NOT NULL);
+CREATE TABLE services (id INTEGER PRIMARY KEY, items TEXT NOT NULL UNIQUE);
+CREATE TABLE facilities (
+    id INTEGER PRIMARY KEY,
+    name TEXT,
+    phone TEXT,
+    address TEXT,
+    hours TEXT,
+    services_id INTEGER REFERENCES services (id)
+);
+CREATE TABLE placements (
+    id INTEGER PRIMARY KEY,
+    prefecture TEXT NOT NULL,
+    city TEXT NOT NULL,
+    district TEXT NOT NULL,
+    category TEXT NOT NULL,
+    facility_id INTEGER NOT NULL REFERENCES facilities (id)
+);
+CREATE INDEX placements_prefecture ON placements (prefecture, id);
+"""
+
+def _intern(value: Optional[str]) -> Optional[str]:
+    return sys.intern(value) if value is not None else None
+
+def source_fingerprint(source_path: str = CONTACT_SOURCE_PATH) -> str:
+    """SHA-1 of the contact source file, used to detect a stale compiled store"""
+    with open(source_path, "rb") as f:
+        return hashlib.sha1(f.read()).hexdigest()
+
+def _new_merge_report() -> Dict[str, Any]:
+    return {"duplicate_keys": [], "identical_dropped": 0, "conflicts": []}
+
+def _merge_facilities(existing: List[Dict], incoming: List[Dict], path: Tuple, report: Dict[str, Any]) -> List[Dict]:
+    """Merge two facility lists of a duplicated block, matching facilities by name
+
+    Identical facilities are kept once. When the same name carries different details the
+    later definition wins (what Python's dict literal already exposed) and a conflict is
+    reported; either way the facility keeps the position of its first definition.
+    """
+    merged = list(existing)
+    positions = {facility.get("name"): i for i, facility in enumerate(merged)}
+    for facility in incoming:
+        name = facility.get("name")
+        if name not in positions:
+            positions[name] = len(merged)
+            merged.append(facility)
+            continue
+        previous = merged[positions[name]]
+        if previous == facility:
+            report["identical_dropped"] += 1
+            continue
+        report["conflicts"].append({
+            "path": list(path),
+            "name": name,
+            "fields": sorted(k for k in set(previous) | set(facility) if previous.get(k) != facility.get(k)),
+        })
+        merged[positions[name]] = facility
+    return merged
+
+def _merge_values(existing: Any, incoming: Any, path: Tuple, report: Dict[str, Any]) -> Any:
+    if isinstance(existing, dict) and isinstance(incoming, dict):
+        for key, value in incoming.items():
+            if key in existing:
+                existing[key] = _merge_values(existing[key], value, path + (key,), report)
+            else:
+                existing[key] = value
+        return existing
+    if isinstance(existing, list) and isinstance(incoming, list):
+        return _merge_facilities(existing, incoming, path, report)
+    report["conflicts"].append({"path": list(path), "name": None, "fields": []})
+    return incoming
+
+def _build_node(node: ast.AST, path: Tuple, report: Dict[str, Any]) -> Any:
+    """Evaluate a literal AST node, merging (instead of dropping) repeated dict keys"""
+    if isinstance(node, ast.Dict) and len(path) < 4:
+        # prefecture / city / district / category levels; facility records are plain literals
+        merged: Dict[str, Any] = {}
+        first_lines: Dict[str, int] = {}
+        for key_node, value_node in zip(node.keys, node.values):
+            key = ast.literal_eval(key_node)
+            value = _build_node(value_node, path + (key,), report)
+            if key in merged:
+                report["duplicate_keys"].append({"path": list(path + (key,)), "lines": [first_lines[key], key_node.lineno]})
+                merged[key] = _merge_values(merged[key], value, path + (key,), report)
+            else:
+                merged[key] = value
+                first_lines[key] = key_node.lineno
+        return merged
+    return ast.literal_eval(node)
+
+def parse_contact_source(source_path: str = CONTACT_SOURCE_PATH) -> Tuple[Dict, Dict[str, Any]]:
+    """Read CONTACT_DATABASE from the source file without executing it
+
+    Unlike importing the module, duplicate prefecture/city/district blocks are merged
+    deterministically instead of the earlier block being silently discarded. Returns the
+    merged database and a report of duplicate keys, identical facilities dropped and
+    conflicting facility definitions.
+    """
+    with open(source_path, encoding="utf-8") as f:
+        tree = ast.parse(f.read(), filename=source_path)
+
+    for statement in tree.body:
+        if (isinstance(statement, ast.Assign) and len(statement.targets) == 1
+                and isinstance(statement.targets[0], ast.Name) and statement.targets[0].id == "CONTACT_DATABASE"):
+            report = _new_merge_report()
+            return _build_node(statement.value, (), report), report
+
+    raise ValueError(f"CONTACT_DATABASE not found in {source_path}")
+
+def load_contact_source(source_path: str = CONTACT_SOURCE_PATH) -> Dict:
+    """Merged CONTACT_DATABASE from the source file (the expensive step the store avoids)"""
+    return parse_contact_source(source_path)[0]
+
+def compile_contact_store(store_path: str = CONTACT_STORE_PATH, source_path: str = CONTACT_SOURCE_PATH) -> str:
+    """Compile the (merged) contact source into a SQLite store and return the store path
+
+    The file is written next to its final location and moved into place atomically, so
+    concurrent readers never see a half-written store.
+    """
+    database, report = parse_contact_source(source_path)
+    tmp_path = f"{store_path}.{os.getpid()}.tmp"
+    if os.path.exists(tmp_path):
+        os.remove(tmp_path)
+
+    conn = sqlite3.connect(tmp_path)
+    try:
+        conn.executescript(SCHEMA)
+
+        # The same NTT / 電力 / ガス / 水道 record is repeated in hundreds of districts:
+        # store each distinct record once and reference it by id from every placement
+        services_ids: Dict[str, int] = {}
+        facility_ids: Dict[Tuple, int] = {}
+        placements = []
+        for prefecture, pref_data in database.items():
+            for city, city_data in pref_data.items():
+                for district, district_data in city_data.items():
+                    for category, contacts in district_data.items():
+                        for contact in contacts:
+                            services_id = None
+                            if "services" in contact:
+                                items = json.dumps(contact["services"], ensure_ascii=False)
+                                services_id = services_ids.setdefault(items, len(services_ids) + 1)
+                            record = (contact.get("name"), contact.get("phone"), contact.get("address"),
+                                      contact.get("hours"), services_id)
+                            facility_id = facility_ids.setdefault(record, len(facility_ids) + 1)
+                            placements.append((prefecture, city, district, category, facility_id))
+
+        conn.executemany("INSERT INTO services (id, items) VALUES (?, ?)",
+                         [(services_id, items) for items, services_id in services_ids.items()])
+        conn.executemany(
+            "INSERT INTO facilities (id, name, phone, address, hours, services_id) VALUES (?, ?, ?, ?, ?, ?)",
+            [(facility_id,) + record for record, facility_id in facility_ids.items()],
+        )
+        conn.executemany(
+            "INSERT INTO placements (prefecture, city, district, category, facility_id) VALUES (?, ?, ?, ?, ?)",
+            placements,
+        )
+        conn.executemany("INSERT INTO meta (key, value) VALUES (?, ?)", [
+            ("version", str(CONTACT_STORE_VERSION)),
+            ("source_sha1", source_fingerprint(source_path)),
+            ("prefectures", json.dumps(list(database.keys()), ensure_ascii=False)),
+            ("merge_report", json.dumps(report, ensure_ascii=False)),
+        ])
+        conn.commit()
+    finally:
+        conn.close()
+
+    os.replace(tmp_path, store_path)
+    return store_path
+
+def _read_meta(store_path: str) -> Dict[str, str]:
+    try:
+        conn = sqlite3.connect(f"file:{store_path}?mode=ro", uri=True)
+    except sqlite3.Error:
+        return {}
+    try:
+        return dict(conn.execute("SELECT key, value FROM meta"))
+    except sqlite3.Error:
+        return {}
+    finally:
+        conn.close()
+
+def is_store_current(store_path: str = CONTACT_STORE_PATH, source_path: str = CONTACT_SOURCE_PATH) -> bool:
+    """True when the compiled store exists and was built from the current source"""
+    if not os.path.exists(store_path):
+        return False
+    meta = _read_meta(store_path)
+    if meta.get("version") != str(CONTACT_STORE_VERSION):
+        return False
+    # A deployment may ship only the compiled store without the source
+    if not os.path.exists(source_path):
+        return True
+    return meta.get("source_sha1") == source_fingerprint(source_path)
+
+class ContactStore(Mapping):
+    """Read-only prefecture -> city -> district -> category -> [contact] mapping
+
+    Behaves like the original CONTACT_DATABASE dict, but each prefecture is read from the
+    compiled store the first time it is accessed and cached afterwards. Facility records
+    are shared between every district that lists them (and `services` is a tuple), so
+    callers must treat them as read-only.
+    """
+
+    def __init__(self, store_path: str = CONTACT_STORE_PATH, source_path: str = CONTACT_SOURCE_PATH):
+        self.store_path = store_path
+        self.source_path = source_path
+        self._prefectures: Optional[List[str]] = None
+        self._loaded: Dict[str, Dict] = {}
+        # facility id -> shared record, raw services JSON -> interned tuple
+        self._facilities: Dict[int, Dict[str, Any]] = {}
+        self._services: Dict[str, Tuple[str, ...]] = {}
+        self._lock = threading.Lock()
+
+    def _ensure_compiled(self) -> List[str]:
+        if self._prefectures is None:
+            with self._lock:
+                if self._prefectures is None:
+                    if not is_store_current(self.store_path, self.source_path):
+                        try:
+                            compile_contact_store(self.store_path, self.source_path)
+                        except (OSError, sqlite3.Error):
+                            # Read-only deployment directory: compile to a private temp store
+                            self.store_path = os.path.join(tempfile.mkdtemp(prefix="contact_store_"), "contacts.sqlite")
+                            compile_contact_store(self.store_path, self.source_path)
+                    self._prefectures = json.loads(_read_meta(self.store_path)["prefectures"])
+        return self._prefectures
+
+    def _load_prefecture(self, prefecture: str) -> Dict:
+        pref_data: Dict = {}
+        facilities = self._facilities
+        conn = sqlite3.connect(f"file:{self.store_path}?mode=ro", uri=True)
+        try:
+            cursor = conn.execute(
+                "SELECT p.city, p.district, p.category, f.id, f.name, f.phone, f.address, f.hours, s.items"
+                " FROM placements p JOIN facilities f ON f.id = p.facility_id"
+                " LEFT JOIN services s ON s.id = f.services_id"
+                " WHERE p.prefecture = ? ORDER BY p.id",
+                (prefecture,),
+            )
+            for city, district, category, facility_id, name, phone, address, hours, services in cursor:
+                contact = facilities.get(facility_id)
+                if contact is None:
+                    contact = self._make_facility(name, phone, address, hours, services)
+                    facilities[facility_id] = contact
+                city, district, category = _intern(city), _intern(district), _intern(category)
+                pref_data.setdefault(city, {}).setdefault(district, {}).setdefault(category, []).append(contact)
+        finally:
+            conn.close()
+        return pref_data
+
+    def _make_facility(self, name, phone, address, hours, services) -> Dict[str, Any]:
+        """Build a shared facility record with interned strings and service tuples"""
+        contact = {"name": name, "phone": phone, "address": address, "hours": hours}
+        if services is not None:
+            items = self._services.get(services)
+            if items is None:
+                items = tuple(_intern(item) for item in json.loads(services))
+                self._services[services] = items
+            contact["services"] = items
+        # Fields absent from the source record stay absent
+        return {field: _intern(value) if isinstance(value, str) else value
+                for field, value in contact.items() if value is not None}
+
+    def get_facility(self, facility_id: int) -> Optional[Dict[str, Any]]:
+        """Shared facility record by id (None until a prefecture using it has been loaded)"""
+        return self._facilities.get(facility_id)
+
+    def __getitem__(self, prefecture: str) -> Dict:
+        if prefecture not in self._ensure_compiled():
+            raise KeyError(prefecture)
+        pref_data = self._loaded.get(prefecture)
+        if pref_data is None:
+            with self._lock:
+                pref_data = self._loaded.get(prefecture)
+                if pref_data is None:
+                    pref_data = self._load_prefecture(prefecture)
+                    self._loaded[prefecture] = pref_data
+        return pref_data
+
+    def __contains__(self, prefecture: object) -> bool:
+        return prefecture in self._ensure_compiled()
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(list(self._ensure_compiled()))
+
+    def __len__(self) -> int:
+        return len(self._ensure_compiled())
+
+    def loaded_prefectures(self) -> List[str]:
+        """Prefectures currently held in memory"""
+        return list(self._loaded)
+
+_default_store: Optional[ContactStore] = None
+
+def get_contact_store() -> ContactStore:
+    """Process-wide contact store (shared across Streamlit reruns since this module is imported)"""
+    global _default_store
+    if _default_store is None:
+        _default_store = ContactStore()
+    return _default_store
+
+def read_merge_report(store_path: str = CONTACT_STORE_PATH) -> Dict[str, Any]:
+    """Duplicate-key merge report recorded when the store was compiled"""
+    return json.loads(_read_meta(store_path).get("merge_report", "null")) or _new_merge_report()
+
+if __name__ == "__main__":
+    path = compile_contact_store()
+    print(f"✅ Compiled {CONTACT_SOURCE_PATH} -> {path}")
+
+    report = read_merge_report(path)
+    for duplicate in report["duplicate_keys"]:
+        print(f"  ⚠️ Duplicate key {' > '.join(duplicate['path'])} (lines {duplicate['lines'][0]} and {duplicate['lines'][1]}) merged")
+    print(f"  Identical facilities dropped: {report['identical_dropped']}")
+    print(f"  Conflicting facilities (later definition kept): {len(report['conflicts'])}")
+    for conflict in report["conflicts"]:
+        print(f"    - {' > '.join(conflict['path'])}: {conflict['name']} ({', '.join(conflict['fields'])})")
@@ -7,10 +7,10 @@ Shows the enhanced 市区町村役所 functionality
 import sys
 import os
 
-# Add the parent directory to sys.path to import from app.py
+# Add the parent directory to sys.path to import from contact_search.py
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
-from app import parse_address_components, estimate_coordinates_from_address, get_comprehensive_contacts
+from contact_search import parse_address_components, estimate_coordinates_from_address, get_comprehensive_contacts
 
 def demonstrate_environmental_contacts():
     """Demonstrate environmental department contacts across regions"""
@@ -0,0 +1,35 @@
+#!/usr/bin/env python3
+"""
+Builders for the small input files the import tests write: GeoJSON polygons (boundaries,
+service areas) and Japan Post's KEN_ALL postal-code table
+"""
+
+import json
+import os
+import zipfile
+
+def square(lon0, lat0, lon1, lat1):
+    """Closed counter-clockwise ring"""
+    return [[lon0, lat0], [lon1, lat0], [lon1, lat1], [lon0, lat1], [lon0, lat0]]
+
+def feature(properties, geometry_type, coordinates):
+    """One GeoJSON feature"""
+    return {"type": "Feature", "properties": properties, "geometry": {"type": geometry_type, "coordinates": coordinates}}
+
+def write_geojson(directory, features, name="features.geojson"):
+    """A FeatureCollection file in directory; returns its path"""
+    path = os.path.join(directory, name)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump({"type": "FeatureCollection", "features": features}, f, ensure_ascii=False)
+    return path
+
+def ken_all_row(code, prefecture, city, town, jis="13104"):
+    """One KEN_ALL line (kana columns and flags filled with plausible values)"""
+    return f'{jis},"{code[:3]}  ","{code}","ｶﾅ","ｶﾅ","ｶﾅ","{prefecture}","{city}","{town}",0,0,0,0,0,0'
+
+def write_ken_all_zip(directory, rows):
+    """KEN_ALL.ZIP as Japan Post ships it: one Shift_JIS CSV with CRLF lines"""
+    path = os.path.join(directory, "KEN_ALL.ZIP")
+    with zipfile.ZipFile(path, "w") as archive:
+        archive.writestr("KEN_ALL.CSV", ("\r\n".join(rows) + "\r\n").encode("cp932"))
+    return path
@@ -0,0 +1,711 @@
+# gazetteer.py
+# Place-name coordinates used to estimate facility and user locations without geocoding
+
+import re
+from typing import AbstractSet, Any, Dict, Iterable, List, Optional, Set, Tuple
+
+from address_parser import PREFECTURE_NAMES, normalize, parse_address
+from spatial_index import GridIndex, build_grid_index
+
+# -----------------------------
+# Gazetteer (prefecture -> city/ward -> ward -> town -> block)
+# -----------------------------
+# A value is either (lat, lon) or a dict of child places; the "" key holds the coordinates
+# of the place itself (same convention as the "" district in CONTACT_DATABASE).
+
+GAZETTEER = {
+    "東京都": {
+        "足立区": {
+            "": (35.7755, 139.8048),
+            "竹の塚": (35.7986, 139.7916),
+            "千住": (35.7489, 139.8048),
+            "西新井": (35.7755, 139.7831),
+        },
+        "荒川区": {
+            "": (35.7364, 139.7838),
+            "荒川3": (35.7364, 139.7838),
+        },
+        "板橋区": (35.7514, 139.7142),
+        "江戸川区": (35.7068, 139.8717),
+        "大田区": (35.5608, 139.7161),
+        "葛飾区": (35.7448, 139.8481),
+        "北区": (35.7537, 139.7340),
+        "江東区": (35.6717, 139.8170),
+        "品川区": (35.6092, 139.7301),
+        "渋谷区": {
+            "": (35.6598, 139.7004),
+            "渋谷": (35.6598, 139.7004),
+            "神宮前": (35.6704, 139.7026),
+            "代々木": (35.6830, 139.7020),
+            "恵比寿": (35.6467, 139.7101),
+            "広尾": (35.6506, 139.7244),
+        },
+        "新宿区": (35.6938, 139.7034),
+        "杉並区": (35.6993, 139.6368),
+        "墨田区": (35.7107, 139.8013),
+        "世田谷区": (35.6464, 139.6533),
+        "台東区": (35.7107, 139.7794),
+        "中央区": (35.6706, 139.7706),
+        "千代田区": (35.6941, 139.7538),
+        "豊島区": (35.7297, 139.7156),
+        "中野区": (35.7093, 139.6656),
+        "練馬区": {
+            "": (35.7357, 139.6516),
+            "石神井町": {
+                "": (35.7417, 139.6021),
+                "2-15-13": (35.7350, 139.5985),  # 石神井警察署 (about 750m from target)
+            },
+            "光が丘": {
+                "2-9-7": (35.7597, 139.6283),  # 光が丘警察署
+            },
+            "豊玉北": {
+                "5-3-15": (35.7357, 139.6516),  # 練馬警察署
+            },
+        },
+        "文京区": (35.7081, 139.7418),
+        "港区": (35.6585, 139.7514),
+        "目黒区": {
+            "": (35.6419, 139.6982),
+            "東が丘": (35.6089, 139.6844),
+        },
+    },
+    "神奈川県": {
+        "横浜市": {
+            "": (35.4437, 139.6377),
+            "鶴見区": {
+                "": (35.5075, 139.6767),  # Tsurumi district center
+                "豊岡町": (35.5088, 139.6779),
+                "鶴見中央": (35.5070, 139.6763),  # Tsurumi Central area (near station)
+                "下末吉": (35.5140, 139.6650),
+                "末広町": (35.5100, 139.6850),
+            },
+            "神奈川区": {
+                "": (35.4814, 139.6430),
+                "反町": (35.4814, 139.6430),
+                "広台太田町": (35.4820, 139.6450),
+            },
+            "西区": (35.4617, 139.6200),
+            "中区": (35.4436, 139.6380),
+            "南区": (35.4367, 139.6200),
+            "保土ケ谷区": (35.4545, 139.5952),
+            "磯子区": (35.4067, 139.6179),
+            "金沢区": (35.3412, 139.6234),
+            "港北区": (35.5133, 139.6317),
+            "戸塚区": (35.3969, 139.5338),
+            "港南区": (35.4123, 139.5881),
+            "旭区": (35.4736, 139.5514),
+            "緑区": (35.5117, 139.5436),
+            "瀬谷区": (35.4671, 139.4865),
+            "栄区": (35.3678, 139.5515),
+            "泉区": (35.4015, 139.4850),
+            "青葉区": (35.5536, 139.5378),
+            "都筑区": (35.5439, 139.5707),
+        },
+        "川崎市": {
+            "": (35.5308, 139.7029),
+            "川崎区": (35.5308, 139.7029),
+            "幸区": (35.5478, 139.6917),
+            "中原区": (35.5761, 139.6565),
+            "高津区": (35.6017, 139.6089),
+            "多摩区": (35.6228, 139.5589),
+            "宮前区": (35.5928, 139.5598),
+            "麻生区": (35.6050, 139.5089),
+        },
+        "相模原市": (35.5761, 139.3817),
+        "平塚市": (35.3276, 139.3496),
+        "鎌倉市": (35.3194, 139.5486),
+        "藤沢市": (35.3419, 139.4895),
+        "小田原市": (35.2565, 139.1564),
+        "茅ヶ崎市": (35.3347, 139.4039),
+        "逗子市": (35.2948, 139.5797),
+        "三浦市": (35.1444, 139.6186),
+        "秦野市": (35.3719, 139.2197),
+        "厚木市": (35.4281, 139.3619),
+        "大和市": (35.4857, 139.4577),
+        "伊勢原市": (35.4029, 139.3142),
+        "海老名市": (35.4476, 139.3925),
+        "座間市": (35.4881, 139.4078),
+        "南足柄市": (35.3093, 139.1316),
+        "綾瀬市": (35.4367, 139.4251),
+    },
+    "千葉県": {
+        "千葉市": {
+            "": (35.6074, 140.1065),
+            "中央区": (35.6074, 140.1065),
+            "花見川区": (35.6500, 140.0500),
+            "稲毛区": (35.6350, 140.0800),
+            "若葉区": (35.6200, 140.1500),
+            "緑区": (35.5500, 140.1200),
+            "美浜区": (35.6550, 140.0400),
+        },
+        "市川市": (35.7267, 139.9304),
+        "船橋市": (35.6951, 139.9840),
+        "松戸市": (35.7873, 139.9016),
+        "柏市": (35.8617, 139.9693),
+        "銚子市": (35.7347, 140.8209),
+        "館山市": (34.9993, 139.8743),
+        "木更津市": (35.3781, 139.9136),
+    },
+    "埼玉県": {
+        "さいたま市": {
+            "": (35.8617, 139.6455),
+            "大宮区": (35.9067, 139.6233),
+            "浦和区": (35.8617, 139.6455),
+            "南区": (35.8467, 139.6455),
+            "見沼区": (35.8967, 139.6555),
+            "中央区": (35.8717, 139.6355),
+            "桜区": (35.8417, 139.6155),
+            "緑区": (35.8817, 139.6755),
+            "岩槻区": (35.9567, 139.6955),
+            "西区": (35.8867, 139.5955),
+            "北区": (35.9267, 139.6255),
+        },
+        "川口市": (35.8081, 139.7244),
+        "所沢市": (35.7993, 139.4689),
+        "越谷市": (35.8906, 139.7906),
+        "草加市": (35.8256, 139.8065),
+        "春日部市": (35.9756, 139.7541),
+        "熊谷市": (36.1477, 139.3883),
+        "川越市": (35.9081, 139.4855),
+    },
+    "山口県": {
+        "山口市": (34.1858, 131.4706),
+        "下関市": (33.9617, 130.9408),
+        "宇部市": (33.9461, 131.2488),
+        "萩市": (34.4064, 131.4014),
+        "防府市": (34.0515, 131.5691),
+        "周南市": (34.0564, 131.8069),
+        "岩国市": (34.1640, 132.2200),
+        "光市": (33.9617, 131.9421),
+        "長門市": (34.3709, 131.1976),
+        "柳井市": (33.9724, 132.1019),
+        "美祢市": (34.1668, 131.2061),
+        "下松市": (34.0176, 131.8729),
+        "山陽小野田市": (34.0008, 131.1818),
+    },
+    "広島県": {
+        "広島市": {
+            "": (34.3853, 132.4553),
+            "中区": (34.3907, 132.4594),
+            "東区": (34.3969, 132.4759),
+            "南区": (34.3820, 132.4470),
+            "西区": (34.3940, 132.4320),
+            "安佐南区": (34.4550, 132.4240),
+            "安佐北区": (34.5250, 132.4450),
+            "佐伯区": (34.3670, 132.3300),
+            "安芸区": (34.3853, 132.5264),
+        },
+        "呉市": (34.2493, 132.5691),
+        "東広島市": (34.4257, 132.7439),
+        "安芸高田市": (34.6658, 132.7075),
+        "廿日市市": (34.3410, 132.3191),
+        "安芸太田町": (34.6003, 132.3547),
+        "北広島町": (34.6588, 132.5042),
+        "府中市": (34.5717, 133.2355),
+        "坂町": (34.3457, 132.5264),
+        "熊野町": (34.3387, 132.5893),
+        "海田町": (34.3616, 132.5264),
+        "福山市": (34.4851, 133.3623),
+        "三原市": (34.3988, 133.0797),
+        "尾道市": (34.4090, 133.2044),
+        "竹原市": (34.3405, 132.9095),
+        "三次市": (34.6658, 132.8553),
+        "庄原市": (34.8544, 133.1520),
+        "大竹市": (34.2356, 132.2272),
+    },
+    "茨城県": {
+        "水戸市": (36.3661, 140.4713),
+        "日立市": (36.5965, 140.6507),
+        "土浦市": (36.0758, 140.2006),
+        "ひたちなか市": (36.3972, 140.5347),
+        "古河市": (36.1816, 139.7025),
+        "石岡市": (36.1913, 140.2647),
+        "結城市": (36.3044, 139.8766),
+        "龍ケ崎市": (35.9061, 140.1806),
+        "下妻市": (36.1836, 139.9647),
+        "常総市": (36.0250, 139.9931),
+        "常陸太田市": (36.5286, 140.5269),
+        "高萩市": (36.7167, 140.7167),
+        "北茨城市": (36.7833, 140.7500),
+        "笠間市": (36.3444, 140.3050),
+        "取手市": (35.9069, 140.0508),
+        "牛久市": (35.9789, 140.1550),
+        "つくば市": (36.0836, 140.1003),
+        "鹿嶋市": (35.9669, 140.6469),
+        "潮来市": (35.9472, 140.5464),
+        "守谷市": (35.9514, 140.0306),
+        "常陸大宮市": (36.5450, 140.4106),
+        "那珂市": (36.4514, 140.4300),
+        "筑西市": (36.3083, 139.9833),
+        "坂東市": (36.0486, 139.8917),
+        "稲敷市": (35.9561, 140.3242),
+        "かすみがうら市": (36.0569, 140.2333),
+        "行方市": (36.0167, 140.4833),
+        "鉾田市": (36.1583, 140.5100),
+        "神栖市": (35.8908, 140.6647),
+    },
+    "山梨県": {
+        "甲府市": (35.6641, 138.5681),
+        "富士吉田市": (35.4852, 138.8025),
+        "都留市": (35.5469, 138.9050),
+        "山梨市": (35.6906, 138.6825),
+        "大月市": (35.6106, 138.9439),
+        "韮崎市": (35.7131, 138.4475),
+        "南アルプス市": (35.6086, 138.4633),
+        "北杜市": (35.7792, 138.4408),
+        "甲斐市": (35.6653, 138.5036),
+        "笛吹市": (35.6372, 138.6456),
+        "上野原市": (35.6283, 139.1197),
+        "甲州市": (35.7047, 138.7297),
+        "中央市": (35.5947, 138.5403),
+    },
+}
+
+# Facility names recognised anywhere in the text, ahead of the address hierarchy
+LANDMARKS = {
+    "石神井警察署": (35.7417, 139.6021),
+    "光が丘警察署": (35.7597, 139.6283),
+    "練馬警察署": (35.7357, 139.6516),
+    "Keio University Hospital": (35.6803, 139.7206),  # Shinjuku
+}
+
+# -----------------------------
+# Matcher
+# -----------------------------
+
+class PlaceNameMatcher:
+    """Aho-Corasick automaton over a fixed set of place names
+
+    find_all() reports every name occurring in a text with a single left-to-right pass,
+    instead of one substring search per name.
+    """
+
+    def __init__(self, names: Iterable[str]):
+        self.names: List[str] = list(names)
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._output: List[List[int]] = [[]]
+        self._lengths = [len(name) for name in self.names]
+        self._max_length = max(self._lengths, default=0)
+
+        for name_id, name in enumerate(self.names):
+            state = 0
+            for char in name:
+                next_state = self._goto[state].get(char)
+                if next_state is None:
+                    next_state = len(self._goto)
+                    self._goto[state][char] = next_state
+                    self._goto.append({})
+                    self._fail.append(0)
+                    self._output.append([])
+                state = next_state
+            self._output[state].append(name_id)
+
+        # Breadth-first construction of failure links; outputs of the failure target are
+        # merged in so each state reports every name ending at that position
+        queue = list(self._goto[0].values())
+        while queue:
+            next_queue = []
+            for state in queue:
+                for char, child in self._goto[state].items():
+                    fallback = self._fail[state]
+                    while fallback and char not in self._goto[fallback]:
+                        fallback = self._fail[fallback]
+                    target = self._goto[fallback].get(char, 0)
+                    self._fail[child] = target if target != child else 0
+                    self._output[child] = self._output[child] + self._output[self._fail[child]]
+                    next_queue.append(child)
+            queue = next_queue
+
+    def find_all(self, text: str) -> List[int]:
+        """Ids (positions in self.names) of every name found in text, each reported once"""
+        goto, fail, output = self._goto, self._fail, self._output
+        found = set()
+        state = 0
+        for char in text:
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            if output[state]:
+                found.update(output[state])
+        return sorted(found)
+
+    def find_first(self, text: str, pos: int = 0) -> Optional[Tuple[int, int, int]]:
+        """(name id, start, end) of the earliest name in text[pos:], the longest at that start
+
+        The pass stops as soon as no name ending later could start earlier; equal matches
+        keep the lower id.
+        """
+        goto, fail, output, lengths = self._goto, self._fail, self._output, self._lengths
+        best = None
+        state = 0
+        for end in range(pos, len(text)):
+            if best is not None and end - self._max_length >= best[1]:
+                break
+            char = text[end]
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            for name_id in output[state]:
+                start = end + 1 - lengths[name_id]
+                if best is None or (start, -lengths[name_id], name_id) < (best[1], best[1] - best[2], best[0]):
+                    best = (name_id, start, end + 1)
+        return best
+
+# Old and variant spellings folded together before n-gram matching (丸ノ内/丸之内/丸の内, 霞が関/霞ヶ関, 龍ケ崎/竜ヶ崎)
+VARIANT_FOLDING = str.maketrans({
+    "ケ": "ヶ", "ヵ": "ヶ", "が": "ヶ", "之": "の", "ノ": "の", "條": "条", "澤": "沢", "濱": "浜", "邊": "辺",
+    "邉": "辺", "嶋": "島", "﨑": "崎", "嵜": "崎", "舘": "館", "冨": "富", "曾": "曽", "德": "徳", "龍": "竜",
+    "檜": "桧", "穗": "穂", "萬": "万", "藏": "蔵", "櫻": "桜", "廣": "広", "國": "国", "區": "区", "驛": "駅",
+})
+
+def bigrams(text: str) -> frozenset:
+    """Character bigrams of text after variant folding"""
+    text = text.translate(VARIANT_FOLDING)
+    return frozenset(text[i:i + 2] for i in range(len(text) - 1))
+
+def prefix_edits(name: str, text: str) -> Optional[int]:
+    """0 when text starts with name, 1 when it starts with name after one substitution,
+    insertion or deletion, else None
+
+    With a single edit allowed it must fall at the first mismatch, so three slice
+    comparisons replace a Levenshtein table.
+    """
+    size = len(name)
+    common = 0
+    for char, other in zip(name, text):
+        if char != other:
+            break
+        common += 1
+    if common == size:
+        return 0
+    rest = name[common + 1:]
+    if rest == text[common + 1:size] or rest == text[common:size - 1] or name[common:] == text[common + 1:size + 1]:
+        return 1
+    return None
+
+class NGramIndex:
+    """Character-bigram inverted index for typo-tolerant name lookups
+
+    best() only touches the postings of the query's own bigrams, so a lookup costs
+    the number of names sharing a bigram with the query rather than a scan of every name;
+    closest() likewise only compares names that can be one edit from the text's start.
+    """
+
+    def __init__(self, names: Iterable[str]):
+        self.names: List[str] = list(names)
+        self._sizes: List[int] = []
+        self._postings: Dict[str, List[int]] = {}
+        self._folded: List[str] = []
+        # Name ids by first and by second character, for closest()
+        self._by_char: Tuple[Dict[str, List[int]], Dict[str, List[int]]] = ({}, {})
+        for name_id, name in enumerate(self.names):
+            grams = bigrams(name)
+            self._sizes.append(len(grams))
+            for gram in grams:
+                self._postings.setdefault(gram, []).append(name_id)
+            folded = name.translate(VARIANT_FOLDING)
+            self._folded.append(folded)
+            if len(folded) >= 3:
+                for position in (0, 1):
+                    self._by_char[position].setdefault(folded[position], []).append(name_id)
+
+    def best(self, text: str, min_coverage: float, allowed: Optional[AbstractSet[int]] = None) -> Optional[int]:
+        """Id of the name that best matches a prefix region of text, or None
+
+        A name scores its bigrams found in text minus those missing, so longer (more
+        specific) names win once most of them is present; at least min_coverage of a
+        name's bigrams must be found. A tie between different names is ambiguous (None).
+        """
+        counts: Dict[int, int] = {}
+        for gram in bigrams(text):
+            for name_id in self._postings.get(gram, ()):
+                counts[name_id] = counts.get(name_id, 0) + 1
+        if allowed is not None:
+            counts = {name_id: count for name_id, count in counts.items() if name_id in allowed}
+
+        best_id, best_score, tied = None, None, False
+        sizes = self._sizes
+        for name_id, matched in counts.items():
+            if matched < min_coverage * sizes[name_id]:
+                continue
+            score = 2 * matched - sizes[name_id]
+            if best_score is None or score > best_score:
+                best_id, best_score, tied = name_id, score, False
+            elif score == best_score:
+                tied = True
+        return None if tied else best_id
+
+    def closest(self, text: str, allowed: Optional[AbstractSet[int]] = None) -> Optional[int]:
+        """Id of the longest name within one edit of a prefix of text, or None
+
+        Covers what best() cannot: one wrong character breaks both bigrams of a
+        three-character name (渋屋区 for 渋谷区) and half of a five-character one.
+        Names shorter than three characters get no edit. One edit leaves the name's first
+        character at the text's first or second position, or its second character there,
+        so only those names are compared. A tie between different names is ambiguous (None).
+        """
+        text = text.translate(VARIANT_FOLDING)
+        first, second = self._by_char
+        candidates: Set[int] = set()
+        for char in text[:2]:
+            candidates.update(first.get(char, ()))
+            candidates.update(second.get(char, ()))
+        if allowed is not None:
+            candidates &= allowed
+
+        best_id, best_key, tied = None, None, False
+        folded = self._folded
+        for name_id in candidates:
+            name = folded[name_id]
+            edits = prefix_edits(name, text)
+            if edits is None:
+                continue
+            key = (len(name), -edits)
+            if best_key is None or key > best_key:
+                best_id, best_key, tied = name_id, key, False
+            elif key == best_key:
+                tied = True
+        return None if tied else best_id
+
+# -----------------------------
+# Hierarchical lookup
+# -----------------------------
+
+POSTAL_CODE_PREFIX = re.compile(r'^\s*〒?\d{3}-?\d{4}\s*')
+LANDMARK_DEPTH = 4  # a named building or station is as specific as a block
+FUZZY_MIN_COVERAGE = 0.6  # share of a place name's bigrams a fuzzy match must contain
+POSTAL_AND_NUMBERS = re.compile(r'^〒?\d{3}-?\d{4}|\d.*$')
+PREFECTURE_NAME = re.compile(r'北海道|東京都|京都府|大阪府|[^\s\d市区町村]{2,3}県')
+
+class Place:
+    """One gazetteer node (prefecture, city, ward, town or block)"""
+
+    __slots__ = ("name", "coords", "children", "parent", "_name_lengths", "_matcher")
+
+    def __init__(self, name: str, coords: Optional[Tuple[float, float]], parent: Optional["Place"]):
+        self.name = name
+        self.coords = coords
+        self.parent = parent
+        self.children: Dict[str, "Place"] = {}
+        self._name_lengths: Tuple[int, ...] = ()
+        self._matcher: Optional[PlaceNameMatcher] = None
+
+    def add_child(self, child: "Place") -> None:
+        self.children[child.name] = child
+        self._name_lengths = tuple(sorted({len(name) for name in self.children}, reverse=True))
+        self._matcher = None
+
+    @property
+    def path(self) -> Tuple[str, ...]:
+        names = []
+        place = self
+        while place.parent is not None:
+            names.append(place.name)
+            place = place.parent
+        return tuple(reversed(names))
+
+    def match_child(self, text: str, pos: int) -> Optional[Tuple["Place", int, int]]:
+        """Child named at text[pos:] (longest wins), else the earliest child named later on
+
+        Returns (child, start, end). The fallback covers names separated by parts the
+        gazetteer does not model, such as a 郡 before a town; it is one automaton pass over
+        the rest of the text, whatever the number of children.
+        """
+        children = self.children
+        for length in self._name_lengths:
+            child = children.get(text[pos:pos + length])
+            if child is not None:
+                return child, pos, pos + length
+
+        if self._matcher is None:
+            self._matcher = PlaceNameMatcher(children)
+        found = self._matcher.find_first(text, pos)
+        if found is None:
+            return None
+        name_id, start, end = found
+        return children[self._matcher.names[name_id]], start, end
+
+class Gazetteer:
+    """Hierarchical place-name lookup keyed by (prefecture, city, ward, town, ...)
+
+    Ambiguous names such as 中央区 or 緑区 are only ever resolved below their parent, so
+    each lookup is one walk down the tree instead of a scan over every known name.
+    """
+
+    def __init__(self, tree: Dict[str, Any], landmarks: Optional[Dict[str, Tuple[float, float]]] = None):
+        self.root = Place("", None, None)
+        self._add_children(self.root, tree)
+        self.landmarks = dict(landmarks or {})
+        self._landmark_names = list(self.landmarks)
+        self._landmark_matcher = PlaceNameMatcher(self._landmark_names)
+        # Cities/wards of every prefecture, for addresses that name no prefecture
+        self._cities = [city for pref_place in self.root.children.values() for city in pref_place.children.values()]
+        self._city_matcher = PlaceNameMatcher(city.name for city in self._cities)
+        self._depth_indexes: Dict[int, GridIndex] = {}
+        self._fuzzy_index: Optional[Tuple[NGramIndex, List[Place], Dict[str, Set[int]], Dict[str, Set[int]]]] = None
+
+    def _add_children(self, parent: Place, tree: Dict[str, Any]) -> None:
+        for name, value in tree.items():
+            if not name:
+                continue
+            if isinstance(value, dict):
+                child = Place(name, value.get(""), parent)
+                self._add_children(child, value)
+            else:
+                child = Place(name, tuple(value), parent)
+            parent.add_child(child)
+
+    def find_place(self, address: str, prefecture: Optional[str] = None) -> Optional[Place]:
+        """Most specific gazetteer place with coordinates named in the address
+
+        `prefecture` is a hint for addresses that omit it (e.g. facility addresses such as
+        "横浜市鶴見区..."): the walk then stays inside that prefecture. Without a prefecture
+        in the address or a hint, the city level of every prefecture is searched. Addresses
+        in prefectures the gazetteer does not cover resolve to None.
+        """
+        match = POSTAL_CODE_PREFIX.match(address)
+        pos = match.end() if match else 0
+
+        node = None
+        found = self.root.match_child(address, pos)
+        if found and found[1] == pos:
+            node, _, pos = found
+        elif PREFECTURE_NAME.match(address, pos):
+            # A prefecture the gazetteer does not cover (e.g. 北海道...): never match elsewhere
+            return None
+        elif prefecture:
+            node = self.root.children.get(prefecture)
+            if node is None:
+                return None
+        else:
+            # No prefecture: take the earliest city/ward named in the address
+            found = self._city_matcher.find_first(address, pos)
+            if found is None:
+                return None
+            node, pos = self._cities[found[0]], found[2]
+
+        deepest = node if node.coords else None
+        while node.children:
+            found = node.match_child(address, pos)
+            if found is None:
+                break
+            node, _, pos = found
+            if node.coords:
+                deepest = node
+        return deepest
+
+    def locate(self, address: str, prefecture: Optional[str] = None) -> Optional[Tuple[Tuple[float, float], int]]:
+        """(coordinates, depth) for an address: named landmark first, then the place hierarchy
+
+        depth is the matched place's level (1 prefecture, 2 city/ward, 3 ward/town, ...);
+        landmarks count as LANDMARK_DEPTH.
+        """
+        landmark_ids = self._landmark_matcher.find_all(address)
+        if landmark_ids:
+            return self.landmarks[self._landmark_names[landmark_ids[0]]], LANDMARK_DEPTH
+
+        place = self.find_place(address, prefecture)
+        return (place.coords, len(place.path)) if place else None
+
+    def _fuzzy(self) -> Tuple[NGramIndex, List[Place], Dict[str, Set[int]], Dict[str, Set[int]]]:
+        # Built on first use: names below the prefecture ("渋谷区神宮前"), their places, and
+        # the name ids of each prefecture and of each municipality suffix (市, 町, 村, 区)
+        if self._fuzzy_index is None:
+            places: List[Place] = []
+            stack = list(self.root.children.values())
+            while stack:
+                place = stack.pop()
+                stack.extend(place.children.values())
+                if place.coords:
+                    places.append(place)
+            by_prefecture: Dict[str, Set[int]] = {}
+            by_suffix: Dict[str, Set[int]] = {}
+            for place_id, place in enumerate(places):
+                by_prefecture.setdefault(place.path[0], set()).add(place_id)
+                # The city's suffix, and 区 for a ward of a designated city (横浜市中区)
+                path = place.path
+                by_suffix.setdefault(path[1][-1], set()).add(place_id)
+                if len(path) > 2 and path[1].endswith("市") and path[2].endswith("区"):
+                    by_suffix.setdefault("区", set()).add(place_id)
+            index = NGramIndex("".join(place.path[1:]) for place in places)
+            self._fuzzy_index = (index, places, by_prefecture, by_suffix)
+        return self._fuzzy_index
+
+    def fuzzy_place(self, address: str, prefecture: Optional[str] = None) -> Optional[Place]:
+        """Place whose name best matches the address despite typos or variant spellings
+
+        Only the place part of the address is compared (no postal code or numbers); a
+        prefecture named in the address, or the hint, limits the candidates to its places.
+        A municipality the parser reads keeps its suffix: 府中町 (a real town the gazetteer
+        may lack) is never corrected to 府中市, while 渋屋区 still becomes 渋谷区.
+        Names too short for bigram scoring fall back to a one-edit match (NGramIndex.closest).
+        """
+        index, places, by_prefecture, by_suffix = self._fuzzy()
+        city = parse_address(address).city
+        text = POSTAL_AND_NUMBERS.sub("", normalize(address))
+        for length in (3, 4):
+            if text[:length] in PREFECTURE_NAMES:
+                prefecture, text = text[:length], text[length:]
+                break
+        allowed = None
+        if prefecture:
+            allowed = by_prefecture.get(prefecture)
+            if allowed is None:
+                return None
+        if city:
+            same_kind = by_suffix.get(city[-1], set())
+            allowed = same_kind if allowed is None else allowed & same_kind
+        place_id = index.best(text, FUZZY_MIN_COVERAGE, allowed)
+        if place_id is None:
+            place_id = index.closest(text, allowed)
+        return places[place_id] if place_id is not None else None
+
+    def fuzzy_locate(self, address: str, prefecture: Optional[str] = None) -> Optional[Tuple[Tuple[float, float], int]]:
+        """(coordinates, depth) like locate() without landmarks, refined by fuzzy matching
+
+        A fuzzy match is only taken below the place the exact walk found (or anywhere when
+        it found nothing), so it can add the town an exact lookup missed but never move
+        the address to another city.
+        """
+        exact = self.find_place(address, prefecture)
+        place = self.fuzzy_place(address, prefecture)
+        if place is not None and exact is not None:
+            ancestor = place.parent
+            while ancestor is not None and ancestor is not exact:
+                ancestor = ancestor.parent
+            if ancestor is None:
+                place = exact
+        place = place or exact
+        return (place.coords, len(place.path)) if place else None
+
+    def resolve(self, address: str, prefecture: Optional[str] = None) -> Optional[Tuple[float, float]]:
+        """Coordinates for an address: named landmark first, then the place hierarchy"""
+        located = self.locate(address, prefecture)
+        return located[0] if located else None
+
+    def nearest_place(self, lat: float, lon: float, depth: int = 2, max_km: Optional[float] = None) -> Optional[Place]:
+        """Place at `depth` (1 prefecture, 2 city/ward, ...) whose coordinates are closest to a point
+
+        Places have no boundaries here, so this is a centroid approximation for points that
+        come without an address; max_km keeps points outside the covered area unmatched.
+        """
+        index = self._depth_indexes.get(depth)
+        if index is None:
+            places = [self.root]
+            for _ in range(depth):
+                places = [child for place in places for child in place.children.values()]
+            index = build_grid_index((place.coords[0], place.coords[1], place) for place in places if place.coords)
+            self._depth_indexes[depth] = index
+        hits = index.nearest(lat, lon, 1, max_km=max_km)
+        return hits[0][1] if hits else None
+
+_GAZETTEER = Gazetteer(GAZETTEER, LANDMARKS)
+
+def get_gazetteer() -> Gazetteer:
+    """Process-wide gazetteer, built once at import"""
+    return _GAZETTEER
+
+def match_coordinates(address: str, prefecture: Optional[str] = None) -> Optional[Tuple[float, float]]:
+    """Coordinates of the most specific known place in the address, or None"""
+    return _GAZETTEER.resolve(address, prefecture)
@@ -0,0 +1,56 @@
+# geocode_batch.py
+# Concurrent multi-address geocoding (gsi_address_search, or any per-address geocoder) with a bounded worker pool
+
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from contact_search import gsi_address_search
+from geocode_cache import normalize_address
+
+DEFAULT_MAX_IN_FLIGHT = 8
+
+def _geocode_one(geocode: Callable[[str], Any], address: str) -> Any:
+    try:
+        return geocode(address)
+    except Exception:
+        # Like geocode_gsi_fallback: one failed address must not fail the batch
+        return None
+
+def geocode_addresses(addresses: Iterable[str], max_in_flight: int = DEFAULT_MAX_IN_FLIGHT,
+                      timeout: float = 10, stats: Optional[Dict[str, float]] = None,
+                      geocode: Optional[Callable[[str], Any]] = None) -> List[Optional[Tuple[float, float]]]:
+    """Geocode many addresses concurrently; results come back in input order
+
+    Addresses that normalize to the same cache key are requested once. At most max_in_flight
+    lookups run at a time; the shared HTTP client additionally paces requests per host
+    (GSI_MAX_REQUESTS_PER_SECOND) and caps concurrent connections. Lookups go through the
+    persistent geocode cache, so only misses reach the network. None means no match or
+    a failed request. When a stats dict is passed it is filled with counts and timing.
+
+    geocode, if given, resolves one address in place of GSI (e.g. contact_search.locate_address
+    for the app's whole resolver chain; timeout is then unused). Its answers are returned as
+    they are, and None stands for an address it raised on.
+    """
+    if geocode is None:
+        geocode = lambda address: gsi_address_search(address, timeout=timeout)
+    addresses = list(addresses)
+    keys = [normalize_address(address) for address in addresses]
+    unique: Dict[str, str] = {}
+    for key, address in zip(keys, addresses):
+        unique.setdefault(key, address)
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=max(1, min(max_in_flight, len(unique) or 1))) as pool:
+        resolved = dict(zip(unique, pool.map(lambda address: _geocode_one(geocode, address), unique.values())))
+    elapsed = time.perf_counter() - start
+
+    if stats is not None:
+        stats.update({
+            "addresses": len(addresses),
+            "unique": len(unique),
+            "found": sum(1 for coords in resolved.values() if coords),
+            "elapsed": elapsed,
+            "addresses_per_second": len(addresses) / elapsed if elapsed else 0.0,
+        })
+    return [resolved[key] for key in keys]
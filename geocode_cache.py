@@ -0,0 +1,171 @@
+# geocode_cache.py
+# Persistent geocode cache: GSI answers kept in SQLite, keyed by normalized address,
+# with TTL expiry, LRU eviction and hit/miss counters
+
+import os
+import sqlite3
+import tempfile
+import threading
+import time
+from typing import Callable, Dict, Optional, Tuple
+
+from address_parser import address_key
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+GEOCODE_CACHE_PATH = os.path.join(BASE_DIR, "geocode_cache.sqlite")
+
+DEFAULT_TTL = 30 * 24 * 3600           # found coordinates: 30 days
+DEFAULT_NEGATIVE_TTL = 24 * 3600       # "no match" answers: 1 day, GSI data does get updated
+DEFAULT_MAX_ENTRIES = 20000
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    key TEXT PRIMARY KEY,
+    lat REAL,
+    lon REAL,
+    stored_at REAL NOT NULL,
+    accessed_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS entries_accessed ON entries (accessed_at);
+CREATE TABLE IF NOT EXISTS counters (name TEXT PRIMARY KEY, value INTEGER NOT NULL);
+"""
+
+def normalize_address(address: str) -> str:
+    """Cache key for an address: its canonical form (address_parser.address_key), so that
+    full-width digits, 丁目/番/号 and hyphens, ケ/ヶ or an omitted county share one entry"""
+    return address_key(address)
+
+class GeocodeCache:
+    """SQLite-backed geocode cache shared by every lookup in the process (and across restarts)
+
+    Both found coordinates and "no match" answers are cached, with separate TTLs; transport
+    errors are never cached. Once more than max_entries addresses are stored the least
+    recently used ones are evicted.
+    """
+
+    def __init__(self, path: str = GEOCODE_CACHE_PATH, ttl: float = DEFAULT_TTL,
+                 negative_ttl: float = DEFAULT_NEGATIVE_TTL, max_entries: int = DEFAULT_MAX_ENTRIES,
+                 clock: Callable[[], float] = time.time):
+        self.path = path
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        self.max_entries = max_entries
+        self.clock = clock
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+
+    def _open(self) -> sqlite3.Connection:
+        # One connection shared by every thread, serialized by self._lock
+        conn = sqlite3.connect(self.path, timeout=5, check_same_thread=False)
+        # WAL without a sync per commit: every hit writes its access time, and losing the
+        # last few answers on power failure only costs a re-query
+        conn.execute("PRAGMA journal_mode = WAL")
+        conn.execute("PRAGMA synchronous = NORMAL")
+        conn.executescript(SCHEMA)
+        return conn
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            try:
+                self._conn = self._open()
+            except sqlite3.OperationalError:
+                # Read-only deployment directory: keep the cache in a private temp dir
+                self.path = os.path.join(tempfile.mkdtemp(prefix="geocode_cache_"), "geocode_cache.sqlite")
+                self._conn = self._open()
+        return self._conn
+
+    def _count(self, conn: sqlite3.Connection, name: str) -> None:
+        conn.execute(
+            "INSERT INTO counters (name, value) VALUES (?, 1)"
+            " ON CONFLICT (name) DO UPDATE SET value = value + 1",
+            (name,),
+        )
+
+    def lookup(self, address: str) -> Tuple[bool, Optional[Tuple[float, float]]]:
+        """(True, coords-or-None) on a fresh cache hit, (False, None) on a miss"""
+        key = normalize_address(address)
+        now = self.clock()
+        with self._lock:
+            conn = self._connect()
+            with conn:
+                row = conn.execute("SELECT lat, lon, stored_at FROM entries WHERE key = ?", (key,)).fetchone()
+                if row is not None:
+                    lat, lon, stored_at = row
+                    ttl = self.ttl if lat is not None else self.negative_ttl
+                    if now - stored_at < ttl:
+                        conn.execute("UPDATE entries SET accessed_at = ? WHERE key = ?", (now, key))
+                        self._count(conn, "hits")
+                        return True, ((lat, lon) if lat is not None else None)
+                    conn.execute("DELETE FROM entries WHERE key = ?", (key,))
+                    self._count(conn, "expired")
+                self._count(conn, "misses")
+                return False, None
+
+    def store(self, address: str, coords: Optional[Tuple[float, float]]) -> None:
+        """Record a geocoding answer (None = the geocoder found no match)"""
+        key = normalize_address(address)
+        now = self.clock()
+        lat, lon = coords if coords else (None, None)
+        with self._lock:
+            conn = self._connect()
+            with conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO entries (key, lat, lon, stored_at, accessed_at) VALUES (?, ?, ?, ?, ?)",
+                    (key, lat, lon, now, now),
+                )
+                overflow = conn.execute("SELECT COUNT(*) FROM entries").fetchone()[0] - self.max_entries
+                if overflow > 0:
+                    conn.execute(
+                        "DELETE FROM entries WHERE key IN"
+                        " (SELECT key FROM entries ORDER BY accessed_at, rowid LIMIT ?)",
+                        (overflow,),
+                    )
+                    conn.execute(
+                        "INSERT INTO counters (name, value) VALUES ('evictions', ?)"
+                        " ON CONFLICT (name) DO UPDATE SET value = value + excluded.value",
+                        (overflow,),
+                    )
+
+    def get_or_fetch(self, address: str, fetch: Callable[[str], Optional[Tuple[float, float]]]) -> Optional[Tuple[float, float]]:
+        """Cached answer for address, calling fetch(address) and storing its result on a miss
+
+        Exceptions raised by fetch propagate and leave the cache untouched.
+        """
+        hit, coords = self.lookup(address)
+        if hit:
+            return coords
+        coords = fetch(address)
+        self.store(address, coords)
+        return coords
+
+    def stats(self) -> Dict[str, int]:
+        """Persistent counters (hits, misses, expired, evictions) and current entry count"""
+        with self._lock:
+            conn = self._connect()
+            stats = {"hits": 0, "misses": 0, "expired": 0, "evictions": 0}
+            stats.update(conn.execute("SELECT name, value FROM counters").fetchall())
+            stats["entries"] = conn.execute("SELECT COUNT(*) FROM entries").fetchone()[0]
+            return stats
+
+    def clear(self) -> None:
+        """Drop every cached answer and reset the counters"""
+        with self._lock:
+            conn = self._connect()
+            with conn:
+                conn.execute("DELETE FROM entries")
+                conn.execute("DELETE FROM counters")
+
+_default_cache: Optional[GeocodeCache] = None
+
+def get_geocode_cache() -> GeocodeCache:
+    """Process-wide geocode cache (shared across Streamlit reruns since this module is imported)"""
+    global _default_cache
+    if _default_cache is None:
+        _default_cache = GeocodeCache()
+    return _default_cache
+
+if __name__ == "__main__":
+    cache = get_geocode_cache()
+    print(f"📦 {cache.path}")
+    for name, value in cache.stats().items():
+        print(f"  {name}: {value}")
@@ -0,0 +1,158 @@
+# geocoder.py
+# Geocoder chain: resolvers tried in order until one is precise enough or the time budget is spent
+
+import re
+import time
+from typing import Callable, NamedTuple, Optional, Sequence, Tuple
+
+# Precision levels, coarse to fine
+PREFECTURE, CITY, TOWN, BLOCK, ADDRESS = 1, 2, 3, 4, 5
+PRECISION_NAMES = {PREFECTURE: "都道府県", CITY: "市区町村", TOWN: "町域", BLOCK: "丁目・街区", ADDRESS: "住所"}
+
+DEFAULT_BUDGET_SECONDS = 5.0
+
+# A 〒 code leading the address, half- or full-width
+POSTAL_CODE = re.compile(r'^\s*〒?\s*([0-9０-９]{3})[-－‐ー]?([0-9０-９]{4})(?![0-9０-９])\s*')
+FULL_WIDTH_DIGITS = str.maketrans("０１２３４５６７８９", "0123456789")
+
+class Answer(NamedTuple):
+    """What a resolver found: coordinates and how precise they are"""
+    coords: Tuple[float, float]
+    precision: int
+
+class GeocoderStep(NamedTuple):
+    """One resolver in a chain
+
+    resolve(address, prefecture, timeout) returns an Answer or None; timeout is the time
+    left in the lookup's budget. Remote steps are skipped when a lookup disallows them.
+    """
+    name: str
+    resolve: Callable[[str, Optional[str], float], Optional[Answer]]
+    remote: bool = False
+
+class StepTiming(NamedTuple):
+    """How one step of a lookup went"""
+    step: str
+    elapsed_ms: float
+    precision: Optional[int]  # None when the step had no answer
+    error: Optional[str] = None
+
+class GeocodeResult(NamedTuple):
+    """Best answer of a lookup, which step gave it, and the timing of every step that ran"""
+    coords: Optional[Tuple[float, float]]
+    precision: Optional[int]
+    source: Optional[str]
+    timings: Tuple[StepTiming, ...]
+
+    @property
+    def errors(self) -> Tuple[StepTiming, ...]:
+        return tuple(timing for timing in self.timings if timing.error)
+
+    @property
+    def elapsed_ms(self) -> float:
+        return sum(timing.elapsed_ms for timing in self.timings)
+
+class GeocoderChain:
+    """Run resolvers in order, keeping the most precise answer
+
+    The chain stops as soon as an answer reaches the required precision, or when the budget
+    (seconds per lookup) is spent. A running step is never interrupted: the budget is
+    checked between steps and passed to each step as its timeout. A step that raises is
+    recorded with its error and the chain moves on.
+    """
+
+    def __init__(self, steps: Sequence[GeocoderStep], budget: float = DEFAULT_BUDGET_SECONDS,
+                 required_precision: int = ADDRESS, clock: Callable[[], float] = time.perf_counter):
+        self.steps = list(steps)
+        self.budget = budget
+        self.required_precision = required_precision
+        self.clock = clock
+
+    def geocode(self, address: str, prefecture: Optional[str] = None, required_precision: Optional[int] = None,
+                budget: Optional[float] = None, allow_remote: bool = True) -> GeocodeResult:
+        """Resolve one address (prefecture is a hint for addresses that omit it)"""
+        required = self.required_precision if required_precision is None else required_precision
+        budget = self.budget if budget is None else budget
+        start = self.clock()
+        best: Optional[Answer] = None
+        source = None
+        timings = []
+
+        for step in self.steps:
+            if step.remote and not allow_remote:
+                continue
+            remaining = budget - (self.clock() - start)
+            if remaining <= 0:
+                timings.append(StepTiming(step.name, 0.0, None, "budget exhausted"))
+                break
+
+            step_start = self.clock()
+            error = None
+            try:
+                answer = step.resolve(address, prefecture, remaining)
+            except Exception as e:
+                answer = None
+                error = f"{type(e).__name__}: {e}"
+            timings.append(StepTiming(step.name, (self.clock() - step_start) * 1000,
+                                      answer.precision if answer else None, error))
+
+            if answer and (best is None or answer.precision > best.precision):
+                best, source = answer, step.name
+            if best and best.precision >= required:
+                break
+
+        return GeocodeResult(best.coords if best else None, best.precision if best else None, source, tuple(timings))
+
+# -----------------------------
+# Steps
+# -----------------------------
+
+def gazetteer_step(gazetteer, name: str = "gazetteer") -> GeocoderStep:
+    """Local place-name gazetteer; precision follows the depth of the matched place"""
+    def resolve(address: str, prefecture: Optional[str], timeout: float) -> Optional[Answer]:
+        located = gazetteer.locate(address, prefecture)
+        if located is None:
+            return None
+        coords, depth = located
+        return Answer(coords, min(depth, BLOCK))
+    return GeocoderStep(name, resolve)
+
+def fuzzy_gazetteer_step(gazetteer, name: str = "fuzzy") -> GeocoderStep:
+    """Typo-tolerant gazetteer match (n-gram index); never claims more than town precision"""
+    def resolve(address: str, prefecture: Optional[str], timeout: float) -> Optional[Answer]:
+        located = gazetteer.fuzzy_locate(address, prefecture)
+        if located is None:
+            return None
+        coords, depth = located
+        return Answer(coords, min(depth, TOWN))
+    return GeocoderStep(name, resolve)
+
+def postal_code(address: str) -> Optional[str]:
+    """The 7-digit 〒 code leading an address ("〒160-0023 ..." → "1600023"), or None"""
+    match = POSTAL_CODE.match(address)
+    return (match.group(1) + match.group(2)).translate(FULL_WIDTH_DIGITS) if match else None
+
+def postal_code_step(lookup: Callable[[str], Optional[Answer]], name: str = "postal_code") -> GeocoderStep:
+    """Postal-code table (PostalIndex.answer): a leading 〒 code locates its town area"""
+    def resolve(address: str, prefecture: Optional[str], timeout: float) -> Optional[Answer]:
+        code = postal_code(address)
+        return lookup(code) if code else None
+    return GeocoderStep(name, resolve)
+
+def remote_step(fetch: Callable[[str, float], Optional[Tuple[float, float]]], name: str = "gsi",
+                max_timeout: float = 10.0, precision: int = ADDRESS) -> GeocoderStep:
+    """Remote geocoder called as fetch(address, timeout), with the timeout capped by the budget
+
+    fetch must finish within timeout, retries and waits included, for the budget to hold.
+    """
+    def resolve(address: str, prefecture: Optional[str], timeout: float) -> Optional[Answer]:
+        coords = fetch(address, min(timeout, max_timeout))
+        return Answer(coords, precision) if coords else None
+    return GeocoderStep(name, resolve, remote=True)
+
+def describe(result: GeocodeResult) -> str:
+    """One-line summary such as "gsi (住所) in 84 ms: cache 0.3 ms, gazetteer 0.1 ms, gsi 83.6 ms" """
+    steps = ", ".join(f"{t.step} {t.elapsed_ms:.1f} ms" + (f" ({t.error})" if t.error else "") for t in result.timings)
+    if result.coords is None:
+        return f"no match in {result.elapsed_ms:.0f} ms: {steps}"
+    return f"{result.source} ({PRECISION_NAMES[result.precision]}) in {result.elapsed_ms:.0f} ms: {steps}"
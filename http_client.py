@@ -0,0 +1,249 @@
+# http_client.py
+# Shared outbound HTTP client: pooled keep-alive session, bounded concurrency,
+# jittered exponential backoff and a per-host circuit breaker
+
+import random
+import threading
+import time
+import urllib.parse
+from typing import Any, Callable, Dict, Optional, Tuple, Union
+
+import requests
+from requests.adapters import HTTPAdapter
+
+CONNECT_TIMEOUT = 3.05          # dead hosts fail fast regardless of the read timeout
+DEFAULT_TIMEOUT = 10
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+class CircuitOpenError(requests.exceptions.ConnectionError):
+    """Raised without touching the network while a host's circuit breaker is open"""
+
+class ConcurrencyLimitError(requests.exceptions.ConnectionError):
+    """Raised when no request slot frees up within the request timeout"""
+
+class CircuitBreaker:
+    """Open after failure_threshold consecutive failures; let one probe through after reset_timeout
+
+    closed -> open when failures reach the threshold; open -> half-open once reset_timeout
+    has passed; a successful probe closes the circuit, a failed one opens it again.
+    """
+
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 30.0,
+                 clock: Callable[[], float] = time.monotonic):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.clock = clock
+        self.failures = 0
+        self.opened_at: Optional[float] = None
+        self._probing = False
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> str:
+        if self.opened_at is None:
+            return "closed"
+        if self._probing or self.clock() - self.opened_at >= self.reset_timeout:
+            return "half-open"
+        return "open"
+
+    def allow(self) -> bool:
+        """Whether a request may be attempted now (claims the single half-open probe)"""
+        with self._lock:
+            if self.opened_at is None:
+                return True
+            if not self._probing and self.clock() - self.opened_at >= self.reset_timeout:
+                self._probing = True
+                return True
+            return False
+
+    def record_success(self) -> None:
+        with self._lock:
+            self.failures = 0
+            self.opened_at = None
+            self._probing = False
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self.failures += 1
+            if self._probing or self.failures >= self.failure_threshold:
+                self.opened_at = self.clock()
+                self._probing = False
+
+    def cancel(self) -> None:
+        """Give back a half-open probe that was claimed but never sent"""
+        with self._lock:
+            self._probing = False
+
+class RateLimiter:
+    """Token bucket: at most `rate` acquisitions per second on average, bursts up to `burst`"""
+
+    def __init__(self, rate: float, burst: int = 1, clock: Callable[[], float] = time.monotonic,
+                 sleep: Callable[[float], None] = time.sleep):
+        self.rate = rate
+        self.burst = burst
+        self.clock = clock
+        self.sleep = sleep
+        self._tokens = float(burst)
+        self._updated = clock()
+        self._lock = threading.Lock()
+
+    def acquire(self, max_wait: Optional[float] = None) -> Optional[float]:
+        """Block until a request may be sent; returns the time waited
+
+        Returns None at once, reserving nothing, when the wait would exceed max_wait.
+        """
+        with self._lock:
+            now = self.clock()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            wait = (1 - self._tokens) / self.rate if self._tokens < 1 else 0.0
+            if max_wait is not None and wait > max_wait:
+                return None
+            # Reserve a token now (possibly going negative) and sleep outside the lock,
+            # so concurrent callers queue up in order at the configured rate
+            self._tokens -= 1
+        if wait:
+            self.sleep(wait)
+        return wait
+
+class HttpClient:
+    """Pooled requests.Session with retries, backoff, a concurrency bound and circuit breakers
+
+    Connection errors, timeouts and 429/5xx responses are retried up to `retries` times,
+    sleeping a random ("full jitter") delay of up to backoff * 2**attempt seconds, capped
+    at max_backoff. Every failed attempt counts towards the host's circuit breaker, and
+    hosts given a rate limit (set_rate_limit) are paced per attempt. A call given a
+    total_timeout fits everything, waits and retries included, into that many seconds.
+    """
+
+    def __init__(self, pool_size: int = 10, max_concurrency: int = 8, retries: int = 2,
+                 backoff: float = 0.5, max_backoff: float = 8.0, failure_threshold: int = 5,
+                 reset_timeout: float = 30.0, clock: Callable[[], float] = time.monotonic,
+                 sleep: Callable[[float], None] = time.sleep, rng: Optional[random.Random] = None):
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=0)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
+        self.retries = retries
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.clock = clock
+        self.sleep = sleep
+        self.rng = rng or random.Random()
+        self._slots = threading.BoundedSemaphore(max_concurrency)
+        self._breakers: Dict[str, CircuitBreaker] = {}
+        self._rate_limiters: Dict[str, RateLimiter] = {}
+        self._lock = threading.Lock()
+
+    def set_rate_limit(self, url: str, per_second: Optional[float], burst: int = 1) -> None:
+        """Pace requests to the host serving url (None removes the limit)"""
+        host = urllib.parse.urlsplit(url).netloc
+        with self._lock:
+            current = self._rate_limiters.get(host)
+            if per_second is None:
+                self._rate_limiters.pop(host, None)
+            elif current is None or (current.rate, current.burst) != (per_second, burst):
+                # Unchanged limits keep their bucket (contact_search re-applies them before every request)
+                self._rate_limiters[host] = RateLimiter(per_second, burst, sleep=self.sleep)
+
+    def breaker(self, url: str) -> CircuitBreaker:
+        """Circuit breaker for the host (and port) serving url"""
+        host = urllib.parse.urlsplit(url).netloc
+        with self._lock:
+            breaker = self._breakers.get(host)
+            if breaker is None:
+                breaker = CircuitBreaker(self.failure_threshold, self.reset_timeout, self.clock)
+                self._breakers[host] = breaker
+            return breaker
+
+    def backoff_delay(self, attempt: int) -> float:
+        """Jittered delay before retry number attempt + 1"""
+        return self.rng.uniform(0, min(self.max_backoff, self.backoff * 2 ** attempt))
+
+    def retry_delay(self, attempt: int, deadline: Optional[float] = None) -> Optional[float]:
+        """Backoff before retry number attempt + 1, or None when no retry is left or fits before deadline"""
+        if attempt >= self.retries:
+            return None
+        delay = self.backoff_delay(attempt)
+        if deadline is not None and self.clock() + delay >= deadline:
+            return None
+        return delay
+
+    def get(self, url: str, params: Optional[Dict[str, Any]] = None,
+            timeout: Union[float, Tuple[float, float]] = DEFAULT_TIMEOUT,
+            total_timeout: Optional[float] = None) -> requests.Response:
+        """GET url through the pool; the last response or error is returned/raised after retries
+
+        With total_timeout, each attempt's timeouts and its rate-limit and slot waits are
+        capped by the time left, and no retry is started whose backoff would outlast it;
+        requests.exceptions.Timeout is raised when no time is left for an attempt.
+        Waiting for a request slot is local congestion, not a host failure: the slot is taken
+        before the circuit breaker is consulted, and ConcurrencyLimitError is neither retried
+        nor counted against the host.
+        """
+        if not isinstance(timeout, tuple):
+            timeout = (min(CONNECT_TIMEOUT, timeout), timeout)
+        deadline = None if total_timeout is None else self.clock() + total_timeout
+        host = urllib.parse.urlsplit(url).netloc
+        breaker = self.breaker(url)
+        rate_limiter = self._rate_limiters.get(host)
+
+        attempt = 0
+        while True:
+            slot_wait = timeout[1] if deadline is None else max(0.0, min(timeout[1], deadline - self.clock()))
+            if not self._slots.acquire(timeout=slot_wait):
+                raise ConcurrencyLimitError(f"no free request slot within {slot_wait:.2f}s")
+            try:
+                if not breaker.allow():
+                    raise CircuitOpenError(f"circuit open for {host}")
+                attempt_timeout = timeout
+                if deadline is not None:
+                    if rate_limiter and rate_limiter.acquire(max(0.0, deadline - self.clock())) is None:
+                        breaker.cancel()
+                        raise requests.exceptions.Timeout(f"rate limit for {host} leaves no time within {total_timeout}s")
+                    # Measured after the slot and rate-limit waits
+                    left = deadline - self.clock()
+                    if left <= 0:
+                        breaker.cancel()
+                        raise requests.exceptions.Timeout(f"no time left for {host} within {total_timeout}s")
+                    attempt_timeout = (min(timeout[0], left), min(timeout[1], left))
+                elif rate_limiter:
+                    rate_limiter.acquire()
+                try:
+                    response = self._send(url, params, attempt_timeout)
+                except (requests.exceptions.ConnectionError, requests.exceptions.Timeout):
+                    breaker.record_failure()
+                    delay = self.retry_delay(attempt, deadline)
+                    if delay is None:
+                        raise
+                else:
+                    if response.status_code not in RETRY_STATUSES:
+                        breaker.record_success()
+                        return response
+                    breaker.record_failure()
+                    delay = self.retry_delay(attempt, deadline)
+                    if delay is None:
+                        return response
+                    response.close()
+            finally:
+                self._slots.release()
+            self.sleep(delay)
+            attempt += 1
+
+    def _send(self, url: str, params: Optional[Dict[str, Any]], timeout: Tuple[float, float]) -> requests.Response:
+        return self.session.get(url, params=params, timeout=timeout)
+
+_default_client: Optional[HttpClient] = None
+_default_client_lock = threading.Lock()
+
+def get_http_client() -> HttpClient:
+    """Process-wide HTTP client (shared across Streamlit reruns since this module is imported)"""
+    global _default_client
+    if _default_client is None:
+        with _default_client_lock:
+            if _default_client is None:
+                _default_client = HttpClient()
+    return _default_client
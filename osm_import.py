@@ -0,0 +1,406 @@
+#!/usr/bin/env python3
+"""
+Offline OpenStreetMap import: police, fire, hospital, town hall and similar amenities from a
+local OSM extract (.osm / .osm.gz / .osm.bz2 XML, .osm.pbf) or a saved Overpass JSON dump
+into osm_facilities.sqlite, which the app merges into its facility indexes.
+
+Searches never call Overpass: the app only reads the imported store. Each input file is one
+region; re-running the import skips regions whose file has not changed since the last run.
+
+Usage:
+    python osm_import.py kanto-latest.osm.pbf                # import (or refresh) one region
+    python osm_import.py tokyo.json saitama.json --refresh    # re-import even if unchanged
+    python osm_import.py --query 東京都 > tokyo.overpassql     # Overpass QL for a dump to save
+"""
+
+import argparse
+import bz2
+import gzip
+import hashlib
+import json
+import os
+import re
+import sqlite3
+import time
+import xml.etree.ElementTree as ET
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
+
+from address_parser import PREFECTURE_NAMES, parse_address
+from boundaries import get_boundary_index
+from gazetteer import get_gazetteer
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+OSM_STORE_PATH = os.path.join(BASE_DIR, "osm_facilities.sqlite")
+OSM_STORE_VERSION = 1
+
+# POIs without an address are placed at the nearest gazetteer city/ward within this distance
+PLACEMENT_MAX_KM = 15.0
+# Tags that may name a POI's prefecture; is_in holds a list such as "日本, 栃木県, 小山市"
+PREFECTURE_TAGS = ("addr:province", "addr:state", "is_in:province", "is_in:state", "is_in")
+IS_IN_SEPARATOR = re.compile(r'[,;、，]')
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT NOT NULL);
+CREATE TABLE IF NOT EXISTS regions (
+    region TEXT PRIMARY KEY,
+    source_sha1 TEXT NOT NULL,
+    imported_at REAL NOT NULL,
+    facilities INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS facilities (
+    region TEXT NOT NULL,
+    osm_id TEXT NOT NULL,
+    category TEXT NOT NULL,
+    name TEXT NOT NULL,
+    phone TEXT,
+    address TEXT,
+    hours TEXT,
+    lat REAL NOT NULL,
+    lon REAL NOT NULL,
+    prefecture TEXT,
+    city TEXT,
+    district TEXT,
+    PRIMARY KEY (region, osm_id)
+);
+CREATE INDEX IF NOT EXISTS facilities_prefecture ON facilities (prefecture, category);
+"""
+
+# -----------------------------
+# Tag classification
+# -----------------------------
+
+# (tag, value) -> category; names decide for offices that share generic tags
+AMENITY_CATEGORIES = {
+    ("amenity", "police"): "警察署",
+    ("amenity", "fire_station"): "消防署",
+    ("amenity", "hospital"): "病院",
+    ("healthcare", "hospital"): "病院",
+    ("amenity", "townhall"): "市区町村役所",
+}
+NAME_CATEGORIES = [
+    ("労働基準監督署", "労基署"),
+    ("保健所", "保健所"),
+    ("保健福祉事務所", "保健所"),
+]
+# Police boxes are tagged amenity=police too, but the app lists stations
+POLICE_BOX_NAMES = ("交番", "駐在所", "警備派出所")
+
+def classify(tags: Dict[str, str]) -> Optional[str]:
+    """App category for an OSM object's tags, or None when it is not a facility we list"""
+    name = tags.get("name:ja") or tags.get("name") or ""
+    if not name:
+        return None
+    for (key, value), category in AMENITY_CATEGORIES.items():
+        if tags.get(key) == value:
+            if category == "警察署" and (tags.get("police") == "koban" or name.endswith(POLICE_BOX_NAMES)):
+                return None
+            return category
+    if "office" in tags or "amenity" in tags or "healthcare" in tags:
+        for fragment, category in NAME_CATEGORIES:
+            if fragment in name:
+                return category
+    return None
+
+def format_address(tags: Dict[str, str]) -> str:
+    """Japanese address from addr:* tags (addr:full when present)"""
+    if tags.get("addr:full"):
+        return tags["addr:full"]
+    parts = [tags.get(key, "") for key in ("addr:province", "addr:city", "addr:suburb", "addr:quarter", "addr:neighbourhood")]
+    number = "-".join(tags[key] for key in ("addr:block_number", "addr:housenumber") if tags.get(key))
+    address = "".join(parts) + number
+    return address if any(parts) else ""
+
+def facility_record(osm_id: str, tags: Dict[str, str], lat: float, lon: float) -> Optional[Dict[str, Any]]:
+    """Store row for one OSM object, placed in a prefecture/city, or None when it is not listed"""
+    category = classify(tags)
+    if category is None:
+        return None
+    address = format_address(tags)
+    prefecture, city, district = place_facility(address, tag_prefecture(tags), lat, lon)
+    return {
+        "osm_id": osm_id,
+        "category": category,
+        "name": tags.get("name:ja") or tags["name"],
+        "phone": tags.get("phone") or tags.get("contact:phone"),
+        "address": address or None,
+        "hours": tags.get("opening_hours"),
+        "lat": lat,
+        "lon": lon,
+        "prefecture": prefecture,
+        "city": city,
+        "district": district,
+    }
+
+def tag_prefecture(tags: Dict[str, str]) -> Optional[str]:
+    """Prefecture a POI's own tags name (addr:province, is_in, ...), or None"""
+    for key in PREFECTURE_TAGS:
+        for part in IS_IN_SEPARATOR.split(tags.get(key, "")):
+            if part.strip() in PREFECTURE_NAMES:
+                return part.strip()
+    return None
+
+def place_facility(address: str, province: Optional[str], lat: float, lon: float) -> Tuple[Optional[str], str, str]:
+    """(prefecture, city, district) of a POI
+
+    The prefecture is the one its tags name (province), else its address's. City and ward come
+    from the gazetteer place the address names, else the boundary polygon containing the POI,
+    else the address itself; the nearest gazetteer city/ward is the last resort. A guess that
+    contradicts the known prefecture is never taken: the gazetteer does not cover every
+    prefecture, and its nearest city may lie across the border (栃木県 next to 茨城県).
+    """
+    parsed = parse_address(address) if address else None
+    province = province or (parsed.prefecture if parsed else "") or None
+    gazetteer = get_gazetteer()
+    place = gazetteer.find_place(address, province) if address else None
+    if place is not None and province in (None, place.path[0]):
+        return _place_components(place.path)
+    jurisdiction = get_boundary_index().reverse_geocode(lat, lon)
+    if jurisdiction is not None and province in (None, jurisdiction.prefecture):
+        return jurisdiction.components
+    if province and parsed is not None and parsed.city:
+        return province, parsed.city, parsed.ward
+    place = gazetteer.nearest_place(lat, lon, depth=2, max_km=PLACEMENT_MAX_KM)
+    if place is not None and province in (None, place.path[0]):
+        return _place_components(place.path)
+    return province, "", ""
+
+def _place_components(path: Tuple[str, ...]) -> Tuple[str, str, str]:
+    district = path[2] if len(path) > 2 and path[2].endswith("区") else ""
+    return path[0], path[1] if len(path) > 1 else "", district
+
+# -----------------------------
+# Readers
+# -----------------------------
+
+def _open_xml(path: str):
+    if path.endswith(".gz"):
+        return gzip.open(path, "rb")
+    if path.endswith(".bz2"):
+        return bz2.open(path, "rb")
+    return open(path, "rb")
+
+def iter_overpass_json(path: str) -> Iterator[Dict[str, Any]]:
+    """Facilities from a saved Overpass JSON response (`out center;` gives ways a position)"""
+    with open(path, encoding="utf-8") as f:
+        payload = json.load(f)
+    for element in payload.get("elements", []):
+        tags = element.get("tags") or {}
+        if "lat" in element:
+            lat, lon = element["lat"], element["lon"]
+        elif "center" in element:
+            lat, lon = element["center"]["lat"], element["center"]["lon"]
+        else:
+            continue
+        record = facility_record(f"{element['type']}/{element['id']}", tags, lat, lon)
+        if record:
+            yield record
+
+def _iter_osm_elements(f) -> Iterator[ET.Element]:
+    """Completed node/way/relation elements of an OSM XML stream
+
+    Each one is dropped from the root once the caller moves on; element.clear() alone
+    would leave an empty element per node attached to the root, growing with the file.
+    """
+    root = None
+    for event, element in ET.iterparse(f, events=("start", "end")):
+        if root is None:
+            root = element
+        elif event == "end" and element.tag in ("node", "way", "relation"):
+            yield element
+            root.clear()
+
+def iter_osm_xml(path: str) -> Iterator[Dict[str, Any]]:
+    """Facilities from an OSM XML extract, streamed in two passes
+
+    Tagged nodes are read in the first pass together with the node ids of matching ways;
+    the second pass collects just those node positions to place each way at its centroid.
+    """
+    way_refs: Dict[str, Tuple[Dict[str, str], List[str]]] = {}
+    with _open_xml(path) as f:
+        for element in _iter_osm_elements(f):
+            if element.tag == "node":
+                tags = {tag.get("k"): tag.get("v") for tag in element.iter("tag")}
+                if tags:
+                    record = facility_record(f"node/{element.get('id')}", tags,
+                                             float(element.get("lat")), float(element.get("lon")))
+                    if record:
+                        yield record
+            elif element.tag == "way":
+                tags = {tag.get("k"): tag.get("v") for tag in element.iter("tag")}
+                if classify(tags):
+                    way_refs[element.get("id")] = (tags, [nd.get("ref") for nd in element.iter("nd")])
+
+    if not way_refs:
+        return
+    wanted = {ref for _, refs in way_refs.values() for ref in refs}
+    positions: Dict[str, Tuple[float, float]] = {}
+    with _open_xml(path) as f:
+        for element in _iter_osm_elements(f):
+            if element.tag == "node" and element.get("id") in wanted:
+                positions[element.get("id")] = (float(element.get("lat")), float(element.get("lon")))
+    for way_id, (tags, refs) in way_refs.items():
+        points = [positions[ref] for ref in refs if ref in positions]
+        if points:
+            lat = sum(p[0] for p in points) / len(points)
+            lon = sum(p[1] for p in points) / len(points)
+            record = facility_record(f"way/{way_id}", tags, lat, lon)
+            if record:
+                yield record
+
+def iter_osm_pbf(path: str) -> List[Dict[str, Any]]:
+    """Facilities from an .osm.pbf extract (needs the optional `osmium` package)"""
+    try:
+        import osmium
+    except ImportError as e:
+        raise ImportError("Reading .osm.pbf needs pyosmium: pip install osmium "
+                          "(or convert the extract to .osm XML / use an Overpass JSON dump)") from e
+
+    records: List[Dict[str, Any]] = []
+
+    class Handler(osmium.SimpleHandler):
+        def node(self, n):
+            if n.tags:
+                record = facility_record(f"node/{n.id}", dict(n.tags), n.location.lat, n.location.lon)
+                if record:
+                    records.append(record)
+
+        def way(self, w):
+            tags = dict(w.tags)
+            if classify(tags):
+                points = [(nd.lat, nd.lon) for nd in w.nodes if nd.location.valid()]
+                if points:
+                    record = facility_record(f"way/{w.id}", tags, sum(p[0] for p in points) / len(points),
+                                             sum(p[1] for p in points) / len(points))
+                    if record:
+                        records.append(record)
+
+    Handler().apply_file(path, locations=True)
+    return records
+
+def read_facilities(path: str) -> Iterator[Dict[str, Any]]:
+    """Facilities from any supported input, chosen by file extension"""
+    if path.endswith(".json"):
+        return iter_overpass_json(path)
+    if path.endswith(".pbf"):
+        return iter(iter_osm_pbf(path))
+    return iter_osm_xml(path)
+
+def region_name(path: str) -> str:
+    """Region key of an input file: its name without OSM/compression extensions"""
+    name = os.path.basename(path)
+    for suffix in (".gz", ".bz2", ".pbf", ".osm", ".json", ".xml"):
+        if name.endswith(suffix):
+            name = name[: -len(suffix)]
+    return name
+
+def file_fingerprint(path: str) -> str:
+    """SHA-1 of an input file, streamed"""
+    digest = hashlib.sha1()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+# -----------------------------
+# Store
+# -----------------------------
+
+def _connect(store_path: str) -> sqlite3.Connection:
+    conn = sqlite3.connect(store_path)
+    conn.executescript(SCHEMA)
+    version = conn.execute("SELECT value FROM meta WHERE key = 'version'").fetchone()
+    if version is None:
+        conn.execute("INSERT INTO meta (key, value) VALUES ('version', ?)", (str(OSM_STORE_VERSION),))
+        conn.commit()
+    elif version[0] != str(OSM_STORE_VERSION):
+        raise ValueError(f"{store_path} was written by a different importer version; delete it and re-import")
+    return conn
+
+def import_region(path: str, store_path: str = OSM_STORE_PATH, region: Optional[str] = None,
+                  refresh: bool = False) -> Dict[str, Any]:
+    """Import one input file as a region, replacing that region's previous facilities
+
+    Returns {"region", "status": "imported" | "unchanged", "facilities", "unplaced"}.
+    """
+    region = region or region_name(path)
+    fingerprint = file_fingerprint(path)
+    conn = _connect(store_path)
+    try:
+        row = conn.execute("SELECT source_sha1, facilities FROM regions WHERE region = ?", (region,)).fetchone()
+        if row and row[0] == fingerprint and not refresh:
+            return {"region": region, "status": "unchanged", "facilities": row[1], "unplaced": 0}
+
+        # Duplicate ids (e.g. overlapping Overpass queries) keep the last occurrence
+        records = {record["osm_id"]: record for record in read_facilities(path)}
+        with conn:
+            conn.execute("DELETE FROM facilities WHERE region = ?", (region,))
+            conn.executemany(
+                "INSERT INTO facilities (region, osm_id, category, name, phone, address, hours, lat, lon, prefecture, city, district)"
+                " VALUES (:region, :osm_id, :category, :name, :phone, :address, :hours, :lat, :lon, :prefecture, :city, :district)",
+                [dict(record, region=region) for record in records.values()],
+            )
+            conn.execute(
+                "INSERT OR REPLACE INTO regions (region, source_sha1, imported_at, facilities) VALUES (?, ?, ?, ?)",
+                (region, fingerprint, time.time(), len(records)),
+            )
+    finally:
+        conn.close()
+    unplaced = sum(1 for record in records.values() if not record["prefecture"])
+    return {"region": region, "status": "imported", "facilities": len(records), "unplaced": unplaced}
+
+def import_osm(paths: Sequence[str], store_path: str = OSM_STORE_PATH, refresh: bool = False) -> List[Dict[str, Any]]:
+    """Import several region files; unchanged regions are skipped unless refresh is set"""
+    return [import_region(path, store_path, refresh=refresh) for path in paths]
+
+def load_osm_facilities(prefecture: str, store_path: str = OSM_STORE_PATH) -> List[Dict[str, Any]]:
+    """Imported facilities of one prefecture, in region then OSM id order ([] without a store)"""
+    try:
+        conn = sqlite3.connect(f"file:{store_path}?mode=ro", uri=True)
+    except sqlite3.Error:
+        return []
+    try:
+        cursor = conn.execute(
+            "SELECT osm_id, category, name, phone, address, hours, lat, lon, city, district FROM facilities"
+            " WHERE prefecture = ? ORDER BY region, osm_id",
+            (prefecture,),
+        )
+        columns = [column[0] for column in cursor.description]
+        return [dict(zip(columns, row)) for row in cursor]
+    except sqlite3.Error:
+        return []
+    finally:
+        conn.close()
+
+def overpass_query(area_name: str, timeout: int = 180) -> str:
+    """Overpass QL for the amenities this importer reads, within a named area (e.g. 東京都)"""
+    selectors = "".join(
+        f'  nwr["{key}"="{value}"](area.a);\n' for key, value in AMENITY_CATEGORIES
+    ) + "".join(f'  nwr["office"]["name"~"{fragment}"](area.a);\n' for fragment, _ in NAME_CATEGORIES)
+    return (f"[out:json][timeout:{timeout}];\n"
+            f'area["name"="{area_name}"]["boundary"="administrative"]->.a;\n'
+            f"(\n{selectors});\nout center tags;\n")
+
+def main():
+    parser = argparse.ArgumentParser(description="Import OSM facilities into the offline facility store")
+    parser.add_argument("inputs", nargs="*", help="OSM XML (.osm[.gz|.bz2]), .osm.pbf or Overpass JSON files, one region each")
+    parser.add_argument("--store", default=OSM_STORE_PATH, help="store path")
+    parser.add_argument("--refresh", action="store_true", help="re-import regions even if their file is unchanged")
+    parser.add_argument("--query", metavar="AREA", help="print the Overpass QL for an area (e.g. 東京都) and exit")
+    args = parser.parse_args()
+
+    if args.query:
+        print(overpass_query(args.query), end="")
+        return
+    if not args.inputs:
+        parser.error("no input files")
+
+    for result in import_osm(args.inputs, args.store, refresh=args.refresh):
+        if result["status"] == "unchanged":
+            print(f"⏭️ {result['region']}: unchanged ({result['facilities']} facilities)")
+        else:
+            print(f"✅ {result['region']}: {result['facilities']} facilities imported")
+            if result["unplaced"]:
+                print(f"  ⚠️ {result['unplaced']} outside the known prefectures (kept, not searchable)")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,229 @@
+#!/usr/bin/env python3
+"""
+Postal-code (〒) index: 7-digit code → prefecture, city, town and coordinates.
+
+Built offline from Japan Post's KEN_ALL.CSV (or its .zip) into postal_codes.json;
+coordinates come from the local gazetteer, so a code resolves without calling GSI.
+
+Usage:
+    python postal_codes.py KEN_ALL.ZIP          # build postal_codes.json
+    python postal_codes.py --lookup 160-0023    # look up one code
+"""
+
+import argparse
+import csv
+import hashlib
+import io
+import json
+import os
+import re
+import zipfile
+from typing import Dict, Iterator, List, NamedTuple, Optional, Tuple
+
+from gazetteer import get_gazetteer
+from geocoder import POSTAL_CODE, TOWN, Answer, postal_code
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+POSTAL_CODES_PATH = os.path.join(BASE_DIR, "postal_codes.json")
+POSTAL_CODES_VERSION = 1
+
+# KEN_ALL columns
+CODE, PREFECTURE, CITY, TOWN_NAME = 2, 6, 7, 8
+
+# Town fields that stand for "the whole municipality" rather than a town name
+NO_TOWN = re.compile(r'^(以下に掲載がない場合|.*の次に番地がくる場合|.*一円)$')
+PARENTHESIZED = re.compile(r'（.*?）|（.*$')
+FIRST_MUNICIPALITY = re.compile(r'^.+?[市郡]')
+
+class PostalEntry(NamedTuple):
+    """Where a postal code points; depth is the gazetteer level the coordinates come from"""
+    prefecture: str
+    city: str
+    town: str
+    coords: Optional[Tuple[float, float]]
+    depth: int = 0
+
+class PostalIndex:
+    """Postal codes held in one dict for O(1) lookups"""
+
+    def __init__(self, entries: Dict[str, PostalEntry]):
+        self.entries = entries
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def get(self, code: str) -> Optional[PostalEntry]:
+        """Entry for a 7-digit code (hyphen optional)"""
+        return self.entries.get(code.replace("-", ""))
+
+    def lookup_address(self, address: str) -> Optional[PostalEntry]:
+        """Entry for the 〒 code leading an address, if it has one the table knows"""
+        code = postal_code(address)
+        return self.entries.get(code) if code else None
+
+    def answer(self, code: str) -> Optional[Answer]:
+        """Geocoder answer for a code: its coordinates, at most town precision"""
+        entry = self.entries.get(code)
+        if entry is None or entry.coords is None:
+            return None
+        return Answer(entry.coords, min(entry.depth, TOWN))
+
+    def qualify(self, address: str) -> str:
+        """The address with the prefecture and city its code implies spelled out where missing
+
+        "〒160-0023 西新宿2-8-1" becomes "〒160-0023 東京都新宿区西新宿2-8-1"; addresses
+        without a known code, or already naming their prefecture, come back unchanged.
+        """
+        entry = self.lookup_address(address)
+        if entry is None or entry.prefecture in address:
+            return address
+        prefix_end = POSTAL_CODE.match(address).end()
+        head, rest = address[:prefix_end], address[prefix_end:]
+        municipality = FIRST_MUNICIPALITY.match(entry.city)
+        if not rest.startswith(entry.city) and not (municipality and rest.startswith(municipality.group())):
+            rest = entry.city + rest
+        return head + entry.prefecture + rest
+
+# -----------------------------
+# KEN_ALL reading
+# -----------------------------
+
+def read_ken_all_text(path: str) -> str:
+    """Text of KEN_ALL.CSV, from the CSV itself or the .zip Japan Post distributes
+
+    The original file is Shift_JIS; the UTF-8 edition (utf_ken_all) is accepted too.
+    """
+    if zipfile.is_zipfile(path):
+        with zipfile.ZipFile(path) as archive:
+            name = next(name for name in archive.namelist() if name.lower().endswith(".csv"))
+            data = archive.read(name)
+    else:
+        with open(path, "rb") as f:
+            data = f.read()
+    try:
+        return data.decode("utf-8-sig")
+    except UnicodeDecodeError:
+        return data.decode("cp932")
+
+def clean_town(town: str) -> str:
+    """Town name without KEN_ALL's parenthesized notes and whole-municipality placeholders"""
+    town = PARENTHESIZED.sub("", town)
+    return "" if NO_TOWN.match(town) else town
+
+def iter_ken_all(text: str) -> Iterator[Tuple[str, str, str, str]]:
+    """(code, prefecture, city, town) per KEN_ALL record
+
+    Long town names are split over several rows until the closing parenthesis; they are
+    joined back into one record.
+    """
+    pending: Optional[List[str]] = None
+    for row in csv.reader(io.StringIO(text)):
+        if len(row) <= TOWN_NAME:
+            continue
+        if pending is not None and row[CODE] == pending[CODE]:
+            pending[TOWN_NAME] += row[TOWN_NAME]
+        else:
+            if pending is not None:
+                yield pending[CODE], pending[PREFECTURE], pending[CITY], clean_town(pending[TOWN_NAME])
+            pending = row
+        if pending[TOWN_NAME].count("（") <= pending[TOWN_NAME].count("）"):
+            yield pending[CODE], pending[PREFECTURE], pending[CITY], clean_town(pending[TOWN_NAME])
+            pending = None
+    if pending is not None:
+        yield pending[CODE], pending[PREFECTURE], pending[CITY], clean_town(pending[TOWN_NAME])
+
+def build_entries(records: Iterator[Tuple[str, str, str, str]]) -> Dict[str, PostalEntry]:
+    """One entry per code, located with the gazetteer
+
+    A code shared by several towns keeps only the prefecture and city (and their coordinates).
+    """
+    towns: Dict[str, Tuple[str, str, str]] = {}
+    for code, prefecture, city, town in records:
+        if code in towns:
+            previous = towns[code]
+            if previous[2] != town or previous[1] != city:
+                towns[code] = (previous[0], previous[1] if previous[1] == city else "", "")
+        else:
+            towns[code] = (prefecture, city, town)
+
+    gazetteer = get_gazetteer()
+    located: Dict[Tuple[str, str, str], Tuple[Optional[Tuple[float, float]], int]] = {}
+    entries = {}
+    for code, place in towns.items():
+        if place not in located:
+            prefecture, city, town = place
+            found = gazetteer.locate(prefecture + city + town, prefecture)
+            located[place] = found if found else (None, 0)
+        coords, depth = located[place]
+        entries[code] = PostalEntry(*place, coords, depth)
+    return entries
+
+# -----------------------------
+# Sidecar
+# -----------------------------
+
+def save_postal_codes(entries: Dict[str, PostalEntry], source_sha1: str, path: str = POSTAL_CODES_PATH) -> None:
+    """Write the sidecar atomically"""
+    payload = {
+        "version": POSTAL_CODES_VERSION,
+        "source_sha1": source_sha1,
+        "codes": {code: [e.prefecture, e.city, e.town, *(e.coords or (None, None)), e.depth]
+                  for code, e in sorted(entries.items())},
+    }
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(payload, f, ensure_ascii=False, separators=(",", ":"))
+    os.replace(tmp_path, path)
+
+def load_postal_index(path: str = POSTAL_CODES_PATH) -> PostalIndex:
+    """Index from the sidecar; empty when it has not been built (or is from another version)"""
+    try:
+        with open(path, encoding="utf-8") as f:
+            payload = json.load(f)
+    except (OSError, ValueError):
+        return PostalIndex({})
+    if payload.get("version") != POSTAL_CODES_VERSION:
+        return PostalIndex({})
+
+    # Names repeat across thousands of codes: keep one string object per name
+    names: Dict[str, str] = {}
+    entries = {}
+    for code, (prefecture, city, town, lat, lon, depth) in payload["codes"].items():
+        entries[code] = PostalEntry(
+            names.setdefault(prefecture, prefecture), names.setdefault(city, city), names.setdefault(town, town),
+            (lat, lon) if lat is not None else None, depth,
+        )
+    return PostalIndex(entries)
+
+_default_index: Optional[PostalIndex] = None
+
+def get_postal_index() -> PostalIndex:
+    """Process-wide postal-code index, loaded on first use"""
+    global _default_index
+    if _default_index is None:
+        _default_index = load_postal_index()
+    return _default_index
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Build or query the postal-code index")
+    parser.add_argument("ken_all", nargs="?", help="KEN_ALL.CSV or KEN_ALL.ZIP from Japan Post")
+    parser.add_argument("--output", default=POSTAL_CODES_PATH)
+    parser.add_argument("--lookup", help="print the entry for one postal code")
+    args = parser.parse_args()
+
+    if args.lookup:
+        entry = load_postal_index(args.output).get(args.lookup)
+        print(entry if entry else f"❌ {args.lookup} not in {args.output}")
+        return
+    if not args.ken_all:
+        parser.error("a KEN_ALL file is required to build the index")
+
+    with open(args.ken_all, "rb") as f:
+        source_sha1 = hashlib.sha1(f.read()).hexdigest()
+    entries = build_entries(iter_ken_all(read_ken_all_text(args.ken_all)))
+    save_postal_codes(entries, source_sha1, args.output)
+    located = sum(1 for entry in entries.values() if entry.coords)
+    print(f"✅ {len(entries)} postal codes ({located} with coordinates) → {args.output}")
+
+if __name__ == "__main__":
+    main()
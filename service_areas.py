@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""
+Service areas (管轄区域) of police and fire stations: which station is responsible for a point.
+
+Area polygons (GeoJSON, or a shapefile when pyshp is installed; one feature per station) are
+imported offline into service_areas.npz. The app lists the station whose area contains the
+searched point first and fills the remaining slots by distance.
+
+Usage:
+    python service_areas.py police_13.geojson fire_13.geojson --prefecture 東京都   # build service_areas.npz
+    python service_areas.py --lookup 35.6895,139.6917                              # stations responsible for a point
+"""
+
+import argparse
+import hashlib
+import os
+import re
+from typing import Any, Dict, Iterator, List, NamedTuple, Optional, Sequence, Tuple
+
+from address_parser import PREFECTURE_NAMES, normalize
+from boundaries import Polygon, PolygonIndex, load_polygon_index, read_features
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+SERVICE_AREAS_PATH = os.path.join(BASE_DIR, "service_areas.npz")
+SERVICE_AREAS_VERSION = 1
+
+SERVICE_AREA_CATEGORIES = ("警察署", "消防署")
+NAME_KEYS = ("name:ja", "name", "署名", "NAME")
+# Organization prefixes some publishers put before the station name: prefectural police
+# (警視庁新宿警察署) and fire departments (東京消防庁新宿消防署, 横浜市消防局鶴見消防署)
+ORGANIZATION_PREFIX = re.compile(r'^(?:警視庁|北海道警察|.{2,3}[府県]警察(?:本部)?|東京消防庁|[^署]{1,15}?消防(?:局|本部))(?=.+署)')
+
+class ServiceArea(NamedTuple):
+    """The station responsible for one area; name as published (matched with station_key)"""
+    prefecture: str
+    category: str
+    name: str
+
+def station_key(name: str) -> str:
+    """Spelling-independent station name: normalized, without an organization prefix"""
+    return ORGANIZATION_PREFIX.sub("", normalize(name))
+
+def feature_service_area(properties: Dict[str, Any], prefecture: Optional[str] = None) -> Optional[ServiceArea]:
+    """Station of one area feature, or None when it names no police or fire station
+
+    The category comes from a `category` property (警察署/消防署) or else from the name; the
+    prefecture from a `prefecture` property or else the importer's default.
+    """
+    name = next((str(properties[key]) for key in NAME_KEYS if properties.get(key)), "")
+    if not name:
+        return None
+    category = properties.get("category")
+    if category not in SERVICE_AREA_CATEGORIES:
+        category = "警察署" if "警察" in name else "消防署" if "消防" in name else None
+    prefecture = properties.get("prefecture") or prefecture
+    if category is None or prefecture not in PREFECTURE_NAMES:
+        return None
+    return ServiceArea(prefecture, category, name)
+
+def build_service_area_index(paths: Sequence[str], prefecture: Optional[str] = None,
+                             encoding: str = "utf-8") -> PolygonIndex:
+    """Service-area index from one or more area files"""
+    def items() -> Iterator[Tuple[Polygon, ServiceArea]]:
+        for path in paths:
+            for properties, polygons in read_features(path, encoding):
+                area = feature_service_area(properties, prefecture)
+                if area is not None:
+                    for polygon in polygons:
+                        yield polygon, area
+    return PolygonIndex.from_polygons(items())
+
+class ServiceAreaIndex:
+    """Point → responsible stations over a PolygonIndex of ServiceArea payloads (empty when not imported)
+
+    Police and fire areas overlap each other, so a point usually lies in one area of each.
+    """
+
+    def __init__(self, polygons: Optional[PolygonIndex] = None):
+        self.polygons = polygons
+
+    def __len__(self) -> int:
+        return len(self.polygons) if self.polygons is not None else 0
+
+    def stations_at(self, lat: float, lon: float) -> List[ServiceArea]:
+        """Stations whose service area contains the point"""
+        if self.polygons is None:
+            return []
+        return self.polygons.locate_all(lat, lon)
+
+def load_service_area_index(path: str = SERVICE_AREAS_PATH) -> ServiceAreaIndex:
+    """Index from the imported file; empty when it has not been built (or is from another version)"""
+    return ServiceAreaIndex(load_polygon_index(path, SERVICE_AREAS_VERSION, lambda item: ServiceArea(*item)))
+
+_default_index: Optional[ServiceAreaIndex] = None
+
+def get_service_area_index() -> ServiceAreaIndex:
+    """Process-wide service-area index, loaded on first use"""
+    global _default_index
+    if _default_index is None:
+        _default_index = load_service_area_index()
+    return _default_index
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Import police/fire service areas or look up a point")
+    parser.add_argument("inputs", nargs="*", help="area polygons as GeoJSON (.geojson/.json) or shapefiles (.shp)")
+    parser.add_argument("--prefecture", help="prefecture of areas whose features do not name one")
+    parser.add_argument("--output", default=SERVICE_AREAS_PATH)
+    parser.add_argument("--encoding", default="utf-8", help="text encoding of the inputs")
+    parser.add_argument("--lookup", metavar="LAT,LON", help="print the stations responsible for a point")
+    args = parser.parse_args()
+
+    if args.lookup:
+        lat, lon = (float(value) for value in args.lookup.split(","))
+        stations = load_service_area_index(args.output).stations_at(lat, lon)
+        for station in stations:
+            print(f"{station.category}: {station.name} ({station.prefecture})")
+        if not stations:
+            print(f"❌ {args.lookup} is outside the service areas in {args.output}")
+        return
+    if not args.inputs:
+        parser.error("no input files")
+    if args.prefecture and args.prefecture not in PREFECTURE_NAMES:
+        parser.error(f"unknown prefecture: {args.prefecture}")
+
+    sha1 = hashlib.sha1()
+    for path in args.inputs:
+        with open(path, "rb") as f:
+            sha1.update(f.read())
+    index = build_service_area_index(args.inputs, args.prefecture, args.encoding)
+    index.save(args.output, sha1.hexdigest(), SERVICE_AREAS_VERSION)
+    counts = {category: sum(area.category == category for area in index.payloads) for category in SERVICE_AREA_CATEGORIES}
+    print(f"✅ {counts['警察署']} police and {counts['消防署']} fire service areas ({len(index)} polygons) → {args.output}")
+
+if __name__ == "__main__":
+    main()
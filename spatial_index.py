@@ -0,0 +1,252 @@
+# spatial_index.py
+# Uniform lat/lon grid index for nearest-facility search (radius and k-nearest queries)
+
+import math
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+EARTH_RADIUS_KM = 6371.0
+
+def haversine_km(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
+    """Great-circle distance in km between two points"""
+    lat1, lon1, lat2, lon2 = map(math.radians, [lat1, lon1, lat2, lon2])
+    dlat = lat2 - lat1
+    dlon = lon2 - lon1
+    a = math.sin(dlat/2)**2 + math.cos(lat1) * math.cos(lat2) * math.sin(dlon/2)**2
+    return 2 * math.asin(math.sqrt(a)) * EARTH_RADIUS_KM
+
+def _haversine_radians(lat1, lon1, cos_lat1, lat2, lon2, cos_lat2):
+    """Haversine on broadcastable arrays of radians with precomputed cosines of latitude"""
+    a = np.sin((lat2 - lat1) / 2) ** 2 + cos_lat1 * cos_lat2 * np.sin((lon2 - lon1) / 2) ** 2
+    return 2 * np.arcsin(np.sqrt(a)) * EARTH_RADIUS_KM
+
+def haversine_matrix(lats1: Sequence[float], lons1: Sequence[float],
+                     lats2: Sequence[float], lons2: Sequence[float]) -> np.ndarray:
+    """Distances in km between every point of set 1 (rows) and set 2 (columns), shape (n1, n2)
+
+    Same formula as haversine_km; results agree with it to within a few ULPs.
+    """
+    lat1 = np.radians(np.asarray(lats1, dtype=np.float64))[:, None]
+    lon1 = np.radians(np.asarray(lons1, dtype=np.float64))[:, None]
+    lat2 = np.radians(np.asarray(lats2, dtype=np.float64))[None, :]
+    lon2 = np.radians(np.asarray(lons2, dtype=np.float64))[None, :]
+    return _haversine_radians(lat1, lon1, np.cos(lat1), lat2, lon2, np.cos(lat2))
+
+# Below this many points a query scores every point in one call; cell pruning only pays off
+# once the per-cell slicing costs less than the distances it avoids. Measured on 17 km
+# queries over points spread like the facilities, the two are level around 1000 points
+# (~65 µs) and the grid is twice as fast at 4096 (64 µs vs 146 µs). Per-category prefecture indexes (tens of points)
+# scan; the national index (~2k) prunes.
+FULL_SCAN_MAX_POINTS = 1024
+
+class GridIndex:
+    """Bucket points into fixed-size lat/lon cells so queries only touch nearby cells
+
+    Items are arbitrary payloads stored alongside their coordinates. Query results are
+    lists of (distance_km, item) sorted by distance; equal distances keep insertion order.
+    Points are kept in NumPy arrays sorted by cell, so a query gathers one contiguous slice
+    per cell row and computes all candidate distances in a single vectorized call (small
+    indexes skip the slicing and score every point).
+    """
+
+    def __init__(self, cell_deg: float = 0.05, full_scan_max: int = FULL_SCAN_MAX_POINTS):
+        # 0.05 degrees is roughly 5.5 km north-south, so the 1-17 km search radii
+        # touch between 1 and ~49 cells
+        self.cell_deg = cell_deg
+        self.full_scan_max = full_scan_max
+        self._lats: List[float] = []
+        self._lons: List[float] = []
+        self._items: List[Any] = []
+        self._bounds: Optional[Tuple[int, int, int, int]] = None
+        self._arrays: Optional[Tuple[np.ndarray, ...]] = None
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def _cell(self, lat: float, lon: float) -> Tuple[int, int]:
+        return math.floor(lat / self.cell_deg), math.floor(lon / self.cell_deg)
+
+    def insert(self, lat: float, lon: float, item: Any) -> None:
+        """Add a point to the index"""
+        row, col = self._cell(lat, lon)
+        self._lats.append(lat)
+        self._lons.append(lon)
+        self._items.append(item)
+        self._arrays = None
+
+        if self._bounds is None:
+            self._bounds = (row, row, col, col)
+        else:
+            min_row, max_row, min_col, max_col = self._bounds
+            self._bounds = (min(min_row, row), max(max_row, row), min(min_col, col), max(max_col, col))
+
+    def insert_many(self, lats: Sequence[float], lons: Sequence[float], items: Sequence[Any]) -> None:
+        """Add many points at once (same result as inserting them one by one)"""
+        lats = np.asarray(lats, dtype=np.float64)
+        lons = np.asarray(lons, dtype=np.float64)
+        if not len(lats):
+            return
+        rows = np.floor(lats / self.cell_deg)
+        cols = np.floor(lons / self.cell_deg)
+        bounds = (int(rows.min()), int(rows.max()), int(cols.min()), int(cols.max()))
+        if self._bounds is not None:
+            min_row, max_row, min_col, max_col = self._bounds
+            bounds = (min(min_row, bounds[0]), max(max_row, bounds[1]), min(min_col, bounds[2]), max(max_col, bounds[3]))
+        self._bounds = bounds
+        self._lats.extend(lats.tolist())
+        self._lons.extend(lons.tolist())
+        self._items.extend(items)
+        self._arrays = None
+
+    def _cell_key(self, row, col):
+        min_row, _, min_col, max_col = self._bounds
+        return (row - min_row) * (max_col - min_col + 1) + (col - min_col)
+
+    def _compiled(self) -> Tuple[np.ndarray, ...]:
+        """(cell keys, seqs, lat radians, lon radians, cos lat) sorted by cell, insertion order within a cell"""
+        if self._arrays is None:
+            lats = np.array(self._lats)
+            lons = np.array(self._lons)
+            rows = np.floor(lats / self.cell_deg).astype(np.int64)
+            cols = np.floor(lons / self.cell_deg).astype(np.int64)
+            keys = self._cell_key(rows, cols)
+            order = np.argsort(keys, kind="stable")
+            lat_rad = np.radians(lats[order])
+            self._arrays = (keys[order], order, lat_rad, np.radians(lons[order]), np.cos(lat_rad))
+        return self._arrays
+
+    def _cell_range(self, lat: float, lon: float, radius_km: float) -> Optional[Tuple[int, int, int, int]]:
+        """(row_lo, row_hi, col_lo, col_hi) of the occupied cells the search circle can reach"""
+        # Exact bounding box of the search circle on the sphere
+        angular = radius_km / EARTH_RADIUS_KM
+        dlat = math.degrees(angular)
+        cos_lat = math.cos(math.radians(lat))
+        if angular >= math.pi / 2 or cos_lat <= math.sin(angular):
+            dlon = 180.0
+        else:
+            dlon = math.degrees(math.asin(math.sin(angular) / cos_lat))
+
+        min_row, max_row, min_col, max_col = self._bounds
+        row_lo = max(math.floor((lat - dlat) / self.cell_deg), min_row)
+        row_hi = min(math.floor((lat + dlat) / self.cell_deg), max_row)
+        col_lo = max(math.floor((lon - dlon) / self.cell_deg), min_col)
+        col_hi = min(math.floor((lon + dlon) / self.cell_deg), max_col)
+        if row_lo > row_hi or col_lo > col_hi:
+            return None
+        return row_lo, row_hi, col_lo, col_hi
+
+    def _window(self, row_lo: int, row_hi: int, col_lo: int, col_hi: int) -> np.ndarray:
+        """Positions (in the cell-sorted arrays) of every point inside a block of cells"""
+        keys = self._compiled()[0]
+        rows = np.arange(row_lo, row_hi + 1)
+        starts = np.searchsorted(keys, self._cell_key(rows, col_lo), side="left")
+        ends = np.searchsorted(keys, self._cell_key(rows, col_hi), side="right")
+        lengths = ends - starts
+        total = int(lengths.sum())
+        if not total:
+            return np.empty(0, dtype=np.int64)
+        # Concatenated ranges without a Python loop: each position is its row's start plus
+        # its offset within the row
+        offsets = np.cumsum(lengths) - lengths
+        return np.repeat(starts - offsets, lengths) + np.arange(total)
+
+    def query_radius(self, lat: float, lon: float, radius_km: float) -> List[Tuple[float, Any]]:
+        """All items within radius_km of (lat, lon), nearest first"""
+        if not self._items or radius_km < 0:
+            return []
+        cell_range = self._cell_range(lat, lon, radius_km)
+        if cell_range is None:
+            return []
+
+        keys, seqs, lat_rad, lon_rad, point_cos = self._compiled()
+        if len(keys) > self.full_scan_max:
+            candidates = self._window(*cell_range)
+            if not candidates.size:
+                return []
+            seqs, lat_rad, lon_rad, point_cos = seqs[candidates], lat_rad[candidates], lon_rad[candidates], point_cos[candidates]
+
+        user_lat = np.radians(np.array([lat]))
+        user_lon = np.radians(np.array([lon]))
+        distances = _haversine_radians(user_lat, user_lon, np.cos(user_lat), lat_rad, lon_rad, point_cos)
+        inside = distances <= radius_km
+        distances = distances[inside]
+        hit_seqs = seqs[inside]
+        order = np.lexsort((hit_seqs, distances))
+
+        items = self._items
+        return [(distance, items[seq]) for distance, seq in zip(distances[order].tolist(), hit_seqs[order].tolist())]
+
+    def join_radius(self, lats: Sequence[float], lons: Sequence[float], radius_km: float) -> List[List[Tuple[float, Any]]]:
+        """For every origin, the items within radius_km in query_radius's order (same hits, same distances)
+
+        A spatial join rather than one query per origin: origins are grouped by grid cell and
+        each group is scored in one vectorized call against the cells its search circles reach
+        (all points when the index is small).
+        """
+        lats = np.asarray(lats, dtype=np.float64)
+        lons = np.asarray(lons, dtype=np.float64)
+        results: List[List[Tuple[float, Any]]] = [[] for _ in range(len(lats))]
+        if not self._items or radius_km < 0 or not len(lats):
+            return results
+
+        keys, seqs, lat_rad, lon_rad, point_cos = self._compiled()
+        pruned = len(keys) > self.full_scan_max
+        by_cell: Dict[Optional[Tuple[int, int]], List[Tuple[int, Tuple[int, int, int, int]]]] = {}
+        for origin, (lat, lon) in enumerate(zip(lats.tolist(), lons.tolist())):
+            cell_range = self._cell_range(lat, lon, radius_km)
+            if cell_range is not None:
+                by_cell.setdefault(self._cell(lat, lon) if pruned else None, []).append((origin, cell_range))
+
+        items = self._items
+        for members in by_cell.values():
+            origins = np.array([origin for origin, _ in members])
+            if pruned:
+                ranges = [cell_range for _, cell_range in members]
+                positions = self._window(min(r[0] for r in ranges), max(r[1] for r in ranges),
+                                         min(r[2] for r in ranges), max(r[3] for r in ranges))
+                if not positions.size:
+                    continue
+                group = seqs[positions], lat_rad[positions], lon_rad[positions], point_cos[positions]
+            else:
+                group = seqs, lat_rad, lon_rad, point_cos
+            group_seqs, group_lat, group_lon, group_cos = group
+            origin_lat = np.radians(lats[origins])[:, None]
+            matrix = _haversine_radians(origin_lat, np.radians(lons[origins])[:, None], np.cos(origin_lat),
+                                        group_lat, group_lon, group_cos)
+            # Every hit of the group at once, ordered by origin, then as query_radius orders them
+            rows, cols = np.nonzero(matrix <= radius_km)
+            distances = matrix[rows, cols]
+            hit_seqs = group_seqs[cols]
+            order = np.lexsort((hit_seqs, distances, rows))
+            bounds = np.searchsorted(rows[order], np.arange(len(origins) + 1)).tolist()
+            distances = distances[order].tolist()
+            hit_items = [items[seq] for seq in hit_seqs[order].tolist()]
+            for row, origin in enumerate(origins.tolist()):
+                start, end = bounds[row], bounds[row + 1]
+                results[origin] = list(zip(distances[start:end], hit_items[start:end]))
+        return results
+
+    def nearest(self, lat: float, lon: float, k: int, max_km: Optional[float] = None) -> List[Tuple[float, Any]]:
+        """The k items closest to (lat, lon), optionally limited to max_km, nearest first"""
+        if not self._items or k <= 0:
+            return []
+
+        # Grow the search circle geometrically until it holds k items; every item inside
+        # the circle is closer than every item outside it, so the first k are exact
+        radius_km = self.cell_deg * 111.0
+        while True:
+            if max_km is not None and radius_km >= max_km:
+                return self.query_radius(lat, lon, max_km)[:k]
+            hits = self.query_radius(lat, lon, radius_km)
+            if len(hits) >= k or len(hits) == len(self) or radius_km >= math.pi * EARTH_RADIUS_KM:
+                return hits[:k]
+            radius_km *= 2
+
+def build_grid_index(points: Iterable[Tuple[float, float, Any]], cell_deg: float = 0.05,
+                     full_scan_max: int = FULL_SCAN_MAX_POINTS) -> GridIndex:
+    """Build a GridIndex from (lat, lon, item) tuples"""
+    index = GridIndex(cell_deg, full_scan_max)
+    for lat, lon, item in points:
+        index.insert(lat, lon, item)
+    return index
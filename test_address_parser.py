@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+Test the single-pass address parser behind parse_address_components and every cache key
+Counties, 政令市 wards and names containing 市/町/村 must split correctly, and every spelling
+of an address must share one canonical key
+"""
+
+import sys
+import os
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from address_parser import ParsedAddress, address_key, normalize, parse_address
+from contact_search import CONTACT_DATABASE, parse_address_components
+from gazetteer import GAZETTEER
+from geocode_cache import normalize_address
+
+CASES = {
+    "東京都新宿区西新宿2-8-1": ("東京都", "", "新宿区", "", "西新宿", "2", "8", "1"),
+    "神奈川県横浜市中区山下町279": ("神奈川県", "", "横浜市", "中区", "山下町", "", "279", ""),
+    "神奈川県足柄上郡松田町松田惣領2037": ("神奈川県", "足柄上郡", "松田町", "", "松田惣領", "", "2037", ""),
+    "東京都西多摩郡奥多摩町氷川215-6": ("東京都", "西多摩郡", "奥多摩町", "", "氷川", "", "215", "6"),
+    # 市, 町 and 村 inside names
+    "千葉県市川市八幡1-1-1": ("千葉県", "", "市川市", "", "八幡", "1", "1", "1"),
+    "東京都町田市森野2-2-22": ("東京都", "", "町田市", "", "森野", "2", "2", "22"),
+    "東京都東村山市本町1-2-3": ("東京都", "", "東村山市", "", "本町", "1", "2", "3"),
+    "東京都武蔵村山市本町1-1-1": ("東京都", "", "武蔵村山市", "", "本町", "1", "1", "1"),
+    "広島県廿日市市下平良1丁目11番1号": ("広島県", "", "廿日市市", "", "下平良", "1", "11", "1"),
+    "奈良県大和郡山市北郡山町248-4": ("奈良県", "", "大和郡山市", "", "北郡山町", "", "248", "4"),
+    "富山県中新川郡上市町横法音寺40": ("富山県", "中新川郡", "上市町", "", "横法音寺", "", "40", ""),
+    "北海道余市郡余市町朝日町26": ("北海道", "余市郡", "余市町", "", "朝日町", "", "26", ""),
+    "奈良県高市郡明日香村岡55": ("奈良県", "高市郡", "明日香村", "", "岡", "", "55", ""),
+    "鹿児島県鹿児島市郡山町141": ("鹿児島県", "", "鹿児島市", "", "郡山町", "", "141", ""),
+    "山梨県北杜市須玉町大豆生田961-1": ("山梨県", "", "北杜市", "", "須玉町大豆生田", "", "961", "1"),
+    "埼玉県さいたま市浦和区高砂3-15-1": ("埼玉県", "", "さいたま市", "浦和区", "高砂", "3", "15", "1"),
+    # Kanji chome and 番地
+    "東京都港区六本木六丁目10番1号": ("東京都", "", "港区", "", "六本木", "6", "10", "1"),
+    "山梨県甲府市丸の内一丁目": ("山梨県", "", "甲府市", "", "丸の内", "1", "", ""),
+    "茨城県水戸市笠原町978番地6": ("茨城県", "", "水戸市", "", "笠原町", "", "978", "6"),
+    # Hokkaido 条 towns
+    "北海道札幌市中央区北1条西2丁目": ("北海道", "", "札幌市", "中央区", "北1条西", "2", "", ""),
+    "北海道札幌市中央区南1条西10丁目1-1": ("北海道", "", "札幌市", "中央区", "南1条西", "10", "1", "1"),
+    "北海道旭川市6条通9丁目": ("北海道", "", "旭川市", "", "6条通", "9", "", ""),
+}
+
+# Spellings that must share a cache key
+EQUIVALENT = [
+    ("東京都新宿区西新宿2-8-1", "東京都新宿区西新宿２丁目８番１号", "東京都 新宿区 西新宿２－８－１",
+     "東京都新宿区西新宿二丁目8番1号", "〒160-0023 東京都新宿区西新宿2ー8ー1", "東京都新宿区西新宿2‐8‐1"),
+    ("東京都奥多摩町氷川215-6", "東京都西多摩郡奥多摩町氷川２１５－６"),
+    ("神奈川県茅ヶ崎市茅ヶ崎1-1-1", "神奈川県茅ケ崎市茅ヶ崎１丁目１番１号"),
+]
+
+def test_address_parser():
+    """Parse known addresses part by part"""
+
+    print("🧪 Address Parser Test")
+    print("=" * 60)
+
+    for address, expected in CASES.items():
+        parsed = parse_address(address)
+        assert tuple(parsed)[:8] == expected, (address, parsed)
+    print(f"✅ {len(CASES)} addresses split into prefecture/county/city/ward/town/chome/block/number")
+
+    parsed = parse_address("〒160-0023 東京都新宿区西新宿2丁目8番1号 都庁第一本庁舎")
+    assert parsed.postal_code == "1600023" and parsed.rest == "都庁第一本庁舎"
+    assert parsed.canonical == "〒160-0023 東京都新宿区西新宿2-8-1都庁第一本庁舎"
+    assert parse_address("横浜市中区山下町279")[:4] == ("", "", "横浜市", "中区")
+    assert parse_address("どこでもない") == ParsedAddress("", "", "", "", "どこでもない", "", "", "")
+    print("✅ Postal code, building and partial addresses")
+
+    # Every municipality the app knows parses back to itself
+    for prefecture in set(GAZETTEER) | set(CONTACT_DATABASE):
+        names = set(GAZETTEER.get(prefecture, {})) | set(CONTACT_DATABASE.get(prefecture, {}))
+        for city in filter(None, names):
+            parsed = parse_address(f"{prefecture}{city}本町1-2-3")
+            assert (parsed.prefecture, parsed.city, parsed.town) == (prefecture, normalize(city), "本町"), (city, parsed)
+            assert parse_address_components(f"{prefecture}{city}本町1-2-3")[1] == city
+    print("✅ Every known city parses back to itself")
+
+def test_canonical_keys():
+    """Spelling variants share one key, which the geocode cache uses too"""
+
+    for variants in EQUIVALENT:
+        keys = {address_key(address) for address in variants}
+        assert keys == {variants[0]}, keys
+        assert {normalize_address(address) for address in variants} == keys
+    assert address_key("東京都新宿区西新宿2-8-1") != address_key("東京都新宿区西新宿2-8-2")
+    print("✅ Full-width digits, 丁目/番/号, dashes, ケ/ヶ and counties share one key")
+
+    assert parse_address_components("千葉県鎌ヶ谷市新鎌ヶ谷2-6-1")[1] == "鎌ケ谷市"
+    assert parse_address_components("神奈川県茅ケ崎市茅ヶ崎1-1-1")[1] == "茅ヶ崎市"
+    assert parse_address_components("神奈川県足柄上郡松田町松田惣領2037")[1] in CONTACT_DATABASE["神奈川県"]
+    print("✅ Components spelled as the contact database spells them")
+
+def test_parser_speed():
+    """Time an uncached parse (printed, not asserted)"""
+
+    addresses = [f"東京都新宿区西新宿{i % 9 + 1}丁目{i % 30 + 1}番{i % 7 + 1}号" for i in range(2000)]
+    addresses += [f"神奈川県足柄上郡松田町松田惣領{i}" for i in range(2000)]
+    parse = parse_address.__wrapped__  # bypass the memo
+    start = time.perf_counter()
+    for address in addresses:
+        parse(address)
+    per_address = (time.perf_counter() - start) / len(addresses) * 1e6
+    print(f"✅ {per_address:.1f} µs per address (uncached)")
+
+if __name__ == "__main__":
+    test_address_parser()
+    test_canonical_keys()
+    test_parser_speed()
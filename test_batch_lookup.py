@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+Test batch address lookup from CSV/XLSX input to the contacts workbook
+Rows must be processed chunk by chunk and match the app's search results for the same address
+"""
+
+import sys
+import os
+import csv
+import tempfile
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from openpyxl import Workbook, load_workbook
+
+import contact_search
+import geocode_cache
+from address_parser import parse_address
+from batch_lookup import ESTIMATED, GEOCODED, NOT_FOUND, batch_lookup as run_lookup, iter_address_chunks
+from contact_search import assemble_results, search_address
+
+SITES = [
+    ("甲府本社", "山梨県甲府市丸の内1-18-1", (35.6641, 138.5681)),
+    ("渋谷店", "東京都渋谷区道玄坂1-2-3", (35.6580, 139.6994)),
+    ("空行", "", None),
+    ("横浜倉庫", "神奈川県横浜市鶴見区豊岡町2-2", None),
+    ("札幌支店", "北海道札幌市中央区北1条西2丁目", None),
+    ("広島営業所", "広島県広島市中区基町10-52", (34.3963, 132.4596)),
+]
+
+def fake_gsi(address, timeout=10, use_cache=True, total_timeout=None):
+    """GSI stand-in: only sites with listed coordinates are found"""
+    for _, site_address, coords in SITES:
+        if site_address == address:
+            return coords
+    return None
+
+def test_batch_lookup():
+    """Run CSV and XLSX inputs through the batch pipeline with GSI stubbed"""
+
+    print("🧪 Batch Lookup Test")
+    print("=" * 60)
+
+    original = contact_search.gsi_address_search, geocode_cache._default_cache
+    contact_search.gsi_address_search = fake_gsi
+    try:
+        with tempfile.TemporaryDirectory() as tmp:
+            # Empty geocode cache, so the search chain asks the stubbed GSI
+            geocode_cache._default_cache = geocode_cache.GeocodeCache(os.path.join(tmp, "geocode_cache.sqlite"))
+            csv_input = os.path.join(tmp, "sites.csv")
+            with open(csv_input, "w", encoding="utf-8-sig", newline="") as f:
+                writer = csv.writer(f)
+                writer.writerow(["拠点名", "所在地"])
+                writer.writerows((name, address) for name, address, _ in SITES)
+
+            chunks = list(iter_address_chunks(csv_input, chunk_size=2))
+            assert [len(chunk) for chunk in chunks] == [2, 2, 1]
+            assert [row for chunk in chunks for row, _ in chunk] == [1, 2, 4, 5, 6], "blank rows skipped, numbering kept"
+            print("✅ CSV read in chunks with the address column detected")
+
+            progress = []
+            xlsx_output = os.path.join(tmp, "contacts.xlsx")
+            stats = run_lookup(csv_input, xlsx_output, chunk_size=2, progress=progress.append)
+            assert [p["rows"] for p in progress] == [2, 4, 5]
+            assert progress[-1]["total"] == 6 and progress[-1]["rows_per_second"] > 0
+            assert (stats[GEOCODED], stats[ESTIMATED], stats[NOT_FOUND]) == (3, 1, 1)
+            print(f"✅ Progress reported per chunk ({stats['rows_per_second']:.1f} rows/s)")
+
+            workbook = load_workbook(xlsx_output, read_only=True)
+            assert workbook.sheetnames == ["概要", "連絡先"]
+            summary = list(workbook["概要"].iter_rows(values_only=True))
+            contacts = list(workbook["連絡先"].iter_rows(values_only=True))
+            workbook.close()
+            assert summary[0][:2] == ("行", "入力住所") and len(summary) == 6
+            assert summary[1][5:8] == (35.6641, 138.5681, GEOCODED)
+            assert summary[4][7] == NOT_FOUND
+
+            # Each input's contact rows match the interactive search with the app's default options
+            for _, address, _ in SITES[:2]:
+                expected = assemble_results(search_address(parse_address(address).canonical)["contacts"])
+                rows = [r for r in contacts[1:] if r[1] == address]
+                assert [r[3] for r in rows] == list(expected["施設名"])
+            assert stats["contacts"] == len(contacts) - 1
+            print(f"✅ Workbook written: {len(summary) - 1} sites, {len(contacts) - 1} contacts")
+
+            # XLSX input, CSV output pair
+            xlsx_input = os.path.join(tmp, "sites.xlsx")
+            sheet_book = Workbook()
+            sheet_book.active.append(["住所", "拠点名"])
+            for name, address, _ in SITES:
+                sheet_book.active.append([address or None, name])
+            sheet_book.save(xlsx_input)
+
+            csv_output = os.path.join(tmp, "contacts.csv")
+            stats = run_lookup(xlsx_input, csv_output, chunk_size=4)
+            with open(os.path.join(tmp, "contacts_summary.csv"), encoding="utf-8-sig") as f:
+                summary_rows = list(csv.reader(f))
+            with open(csv_output, encoding="utf-8-sig") as f:
+                contact_rows = list(csv.reader(f))
+            assert len(summary_rows) == 6 and stats["rows"] == 5
+            assert len(contact_rows) - 1 == stats["contacts"]
+            print("✅ XLSX input and CSV output pair")
+    finally:
+        contact_search.gsi_address_search, geocode_cache._default_cache = original
+
+if __name__ == "__main__":
+    test_batch_lookup()
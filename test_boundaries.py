@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+"""
+Test the local reverse geocoder: boundary polygons (holes and multi-part municipalities included)
+map a point to its prefecture, city and ward without any network call, in well under a millisecond
+"""
+
+import sys
+import os
+import math
+import random
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import boundaries
+import contact_search
+import geocode_cache
+from boundaries import (BOUNDARIES_VERSION, Jurisdiction, PolygonIndex, build_boundary_index, load_boundary_index,
+                        read_features)
+from fixture_files import feature, square, write_geojson
+from geocoder import ADDRESS
+
+def n03(prefecture, upper, municipality, code, geometry_type, coordinates):
+    """One feature with 国土数値情報 N03 attributes"""
+    properties = {"N03_001": prefecture, "N03_002": None, "N03_003": upper, "N03_004": municipality, "N03_007": code}
+    return feature(properties, geometry_type, coordinates)
+
+FEATURES = [
+    n03("東京都", None, "新宿区", "13104", "Polygon", [square(139.67, 35.68, 139.73, 35.72)]),
+    # 中区 with a hole, and 南区 filling the hole (an enclave)
+    n03("神奈川県", "横浜市", "中区", "14104", "Polygon",
+        [square(139.60, 35.40, 139.70, 35.46), square(139.62, 35.42, 139.64, 35.44)]),
+    n03("神奈川県", "横浜市", "南区", "14105", "Polygon", [square(139.62, 35.42, 139.64, 35.44)]),
+    # A county town in two parts
+    n03("東京都", "西多摩郡", "奥多摩町", "13308", "MultiPolygon",
+        [[square(139.00, 35.78, 139.10, 35.85)], [square(139.20, 35.78, 139.22, 35.80)]]),
+    n03("千葉県", None, "鎌ケ谷市", "12224", "Polygon", [square(140.00, 35.76, 140.04, 35.80)]),
+    n03("東京都", None, "所属未定地", None, "Polygon", [square(139.80, 35.60, 139.82, 35.62)]),
+]
+
+def ray_cast(rings, lat, lon):
+    """Reference even-odd test, one edge at a time"""
+    inside = False
+    for ring in rings:
+        for (x1, y1), (x2, y2) in zip(ring, ring[1:]):
+            if (y1 > lat) != (y2 > lat) and lon < x1 + (lat - y1) * (x2 - x1) / (y2 - y1):
+                inside = not inside
+    return inside
+
+def star(lon, lat, radius, points, rng):
+    """Closed concave ring around a center"""
+    ring = []
+    for i in range(points):
+        angle = 2 * math.pi * i / points
+        r = radius * (0.4 + 0.6 * rng.random())
+        ring.append([lon + r * math.cos(angle), lat + r * math.sin(angle)])
+    return ring + ring[:1]
+
+def test_reverse_geocoding():
+    """N03 GeoJSON → saved index → jurisdictions"""
+
+    print("🧪 Reverse Geocoding Test")
+    print("=" * 60)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        source = write_geojson(tmp, FEATURES, "N03-test.geojson")
+        assert len(list(read_features(source))) == len(FEATURES)
+        polygons = build_boundary_index([source])
+        assert len(polygons) == 6 and len(polygons.payloads) == 5, "unassigned land skipped"
+
+        path = os.path.join(tmp, "boundaries.npz")
+        polygons.save(path, "test", BOUNDARIES_VERSION)
+        index = load_boundary_index(path)
+        assert len(index) == 6
+
+        assert index.reverse_geocode(35.69, 139.70) == Jurisdiction("東京都", "", "新宿区", "", "13104")
+        assert index.reverse_geocode(35.45, 139.61) == Jurisdiction("神奈川県", "", "横浜市", "中区", "14104")
+        assert index.reverse_geocode(35.43, 139.63).ward == "南区", "a point in the hole belongs to the enclave"
+        assert index.reverse_geocode(35.79, 139.21) == Jurisdiction("東京都", "西多摩郡", "奥多摩町", "", "13308")
+        assert index.reverse_geocode(35.80, 139.05).city == "奥多摩町"
+        assert index.reverse_geocode(35.61, 139.81) is None
+        assert index.reverse_geocode(35.75, 139.50) is None
+        print("✅ Wards, enclaves in holes, multi-part towns and counties")
+
+        assert load_boundary_index(os.path.join(tmp, "missing.npz")).reverse_geocode(35.69, 139.70) is None
+        polygons.save(path, "test", BOUNDARIES_VERSION + 1)
+        assert len(load_boundary_index(path)) == 0, "an index from another version is ignored"
+        print("✅ Missing or outdated index: no jurisdiction")
+
+def test_point_in_polygon():
+    """Grid-indexed lookups agree with a plain ray cast on concave polygons"""
+
+    rng = random.Random(7)
+    shapes = [(star(139.0 + 0.1 * i, 35.0 + 0.1 * j, 0.05, 40, rng), (i, j)) for i in range(5) for j in range(5)]
+    index = PolygonIndex.from_polygons(([ring], payload) for ring, payload in shapes)
+    for _ in range(3000):
+        lat, lon = 34.9 + 0.5 * rng.random(), 138.9 + 0.5 * rng.random()
+        expected = next((payload for ring, payload in shapes if ray_cast([ring], lat, lon)), None)
+        assert index.locate(lat, lon) == expected, (lat, lon)
+    print("✅ 3000 random points agree with the reference ray cast")
+
+def test_lookup_speed():
+    """Lookup time over municipality-sized polygons with thousands of vertices (printed, not asserted)"""
+
+    rng = random.Random(11)
+    shapes = [([star(138.0 + 0.08 * i, 34.0 + 0.08 * j, 0.05, 2000, rng)], (i, j)) for i in range(30) for j in range(30)]
+    index = PolygonIndex.from_polygons(shapes)
+    points = [(34.0 + 2.4 * rng.random(), 138.0 + 2.4 * rng.random()) for _ in range(5000)]
+    start = time.perf_counter()
+    found = sum(index.locate(lat, lon) is not None for lat, lon in points)
+    per_lookup = (time.perf_counter() - start) / len(points) * 1e6
+    assert found
+    print(f"✅ {per_lookup:.0f} µs per lookup over {len(index)} polygons of 2000 vertices")
+
+def test_app_jurisdiction():
+    """The app takes the jurisdiction from the polygons for GPS points and geocoded addresses"""
+
+    with tempfile.TemporaryDirectory() as tmp:
+        index = boundaries.BoundaryIndex(build_boundary_index([write_geojson(tmp, FEATURES)]))
+        original = boundaries._default_index, contact_search.gsi_address_search, geocode_cache._default_cache
+        boundaries._default_index = index
+        # Empty geocode cache, so GSI (stubbed: a point inside the 南区 enclave) answers the search
+        geocode_cache._default_cache = geocode_cache.GeocodeCache(os.path.join(tmp, "geocode_cache.sqlite"))
+        contact_search.gsi_address_search = lambda address, timeout=10, use_cache=True, total_timeout=None: (35.43, 139.63)
+        try:
+            assert contact_search.jurisdiction_at(35.78, 140.02) == ("千葉県", "鎌ケ谷市", ""), "spelled as the database spells it"
+            assert contact_search.jurisdiction_at(35.45, 139.61) == ("神奈川県", "横浜市", "中区")
+
+            result = contact_search.search_coordinates(35.69, 139.70)
+            assert result["components"] == ("東京都", "新宿区", "") and result["contacts"]["警察署"]
+            assert result["geocode"].precision == ADDRESS and result["geocode"].source == "coordinates"
+
+            result = contact_search.search_address("神奈川県横浜市中区山下町1-1-1")
+            assert result["components"] == ("神奈川県", "横浜市", "南区"), "the polygon outranks the typed ward"
+            print("✅ GPS points and geocoded addresses take the polygon's jurisdiction")
+
+            # Outside the polygons the gazetteer's nearest city/ward stands in
+            boundaries._default_index = boundaries.BoundaryIndex()
+            assert contact_search.jurisdiction_at(35.4436, 139.638) == ("神奈川県", "横浜市", "中区")
+            assert contact_search.jurisdiction_at(0.0, 0.0) is None
+            assert contact_search.parse_coordinates("35.6641, 138.5681") == (35.6641, 138.5681)
+            assert contact_search.parse_coordinates("35.6641 138.5681") == (35.6641, 138.5681)
+            assert contact_search.parse_coordinates("甲府市") is None and contact_search.parse_coordinates("95, 10") is None
+            print("✅ Without boundaries the nearest gazetteer city/ward is used")
+        finally:
+            boundaries._default_index, contact_search.gsi_address_search, geocode_cache._default_cache = original
+
+if __name__ == "__main__":
+    test_reverse_geocoding()
+    test_point_in_polygon()
+    test_lookup_speed()
+    test_app_jurisdiction()
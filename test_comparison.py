@@ -13,7 +13,7 @@ print(f"=== Testing proximity search for: {test_address} ===\n")
 test_coords = (35.8012, 139.7906)
 
 # Import and test
-from app import get_comprehensive_contacts, parse_address_components
+from contact_search import get_comprehensive_contacts, parse_address_components
 
 pref, city_name, district_name = parse_address_components(test_address)
 print(f"Parsed address: {pref} / {city_name} / {district_name}")
@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+"""
+Test the single-pass contact selection against the progressive radius search it replaced
+Selections must be identical, including ties, zero distances and unmapped same-city contacts
+"""
+
+import sys
+import os
+import copy
+import random
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from contact_search import (CONTACT_DATABASE, SEARCH_RADII, ContactHit, Facility, find_nearest_facilities,
+                 get_comprehensive_contacts, get_facility_coordinates, get_prefecture_facilities,
+                 get_prefecture_partitions, radius_tier, select_nearest_contacts)
+
+def progressive_selection(nearby, unmapped, city_name, district_name, target_count):
+    """The original loop: rescan and re-sort every candidate at each radius"""
+    selected = []
+    for radius_km in SEARCH_RADII:
+        within_radius = []
+        for distance_km, facility in nearby:
+            if distance_km > radius_km:
+                break
+            priority_score = 0
+            if facility.city == city_name:
+                priority_score += 100
+                if facility.district == district_name:
+                    priority_score += 50
+            priority_score += max(0, int((radius_km - distance_km) * 10))
+            within_radius.append((distance_km, priority_score, facility))
+        for facility in unmapped:
+            if facility.city == city_name:
+                priority_score = 25
+                if facility.district == district_name:
+                    priority_score += 15
+                within_radius.append((None, priority_score, facility))
+        within_radius.sort(key=lambda x: (x[0] or 999, -x[1], x[2].facility_id))
+        selected = within_radius[:target_count]
+        if len(selected) >= target_count:
+            break
+    return [(distance_km, facility.facility_id) for distance_km, _, facility in selected]
+
+def random_candidates(rng):
+    """Facilities in three cities, with coarse distances so ties and 0.0 km are common"""
+    cities = ["甲府市", "甲斐市", "笛吹市"]
+    districts = ["", "丸の内"]
+    entries = [Facility(seq, "山梨県", "警察署", {"name": f"施設{seq}"}, rng.choice(cities), rng.choice(districts))
+               for seq in range(rng.randint(0, 40))]
+    rng.shuffle(entries)
+    split = rng.randint(0, len(entries))
+    step = rng.choice([0.1, 0.5, 2.0])
+    nearby = sorted(((round(rng.randint(0, 40) * step, 1), entry) for entry in entries[:split]),
+                    key=lambda hit: (hit[0], hit[1].facility_id))
+    unmapped = sorted(entries[split:])
+    return nearby, unmapped, rng.choice(cities), rng.choice(districts)
+
+def test_contact_selection():
+    """Randomized comparison with the progressive search, plus the reported radius tiers"""
+
+    print("🧪 Contact Selection Test")
+    print("=" * 60)
+
+    assert [radius_tier(d) for d in (None, 0.0, 1.0, 1.1, 5.5, 17.0, 17.1)] == [None, 1, 1, 2, 7, 17, None]
+
+    rng = random.Random(15)
+    for _ in range(5000):
+        nearby, unmapped, city, district = random_candidates(rng)
+        target_count = rng.choice([1, 2, 3])
+        selected = select_nearest_contacts(nearby, unmapped, city, district, target_count)
+        expected = progressive_selection(nearby, unmapped, city, district, target_count)
+        assert selected == [ContactHit(facility_id, d, radius_tier(d), "山梨県") for d, facility_id in expected]
+        assert all(hit.distance_km is None or hit.distance_km <= hit.tier for hit in selected)
+    print("✅ Identical to the progressive radius search on 5000 random candidate sets")
+
+    # Candidates that only appear at the outer radii: the progressive search rescans them all
+    # at every step, the single pass sees each once
+    entries = [Facility(seq, "山梨県", "警察署", {"name": f"施設{seq}"}, "甲府市", "") for seq in range(2000)]
+    nearby = [(round(16 + seq / 2000, 1), entry) for seq, entry in enumerate(entries)]
+    timings = []
+    for select in (progressive_selection, select_nearest_contacts):
+        start = time.perf_counter()
+        for _ in range(20):
+            select(nearby, [], "甲斐市", "", 3)
+        timings.append((time.perf_counter() - start) * 1000 / 20)
+    print(f"✅ 2000 distant candidates, 3 picks: {timings[1]:.2f} ms (progressive search: {timings[0]:.2f} ms)")
+
+def test_shared_records():
+    """Queries read the shared facility records without changing them, from any thread"""
+    before = copy.deepcopy(CONTACT_DATABASE["山梨県"])
+    facilities = get_prefecture_facilities("山梨県")
+    assert facilities is get_prefecture_facilities("山梨県")
+    assert all(facility.facility_id == i for i, facility in enumerate(facilities))
+    try:
+        facilities[0].contact["name"] = "上書き"
+        raise AssertionError("facility records must be read-only")
+    except TypeError:
+        pass
+
+    # Category partitions: every facility once, in database order, with its coordinates
+    partitions = get_prefecture_partitions("山梨県")
+    for contact_type, partition in partitions.items():
+        ids = sorted(partition.facility_ids.tolist() + partition.unmapped_ids.tolist())
+        assert ids == [f.facility_id for f in facilities if f.category == contact_type]
+        assert partition.facility_ids.tolist() == sorted(partition.facility_ids.tolist())
+        for facility_id, lat, lon in zip(partition.facility_ids.tolist(), partition.lats.tolist(), partition.lons.tolist()):
+            assert get_facility_coordinates(facilities[facility_id].contact["address"], "山梨県") == (lat, lon)
+    assert partitions is get_prefecture_partitions("山梨県")
+
+    rng = random.Random(16)
+    queries = [("甲府市", "", (rng.uniform(35.5, 35.8), rng.uniform(138.4, 138.7))) for _ in range(200)]
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        results = list(pool.map(lambda q: get_comprehensive_contacts(q[0], q[1], "山梨県", q[2]), queries))
+    for (city, district, coords), contacts in zip(queries, results):
+        hits = find_nearest_facilities("山梨県", city, district, coords)
+        assert contacts == {
+            contact_type: [{**facilities[hit.facility_id].contact, "distance_km": hit.distance_km} for hit in category_hits]
+            for contact_type, category_hits in hits.items()
+        }
+    assert CONTACT_DATABASE["山梨県"] == before
+    print("✅ Concurrent searches leave the shared records untouched")
+
+def test_cross_prefecture():
+    """Searches near a border reach the neighbouring prefecture through the national index"""
+    # Same-named cities in different prefectures are not "the same city"
+    fuchu_tokyo = Facility(0, "東京都", "警察署", {"name": "府中警察署"}, "府中市", "")
+    fuchu_hiroshima = Facility(0, "広島県", "警察署", {"name": "府中警察署"}, "府中市", "")
+    selected = select_nearest_contacts([(2.0, fuchu_hiroshima), (2.0, fuchu_tokyo)], [], "府中市", "", 1, "東京都")
+    assert selected == [ContactHit(0, 2.0, 2, "東京都")]
+
+    # 和光市 (埼玉県) sits on the 東京都 border: the nearest police stations are in 練馬区
+    coords = (35.7812, 139.6057)
+    local = get_comprehensive_contacts("和光市", "", "埼玉県", coords)
+    nationwide = get_comprehensive_contacts("和光市", "", "埼玉県", coords, cross_prefecture=True)
+    for contact_type, contacts in nationwide.items():
+        if local[contact_type] and contacts and local[contact_type][0]["distance_km"] is not None:
+            assert contacts[0]["distance_km"] <= local[contact_type][0]["distance_km"], contact_type
+    assert nationwide["警察署"][0]["distance_km"] < local["警察署"][0]["distance_km"]
+    assert "練馬区" in nationwide["警察署"][0]["address"]
+
+    # Preferring the home prefecture gives the local answer whenever it is complete
+    preferred = get_comprehensive_contacts("和光市", "", "埼玉県", coords, cross_prefecture=True, prefer_same_prefecture=True)
+    for contact_type, contacts in preferred.items():
+        assert contacts[:len(local[contact_type])] == local[contact_type], contact_type
+
+    # Outside the database, coordinates still find facilities across the border (熱海市泉, next to 湯河原町)
+    assert not get_comprehensive_contacts("熱海市", "", "静岡県", (35.152, 139.100))["消防署"]
+    hits = find_nearest_facilities("静岡県", "熱海市", "", (35.152, 139.100), cross_prefecture=True)
+    assert all(hit.prefecture == "神奈川県" for hit in hits["消防署"]) and hits["消防署"]
+    print("✅ Border searches cross prefectures; the home prefecture can still be preferred")
+
+if __name__ == "__main__":
+    test_contact_selection()
+    test_shared_records()
+    test_cross_prefecture()
@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+"""
+Test the compiled contact store
+The store must reproduce CONTACT_DATABASE exactly, load prefectures lazily,
+recompile itself when contact_data.py changes and merge duplicated blocks
+"""
+
+import sys
+import os
+import shutil
+import tempfile
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from contact_store import CONTACT_SOURCE_PATH, ContactStore, is_store_current, load_contact_source, parse_contact_source
+
+def as_lists(pref_data):
+    """Store records carry services as tuples; convert back for comparison with the source"""
+    return {
+        city: {
+            district: {
+                category: [{**c, "services": list(c["services"])} if "services" in c else c for c in contacts]
+                for category, contacts in district_data.items()
+            }
+            for district, district_data in city_data.items()
+        }
+        for city, city_data in pref_data.items()
+    }
+
+def test_contact_store():
+    """Compile into a temp dir and compare against the source dict"""
+
+    print("🧪 Compiled Contact Store Test")
+    print("=" * 60)
+
+    source = load_contact_source()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        source_path = os.path.join(tmp, "contact_data.py")
+        store_path = os.path.join(tmp, "contacts.sqlite")
+        shutil.copy(CONTACT_SOURCE_PATH, source_path)
+
+        store = ContactStore(store_path, source_path)
+        assert list(store) == list(source), "prefecture order should match the source"
+        assert store.loaded_prefectures() == [], "no prefecture should be loaded before access"
+        print(f"✅ Compiled {len(store)} prefectures, none loaded yet")
+
+        assert "北海道" not in store
+        assert store["山梨県"] is store["山梨県"]
+        assert store.loaded_prefectures() == ["山梨県"]
+        print("✅ Prefectures are loaded lazily and cached")
+
+        for prefecture in source:
+            assert as_lists(store[prefecture]) == source[prefecture], f"{prefecture} differs from source"
+        print("✅ Every prefecture matches contact_data.py exactly")
+
+        # Repeated records are stored once and shared by every district that lists them
+        kanagawa = store["神奈川県"]
+        ntt_tsurumi = kanagawa["横浜市"]["鶴見区"]["NTT"][0]
+        ntt_atsugi = kanagawa["厚木市"][""]["NTT"][0]
+        assert ntt_tsurumi is ntt_atsugi
+        assert isinstance(ntt_tsurumi["services"], tuple)
+        assert kanagawa["横浜市"]["鶴見区"]["警察署"][0]["services"] is kanagawa["厚木市"][""]["警察署"][0]["services"]
+        print("✅ Shared facilities and service tuples are deduplicated")
+
+        # Editing the source invalidates the compiled store
+        assert is_store_current(store_path, source_path)
+        with open(source_path, "a", encoding="utf-8") as f:
+            f.write("\n# edited\n")
+        assert not is_store_current(store_path, source_path)
+        assert as_lists(ContactStore(store_path, source_path)["山梨県"]) == source["山梨県"]
+        assert is_store_current(store_path, source_path)
+        print("✅ Stale store is recompiled after a source edit")
+
+        # An unwritable store location (sqlite3 cannot even open the file) compiles to a temp store
+        readonly = ContactStore("/proc/contacts.sqlite", source_path)
+        assert as_lists(readonly["山梨県"]) == source["山梨県"]
+        assert readonly.store_path != "/proc/contacts.sqlite"
+        print("✅ Unwritable store path falls back to a temp store")
+
+DUPLICATED_SOURCE = """
+CONTACT_DATABASE = {
+    "千葉県": {
+        "千葉市": {"中央区": {"警察署": [
+            {"name": "A警察署", "phone": "1", "address": "千葉市中央区1"},
+            {"name": "B警察署", "phone": "2", "address": "千葉市中央区2"},
+        ]}},
+    },
+    "東京都": {"港区": {"": {"病院": [{"name": "港病院", "phone": "3"}]}}},
+    "千葉県": {
+        "千葉市": {"中央区": {"警察署": [
+            {"name": "B警察署", "phone": "2", "address": "千葉市中央区2"},
+            {"name": "A警察署", "phone": "9", "address": "千葉市中央区1"},
+            {"name": "C警察署", "phone": "4", "address": "千葉市中央区3"},
+        ]}},
+        "船橋市": {"": {"病院": [{"name": "船橋病院", "phone": "5"}]}},
+    },
+}
+"""
+
+def test_duplicate_prefecture_merge():
+    """Duplicate prefecture blocks are merged instead of silently dropped"""
+
+    with tempfile.TemporaryDirectory() as tmp:
+        source_path = os.path.join(tmp, "contact_data.py")
+        with open(source_path, "w", encoding="utf-8") as f:
+            f.write(DUPLICATED_SOURCE)
+
+        database, report = parse_contact_source(source_path)
+        assert list(database) == ["千葉県", "東京都"]
+        assert list(database["千葉県"]) == ["千葉市", "船橋市"]
+
+        police = database["千葉県"]["千葉市"]["中央区"]["警察署"]
+        assert [p["name"] for p in police] == ["A警察署", "B警察署", "C警察署"]
+        assert police[0]["phone"] == "9", "later definition wins on conflict"
+
+        assert [d["path"] for d in report["duplicate_keys"]] == [["千葉県"]]
+        assert report["identical_dropped"] == 1
+        assert [(c["name"], c["fields"]) for c in report["conflicts"]] == [("A警察署", ["phone"])]
+
+        store = ContactStore(os.path.join(tmp, "contacts.sqlite"), source_path)
+        assert as_lists(store["千葉県"]) == database["千葉県"]
+    print("✅ Duplicate blocks merged deterministically with conflicts reported")
+
+    # The real source defines 千葉県 and 茨城県 twice; both blocks must be reachable
+    database, report = parse_contact_source()
+    assert sorted(d["path"][0] for d in report["duplicate_keys"]) == ["千葉県", "茨城県"]
+    assert "浦安市" in database["千葉県"] and "館山市" in database["千葉県"]
+    print(f"✅ Real data: {report['identical_dropped']} identical facilities dropped, {len(report['conflicts'])} conflicts")
+
+if __name__ == "__main__":
+    test_contact_store()
+    test_duplicate_prefecture_merge()
@@ -6,7 +6,7 @@ import sys
 import os
 sys.path.append(os.path.dirname(__file__))
 
-from app import parse_address_components, get_comprehensive_contacts, CONTACT_DATABASE
+from contact_search import parse_address_components, get_comprehensive_contacts, CONTACT_DATABASE
 
 # Test the problematic address
 test_address = "東京都中央区築地3-1005-15"
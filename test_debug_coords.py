@@ -6,10 +6,10 @@ Debug script to check coordinate estimation for police station addresses
 import sys
 import os
 
-# Add the parent directory to sys.path to import from app.py
+# Add the parent directory to sys.path to import from contact_search.py
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
-from app import estimate_coordinates_from_address
+from contact_search import estimate_coordinates_from_address
 
 def debug_coordinates():
     """Debug coordinate estimation for police stations"""
@@ -6,10 +6,10 @@ Debug script with detailed output to trace the contact selection process
 import sys
 import os
 
-# Add the parent directory to sys.path to import from app.py
+# Add the parent directory to sys.path to import from contact_search.py
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
-from app import parse_address_components, estimate_coordinates_from_address, calculate_distance
+from contact_search import parse_address_components, estimate_coordinates_from_address, calculate_distance
 
 def debug_contact_selection():
     """Debug the contact selection process step by step"""
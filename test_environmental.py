@@ -6,10 +6,10 @@ Test script to verify environmental department contacts are included in 市区
 import sys
 import os
 
-# Add the parent directory to sys.path to import from app.py
+# Add the parent directory to sys.path to import from contact_search.py
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
-from app import parse_address_components, estimate_coordinates_from_address, get_comprehensive_contacts
+from contact_search import parse_address_components, estimate_coordinates_from_address, get_comprehensive_contacts
 
 def test_environmental_departments():
     """Test that environmental departments are included in city hall contacts"""
@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+Test the precomputed facility coordinate sidecar
+Verifies that sidecar addresses never trigger geocoding and that the offline build works
+"""
+
+import sys
+import os
+import json
+import tempfile
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import contact_search
+from build_facility_coordinates import build_facility_coordinates, iter_facility_addresses
+
+def test_facility_coordinates():
+    """Test sidecar loading, lookup and offline rebuild"""
+
+    print("🧪 Facility Coordinate Sidecar Test")
+    print("=" * 60)
+
+    table = contact_search.load_facility_coordinates()
+    print(f"Sidecar entries: {len(table)}")
+    assert table, "facility_coordinates.json should be present and readable"
+
+    # The shipped sidecar comes from an online build: an offline one leaves addresses unmapped
+    _, unresolved = contact_search.read_facility_sidecar()
+    assert not unresolved, (f"{len(unresolved)} shipped addresses unresolved (e.g. {unresolved[:3]}); "
+                            "rebuild with network access: python build_facility_coordinates.py")
+
+    # Every sidecar hit must be served without touching the estimator / GSI
+    original_estimate = contact_search.estimate_coordinates_from_address
+    def fail_estimate(address, allow_remote=True, prefecture=None):
+        raise AssertionError(f"unexpected geocoding for {address}")
+    contact_search.estimate_coordinates_from_address = fail_estimate
+    try:
+        for address, coords in list(table.items())[:50]:
+            assert contact_search.get_facility_coordinates(address) == coords
+        print("✅ Sidecar addresses resolved without geocoding")
+    finally:
+        contact_search.estimate_coordinates_from_address = original_estimate
+
+    # The shipped sidecar covers every facility, so building the indexes never asks GSI
+    addresses = [address for address, _ in iter_facility_addresses()]
+    assert all(address in table for address in addresses), "sidecar covers every facility address"
+    original_gsi = contact_search.gsi_address_search
+    requests = []
+    contact_search.gsi_address_search = lambda address, *args, **kwargs: requests.append(address)
+    try:
+        for prefecture in contact_search.CONTACT_DATABASE:
+            contact_search.build_prefecture_partitions(prefecture)
+        # A facility missing from the sidecar is placed locally or left unmapped
+        assert contact_search.get_facility_coordinates("どこかの市どこかの町1-2-3", "神奈川県") is None
+    finally:
+        contact_search.gsi_address_search = original_gsi
+    assert requests == [], requests[:5]
+    print(f"✅ Every prefecture's partitions built without GSI ({sum(v is None for v in table.values())} unmapped)")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        # Unknown format versions are ignored rather than trusted
+        stale_path = os.path.join(tmp, "stale.json")
+        with open(stale_path, "w", encoding="utf-8") as f:
+            json.dump({"version": -1, "coordinates": {"甲府市丸の内1-1-18": [0, 0]}}, f)
+        assert contact_search.load_facility_coordinates(stale_path) == {}
+        assert contact_search.load_facility_coordinates(os.path.join(tmp, "missing.json")) == {}
+        print("✅ Stale or missing sidecars fall back to local estimation")
+
+        # Offline build records locally resolved addresses and lists the rest as unresolved
+        out_path = os.path.join(tmp, "coords.json")
+        stats = build_facility_coordinates(out_path, offline=True)
+        coordinates, unresolved = contact_search.read_facility_sidecar(out_path)
+        print(f"Offline build: {stats}")
+        assert stats["local"] == len(coordinates) and stats["unreachable"] == len(unresolved)
+        assert len(contact_search.load_facility_coordinates(out_path)) == len(addresses)
+        assert all(coords is not None for coords in coordinates.values())
+
+        # Second build reuses every resolved entry and retries the unresolved ones
+        stats = build_facility_coordinates(out_path, offline=True)
+        assert stats["cached"] == len(coordinates) and stats["local"] == 0
+        assert stats["unreachable"] == len(unresolved)
+        print("✅ Incremental rebuild reuses existing entries")
+
+if __name__ == "__main__":
+    test_facility_coordinates()
@@ -5,7 +5,7 @@ import sys
 import os
 sys.path.append(os.path.dirname(__file__))
 
-from app import parse_address_components, get_comprehensive_contacts, geocode_gsi, assemble_results
+from contact_search import parse_address_components, get_comprehensive_contacts, assemble_results
 
 # Test different variations of the problematic address
 test_addresses = [
@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+"""
+Test the hierarchical gazetteer used by estimate_coordinates_from_address
+The single-pass automaton must find exactly the names a substring scan would find,
+and ambiguous ward/city names must resolve within their own prefecture and city
+"""
+
+import sys
+import os
+import random
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from gazetteer import GAZETTEER, NGramIndex, PlaceNameMatcher, bigrams, get_gazetteer, match_coordinates, prefix_edits
+from contact_search import estimate_coordinates_from_address, parse_address_components
+
+def coords_of(*path):
+    """Coordinates stored in GAZETTEER for a place path"""
+    node = GAZETTEER
+    for name in path:
+        node = node[name]
+    return node[""] if isinstance(node, dict) else node
+
+def test_place_name_matcher():
+    """Compare PlaceNameMatcher.find_all with a brute-force substring scan"""
+
+    print("🧪 Place Name Matcher Test")
+    print("=" * 60)
+
+    # Overlapping names exercise the failure links
+    names = ["中央", "中央区", "央区", "区", "鶴見", "鶴見区鶴見中央", "見区鶴"]
+    matcher = PlaceNameMatcher(names)
+    text = "横浜市鶴見区鶴見中央3-20-1 中央区"
+    assert matcher.find_all(text) == [i for i, name in enumerate(names) if name in text]
+
+    rng = random.Random(3)
+    map_names = sorted({city for cities in GAZETTEER.values() for city in cities if city})
+    full_matcher = PlaceNameMatcher(map_names)
+    for _ in range(2000):
+        text = "".join(rng.sample(map_names, rng.randint(1, 3))) + f"{rng.randint(1, 9)}-{rng.randint(1, 30)}"
+        text = text[rng.randint(0, 2):]
+        assert full_matcher.find_all(text) == [i for i, name in enumerate(map_names) if name in text]
+        # Earliest name, longest at that start, as a text.find scan over every name picks it
+        starts = [(text.find(name, 1), -len(name), i) for i, name in enumerate(map_names) if text.find(name, 1) >= 0]
+        first = min(starts, default=None)
+        assert full_matcher.find_first(text, 1) == (first and (first[2], first[0], first[0] - first[1]))
+    print("✅ Automaton matches a substring scan on 2000 random addresses")
+
+    # Most specific level wins over broader matches
+    gazetteer = get_gazetteer()
+    assert gazetteer.find_place("横浜市鶴見区豊岡町2-2").path == ("神奈川県", "横浜市", "鶴見区", "豊岡町")
+    assert gazetteer.find_place("東京都練馬区石神井町2-15-13").path == ("東京都", "練馬区", "石神井町", "2-15-13")
+    assert gazetteer.find_place("甲府市丸の内1-1-18").path == ("山梨県", "甲府市")
+    assert gazetteer.find_place("広島県安芸郡熊野町中溝1-1-1").path[:2] == ("広島県", "熊野町"), "county skipped"
+    assert match_coordinates("北海道札幌市") is None
+    assert match_coordinates("北海道札幌市中央区北1条西2丁目") is None, "uncovered prefecture must not match 東京都中央区"
+    assert match_coordinates("札幌市中央区北1条西2丁目", prefecture="北海道") is None
+    assert estimate_coordinates_from_address("北海道札幌市", allow_remote=False) is None
+    print("✅ Most specific place name is returned")
+
+    # The same ward name resolves under its own city
+    tokyo = match_coordinates("東京都中央区日本橋兜町15-1")
+    chiba = match_coordinates("千葉市中央区中央4-5-1")
+    saitama = match_coordinates("さいたま市中央区下落合5-7-10")
+    assert len({tokyo, chiba, saitama}) == 3
+    assert tokyo == coords_of("東京都", "中央区")
+    assert chiba == coords_of("千葉県", "千葉市", "中央区")
+    assert match_coordinates("千葉市中央区中央4-5-1", prefecture="千葉県") == chiba
+
+    # A prefecture hint keeps out same-named places elsewhere
+    assert match_coordinates("府中市府川13") == coords_of("広島県", "府中市")
+    assert match_coordinates("府中市宮西町2-24", prefecture="東京都") is None
+    assert match_coordinates("東大和市仲原3-18-1", prefecture="東京都") != coords_of("神奈川県", "大和市")
+    print("✅ Ambiguous ward and city names resolve within their prefecture")
+
+    start = time.perf_counter()
+    for _ in range(10000):
+        match_coordinates("神奈川県横浜市鶴見区鶴見中央3-20-1")
+    print(f"Average lookup: {(time.perf_counter() - start) * 100:.2f} µs")
+
+def test_fuzzy_matching():
+    """Typos and variant spellings resolve locally through the bigram index"""
+
+    print("🧪 Fuzzy Place Matching Test")
+    print("=" * 60)
+
+    # The inverted index scores exactly like a scan over every name
+    names = ["渋谷区神宮前", "渋谷区", "新宿区西新宿", "横浜市中区", "横浜市中区山下町", "中央区"]
+    index = NGramIndex(names)
+    for text in ["渋谷区神宮全", "横浜市中区山下丁", "新宿区西新", "まったく別"]:
+        query = bigrams(text)
+        scored = [(2 * len(query & bigrams(name)) - len(bigrams(name)), i) for i, name in enumerate(names)
+                  if len(query & bigrams(name)) >= 0.6 * len(bigrams(name))]
+        expected = max(scored)[1] if scored and [s for s, _ in scored].count(max(scored)[0]) == 1 else None
+        assert index.best(text, 0.6) == expected, text
+
+    gazetteer = get_gazetteer()
+    assert gazetteer.fuzzy_place("東京都渋谷区神宮全1-1").path == ("東京都", "渋谷区", "神宮前")
+    assert gazetteer.fuzzy_place("東京都渋屋区神宮前1-1").path == ("東京都", "渋谷区", "神宮前")
+    assert gazetteer.fuzzy_place("茨城県竜ヶ崎市3710").path == ("茨城県", "龍ケ崎市")
+    assert gazetteer.fuzzy_place("横浜市保土ヶ谷区川辺町2-9").path == ("神奈川県", "横浜市", "保土ケ谷区")
+    assert gazetteer.fuzzy_place("北海道札幌市中央区") is None
+    assert gazetteer.fuzzy_place("千葉市中央区中英4-5-1", prefecture="千葉県").path == ("千葉県", "千葉市", "中央区")
+    assert NGramIndex(["中央区", "中央区"]).best("中央区", 0.6) is None, "equally good names are ambiguous"
+    print("✅ Typos, ケ/ヶ and old kanji forms matched")
+
+    # One wrong character breaks every bigram of a short name: matched within one edit instead
+    assert [prefix_edits("渋谷区", text) for text in ("渋谷区宇田川町", "渋屋区宇田川町", "渋区宇田川町", "渋谷谷区", "渋屋屋区")] == [0, 1, 1, 1, None]
+    short = NGramIndex(["渋谷区", "港区", "北区", "甲府市", "横浜市", "横浜市中区"])
+    assert short.best("渋屋区宇田川町", 0.6) is None and short.closest("渋屋区宇田川町") == 0
+    assert short.closest("横浜巿中区日本大通") == 5, "the longest name within one edit wins"
+    assert short.closest("湊区芝公園") is None, "two-character names get no edit"
+    assert short.closest("甲府巿", allowed={0}) is None
+    for address, path in [("東京都渋屋区宇田川町1", ("東京都", "渋谷区")), ("山梨県甲府巿丸の内1-18-1", ("山梨県", "甲府市")),
+                          ("神奈川県横浜巿中区日本大通1", ("神奈川県", "横浜市", "中区"))]:
+        assert gazetteer.find_place(address) is None and gazetteer.fuzzy_place(address).path == path, address
+        assert gazetteer.fuzzy_locate(address) == (coords_of(*path), len(path)), address
+    assert parse_address_components("東京都渋屋区宇田川町1") == ("東京都", "渋谷区", "")
+    assert parse_address_components("神奈川県横浜巿中区日本大通1") == ("神奈川県", "横浜市", "中区")
+    print("✅ One-character typos in short city and ward names matched")
+
+    # Refines an exact match below it, never moves the address elsewhere
+    assert gazetteer.fuzzy_locate("東京都渋谷区神宮全1-1") == (coords_of("東京都", "渋谷区", "神宮前"), 3)
+    assert gazetteer.fuzzy_locate("東京都渋谷区渋谷2-1") == gazetteer.locate("東京都渋谷区渋谷2-1")
+    assert gazetteer.fuzzy_locate("東京都町田市森野2-2-22") is None
+    assert estimate_coordinates_from_address("東京都渋屋区神宮前1-1", allow_remote=False) == coords_of("東京都", "渋谷区", "神宮前")
+    assert parse_address_components("東京都渋屋区神宮前1-1") == ("東京都", "渋谷区", "")
+    assert parse_address_components("神奈川県横浜巿鶴見区鶴見中央3-20-1") == ("神奈川県", "横浜市", "鶴見区")
+    assert parse_address_components("東京都町田市森野2-2-22") == ("東京都", "町田市", ""), "listed cities are kept"
+    # A real town missing from the gazetteer keeps its suffix: 府中町 is not 府中市
+    for address in ("広島県府中町大通3-5-1", "広島県安芸郡府中町大通3-5-1"):
+        assert gazetteer.fuzzy_place(address) is None, address
+        assert gazetteer.fuzzy_locate(address) is None, address
+        assert parse_address_components(address) == ("広島県", "府中町", ""), address
+    print("✅ Failed exact lookups resolved locally")
+
+    start = time.perf_counter()
+    for _ in range(2000):
+        gazetteer.fuzzy_place("東京都渋屋区神宮全1-1")
+    per_lookup = (time.perf_counter() - start) / 2000 * 1000
+    print(f"Average fuzzy lookup: {per_lookup * 1000:.1f} µs")
+
+if __name__ == "__main__":
+    test_place_name_matcher()
+    test_fuzzy_matching()
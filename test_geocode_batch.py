@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+"""
+Test concurrent multi-address geocoding against a local mock GSI server
+Results must come back in input order with duplicates requested once, several requests in flight at a time
+"""
+
+import sys
+import os
+import json
+import tempfile
+import threading
+import time
+import urllib.parse
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import contact_search
+import geocode_cache
+from geocode_batch import geocode_addresses
+from geocode_cache import GeocodeCache
+from http_client import RateLimiter
+
+LATENCY = 0.02  # simulated GSI round trip
+
+class MockGSIHandler(BaseHTTPRequestHandler):
+    """Every 甲府市 address is found at a position derived from its number; others have no match"""
+    protocol_version = "HTTP/1.1"
+    wbufsize = 65536  # headers and body in one segment (avoids delayed-ACK stalls on keep-alive)
+    queries = []
+    active = 0
+    max_active = 0
+    lock = threading.Lock()
+
+    def do_GET(self):
+        query = urllib.parse.parse_qs(urllib.parse.urlparse(self.path).query).get("q", [""])[0]
+        cls = MockGSIHandler
+        with cls.lock:
+            cls.queries.append(query)
+            cls.active += 1
+            cls.max_active = max(cls.max_active, cls.active)
+        time.sleep(LATENCY)
+        with cls.lock:
+            cls.active -= 1
+        features = []
+        if query.startswith("山梨県甲府市"):
+            number = int(query.rsplit("-", 1)[1])
+            features = [{"geometry": {"coordinates": [138.5 + number / 10000, 35.6]}}]
+        body = json.dumps(features).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+def test_rate_limiter():
+    """Token bucket lets a burst through, then paces at the configured rate"""
+    now = [0.0]
+    waits = []
+    def fake_sleep(seconds):
+        waits.append(seconds)
+        now[0] += seconds
+    limiter = RateLimiter(10, burst=3, clock=lambda: now[0], sleep=fake_sleep)
+    for _ in range(6):
+        limiter.acquire()
+    assert [round(w, 6) for w in waits] == [0.1, 0.1, 0.1], waits
+    now[0] += 1.0
+    assert limiter.acquire() == 0.0, "tokens refill while idle"
+
+def test_geocode_batch():
+    """Geocode 600 addresses (300 unique) through a bounded pool against the mock server"""
+
+    print("🧪 Concurrent Geocoding Test")
+    print("=" * 60)
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), MockGSIHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    original = contact_search.GSI_GEOCODE, contact_search.GSI_MAX_REQUESTS_PER_SECOND, geocode_cache._default_cache
+
+    with tempfile.TemporaryDirectory() as tmp:
+        contact_search.GSI_GEOCODE = f"http://127.0.0.1:{server.server_port}/address-search/AddressSearch"
+        contact_search.GSI_MAX_REQUESTS_PER_SECOND = 10000
+        geocode_cache._default_cache = GeocodeCache(os.path.join(tmp, "geocode_cache.sqlite"))
+        MockGSIHandler.queries = []
+        MockGSIHandler.max_active = 0
+        try:
+            unique = [f"山梨県甲府市丸の内1-{i}" for i in range(1, 291)] + [f"北海道どこか{i}-1" for i in range(10)]
+            # Each address twice, the repeat written with full-width digits
+            addresses = []
+            for address in unique:
+                addresses.append(address)
+            for address in reversed(unique):
+                addresses.append(address.translate(str.maketrans("0123456789-", "０１２３４５６７８９－")))
+
+            stats = {}
+            results = geocode_addresses(addresses, max_in_flight=8, stats=stats)
+            assert len(MockGSIHandler.queries) == len(unique), "duplicates must be requested once"
+            assert stats["unique"] == 300 and stats["found"] == 290
+
+            expected = {a: ((35.6, 138.5 + int(a.rsplit("-", 1)[1]) / 10000) if "甲府市" in a else None) for a in unique}
+            assert results[:300] == [expected[a] for a in unique]
+            assert results[300:] == [expected[a] for a in reversed(unique)]
+            print("✅ Results in input order, duplicates deduplicated")
+
+            sequential = len(unique) * LATENCY
+            assert 1 < MockGSIHandler.max_active <= 8, MockGSIHandler.max_active
+            print(f"✅ {stats['addresses']} addresses in {stats['elapsed']:.2f}s "
+                  f"(~{sequential:.1f}s one at a time, {stats['addresses_per_second']:.0f}/s, "
+                  f"{MockGSIHandler.max_active} in flight at most)")
+
+            # Second pass is served entirely by the persistent cache
+            MockGSIHandler.queries = []
+            assert geocode_addresses(addresses) == results
+            assert MockGSIHandler.queries == []
+            print("✅ Repeat batch served from the geocode cache")
+
+            # Per-host pacing: 25 new addresses at 20/s with a burst of 5 take at least ~1s
+            contact_search.GSI_MAX_REQUESTS_PER_SECOND = 20
+            start = time.perf_counter()
+            geocode_addresses([f"山梨県甲府市相生1-{i}" for i in range(25)], max_in_flight=8)
+            elapsed = time.perf_counter() - start
+            assert elapsed >= 0.9, elapsed
+            print(f"✅ Rate limit respected ({elapsed:.2f}s for 25 requests at 20/s)")
+        finally:
+            contact_search.GSI_GEOCODE, contact_search.GSI_MAX_REQUESTS_PER_SECOND, geocode_cache._default_cache = original
+            server.shutdown()
+            server.server_close()
+
+def test_custom_geocoder():
+    """Any per-address geocoder runs through the same deduplicating pool"""
+
+    calls = []
+    def geocode(address):
+        calls.append(address)
+        if "どこか" in address:
+            raise ValueError("resolver failed")
+        return address[:3]
+
+    results = geocode_addresses(["山梨県甲府市1-1", "山梨県甲府市１－１", "北海道どこか"], geocode=geocode)
+    assert results == ["山梨県", "山梨県", None] and len(calls) == 2
+    print("✅ Custom geocoder: input order, duplicates once, failures as None")
+
+if __name__ == "__main__":
+    test_rate_limiter()
+    test_geocode_batch()
+    test_custom_geocoder()
@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""
+Test the persistent geocode cache against a local stand-in for the GSI AddressSearch API
+Repeated lookups must be served from disk, expire after their TTL and be evicted LRU-first
+"""
+
+import sys
+import os
+import json
+import tempfile
+import threading
+import urllib.parse
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import contact_search
+import geocode_cache
+from geocode_cache import GeocodeCache, normalize_address
+
+KNOWN_ADDRESSES = {
+    "東京都新宿区西新宿2-8-1": (35.6896, 139.6917),
+    "山梨県甲府市丸の内1-6-1": (35.6641, 138.5681),
+}
+
+class FakeGSIHandler(BaseHTTPRequestHandler):
+    """Answers like GSI: a GeoJSON feature list, empty when the address is unknown"""
+    requests_seen = []
+
+    def do_GET(self):
+        query = urllib.parse.parse_qs(urllib.parse.urlparse(self.path).query).get("q", [""])[0]
+        FakeGSIHandler.requests_seen.append(query)
+        coords = KNOWN_ADDRESSES.get(query)
+        features = [{"geometry": {"coordinates": [coords[1], coords[0]]}}] if coords else []
+        body = json.dumps(features).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1_000_000.0
+
+    def __call__(self):
+        return self.now
+
+def test_geocode_cache():
+    """Route gsi_address_search to a local server and count requests reaching it"""
+
+    print("🧪 Persistent Geocode Cache Test")
+    print("=" * 60)
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), FakeGSIHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    original_url, original_cache = contact_search.GSI_GEOCODE, geocode_cache._default_cache
+
+    with tempfile.TemporaryDirectory() as tmp:
+        clock = FakeClock()
+        cache_path = os.path.join(tmp, "geocode_cache.sqlite")
+        contact_search.GSI_GEOCODE = f"http://127.0.0.1:{server.server_port}/address-search/AddressSearch"
+        geocode_cache._default_cache = GeocodeCache(cache_path, ttl=100, negative_ttl=10, clock=clock)
+        FakeGSIHandler.requests_seen = []
+        try:
+            address = "東京都新宿区西新宿2-8-1"
+            assert contact_search.geocode_gsi_fallback(address) == KNOWN_ADDRESSES[address]
+            assert contact_search.gsi_address_search(address) == KNOWN_ADDRESSES[address]
+            assert contact_search.geocode_gsi_fallback("東京都新宿区西新宿２－８－１ ") == KNOWN_ADDRESSES[address]
+            assert FakeGSIHandler.requests_seen == [address], "repeat lookups should not reach the server"
+            print("✅ Repeated and full-width variants served from the cache")
+
+            # "No match" answers are cached too, but for the shorter negative TTL
+            assert contact_search.geocode_gsi_fallback("北海道どこか1-1") is None
+            assert contact_search.geocode_gsi_fallback("北海道どこか1-1") is None
+            assert len(FakeGSIHandler.requests_seen) == 2
+            clock.now += 11
+            assert contact_search.geocode_gsi_fallback("北海道どこか1-1") is None
+            assert len(FakeGSIHandler.requests_seen) == 3
+            clock.now += 90
+            assert contact_search.geocode_gsi_fallback(address) == KNOWN_ADDRESSES[address]
+            assert len(FakeGSIHandler.requests_seen) == 4
+            print("✅ Entries expire after their TTL")
+
+            # The cache file outlives the process-wide instance (Streamlit restart)
+            reopened = GeocodeCache(cache_path, ttl=100, clock=clock)
+            assert reopened.lookup(address) == (True, KNOWN_ADDRESSES[address])
+            stats = reopened.stats()
+            assert stats["hits"] == 4 and stats["misses"] == 4 and stats["expired"] == 2, stats
+            print(f"✅ Cache persists on disk: {stats}")
+
+            # Transport errors are not cached
+            contact_search.GSI_GEOCODE = "http://127.0.0.1:1/unreachable"
+            assert contact_search.geocode_gsi_fallback("山梨県甲府市丸の内1-6-1") is None
+            assert reopened.lookup("山梨県甲府市丸の内1-6-1") == (False, None)
+            print("✅ Failed requests leave no cache entry")
+        finally:
+            contact_search.GSI_GEOCODE, geocode_cache._default_cache = original_url, original_cache
+            server.shutdown()
+            server.server_close()
+
+        # Least recently used entries are evicted first
+        small = GeocodeCache(os.path.join(tmp, "small.sqlite"), max_entries=2, clock=clock)
+        small.store("a", (1.0, 1.0))
+        clock.now += 1
+        small.store("b", (2.0, 2.0))
+        clock.now += 1
+        assert small.lookup("a") == (True, (1.0, 1.0))
+        clock.now += 1
+        small.store("c", (3.0, 3.0))
+        assert small.lookup("b") == (False, None)
+        assert small.lookup("a")[0] and small.lookup("c")[0]
+        assert small.stats()["evictions"] == 1
+        print("✅ Least recently used entry evicted at capacity")
+
+    assert normalize_address(" 東京都 新宿区１－２ ") == "東京都新宿区1-2"
+
+if __name__ == "__main__":
+    test_geocode_cache()
@@ -0,0 +1,196 @@
+#!/usr/bin/env python3
+"""
+Test the geocoder chain: resolvers run in order until one is precise enough,
+the per-lookup budget caps the chain, and failures are recorded without losing earlier answers
+"""
+
+import sys
+import os
+import tempfile
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import contact_search
+import geocode_cache
+import http_client
+from gazetteer import get_gazetteer
+from geocoder import (ADDRESS, CITY, TOWN, Answer, GeocoderChain, GeocoderStep, describe,
+                      gazetteer_step, postal_code_step, remote_step)
+
+class FakeClock:
+    """Clock advanced by the steps themselves"""
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+def fixed_step(name, answer, clock, cost=0.0, calls=None, remote=False):
+    """Step that takes `cost` seconds and answers `answer` (or raises it if it is an exception)"""
+    def resolve(address, prefecture, timeout):
+        if calls is not None:
+            calls.append((name, timeout))
+        clock.now += cost
+        if isinstance(answer, Exception):
+            raise answer
+        return answer
+    return GeocoderStep(name, resolve, remote)
+
+def test_geocoder_chain():
+    """Precision stop, budget exhaustion, error recording and local-only lookups"""
+
+    print("🧪 Geocoder Chain Test")
+    print("=" * 60)
+
+    clock = FakeClock()
+    calls = []
+    town = Answer((35.0, 139.0), TOWN)
+    exact = Answer((35.1, 139.1), ADDRESS)
+    chain = GeocoderChain([
+        fixed_step("local", town, clock, cost=0.001, calls=calls),
+        fixed_step("remote", exact, clock, cost=0.5, calls=calls, remote=True),
+        fixed_step("never", exact, clock, calls=calls),
+    ], budget=2.0, clock=clock)
+
+    result = chain.geocode("どこか")
+    assert (result.coords, result.precision, result.source) == (exact.coords, ADDRESS, "remote")
+    assert [name for name, _ in calls] == ["local", "remote"], "chain stops at the required precision"
+    assert abs(calls[1][1] - 1.999) < 1e-9, "remote step gets the rest of the budget as its timeout"
+    assert [round(t.elapsed_ms, 3) for t in result.timings] == [1.0, 500.0]
+    print("✅ Stops once an answer is precise enough")
+
+    calls.clear()
+    result = chain.geocode("どこか", required_precision=CITY)
+    assert result.source == "local" and [name for name, _ in calls] == ["local"]
+    result = chain.geocode("どこか", allow_remote=False)
+    assert result.source == "never" and "remote" not in [t.step for t in result.timings]
+    print("✅ Required precision per lookup; remote steps skipped for local-only lookups")
+
+    # A slow step exhausts the budget; the best answer so far is kept
+    chain = GeocoderChain([
+        fixed_step("local", town, clock),
+        fixed_step("slow", None, clock, cost=3.0),
+        fixed_step("remote", exact, clock, remote=True),
+    ], budget=2.0, clock=clock)
+    result = chain.geocode("どこか")
+    assert (result.coords, result.precision) == (town.coords, TOWN)
+    assert [(t.step, t.error) for t in result.errors] == [("remote", "budget exhausted")]
+    print("✅ Budget caps the chain; best answer so far kept")
+
+    # A failing step is recorded and the chain moves on
+    chain = GeocoderChain([
+        fixed_step("broken", ConnectionError("offline"), clock),
+        fixed_step("local", town, clock),
+    ], clock=clock)
+    result = chain.geocode("どこか")
+    assert result.source == "local"
+    assert [(t.step, t.error) for t in result.errors] == [("broken", "ConnectionError: offline")]
+    assert "broken" in describe(result) and "町域" in describe(result)
+    print(f"✅ Failures recorded: {describe(result)}")
+
+def test_geocoder_steps():
+    """Gazetteer precision, postal codes and remote timeouts"""
+
+    gazetteer = gazetteer_step(get_gazetteer())
+    answer = gazetteer.resolve("神奈川県横浜市中区山下町279", None, 1.0)
+    assert answer == Answer((35.4436, 139.638), TOWN), answer
+    assert gazetteer.resolve("東京都新宿区西新宿2-8-1", None, 1.0).precision == CITY
+    assert gazetteer.resolve("どこでもない", None, 1.0) is None
+    print(f"✅ Gazetteer precision follows the matched place ({answer.precision})")
+
+    postal = postal_code_step({"1600023": Answer((35.69, 139.69), TOWN)}.get)
+    assert postal.resolve("〒160-0023 東京都新宿区西新宿", None, 1.0) == Answer((35.69, 139.69), TOWN)
+    assert postal.resolve("１６０－００２３", None, 1.0) == Answer((35.69, 139.69), TOWN)
+    assert postal.resolve("〒100-0001", None, 1.0) is None
+    assert postal.resolve("東京都新宿区西新宿1600023", None, 1.0) is None, "only a leading code counts"
+    print("✅ Postal codes with and without 〒 and hyphen")
+
+    timeouts = []
+    remote = remote_step(lambda address, timeout: timeouts.append(timeout), max_timeout=5)
+    assert remote.resolve("どこか", None, 8.0) is None and remote.resolve("どこか", None, 0.3) is None
+    assert timeouts == [5, 0.3]
+    print("✅ Remote timeout capped by the step and by the budget")
+
+def test_app_chains():
+    """App lookups: search chain prefers GSI, facility estimation stays local-first"""
+
+    original = contact_search.gsi_address_search, contact_search.geocode_gsi_fallback
+    requests = []
+    contact_search.gsi_address_search = lambda address, timeout=10, use_cache=True, total_timeout=None: requests.append(address) or (35.6641, 138.5681)
+    contact_search.geocode_gsi_fallback = lambda address, timeout=5: requests.append(address) or (35.0, 139.0)
+    try:
+        result = contact_search.geocode_address("山梨県甲府市丸の内1-18-1")
+        assert result.source == "gsi" and result.precision == ADDRESS, result
+
+        requests.clear()
+        coords = contact_search.estimate_coordinates_from_address("山梨県甲府市丸の内1-18-1")
+        assert coords == get_gazetteer().resolve("山梨県甲府市丸の内1-18-1") and requests == []
+        assert contact_search.estimate_coordinates_from_address("どこでもない") == (35.0, 139.0)
+        assert contact_search.estimate_coordinates_from_address("どこでもない", allow_remote=False) is None
+        print("✅ Facility estimation asks GSI only for places the gazetteer lacks")
+
+        def offline(address, timeout=10, use_cache=True, total_timeout=None):
+            raise ConnectionError("offline")
+        contact_search.gsi_address_search = offline
+        address = "山梨県甲府市存在しない町9-9-9"
+        try:
+            contact_search.search_address(address)
+            assert False, "a failed GSI lookup must not be returned as a complete search"
+        except contact_search.GeocodeIncomplete as e:
+            assert e.result["coords"] == get_gazetteer().resolve(address)
+            assert e.result["contacts"]["警察署"], "search continues from the gazetteer's answer"
+        result = contact_search.geocode_address("東京都渋谷区神宮全1-1")
+        assert (result.source, result.precision) == ("fuzzy", TOWN), result
+        print("✅ GSI failure falls back to the gazetteer (fuzzy for typos) and is not memoized")
+    finally:
+        contact_search.gsi_address_search, contact_search.geocode_gsi_fallback = original
+
+class FakeGsiClient:
+    """Stands in for the shared HttpClient: answers every GSI request with one point"""
+    def __init__(self):
+        self.requests = []
+
+    def set_rate_limit(self, url, per_second, burst=1):
+        pass
+
+    def get(self, url, params=None, timeout=None, total_timeout=None):
+        self.requests.append(params["q"])
+        return FakeGsiResponse()
+
+class FakeGsiResponse:
+    status_code = 200
+
+    def raise_for_status(self):
+        pass
+
+    def json(self):
+        return [{"geometry": {"coordinates": [138.5681, 35.6641]}}]
+
+def test_cached_remote_lookup():
+    """The search chain reads the geocode cache once per lookup: one miss cold, one hit warm"""
+
+    original = http_client._default_client, geocode_cache._default_cache
+    client = FakeGsiClient()
+    with tempfile.TemporaryDirectory() as tmp:
+        cache = geocode_cache.GeocodeCache(os.path.join(tmp, "geocode_cache.sqlite"))
+        http_client._default_client, geocode_cache._default_cache = client, cache
+        try:
+            address = "山梨県甲府市丸の内1-18-1"
+            cold = contact_search.geocode_address(address)
+            assert (cold.source, cold.coords) == ("gsi", (35.6641, 138.5681)), cold
+            stats = cache.stats()
+            assert (stats["hits"], stats["misses"], stats["entries"]) == (0, 1, 1), stats
+
+            warm = contact_search.geocode_address(address)
+            assert warm.coords == cold.coords and client.requests == [address]
+            stats = cache.stats()
+            assert (stats["hits"], stats["misses"]) == (1, 1), stats
+        finally:
+            http_client._default_client, geocode_cache._default_cache = original
+    print("✅ Cold lookup counts one cache miss; the repeat is a hit without GSI")
+
+if __name__ == "__main__":
+    test_geocoder_chain()
+    test_geocoder_steps()
+    test_app_chains()
+    test_cached_remote_lookup()
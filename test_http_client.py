@@ -0,0 +1,180 @@
+#!/usr/bin/env python3
+"""
+Test the shared HTTP client against a local server
+Covers keep-alive reuse, retries with jittered backoff, the circuit breaker and the concurrency bound
+"""
+
+import sys
+import os
+import threading
+import time
+import requests
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from http_client import CircuitOpenError, ConcurrencyLimitError, HttpClient
+
+class FlakyHandler(BaseHTTPRequestHandler):
+    """Serves /ok, fails /flaky with 503 until `failures` runs out, and holds /slow open briefly"""
+    protocol_version = "HTTP/1.1"
+    failures = 0
+    client_ports = set()
+    active = 0
+    max_active = 0
+    lock = threading.Lock()
+
+    def do_GET(self):
+        cls = FlakyHandler
+        cls.client_ports.add(self.client_address[1])
+        status = 200
+        if self.path.startswith("/flaky") and cls.failures > 0:
+            cls.failures -= 1
+            status = 503
+        if self.path.startswith("/slow"):
+            with cls.lock:
+                cls.active += 1
+                cls.max_active = max(cls.max_active, cls.active)
+            time.sleep(0.05)
+            with cls.lock:
+                cls.active -= 1
+        body = b"[]"
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+class StubResponse:
+    """A response with only a status, for tests that must not touch the network"""
+    def __init__(self, status_code):
+        self.status_code = status_code
+
+    def close(self):
+        pass
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+def test_http_client():
+    """Exercise the client end to end with sleeps recorded instead of slept"""
+
+    print("🧪 Shared HTTP Client Test")
+    print("=" * 60)
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), FlakyHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base = f"http://127.0.0.1:{server.server_port}"
+
+    try:
+        clock = FakeClock()
+        sleeps = []
+        client = HttpClient(retries=2, backoff=0.5, failure_threshold=3, reset_timeout=30,
+                            clock=clock, sleep=sleeps.append)
+
+        # Keep-alive: sequential requests reuse one pooled connection
+        FlakyHandler.client_ports.clear()
+        for _ in range(5):
+            assert client.get(f"{base}/ok").status_code == 200
+        assert len(FlakyHandler.client_ports) == 1, FlakyHandler.client_ports
+        print("✅ Five requests over one keep-alive connection")
+
+        # 503s are retried with jittered, exponentially capped delays
+        FlakyHandler.failures = 2
+        assert client.get(f"{base}/flaky").status_code == 200
+        assert len(sleeps) == 2
+        assert 0 <= sleeps[0] <= 0.5 and 0 <= sleeps[1] <= 1.0
+        assert client.breaker(base).state == "closed"
+        print(f"✅ Recovered after two 503s (backoff {sleeps[0]:.2f}s, {sleeps[1]:.2f}s)")
+
+        # Exhausted retries return the last response and open the breaker
+        FlakyHandler.failures = 10
+        assert client.get(f"{base}/flaky").status_code == 503
+        assert client.breaker(base).state == "open"
+        FlakyHandler.failures = 0
+        try:
+            client.get(f"{base}/ok")
+            raise AssertionError("circuit should be open")
+        except CircuitOpenError:
+            pass
+        print("✅ Circuit opens after repeated failures and fails fast")
+
+        # After reset_timeout one probe is let through; success closes the circuit
+        clock.now += 31
+        assert client.breaker(base).state == "half-open"
+        assert client.get(f"{base}/ok").status_code == 200
+        assert client.breaker(base).state == "closed"
+        print("✅ Half-open probe closes the circuit")
+
+        # Unreachable hosts raise after retries, without affecting other hosts
+        sleeps.clear()
+        try:
+            client.get("http://127.0.0.1:1/", timeout=1)
+            raise AssertionError("expected a connection error")
+        except Exception as e:
+            assert not isinstance(e, AssertionError)
+        assert len(sleeps) == 2
+        assert client.breaker(base).state == "closed"
+        print("✅ Connection errors are retried and raised")
+
+        # A total timeout caps retries, backoff and rate-limit waits by the time left. The
+        # fake clock only moves when the client sleeps, so no real request is sent here
+        waited = []
+        def advance(seconds):
+            waited.append(seconds)
+            clock.now += seconds
+        bounded = HttpClient(retries=5, backoff=1.0, failure_threshold=100, clock=clock, sleep=advance)
+        statuses = [503] * 10
+        bounded._send = lambda url, params, timeout: StubResponse(statuses.pop(0) if statuses else 200)
+        assert bounded.get(f"{base}/flaky", total_timeout=1.5).status_code == 503
+        assert waited and sum(waited) < 1.5 and len(waited) < 5, waited
+        statuses.clear()
+        bounded.set_rate_limit(base, 0.1)
+        waited.clear()
+        assert bounded.get(f"{base}/ok", total_timeout=2).status_code == 200
+        try:
+            bounded.get(f"{base}/ok", total_timeout=2)
+            raise AssertionError("the rate-limit wait exceeds the total timeout")
+        except requests.exceptions.Timeout:
+            pass
+        assert waited == [] and bounded.breaker(base).state == "closed"
+        print("✅ Retries and rate-limit waits stay within the total timeout")
+
+        # At most max_concurrency requests are in flight at once
+        bounded = HttpClient(max_concurrency=2, pool_size=4)
+        FlakyHandler.max_active = 0
+        threads = [threading.Thread(target=bounded.get, args=(f"{base}/slow",)) for _ in range(6)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert FlakyHandler.max_active <= 2, FlakyHandler.max_active
+        print(f"✅ Concurrency bounded ({FlakyHandler.max_active} requests in flight at most)")
+
+        # No free slot is local congestion: raised at once, not retried, not a host failure
+        sleeps.clear()
+        busy = HttpClient(max_concurrency=1, failure_threshold=1, clock=clock, sleep=sleeps.append)
+        busy._slots.acquire()
+        try:
+            busy.get(f"{base}/ok", timeout=0.05)
+            raise AssertionError("expected ConcurrencyLimitError")
+        except ConcurrencyLimitError:
+            pass
+        finally:
+            busy._slots.release()
+        assert sleeps == [] and busy.breaker(base).failures == 0 and busy.breaker(base).state == "closed"
+        assert busy.get(f"{base}/ok").status_code == 200
+        print("✅ Slot waits are neither retried nor counted by the circuit breaker")
+    finally:
+        server.shutdown()
+        server.server_close()
+
+if __name__ == "__main__":
+    test_http_client()
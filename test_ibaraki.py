@@ -7,7 +7,7 @@ import sys
 import os
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
-from app import get_comprehensive_contacts, parse_address_components, calculate_distance, estimate_coordinates_from_address
+from contact_search import get_comprehensive_contacts, parse_address_components, calculate_distance, estimate_coordinates_from_address
 
 def test_ibaraki_cities():
     """Test searching for contacts in Ibaraki cities"""
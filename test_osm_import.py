@@ -0,0 +1,165 @@
+#!/usr/bin/env python3
+"""
+Test the offline OSM import from an Overpass JSON dump and an OSM XML extract
+Facilities must be classified, placed in a prefecture, refreshed per region and served by the search
+"""
+
+import sys
+import os
+import gzip
+import json
+import tempfile
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import boundaries
+import contact_search
+from boundaries import BoundaryIndex, build_boundary_index
+from fixture_files import feature, square, write_geojson
+from osm_import import classify, import_osm, iter_osm_xml, load_osm_facilities, overpass_query, place_facility, tag_prefecture
+
+OVERPASS_DUMP = {
+    "elements": [
+        {"type": "node", "id": 1, "lat": 35.6620, "lon": 138.5700,
+         "tags": {"amenity": "police", "name": "甲府テスト警察署", "phone": "055-000-0001",
+                  "addr:province": "山梨県", "addr:city": "甲府市", "addr:quarter": "丸の内", "addr:block_number": "1"}},
+        {"type": "node", "id": 2, "lat": 35.6630, "lon": 138.5710,
+         "tags": {"amenity": "police", "police": "koban", "name": "駅前交番"}},
+        {"type": "way", "id": 3, "center": {"lat": 35.6500, "lon": 138.5600},
+         "tags": {"amenity": "hospital", "name": "テスト総合病院", "phone": "055-000-0003"}},
+        {"type": "node", "id": 4, "lat": 35.6700, "lon": 138.5800,
+         "tags": {"amenity": "cafe", "name": "喫茶店"}},
+        {"type": "node", "id": 5, "lat": 43.0600, "lon": 141.3500,
+         "tags": {"amenity": "fire_station", "name": "札幌テスト消防署"}},
+        # The database's 甲府警察署 under its organization's name
+        {"type": "node", "id": 6, "lat": 35.6641, "lon": 138.5681,
+         "tags": {"amenity": "police", "name": "山梨県警察 甲府警察署", "phone": "055-000-0006",
+                  "addr:province": "山梨県", "addr:city": "甲府市"}},
+    ]
+}
+
+OSM_XML = """<?xml version="1.0" encoding="UTF-8"?>
+<osm version="0.6">
+  <node id="10" lat="35.6900" lon="139.6900"/>
+  <node id="11" lat="35.6910" lon="139.6910"/>
+  <node id="12" lat="35.6900" lon="139.6910"/>
+  <node id="13" lat="35.6938" lon="139.7034">
+    <tag k="office" v="government"/><tag k="name" v="新宿労働基準監督署"/><tag k="phone" v="03-0000-0013"/>
+  </node>
+  <way id="20">
+    <nd ref="10"/><nd ref="11"/><nd ref="12"/>
+    <tag k="amenity" v="fire_station"/><tag k="name" v="テスト消防署"/><tag k="phone" v="03-0000-0020"/>
+  </way>
+</osm>
+"""
+
+def test_osm_import():
+    """Import, refresh and search against a temporary store"""
+
+    print("🧪 OSM Import Test")
+    print("=" * 60)
+
+    assert classify({"amenity": "townhall", "name": "甲府市役所"}) == "市区町村役所"
+    assert classify({"amenity": "police", "name": "丸の内交番"}) is None
+    assert classify({"office": "government", "name": "甲府保健所"}) == "保健所"
+    assert 'nwr["amenity"="police"](area.a);' in overpass_query("山梨県")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        store = os.path.join(tmp, "osm.sqlite")
+        dump = os.path.join(tmp, "yamanashi.json")
+        extract = os.path.join(tmp, "shinjuku.osm.gz")
+        with open(dump, "w", encoding="utf-8") as f:
+            json.dump(OVERPASS_DUMP, f, ensure_ascii=False)
+        with gzip.open(extract, "wt", encoding="utf-8") as f:
+            f.write(OSM_XML)
+
+        results = import_osm([dump, extract], store)
+        assert [(r["region"], r["status"], r["facilities"], r["unplaced"]) for r in results] == [
+            ("yamanashi", "imported", 4, 1), ("shinjuku", "imported", 2, 0)]
+        yamanashi = load_osm_facilities("山梨県", store)
+        assert [(f["osm_id"], f["category"], f["city"]) for f in yamanashi] == [
+            ("node/1", "警察署", "甲府市"), ("node/6", "警察署", "甲府市"), ("way/3", "病院", "甲府市")]
+        assert yamanashi[0]["address"] == "山梨県甲府市丸の内1"
+        tokyo = {f["osm_id"]: f for f in load_osm_facilities("東京都", store)}
+        assert tokyo["way/20"]["category"] == "消防署"
+        assert abs(tokyo["way/20"]["lat"] - 35.6903333) < 1e-6, "ways are placed at their centroid"
+        assert tokyo["node/13"]["category"] == "労基署" and tokyo["node/13"]["city"] == "新宿区"
+        print("✅ Overpass JSON and OSM XML imported, classified and placed")
+
+        # Only changed regions are re-imported
+        assert [r["status"] for r in import_osm([dump, extract], store)] == ["unchanged", "unchanged"]
+        OVERPASS_DUMP["elements"].pop(2)
+        with open(dump, "w", encoding="utf-8") as f:
+            json.dump(OVERPASS_DUMP, f, ensure_ascii=False)
+        results = import_osm([dump, extract], store)
+        assert [r["status"] for r in results] == ["imported", "unchanged"]
+        assert [f["osm_id"] for f in load_osm_facilities("山梨県", store)] == ["node/1", "node/6"]
+        print("✅ Unchanged regions skipped, changed region replaced")
+
+        # Imported facilities join the prefecture's index and win when nearest
+        build = contact_search.build_prefecture_facilities
+        for table in ("prefecture_facilities", "prefecture_partitions", "prefecture_indexes"):
+            contact_search._data_plane[table].pop("山梨県", None)
+        contact_search.build_prefecture_facilities = lambda prefecture: build(prefecture, store)
+        try:
+            contacts = contact_search.get_comprehensive_contacts("甲府市", "", "山梨県", (35.6630, 138.5700))
+            police = contacts["警察署"][0]
+            assert police["name"] == "甲府テスト警察署" and police["source"] == "OpenStreetMap"
+            assert police["distance_km"] == 0.1
+            assert all(f.coords is None for f in build("山梨県", os.path.join(tmp, "missing.sqlite")))
+            osm_names = [f.contact["name"] for f in build("山梨県", store) if f.contact.get("source") == "OpenStreetMap"]
+            assert osm_names == ["甲府テスト警察署"], "the database's 甲府警察署 is not listed twice"
+        finally:
+            contact_search.build_prefecture_facilities = build
+            for table in ("prefecture_facilities", "prefecture_partitions", "prefecture_indexes"):
+                contact_search._data_plane[table].pop("山梨県", None)
+        print("✅ Imported facilities served from the local index (no Overpass call)")
+
+        # Streaming a large extract keeps memory flat: parsed elements are dropped from the root
+        large = os.path.join(tmp, "large.osm")
+        with open(large, "w", encoding="utf-8") as f:
+            f.write('<?xml version="1.0" encoding="UTF-8"?>\n<osm version="0.6">\n')
+            for i in range(100000):
+                f.write(f'  <node id="{i}" lat="35.{i:05d}" lon="139.{i:05d}"><tag k="highway" v="crossing"/></node>\n')
+            f.write('</osm>\n')
+        tracemalloc.start()
+        try:
+            assert list(iter_osm_xml(large)) == []
+            peak = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+        assert peak < 2_000_000, peak
+        print(f"✅ 100000 nodes streamed with a {peak / 1e6:.1f} MB peak")
+
+OYAMA = (36.3147, 139.8003)  # 栃木県小山市, 10 km from the gazetteer's 茨城県結城市
+
+def test_prefecture_placement():
+    """POIs in prefectures the gazetteer lacks take their prefecture from tags or boundaries"""
+
+    assert tag_prefecture({"addr:province": "栃木県"}) == "栃木県"
+    assert tag_prefecture({"is_in": "日本, 群馬県, 前橋市"}) == "群馬県"
+    assert tag_prefecture({"is_in": "Japan"}) is None and tag_prefecture({}) is None
+
+    original = boundaries._default_index
+    boundaries._default_index = BoundaryIndex()
+    try:
+        assert place_facility("栃木県小山市中央町1-1-1", "栃木県", *OYAMA) == ("栃木県", "小山市", "")
+        assert place_facility("", "群馬県", 36.3895, 139.0634) == ("群馬県", "", "")
+        # Tagged with 栃木県 but nearest to a city across the border: the border city is not taken
+        assert place_facility("", "栃木県", *OYAMA) == ("栃木県", "", "")
+        assert place_facility("", None, 35.6641, 138.5681)[:2] == ("山梨県", "甲府市"), "gazetteer fallback"
+        print("✅ Prefecture from addr:province / is_in, never from a city across the border")
+
+        with tempfile.TemporaryDirectory() as tmp:
+            oyama = feature({"N03_001": "栃木県", "N03_004": "小山市", "N03_007": "09208"}, "Polygon",
+                            [square(139.70, 36.20, 139.90, 36.40)])
+            boundaries._default_index = BoundaryIndex(build_boundary_index([write_geojson(tmp, [oyama])]))
+            assert place_facility("", None, *OYAMA) == ("栃木県", "小山市", "")
+        print("✅ Untagged POIs placed by the boundary polygon before the gazetteer")
+    finally:
+        boundaries._default_index = original
+
+if __name__ == "__main__":
+    test_osm_import()
+    test_prefecture_placement()
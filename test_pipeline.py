@@ -5,7 +5,7 @@ import sys
 import os
 sys.path.append(os.path.dirname(__file__))
 
-from app import parse_address_components, get_comprehensive_contacts, geocode_gsi, assemble_results
+from contact_search import parse_address_components, get_comprehensive_contacts, geocode_address, assemble_results
 
 def test_complete_pipeline(address):
     print(f"Testing complete pipeline for: {address}")
@@ -13,7 +13,7 @@ def test_complete_pipeline(address):
     
     # Step 1: Geocoding
     print("Step 1: Geocoding...")
-    coords = geocode_gsi(address.strip())
+    coords = geocode_address(address.strip()).coords
     if not coords:
         print("❌ Geocoding failed!")
         return
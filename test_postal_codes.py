@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""
+Test the postal-code index built from a KEN_ALL-style file
+Codes must resolve locally to prefecture, city, town and coordinates, and keep searches off GSI
+"""
+
+import sys
+import os
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import contact_search
+import postal_codes
+from fixture_files import ken_all_row, write_ken_all_zip
+from gazetteer import get_gazetteer
+from geocoder import ADDRESS, CITY, TOWN, Answer, postal_code
+from postal_codes import (PostalEntry, build_entries, iter_ken_all, load_postal_index, read_ken_all_text,
+                          save_postal_codes)
+
+KEN_ALL_ROWS = [
+    ken_all_row("1600023", "東京都", "新宿区", "西新宿（次のビルを除く）"),
+    ken_all_row("1630890", "東京都", "新宿区", "西新宿新宿ＮＳビル（地階・階層不明）"),
+    # A long town name split over two rows
+    ken_all_row("2310023", "神奈川県", "横浜市中区", "山下町（１～２８４番地、", "14104"),
+    ken_all_row("2310023", "神奈川県", "横浜市中区", "２９０番地以降）", "14104"),
+    ken_all_row("4000000", "山梨県", "甲府市", "以下に掲載がない場合", "19201"),
+    # One code shared by two towns
+    ken_all_row("4000031", "山梨県", "甲府市", "丸の内", "19201"),
+    ken_all_row("4000031", "山梨県", "甲府市", "相生", "19201"),
+    ken_all_row("0600000", "北海道", "札幌市中央区", "以下に掲載がない場合", "01101"),
+]
+
+def test_postal_codes():
+    """Build the index from a zipped KEN_ALL and resolve codes"""
+
+    print("🧪 Postal Code Index Test")
+    print("=" * 60)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        text = read_ken_all_text(write_ken_all_zip(tmp, KEN_ALL_ROWS))
+        records = list(iter_ken_all(text))
+        assert records[2] == ("2310023", "神奈川県", "横浜市中区", "山下町"), "split rows joined, notes dropped"
+        assert records[3] == ("4000000", "山梨県", "甲府市", "")
+        print(f"✅ {len(records)} records read from Shift_JIS KEN_ALL.ZIP")
+
+        entries = build_entries(iter(records))
+        assert entries["2310023"] == PostalEntry("神奈川県", "横浜市中区", "山下町", (35.4436, 139.638), 3)
+        assert entries["4000031"] == PostalEntry("山梨県", "甲府市", "", get_gazetteer().resolve("山梨県甲府市"), 2)
+        assert entries["0600000"].prefecture == "北海道"
+
+        path = os.path.join(tmp, "postal_codes.json")
+        save_postal_codes(entries, "test", path)
+        index = load_postal_index(path)
+        assert len(index) == 6 and index.get("231-0023") == entries["2310023"]
+        assert index.answer("2310023") == Answer((35.4436, 139.638), TOWN)
+        assert index.answer("1600023") == Answer(get_gazetteer().resolve("東京都新宿区"), CITY)
+        assert index.get("9999999") is None
+        print("✅ Codes resolve to prefecture, city, town and coordinates")
+
+        assert postal_code("〒２３１－００２３　横浜市中区") == "2310023"
+        assert index.qualify("〒160-0023 西新宿2-8-1") == "〒160-0023 東京都新宿区西新宿2-8-1"
+        assert index.qualify("〒231-0023 横浜市中区山下町279") == "〒231-0023 神奈川県横浜市中区山下町279"
+        assert index.qualify("〒160-0023 東京都新宿区西新宿2-8-1") == "〒160-0023 東京都新宿区西新宿2-8-1"
+        print("✅ Addresses qualified with the prefecture and city their code implies")
+
+        codes = list(index.entries) * 20000
+        start = time.perf_counter()
+        for code in codes:
+            index.get(code)
+        per_lookup = (time.perf_counter() - start) / len(codes) * 1e6
+        print(f"✅ {per_lookup:.2f} µs per lookup")
+
+        missing = load_postal_index(os.path.join(tmp, "missing.json"))
+        assert len(missing) == 0 and missing.lookup_address("〒160-0023") is None
+
+        # App: a known code fills in the jurisdiction and keeps the lookup off GSI
+        original = postal_codes._default_index, contact_search.gsi_address_search, contact_search.geocode_gsi_fallback
+        requests = []
+        def no_remote(address, *args, **kwargs):
+            requests.append(address)
+            raise ConnectionError("GSI must not be called for a known postal code")
+        postal_codes._default_index = index
+        contact_search.gsi_address_search = contact_search.geocode_gsi_fallback = no_remote
+        try:
+            assert contact_search.parse_address_components("〒231-0023 山下町279") == ("神奈川県", "横浜市", "中区")
+            assert contact_search.parse_address_components("〒160-0023 西新宿2-8-1")[:2] == ("東京都", "新宿区")
+
+            result = contact_search.geocode_address("〒231-0023 山下町279")
+            assert (result.coords, result.precision) == ((35.4436, 139.638), TOWN) and not result.errors, result
+            assert contact_search.estimate_coordinates_from_address("〒400-0000 どこか") == get_gazetteer().resolve("山梨県甲府市")
+
+            search = contact_search.search_address("〒231-0023 山下町279")
+            assert search["components"][0] == "神奈川県" and search["contacts"]["警察署"]
+            # (Building 神奈川県's facility index may ask for facility addresses, never for this one)
+            assert not [address for address in requests if "山下町279" in address or "どこか" in address], requests
+            print("✅ Searches from a known postal code skip GSI")
+
+            # Codes that only locate their city, or nothing at all, still go to GSI
+            contact_search.gsi_address_search = lambda address, *args, **kwargs: requests.append(address) or (35.6896, 139.6921)
+            contact_search.geocode_gsi_fallback = lambda address, *args, **kwargs: requests.append(address) or (43.0621, 141.3544)
+            requests.clear()
+            assert index.lookup_address("〒060-0000").coords is None
+            result = contact_search.geocode_address("〒160-0023 東京都新宿区西新宿2-8-1")
+            assert (result.coords, result.precision) == ((35.6896, 139.6921), ADDRESS), result
+            result = contact_search.geocode_address("〒060-0000 北海道札幌市中央区北1条西2丁目")
+            assert (result.coords, result.precision) == ((35.6896, 139.6921), ADDRESS), result
+            assert contact_search.estimate_coordinates_from_address("〒060-0000 どこか") == (43.0621, 141.3544)
+            assert requests == ["〒160-0023 東京都新宿区西新宿2-8-1", "〒060-0000 北海道札幌市中央区北1条西2丁目",
+                                "〒060-0000 どこか"], requests
+            print("✅ Codes without town coordinates fall through to GSI")
+        finally:
+            postal_codes._default_index, contact_search.gsi_address_search, contact_search.geocode_gsi_fallback = original
+
+if __name__ == "__main__":
+    test_postal_codes()
@@ -5,7 +5,7 @@ import sys
 import os
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
-from app import get_comprehensive_contacts, parse_address_components, geocode_gsi
+from contact_search import get_comprehensive_contacts, parse_address_components, geocode_address
 
 def test_proximity_search():
     # Test addresses
@@ -24,7 +24,7 @@ def test_proximity_search():
         print(f"Parsed: {pref} / {city_name} / {district_name}")
         
         # Get coordinates 
-        coords = geocode_gsi(address)
+        coords = geocode_address(address).coords
         if coords:
             lat, lon = coords
             print(f"Coordinates: {lat:.6f}, {lon:.6f}")
@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+"""
+Test police/fire service areas (管轄区域): the station whose area contains a point is listed first,
+whatever its distance, and distance ranking fills the remaining slots
+"""
+
+import sys
+import os
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import contact_search
+import service_areas
+from contact_search import ContactHit, Facility, select_nearest_contacts
+from fixture_files import feature, square, write_geojson
+from service_areas import (SERVICE_AREAS_VERSION, ServiceArea, ServiceAreaIndex, build_service_area_index,
+                           feature_service_area, load_service_area_index, station_key)
+
+KOFU = (35.6641, 138.5681)
+
+def area(name, ring, **properties):
+    """One station's service area"""
+    return feature({"name": name, **properties}, "Polygon", [ring])
+
+# Police and fire areas overlap each other around 甲府市丸の内
+FEATURES = [
+    area("山梨県警察甲府警察署", square(138.50, 35.60, 138.62, 35.70)),
+    area("甲府市消防本部", square(138.45, 35.55, 138.65, 35.75), category="消防署"),
+    area("南アルプス警察署", square(138.40, 35.55, 138.50, 35.65)),
+    area("新宿警察署", square(139.67, 35.68, 139.73, 35.72), prefecture="東京都"),
+    area("甲府市役所", square(138.50, 35.60, 138.62, 35.70)),
+]
+
+def test_service_areas():
+    """Area files → saved index → stations responsible for a point"""
+
+    print("🧪 Service Area Test")
+    print("=" * 60)
+
+    assert station_key("警視庁新宿警察署") == station_key("新宿警察署") == "新宿警察署"
+    assert station_key("神奈川県警察本部加賀町警察署") == "加賀町警察署"
+    assert station_key("甲府警察署") == "甲府警察署"
+    assert station_key("東京消防庁新宿消防署") == station_key("新宿消防署") == "新宿消防署"
+    assert station_key("横浜市消防局鶴見消防署") == "鶴見消防署"
+    assert station_key("甲府地区広域行政事務組合消防本部 甲府消防署") == "甲府消防署"
+    assert station_key("甲府市消防本部") == "甲府市消防本部", "a headquarters' own name is kept"
+    assert feature_service_area({"name": "甲府警察署"}) is None, "no prefecture"
+    assert feature_service_area({"name": "甲府市役所"}, "山梨県") is None, "neither police nor fire"
+    assert feature_service_area({"name:ja": "甲府消防署"}, "山梨県") == ServiceArea("山梨県", "消防署", "甲府消防署")
+    print("✅ Station names, categories and prefectures read from area features")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        polygons = build_service_area_index([write_geojson(tmp, FEATURES)], prefecture="山梨県")
+        assert len(polygons) == 4
+        path = os.path.join(tmp, "service_areas.npz")
+        polygons.save(path, "test", SERVICE_AREAS_VERSION)
+        index = load_service_area_index(path)
+
+        assert sorted(index.stations_at(*KOFU)) == [
+            ServiceArea("山梨県", "消防署", "甲府市消防本部"), ServiceArea("山梨県", "警察署", "山梨県警察甲府警察署")]
+        assert index.stations_at(35.70, 139.70) == [ServiceArea("東京都", "警察署", "新宿警察署")]
+        assert index.stations_at(35.0, 135.0) == [] and ServiceAreaIndex().stations_at(*KOFU) == []
+        assert len(load_service_area_index(os.path.join(tmp, "missing.npz"))) == 0
+
+        points = [(35.55 + 0.2 * i / 1000, 138.45 + 0.2 * i / 1000) for i in range(1000)]
+        start = time.perf_counter()
+        for lat, lon in points:
+            index.stations_at(lat, lon)
+        per_lookup = (time.perf_counter() - start) / len(points) * 1e6
+        print(f"✅ Overlapping police and fire areas, {per_lookup:.0f} µs per point")
+
+def test_responsible_selection():
+    """The responsible station comes first; its other placements do not take more slots"""
+
+    # Placements 3 and 4 are one station listed twice (placements share the station's name)
+    stations = [Facility(i, "山梨県", "警察署", {"name": f"署{min(i, 3)}"}, "甲府市", "") for i in range(5)]
+    nearby = [(0.5, stations[0]), (0.5, stations[1]), (1.2, stations[2]), (8.0, stations[3]), (9.5, stations[4])]
+    plain = select_nearest_contacts(nearby, [], "甲府市", "", 3)
+    assert [hit.facility_id for hit in plain] == [0, 1, 2]
+
+    # Station 3 is responsible (placements 3 and 4): pinned at its nearest placement, tier from its distance
+    selected = select_nearest_contacts(nearby, [], "甲府市", "", 3, responsible=frozenset({("山梨県", 3), ("山梨県", 4)}))
+    assert selected == [ContactHit(3, 8.0, 9, "山梨県"), ContactHit(0, 0.5, 1, "山梨県"), ContactHit(1, 0.5, 1, "山梨県")]
+
+    # An unmapped responsible station is pinned too; an unknown one changes nothing
+    unmapped = [Facility(5, "山梨県", "警察署", {"name": "署5"}, "甲斐市", "")]
+    selected = select_nearest_contacts(nearby, unmapped, "甲府市", "", 3, responsible=frozenset({("山梨県", 5)}))
+    assert [hit.facility_id for hit in selected] == [5, 0, 1] and selected[0].distance_km is None
+    assert select_nearest_contacts(nearby, [], "甲府市", "", 3, responsible=frozenset({("東京都", 3)})) == plain
+
+    # Overlapping areas: each responsible station is pinned once, nearest first
+    selected = select_nearest_contacts(nearby, [], "甲府市", "", 3, responsible=frozenset({("山梨県", 2), ("山梨県", 3), ("山梨県", 4)}))
+    assert [hit.facility_id for hit in selected] == [2, 3, 0]
+    print("✅ Responsible stations pinned first, the rest ranked by distance")
+
+def test_app_service_areas():
+    """Searches list the responsible police and fire stations first"""
+
+    before = contact_search.get_comprehensive_contacts("甲府市", "", "山梨県", KOFU)
+    with tempfile.TemporaryDirectory() as tmp:
+        original = service_areas._default_index
+        service_areas._default_index = ServiceAreaIndex(build_service_area_index([write_geojson(tmp, FEATURES)], prefecture="山梨県"))
+        try:
+            stations = contact_search.responsible_stations(*KOFU)
+            assert set(stations) == {"警察署", "消防署"}
+            facilities = contact_search.get_prefecture_facilities("山梨県")
+            assert {facilities[i].contact["name"] for _, i in stations["警察署"]} == {"甲府警察署"}
+
+            contacts = contact_search.get_comprehensive_contacts("甲府市", "", "山梨県", KOFU)
+            police = [contact["name"] for contact in contacts["警察署"]]
+            assert police[0] == "甲府警察署" and police.count("甲府警察署") == 1 and len(police) == 3, police
+            assert contacts["消防署"][0]["name"] == "甲府市消防本部"
+            assert [c["name"] for c in contacts["消防署"][1:]] == [c["name"] for c in before["消防署"][:2]]
+            assert contacts["病院"] == before["病院"], "other categories are ranked by distance as before"
+
+            # Outside every area the search is unchanged
+            elsewhere = (35.48, 138.80)
+            assert contact_search.responsible_stations(*elsewhere) == {}
+            service_areas._default_index = ServiceAreaIndex()
+            expected = contact_search.get_comprehensive_contacts("笛吹市", "", "山梨県", elsewhere)
+            service_areas._default_index = ServiceAreaIndex(build_service_area_index([write_geojson(tmp, FEATURES)], prefecture="山梨県"))
+            assert contact_search.get_comprehensive_contacts("笛吹市", "", "山梨県", elsewhere) == expected
+            print(f"✅ 甲府市丸の内: police {police}, fire {contacts['消防署'][0]['name']} first")
+
+            # Overlapping police areas: both stations are responsible, each listed once
+            overlapping = FEATURES + [area("日下部警察署", square(138.55, 35.65, 138.60, 35.68))]
+            service_areas._default_index = ServiceAreaIndex(
+                build_service_area_index([write_geojson(tmp, overlapping)], prefecture="山梨県"))
+            police = [contact["name"] for contact in contact_search.get_comprehensive_contacts("甲府市", "", "山梨県", KOFU)["警察署"]]
+            assert sorted(police[:2]) == ["日下部警察署", "甲府警察署"] and len(set(police)) == len(police) == 3, police
+
+            # A responsible station across the border leads even when the home prefecture fills every slot
+            kawaguchi = (35.80, 139.72)
+            service_areas._default_index = ServiceAreaIndex()
+            before = contact_search.get_comprehensive_contacts("川口市", "", "埼玉県", kawaguchi, True, True)["警察署"]
+            assert all(contact["name"] != "赤羽警察署" for contact in before)
+            across = [area("赤羽警察署", square(139.70, 35.78, 139.74, 35.82), prefecture="東京都")]
+            service_areas._default_index = ServiceAreaIndex(build_service_area_index([write_geojson(tmp, across)]))
+            police = contact_search.get_comprehensive_contacts("川口市", "", "埼玉県", kawaguchi, True, True)["警察署"]
+            assert [c["name"] for c in police] == ["赤羽警察署"] + [c["name"] for c in before[:2]], police
+            print("✅ Overlapping and cross-border service areas")
+        finally:
+            service_areas._default_index = original
+
+if __name__ == "__main__":
+    test_service_areas()
+    test_responsible_selection()
+    test_app_service_areas()
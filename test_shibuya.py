@@ -5,7 +5,7 @@ import sys
 import os
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
-from app import get_comprehensive_contacts, parse_address_components
+from contact_search import get_comprehensive_contacts, parse_address_components
 
 # Test Shibuya address
 test_address = "東京都渋谷区神宮前1-1-1"
@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+"""
+Test the grid spatial index and the vectorized distance kernels against brute force
+Radius, k-nearest and join queries must return exactly the brute-force results, nearest first
+"""
+
+import sys
+import os
+import random
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import numpy as np
+
+from spatial_index import FULL_SCAN_MAX_POINTS, GridIndex, build_grid_index, haversine_km, haversine_matrix
+from contact_search import (calculate_distance, get_comprehensive_contacts, get_comprehensive_contacts_batch,
+                            get_national_index, get_prefecture_indexes, jurisdiction_at)
+
+def test_spatial_index():
+    """Compare GridIndex queries with brute force over random Kanto points"""
+
+    print("🧪 Spatial Index Test")
+    print("=" * 60)
+
+    rng = random.Random(42)
+    points = [(rng.uniform(35.0, 36.5), rng.uniform(139.0, 140.8), i) for i in range(3000)]
+    # Pruned by cell at this size; the second index forces one pass over every point
+    index = build_grid_index(points)
+    pruned = build_grid_index(points, full_scan_max=len(points))
+
+    lats = [p[0] for p in points]
+    lons = [p[1] for p in points]
+    for _ in range(200):
+        lat, lon = rng.uniform(35.0, 36.5), rng.uniform(139.0, 140.8)
+        distances = haversine_matrix([lat], [lon], lats, lons)[0].tolist()
+        radius = rng.choice([1, 2, 5, 9, 17, 40])
+        brute = sorted((d, item) for d, (_, _, item) in zip(distances, points) if d <= radius)
+        assert index.query_radius(lat, lon, radius) == brute
+        assert pruned.query_radius(lat, lon, radius) == brute
+
+        k = rng.choice([1, 2, 3, 10])
+        everything = sorted((d, item) for d, (_, _, item) in zip(distances, points))
+        assert index.nearest(lat, lon, k) == everything[:k]
+        assert index.nearest(lat, lon, k, max_km=3) == [hit for hit in everything[:k] if hit[0] <= 3]
+
+    print("✅ Radius and k-nearest queries match brute force")
+
+    # Bulk loading builds the same index as point-by-point inserts
+    bulk = GridIndex()
+    bulk.insert_many(lats[:1000], lons[:1000], list(range(1000)))
+    bulk.insert_many(lats[1000:], lons[1000:], list(range(1000, 3000)))
+    assert bulk._bounds == index._bounds
+    for lat, lon in [(35.7, 139.7), (35.1, 140.7), (36.4, 139.1)]:
+        assert bulk.query_radius(lat, lon, 9) == index.query_radius(lat, lon, 9)
+
+    # The vectorized kernel agrees with the scalar formula used by calculate_distance
+    assert haversine_km(35.66, 139.70, 35.69, 139.75) == calculate_distance(35.66, 139.70, 35.69, 139.75)
+    matrix = haversine_matrix(lats[:50], lons[:50], lats[50:300], lons[50:300])
+    scalar = [[haversine_km(a, b, c, d) for c, d in zip(lats[50:300], lons[50:300])] for a, b in zip(lats[:50], lons[:50])]
+    assert np.allclose(matrix, scalar, rtol=0, atol=1e-9)
+
+    print("✅ Vectorized distance matrix matches the scalar formula")
+
+    # Radius join: every origin gets exactly its query_radius hits, ties and distances included
+    users = [(rng.uniform(35.0, 36.5), rng.uniform(139.0, 140.8)) for _ in range(300)]
+    user_lats = [u[0] for u in users]
+    user_lons = [u[1] for u in users]
+    for radius_km in (0.5, 4, 17.051):
+        expected = [index.query_radius(lat, lon, radius_km) for lat, lon in users]
+        assert index.join_radius(user_lats, user_lons, radius_km) == expected
+        assert pruned.join_radius(user_lats, user_lons, radius_km) == expected
+    duplicated = build_grid_index(points + points[:10])
+    assert duplicated.join_radius([points[0][0]], [points[0][1]], 1) == [duplicated.query_radius(points[0][0], points[0][1], 1)]
+    print("✅ Grid radius join matches per-origin radius queries")
+
+    # Per-prefecture indexes are built once and reused
+    assert get_prefecture_indexes("山梨県") is get_prefecture_indexes("山梨県")
+
+    start = time.perf_counter()
+    for _ in range(50):
+        contacts = get_comprehensive_contacts("甲府市", "", "山梨県", (35.6641, 138.5681))
+    elapsed_ms = (time.perf_counter() - start) * 1000 / 50
+    print(f"Average 11-category search: {elapsed_ms:.2f} ms")
+    assert contacts["警察署"], "expected police stations near Kofu"
+    for contact_list in contacts.values():
+        distances = [c["distance_km"] for c in contact_list if c["distance_km"] is not None]
+        assert distances == sorted(distances)
+    print("✅ Search results come back in distance order")
+
+def test_grid_path():
+    """Indexes of realistic size take the cell-pruned path, and it beats scoring every point"""
+    national = get_national_index()
+    assert len(national) > FULL_SCAN_MAX_POINTS, len(national)
+    windows = []
+    original_window = national._window
+    national._window = lambda *cells: windows.append(cells) or original_window(*cells)
+    try:
+        hits = national.query_radius(35.6895, 139.6917, 17.051)
+    finally:
+        del national._window
+    assert windows and hits, "the national index must consult the grid"
+    scanned = build_grid_index(zip(national._lats, national._lons, national._items), full_scan_max=len(national))
+    assert hits == scanned.query_radius(35.6895, 139.6917, 17.051)
+
+    rng = random.Random(3)
+    points = [(rng.uniform(35.0, 38.0), rng.uniform(138.5, 141.5), i) for i in range(4 * FULL_SCAN_MAX_POINTS)]
+    queries = [(rng.uniform(35.0, 38.0), rng.uniform(138.5, 141.5)) for _ in range(1000)]
+    timings = {}
+    for name, full_scan_max in [("grid", FULL_SCAN_MAX_POINTS), ("scan", len(points))]:
+        index = build_grid_index(points, full_scan_max=full_scan_max)
+        start = time.perf_counter()
+        for lat, lon in queries:
+            index.query_radius(lat, lon, 17.051)
+        timings[name] = (time.perf_counter() - start) / len(queries) * 1e6
+    print(f"✅ National index ({len(national)} points) uses the grid; "
+          f"{len(points)} points: grid {timings['grid']:.0f} µs vs scan {timings['scan']:.0f} µs per query")
+
+def test_comprehensive_contacts_batch():
+    """Batched searches return exactly what one get_comprehensive_contacts call per query does"""
+    rng = random.Random(7)
+    # Around the 東京都/神奈川県/埼玉県 borders, each with the jurisdiction the app would search
+    queries = []
+    for _ in range(300):
+        lat, lon = rng.uniform(35.45, 35.90), rng.uniform(139.40, 139.90)
+        pref, city, district = jurisdiction_at(lat, lon) or ("", "", "")
+        queries.append((city, district, pref, (lat, lon)))
+    queries += [("甲府市", "", "山梨県", None), ("札幌市", "中央区", "北海道", (43.06, 141.35)), ("", "", "", None)]
+
+    for cross_prefecture, prefer_same_prefecture in [(False, False), (True, False), (True, True)]:
+        start = time.perf_counter()
+        batch = get_comprehensive_contacts_batch(queries, cross_prefecture, prefer_same_prefecture)
+        batch_ms = (time.perf_counter() - start) * 1000
+        start = time.perf_counter()
+        expected = [get_comprehensive_contacts(*query, cross_prefecture, prefer_same_prefecture) for query in queries]
+        loop_ms = (time.perf_counter() - start) * 1000
+        assert batch == expected, (cross_prefecture, prefer_same_prefecture)
+        print(f"✅ {len(queries)} queries (cross={cross_prefecture}, same first={prefer_same_prefecture}): "
+              f"batch {batch_ms:.0f} ms, one by one {loop_ms:.0f} ms")
+
+if __name__ == "__main__":
+    test_spatial_index()
+    test_grid_path()
+    test_comprehensive_contacts_batch()
@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+Test Streamlit-level caching of the data plane and of per-address search results
+Runs a small script under Streamlit's AppTest runtime, where st.cache_* are active
+"""
+
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from streamlit.testing.v1 import AppTest
+
+def cached_search_script():
+    """Search the same address on every rerun, counting GSI requests and index builds"""
+    import os
+    import tempfile
+    import streamlit as st
+    import app
+    import contact_search
+    import geocode_cache
+
+    if "stats" not in st.session_state:
+        app.cached_search_address.clear()
+        st.session_state.stats = {"gsi": 0, "builds": 0}
+        st.session_state.planes = []
+    stats = st.session_state.stats
+
+    def fake_gsi(address, timeout=10, use_cache=True, total_timeout=None):
+        stats["gsi"] += 1
+        return (35.6641, 138.5681)
+
+    def counting_build(prefecture, build=contact_search.build_prefecture_indexes):
+        stats["builds"] += 1
+        return build(prefecture)
+
+    original = contact_search.gsi_address_search, contact_search.build_prefecture_indexes, geocode_cache._default_cache
+    contact_search.gsi_address_search = fake_gsi
+    contact_search.build_prefecture_indexes = counting_build
+    # Empty geocode cache, so the GSI step misses it and GSI is asked
+    tmp = tempfile.TemporaryDirectory()
+    geocode_cache._default_cache = geocode_cache.GeocodeCache(os.path.join(tmp.name, "geocode_cache.sqlite"))
+    # The plane get_prefecture_indexes uses (resolved when app was first imported)
+    contact_search._data_plane["prefecture_indexes"].pop("山梨県", None)
+    try:
+        result = app.cached_search_address("山梨県甲府市丸の内1-18-1")
+        app.cached_search_address("山梨県甲府市丸の内1-18-1")
+        st.session_state.planes.append(id(contact_search.get_data_plane()))
+    finally:
+        contact_search.gsi_address_search, contact_search.build_prefecture_indexes, geocode_cache._default_cache = original
+        tmp.cleanup()
+
+    st.text(f"gsi={stats['gsi']} builds={stats['builds']} police={len(result['contacts']['警察署'])}")
+    st.text(f"planes={len(set(st.session_state.planes))}")
+    st.text(f"source={result['geocode'].source}")
+
+def test_streamlit_cache():
+    """Repeated searches of one address geocode and search once; the data plane is shared"""
+
+    print("🧪 Streamlit Cache Test")
+    print("=" * 60)
+
+    at = AppTest.from_function(cached_search_script, default_timeout=60)
+    at.run()
+    assert not at.exception, at.exception
+    assert at.text[0].value == "gsi=1 builds=1 police=3", at.text[0].value
+    print("✅ Second search in the same run served from st.cache_data")
+
+    at.run()
+    assert not at.exception, at.exception
+    assert at.text[0].value == "gsi=1 builds=1 police=3", at.text[0].value
+    assert at.text[1].value == "planes=1"
+    assert at.text[2].value == "source=gsi"
+    print("✅ Rerun reuses the memoized result and the cached data plane")
+
+def test_app_script():
+    """app.py runs as Streamlit's __main__ on the one data plane of contact_search"""
+
+    at = AppTest.from_file("app.py", default_timeout=60)
+    at.run()
+    assert not at.exception, at.exception
+    # No second copy of the search module (e.g. app imported again from the batch section)
+    planes = [name for name, module in list(sys.modules.items()) if hasattr(module, "get_data_plane")]
+    assert at.button and planes == ["contact_search"], planes
+    print("✅ app.py and the batch section share one contact_search module")
+
+if __name__ == "__main__":
+    test_streamlit_cache()
+    test_app_script()